@@ -3571,7 +3571,7 @@ eval("var __WEBPACK_AMD_DEFINE_RESULT__;/*\nCopyright 2019 David Bau.\n\nPermiss
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ LayoutAnalysis)\n/* harmony export */ });\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n\r\n\r\nclass LayoutAnalysis {\r\n    constructor(layout, options = {}) {\r\n        this._layoutGraph = layout;\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, {\r\n            targetEdgeLength: 50,\r\n            weightBends: 0.2,\r\n            weightCrossings: 1,\r\n            weightLengths: 0.1,\r\n        });\r\n        this._nodes = this._layoutGraph.allNodes();\r\n        this._edges = this._layoutGraph.allEdges();\r\n        this._segments = lodash__WEBPACK_IMPORTED_MODULE_1__.flatMap(this._edges, (edge) => edge.segments());\r\n        this._uniqueSegments = lodash__WEBPACK_IMPORTED_MODULE_1__.map(lodash__WEBPACK_IMPORTED_MODULE_1__.uniqBy(lodash__WEBPACK_IMPORTED_MODULE_1__.map(this._segments, segment => [segment, segment.start.x + \"_\" + segment.start.y + \"_\" + segment.end.x + \"_\" + segment.end.y]), \"1\"), \"0\");\r\n        // precalculate all parents for nodes and edges\r\n        this._nodeParents = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._nodes, (node) => {\r\n            const parents = new Set();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.parents(), (parent) => {\r\n                parents.add(parent);\r\n            });\r\n            this._nodeParents.set(node, parents);\r\n        });\r\n        this._edgeParents = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n            const parents = new Set();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(edge.parents(), (parent) => {\r\n                parents.add(parent);\r\n            });\r\n            this._edgeParents.set(edge, parents);\r\n        });\r\n    }\r\n    /**\r\n     * Returns the total number of pairwise segment crossings in the graph.\r\n     */\r\n    segmentCrossings() {\r\n        return this._getAllCrossingSegments().length;\r\n    }\r\n    /**\r\n     * Returns the cost for segment crossings in the graph.\r\n     * For every pairwise crossing, the cost is between 1 and 2 depending on the crossing angle.\r\n     * Orthogonal crossings have a cost of 1, almost parallel segments a cost very close to 2.\r\n     */\r\n    segmentCrossingsWithAngles() {\r\n        let cost = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._getAllCrossingSegments(), ([segI, segJ]) => {\r\n            const angle = segI.vector().acuteAngleTo(segJ.vector());\r\n            const angleCost = (Math.cos(2 * angle) + 1) / 2;\r\n            cost += 1 + angleCost;\r\n        });\r\n        return cost;\r\n    }\r\n    edgeLengths() {\r\n        let cost = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n            const edgeLength = lodash__WEBPACK_IMPORTED_MODULE_1__.sum(lodash__WEBPACK_IMPORTED_MODULE_1__.map(edge.segments(), segment => segment.length()));\r\n            let factor = edgeLength / this._options[\"targetEdgeLength\"];\r\n            cost += Math.max(factor, 1 / factor);\r\n        });\r\n        return cost;\r\n    }\r\n    checkUpwardFlow() {\r\n        let hasUpwardFlow = false;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n            if (hasUpwardFlow) {\r\n                return; // break not possible in forEach\r\n            }\r\n            if (!edge.graph.mayHaveCycles && edge.points[0].y > lodash__WEBPACK_IMPORTED_MODULE_1__.last(edge.points).y) {\r\n                console.log(\"edge goes upwards\", edge);\r\n                hasUpwardFlow = true;\r\n            }\r\n        });\r\n        return !hasUpwardFlow;\r\n    }\r\n    checkNodeOverlaps() {\r\n        const overlaps = {};\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach([\"x\", \"y\"], axis => {\r\n            overlaps[axis] = new Array(this._nodes.length);\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                overlaps[axis][i] = [];\r\n            }\r\n            const endpoints = [];\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                endpoints.push([this._nodes[i][axis], i, true]);\r\n                endpoints.push([this._nodes[i][axis] + this._nodes[i][axis === \"x\" ? \"width\" : \"height\"], i, false]);\r\n            }\r\n            let openSegments = new Set();\r\n            (0,fast_sort__WEBPACK_IMPORTED_MODULE_0__.inPlaceSort)(endpoints).asc(\"0\");\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(endpoints, ([coord, segId, isFirst]) => {\r\n                if (isFirst) {\r\n                    openSegments.forEach((openSegId) => {\r\n                        let min = Math.min(openSegId, segId);\r\n                        let max = Math.max(openSegId, segId);\r\n                        overlaps[axis][min].push(max);\r\n                    });\r\n                    openSegments.add(segId);\r\n                }\r\n                else {\r\n                    openSegments.delete(segId);\r\n                }\r\n            });\r\n        });\r\n        let overlap = false;\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const nodeI = this._nodes[i];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.intersection(overlaps[\"y\"][i], overlaps[\"x\"][i]), (j) => {\r\n                const nodeJ = this._nodes[j];\r\n                if (nodeI.boundingBox().intersects(nodeJ.boundingBox()) && !this._nodesRelated(nodeI, nodeJ)) {\r\n                    console.log(\"two nodes overlap\", nodeI, nodeJ);\r\n                    overlap = true;\r\n                }\r\n            });\r\n        }\r\n        return !overlap;\r\n    }\r\n    checkEdgeOverlaps() {\r\n        const overlaps = {};\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach([\"x\", \"y\"], axis => {\r\n            overlaps[axis] = new Array(this._nodes.length + this._edges.length);\r\n            for (let i = 0; i < this._nodes.length + this._edges.length; ++i) {\r\n                overlaps[axis][i] = [];\r\n            }\r\n            const endpoints = [];\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                endpoints.push([this._nodes[i][axis], i, true]);\r\n                endpoints.push([this._nodes[i][axis] + this._nodes[i][axis === \"x\" ? \"width\" : \"height\"], i, false]);\r\n            }\r\n            for (let i = 0; i < this._edges.length; ++i) {\r\n                const boundingBox = this._edges[i].boundingBox();\r\n                endpoints.push([boundingBox[axis], this._nodes.length + i, true]);\r\n                endpoints.push([boundingBox[axis] + boundingBox[axis === \"x\" ? \"width\" : \"height\"], this._nodes.length + i, false]);\r\n            }\r\n            let openSegments = new Set();\r\n            (0,fast_sort__WEBPACK_IMPORTED_MODULE_0__.inPlaceSort)(endpoints).asc(\"0\");\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(endpoints, ([coord, segId, isFirst]) => {\r\n                if (isFirst) {\r\n                    openSegments.forEach((openSegId) => {\r\n                        let min = Math.min(openSegId, segId);\r\n                        let max = Math.max(openSegId, segId);\r\n                        if (min < this._nodes.length && max >= this._nodes.length) {\r\n                            overlaps[axis][min].push(max - this._nodes.length);\r\n                        }\r\n                    });\r\n                    openSegments.add(segId);\r\n                }\r\n                else {\r\n                    openSegments.delete(segId);\r\n                }\r\n            });\r\n        });\r\n        let overlap = false;\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const nodeI = this._nodes[i];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.intersection(overlaps[\"y\"][i], overlaps[\"x\"][i]), (j) => {\r\n                const edgeJ = this._edges[j];\r\n                if (this._edgeIntersectsNode(edgeJ, nodeI) && !this._edgeParents.get(edgeJ).has(nodeI)) {\r\n                    console.log(\"node overlaps edge\", nodeI, edgeJ);\r\n                    overlap = true;\r\n                }\r\n            });\r\n        }\r\n        return !overlap;\r\n    }\r\n    checkNodeContainment() {\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const node = this._nodes[i];\r\n            let contained = true;\r\n            this._nodeParents.get(node).forEach((parent) => {\r\n                contained = contained && node.boundingBox().containedIn(parent.boundingBox());\r\n            });\r\n            if (!contained) {\r\n                console.log(\"node not contained in parent\", node, node.boundingBox(), lodash__WEBPACK_IMPORTED_MODULE_1__.map(Array.from(this._nodeParents.get(node)), (parent) => parent.boundingBox()));\r\n                return false;\r\n            }\r\n        }\r\n        return true;\r\n    }\r\n    checkEdgeContainment() {\r\n        for (let i = 0; i < this._edges.length; ++i) {\r\n            const edge = this._edges[i];\r\n            let contained = true;\r\n            this._edgeParents.get(edge).forEach((parent) => {\r\n                contained = contained && edge.boundingBox().containedIn(parent.boundingBox());\r\n            });\r\n            if (!contained) {\r\n                console.log(\"edge not contained in parent\", edge);\r\n                return false;\r\n            }\r\n        }\r\n        return true;\r\n    }\r\n    checkMapAlignment() {\r\n        // gather all graphs\r\n        const graphs = [];\r\n        const addSubGraphs = (graph) => {\r\n            graphs.push(graph);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                if (node.childGraph !== null) {\r\n                    addSubGraphs(node.childGraph);\r\n                }\r\n            });\r\n        };\r\n        addSubGraphs(this._layoutGraph);\r\n        let aligned = true;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graphs, (graph) => {\r\n            if (!aligned) {\r\n                return; // break not possible in forEach\r\n            }\r\n            if (graph.entryNode !== null && graph.exitNode !== null) {\r\n                if (graph.entryNode.x !== graph.exitNode.x || graph.entryNode.width !== graph.exitNode.width) {\r\n                    console.log(\"entry and exit node not aligned\", graph.entryNode, graph.exitNode);\r\n                    aligned = false;\r\n                }\r\n            }\r\n        });\r\n        return aligned;\r\n    }\r\n    checkConnectorAlignment() {\r\n        let aligned = true;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._nodes, (node) => {\r\n            if (!aligned) {\r\n                return; // break not possible in forEach\r\n            }\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.inConnectors, (inConnector) => {\r\n                if (!aligned) {\r\n                    return; // break not possible in forEach\r\n                }\r\n                if (inConnector.isScoped) {\r\n                    const outConnector = node.connector(\"OUT\", \"OUT_\" + inConnector.name.substr(3));\r\n                    if (inConnector.x !== outConnector.x) {\r\n                        console.log(\"IN connector and OUT connector not aligned\", inConnector, outConnector);\r\n                        aligned = false;\r\n                    }\r\n                }\r\n            });\r\n        });\r\n        return aligned;\r\n    }\r\n    validate() {\r\n        return (this.checkUpwardFlow() &&\r\n            this.checkNodeOverlaps() &&\r\n            this.checkEdgeOverlaps() &&\r\n            this.checkNodeContainment() &&\r\n            this.checkEdgeContainment() &&\r\n            this.checkMapAlignment() &&\r\n            this.checkConnectorAlignment());\r\n    }\r\n    bends() {\r\n        return this._segments.length - this._edges.length;\r\n    }\r\n    cost(breakdown = false) {\r\n        const crossings = this.segmentCrossingsWithAngles();\r\n        const bends = this.bends();\r\n        const lengths = this.edgeLengths();\r\n        const weightedCrossings = this._options.weightCrossings * crossings;\r\n        const weightedBends = this._options.weightBends * bends;\r\n        const weightedLengths = this._options.weightLengths * lengths;\r\n        if (breakdown) {\r\n            console.log(\"Crossings: \" + this._options.weightCrossings + \" * \" + crossings.toFixed(2) + \" = \" + weightedCrossings.toFixed(2));\r\n            console.log(\"Bends: \" + this._options.weightBends + \" * \" + bends.toFixed(2) + \" = \" + weightedBends.toFixed(2));\r\n            console.log(\"Lengths: \" + this._options.weightLengths + \" * \" + lengths.toFixed(2) + \" = \" + weightedLengths.toFixed(2));\r\n        }\r\n        return weightedCrossings + weightedBends + weightedLengths;\r\n    }\r\n    _edgeIntersectsNode(edge, node) {\r\n        const nodeBox = node.boundingBox();\r\n        if (!edge.boundingBox().intersects(nodeBox)) {\r\n            return false;\r\n        }\r\n        let intersects = false;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(edge.segments(), (segment) => {\r\n            intersects = intersects || segment.intersectsBox(nodeBox);\r\n        });\r\n        return intersects;\r\n    }\r\n    _nodesRelated(nodeA, nodeB) {\r\n        return this._nodeParents.get(nodeA).has(nodeB) || this._nodeParents.get(nodeB).has(nodeA);\r\n    }\r\n    _printCrossings() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.map(lodash__WEBPACK_IMPORTED_MODULE_1__.sortBy(lodash__WEBPACK_IMPORTED_MODULE_1__.map(this._getAllCrossingSegments(), ([segI, segJ]) => {\r\n            const point = segI.intersection(segJ);\r\n            return {\r\n                pointx: point.x,\r\n                pointy: point.y,\r\n                segi: segI,\r\n                segj: segJ,\r\n            };\r\n        }), [\"pointy\", \"pointx\"]), data => console.log(\"(\" + data.pointx.toFixed(0) + \" / \" + data.pointy.toFixed(0) + \")\", data.segi.toString(), data.segj.toString()));\r\n    }\r\n    _getAllCrossingSegments() {\r\n        const overlaps = {};\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach([\"x\", \"y\"], axis => {\r\n            overlaps[axis] = new Array(this._segments.length);\r\n            for (let i = 0; i < this._uniqueSegments.length; ++i) {\r\n                overlaps[axis][i] = [];\r\n            }\r\n            const endpoints = [];\r\n            for (let i = 0; i < this._uniqueSegments.length; ++i) {\r\n                endpoints.push([this._uniqueSegments[i].start[axis], i, this._uniqueSegments[i].start[axis] <= this._uniqueSegments[i].end[axis]]);\r\n                endpoints.push([this._uniqueSegments[i].end[axis], i, this._uniqueSegments[i].start[axis] > this._uniqueSegments[i].end[axis]]);\r\n            }\r\n            let openSegments = new Set();\r\n            (0,fast_sort__WEBPACK_IMPORTED_MODULE_0__.inPlaceSort)(endpoints).asc([endpoint => endpoint[0], endpoint => endpoint[2]]);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(endpoints, ([coord, segId, isFirst]) => {\r\n                if (isFirst) {\r\n                    openSegments.forEach((openSegId) => {\r\n                        let min = Math.min(openSegId, segId);\r\n                        let max = Math.max(openSegId, segId);\r\n                        overlaps[axis][min].push(max);\r\n                    });\r\n                    openSegments.add(segId);\r\n                }\r\n                else {\r\n                    openSegments.delete(segId);\r\n                }\r\n            });\r\n        });\r\n        const intersections = [];\r\n        for (let i = 0; i < this._uniqueSegments.length; ++i) {\r\n            const segI = this._uniqueSegments[i];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.intersection(overlaps[\"y\"][i], overlaps[\"x\"][i]), (j) => {\r\n                const segJ = this._uniqueSegments[j];\r\n                if (segI.intersects(segJ)) {\r\n                    intersections.push([segI, segJ]);\r\n                }\r\n            });\r\n        }\r\n        return intersections;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/bench/layoutAnalysis.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ LayoutAnalysis)\n/* harmony export */ });\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _geometry_segmentGrid__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../geometry/segmentGrid */ \"./src/geometry/segmentGrid.ts\");\n\r\n\r\n\r\n/**\r\n * Quality measures and validation checks of a layout.\r\n * The segment lists, the grid index of the segments (see SegmentGrid), the crossing counts and the parents of nodes\r\n * and edges are only computed when a measure needs them and are kept afterwards, so one analysis can evaluate several\r\n * measures of the same layout (see Bench.runMeasures) without repeating the expensive parts.\r\n */\r\nclass LayoutAnalysis {\r\n    constructor(layout, options = {}) {\r\n        this._segments = null;\r\n        this._uniqueSegments = null;\r\n        this._segmentGrid = null;\r\n        this._crossingSegments = null;\r\n        this._numCrossings = null;\r\n        this._crossingCost = null;\r\n        this._nodeParents = null;\r\n        this._edgeParents = null;\r\n        this._layoutGraph = layout;\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, {\r\n            targetEdgeLength: 50,\r\n            weightBends: 0.2,\r\n            weightCrossings: 1,\r\n            weightLengths: 0.1,\r\n        });\r\n        this._nodes = this._layoutGraph.allNodes();\r\n        this._edges = this._layoutGraph.allEdges();\r\n    }\r\n    /**\r\n     * Returns the total number of pairwise segment crossings in the graph.\r\n     */\r\n    segmentCrossings() {\r\n        if (this._numCrossings === null) {\r\n            this._numCrossings = this._getSegmentGrid().countCrossings();\r\n        }\r\n        return this._numCrossings;\r\n    }\r\n    /**\r\n     * Returns the cost for segment crossings in the graph.\r\n     * For every pairwise crossing, the cost is between 1 and 2 depending on the crossing angle.\r\n     * Orthogonal crossings have a cost of 1, almost parallel segments a cost very close to 2.\r\n     */\r\n    segmentCrossingsWithAngles() {\r\n        if (this._crossingCost === null) {\r\n            this._crossingCost = this._getSegmentGrid().crossingCost();\r\n        }\r\n        return this._crossingCost;\r\n    }\r\n    edgeLengths() {\r\n        let cost = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n            const edgeLength = lodash__WEBPACK_IMPORTED_MODULE_1__.sum(lodash__WEBPACK_IMPORTED_MODULE_1__.map(edge.segments(), segment => segment.length()));\r\n            let factor = edgeLength / this._options[\"targetEdgeLength\"];\r\n            cost += Math.max(factor, 1 / factor);\r\n        });\r\n        return cost;\r\n    }\r\n    checkUpwardFlow() {\r\n        let hasUpwardFlow = false;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n            if (hasUpwardFlow) {\r\n                return; // break not possible in forEach\r\n            }\r\n            if (!edge.graph.mayHaveCycles && edge.points[0].y > lodash__WEBPACK_IMPORTED_MODULE_1__.last(edge.points).y) {\r\n                console.log(\"edge goes upwards\", edge);\r\n                hasUpwardFlow = true;\r\n            }\r\n        });\r\n        return !hasUpwardFlow;\r\n    }\r\n    checkNodeOverlaps() {\r\n        const overlaps = {};\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach([\"x\", \"y\"], axis => {\r\n            overlaps[axis] = new Array(this._nodes.length);\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                overlaps[axis][i] = [];\r\n            }\r\n            const endpoints = [];\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                endpoints.push([this._nodes[i][axis], i, true]);\r\n                endpoints.push([this._nodes[i][axis] + this._nodes[i][axis === \"x\" ? \"width\" : \"height\"], i, false]);\r\n            }\r\n            let openSegments = new Set();\r\n            (0,fast_sort__WEBPACK_IMPORTED_MODULE_0__.inPlaceSort)(endpoints).asc(\"0\");\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(endpoints, ([coord, segId, isFirst]) => {\r\n                if (isFirst) {\r\n                    openSegments.forEach((openSegId) => {\r\n                        let min = Math.min(openSegId, segId);\r\n                        let max = Math.max(openSegId, segId);\r\n                        overlaps[axis][min].push(max);\r\n                    });\r\n                    openSegments.add(segId);\r\n                }\r\n                else {\r\n                    openSegments.delete(segId);\r\n                }\r\n            });\r\n        });\r\n        let overlap = false;\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const nodeI = this._nodes[i];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.intersection(overlaps[\"y\"][i], overlaps[\"x\"][i]), (j) => {\r\n                const nodeJ = this._nodes[j];\r\n                if (nodeI.boundingBox().intersects(nodeJ.boundingBox()) && !this._nodesRelated(nodeI, nodeJ)) {\r\n                    console.log(\"two nodes overlap\", nodeI, nodeJ);\r\n                    overlap = true;\r\n                }\r\n            });\r\n        }\r\n        return !overlap;\r\n    }\r\n    checkEdgeOverlaps() {\r\n        const overlaps = {};\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach([\"x\", \"y\"], axis => {\r\n            overlaps[axis] = new Array(this._nodes.length + this._edges.length);\r\n            for (let i = 0; i < this._nodes.length + this._edges.length; ++i) {\r\n                overlaps[axis][i] = [];\r\n            }\r\n            const endpoints = [];\r\n            for (let i = 0; i < this._nodes.length; ++i) {\r\n                endpoints.push([this._nodes[i][axis], i, true]);\r\n                endpoints.push([this._nodes[i][axis] + this._nodes[i][axis === \"x\" ? \"width\" : \"height\"], i, false]);\r\n            }\r\n            for (let i = 0; i < this._edges.length; ++i) {\r\n                const boundingBox = this._edges[i].boundingBox();\r\n                endpoints.push([boundingBox[axis], this._nodes.length + i, true]);\r\n                endpoints.push([boundingBox[axis] + boundingBox[axis === \"x\" ? \"width\" : \"height\"], this._nodes.length + i, false]);\r\n            }\r\n            let openSegments = new Set();\r\n            (0,fast_sort__WEBPACK_IMPORTED_MODULE_0__.inPlaceSort)(endpoints).asc(\"0\");\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(endpoints, ([coord, segId, isFirst]) => {\r\n                if (isFirst) {\r\n                    openSegments.forEach((openSegId) => {\r\n                        let min = Math.min(openSegId, segId);\r\n                        let max = Math.max(openSegId, segId);\r\n                        if (min < this._nodes.length && max >= this._nodes.length) {\r\n                            overlaps[axis][min].push(max - this._nodes.length);\r\n                        }\r\n                    });\r\n                    openSegments.add(segId);\r\n                }\r\n                else {\r\n                    openSegments.delete(segId);\r\n                }\r\n            });\r\n        });\r\n        let overlap = false;\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const nodeI = this._nodes[i];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.intersection(overlaps[\"y\"][i], overlaps[\"x\"][i]), (j) => {\r\n                const edgeJ = this._edges[j];\r\n                if (this._edgeIntersectsNode(edgeJ, nodeI) && !this._getEdgeParents().get(edgeJ).has(nodeI)) {\r\n                    console.log(\"node overlaps edge\", nodeI, edgeJ);\r\n                    overlap = true;\r\n                }\r\n            });\r\n        }\r\n        return !overlap;\r\n    }\r\n    checkNodeContainment() {\r\n        for (let i = 0; i < this._nodes.length; ++i) {\r\n            const node = this._nodes[i];\r\n            let contained = true;\r\n            this._getNodeParents().get(node).forEach((parent) => {\r\n                contained = contained && node.boundingBox().containedIn(parent.boundingBox());\r\n            });\r\n            if (!contained) {\r\n                console.log(\"node not contained in parent\", node, node.boundingBox(), lodash__WEBPACK_IMPORTED_MODULE_1__.map(Array.from(this._getNodeParents().get(node)), (parent) => parent.boundingBox()));\r\n                return false;\r\n            }\r\n        }\r\n        return true;\r\n    }\r\n    checkEdgeContainment() {\r\n        for (let i = 0; i < this._edges.length; ++i) {\r\n            const edge = this._edges[i];\r\n            let contained = true;\r\n            this._getEdgeParents().get(edge).forEach((parent) => {\r\n                contained = contained && edge.boundingBox().containedIn(parent.boundingBox());\r\n            });\r\n            if (!contained) {\r\n                console.log(\"edge not contained in parent\", edge);\r\n                return false;\r\n            }\r\n        }\r\n        return true;\r\n    }\r\n    checkMapAlignment() {\r\n        // gather all graphs\r\n        const graphs = [];\r\n        const addSubGraphs = (graph) => {\r\n            graphs.push(graph);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                if (node.childGraph !== null) {\r\n                    addSubGraphs(node.childGraph);\r\n                }\r\n            });\r\n        };\r\n        addSubGraphs(this._layoutGraph);\r\n        let aligned = true;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graphs, (graph) => {\r\n            if (!aligned) {\r\n                return; // break not possible in forEach\r\n            }\r\n            if (graph.entryNode !== null && graph.exitNode !== null) {\r\n                if (graph.entryNode.x !== graph.exitNode.x || graph.entryNode.width !== graph.exitNode.width) {\r\n                    console.log(\"entry and exit node not aligned\", graph.entryNode, graph.exitNode);\r\n                    aligned = false;\r\n                }\r\n            }\r\n        });\r\n        return aligned;\r\n    }\r\n    checkConnectorAlignment() {\r\n        let aligned = true;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._nodes, (node) => {\r\n            if (!aligned) {\r\n                return; // break not possible in forEach\r\n            }\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.inConnectors, (inConnector) => {\r\n                if (!aligned) {\r\n                    return; // break not possible in forEach\r\n                }\r\n                if (inConnector.isScoped) {\r\n                    const outConnector = node.connector(\"OUT\", \"OUT_\" + inConnector.name.substr(3));\r\n                    if (inConnector.x !== outConnector.x) {\r\n                        console.log(\"IN connector and OUT connector not aligned\", inConnector, outConnector);\r\n                        aligned = false;\r\n                    }\r\n                }\r\n            });\r\n        });\r\n        return aligned;\r\n    }\r\n    validate() {\r\n        return (this.checkUpwardFlow() &&\r\n            this.checkNodeOverlaps() &&\r\n            this.checkEdgeOverlaps() &&\r\n            this.checkNodeContainment() &&\r\n            this.checkEdgeContainment() &&\r\n            this.checkMapAlignment() &&\r\n            this.checkConnectorAlignment());\r\n    }\r\n    bends() {\r\n        return this._getSegments().length - this._edges.length;\r\n    }\r\n    cost(breakdown = false) {\r\n        const crossings = this.segmentCrossingsWithAngles();\r\n        const bends = this.bends();\r\n        const lengths = this.edgeLengths();\r\n        const weightedCrossings = this._options.weightCrossings * crossings;\r\n        const weightedBends = this._options.weightBends * bends;\r\n        const weightedLengths = this._options.weightLengths * lengths;\r\n        if (breakdown) {\r\n            console.log(\"Crossings: \" + this._options.weightCrossings + \" * \" + crossings.toFixed(2) + \" = \" + weightedCrossings.toFixed(2));\r\n            console.log(\"Bends: \" + this._options.weightBends + \" * \" + bends.toFixed(2) + \" = \" + weightedBends.toFixed(2));\r\n            console.log(\"Lengths: \" + this._options.weightLengths + \" * \" + lengths.toFixed(2) + \" = \" + weightedLengths.toFixed(2));\r\n        }\r\n        return weightedCrossings + weightedBends + weightedLengths;\r\n    }\r\n    _edgeIntersectsNode(edge, node) {\r\n        const nodeBox = node.boundingBox();\r\n        if (!edge.boundingBox().intersects(nodeBox)) {\r\n            return false;\r\n        }\r\n        let intersects = false;\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(edge.segments(), (segment) => {\r\n            intersects = intersects || segment.intersectsBox(nodeBox);\r\n        });\r\n        return intersects;\r\n    }\r\n    _nodesRelated(nodeA, nodeB) {\r\n        const nodeParents = this._getNodeParents();\r\n        return nodeParents.get(nodeA).has(nodeB) || nodeParents.get(nodeB).has(nodeA);\r\n    }\r\n    _getSegments() {\r\n        if (this._segments === null) {\r\n            this._segments = lodash__WEBPACK_IMPORTED_MODULE_1__.flatMap(this._edges, (edge) => edge.segments());\r\n        }\r\n        return this._segments;\r\n    }\r\n    _getUniqueSegments() {\r\n        if (this._uniqueSegments === null) {\r\n            this._uniqueSegments = lodash__WEBPACK_IMPORTED_MODULE_1__.map(lodash__WEBPACK_IMPORTED_MODULE_1__.uniqBy(lodash__WEBPACK_IMPORTED_MODULE_1__.map(this._getSegments(), segment => [segment, segment.start.x + \"_\" + segment.start.y + \"_\" + segment.end.x + \"_\" + segment.end.y]), \"1\"), \"0\");\r\n        }\r\n        return this._uniqueSegments;\r\n    }\r\n    _getSegmentGrid() {\r\n        if (this._segmentGrid === null) {\r\n            this._segmentGrid = new _geometry_segmentGrid__WEBPACK_IMPORTED_MODULE_2__.default(this._getUniqueSegments());\r\n        }\r\n        return this._segmentGrid;\r\n    }\r\n    _getCrossingSegments() {\r\n        if (this._crossingSegments === null) {\r\n            this._crossingSegments = this._getSegmentGrid().crossingPairs();\r\n        }\r\n        return this._crossingSegments;\r\n    }\r\n    _getNodeParents() {\r\n        if (this._nodeParents === null) {\r\n            this._nodeParents = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._nodes, (node) => {\r\n                this._nodeParents.set(node, new Set(node.parents()));\r\n            });\r\n        }\r\n        return this._nodeParents;\r\n    }\r\n    _getEdgeParents() {\r\n        if (this._edgeParents === null) {\r\n            this._edgeParents = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._edges, (edge) => {\r\n                this._edgeParents.set(edge, new Set(edge.parents()));\r\n            });\r\n        }\r\n        return this._edgeParents;\r\n    }\r\n    _printCrossings() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.map(lodash__WEBPACK_IMPORTED_MODULE_1__.sortBy(lodash__WEBPACK_IMPORTED_MODULE_1__.map(this._getCrossingSegments(), ([segI, segJ]) => {\r\n            const point = segI.intersection(segJ);\r\n            return {\r\n                pointx: point.x,\r\n                pointy: point.y,\r\n                segi: segI,\r\n                segj: segJ,\r\n            };\r\n        }), [\"pointy\", \"pointx\"]), data => console.log(\"(\" + data.pointx.toFixed(0) + \" / \" + data.pointy.toFixed(0) + \")\", data.segi.toString(), data.segj.toString()));\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/bench/layoutAnalysis.ts?");
 
 /***/ }),
 
@@ -3586,6 +3586,17 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 
 /***/ }),
 
+/***/ "./src/geometry/boxGrid.ts":
+/*!*********************************!*\
+  !*** ./src/geometry/boxGrid.ts ***!
+  \*********************************/
+/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
+
+"use strict";
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ BoxGrid)\n/* harmony export */ });\n/**\r\n * Uniform grid over axis-aligned boxes given as typed arrays (top left corner and size), for finding the boxes that\r\n * overlap a query box without testing all of them. Every box is registered in all cells it overlaps.\r\n * The grid does not follow later changes of the arrays, a new grid has to be built when the boxes moved.\r\n */\r\nclass BoxGrid {\r\n    constructor(xs, ys, widths, heights, count = xs.length, cellSize = 100) {\r\n        this._originX = 0;\r\n        this._originY = 0;\r\n        this._cols = 1;\r\n        this._rows = 1;\r\n        this._stamp = 0;\r\n        this._xs = xs;\r\n        this._ys = ys;\r\n        this._widths = widths;\r\n        this._heights = heights;\r\n        this._count = count;\r\n        this._stamps = new Int32Array(count);\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        for (let i = 0; i < count; ++i) {\r\n            minX = Math.min(minX, xs[i]);\r\n            minY = Math.min(minY, ys[i]);\r\n            maxX = Math.max(maxX, xs[i] + widths[i]);\r\n            maxY = Math.max(maxY, ys[i] + heights[i]);\r\n        }\r\n        if (count === 0) {\r\n            minX = minY = maxX = maxY = 0;\r\n        }\r\n        this._originX = minX;\r\n        this._originY = minY;\r\n        // not many more cells than boxes\r\n        this._cellSize = Math.max(cellSize, Math.sqrt((maxX - minX) * (maxY - minY) / (4 * count + 16)), 1e-9);\r\n        this._cols = Math.floor((maxX - minX) / this._cellSize) + 1;\r\n        this._rows = Math.floor((maxY - minY) / this._cellSize) + 1;\r\n        const numCells = this._cols * this._rows;\r\n        const cellStarts = new Int32Array(numCells + 1);\r\n        for (let i = 0; i < count; ++i) {\r\n            const colEnd = this._col(xs[i] + widths[i]);\r\n            const rowEnd = this._row(ys[i] + heights[i]);\r\n            for (let row = this._row(ys[i]); row <= rowEnd; ++row) {\r\n                for (let col = this._col(xs[i]); col <= colEnd; ++col) {\r\n                    cellStarts[row * this._cols + col + 1]++;\r\n                }\r\n            }\r\n        }\r\n        for (let cell = 0; cell < numCells; ++cell) {\r\n            cellStarts[cell + 1] += cellStarts[cell];\r\n        }\r\n        const cellBoxes = new Int32Array(cellStarts[numCells]);\r\n        const fill = cellStarts.slice(0, numCells);\r\n        for (let i = 0; i < count; ++i) {\r\n            const colEnd = this._col(xs[i] + widths[i]);\r\n            const rowEnd = this._row(ys[i] + heights[i]);\r\n            for (let row = this._row(ys[i]); row <= rowEnd; ++row) {\r\n                for (let col = this._col(xs[i]); col <= colEnd; ++col) {\r\n                    cellBoxes[fill[row * this._cols + col]++] = i;\r\n                }\r\n            }\r\n        }\r\n        this._cellStarts = cellStarts;\r\n        this._cellBoxes = cellBoxes;\r\n    }\r\n    /**\r\n     * Calls f once with the index of every box that overlaps the given box (touching counts as overlapping).\r\n     */\r\n    forEachInBox(x, y, width, height, f) {\r\n        if (this._count === 0) {\r\n            return;\r\n        }\r\n        const stamp = ++this._stamp;\r\n        const colEnd = this._col(x + width);\r\n        const rowEnd = this._row(y + height);\r\n        for (let row = this._row(y); row <= rowEnd; ++row) {\r\n            for (let col = this._col(x); col <= colEnd; ++col) {\r\n                const cell = row * this._cols + col;\r\n                const end = this._cellStarts[cell + 1];\r\n                for (let c = this._cellStarts[cell]; c < end; ++c) {\r\n                    const i = this._cellBoxes[c];\r\n                    if (this._stamps[i] === stamp) {\r\n                        continue;\r\n                    }\r\n                    this._stamps[i] = stamp;\r\n                    if (this._xs[i] <= x + width && this._xs[i] + this._widths[i] >= x\r\n                        && this._ys[i] <= y + height && this._ys[i] + this._heights[i] >= y) {\r\n                        f(i);\r\n                    }\r\n                }\r\n            }\r\n        }\r\n    }\r\n    _col(x) {\r\n        return Math.min(this._cols - 1, Math.max(0, Math.floor((x - this._originX) / this._cellSize)));\r\n    }\r\n    _row(y) {\r\n        return Math.min(this._rows - 1, Math.max(0, Math.floor((y - this._originY) / this._cellSize)));\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/geometry/boxGrid.ts?");
+
+/***/ }),
+
 /***/ "./src/geometry/segment.ts":
 /*!*********************************!*\
   !*** ./src/geometry/segment.ts ***!
@@ -3597,6 +3608,17 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 
 /***/ }),
 
+/***/ "./src/geometry/segmentGrid.ts":
+/*!*************************************!*\
+  !*** ./src/geometry/segmentGrid.ts ***!
+  \*************************************/
+/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
+
+"use strict";
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SegmentGrid)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n\r\n/**\r\n * Uniform grid over the bounding boxes of a set of segments for finding their pairwise crossings.\r\n * Every segment is registered in all cells its bounding box overlaps, and only segments sharing a cell are tested.\r\n * A pair is reported only in the cell that contains the top left corner of the intersection of both bounding boxes,\r\n * so no pair is found twice and no set of visited pairs is needed.\r\n * Crossings are defined like Segment.intersects: segments sharing their start or their end point do not cross.\r\n */\r\nclass SegmentGrid {\r\n    constructor(segments) {\r\n        this._originX = 0;\r\n        this._originY = 0;\r\n        this._cellWidth = 1;\r\n        this._cellHeight = 1;\r\n        this._cols = 1;\r\n        this._rows = 1;\r\n        this._segments = segments;\r\n        this._coords = new Float64Array(8 * segments.length);\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        let sumWidth = 0;\r\n        let sumHeight = 0;\r\n        for (let i = 0; i < segments.length; ++i) {\r\n            const segment = segments[i];\r\n            const c = 8 * i;\r\n            this._coords[c] = segment.start.x;\r\n            this._coords[c + 1] = segment.start.y;\r\n            this._coords[c + 2] = segment.end.x;\r\n            this._coords[c + 3] = segment.end.y;\r\n            this._coords[c + 4] = Math.min(segment.start.x, segment.end.x);\r\n            this._coords[c + 5] = Math.min(segment.start.y, segment.end.y);\r\n            this._coords[c + 6] = Math.max(segment.start.x, segment.end.x);\r\n            this._coords[c + 7] = Math.max(segment.start.y, segment.end.y);\r\n            minX = Math.min(minX, this._coords[c + 4]);\r\n            minY = Math.min(minY, this._coords[c + 5]);\r\n            maxX = Math.max(maxX, this._coords[c + 6]);\r\n            maxY = Math.max(maxY, this._coords[c + 7]);\r\n            sumWidth += this._coords[c + 6] - this._coords[c + 4];\r\n            sumHeight += this._coords[c + 7] - this._coords[c + 5];\r\n        }\r\n        if (segments.length === 0) {\r\n            this._cellStarts = new Int32Array(2);\r\n            this._cellSegments = new Int32Array(0);\r\n            return;\r\n        }\r\n        this._originX = minX;\r\n        this._originY = minY;\r\n        // cells about as large as the average bounding box, but not many more cells than segments\r\n        const width = maxX - minX;\r\n        const height = maxY - minY;\r\n        let cols = Math.max(1, Math.ceil(width / Math.max(1, sumWidth / segments.length)));\r\n        let rows = Math.max(1, Math.ceil(height / Math.max(1, sumHeight / segments.length)));\r\n        const maxCells = 4 * segments.length;\r\n        if (cols * rows > maxCells) {\r\n            const factor = Math.sqrt(cols * rows / maxCells);\r\n            cols = Math.max(1, Math.floor(cols / factor));\r\n            rows = Math.max(1, Math.floor(rows / factor));\r\n        }\r\n        while (true) {\r\n            this._setCells(width, height, cols, rows);\r\n            if (this._countEntries() <= SegmentGrid.MAX_CELLS_PER_SEGMENT * segments.length || cols * rows === 1) {\r\n                break;\r\n            }\r\n            cols = Math.max(1, Math.floor(cols / 2));\r\n            rows = Math.max(1, Math.floor(rows / 2));\r\n        }\r\n        this._fillCells();\r\n    }\r\n    /**\r\n     * Returns the number of pairwise crossings without materializing the pairs.\r\n     */\r\n    countCrossings() {\r\n        return this._forEachCrossing(null);\r\n    }\r\n    /**\r\n     * Returns the sum of the costs of all crossings, where a crossing costs between 1 (orthogonal segments) and\r\n     * 2 (almost parallel segments), see LayoutAnalysis.segmentCrossingsWithAngles.\r\n     */\r\n    crossingCost() {\r\n        let cost = 0;\r\n        this._forEachCrossing((i, j) => {\r\n            cost += 1 + this._angleCost(i, j);\r\n        });\r\n        return cost;\r\n    }\r\n    /**\r\n     * Returns all pairs of crossing segments.\r\n     */\r\n    crossingPairs() {\r\n        const pairs = [];\r\n        this._forEachCrossing((i, j) => {\r\n            pairs.push([this._segments[i], this._segments[j]]);\r\n        });\r\n        return pairs;\r\n    }\r\n    /**\r\n     * Calls f with the indices of every pair of crossing segments, the lower index first; returns the number of pairs.\r\n     */\r\n    forEachCrossing(f) {\r\n        return this._forEachCrossing(f);\r\n    }\r\n    _setCells(width, height, cols, rows) {\r\n        this._cols = cols;\r\n        this._rows = rows;\r\n        // a little wider than the extent, so that the maximum coordinates fall into the last cell\r\n        this._cellWidth = Math.max(width * (1 + 1e-9), _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON) / cols;\r\n        this._cellHeight = Math.max(height * (1 + 1e-9), _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON) / rows;\r\n    }\r\n    _col(x) {\r\n        return Math.min(this._cols - 1, Math.max(0, Math.floor((x - this._originX) / this._cellWidth)));\r\n    }\r\n    _row(y) {\r\n        return Math.min(this._rows - 1, Math.max(0, Math.floor((y - this._originY) / this._cellHeight)));\r\n    }\r\n    _countEntries() {\r\n        let entries = 0;\r\n        for (let i = 0; i < this._segments.length; ++i) {\r\n            const c = 8 * i;\r\n            entries += (this._col(this._coords[c + 6]) - this._col(this._coords[c + 4]) + 1)\r\n                * (this._row(this._coords[c + 7]) - this._row(this._coords[c + 5]) + 1);\r\n        }\r\n        return entries;\r\n    }\r\n    _fillCells() {\r\n        const numCells = this._cols * this._rows;\r\n        const cellStarts = new Int32Array(numCells + 1);\r\n        for (let i = 0; i < this._segments.length; ++i) {\r\n            const c = 8 * i;\r\n            const colEnd = this._col(this._coords[c + 6]);\r\n            const rowEnd = this._row(this._coords[c + 7]);\r\n            for (let row = this._row(this._coords[c + 5]); row <= rowEnd; ++row) {\r\n                for (let col = this._col(this._coords[c + 4]); col <= colEnd; ++col) {\r\n                    cellStarts[row * this._cols + col + 1]++;\r\n                }\r\n            }\r\n        }\r\n        for (let cell = 0; cell < numCells; ++cell) {\r\n            cellStarts[cell + 1] += cellStarts[cell];\r\n        }\r\n        const cellSegments = new Int32Array(cellStarts[numCells]);\r\n        const fill = cellStarts.slice(0, numCells);\r\n        for (let i = 0; i < this._segments.length; ++i) {\r\n            const c = 8 * i;\r\n            const colEnd = this._col(this._coords[c + 6]);\r\n            const rowEnd = this._row(this._coords[c + 7]);\r\n            for (let row = this._row(this._coords[c + 5]); row <= rowEnd; ++row) {\r\n                for (let col = this._col(this._coords[c + 4]); col <= colEnd; ++col) {\r\n                    cellSegments[fill[row * this._cols + col]++] = i;\r\n                }\r\n            }\r\n        }\r\n        this._cellStarts = cellStarts;\r\n        this._cellSegments = cellSegments;\r\n    }\r\n    _forEachCrossing(f) {\r\n        const coords = this._coords;\r\n        let count = 0;\r\n        for (let row = 0; row < this._rows; ++row) {\r\n            for (let col = 0; col < this._cols; ++col) {\r\n                const cell = row * this._cols + col;\r\n                const end = this._cellStarts[cell + 1];\r\n                for (let a = this._cellStarts[cell]; a < end; ++a) {\r\n                    const i = this._cellSegments[a];\r\n                    const ci = 8 * i;\r\n                    for (let b = a + 1; b < end; ++b) {\r\n                        const j = this._cellSegments[b];\r\n                        const cj = 8 * j;\r\n                        // bounding boxes intersect (like Box.intersects)\r\n                        if (!(coords[ci + 4] + _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON < coords[cj + 6] && coords[ci + 6] > coords[cj + 4] + _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON\r\n                            && coords[ci + 5] + _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON < coords[cj + 7] && coords[ci + 7] > coords[cj + 5] + _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON)) {\r\n                            continue;\r\n                        }\r\n                        // only reported in the cell of the top left corner of the intersection of the boxes\r\n                        if (this._col(Math.max(coords[ci + 4], coords[cj + 4])) !== col\r\n                            || this._row(Math.max(coords[ci + 5], coords[cj + 5])) !== row) {\r\n                            continue;\r\n                        }\r\n                        if (this._crosses(ci, cj)) {\r\n                            count++;\r\n                            if (f !== null) {\r\n                                if (i < j) {\r\n                                    f(i, j);\r\n                                }\r\n                                else {\r\n                                    f(j, i);\r\n                                }\r\n                            }\r\n                        }\r\n                    }\r\n                }\r\n            }\r\n        }\r\n        return count;\r\n    }\r\n    _crosses(ci, cj) {\r\n        const coords = this._coords;\r\n        if ((coords[ci] === coords[cj] && coords[ci + 1] === coords[cj + 1])\r\n            || (coords[ci + 2] === coords[cj + 2] && coords[ci + 3] === coords[cj + 3])) {\r\n            return false;\r\n        }\r\n        return (this._orientation(ci, coords[cj], coords[cj + 1]) !== this._orientation(ci, coords[cj + 2], coords[cj + 3])\r\n            && this._orientation(cj, coords[ci], coords[ci + 1]) !== this._orientation(cj, coords[ci + 2], coords[ci + 3]));\r\n    }\r\n    // like Segment.orientation\r\n    _orientation(c, x, y) {\r\n        const coords = this._coords;\r\n        return Math.sign((coords[c + 3] - coords[c + 1]) * (x - coords[c + 2]) - (coords[c + 2] - coords[c]) * (y - coords[c + 3]));\r\n    }\r\n    // (cos(2 * angle) + 1) / 2 for the angle between the segments, which is the squared cosine of the angle\r\n    _angleCost(i, j) {\r\n        const coords = this._coords;\r\n        const xI = coords[8 * i + 2] - coords[8 * i];\r\n        const yI = coords[8 * i + 3] - coords[8 * i + 1];\r\n        const xJ = coords[8 * j + 2] - coords[8 * j];\r\n        const yJ = coords[8 * j + 3] - coords[8 * j + 1];\r\n        const dot = xI * xJ + yI * yJ;\r\n        return dot * dot / ((xI * xI + yI * yI) * (xJ * xJ + yJ * yJ));\r\n    }\r\n}\r\n// segments registered in more cells than this on average coarsen the grid\r\nSegmentGrid.MAX_CELLS_PER_SEGMENT = 16;\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/geometry/segmentGrid.ts?");
+
+/***/ }),
+
 /***/ "./src/geometry/vector.ts":
 /*!********************************!*\
   !*** ./src/geometry/vector.ts ***!
@@ -3703,7 +3725,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ LayoutNode)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _layoutConnector__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./layoutConnector */ \"./src/layoutGraph/layoutConnector.ts\");\n/* harmony import */ var _graph_node__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../graph/node */ \"./src/graph/node.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\n\r\nclass LayoutNode extends _graph_node__WEBPACK_IMPORTED_MODULE_3__.default {\r\n    constructor(size = null, padding = 0, connectorPadding = 0, isVirtual = false, isBundle = false, addConnectors = true) {\r\n        super();\r\n        this.inConnectors = [];\r\n        this.outConnectors = [];\r\n        this.inConnectorBundles = [];\r\n        this.outConnectorBundles = [];\r\n        this.x = 0;\r\n        this.y = 0;\r\n        this.width = 0;\r\n        this.height = 0;\r\n        this.selfLoop = null;\r\n        this.isScopeNode = false;\r\n        this.hasScopedConnectors = false;\r\n        this.rank = null; // global rank (level) of the node\r\n        this.rankSpan = 1;\r\n        this.index = 0;\r\n        this.isVirtual = false;\r\n        this.levelNodes = [];\r\n        this.childGraphs = [];\r\n        this._inConnectors = new Map();\r\n        this._outConnectors = new Map();\r\n        if (size !== null) {\r\n            this.width = size.width;\r\n            this.height = size.height;\r\n        }\r\n        this.padding = padding;\r\n        this.connectorPadding = connectorPadding;\r\n        this.isVirtual = isVirtual;\r\n        this.isBundle = isBundle;\r\n        if (addConnectors && (isVirtual || isBundle)) {\r\n            this.addConnector(\"IN\", null);\r\n            this.addConnector(\"OUT\", null);\r\n        }\r\n    }\r\n    numInConnectors() {\r\n        return this.inConnectors.length;\r\n    }\r\n    numOutConnectors() {\r\n        return this.outConnectors.length;\r\n    }\r\n    connectors() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_0__.concat(this.inConnectors, this.outConnectors);\r\n    }\r\n    connector(type, name) {\r\n        if (type === \"IN\") {\r\n            return this._inConnectors.get(name);\r\n        }\r\n        else {\r\n            return this._outConnectors.get(name);\r\n        }\r\n    }\r\n    connectorIndex(type, name) {\r\n        const connectors = (type === \"IN\" ? this.inConnectors : this.outConnectors);\r\n        for (let i = 0; i < connectors.length; ++i) {\r\n            if (connectors[i].name === name) {\r\n                return i;\r\n            }\r\n        }\r\n        return -1;\r\n    }\r\n    addConnector(type, name, temporary = false) {\r\n        const connector = new _layoutConnector__WEBPACK_IMPORTED_MODULE_2__.default(this, type, name, temporary);\r\n        if (type === \"IN\") {\r\n            this._inConnectors.set(name, connector);\r\n            this.inConnectors.push(connector);\r\n        }\r\n        else {\r\n            this._outConnectors.set(name, connector);\r\n            this.outConnectors.push(connector);\r\n        }\r\n    }\r\n    removeConnector(type, name) {\r\n        if (type === \"IN\") {\r\n            const connector = this._inConnectors.get(name);\r\n            this._inConnectors.delete(name);\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.pull(this.inConnectors, connector);\r\n        }\r\n        else {\r\n            const connector = this._outConnectors.get(name);\r\n            this._outConnectors.delete(name);\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.pull(this.outConnectors, connector);\r\n        }\r\n    }\r\n    translate(x, y) {\r\n        this.x += x;\r\n        this.y += y;\r\n        if (this.selfLoop !== null) {\r\n            this.selfLoop.translate(x, y);\r\n        }\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n            childGraph.translateElements(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectorBundles, (inBundle) => {\r\n            inBundle.x += x;\r\n            inBundle.y += y;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectorBundles, (outBundle) => {\r\n            outBundle.x += x;\r\n            outBundle.y += y;\r\n        });\r\n    }\r\n    translateWithoutChildren(x, y) {\r\n        this.x += x;\r\n        this.y += y;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n    }\r\n    setPosition(position) {\r\n        this.x = position.x;\r\n        this.y = position.y;\r\n    }\r\n    updatePosition(position) {\r\n        const prevX = this.x;\r\n        const prevY = this.y;\r\n        const offsetX = position.x - prevX;\r\n        const offsetY = position.y - prevY;\r\n        this.x = position.x;\r\n        this.y = position.y;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n            childGraph.translateElements(offsetX, offsetY);\r\n        });\r\n    }\r\n    setSize(size) {\r\n        this.width = size.width;\r\n        this.height = size.height;\r\n    }\r\n    updateSize(size) {\r\n        this.width = Math.max(this.width, size.width);\r\n        this.height = Math.max(this.height, size.height);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.levelNodes, (levelNode) => {\r\n            levelNode.width = this.width;\r\n        });\r\n    }\r\n    setWidth(width) {\r\n        this.width = width;\r\n    }\r\n    position() {\r\n        return (new _geometry_vector__WEBPACK_IMPORTED_MODULE_4__.default(this.x, this.y));\r\n    }\r\n    size() {\r\n        return {\r\n            width: this.width,\r\n            height: this.height,\r\n        };\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    offsetRank(offset) {\r\n        this.rank += offset;\r\n        if (offset !== 0) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n                childGraph.offsetRank(offset);\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.levelNodes, (levelNode, r) => {\r\n                levelNode.rank = this.rank + r;\r\n            });\r\n        }\r\n    }\r\n    updateRank(newRank) {\r\n        if (this.rank !== newRank) {\r\n            this.offsetRank(newRank - this.rank);\r\n        }\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layoutGraph/layoutNode.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ LayoutNode)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _layoutConnector__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./layoutConnector */ \"./src/layoutGraph/layoutConnector.ts\");\n/* harmony import */ var _graph_node__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../graph/node */ \"./src/graph/node.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\n\r\nclass LayoutNode extends _graph_node__WEBPACK_IMPORTED_MODULE_3__.default {\r\n    constructor(size = null, padding = 0, connectorPadding = 0, isVirtual = false, isBundle = false, addConnectors = true) {\r\n        super();\r\n        this.inConnectors = [];\r\n        this.outConnectors = [];\r\n        this.inConnectorBundles = [];\r\n        this.outConnectorBundles = [];\r\n        this.x = 0;\r\n        this.y = 0;\r\n        this.width = 0;\r\n        this.height = 0;\r\n        this.selfLoop = null;\r\n        this.isScopeNode = false;\r\n        this.hasScopedConnectors = false;\r\n        this.rank = null; // global rank (level) of the node\r\n        this.rankSpan = 1;\r\n        this.index = 0;\r\n        this.isVirtual = false;\r\n        this.levelNodes = [];\r\n        // ids of the render nodes from the top-level graph down to this node, e.g. \"3/12\", null for scope and virtual nodes\r\n        this.renderPath = null;\r\n        this.childGraphs = [];\r\n        this._inConnectors = new Map();\r\n        this._outConnectors = new Map();\r\n        if (size !== null) {\r\n            this.width = size.width;\r\n            this.height = size.height;\r\n        }\r\n        this.padding = padding;\r\n        this.connectorPadding = connectorPadding;\r\n        this.isVirtual = isVirtual;\r\n        this.isBundle = isBundle;\r\n        if (addConnectors && (isVirtual || isBundle)) {\r\n            this.addConnector(\"IN\", null);\r\n            this.addConnector(\"OUT\", null);\r\n        }\r\n    }\r\n    numInConnectors() {\r\n        return this.inConnectors.length;\r\n    }\r\n    numOutConnectors() {\r\n        return this.outConnectors.length;\r\n    }\r\n    connectors() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_0__.concat(this.inConnectors, this.outConnectors);\r\n    }\r\n    connector(type, name) {\r\n        if (type === \"IN\") {\r\n            return this._inConnectors.get(name);\r\n        }\r\n        else {\r\n            return this._outConnectors.get(name);\r\n        }\r\n    }\r\n    connectorIndex(type, name) {\r\n        const connectors = (type === \"IN\" ? this.inConnectors : this.outConnectors);\r\n        for (let i = 0; i < connectors.length; ++i) {\r\n            if (connectors[i].name === name) {\r\n                return i;\r\n            }\r\n        }\r\n        return -1;\r\n    }\r\n    addConnector(type, name, temporary = false) {\r\n        const connector = new _layoutConnector__WEBPACK_IMPORTED_MODULE_2__.default(this, type, name, temporary);\r\n        if (type === \"IN\") {\r\n            this._inConnectors.set(name, connector);\r\n            this.inConnectors.push(connector);\r\n        }\r\n        else {\r\n            this._outConnectors.set(name, connector);\r\n            this.outConnectors.push(connector);\r\n        }\r\n    }\r\n    removeConnector(type, name) {\r\n        if (type === \"IN\") {\r\n            const connector = this._inConnectors.get(name);\r\n            this._inConnectors.delete(name);\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.pull(this.inConnectors, connector);\r\n        }\r\n        else {\r\n            const connector = this._outConnectors.get(name);\r\n            this._outConnectors.delete(name);\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.pull(this.outConnectors, connector);\r\n        }\r\n    }\r\n    translate(x, y) {\r\n        this.x += x;\r\n        this.y += y;\r\n        if (this.selfLoop !== null) {\r\n            this.selfLoop.translate(x, y);\r\n        }\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n            childGraph.translateElements(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectorBundles, (inBundle) => {\r\n            inBundle.x += x;\r\n            inBundle.y += y;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectorBundles, (outBundle) => {\r\n            outBundle.x += x;\r\n            outBundle.y += y;\r\n        });\r\n    }\r\n    translateWithoutChildren(x, y) {\r\n        this.x += x;\r\n        this.y += y;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.inConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.outConnectors, (connector) => {\r\n            connector.translate(x, y);\r\n        });\r\n    }\r\n    setPosition(position) {\r\n        this.x = position.x;\r\n        this.y = position.y;\r\n    }\r\n    updatePosition(position) {\r\n        const prevX = this.x;\r\n        const prevY = this.y;\r\n        const offsetX = position.x - prevX;\r\n        const offsetY = position.y - prevY;\r\n        this.x = position.x;\r\n        this.y = position.y;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n            childGraph.translateElements(offsetX, offsetY);\r\n        });\r\n    }\r\n    setSize(size) {\r\n        this.width = size.width;\r\n        this.height = size.height;\r\n    }\r\n    updateSize(size) {\r\n        this.width = Math.max(this.width, size.width);\r\n        this.height = Math.max(this.height, size.height);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.levelNodes, (levelNode) => {\r\n            levelNode.width = this.width;\r\n        });\r\n    }\r\n    setWidth(width) {\r\n        this.width = width;\r\n    }\r\n    position() {\r\n        return (new _geometry_vector__WEBPACK_IMPORTED_MODULE_4__.default(this.x, this.y));\r\n    }\r\n    size() {\r\n        return {\r\n            width: this.width,\r\n            height: this.height,\r\n        };\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    offsetRank(offset) {\r\n        this.rank += offset;\r\n        if (offset !== 0) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.childGraphs, (childGraph) => {\r\n                childGraph.offsetRank(offset);\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.levelNodes, (levelNode, r) => {\r\n                levelNode.rank = this.rank + r;\r\n            });\r\n        }\r\n    }\r\n    updateRank(newRank) {\r\n        if (this.rank !== newRank) {\r\n            this.offsetRank(newRank - this.rank);\r\n        }\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layoutGraph/layoutNode.ts?");
 
 /***/ }),
 
@@ -3725,7 +3747,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Layouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! seedrandom */ \"./node_modules/seedrandom/index.js\");\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(seedrandom__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../layoutGraph/layoutBundle */ \"./src/layoutGraph/layoutBundle.ts\");\n/* harmony import */ var _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../layoutGraph/layoutEdge */ \"./src/layoutGraph/layoutEdge.ts\");\n/* harmony import */ var _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../layoutGraph/layoutGraph */ \"./src/layoutGraph/layoutGraph.ts\");\n/* harmony import */ var _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../layoutGraph/layoutNode */ \"./src/layoutGraph/layoutNode.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Layouter {\r\n    constructor(options = {}) {\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, {\r\n            targetEdgeLength: 50,\r\n            spaceBetweenNodes: 30,\r\n            weightBends: 0.2,\r\n            weightCrossings: 1,\r\n            weightLengths: 0.1,\r\n            printTimes: false,\r\n        });\r\n    }\r\n    getOptionsForAnalysis() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_1__.pick(this._options, [\r\n            \"targetEdgeLength\",\r\n            \"weightBends\",\r\n            \"weightCrossings\",\r\n            \"weightLengths\",\r\n        ]);\r\n    }\r\n    layout(renderGraph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const layoutGraph = this.createLayoutGraph(renderGraph);\r\n            this._createComponents(layoutGraph);\r\n            if (this._options['bundle']) {\r\n                this._createBundles(layoutGraph);\r\n            }\r\n            this._removeCycles(layoutGraph);\r\n            const tmpRandom = Math.random;\r\n            seedrandom__WEBPACK_IMPORTED_MODULE_2__(\"I am the seed string.\", { global: true });\r\n            yield this.doLayout(layoutGraph);\r\n            Math.random = tmpRandom;\r\n            this._restoreCycles(layoutGraph);\r\n            this._placeLoops(layoutGraph);\r\n            this._copyLayoutInfo(layoutGraph, renderGraph);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(renderGraph.allEdges(), (edge) => edge.points.length > 0, \"edge has no points assigned\");\r\n            }\r\n            if (this._options.printTimes) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.printTimes();\r\n            }\r\n            return layoutGraph;\r\n        });\r\n    }\r\n    cleanUp() {\r\n        // do nothing\r\n    }\r\n    /**\r\n     * Places the scoped connectors in the middle and the unscoped evenly on both sides.\r\n     */\r\n    _placeConnectorsCenter(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            const inConnectorsScoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.inConnectors, connector => connector.isScoped);\r\n            const inConnectorsUnscoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.inConnectors, connector => !connector.isScoped);\r\n            const outConnectorsScoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.outConnectors, connector => connector.isScoped);\r\n            const outConnectorsUnscoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.outConnectors, connector => !connector.isScoped);\r\n            const hasMoreInThanOut = inConnectorsUnscoped.length > outConnectorsUnscoped.length ? 1 : 0;\r\n            const hasMoreOutThanIn = outConnectorsUnscoped.length > inConnectorsUnscoped.length ? 1 : 0;\r\n            const arrangedInConnectors = [];\r\n            const arrangedOutConnectors = [];\r\n            for (let i = 0; i < inConnectorsUnscoped.length; ++i) {\r\n                const isLeft = i < (inConnectorsUnscoped.length - hasMoreInThanOut) / 2;\r\n                arrangedInConnectors[i + (isLeft ? 0 : inConnectorsScoped.length)] = inConnectorsUnscoped[i];\r\n            }\r\n            let offset = Math.ceil((inConnectorsUnscoped.length - hasMoreInThanOut) / 2);\r\n            for (let i = 0; i < inConnectorsScoped.length; ++i) {\r\n                arrangedInConnectors[i + offset] = inConnectorsScoped[i];\r\n            }\r\n            for (let i = 0; i < outConnectorsUnscoped.length; ++i) {\r\n                let isLeft = i < (outConnectorsUnscoped.length - hasMoreOutThanIn) / 2;\r\n                arrangedOutConnectors[i + (isLeft ? 0 : outConnectorsScoped.length)] = outConnectorsUnscoped[i];\r\n            }\r\n            offset = Math.ceil((outConnectorsUnscoped.length - hasMoreOutThanIn) / 2);\r\n            for (let i = 0; i < outConnectorsScoped.length; ++i) {\r\n                arrangedOutConnectors[i + offset] = outConnectorsScoped[i];\r\n            }\r\n            const connectorDifference = node.inConnectors.length - node.outConnectors.length;\r\n            if (node.inConnectors.length > 0) {\r\n                let inConnectorsWidth = node.inConnectors.length * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + (node.inConnectors.length - 1) * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                if (connectorDifference % 2 === -1 && inConnectorsScoped.length > 0) {\r\n                    inConnectorsWidth += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                }\r\n                const firstX = node.x + (node.width - inConnectorsWidth) / 2;\r\n                const y = node.y - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(arrangedInConnectors, (connector, i) => {\r\n                    let connectorX = firstX + (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) * i;\r\n                    let connectorY = y;\r\n                    if (connector.width === 0) {\r\n                        connectorX += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        connectorY += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    connector.setPosition(connectorX, connectorY);\r\n                });\r\n            }\r\n            if (node.outConnectors.length > 0) {\r\n                let outConnectorsWidth = node.outConnectors.length * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + (node.outConnectors.length - 1) * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                if (connectorDifference % 2 === 1 && inConnectorsScoped.length > 0) {\r\n                    outConnectorsWidth += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                }\r\n                const firstX = node.x + (node.width - outConnectorsWidth) / 2;\r\n                const y = node.y + node.height - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(arrangedOutConnectors, (connector, i) => {\r\n                    let connectorX = firstX + (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) * i;\r\n                    let connectorY = y;\r\n                    if (connector.width === 0) {\r\n                        connectorX += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        connectorY += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    connector.setPosition(connectorX, connectorY);\r\n                });\r\n            }\r\n        });\r\n    }\r\n    _matchEdgesToConnectors(layoutGraph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            const srcNode = edge.graph.node(edge.src);\r\n            let srcConnector = srcNode.connector(\"OUT\", edge.srcConnector);\r\n            if (srcConnector === undefined && srcNode.childGraphs.length > 0) {\r\n                const childGraph = srcNode.childGraphs[0];\r\n                if (childGraph.exitNode !== null) {\r\n                    srcConnector = childGraph.exitNode.connector(\"OUT\", edge.srcConnector);\r\n                }\r\n            }\r\n            if (srcConnector === undefined) {\r\n                return;\r\n            }\r\n            edge.points[0] = srcConnector.boundingBox().bottomCenter();\r\n            const dstNode = edge.graph.node(edge.dst);\r\n            let dstConnector = dstNode.connector(\"IN\", edge.dstConnector);\r\n            if (dstConnector === undefined && dstNode.childGraphs.length > 0) {\r\n                const childGraph = dstNode.childGraphs[0];\r\n                if (childGraph.entryNode !== null) {\r\n                    dstConnector = childGraph.entryNode.connector(\"IN\", edge.dstConnector);\r\n                }\r\n            }\r\n            if (dstConnector === undefined) {\r\n                return;\r\n            }\r\n            edge.points[edge.points.length - 1] = dstConnector.boundingBox().topCenter();\r\n        });\r\n    }\r\n    createLayoutGraph(renderGraph) {\r\n        const transformSubgraph = (renderGraph) => {\r\n            let mayHaveCycles = false;\r\n            if (renderGraph.parentNode === null || renderGraph.parentNode.type() === \"NestedSDFG\") {\r\n                mayHaveCycles = true;\r\n            }\r\n            const layoutGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default(mayHaveCycles);\r\n            // add nodes and create groups for scopes (maps etc.)\r\n            const createLayoutNode = (node) => {\r\n                const layoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__.default(node.size(), node.childPadding, node.connectorPadding);\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.inConnectors, (connector) => {\r\n                    layoutNode.addConnector(\"IN\", connector.name);\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.outConnectors, (connector) => {\r\n                    layoutNode.addConnector(\"OUT\", connector.name);\r\n                });\r\n                node.layoutNode = layoutNode;\r\n                return layoutNode;\r\n            };\r\n            // create layout nodes for scope entries and scopes around them\r\n            const layoutChildren = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.type().endsWith(\"Entry\")) {\r\n                    // check if corresponding exit node exists\r\n                    let exitExists = false;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node2) => {\r\n                        if (node2.type().endsWith(\"Exit\") && node2.scopeEntry === node.id) {\r\n                            exitExists = true;\r\n                        }\r\n                    });\r\n                    if (!exitExists) {\r\n                        return;\r\n                    }\r\n                    const entryNode = createLayoutNode(node);\r\n                    const scopeNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__.default();\r\n                    const scopeGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default();\r\n                    scopeNode.setChildGraph(scopeGraph);\r\n                    scopeGraph.addNode(entryNode);\r\n                    node.layoutGraph = scopeGraph;\r\n                    node.layoutNode = entryNode;\r\n                    scopeGraph.entryNode = entryNode;\r\n                    scopeNode.isScopeNode = true;\r\n                    layoutChildren.set(scopeNode, []);\r\n                    scopeNode.setLabel(\"Map with entry \" + entryNode.label()); // for debugging\r\n                }\r\n            });\r\n            // create unscoped layout nodes and assign children (other than the entry) to the scope node\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.scopeEntry === null || renderGraph.node(node.scopeEntry).layoutGraph.parentNode === null || !renderGraph.node(node.scopeEntry).layoutGraph.parentNode.isScopeNode) {\r\n                    if (node.layoutNode) {\r\n                        layoutGraph.addNode(node.layoutGraph.parentNode);\r\n                    }\r\n                    else {\r\n                        layoutGraph.addNode(createLayoutNode(node));\r\n                        node.layoutGraph = layoutGraph;\r\n                    }\r\n                }\r\n                else {\r\n                    layoutChildren.get((renderGraph.node(node.scopeEntry)).layoutGraph.parentNode).push(node);\r\n                }\r\n            });\r\n            // recursively add scope children\r\n            const addScopeChildren = (layoutGraph) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.nodes(), (node) => {\r\n                    if (layoutChildren.has(node)) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutChildren.get(node), (renderNode) => {\r\n                            if (renderNode.layoutNode) {\r\n                                // renderNode is an entry node\r\n                                node.childGraph.addNode(renderNode.layoutGraph.parentNode);\r\n                            }\r\n                            else {\r\n                                const layoutNode = createLayoutNode(renderNode);\r\n                                node.childGraph.addNode(layoutNode);\r\n                                renderNode.layoutGraph = node.childGraph;\r\n                                if (renderNode.type().endsWith(\"Exit\")) {\r\n                                    node.childGraph.exitNode = layoutNode;\r\n                                }\r\n                            }\r\n                        });\r\n                    }\r\n                    if (node.childGraph !== null) {\r\n                        addScopeChildren(node.childGraph);\r\n                    }\r\n                });\r\n            };\r\n            addScopeChildren(layoutGraph);\r\n            // add edges\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.edges(), (edge) => {\r\n                let srcNode = renderGraph.node(edge.src);\r\n                let dstNode = renderGraph.node(edge.dst);\r\n                let srcLayoutNode = srcNode.layoutNode;\r\n                let dstLayoutNode = dstNode.layoutNode;\r\n                if (srcNode.layoutGraph !== dstNode.layoutGraph) {\r\n                    if (dstNode.layoutGraph.entryNode === dstLayoutNode) {\r\n                        dstLayoutNode = dstNode.layoutGraph.parentNode;\r\n                    }\r\n                    if (srcNode.layoutGraph.exitNode === srcLayoutNode) {\r\n                        srcLayoutNode = srcNode.layoutGraph.parentNode;\r\n                    }\r\n                }\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assert(srcLayoutNode.graph === dstLayoutNode.graph, \"edge between different graphs\", edge);\r\n                }\r\n                // add dummy connectors (with name=null)\r\n                if (edge.src !== edge.dst) {\r\n                    if (srcNode.layoutNode.connector(\"OUT\", edge.srcConnector) === undefined) {\r\n                        srcNode.layoutNode.addConnector(\"OUT\", edge.srcConnector, true);\r\n                    }\r\n                    if (dstNode.layoutNode.connector(\"IN\", edge.dstConnector) === undefined) {\r\n                        dstNode.layoutNode.addConnector(\"IN\", edge.dstConnector, true);\r\n                    }\r\n                }\r\n                edge.layoutEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_5__.default(srcLayoutNode.id, dstLayoutNode.id, edge.srcConnector, edge.dstConnector);\r\n                srcLayoutNode.graph.addEdge(edge.layoutEdge);\r\n            });\r\n            // recursively transform subgraph\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.childGraph !== null) {\r\n                    node.layoutNode.setChildGraph(transformSubgraph(node.childGraph));\r\n                }\r\n            });\r\n            renderGraph.layoutGraph = layoutGraph;\r\n            return layoutGraph;\r\n        };\r\n        return transformSubgraph(renderGraph);\r\n    }\r\n    _createComponents(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            if (node.childGraph !== null) {\r\n                if (node.isScopeNode || node.childGraph.mayHaveCycles) {\r\n                    node.childGraphs.push(node.childGraph);\r\n                }\r\n                else {\r\n                    // only nodes of type NestedSDFG may have more than one component as child graph\r\n                    lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.childGraph.components(), (component) => {\r\n                        const childGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default();\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(component.nodes(), (node) => {\r\n                            childGraph.addNode(node, node.id);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(component.edges(), (edge) => {\r\n                            childGraph.addEdge(edge, edge.id);\r\n                        });\r\n                        node.childGraphs.push(childGraph);\r\n                        childGraph.parentNode = node;\r\n                    });\r\n                    if (node.childGraphs.length === 0) {\r\n                        node.childGraphs.push(node.childGraph);\r\n                    }\r\n                }\r\n                node.childGraph = null; // property childGraph should not be used after this point\r\n            }\r\n        });\r\n    }\r\n    printLayout(graph, level = 0) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n            console.log(\"  \".repeat(level) + node.label());\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.childGraphs, (childGraph) => {\r\n                this.printLayout(childGraph, level + 1);\r\n            });\r\n        });\r\n    }\r\n    _createBundles(layoutGraph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allGraphs(), (graph) => {\r\n            const bundles = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n                if ((edge.srcConnector !== null || edge.dstConnector !== null) && (edge.srcConnector === null || edge.dstConnector === null)) {\r\n                    const key = edge.src + \"_\" + edge.dst;\r\n                    const connectorName = edge.srcConnector || edge.dstConnector;\r\n                    let bundle;\r\n                    if (!bundles.has(key)) {\r\n                        bundle = new _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__.default();\r\n                        bundles.set(key, bundle);\r\n                        if (connectorName === edge.srcConnector) {\r\n                            let srcNode = graph.node(edge.src);\r\n                            if (srcNode.isScopeNode) {\r\n                                srcNode = srcNode.childGraphs[0].exitNode;\r\n                            }\r\n                            srcNode.outConnectorBundles.push(bundle);\r\n                        }\r\n                        else {\r\n                            let dstNode = graph.node(edge.dst);\r\n                            if (dstNode.isScopeNode) {\r\n                                dstNode = dstNode.childGraphs[0].entryNode;\r\n                            }\r\n                            dstNode.inConnectorBundles.push(bundle);\r\n                        }\r\n                    }\r\n                    else {\r\n                        bundle = bundles.get(key);\r\n                    }\r\n                    bundle.connectors.push(connectorName);\r\n                    if (edge.srcConnector !== null) {\r\n                        edge.srcBundle = bundle;\r\n                    }\r\n                    else {\r\n                        edge.dstBundle = bundle;\r\n                    }\r\n                }\r\n            });\r\n        });\r\n        // as soon as a node has some bundle, all edges have to be assigned a bundle\r\n        // otherwise edges with and without bundles may create clutter and unwanted crossings\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allNodes(), (node) => {\r\n            const addBundles = (bundles, connectors, edgeMethod, connectorProp, bundleProp, entryExit) => {\r\n                if (node[bundles].length > 0) {\r\n                    let graph = node.graph;\r\n                    let id = node.id;\r\n                    if (graph[entryExit] === node) {\r\n                        graph = node.graph.parentNode.graph;\r\n                        id = node.graph.parentNode.id;\r\n                    }\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_1__.some(node[bundles], bundle => bundle.connectors.length > 1)) {\r\n                        const remainingConnectors = new Set();\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node[connectors], (connector) => {\r\n                            remainingConnectors.add(connector.name);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node[bundles], (bundle) => {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(bundle.connectors, (name) => {\r\n                                remainingConnectors.delete(name);\r\n                            });\r\n                        });\r\n                        remainingConnectors.forEach((name) => {\r\n                            const bundle = new _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__.default();\r\n                            bundle.addConnector(name);\r\n                            node[bundles].push(bundle);\r\n                            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph[edgeMethod](id), (edge) => {\r\n                                if (edge[connectorProp] === name) {\r\n                                    edge[bundleProp] = bundle;\r\n                                }\r\n                            });\r\n                        });\r\n                    }\r\n                    else {\r\n                        node[bundles] = [];\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph[edgeMethod](id), (edge) => {\r\n                            edge[bundleProp] = null;\r\n                        });\r\n                    }\r\n                }\r\n            };\r\n            addBundles(\"inConnectorBundles\", \"inConnectors\", \"inEdges\", \"dstConnector\", \"dstBundle\", \"entryNode\");\r\n            addBundles(\"outConnectorBundles\", \"outConnectors\", \"outEdges\", \"srcConnector\", \"srcBundle\", \"exitNode\");\r\n        });\r\n        // mark all but one edges in a bundle as replica\r\n        const bundles = new Set();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            if (edge.srcBundle !== null || edge.dstBundle !== null) {\r\n                const bundle = edge.srcBundle || edge.dstBundle;\r\n                if (bundles.has(bundle)) {\r\n                    edge.isReplica = true;\r\n                }\r\n                else {\r\n                    bundles.add(bundle);\r\n                }\r\n                bundle.edges.push(edge);\r\n            }\r\n        });\r\n    }\r\n    _copyLayoutInfo(layoutGraph, renderGraph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.allNodes(), (node) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.assign(node, node.layoutNode.boundingBox());\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.concat(node.inConnectors), (connector) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.assign(connector, node.layoutNode.connector(\"IN\", connector.name).boundingBox());\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.concat(node.outConnectors), (connector) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.assign(connector, node.layoutNode.connector(\"OUT\", connector.name).boundingBox());\r\n            });\r\n            delete node.layoutGraph;\r\n            delete node.layoutNode;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.allEdges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.assign(edge, lodash__WEBPACK_IMPORTED_MODULE_1__.pick(edge.layoutEdge, ['points', 'labelX', 'labelY']));\r\n            // duplicate bundle points to make curved edges go through them\r\n            if (edge.layoutEdge.srcBundle !== null) {\r\n                edge.points.splice(1, 0, edge.points[1].clone());\r\n            }\r\n            if (edge.layoutEdge.dstBundle !== null) {\r\n                edge.points.splice(edge.points.length - 2, 0, edge.points[edge.points.length - 2].clone());\r\n            }\r\n            edge.updateBoundingBox();\r\n            delete edge.layoutEdge;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.allGraphs(), (graph) => {\r\n            delete graph.layoutGraph;\r\n        });\r\n    }\r\n    _removeCycles(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allGraphs(), (subgraph) => {\r\n            if (subgraph.mayHaveCycles) {\r\n                // remove self-loops\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(subgraph.edges(), (edge) => {\r\n                    if (edge.src === edge.dst) {\r\n                        subgraph.node(edge.src).selfLoop = edge;\r\n                        subgraph.removeEdge(edge.id);\r\n                    }\r\n                });\r\n                // remove normal cycles\r\n                const invertedEdges = subgraph.removeCycles();\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(invertedEdges, (edge) => {\r\n                    const newSrc = subgraph.node(edge.src);\r\n                    const newDst = subgraph.node(edge.dst);\r\n                    newSrc.addConnector(\"OUT\", \"bottomIn\", true);\r\n                    newDst.addConnector(\"IN\", \"topOut\", true);\r\n                    edge.srcConnector = \"bottomIn\";\r\n                    edge.dstConnector = \"topOut\";\r\n                    if (!lodash__WEBPACK_IMPORTED_MODULE_1__.some(subgraph.outEdges(newDst.id), edge => edge.srcConnector === null)) {\r\n                        newDst.removeConnector(\"OUT\", null);\r\n                    }\r\n                    if (!lodash__WEBPACK_IMPORTED_MODULE_1__.some(subgraph.inEdges(newSrc.id), edge => edge.dstConnector === null)) {\r\n                        newSrc.removeConnector(\"IN\", null);\r\n                    }\r\n                });\r\n            }\r\n        });\r\n    }\r\n    _restoreCycles(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allEdges(), (edge) => {\r\n            if (edge.isInverted) {\r\n                edge.graph.invertEdge(edge.id);\r\n                edge.points = lodash__WEBPACK_IMPORTED_MODULE_1__.reverse(edge.points);\r\n                edge.isInverted = false;\r\n            }\r\n        });\r\n    }\r\n    _placeLoops(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            if (node.selfLoop !== null) {\r\n                node.selfLoop.points = [\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width - this._options.targetEdgeLength, node.y + node.height - 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width, node.y + node.height - 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width, node.y + 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width - this._options.targetEdgeLength, node.y + 10),\r\n                ];\r\n                node.width -= this._options.targetEdgeLength;\r\n            }\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/layouter.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Layouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! seedrandom */ \"./node_modules/seedrandom/index.js\");\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(seedrandom__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../layoutGraph/layoutBundle */ \"./src/layoutGraph/layoutBundle.ts\");\n/* harmony import */ var _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../layoutGraph/layoutEdge */ \"./src/layoutGraph/layoutEdge.ts\");\n/* harmony import */ var _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../layoutGraph/layoutGraph */ \"./src/layoutGraph/layoutGraph.ts\");\n/* harmony import */ var _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../layoutGraph/layoutNode */ \"./src/layoutGraph/layoutNode.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Layouter {\r\n    constructor(options = {}) {\r\n        // laid out nodes with child graphs by render path, for the option lazy\r\n        this._innerLayouts = new Map();\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, {\r\n            targetEdgeLength: 50,\r\n            spaceBetweenNodes: 30,\r\n            weightBends: 0.2,\r\n            weightCrossings: 1,\r\n            weightLengths: 0.1,\r\n            printTimes: false,\r\n            relayoutThreshold: 0.5,\r\n            lazy: false,\r\n        });\r\n    }\r\n    getOptionsForAnalysis() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_1__.pick(this._options, [\r\n            \"targetEdgeLength\",\r\n            \"weightBends\",\r\n            \"weightCrossings\",\r\n            \"weightLengths\",\r\n        ]);\r\n    }\r\n    layout(renderGraph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            this._innerLayouts.clear();\r\n            return this._layout(renderGraph, null, []);\r\n        });\r\n    }\r\n    /**\r\n     * Expands the node at the id path (see relayout) and lays out the graph again.\r\n     * With the option lazy, collapsed nodes with child graphs (states and nested SDFGs) are laid out as placeholders\r\n     * of their collapsed size without their contents, which get no layout at all. The layouter keeps the inner\r\n     * layout of every expanded node until the next call of layout, so expanding lays out only the contents of the\r\n     * node if it was never expanded before, and the graphs around it. Collapsing and expanding again reuses the inner\r\n     * layout. Without lazy, the whole graph is laid out again and collapsed nodes are laid out like expanded ones.\r\n     */\r\n    expand(renderGraph, path) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            return this._setCollapsed(renderGraph, path, false);\r\n        });\r\n    }\r\n    /**\r\n     * Collapses the node at the id path and lays out the graph again (see expand).\r\n     */\r\n    collapse(renderGraph, path) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            return this._setCollapsed(renderGraph, path, true);\r\n        });\r\n    }\r\n    _setCollapsed(renderGraph, path, collapsed) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            let graph = renderGraph;\r\n            let node = null;\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(path, (id) => {\r\n                node = graph.node(id);\r\n                graph = node.childGraph;\r\n            });\r\n            if (node === null || node.childGraph === null) {\r\n                throw new Error(\"No node with child graph at path \" + path.join(\"/\"));\r\n            }\r\n            node.collapsed = collapsed;\r\n            return this._layout(renderGraph, null, []);\r\n        });\r\n    }\r\n    /**\r\n     * Lays out an edited graph and keeps the previous layout of the nested graphs the edit did not touch.\r\n     * previous is the result of the last layout (or relayout) of the graph before the edit. changes holds the id\r\n     * paths of the added, removed or modified render nodes, i.e. the ids from the top-level graph down to the node\r\n     * (e.g. [stateId, nodeId] for a node in a state); an added or removed edge is given by its source or destination.\r\n     * Nodes with child graphs (states, nested SDFGs) without changes keep their size and contents: they are laid out\r\n     * like simple nodes and their contents are moved along with them, so only the graphs on the paths to the changes\r\n     * are ranked, ordered and placed again. Map scopes are part of their graph and always laid out again.\r\n     * If more than relayoutThreshold of all nodes would have to be laid out again, the whole graph is laid out.\r\n     */\r\n    relayout(renderGraph, previous, changes) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            return this._layout(renderGraph, previous, changes);\r\n        });\r\n    }\r\n    _layout(renderGraph, previous, changes) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const layoutGraph = this.createLayoutGraph(renderGraph);\r\n            this._createComponents(layoutGraph);\r\n            let reused = (previous !== null ? this._detachReusable(layoutGraph, previous, changes) : []);\r\n            if (this._options.lazy) {\r\n                reused = reused.concat(this._detachCached(layoutGraph, changes));\r\n            }\r\n            if (this._options['bundle']) {\r\n                this._createBundles(layoutGraph);\r\n            }\r\n            this._removeCycles(layoutGraph);\r\n            const tmpRandom = Math.random;\r\n            seedrandom__WEBPACK_IMPORTED_MODULE_2__(\"I am the seed string.\", { global: true });\r\n            const timerEnabled = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.isEnabled();\r\n            if (this._options.printTimes) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.setEnabled(true);\r\n            }\r\n            yield this.doLayout(layoutGraph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.setEnabled(timerEnabled);\r\n            Math.random = tmpRandom;\r\n            this._attachReused(reused);\r\n            this._restoreCycles(layoutGraph);\r\n            this._placeLoops(layoutGraph);\r\n            if (this._options.lazy) {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allNodes(), (node) => {\r\n                    if (!node.isScopeNode && node.childGraphs.length > 0 && node.renderPath !== null) {\r\n                        this._innerLayouts.set(node.renderPath, node);\r\n                    }\r\n                });\r\n            }\r\n            const laidOutGraphs = this._laidOutGraphs(renderGraph);\r\n            this._copyLayoutInfo(laidOutGraphs);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(laidOutGraphs, (graph) => {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(graph.edges(), (edge) => edge.points.length > 0, \"edge has no points assigned\");\r\n                });\r\n            }\r\n            if (this._options.printTimes) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.printTimes();\r\n            }\r\n            return layoutGraph;\r\n        });\r\n    }\r\n    /**\r\n     * Resolves once the layouter is ready to lay out, e.g. when its web workers have started.\r\n     */\r\n    ready() {\r\n        return Promise.resolve();\r\n    }\r\n    cleanUp() {\r\n        // do nothing\r\n    }\r\n    /**\r\n     * Places the scoped connectors in the middle and the unscoped evenly on both sides.\r\n     */\r\n    _placeConnectorsCenter(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            const inConnectorsScoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.inConnectors, connector => connector.isScoped);\r\n            const inConnectorsUnscoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.inConnectors, connector => !connector.isScoped);\r\n            const outConnectorsScoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.outConnectors, connector => connector.isScoped);\r\n            const outConnectorsUnscoped = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(node.outConnectors, connector => !connector.isScoped);\r\n            const hasMoreInThanOut = inConnectorsUnscoped.length > outConnectorsUnscoped.length ? 1 : 0;\r\n            const hasMoreOutThanIn = outConnectorsUnscoped.length > inConnectorsUnscoped.length ? 1 : 0;\r\n            const arrangedInConnectors = [];\r\n            const arrangedOutConnectors = [];\r\n            for (let i = 0; i < inConnectorsUnscoped.length; ++i) {\r\n                const isLeft = i < (inConnectorsUnscoped.length - hasMoreInThanOut) / 2;\r\n                arrangedInConnectors[i + (isLeft ? 0 : inConnectorsScoped.length)] = inConnectorsUnscoped[i];\r\n            }\r\n            let offset = Math.ceil((inConnectorsUnscoped.length - hasMoreInThanOut) / 2);\r\n            for (let i = 0; i < inConnectorsScoped.length; ++i) {\r\n                arrangedInConnectors[i + offset] = inConnectorsScoped[i];\r\n            }\r\n            for (let i = 0; i < outConnectorsUnscoped.length; ++i) {\r\n                let isLeft = i < (outConnectorsUnscoped.length - hasMoreOutThanIn) / 2;\r\n                arrangedOutConnectors[i + (isLeft ? 0 : outConnectorsScoped.length)] = outConnectorsUnscoped[i];\r\n            }\r\n            offset = Math.ceil((outConnectorsUnscoped.length - hasMoreOutThanIn) / 2);\r\n            for (let i = 0; i < outConnectorsScoped.length; ++i) {\r\n                arrangedOutConnectors[i + offset] = outConnectorsScoped[i];\r\n            }\r\n            const connectorDifference = node.inConnectors.length - node.outConnectors.length;\r\n            if (node.inConnectors.length > 0) {\r\n                let inConnectorsWidth = node.inConnectors.length * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + (node.inConnectors.length - 1) * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                if (connectorDifference % 2 === -1 && inConnectorsScoped.length > 0) {\r\n                    inConnectorsWidth += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                }\r\n                const firstX = node.x + (node.width - inConnectorsWidth) / 2;\r\n                const y = node.y - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(arrangedInConnectors, (connector, i) => {\r\n                    let connectorX = firstX + (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) * i;\r\n                    let connectorY = y;\r\n                    if (connector.width === 0) {\r\n                        connectorX += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        connectorY += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    connector.setPosition(connectorX, connectorY);\r\n                });\r\n            }\r\n            if (node.outConnectors.length > 0) {\r\n                let outConnectorsWidth = node.outConnectors.length * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + (node.outConnectors.length - 1) * _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                if (connectorDifference % 2 === 1 && inConnectorsScoped.length > 0) {\r\n                    outConnectorsWidth += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n                }\r\n                const firstX = node.x + (node.width - outConnectorsWidth) / 2;\r\n                const y = node.y + node.height - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(arrangedOutConnectors, (connector, i) => {\r\n                    let connectorX = firstX + (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) * i;\r\n                    let connectorY = y;\r\n                    if (connector.width === 0) {\r\n                        connectorX += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        connectorY += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    connector.setPosition(connectorX, connectorY);\r\n                });\r\n            }\r\n        });\r\n    }\r\n    _matchEdgesToConnectors(layoutGraph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            const srcNode = edge.graph.node(edge.src);\r\n            let srcConnector = srcNode.connector(\"OUT\", edge.srcConnector);\r\n            if (srcConnector === undefined && srcNode.childGraphs.length > 0) {\r\n                const childGraph = srcNode.childGraphs[0];\r\n                if (childGraph.exitNode !== null) {\r\n                    srcConnector = childGraph.exitNode.connector(\"OUT\", edge.srcConnector);\r\n                }\r\n            }\r\n            if (srcConnector === undefined) {\r\n                return;\r\n            }\r\n            edge.points[0] = srcConnector.boundingBox().bottomCenter();\r\n            const dstNode = edge.graph.node(edge.dst);\r\n            let dstConnector = dstNode.connector(\"IN\", edge.dstConnector);\r\n            if (dstConnector === undefined && dstNode.childGraphs.length > 0) {\r\n                const childGraph = dstNode.childGraphs[0];\r\n                if (childGraph.entryNode !== null) {\r\n                    dstConnector = childGraph.entryNode.connector(\"IN\", edge.dstConnector);\r\n                }\r\n            }\r\n            if (dstConnector === undefined) {\r\n                return;\r\n            }\r\n            edge.points[edge.points.length - 1] = dstConnector.boundingBox().topCenter();\r\n        });\r\n    }\r\n    createLayoutGraph(renderGraph) {\r\n        const transformSubgraph = (renderGraph, path) => {\r\n            let mayHaveCycles = false;\r\n            if (renderGraph.parentNode === null || renderGraph.parentNode.type() === \"NestedSDFG\") {\r\n                mayHaveCycles = true;\r\n            }\r\n            const layoutGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default(mayHaveCycles);\r\n            // add nodes and create groups for scopes (maps etc.)\r\n            const createLayoutNode = (node) => {\r\n                // a layout replaces the size of the render node with its bounding box (including its child graph), which\r\n                // must not carry over when the graph is laid out again (in lazy mode or after an edit)\r\n                const size = (this._options.lazy || node.x !== null ? node.collapsedSize() : node.size());\r\n                const layoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__.default(size, node.childPadding, node.connectorPadding);\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.inConnectors, (connector) => {\r\n                    layoutNode.addConnector(\"IN\", connector.name);\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.outConnectors, (connector) => {\r\n                    layoutNode.addConnector(\"OUT\", connector.name);\r\n                });\r\n                layoutNode.renderPath = path + node.id;\r\n                node.layoutNode = layoutNode;\r\n                return layoutNode;\r\n            };\r\n            // create layout nodes for scope entries and scopes around them\r\n            const layoutChildren = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.type().endsWith(\"Entry\")) {\r\n                    // check if corresponding exit node exists\r\n                    let exitExists = false;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node2) => {\r\n                        if (node2.type().endsWith(\"Exit\") && node2.scopeEntry === node.id) {\r\n                            exitExists = true;\r\n                        }\r\n                    });\r\n                    if (!exitExists) {\r\n                        return;\r\n                    }\r\n                    const entryNode = createLayoutNode(node);\r\n                    const scopeNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_7__.default();\r\n                    const scopeGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default();\r\n                    scopeNode.setChildGraph(scopeGraph);\r\n                    scopeGraph.addNode(entryNode);\r\n                    node.layoutGraph = scopeGraph;\r\n                    node.layoutNode = entryNode;\r\n                    scopeGraph.entryNode = entryNode;\r\n                    scopeNode.isScopeNode = true;\r\n                    layoutChildren.set(scopeNode, []);\r\n                    scopeNode.setLabel(\"Map with entry \" + entryNode.label()); // for debugging\r\n                }\r\n            });\r\n            // create unscoped layout nodes and assign children (other than the entry) to the scope node\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.scopeEntry === null || renderGraph.node(node.scopeEntry).layoutGraph.parentNode === null || !renderGraph.node(node.scopeEntry).layoutGraph.parentNode.isScopeNode) {\r\n                    if (node.layoutNode) {\r\n                        layoutGraph.addNode(node.layoutGraph.parentNode);\r\n                    }\r\n                    else {\r\n                        layoutGraph.addNode(createLayoutNode(node));\r\n                        node.layoutGraph = layoutGraph;\r\n                    }\r\n                }\r\n                else {\r\n                    layoutChildren.get((renderGraph.node(node.scopeEntry)).layoutGraph.parentNode).push(node);\r\n                }\r\n            });\r\n            // recursively add scope children\r\n            const addScopeChildren = (layoutGraph) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.nodes(), (node) => {\r\n                    if (layoutChildren.has(node)) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutChildren.get(node), (renderNode) => {\r\n                            if (renderNode.layoutNode) {\r\n                                // renderNode is an entry node\r\n                                node.childGraph.addNode(renderNode.layoutGraph.parentNode);\r\n                            }\r\n                            else {\r\n                                const layoutNode = createLayoutNode(renderNode);\r\n                                node.childGraph.addNode(layoutNode);\r\n                                renderNode.layoutGraph = node.childGraph;\r\n                                if (renderNode.type().endsWith(\"Exit\")) {\r\n                                    node.childGraph.exitNode = layoutNode;\r\n                                }\r\n                            }\r\n                        });\r\n                    }\r\n                    if (node.childGraph !== null) {\r\n                        addScopeChildren(node.childGraph);\r\n                    }\r\n                });\r\n            };\r\n            addScopeChildren(layoutGraph);\r\n            // add edges\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.edges(), (edge) => {\r\n                let srcNode = renderGraph.node(edge.src);\r\n                let dstNode = renderGraph.node(edge.dst);\r\n                let srcLayoutNode = srcNode.layoutNode;\r\n                let dstLayoutNode = dstNode.layoutNode;\r\n                if (srcNode.layoutGraph !== dstNode.layoutGraph) {\r\n                    if (dstNode.layoutGraph.entryNode === dstLayoutNode) {\r\n                        dstLayoutNode = dstNode.layoutGraph.parentNode;\r\n                    }\r\n                    if (srcNode.layoutGraph.exitNode === srcLayoutNode) {\r\n                        srcLayoutNode = srcNode.layoutGraph.parentNode;\r\n                    }\r\n                }\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assert(srcLayoutNode.graph === dstLayoutNode.graph, \"edge between different graphs\", edge);\r\n                }\r\n                // add dummy connectors (with name=null)\r\n                if (edge.src !== edge.dst) {\r\n                    if (srcNode.layoutNode.connector(\"OUT\", edge.srcConnector) === undefined) {\r\n                        srcNode.layoutNode.addConnector(\"OUT\", edge.srcConnector, true);\r\n                    }\r\n                    if (dstNode.layoutNode.connector(\"IN\", edge.dstConnector) === undefined) {\r\n                        dstNode.layoutNode.addConnector(\"IN\", edge.dstConnector, true);\r\n                    }\r\n                }\r\n                edge.layoutEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_5__.default(srcLayoutNode.id, dstLayoutNode.id, edge.srcConnector, edge.dstConnector);\r\n                srcLayoutNode.graph.addEdge(edge.layoutEdge);\r\n            });\r\n            // recursively transform subgraph\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(renderGraph.nodes(), (node) => {\r\n                if (node.childGraph !== null && !this._isPlaceholder(node)) {\r\n                    node.layoutNode.setChildGraph(transformSubgraph(node.childGraph, path + node.id + \"/\"));\r\n                }\r\n            });\r\n            renderGraph.layoutGraph = layoutGraph;\r\n            return layoutGraph;\r\n        };\r\n        return transformSubgraph(renderGraph, \"\");\r\n    }\r\n    _createComponents(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            if (node.childGraph !== null) {\r\n                if (node.isScopeNode || node.childGraph.mayHaveCycles) {\r\n                    node.childGraphs.push(node.childGraph);\r\n                }\r\n                else {\r\n                    // only nodes of type NestedSDFG may have more than one component as child graph\r\n                    lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.childGraph.components(), (component) => {\r\n                        const childGraph = new _layoutGraph_layoutGraph__WEBPACK_IMPORTED_MODULE_6__.default();\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(component.nodes(), (node) => {\r\n                            childGraph.addNode(node, node.id);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(component.edges(), (edge) => {\r\n                            childGraph.addEdge(edge, edge.id);\r\n                        });\r\n                        node.childGraphs.push(childGraph);\r\n                        childGraph.parentNode = node;\r\n                    });\r\n                    if (node.childGraphs.length === 0) {\r\n                        node.childGraphs.push(node.childGraph);\r\n                    }\r\n                }\r\n                node.childGraph = null; // property childGraph should not be used after this point\r\n            }\r\n        });\r\n    }\r\n    printLayout(graph, level = 0) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n            console.log(\"  \".repeat(level) + node.label());\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.childGraphs, (childGraph) => {\r\n                this.printLayout(childGraph, level + 1);\r\n            });\r\n        });\r\n    }\r\n    _createBundles(layoutGraph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allGraphs(), (graph) => {\r\n            const bundles = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n                if ((edge.srcConnector !== null || edge.dstConnector !== null) && (edge.srcConnector === null || edge.dstConnector === null)) {\r\n                    const key = edge.src + \"_\" + edge.dst;\r\n                    const connectorName = edge.srcConnector || edge.dstConnector;\r\n                    let bundle;\r\n                    if (!bundles.has(key)) {\r\n                        bundle = new _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__.default();\r\n                        bundles.set(key, bundle);\r\n                        if (connectorName === edge.srcConnector) {\r\n                            let srcNode = graph.node(edge.src);\r\n                            if (srcNode.isScopeNode) {\r\n                                srcNode = srcNode.childGraphs[0].exitNode;\r\n                            }\r\n                            srcNode.outConnectorBundles.push(bundle);\r\n                        }\r\n                        else {\r\n                            let dstNode = graph.node(edge.dst);\r\n                            if (dstNode.isScopeNode) {\r\n                                dstNode = dstNode.childGraphs[0].entryNode;\r\n                            }\r\n                            dstNode.inConnectorBundles.push(bundle);\r\n                        }\r\n                    }\r\n                    else {\r\n                        bundle = bundles.get(key);\r\n                    }\r\n                    bundle.connectors.push(connectorName);\r\n                    if (edge.srcConnector !== null) {\r\n                        edge.srcBundle = bundle;\r\n                    }\r\n                    else {\r\n                        edge.dstBundle = bundle;\r\n                    }\r\n                }\r\n            });\r\n        });\r\n        // as soon as a node has some bundle, all edges have to be assigned a bundle\r\n        // otherwise edges with and without bundles may create clutter and unwanted crossings\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allNodes(), (node) => {\r\n            const addBundles = (bundles, connectors, edgeMethod, connectorProp, bundleProp, entryExit) => {\r\n                if (node[bundles].length > 0) {\r\n                    let graph = node.graph;\r\n                    let id = node.id;\r\n                    if (graph[entryExit] === node) {\r\n                        graph = node.graph.parentNode.graph;\r\n                        id = node.graph.parentNode.id;\r\n                    }\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_1__.some(node[bundles], bundle => bundle.connectors.length > 1)) {\r\n                        const remainingConnectors = new Set();\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node[connectors], (connector) => {\r\n                            remainingConnectors.add(connector.name);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node[bundles], (bundle) => {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(bundle.connectors, (name) => {\r\n                                remainingConnectors.delete(name);\r\n                            });\r\n                        });\r\n                        remainingConnectors.forEach((name) => {\r\n                            const bundle = new _layoutGraph_layoutBundle__WEBPACK_IMPORTED_MODULE_4__.default();\r\n                            bundle.addConnector(name);\r\n                            node[bundles].push(bundle);\r\n                            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph[edgeMethod](id), (edge) => {\r\n                                if (edge[connectorProp] === name) {\r\n                                    edge[bundleProp] = bundle;\r\n                                }\r\n                            });\r\n                        });\r\n                    }\r\n                    else {\r\n                        node[bundles] = [];\r\n                        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph[edgeMethod](id), (edge) => {\r\n                            edge[bundleProp] = null;\r\n                        });\r\n                    }\r\n                }\r\n            };\r\n            addBundles(\"inConnectorBundles\", \"inConnectors\", \"inEdges\", \"dstConnector\", \"dstBundle\", \"entryNode\");\r\n            addBundles(\"outConnectorBundles\", \"outConnectors\", \"outEdges\", \"srcConnector\", \"srcBundle\", \"exitNode\");\r\n        });\r\n        // mark all but one edges in a bundle as replica\r\n        const bundles = new Set();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            if (edge.srcBundle !== null || edge.dstBundle !== null) {\r\n                const bundle = edge.srcBundle || edge.dstBundle;\r\n                if (bundles.has(bundle)) {\r\n                    edge.isReplica = true;\r\n                }\r\n                else {\r\n                    bundles.add(bundle);\r\n                }\r\n                bundle.edges.push(edge);\r\n            }\r\n        });\r\n    }\r\n    _isPlaceholder(node) {\r\n        return (this._options.lazy && node.collapsed && node.childGraph !== null);\r\n    }\r\n    /**\r\n     * Returns the render graph and all nested graphs except those in placeholders.\r\n     */\r\n    _laidOutGraphs(renderGraph) {\r\n        const graphs = [];\r\n        const addGraphs = (graph) => {\r\n            graphs.push(graph);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                if (node.childGraph !== null && !this._isPlaceholder(node)) {\r\n                    addGraphs(node.childGraph);\r\n                }\r\n            });\r\n        };\r\n        addGraphs(renderGraph);\r\n        return graphs;\r\n    }\r\n    _copyLayoutInfo(graphs) {\r\n        const nodes = lodash__WEBPACK_IMPORTED_MODULE_1__.flatMap(graphs, (graph) => graph.nodes());\r\n        const edges = lodash__WEBPACK_IMPORTED_MODULE_1__.flatMap(graphs, (graph) => graph.edges());\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(nodes, (node) => {\r\n            node.isPlaceholder = this._isPlaceholder(node);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.assign(node, node.layoutNode.boundingBox());\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.concat(node.inConnectors), (connector) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.assign(connector, node.layoutNode.connector(\"IN\", connector.name).boundingBox());\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.concat(node.outConnectors), (connector) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.assign(connector, node.layoutNode.connector(\"OUT\", connector.name).boundingBox());\r\n            });\r\n            delete node.layoutGraph;\r\n            delete node.layoutNode;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(edges, (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.assign(edge, lodash__WEBPACK_IMPORTED_MODULE_1__.pick(edge.layoutEdge, ['points', 'labelX', 'labelY']));\r\n            // duplicate bundle points to make curved edges go through them\r\n            if (edge.layoutEdge.srcBundle !== null) {\r\n                edge.points.splice(1, 0, edge.points[1].clone());\r\n            }\r\n            if (edge.layoutEdge.dstBundle !== null) {\r\n                edge.points.splice(edge.points.length - 2, 0, edge.points[edge.points.length - 2].clone());\r\n            }\r\n            edge.updateBoundingBox();\r\n            delete edge.layoutEdge;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graphs, (graph) => {\r\n            delete graph.layoutGraph;\r\n        });\r\n    }\r\n    /**\r\n     * Finds the outermost nodes with child graphs that have a counterpart with the same structure in the previous\r\n     * layout and contain no change, and turns them into simple nodes of their previous size for the layout.\r\n     * Returns the nodes with their counterparts and child graphs, or nothing if too much changed.\r\n     */\r\n    _detachReusable(layoutGraph, previous, changes) {\r\n        const changed = this._changedPaths(changes);\r\n        // nodes of the graphs including the contents of their scopes, which come from the same render graph\r\n        const addNodes = (graphs, nodes) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graphs, (graph) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                    nodes.push(node);\r\n                    if (node.isScopeNode) {\r\n                        addNodes(node.childGraphs, nodes);\r\n                    }\r\n                });\r\n            });\r\n            return nodes;\r\n        };\r\n        const reusable = [];\r\n        const findReusable = (graphs, previousGraphs) => {\r\n            const previousNodes = new Map();\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(addNodes(previousGraphs, []), (node) => {\r\n                if (node.renderPath !== null) {\r\n                    previousNodes.set(node.renderPath, node);\r\n                }\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(addNodes(graphs, []), (node) => {\r\n                if (node.isScopeNode || node.childGraphs.length === 0 || !previousNodes.has(node.renderPath)) {\r\n                    return;\r\n                }\r\n                const previousNode = previousNodes.get(node.renderPath);\r\n                if (changed.has(node.renderPath) || !this._sameStructure(node.childGraphs, previousNode.childGraphs)) {\r\n                    findReusable(node.childGraphs, previousNode.childGraphs);\r\n                }\r\n                else {\r\n                    reusable.push([node, previousNode]);\r\n                }\r\n            });\r\n        };\r\n        findReusable([layoutGraph], [previous]);\r\n        const numNodes = layoutGraph.allNodes().length;\r\n        const numReused = lodash__WEBPACK_IMPORTED_MODULE_1__.sum(lodash__WEBPACK_IMPORTED_MODULE_1__.map(reusable, ([node, previousNode]) => lodash__WEBPACK_IMPORTED_MODULE_1__.sum(lodash__WEBPACK_IMPORTED_MODULE_1__.map(node.childGraphs, (childGraph) => childGraph.allNodes().length))));\r\n        if (numNodes - numReused > this._options.relayoutThreshold * numNodes) {\r\n            return [];\r\n        }\r\n        return this._detach(reusable);\r\n    }\r\n    /**\r\n     * Like _detachReusable, but takes the outermost unchanged nodes with an inner layout kept for the option lazy.\r\n     */\r\n    _detachCached(layoutGraph, changes) {\r\n        const changed = this._changedPaths(changes);\r\n        const reusable = [];\r\n        const findCached = (graph) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                if (node.childGraphs.length === 0) {\r\n                    return;\r\n                }\r\n                const cachedNode = this._innerLayouts.get(node.renderPath);\r\n                if (!node.isScopeNode && cachedNode !== undefined && !changed.has(node.renderPath)\r\n                    && this._sameStructure(node.childGraphs, cachedNode.childGraphs)) {\r\n                    reusable.push([node, cachedNode]);\r\n                }\r\n                else {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.childGraphs, findCached);\r\n                }\r\n            });\r\n        };\r\n        findCached(layoutGraph);\r\n        return this._detach(reusable);\r\n    }\r\n    /**\r\n     * Returns the id paths of the changed nodes and all their ancestors, joined by \"/\" like render paths.\r\n     */\r\n    _changedPaths(changes) {\r\n        const changed = new Set();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(changes, (path) => {\r\n            for (let i = 1; i <= path.length; ++i) {\r\n                changed.add(path.slice(0, i).join(\"/\"));\r\n            }\r\n        });\r\n        return changed;\r\n    }\r\n    /**\r\n     * Takes the child graphs out of the nodes and gives the nodes the size of their counterparts.\r\n     */\r\n    _detach(reusable) {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_1__.map(reusable, ([node, previousNode]) => {\r\n            const childGraphs = node.childGraphs;\r\n            node.childGraphs = [];\r\n            // _placeLoops takes the width of a self-loop off again\r\n            node.setSize({\r\n                width: previousNode.width + (previousNode.selfLoop !== null ? this._options.targetEdgeLength : 0),\r\n                height: previousNode.height,\r\n            });\r\n            return [node, previousNode, childGraphs];\r\n        });\r\n    }\r\n    /**\r\n     * Checks that the graphs have the nodes (by id and render path) and the edges (by id and end points) of the\r\n     * previous graphs.\r\n     */\r\n    _sameStructure(graphs, previousGraphs) {\r\n        if (graphs.length !== previousGraphs.length) {\r\n            return false;\r\n        }\r\n        return lodash__WEBPACK_IMPORTED_MODULE_1__.every(graphs, (graph, c) => {\r\n            const previousGraph = previousGraphs[c];\r\n            const numSelfLoops = lodash__WEBPACK_IMPORTED_MODULE_1__.filter(previousGraph.nodes(), (node) => node.selfLoop !== null).length;\r\n            if (graph.numNodes() !== previousGraph.numNodes() || graph.numEdges() !== previousGraph.numEdges() + numSelfLoops) {\r\n                return false;\r\n            }\r\n            const sameEdges = lodash__WEBPACK_IMPORTED_MODULE_1__.every(graph.edges(), (edge) => {\r\n                const previousEdge = this._previousEdge(previousGraph, edge);\r\n                return (previousEdge !== undefined && previousEdge.src === edge.src && previousEdge.dst === edge.dst);\r\n            });\r\n            return sameEdges && lodash__WEBPACK_IMPORTED_MODULE_1__.every(graph.nodes(), (node) => {\r\n                const previousNode = previousGraph.node(node.id);\r\n                return (previousNode !== undefined && previousNode.renderPath === node.renderPath\r\n                    && this._sameStructure(node.childGraphs, previousNode.childGraphs));\r\n            });\r\n        });\r\n    }\r\n    /**\r\n     * Puts the child graphs back into the reused nodes and copies their previous layout, moved with the node.\r\n     */\r\n    _attachReused(reused) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(reused, ([node, previousNode, childGraphs]) => {\r\n            node.childGraphs = childGraphs;\r\n            this._copyPreviousLayout(childGraphs, previousNode.childGraphs, node.x - previousNode.x, node.y - previousNode.y);\r\n        });\r\n    }\r\n    _copyPreviousLayout(graphs, previousGraphs, x, y) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graphs, (graph, c) => {\r\n            const previousGraph = previousGraphs[c];\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                const previousNode = previousGraph.node(node.id);\r\n                node.setPosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(previousNode.x + x, previousNode.y + y));\r\n                node.setSize(previousNode.size());\r\n                node.rank = previousNode.rank;\r\n                node.rankSpan = previousNode.rankSpan;\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(node.connectors(), (connector) => {\r\n                    const previousConnector = previousNode.connector(connector.type, connector.name);\r\n                    if (previousConnector !== undefined) {\r\n                        connector.setPosition(previousConnector.x + x, previousConnector.y + y);\r\n                    }\r\n                });\r\n                this._copyPreviousLayout(node.childGraphs, previousNode.childGraphs, x, y);\r\n            });\r\n            // the graph has not been through _removeCycles, so self-loops are still edges;\r\n            // the bundles stay unset because _copyLayoutInfo already added the bundle points to the previous points\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n                const previousEdge = this._previousEdge(previousGraph, edge);\r\n                edge.points = lodash__WEBPACK_IMPORTED_MODULE_1__.map(previousEdge.points, (point) => new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(point.x + x, point.y + y));\r\n            });\r\n        });\r\n    }\r\n    /**\r\n     * Returns the edge with the id of the edge in the previous graph, where self-loops are no edges of the graph\r\n     * anymore but the selfLoop of their node.\r\n     */\r\n    _previousEdge(previousGraph, edge) {\r\n        const previousEdge = previousGraph.edge(edge.id);\r\n        if (previousEdge !== undefined || edge.src !== edge.dst) {\r\n            return previousEdge;\r\n        }\r\n        const previousNode = previousGraph.node(edge.src);\r\n        if (previousNode === undefined || previousNode.selfLoop === null || previousNode.selfLoop.id !== edge.id) {\r\n            return undefined;\r\n        }\r\n        return previousNode.selfLoop;\r\n    }\r\n    _removeCycles(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allGraphs(), (subgraph) => {\r\n            if (subgraph.mayHaveCycles) {\r\n                // remove self-loops\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(subgraph.edges(), (edge) => {\r\n                    if (edge.src === edge.dst) {\r\n                        subgraph.node(edge.src).selfLoop = edge;\r\n                        subgraph.removeEdge(edge.id);\r\n                    }\r\n                });\r\n                // remove normal cycles\r\n                const invertedEdges = subgraph.removeCycles();\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(invertedEdges, (edge) => {\r\n                    const newSrc = subgraph.node(edge.src);\r\n                    const newDst = subgraph.node(edge.dst);\r\n                    newSrc.addConnector(\"OUT\", \"bottomIn\", true);\r\n                    newDst.addConnector(\"IN\", \"topOut\", true);\r\n                    edge.srcConnector = \"bottomIn\";\r\n                    edge.dstConnector = \"topOut\";\r\n                    if (!lodash__WEBPACK_IMPORTED_MODULE_1__.some(subgraph.outEdges(newDst.id), edge => edge.srcConnector === null)) {\r\n                        newDst.removeConnector(\"OUT\", null);\r\n                    }\r\n                    if (!lodash__WEBPACK_IMPORTED_MODULE_1__.some(subgraph.inEdges(newSrc.id), edge => edge.dstConnector === null)) {\r\n                        newSrc.removeConnector(\"IN\", null);\r\n                    }\r\n                });\r\n            }\r\n        });\r\n    }\r\n    _restoreCycles(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allEdges(), (edge) => {\r\n            if (edge.isInverted) {\r\n                edge.graph.invertEdge(edge.id);\r\n                edge.points = lodash__WEBPACK_IMPORTED_MODULE_1__.reverse(edge.points);\r\n                edge.isInverted = false;\r\n            }\r\n        });\r\n    }\r\n    _placeLoops(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.allNodes(), (node) => {\r\n            if (node.selfLoop !== null) {\r\n                node.selfLoop.points = [\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width - this._options.targetEdgeLength, node.y + node.height - 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width, node.y + node.height - 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width, node.y + 10),\r\n                    new _geometry_vector__WEBPACK_IMPORTED_MODULE_8__.default(node.x + node.width - this._options.targetEdgeLength, node.y + 10),\r\n                ];\r\n                node.width -= this._options.targetEdgeLength;\r\n            }\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/layouter.ts?");
 
 /***/ }),
 
@@ -3736,7 +3758,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ MagneticSpringLayouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _recursiveLayouter__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ./recursiveLayouter */ \"./src/layouter/recursiveLayouter.ts\");\n/* harmony import */ var _util_shuffle__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../util/shuffle */ \"./src/util/shuffle.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\nclass MagneticSpringLayouter extends _recursiveLayouter__WEBPACK_IMPORTED_MODULE_3__.default {\r\n    constructor(options = {}) {\r\n        super();\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, this._options, {\r\n            numIterations: 1000,\r\n            stepSize: 1,\r\n            weightSpring: 1,\r\n            weightRepulsive: 1,\r\n            weightMagnetic: 2,\r\n            magneticDistanceExponent: 1,\r\n            magneticAngleExponent: 5,\r\n            forceCap: 100,\r\n            decay: 1,\r\n        });\r\n    }\r\n    layoutSizedGraph(graph) {\r\n        //console.log(graph);\r\n        switch (graph.nodes().length) {\r\n            case 1:\r\n                // just one node => place it anywhere\r\n                graph.nodes()[0].updatePosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default());\r\n                break;\r\n            case 2:\r\n                // two nodes => place them above each other\r\n                const topIndex = Math.round(Math.random());\r\n                const topNode = graph.nodes()[topIndex];\r\n                const bottomNode = graph.nodes()[1 - topIndex];\r\n                const positionTop = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(-topNode.width / 2, -topNode.height / 2);\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(positionTop.isFinite(), \"positionTop is not finite\");\r\n                }\r\n                topNode.updatePosition(positionTop);\r\n                const positionBottom = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(-bottomNode.width / 2, topNode.height / 2 + this._options.targetEdgeLength);\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(positionBottom.isFinite(), \"positionBottom is not finite\");\r\n                }\r\n                bottomNode.updatePosition(positionBottom);\r\n                break;\r\n            default:\r\n                // more nodes => place them on a circle\r\n                let chordLengthSum = graph.nodes().length * this._options.targetEdgeLength;\r\n                const nodeDiagonals = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                    nodeDiagonals[node.id] = Math.sqrt(node.width * node.width + node.height * node.height);\r\n                    chordLengthSum += nodeDiagonals[node.id];\r\n                });\r\n                // go from sum of chord lengths to sum of arc lengths, assuming maximal angle (2π/3)\r\n                const circumference = chordLengthSum * Math.PI / 2;\r\n                const diameter = circumference / Math.PI;\r\n                const radius = diameter / 2;\r\n                let angle = 0;\r\n                const shuffledNodes = _util_shuffle__WEBPACK_IMPORTED_MODULE_4__.default.shuffle(graph.nodes());\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shuffledNodes, (node, i) => {\r\n                    const center = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(radius * Math.sin(angle), radius * Math.cos(angle));\r\n                    const topLeft = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(center.x - node.width / 2, center.y - node.height / 2);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(topLeft.isFinite(), \"topLeft is not finite\");\r\n                    }\r\n                    node.updatePosition(topLeft);\r\n                    if (i < graph.nodes().length - 1) {\r\n                        angle += 2 * Math.asin((this._options.targetEdgeLength + nodeDiagonals[node.id] / 2 + nodeDiagonals[shuffledNodes[i + 1].id] / 2) / diameter);\r\n                    }\r\n                });\r\n        }\r\n        // precompute set of neighbors and non-neighbors\r\n        const neighbors = new Array(graph.maxId() + 1);\r\n        const nonNeighbors = new Array(graph.maxId() + 1);\r\n        const forces = new Array(graph.maxId() + 1);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n            neighbors[node.id] = new Set();\r\n            nonNeighbors[node.id] = new Set();\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n            if (edge.src !== edge.dst) {\r\n                neighbors[edge.dst].add(graph.node(edge.src));\r\n            }\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (nodeA) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (nodeB) => {\r\n                if (nodeA !== nodeB && !neighbors[nodeA.id].has(nodeB) && !neighbors[nodeB.id].has(nodeA)) {\r\n                    nonNeighbors[nodeA.id].add(nodeB);\r\n                }\r\n            });\r\n        });\r\n        function xIntersection(src, dst, srcToDst, x) {\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(srcToDst.x !== 0, \"x intersection with vertical line\");\r\n            }\r\n            if (Math.sign(dst.x - src.x) === Math.sign(x - dst.x)) {\r\n                return null;\r\n            }\r\n            return srcToDst.clone().setX(x - src.x).add(src);\r\n        }\r\n        function yIntersection(src, dst, srcToDst, y) {\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(srcToDst.y !== 0, \"y intersection with horizontal line\");\r\n            }\r\n            if (Math.sign(dst.y - src.y) === Math.sign(y - dst.y)) {\r\n                return null;\r\n            }\r\n            return srcToDst.clone().setY(y - src.y).add(src);\r\n        }\r\n        function distanceVector(srcNode, dstNode) {\r\n            const srcBox = srcNode.boundingBox();\r\n            const dstBox = dstNode.boundingBox();\r\n            const srcCenter = srcBox.center();\r\n            const dstCenter = dstBox.center();\r\n            if (srcBox.intersects(dstBox)) {\r\n                if (srcCenter.x === dstCenter.x && srcCenter.y === dstCenter.y) {\r\n                    return new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(Math.random(), Math.random()).setLength(0.001);\r\n                }\r\n                return dstCenter.clone().sub(srcCenter).setLength(0.001);\r\n            }\r\n            const srcToDst = dstCenter.sub(srcCenter);\r\n            const x = Math.max(0, Math.abs(srcToDst.x) - (srcNode.width + dstNode.width) / 2);\r\n            const y = Math.max(0, Math.abs(srcToDst.y) - (srcNode.height + dstNode.height) / 2);\r\n            if (x === 0 && y === 0) {\r\n                return dstCenter.clone().sub(srcCenter).setLength(0.001);\r\n            }\r\n            return srcToDst.setLength((new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(x, y)).length());\r\n        }\r\n        function edgeDistanceVector(srcNode, dstNode) {\r\n            const src = srcNode.boundingBox().bottomCenter();\r\n            const dst = dstNode.boundingBox().topCenter();\r\n            if (src.x === dst.x && src.y === dst.y) {\r\n                const srcCenter = srcNode.boundingBox().center();\r\n                const dstCenter = dstNode.boundingBox().center();\r\n                if (srcCenter.x === dstCenter.x && srcCenter.y === dstCenter.y) {\r\n                    return new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(Math.random(), Math.random()).setLength(1E-5);\r\n                }\r\n                return dstCenter.clone().sub(srcCenter).setLength(1E-5);\r\n            }\r\n            return dst.sub(src);\r\n        }\r\n        const fieldVector = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(0, 1);\r\n        const HALF_PI = Math.PI / 2;\r\n        let weightSpring = this._options.weightSpring;\r\n        let weightMagnetic = this._options.weightMagnetic;\r\n        let weightRepulsive = 0;\r\n        for (let iteration = 0; iteration < this._options.numIterations; ++iteration) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                forces[node.id] = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default();\r\n            });\r\n            let maxOffset = 0;\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                let springForce = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default();\r\n                let magneticForce = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default();\r\n                let repulsiveForce = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default();\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.inNeighbors(node.id), (inNeighbor) => {\r\n                    // spring force\r\n                    const edgeVector = edgeDistanceVector(inNeighbor, node);\r\n                    const strength = Math.log(edgeVector.length() / this._options.targetEdgeLength);\r\n                    springForce.add(edgeVector.clone().normalize().multiplyScalar(-1 * strength));\r\n                    // magnetic force\r\n                    if (edgeVector.x === 0 && edgeVector.y > 0) {\r\n                        return;\r\n                    }\r\n                    let magneticDirection = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(1 / edgeVector.x, 1 / edgeVector.y);\r\n                    if (edgeVector.y < 0) {\r\n                        magneticDirection.y *= -1;\r\n                    }\r\n                    else {\r\n                        magneticDirection.x *= -1;\r\n                    }\r\n                    if (edgeVector.x === 0) {\r\n                        magneticDirection = fieldVector.clone();\r\n                    }\r\n                    let angle = HALF_PI - Math.sign(edgeVector.y) * Math.atan(Math.abs(edgeVector.y / edgeVector.x));\r\n                    let angleFactor = Math.pow(angle / HALF_PI, this._options.magneticAngleExponent);\r\n                    const distanceFactor = Math.pow(edgeVector.length(), this._options.magneticDistanceExponent);\r\n                    const tmpMagneticForce = magneticDirection.clone().normalize().multiplyScalar(angleFactor * distanceFactor);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(tmpMagneticForce.isFinite(), \"magnetic force is not finite\");\r\n                    }\r\n                    magneticForce.add(tmpMagneticForce);\r\n                });\r\n                nonNeighbors[node.id].forEach((nonNeighbor) => {\r\n                    // repulsive force\r\n                    const edgeVector = distanceVector(node, nonNeighbor);\r\n                    const length = edgeVector.length();\r\n                    const relativeLength = length / this._options.spaceBetweenNodes;\r\n                    const strength = 1 / (relativeLength * relativeLength);\r\n                    const tmpRepulsiveForce = edgeVector.clone().normalize().multiplyScalar(-1 * strength);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(tmpRepulsiveForce.isFinite(), \"repulsive force is not finite\");\r\n                    }\r\n                    repulsiveForce.add(tmpRepulsiveForce);\r\n                });\r\n                if (repulsiveForce.length() > this._options.forceCap) {\r\n                    repulsiveForce.setLength(this._options.forceCap);\r\n                }\r\n                if (springForce.length() > this._options.forceCap) {\r\n                    springForce.setLength(this._options.forceCap);\r\n                }\r\n                if (magneticForce.length() > this._options.forceCap) {\r\n                    magneticForce.setLength(this._options.forceCap);\r\n                }\r\n                repulsiveForce.multiplyScalar(weightRepulsive);\r\n                springForce.multiplyScalar(weightSpring);\r\n                magneticForce.multiplyScalar(weightMagnetic);\r\n                const offset = springForce.clone().add(magneticForce).add(repulsiveForce);\r\n                offset.multiplyScalar(Math.pow(this._options.decay, iteration) * this._options.stepSize);\r\n                maxOffset = Math.max(maxOffset, offset.length());\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(offset.isFinite(), \"offset is not finite\");\r\n                }\r\n                node.translate(offset.x, offset.y);\r\n            });\r\n            // stop when all nodes in subgraph almost stopped moving\r\n            if (maxOffset < _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON) {\r\n                break;\r\n            }\r\n            weightRepulsive += this._options.weightRepulsive / this._options.numIterations;\r\n        }\r\n        // place edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n            const srcNode = graph.node(edge.src);\r\n            const srcPoint = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(srcNode.x + srcNode.width / 2, srcNode.y + srcNode.height);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(srcPoint.isFinite(), \"srcPoint is not finite\");\r\n            }\r\n            const dstNode = graph.node(edge.dst);\r\n            const dstPoint = new _geometry_vector__WEBPACK_IMPORTED_MODULE_5__.default(dstNode.x + dstNode.width / 2, dstNode.y);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(dstPoint.isFinite(), \"dstPoint is not finite\");\r\n            }\r\n            edge.points = [srcPoint, dstPoint];\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/magneticSpringLayouter.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ MagneticSpringLayouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _geometry_boxGrid__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../geometry/boxGrid */ \"./src/geometry/boxGrid.ts\");\n/* harmony import */ var _recursiveLayouter__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./recursiveLayouter */ \"./src/layouter/recursiveLayouter.ts\");\n/* harmony import */ var _util_shuffle__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../util/shuffle */ \"./src/util/shuffle.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nconst TIMER_FORCES = _util_timer__WEBPACK_IMPORTED_MODULE_6__.default.register([\"doLayout\", \"forces\"]);\r\n/**\r\n * Force-directed layouter: edges are springs that are turned downwards by a magnetic field and nodes repel each other.\r\n * The repulsion is ramped up over rampIterations iterations (default: all of them).\r\n * By default, all pairs of non-adjacent nodes repel each other and the iteration runs until the nodes stop moving.\r\n * For large graphs, repulsion can be cut off at repulsionCutoff, so that only nearby nodes have to be found (see\r\n * BoxGrid), and after the ramp the step size can be multiplied by cooling (< 1) whenever the forces do not decrease\r\n * and the iteration stopped once no node moves more than tolerance.\r\n */\r\nclass MagneticSpringLayouter extends _recursiveLayouter__WEBPACK_IMPORTED_MODULE_4__.default {\r\n    constructor(options = {}) {\r\n        super();\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_1__.defaults(options, this._options, {\r\n            numIterations: 1000,\r\n            stepSize: 1,\r\n            weightSpring: 1,\r\n            weightRepulsive: 1,\r\n            weightMagnetic: 2,\r\n            magneticDistanceExponent: 1,\r\n            magneticAngleExponent: 5,\r\n            forceCap: 100,\r\n            decay: 1,\r\n            repulsionCutoff: null,\r\n            rampIterations: null,\r\n            tolerance: 0,\r\n            cooling: 1,\r\n        });\r\n    }\r\n    layoutSizedGraph(graph) {\r\n        //console.log(graph);\r\n        switch (graph.nodes().length) {\r\n            case 1:\r\n                // just one node => place it anywhere\r\n                graph.nodes()[0].updatePosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default());\r\n                break;\r\n            case 2:\r\n                // two nodes => place them above each other\r\n                const topIndex = Math.round(Math.random());\r\n                const topNode = graph.nodes()[topIndex];\r\n                const bottomNode = graph.nodes()[1 - topIndex];\r\n                const positionTop = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(-topNode.width / 2, -topNode.height / 2);\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(positionTop.isFinite(), \"positionTop is not finite\");\r\n                }\r\n                topNode.updatePosition(positionTop);\r\n                const positionBottom = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(-bottomNode.width / 2, topNode.height / 2 + this._options.targetEdgeLength);\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(positionBottom.isFinite(), \"positionBottom is not finite\");\r\n                }\r\n                bottomNode.updatePosition(positionBottom);\r\n                break;\r\n            default:\r\n                // more nodes => place them on a circle\r\n                let chordLengthSum = graph.nodes().length * this._options.targetEdgeLength;\r\n                const nodeDiagonals = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.nodes(), (node) => {\r\n                    nodeDiagonals[node.id] = Math.sqrt(node.width * node.width + node.height * node.height);\r\n                    chordLengthSum += nodeDiagonals[node.id];\r\n                });\r\n                // go from sum of chord lengths to sum of arc lengths, assuming maximal angle (2π/3)\r\n                const circumference = chordLengthSum * Math.PI / 2;\r\n                const diameter = circumference / Math.PI;\r\n                const radius = diameter / 2;\r\n                let angle = 0;\r\n                const shuffledNodes = _util_shuffle__WEBPACK_IMPORTED_MODULE_5__.default.shuffle(graph.nodes());\r\n                lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shuffledNodes, (node, i) => {\r\n                    const center = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(radius * Math.sin(angle), radius * Math.cos(angle));\r\n                    const topLeft = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(center.x - node.width / 2, center.y - node.height / 2);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(topLeft.isFinite(), \"topLeft is not finite\");\r\n                    }\r\n                    node.updatePosition(topLeft);\r\n                    if (i < graph.nodes().length - 1) {\r\n                        angle += 2 * Math.asin((this._options.targetEdgeLength + nodeDiagonals[node.id] / 2 + nodeDiagonals[shuffledNodes[i + 1].id] / 2) / diameter);\r\n                    }\r\n                });\r\n        }\r\n        const nodes = graph.nodes();\r\n        const n = nodes.length;\r\n        const targetEdgeLength = this._options.targetEdgeLength;\r\n        const spaceBetweenNodes = this._options.spaceBetweenNodes;\r\n        const forceCap = this._options.forceCap;\r\n        const cutoff = this._options.repulsionCutoff;\r\n        const rampIterations = Math.max(1, (this._options.rampIterations !== null ?\r\n            Math.min(this._options.numIterations, this._options.rampIterations) : this._options.numIterations));\r\n        // positions and sizes by node index, the nodes are moved once at the end\r\n        const index = new Int32Array(graph.maxId() + 1);\r\n        const xs = new Float64Array(n);\r\n        const ys = new Float64Array(n);\r\n        const widths = new Float64Array(n);\r\n        const heights = new Float64Array(n);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(nodes, (node, i) => {\r\n            index[node.id] = i;\r\n            xs[i] = node.x;\r\n            ys[i] = node.y;\r\n            widths[i] = node.width;\r\n            heights[i] = node.height;\r\n        });\r\n        const startXs = xs.slice();\r\n        const startYs = ys.slice();\r\n        // in-neighbors in CSR form and the set of adjacent pairs (i * n + j with i < j), which do not repel each other\r\n        const inStarts = new Int32Array(n + 1);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(nodes, (node, i) => {\r\n            inStarts[i + 1] = inStarts[i] + graph.inEdgesIds(node.id).length;\r\n        });\r\n        const inNodes = new Int32Array(inStarts[n]);\r\n        const adjacent = new Set();\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(nodes, (node, i) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.inEdges(node.id), (edge, k) => {\r\n                const j = index[edge.src];\r\n                inNodes[inStarts[i] + k] = j;\r\n                if (i !== j) {\r\n                    adjacent.add(Math.min(i, j) * n + Math.max(i, j));\r\n                }\r\n            });\r\n        });\r\n        const HALF_PI = Math.PI / 2;\r\n        let weightSpring = this._options.weightSpring;\r\n        let weightMagnetic = this._options.weightMagnetic;\r\n        let weightRepulsive = 0;\r\n        // once the repulsion has been ramped up, the step shrinks whenever the energy (sum of squared forces) does not\r\n        // decrease, so that oscillating nodes come to rest\r\n        let stepSize = this._options.stepSize;\r\n        let energy = Number.POSITIVE_INFINITY;\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_6__.default.start(TIMER_FORCES);\r\n        for (let iteration = 0; iteration < this._options.numIterations; ++iteration) {\r\n            // nodes farther apart than the cutoff do not repel each other, so only the grid cells around a node are visited\r\n            const grid = (cutoff !== null ? new _geometry_boxGrid__WEBPACK_IMPORTED_MODULE_3__.default(xs, ys, widths, heights, n, Math.max(cutoff, spaceBetweenNodes)) : null);\r\n            const factor = Math.pow(this._options.decay, iteration) * stepSize;\r\n            let maxOffset = 0;\r\n            let newEnergy = 0;\r\n            for (let i = 0; i < n; ++i) {\r\n                let springX = 0;\r\n                let springY = 0;\r\n                let magneticX = 0;\r\n                let magneticY = 0;\r\n                let repulsiveX = 0;\r\n                let repulsiveY = 0;\r\n                const centerX = xs[i] + widths[i] / 2;\r\n                const centerY = ys[i] + heights[i] / 2;\r\n                for (let k = inStarts[i]; k < inStarts[i + 1]; ++k) {\r\n                    const j = inNodes[k];\r\n                    // edge vector from the bottom center of the in-neighbor to the top center of the node\r\n                    let vx = centerX - (xs[j] + widths[j] / 2);\r\n                    let vy = ys[i] - (ys[j] + heights[j]);\r\n                    let length;\r\n                    if (vx === 0 && vy === 0) {\r\n                        vx = 0;\r\n                        vy = centerY - (ys[j] + heights[j] / 2);\r\n                        if (vy === 0) {\r\n                            vx = Math.random();\r\n                            vy = Math.random();\r\n                        }\r\n                        length = Math.sqrt(vx * vx + vy * vy);\r\n                        vx *= 1E-5 / length;\r\n                        vy *= 1E-5 / length;\r\n                        length = 1E-5;\r\n                    }\r\n                    else {\r\n                        length = Math.sqrt(vx * vx + vy * vy);\r\n                    }\r\n                    // spring force\r\n                    const strength = Math.log(length / targetEdgeLength);\r\n                    springX -= vx / length * strength;\r\n                    springY -= vy / length * strength;\r\n                    // magnetic force\r\n                    if (vx === 0 && vy > 0) {\r\n                        continue;\r\n                    }\r\n                    // direction (1 / vx, 1 / vy) with the x component flipped for downward and the y component for\r\n                    // upward edges, normalized; straight down for vertical edges\r\n                    let directionX = 0;\r\n                    let directionY = 1;\r\n                    if (vx !== 0) {\r\n                        const sign = Math.sign(vx * vy);\r\n                        directionX = sign * vy / length;\r\n                        directionY = sign * vx / length;\r\n                        if (vy < 0) {\r\n                            directionY = -directionY;\r\n                        }\r\n                        else {\r\n                            directionX = -directionX;\r\n                        }\r\n                    }\r\n                    const angle = HALF_PI - Math.sign(vy) * Math.atan(Math.abs(vy / vx));\r\n                    const magnitude = Math.pow(angle / HALF_PI, this._options.magneticAngleExponent)\r\n                        * Math.pow(length, this._options.magneticDistanceExponent);\r\n                    magneticX += directionX * magnitude;\r\n                    magneticY += directionY * magnitude;\r\n                }\r\n                // repulsive force from the other nodes, with a cutoff only from those whose boxes are closer than it\r\n                const repel = (j) => {\r\n                    if (j === i || adjacent.has(Math.min(i, j) * n + Math.max(i, j))) {\r\n                        return;\r\n                    }\r\n                    let dx = (xs[j] + widths[j] / 2) - centerX;\r\n                    let dy = (ys[j] + heights[j] / 2) - centerY;\r\n                    const gapX = Math.abs(dx) - (widths[i] + widths[j]) / 2;\r\n                    const gapY = Math.abs(dy) - (heights[i] + heights[j]) / 2;\r\n                    let length;\r\n                    if (gapX < _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON && gapY < _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON) {\r\n                        // overlapping boxes push each other apart along the line between their centers\r\n                        if (dx === 0 && dy === 0) {\r\n                            dx = Math.random();\r\n                            dy = Math.random();\r\n                        }\r\n                        length = 0.001;\r\n                    }\r\n                    else {\r\n                        length = Math.sqrt(Math.max(0, gapX) * Math.max(0, gapX) + Math.max(0, gapY) * Math.max(0, gapY));\r\n                        if (length === 0) {\r\n                            length = 0.001;\r\n                        }\r\n                    }\r\n                    if (cutoff !== null && length > cutoff) {\r\n                        return;\r\n                    }\r\n                    const relativeLength = length / spaceBetweenNodes;\r\n                    const strength = 1 / (relativeLength * relativeLength);\r\n                    const centerDistance = Math.sqrt(dx * dx + dy * dy);\r\n                    repulsiveX -= dx / centerDistance * strength;\r\n                    repulsiveY -= dy / centerDistance * strength;\r\n                };\r\n                if (grid !== null) {\r\n                    grid.forEachInBox(xs[i] - cutoff, ys[i] - cutoff, widths[i] + 2 * cutoff, heights[i] + 2 * cutoff, repel);\r\n                }\r\n                else {\r\n                    for (let j = 0; j < n; ++j) {\r\n                        repel(j);\r\n                    }\r\n                }\r\n                const springScale = weightSpring * Math.min(1, forceCap / Math.sqrt(springX * springX + springY * springY));\r\n                const magneticScale = weightMagnetic * Math.min(1, forceCap / Math.sqrt(magneticX * magneticX + magneticY * magneticY));\r\n                const repulsiveScale = weightRepulsive * Math.min(1, forceCap / Math.sqrt(repulsiveX * repulsiveX + repulsiveY * repulsiveY));\r\n                const forceX = springX * springScale + magneticX * magneticScale + repulsiveX * repulsiveScale;\r\n                const forceY = springY * springScale + magneticY * magneticScale + repulsiveY * repulsiveScale;\r\n                newEnergy += forceX * forceX + forceY * forceY;\r\n                const offsetX = forceX * factor;\r\n                const offsetY = forceY * factor;\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(isFinite(offsetX) && isFinite(offsetY), \"offset is not finite\");\r\n                }\r\n                xs[i] += offsetX;\r\n                ys[i] += offsetY;\r\n                maxOffset = Math.max(maxOffset, Math.sqrt(offsetX * offsetX + offsetY * offsetY));\r\n            }\r\n            // stop when all nodes in subgraph almost stopped moving, after the repulsion has been ramped up also\r\n            // when they move less than the tolerance (if any)\r\n            if (maxOffset < _util_constants__WEBPACK_IMPORTED_MODULE_0__.EPSILON || (iteration + 1 >= rampIterations && maxOffset < this._options.tolerance)) {\r\n                break;\r\n            }\r\n            if (iteration + 1 >= rampIterations && newEnergy >= energy) {\r\n                stepSize *= this._options.cooling;\r\n            }\r\n            energy = newEnergy;\r\n            weightRepulsive = Math.min(this._options.weightRepulsive, weightRepulsive + this._options.weightRepulsive / rampIterations);\r\n        }\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_6__.default.stop(TIMER_FORCES);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(nodes, (node, i) => {\r\n            node.translate(xs[i] - startXs[i], ys[i] - startYs[i]);\r\n        });\r\n        // place edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(graph.edges(), (edge) => {\r\n            const srcNode = graph.node(edge.src);\r\n            const srcPoint = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(srcNode.x + srcNode.width / 2, srcNode.y + srcNode.height);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(srcPoint.isFinite(), \"srcPoint is not finite\");\r\n            }\r\n            const dstNode = graph.node(edge.dst);\r\n            const dstPoint = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(dstNode.x + dstNode.width / 2, dstNode.y);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_2__.default.assert(dstPoint.isFinite(), \"dstPoint is not finite\");\r\n            }\r\n            edge.points = [srcPoint, dstPoint];\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/magneticSpringLayouter.ts?");
 
 /***/ }),
 
@@ -3747,7 +3769,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RecursiveLayouter)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _layouter__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./layouter */ \"./src/layouter/layouter.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\n\r\n\r\n\r\nclass RecursiveLayouter extends _layouter__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    doLayout(graph) {\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_2__.default.start([\"doLayout\"]);\r\n        this.recursiveLayout(graph);\r\n        const box = graph.boundingBox();\r\n        graph.translateElements(-box.x, -box.y);\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_2__.default.stop([\"doLayout\"]);\r\n    }\r\n    recursiveLayout(graph) {\r\n        this.setNodeSizes(graph);\r\n        this.layoutSizedGraph(graph);\r\n        this._placeConnectorsCenter(graph);\r\n        this._matchEdgesToConnectors(graph);\r\n    }\r\n    setNodeSizes(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.nodes(), (node) => {\r\n            let x = 0;\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.childGraphs, (childGraph) => {\r\n                let childGraphBox = {\r\n                    width: 0,\r\n                    height: 0,\r\n                    x: 0,\r\n                    y: 0,\r\n                };\r\n                if (childGraph.nodes().length > 0) {\r\n                    this.recursiveLayout(childGraph);\r\n                    childGraphBox = childGraph.boundingBox();\r\n                    // child graph's contents can have negative coordinates\r\n                    childGraph.translateElements(node.padding - childGraphBox.x, node.padding - childGraphBox.y);\r\n                    // make entry and exit nodes match parent width\r\n                    if (childGraph.entryNode !== null) {\r\n                        const childNodeBox = childGraph.entryNode.boundingBox();\r\n                        childGraph.entryNode.setWidth(childGraphBox.width);\r\n                        childGraph.entryNode.translate(-childNodeBox.x, 0);\r\n                    }\r\n                    if (childGraph.exitNode !== null) {\r\n                        const childNodeBox = childGraph.exitNode.boundingBox();\r\n                        childGraph.exitNode.setWidth(childGraphBox.width);\r\n                        childGraph.exitNode.translate(-childNodeBox.x, 0);\r\n                    }\r\n                }\r\n                childGraph.translateElements(x, 0);\r\n                x += childGraphBox.width + this._options[\"targetEdgeLength\"];\r\n                let width = x - this._options[\"targetEdgeLength\"] + 2 * node.padding;\r\n                if (node.selfLoop !== null) {\r\n                    width += this._options[\"targetEdgeLength\"];\r\n                }\r\n                node.updateSize({\r\n                    width: width,\r\n                    height: Math.max(node.height, childGraphBox.height + 2 * node.padding),\r\n                });\r\n            });\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/recursiveLayouter.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RecursiveLayouter)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _layouter__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./layouter */ \"./src/layouter/layouter.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\n\r\n\r\n\r\nconst TIMER_DO_LAYOUT = _util_timer__WEBPACK_IMPORTED_MODULE_2__.default.register([\"doLayout\"]);\r\nclass RecursiveLayouter extends _layouter__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    doLayout(graph) {\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_2__.default.start(TIMER_DO_LAYOUT);\r\n        this.recursiveLayout(graph);\r\n        const box = graph.boundingBox();\r\n        graph.translateElements(-box.x, -box.y);\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_2__.default.stop(TIMER_DO_LAYOUT);\r\n    }\r\n    recursiveLayout(graph) {\r\n        this.setNodeSizes(graph);\r\n        this.layoutSizedGraph(graph);\r\n        this._placeConnectorsCenter(graph);\r\n        this._matchEdgesToConnectors(graph);\r\n    }\r\n    setNodeSizes(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.nodes(), (node) => {\r\n            let x = 0;\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.childGraphs, (childGraph) => {\r\n                let childGraphBox = {\r\n                    width: 0,\r\n                    height: 0,\r\n                    x: 0,\r\n                    y: 0,\r\n                };\r\n                if (childGraph.nodes().length > 0) {\r\n                    this.recursiveLayout(childGraph);\r\n                    childGraphBox = childGraph.boundingBox();\r\n                    // child graph's contents can have negative coordinates\r\n                    childGraph.translateElements(node.padding - childGraphBox.x, node.padding - childGraphBox.y);\r\n                    // make entry and exit nodes match parent width\r\n                    if (childGraph.entryNode !== null) {\r\n                        const childNodeBox = childGraph.entryNode.boundingBox();\r\n                        childGraph.entryNode.setWidth(childGraphBox.width);\r\n                        childGraph.entryNode.translate(-childNodeBox.x, 0);\r\n                    }\r\n                    if (childGraph.exitNode !== null) {\r\n                        const childNodeBox = childGraph.exitNode.boundingBox();\r\n                        childGraph.exitNode.setWidth(childGraphBox.width);\r\n                        childGraph.exitNode.translate(-childNodeBox.x, 0);\r\n                    }\r\n                }\r\n                childGraph.translateElements(x, 0);\r\n                x += childGraphBox.width + this._options[\"targetEdgeLength\"];\r\n                let width = x - this._options[\"targetEdgeLength\"] + 2 * node.padding;\r\n                if (node.selfLoop !== null) {\r\n                    width += this._options[\"targetEdgeLength\"];\r\n                }\r\n                node.updateSize({\r\n                    width: width,\r\n                    height: Math.max(node.height, childGraphBox.height + 2 * node.padding),\r\n                });\r\n            });\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/recursiveLayouter.ts?");
 
 /***/ }),
 
@@ -3758,7 +3780,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SugiyamaLayouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! seedrandom */ \"./node_modules/seedrandom/index.js\");\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_3___default = /*#__PURE__*/__webpack_require__.n(seedrandom__WEBPACK_IMPORTED_MODULE_3__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _layouter__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ./layouter */ \"./src/layouter/layouter.ts\");\n/* harmony import */ var _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../layoutGraph/layoutEdge */ \"./src/layoutGraph/layoutEdge.ts\");\n/* harmony import */ var _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../layoutGraph/layoutNode */ \"./src/layoutGraph/layoutNode.ts\");\n/* harmony import */ var _levelGraph_levelNode__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../levelGraph/levelNode */ \"./src/levelGraph/levelNode.ts\");\n/* harmony import */ var _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../order/orderGraph */ \"./src/order/orderGraph.ts\");\n/* harmony import */ var _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../order/orderGroup */ \"./src/order/orderGroup.ts\");\n/* harmony import */ var _order_orderNode__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! ../order/orderNode */ \"./src/order/orderNode.ts\");\n/* harmony import */ var _order_orderRank__WEBPACK_IMPORTED_MODULE_14__ = __webpack_require__(/*! ../order/orderRank */ \"./src/order/orderRank.ts\");\n/* harmony import */ var _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__ = __webpack_require__(/*! ../rank/rankGraph */ \"./src/rank/rankGraph.ts\");\n/* harmony import */ var _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__ = __webpack_require__(/*! ../rank/rankNode */ \"./src/rank/rankNode.ts\");\n/* harmony import */ var _geometry_segment__WEBPACK_IMPORTED_MODULE_17__ = __webpack_require__(/*! ../geometry/segment */ \"./src/geometry/segment.ts\");\n/* harmony import */ var _util_shuffle__WEBPACK_IMPORTED_MODULE_18__ = __webpack_require__(/*! ../util/shuffle */ \"./src/util/shuffle.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_19__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_20__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _wasm_wasm__WEBPACK_IMPORTED_MODULE_21__ = __webpack_require__(/*! ../wasm/wasm */ \"./src/wasm/wasm.ts\");\n/* harmony import */ var _util_workerPool__WEBPACK_IMPORTED_MODULE_22__ = __webpack_require__(/*! ../util/workerPool */ \"./src/util/workerPool.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass SugiyamaLayouter extends _layouter__WEBPACK_IMPORTED_MODULE_7__.default {\r\n    constructor(options = {}) {\r\n        super(options);\r\n        this._pool = null;\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_2__.defaults(options, this._options, {\r\n            jointOrder: true,\r\n            compactRanks: true,\r\n            numShuffles: 0,\r\n            optimizeAngles: false,\r\n            bundle: false,\r\n            spaceBetweenComponents: 50,\r\n            webAssembly: false,\r\n            webWorkers: false,\r\n            maxWorkers: (typeof (navigator) !== \"undefined\" ? (navigator.hardwareConcurrency - 1) : 0),\r\n            sharedArrayBuffer: false,\r\n        });\r\n        if (this._options.webWorkers && this._options.maxWorkers > 0) {\r\n            let workerPath = '/worker/worker.js';\r\n            let layouterDirPos = window.location.href.indexOf(_util_constants__WEBPACK_IMPORTED_MODULE_0__.ROOT_DIR);\r\n            if (layouterDirPos > -1) {\r\n                workerPath = window.location.href.substr(0, layouterDirPos + _util_constants__WEBPACK_IMPORTED_MODULE_0__.ROOT_DIR.length) + '/worker/worker.js';\r\n            }\r\n            this._pool = new _util_workerPool__WEBPACK_IMPORTED_MODULE_22__.default(workerPath, Math.min(Math.max(this._options.numShuffles, 4), this._options.maxWorkers), this);\r\n        }\r\n        if (this._options.webAssembly) {\r\n            let wasmPath = '/wasm/countCrossings.js';\r\n            let layouterDirPos = window.location.href.indexOf('npg-dag-layout');\r\n            if (layouterDirPos > -1) {\r\n                wasmPath = window.location.href.substr(0, layouterDirPos + 'npg-dag-layout'.length) + '/wasm/countCrossings.js';\r\n            }\r\n            try {\r\n                this._wasm = new _wasm_wasm__WEBPACK_IMPORTED_MODULE_21__.default(wasmPath, this);\r\n            }\r\n            catch (e) {\r\n                this._wasm = null;\r\n            }\r\n        }\r\n        if (this._options.sharedArrayBuffer && typeof (SharedArrayBuffer) === \"undefined\") {\r\n            this._options.sharedArrayBuffer = false;\r\n        }\r\n        this._bufferClass = this._options.sharedArrayBuffer ? SharedArrayBuffer : ArrayBuffer;\r\n    }\r\n    cleanUp() {\r\n        if (this._pool !== null) {\r\n            this._pool.cleanUp();\r\n        }\r\n    }\r\n    disableWasm() {\r\n        this._wasm = null;\r\n    }\r\n    disableWorkers() {\r\n        this._options[\"webWorkers\"] = false;\r\n    }\r\n    doLayout(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (graph.numNodes() === 0) {\r\n                return;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\"]);\r\n            // STEP 1: ASSIGN RANKS\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignRanks\"]);\r\n            this._assignRanks(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignRanks\"]);\r\n            // STEP 2: ADD VIRTUAL NODES\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"addVirtualNodes\"]);\r\n            this._addVirtualNodes(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"addVirtualNodes\"]);\r\n            // STEP 3: ORDER RANKS\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\"]);\r\n            yield this._orderRanks(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\"]);\r\n            // STEP 4: ASSIGN COORDINATES & REMOVE VIRTUAL NODES\r\n            const rankTops = [];\r\n            const segmentsPerRank = [];\r\n            const crossingsPerRank = [];\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\"]);\r\n            yield this._assignCoordinates(graph, rankTops, segmentsPerRank, crossingsPerRank);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\"]);\r\n            // STEP 5 (OPTIONAL): OPTIMIZE ANGLES\r\n            if (this._options.optimizeAngles) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"optimizeAngles\"]);\r\n                this._optimizeAngles(graph, rankTops, segmentsPerRank, crossingsPerRank);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"optimizeAngles\"]);\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\"]);\r\n        });\r\n    }\r\n    _assignRanks(graph) {\r\n        const assignRanksForSubgraph = (subgraph) => {\r\n            if (subgraph.numNodes() === 0) {\r\n                return; // do nothing for empty subgraphs\r\n            }\r\n            // first determine the rank span of all nodes\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                    assignRanksForSubgraph(childGraph);\r\n                });\r\n            });\r\n            const rankGraph = new _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__.default();\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), node => {\r\n                rankGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(node.label()), node.id);\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), edge => {\r\n                rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(edge.src, edge.dst, subgraph.node(edge.src).rankSpan));\r\n            });\r\n            rankGraph.rank();\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), node => {\r\n                node.rank = rankGraph.node(node.id).rank;\r\n                subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan);\r\n            });\r\n            if (subgraph.parentNode !== null && this._options.compactRanks) {\r\n                subgraph.parentNode.rankSpan = Math.max(subgraph.parentNode.rankSpan, subgraph.numRanks);\r\n            }\r\n        };\r\n        assignRanksForSubgraph(graph);\r\n        // transform ranking from local to global\r\n        const makeRanksAbsoluteCompact = (subgraph, offset) => {\r\n            subgraph.minRank = offset;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                node.rank += offset;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                    makeRanksAbsoluteCompact(childGraph, node.rank);\r\n                });\r\n                subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan - subgraph.minRank);\r\n            });\r\n        };\r\n        const makeRanksAbsolute = (subgraph, offset) => {\r\n            subgraph.minRank = offset;\r\n            let newRanks = 0;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.ranks(), (rank) => {\r\n                let maxChild = 1;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (node) => {\r\n                    node.rank += offset + newRanks;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                        makeRanksAbsolute(childGraph, node.rank);\r\n                        node.rankSpan = Math.max(node.rankSpan, childGraph.numRanks);\r\n                        maxChild = Math.max(maxChild, node.rankSpan);\r\n                    });\r\n                    subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan - subgraph.minRank);\r\n                });\r\n                newRanks += maxChild - 1;\r\n            });\r\n        };\r\n        if (this._options.compactRanks) {\r\n            makeRanksAbsoluteCompact(graph, 0);\r\n        }\r\n        else {\r\n            makeRanksAbsolute(graph, 0);\r\n        }\r\n    }\r\n    _addVirtualNodes(graph, addToLevelGraph = false) {\r\n        // place intermediate nodes between long edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allEdges(), (edge) => {\r\n            if (edge.isReplica) {\r\n                return;\r\n            }\r\n            let srcNode = edge.graph.node(edge.src);\r\n            let dstNode = edge.graph.node(edge.dst);\r\n            if (srcNode.rank + srcNode.rankSpan < dstNode.rank) {\r\n                let tmpSrcId = srcNode.id;\r\n                let tmpDstId;\r\n                const dstConnector = edge.dstConnector;\r\n                let bundle = ((edge.srcBundle !== null) && (edge.srcBundle.edges.length > 1));\r\n                for (let tmpDstRank = srcNode.rank + srcNode.rankSpan; tmpDstRank < dstNode.rank; ++tmpDstRank) {\r\n                    const newNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, !bundle, bundle);\r\n                    bundle = ((edge.dstBundle !== null) && (edge.dstBundle.edges.length > 1) && (tmpDstRank === dstNode.rank - 2));\r\n                    newNode.rank = tmpDstRank;\r\n                    tmpDstId = edge.graph.addNode(newNode, null);\r\n                    if (addToLevelGraph) {\r\n                        const levelNode = newNode.graph.levelGraph().addLayoutNode(newNode);\r\n                        levelNode.position = lodash__WEBPACK_IMPORTED_MODULE_2__.last(srcNode.levelNodes).position;\r\n                    }\r\n                    if (tmpDstRank === srcNode.rank + srcNode.rankSpan) {\r\n                        // original edge is redirected from source to first virtual node\r\n                        edge.graph.redirectEdge(edge.id, edge.src, tmpDstId);\r\n                        edge.dstConnector = null;\r\n                        // add bundle edges\r\n                        if (edge.srcBundle !== null && edge.srcBundle.edges.length > 1) {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.srcBundle.edges, (bundleEdge) => {\r\n                                if (bundleEdge.isReplica) {\r\n                                    bundleEdge.graph.redirectEdge(bundleEdge.id, bundleEdge.src, tmpDstId);\r\n                                }\r\n                            });\r\n                        }\r\n                        if (addToLevelGraph) {\r\n                            const levelEdge = edge.graph.levelGraph().edgeBetween(lodash__WEBPACK_IMPORTED_MODULE_2__.last(srcNode.levelNodes).id, lodash__WEBPACK_IMPORTED_MODULE_2__.first(dstNode.levelNodes).id);\r\n                            if (levelEdge !== undefined) {\r\n                                levelEdge.graph.removeEdge(levelEdge.id);\r\n                            }\r\n                            edge.graph.levelGraph().addLayoutEdge(edge);\r\n                        }\r\n                    }\r\n                    else {\r\n                        const tmpEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcId, tmpDstId);\r\n                        if (!bundle) {\r\n                            tmpEdge.weight = Number.POSITIVE_INFINITY;\r\n                        }\r\n                        tmpEdge.isInverted = edge.isInverted;\r\n                        edge.graph.addEdge(tmpEdge, null);\r\n                        if (addToLevelGraph) {\r\n                            edge.graph.levelGraph().addLayoutEdge(tmpEdge);\r\n                        }\r\n                    }\r\n                    tmpSrcId = tmpDstId;\r\n                }\r\n                // last virtual edge has the original dstConnector\r\n                const tmpEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcId, dstNode.id, null, dstConnector);\r\n                tmpEdge.isInverted = edge.isInverted;\r\n                edge.graph.addEdge(tmpEdge, null);\r\n                if (addToLevelGraph) {\r\n                    edge.graph.levelGraph().addLayoutEdge(tmpEdge);\r\n                }\r\n                // add bundle edges\r\n                if ((edge.dstBundle !== null) && (edge.dstBundle.edges.length > 1)) {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.dstBundle.edges, (bundleEdge) => {\r\n                        if (bundleEdge.isReplica) {\r\n                            bundleEdge.graph.redirectEdge(bundleEdge.id, tmpSrcId, bundleEdge.dst);\r\n                        }\r\n                    });\r\n                }\r\n            }\r\n        });\r\n    }\r\n    _updateLevelNodeRanks(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allNodes(), (layoutNode) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutNode.levelNodes, (levelNode, r) => {\r\n                levelNode.rank = layoutNode.rank + r;\r\n            });\r\n        });\r\n    }\r\n    countCrossings(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const orderGraph = this._createConnectorGraph(graph, true, false, false, true);\r\n            return yield orderGraph.order({\r\n                resolveConflicts: false,\r\n                countInitial: true,\r\n                countOnly: true,\r\n            });\r\n        });\r\n    }\r\n    _createConnectorGraph(graph, isPreorder, shuffleNodes = false, shuffleConnectors = false, isCounting = false) {\r\n        const orderGraph = new _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__.default(this._wasm);\r\n        const orderRank = [];\r\n        for (let r = 0; r < graph.numRanks; ++r) {\r\n            orderRank[r] = new _order_orderRank__WEBPACK_IMPORTED_MODULE_14__.default(r);\r\n            orderGraph.addRank(orderRank[r]);\r\n        }\r\n        const connectorMap = new Map();\r\n        const levelNodeMap = new Map();\r\n        const addConnector = (connectorGroup, connector) => {\r\n            const connectorNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(connector, false, false);\r\n            connectorGroup.addNode(connectorNode);\r\n            connectorMap.set(connector, connectorNode.id);\r\n            if (connector.isScoped) {\r\n                connectorMap.set(connector.counterpart, connectorNode.id);\r\n            }\r\n        };\r\n        // add nodes\r\n        const addConnectorsForSubgraph = (subgraph, indizes = null) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.levelGraph().ranks(), (rank, r) => {\r\n                let index = (indizes === null ? 0 : indizes[r]);\r\n                if (shuffleNodes) {\r\n                    rank = _util_shuffle__WEBPACK_IMPORTED_MODULE_18__.default.shuffle(rank);\r\n                }\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (levelNode) => {\r\n                    if (isPreorder && !isCounting) {\r\n                        levelNode.position = index;\r\n                    }\r\n                    const node = levelNode.layoutNode;\r\n                    if (levelNode.isLast) {\r\n                        let childIndizes = null;\r\n                        if (node.isScopeNode) {\r\n                            childIndizes = lodash__WEBPACK_IMPORTED_MODULE_2__.map(node.levelNodes, \"position\");\r\n                        }\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                            addConnectorsForSubgraph(childGraph, childIndizes);\r\n                        });\r\n                    }\r\n                    if (node.isScopeNode) {\r\n                        index += node.childGraphs[0].maxNodesPerRank();\r\n                        return; // do not add connectors for scope nodes\r\n                    }\r\n                    let connectorGroup;\r\n                    if (isCounting && node.hasScopedConnectors) {\r\n                        connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                        orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                        connectorGroup.position = index;\r\n                        let inPointer = 0;\r\n                        let outPointer = 0;\r\n                        while (inPointer < node.inConnectors.length || outPointer < node.outConnectors.length) {\r\n                            if (inPointer === node.inConnectors.length) {\r\n                                // only out connectors left\r\n                                addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                            }\r\n                            else if (outPointer === node.outConnectors.length) {\r\n                                // only in connectors left\r\n                                addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                            }\r\n                            else {\r\n                                let scoped = false;\r\n                                if (node.inConnectors[inPointer].isScoped) {\r\n                                    scoped = true;\r\n                                    while (!node.outConnectors[outPointer].isScoped) {\r\n                                        addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                                    }\r\n                                }\r\n                                else if (node.outConnectors[outPointer].isScoped) {\r\n                                    scoped = true;\r\n                                    while (!node.inConnectors[inPointer].isScoped) {\r\n                                        addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    }\r\n                                }\r\n                                else {\r\n                                    addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                                }\r\n                                if (scoped) {\r\n                                    addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    outPointer++;\r\n                                }\r\n                            }\r\n                        }\r\n                    }\r\n                    else {\r\n                        if (isPreorder || levelNode.isFirst) {\r\n                            connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                            orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                            connectorGroup.position = index;\r\n                            if (levelNode.isFirst) {\r\n                                // add input connectors\r\n                                let connectors = node.inConnectors;\r\n                                if (shuffleConnectors) {\r\n                                    connectors = _util_shuffle__WEBPACK_IMPORTED_MODULE_18__.default.shuffle(connectors);\r\n                                }\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                                    addConnector(connectorGroup, connector);\r\n                                });\r\n                            }\r\n                        }\r\n                        if (isPreorder || levelNode.isLast) {\r\n                            if (!isPreorder && !node.hasScopedConnectors) {\r\n                                connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                                orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                                connectorGroup.position = index;\r\n                            }\r\n                            if (levelNode.isLast) {\r\n                                // add output connectors\r\n                                let connectors = node.outConnectors;\r\n                                if (shuffleConnectors) {\r\n                                    connectors = _util_shuffle__WEBPACK_IMPORTED_MODULE_18__.default.shuffle(connectors);\r\n                                }\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                                    if (!connector.isScoped) {\r\n                                        const connectorNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(connector, false, false);\r\n                                        connectorGroup.addNode(connectorNode, node.hasScopedConnectors ? null : null);\r\n                                        connectorMap.set(connector, connectorNode.id);\r\n                                    }\r\n                                });\r\n                            }\r\n                        }\r\n                        if (isPreorder && node.rankSpan > 1) {\r\n                            const orderNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(null, false, false);\r\n                            connectorGroup.addNode(orderNode);\r\n                            levelNodeMap.set(levelNode, orderNode);\r\n                        }\r\n                    }\r\n                    index++;\r\n                });\r\n            });\r\n        };\r\n        addConnectorsForSubgraph(graph);\r\n        // add edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allEdges(), (edge) => {\r\n            let srcNode = edge.graph.node(edge.src);\r\n            if (srcNode.isScopeNode) {\r\n                srcNode = srcNode.childGraphs[0].exitNode;\r\n            }\r\n            let dstNode = edge.graph.node(edge.dst);\r\n            if (dstNode.isScopeNode) {\r\n                dstNode = dstNode.childGraphs[0].entryNode;\r\n            }\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(dstNode.rank > srcNode.rank, \"edge not between neighboring ranks\", edge, srcNode, dstNode);\r\n            }\r\n            let srcOrderNodeId = connectorMap.get(srcNode.connector(\"OUT\", edge.srcConnector));\r\n            let dstOrderNodeId = connectorMap.get(dstNode.connector(\"IN\", edge.dstConnector));\r\n            orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(srcOrderNodeId, dstOrderNodeId, 1));\r\n        });\r\n        if (isPreorder) {\r\n            // add intranode edges\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allNodes(), (node) => {\r\n                if (!node.isScopeNode && node.rankSpan > 1) {\r\n                    for (let r = 0; r < node.levelNodes.length - 1; ++r) {\r\n                        const srcNode = node.levelNodes[r];\r\n                        const dstNode = node.levelNodes[r + 1];\r\n                        let srcOrderNode = levelNodeMap.get(srcNode);\r\n                        let dstOrderNode = levelNodeMap.get(dstNode);\r\n                        orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(srcOrderNode.id, dstOrderNode.id, 1));\r\n                    }\r\n                }\r\n            });\r\n        }\r\n        return orderGraph;\r\n    }\r\n    doOrder(graph, shuffle = false) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\"]);\r\n            /**\r\n             * STEP 1 (OPTIONAL): ORDER NODES BASED ON CONNECTORS\r\n             * In this step, scope insides and outsides are handled in the same order graph.\r\n             * If there are nested scopes, they are flattened.\r\n             */\r\n            if (this._options.jointOrder) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"preorder\"]);\r\n                // order\r\n                const connectorOrderGraph = this._createConnectorGraph(graph, true, shuffle, shuffle);\r\n                yield connectorOrderGraph.order({\r\n                    orderGroups: true,\r\n                    resolveConflicts: false,\r\n                });\r\n                // copy order information from order graph to layout graph\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectorOrderGraph.groups(), (orderGroup) => {\r\n                    const levelNode = orderGroup.reference;\r\n                    if (levelNode !== null) {\r\n                        levelNode.position = orderGroup.position;\r\n                        let tmpNode = levelNode;\r\n                        while (tmpNode.layoutNode.graph.entryNode !== null) {\r\n                            tmpNode = tmpNode.layoutNode.graph.parentNode.levelNodes[tmpNode.rank - tmpNode.layoutNode.graph.parentNode.rank];\r\n                            tmpNode.position = levelNode.position;\r\n                        }\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"preorder\"]);\r\n            }\r\n            /**\r\n             * STEP 2: ORDER NODES (OPTIONAL) & RESOLVE CONFLICTS\r\n             * This is done strictly hierarchically.\r\n             * Child graphs are represented as a chain over multiple ranks in their parent.\r\n             */\r\n            const nodeMap = new Map(); // map from level node to corresponding order node\r\n            // child graphs are visited before their parents\r\n            const allGraphs = graph.allGraphs();\r\n            for (let i = allGraphs.length - 1; i >= 0; --i) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderNodes\"]);\r\n                const subgraph = allGraphs[i];\r\n                this._addVirtualNodes(subgraph, true);\r\n                const levelGraph = subgraph.levelGraph();\r\n                levelGraph.invalidateRankOrder();\r\n                // init graph and ranks\r\n                const orderGraph = new _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__.default(this._wasm);\r\n                const orderGroups = new Array(subgraph.numRanks);\r\n                for (let r = subgraph.minRank; r < subgraph.minRank + subgraph.numRanks; ++r) {\r\n                    const orderRank = new _order_orderRank__WEBPACK_IMPORTED_MODULE_14__.default(r);\r\n                    orderGraph.addRank(orderRank);\r\n                    orderGroups[r] = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(null);\r\n                    orderRank.addGroup(orderGroups[r]);\r\n                }\r\n                // add nodes\r\n                let levelNodes = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(levelGraph.nodes());\r\n                if (shuffle && !this._options.jointOrder) {\r\n                    _util_shuffle__WEBPACK_IMPORTED_MODULE_18__.default.shuffle(levelNodes);\r\n                }\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelNodes, (levelNode) => {\r\n                    const orderNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(levelNode, levelNode.layoutNode.isVirtual || levelNode.layoutNode.isBundle, levelNode.layoutNode.rankSpan > 1, levelNode.layoutNode.label());\r\n                    orderGroups[levelNode.rank].addNode(orderNode, levelNode.id);\r\n                    nodeMap.set(levelNode.id, orderNode.id);\r\n                    if (this._options.jointOrder) {\r\n                        orderNode.position = levelNode.position;\r\n                    }\r\n                });\r\n                // add edges\r\n                // for each pair of nodes, sum up the weights of edges in-between\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), (edge) => {\r\n                    const existingEdge = orderGraph.edgeBetween(edge.src, edge.dst);\r\n                    if (existingEdge === undefined) {\r\n                        orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(edge.src, edge.dst, edge.weight));\r\n                    }\r\n                    else {\r\n                        existingEdge.weight += edge.weight;\r\n                    }\r\n                });\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertAll(orderGraph.edges(), edge => {\r\n                        const srcNode = edge.graph.node(edge.src);\r\n                        const dstNode = edge.graph.node(edge.dst);\r\n                        return (srcNode.group.rank.rank + 1 === dstNode.group.rank.rank);\r\n                    }, \"order graph edge not between neighboring ranks\");\r\n                }\r\n                // do order\r\n                yield orderGraph.order({\r\n                    debug: false,\r\n                    resolveX: true,\r\n                    countInitial: this._options.jointOrder,\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderNodes\"]);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"insertNodes\"]);\r\n                // copy node order into layout graph\r\n                const newOrderNodes = new Set();\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(orderGraph.nodes(), (orderNode) => {\r\n                    let levelNode = orderNode.reference;\r\n                    if (levelNode === null) {\r\n                        // virtual node was created by orderGraph.order() => add this node to layout graph\r\n                        const newLayoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, true);\r\n                        newLayoutNode.rank = orderNode.rank;\r\n                        subgraph.addNode(newLayoutNode, null);\r\n                        newOrderNodes.add(orderNode);\r\n                        levelNode = levelGraph.addLayoutNode(newLayoutNode);\r\n                        orderNode.reference = levelNode;\r\n                    }\r\n                    else {\r\n                        if (levelNode.isFirst) {\r\n                            levelNode.layoutNode.updateRank(orderNode.rank);\r\n                        }\r\n                    }\r\n                    subgraph.numRanks = Math.max(subgraph.numRanks, levelNode.rank - subgraph.minRank + 1);\r\n                    levelNode.position = orderNode.position;\r\n                });\r\n                let tmpSubgraph = subgraph;\r\n                while (tmpSubgraph.parentNode !== null) {\r\n                    const parent = tmpSubgraph.parentNode;\r\n                    const prevRankSpan = parent.rankSpan;\r\n                    const newRankSpan = Math.max(prevRankSpan, tmpSubgraph.numRanks);\r\n                    const diff = newRankSpan - prevRankSpan;\r\n                    if (diff !== 0) {\r\n                        const levelGraph = parent.graph.levelGraph();\r\n                        parent.rankSpan = newRankSpan;\r\n                        /**\r\n                         * UPDATE LEVEL NODES REPRESENTATION IN PARENT\r\n                         */\r\n                        let positions = lodash__WEBPACK_IMPORTED_MODULE_2__.map(parent.levelNodes, \"position\");\r\n                        positions.length = newRankSpan;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.fill(positions, positions[prevRankSpan - 1], prevRankSpan);\r\n                        const lastLevelNode = lodash__WEBPACK_IMPORTED_MODULE_2__.last(parent.levelNodes);\r\n                        // add new nodes\r\n                        const newLevelNodes = [];\r\n                        for (let r = 0; r < diff; ++r) {\r\n                            const newNode = new _levelGraph_levelNode__WEBPACK_IMPORTED_MODULE_10__.default(parent, lastLevelNode.rank + r, 0);\r\n                            levelGraph.addNode(newNode);\r\n                            newLevelNodes.push(newNode);\r\n                        }\r\n                        parent.levelNodes.length--;\r\n                        Array.prototype.push.apply(parent.levelNodes, newLevelNodes);\r\n                        parent.levelNodes.push(lastLevelNode);\r\n                        lastLevelNode.rank += diff;\r\n                        // redirect last edge\r\n                        const lastEdge = levelGraph.inEdges(lastLevelNode.id)[0];\r\n                        levelGraph.redirectEdge(lastEdge.id, lodash__WEBPACK_IMPORTED_MODULE_2__.last(newLevelNodes).id, lastLevelNode.id);\r\n                        // update positions\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.levelNodes, (levelNode, r) => {\r\n                            levelNode.position = positions[r];\r\n                        });\r\n                        // add edges between new nodes\r\n                        for (let r = prevRankSpan - 2; r < newRankSpan - 2; ++r) {\r\n                            levelGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(parent.levelNodes[r].id, parent.levelNodes[r + 1].id, Number.POSITIVE_INFINITY));\r\n                        }\r\n                        /////////////////////////////////////////////////////\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.graph.bfs(parent.id), (node) => {\r\n                            if (node !== parent) {\r\n                                node.offsetRank(diff);\r\n                            }\r\n                            node.graph.numRanks = Math.max(node.graph.numRanks, node.rank + node.rankSpan - node.graph.minRank);\r\n                        });\r\n                    }\r\n                    tmpSubgraph = parent.graph;\r\n                }\r\n                // find for all new nodes the dominating and dominated non-new node\r\n                const visited = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(orderGraph.maxId() + 1), false);\r\n                const newLevelNodesPerEdge = new Map();\r\n                newOrderNodes.forEach((orderNode) => {\r\n                    if (visited[orderNode.id]) {\r\n                        return; // start and end node already set\r\n                    }\r\n                    visited[orderNode.id] = true;\r\n                    let tmpOrderNode = orderNode;\r\n                    const nodes = [orderNode.reference];\r\n                    while (newOrderNodes.has(tmpOrderNode) && orderGraph.inEdges(tmpOrderNode.id).length > 0) {\r\n                        tmpOrderNode = orderGraph.node(orderGraph.inEdges(tmpOrderNode.id)[0].src);\r\n                        if (newOrderNodes.has(tmpOrderNode)) {\r\n                            nodes.push(tmpOrderNode.reference);\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(!visited[tmpOrderNode.id], \"new node on multiple paths\");\r\n                            }\r\n                            visited[tmpOrderNode.id] = true;\r\n                        }\r\n                    }\r\n                    const startNode = tmpOrderNode;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.reverse(nodes);\r\n                    tmpOrderNode = orderNode;\r\n                    while (newOrderNodes.has(tmpOrderNode) && orderGraph.outEdges(tmpOrderNode.id).length > 0) {\r\n                        tmpOrderNode = orderGraph.node(orderGraph.outEdges(tmpOrderNode.id)[0].dst);\r\n                        if (newOrderNodes.has(tmpOrderNode)) {\r\n                            nodes.push(tmpOrderNode.reference);\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(!visited[tmpOrderNode.id], \"new node on multiple paths\");\r\n                            }\r\n                            visited[tmpOrderNode.id] = true;\r\n                        }\r\n                    }\r\n                    const endNode = tmpOrderNode;\r\n                    const key = startNode.id + \"_\" + endNode.id;\r\n                    newLevelNodesPerEdge.set(key, nodes);\r\n                });\r\n                levelGraph.invalidateRankOrder();\r\n                const ranks = levelGraph.ranks();\r\n                // reroute edges that were intermitted by new virtual nodes\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), levelEdge => {\r\n                    const orderSrcNodeId = nodeMap.get(levelEdge.src);\r\n                    const orderDstNodeId = nodeMap.get(levelEdge.dst);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(orderSrcNodeId, \"orderSrcNodeId is not a number\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(orderSrcNodeId, \"orderSrcNodeId is not a number\");\r\n                    }\r\n                    if (orderGraph.edgeBetween(orderSrcNodeId, orderDstNodeId) === undefined) {\r\n                        levelGraph.removeEdge(levelEdge.id);\r\n                        const srcLayoutNode = levelGraph.node(levelEdge.src).layoutNode;\r\n                        const dstLayoutNode = levelGraph.node(levelEdge.dst).layoutNode;\r\n                        const key = orderSrcNodeId + \"_\" + orderDstNodeId;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edgesBetween(srcLayoutNode.id, dstLayoutNode.id), (layoutEdge, e) => {\r\n                            if (layoutEdge.isReplica) {\r\n                                return;\r\n                            }\r\n                            let newNodes = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(newLevelNodesPerEdge.get(key));\r\n                            const dstConnector = layoutEdge.dstConnector;\r\n                            if (e > 0) {\r\n                                let clonedNewNodes = [];\r\n                                // create a copy of all new nodes because each edge needs its own virtual nodes\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(newNodes, (levelNode) => {\r\n                                    const newLayoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, true);\r\n                                    newLayoutNode.rank = levelNode.layoutNode.rank;\r\n                                    subgraph.addNode(newLayoutNode, null);\r\n                                    const newLevelNode = levelGraph.addLayoutNode(newLayoutNode);\r\n                                    const rank = ranks[newLayoutNode.rank - subgraph.minRank];\r\n                                    for (let pos = levelNode.position; pos < rank.length; ++pos) {\r\n                                        rank[pos].position++;\r\n                                    }\r\n                                    rank.splice(levelNode.position - 1, 0, newLevelNode);\r\n                                    newLevelNode.position = levelNode.position - 1;\r\n                                    clonedNewNodes.push(newLevelNode);\r\n                                });\r\n                                newNodes = clonedNewNodes;\r\n                            }\r\n                            newNodes.push(orderGraph.node(orderDstNodeId).reference);\r\n                            // original edge gets rerouted to first new node\r\n                            subgraph.removeEdge(layoutEdge.id);\r\n                            layoutEdge.dst = newNodes[0].layoutNode.id;\r\n                            layoutEdge.dstConnector = null;\r\n                            subgraph.addEdge(layoutEdge, layoutEdge.id);\r\n                            levelGraph.addLayoutEdge(layoutEdge);\r\n                            for (let n = 1; n < newNodes.length; ++n) {\r\n                                const tmpSrcLayoutNodeId = newNodes[n - 1].layoutNode.id;\r\n                                const tmpDstLayoutNodeId = newNodes[n].layoutNode.id;\r\n                                // last edge gets the original dst connector\r\n                                const tmpDstConnector = ((n === newNodes.length - 1) ? dstConnector : null);\r\n                                const newLayoutEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcLayoutNodeId, tmpDstLayoutNodeId, null, tmpDstConnector);\r\n                                subgraph.addEdge(newLayoutEdge, null);\r\n                                levelGraph.addLayoutEdge(newLayoutEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"insertNodes\"]);\r\n            }\r\n            this._updateLevelNodeRanks(graph);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertAll(graph.allEdges(), edge => edge.graph.node(edge.src).rank + edge.graph.node(edge.src).rankSpan === edge.graph.node(edge.dst).rank, \"edge not between neighboring ranks\");\r\n            }\r\n            /**\r\n             * STEP 3: ORDER CONNECTORS\r\n             */\r\n            // order connectors\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderConnectors\"]);\r\n            const connectorOrderGraph = this._createConnectorGraph(graph, false, false, shuffle && !this._options.jointOrder);\r\n            yield connectorOrderGraph.order({\r\n                resolveConflicts: false,\r\n            });\r\n            // copy order information from order graph to layout graph\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectorOrderGraph.groups(), (orderGroup) => {\r\n                const levelNode = orderGroup.reference;\r\n                if (levelNode !== null) {\r\n                    const layoutNode = levelNode.layoutNode;\r\n                    const connectors = { \"IN\": [], \"OUT\": [] };\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(orderGroup.orderedNodes(), (orderNode) => {\r\n                        if (orderNode.reference !== null) {\r\n                            const connector = orderNode.reference;\r\n                            connectors[connector.type].push(connector);\r\n                            if (connector.isScoped) {\r\n                                connectors[\"OUT\"].push(connector.counterpart);\r\n                            }\r\n                        }\r\n                    });\r\n                    if (connectors[\"IN\"].length > 0 || connectors[\"OUT\"].length > 0) {\r\n                        if (connectors[\"IN\"].length > 0 && layoutNode.inConnectorBundles.length > 0) {\r\n                            this._bundleConnectors(connectors[\"IN\"], connectors[\"OUT\"], layoutNode.inConnectorBundles);\r\n                        }\r\n                        if (connectors[\"OUT\"].length > 0 && layoutNode.outConnectorBundles.length > 0) {\r\n                            this._bundleConnectors(connectors[\"OUT\"], connectors[\"IN\"], layoutNode.outConnectorBundles);\r\n                        }\r\n                        if (connectors[\"IN\"].length > 0) {\r\n                            layoutNode.inConnectors = connectors[\"IN\"];\r\n                        }\r\n                        if (connectors[\"OUT\"].length > 0) {\r\n                            layoutNode.outConnectors = connectors[\"OUT\"];\r\n                        }\r\n                    }\r\n                }\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderConnectors\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\"]);\r\n        });\r\n    }\r\n    _orderAndCount(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const graphCopy = graph.cloneForOrdering();\r\n            yield this.doOrder(graphCopy);\r\n            return yield this.countCrossings(graphCopy);\r\n        });\r\n    }\r\n    _orderRanks(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (this._options.numShuffles === 0) {\r\n                yield this.doOrder(graph);\r\n            }\r\n            else {\r\n                if (!this._options.bundle && this._options.webWorkers) {\r\n                    const allGraphs = graph.allGraphs();\r\n                    const numNodesTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => subgraph.numNodes()));\r\n                    const numInConnectorsTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(subgraph.nodes(), node => node.numInConnectors()))));\r\n                    const numOutConnectorsTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(subgraph.nodes(), node => node.numOutConnectors()))));\r\n                    const numEdgesTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => subgraph.numEdges()));\r\n                    // DATA PASSED TO WORKER\r\n                    // metadata: level, parentNodeId, #nodes, #in-connectors, #out-connectors, #edges, minRank, numRanks\r\n                    // nodes: id, rank, rankSpan, isVirtual, isScopeNode\r\n                    // inConnectors: nodeId, counterPartId\r\n                    // outConnectors: nodeId, counterPartId\r\n                    // edges: id, srcId, dstId, srcConnectorId, dstConnectorId, weight\r\n                    const sizeMetadata = 8 * allGraphs.length;\r\n                    const sizeNodes = 5 * numNodesTotal;\r\n                    const sizeInConnectors = numInConnectorsTotal;\r\n                    const sizeOutConnectors = 2 * numOutConnectorsTotal;\r\n                    const sizeEdges = 8 * numEdgesTotal;\r\n                    const metadataBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeMetadata);\r\n                    const metadata = new Int32Array(metadataBuf);\r\n                    const nodesBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeNodes);\r\n                    const nodes = new Int32Array(nodesBuf);\r\n                    const inConnectorsBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeInConnectors);\r\n                    const inConnectors = new Int32Array(inConnectorsBuf);\r\n                    const outConnectorsBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeOutConnectors);\r\n                    const outConnectors = new Int32Array(outConnectorsBuf);\r\n                    const edgesBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeEdges);\r\n                    const edges = new Int32Array(edgesBuf);\r\n                    let n = 0;\r\n                    let i = 0;\r\n                    let o = 0;\r\n                    let e = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(allGraphs, (subgraph, g) => {\r\n                        const graphNodes = subgraph.nodes();\r\n                        let numInConnectors = 0;\r\n                        let numOutConnectors = 0;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphNodes, (node) => {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.inConnectors, (connector) => {\r\n                                inConnectors[i++] = connector.node.id;\r\n                                numInConnectors++;\r\n                            });\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.outConnectors, (connector) => {\r\n                                outConnectors[o++] = connector.node.id;\r\n                                outConnectors[o++] = (connector.isScoped ? connector.node.connectorIndex(\"IN\", connector.counterpart.name) : -1);\r\n                                numOutConnectors++;\r\n                            });\r\n                        });\r\n                        const graphEdges = subgraph.edges();\r\n                        metadata[8 * g] = (subgraph.parentNode === null ? 0 : subgraph.parentNode.parents().length + 1);\r\n                        metadata[8 * g + 1] = (subgraph.parentNode === null ? -1 : subgraph.parentNode.id);\r\n                        metadata[8 * g + 2] = graphNodes.length;\r\n                        metadata[8 * g + 3] = numInConnectors;\r\n                        metadata[8 * g + 4] = numOutConnectors;\r\n                        metadata[8 * g + 5] = graphEdges.length;\r\n                        metadata[8 * g + 6] = subgraph.minRank;\r\n                        metadata[8 * g + 7] = subgraph.numRanks;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphNodes, (node) => {\r\n                            nodes[n++] = node.id;\r\n                            nodes[n++] = node.rank;\r\n                            nodes[n++] = node.rankSpan;\r\n                            nodes[n++] = node.isVirtual ? 1 : 0;\r\n                            nodes[n++] = node.isScopeNode ? 1 : 0;\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphEdges, (edge) => {\r\n                            edges[e++] = edge.id; // id\r\n                            edges[e++] = edge.src; // srcNodeId\r\n                            edges[e++] = edge.dst; // dstNodeId\r\n                            let srcNode = subgraph.node(edge.src);\r\n                            let dstNode = subgraph.node(edge.dst);\r\n                            if (srcNode.isScopeNode) {\r\n                                srcNode = srcNode.childGraphs[0].exitNode;\r\n                            }\r\n                            if (dstNode.isScopeNode) {\r\n                                dstNode = dstNode.childGraphs[0].entryNode;\r\n                            }\r\n                            edges[e++] = srcNode.connectorIndex(\"OUT\", edge.srcConnector); // srcConnectorId\r\n                            edges[e++] = dstNode.connectorIndex(\"IN\", edge.dstConnector); // dstConnectorId\r\n                            edges[e++] = (edge.weight === Number.POSITIVE_INFINITY ? -1 : edge.weight); // weight\r\n                        });\r\n                    });\r\n                    const startedPromises = [];\r\n                    const donePromises = [null];\r\n                    for (let s = 0; s < this._options.numShuffles; ++s) {\r\n                        const [startedPromise, donePromise] = this._pool.exec(\"orderRanks\", [s + 1, allGraphs.length, metadata.buffer, nodes.buffer, inConnectors.buffer, outConnectors.buffer, edges.buffer, this._options.webAssembly]);\r\n                        startedPromises.push(startedPromise);\r\n                        donePromises.push(donePromise);\r\n                    }\r\n                    yield Promise.all(startedPromises);\r\n                    donePromises[0] = this._orderAndCount(graph);\r\n                    const results = yield Promise.all(donePromises);\r\n                    let minCrossings = results[0];\r\n                    let minIndex = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(results, (result, index) => {\r\n                        if (result < minCrossings) {\r\n                            minCrossings = result;\r\n                            minIndex = index;\r\n                        }\r\n                    });\r\n                    seedrandom__WEBPACK_IMPORTED_MODULE_3__(minIndex, { global: true });\r\n                    yield this.doOrder(graph, minIndex > 0);\r\n                }\r\n                else {\r\n                    const graphCopy = graph.cloneForOrdering();\r\n                    yield this.doOrder(graphCopy);\r\n                    let minCrossings = yield this.countCrossings(graphCopy);\r\n                    let bestGraphCopy = graphCopy;\r\n                    for (let i = 0; i < this._options.numShuffles; ++i) {\r\n                        if (minCrossings === 0) {\r\n                            break;\r\n                        }\r\n                        const graphCopy = graph.cloneForOrdering();\r\n                        yield this.doOrder(graphCopy, true);\r\n                        let numCrossings = yield this.countCrossings(graphCopy);\r\n                        if (numCrossings < minCrossings) {\r\n                            minCrossings = numCrossings;\r\n                            bestGraphCopy = graphCopy;\r\n                        }\r\n                    }\r\n                    bestGraphCopy.copyInto(graph);\r\n                }\r\n            }\r\n        });\r\n    }\r\n    _bundleConnectors(connectors, counterPartConnectors, bundles) {\r\n        // order bundles by the mean of their connectors positions\r\n        // within a bundle, the connectors do not change their relative position\r\n        let connectorByName = new Map();\r\n        let indexByConnector = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector, pos) => {\r\n            connectorByName.set(connector.name, connector);\r\n            indexByConnector.set(connector.name, pos);\r\n        });\r\n        let bundleMeans = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(bundles, (bundle) => {\r\n            bundle.connectors = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(bundle.connectors, (name) => indexByConnector.get(name));\r\n            bundleMeans.push([bundle, lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(bundle.connectors, (name) => indexByConnector.get(name)))]);\r\n        });\r\n        connectors.length = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(bundleMeans, \"1\"), ([bundle, mean]) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(bundle.connectors, (name) => {\r\n                const connector = connectorByName.get(name);\r\n                connectors.push(connector);\r\n            });\r\n        });\r\n        // reflect unbroken sequences of scoped connectors on other side\r\n        const scopeGroups = [];\r\n        let group = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector, pos) => {\r\n            if (connector.isScoped) {\r\n                group.push(connector);\r\n            }\r\n            if ((pos === connectors.length - 1) || !connectors[pos + 1].isScoped) {\r\n                scopeGroups.push(group);\r\n                group = [];\r\n            }\r\n        });\r\n        const counterMeans = [];\r\n        let scopeCount = 0;\r\n        let scopeSum = 0;\r\n        let scopeGroupPointer = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(counterPartConnectors, (connector, pos) => {\r\n            if (connector.isScoped) {\r\n                scopeSum += pos;\r\n                if (++scopeCount === scopeGroups[scopeGroupPointer].length) {\r\n                    counterMeans.push([lodash__WEBPACK_IMPORTED_MODULE_2__.map(scopeGroups[scopeGroupPointer++], \"counterpart\"), pos / scopeCount]);\r\n                    scopeCount = 0;\r\n                    scopeSum = 0;\r\n                }\r\n            }\r\n            else {\r\n                counterMeans.push([[connector], pos]);\r\n            }\r\n        });\r\n        counterPartConnectors.length = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(counterMeans, \"1\"), ([connectors, mean]) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                counterPartConnectors.push(connector);\r\n            });\r\n        });\r\n    }\r\n    /**\r\n     * Assigns coordinates to the nodes, the connectors and the edges.\r\n     * @param graph\r\n     * @param rankTops\r\n     * @param segmentsPerRank\r\n     * @param crossingsPerRank\r\n     * @private\r\n     */\r\n    _assignCoordinates(graph, rankTops, segmentsPerRank, crossingsPerRank) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            // assign y\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"assignY\"]);\r\n            rankTops.length = graph.numRanks + 1;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.fill(rankTops, Number.POSITIVE_INFINITY);\r\n            const rankBottoms = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(graph.numRanks), Number.NEGATIVE_INFINITY);\r\n            const globalRanks = graph.globalRanks();\r\n            rankTops[0] = 0;\r\n            for (let r = 0; r < globalRanks.length; ++r) {\r\n                crossingsPerRank[r] = [];\r\n                segmentsPerRank[r] = [];\r\n                let maxBottom = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(globalRanks[r], (node) => {\r\n                    node.y = rankTops[r];\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.parents(), (parent) => {\r\n                        if (parent.rank === node.rank) {\r\n                            node.y += parent.padding;\r\n                        }\r\n                    });\r\n                    node.updateSize({ width: 2 * node.padding, height: 2 * node.padding });\r\n                    let height = node.height;\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(node.inConnectors, connector => !connector.isTemporary)) {\r\n                        node.y += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(node.outConnectors, connector => !connector.isTemporary)) {\r\n                        height += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.parents(), (parent) => {\r\n                        if (parent.rank + parent.rankSpan - 1 === node.rank) {\r\n                            height += parent.padding;\r\n                            if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(parent.outConnectors, connector => !connector.isTemporary)) {\r\n                                height += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                            }\r\n                        }\r\n                    });\r\n                    maxBottom = Math.max(maxBottom, node.y + height);\r\n                });\r\n                rankBottoms[r] = maxBottom;\r\n                rankTops[r + 1] = maxBottom + this._options.targetEdgeLength;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"assignY\"]);\r\n            const nodeHasInProxies = [];\r\n            const nodeHasOutProxies = [];\r\n            // assign x and set size; assign edge and connector coordinates\r\n            const placeSubgraph = (subgraph, offset) => __awaiter(this, void 0, void 0, function* () {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\"]);\r\n                // place all subgraphs in order to know their size\r\n                const nodes = subgraph.nodes();\r\n                for (let n = 0; n < nodes.length; ++n) {\r\n                    let childOffset = 0;\r\n                    for (let c = 0; c < nodes[n].childGraphs.length; ++c) {\r\n                        const childGraph = nodes[n].childGraphs[c];\r\n                        if (childGraph.numNodes() > 0) {\r\n                            yield placeSubgraph(childGraph, childOffset);\r\n                            childOffset += childGraph.boundingBox().width + this._options.spaceBetweenComponents;\r\n                        }\r\n                    }\r\n                }\r\n                // assign x\r\n                yield this._assignX(subgraph, offset + (subgraph.parentNode !== null ? subgraph.parentNode.padding : 0));\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"changeParentSize\"]);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeConnectors\"]);\r\n                // place connectors\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                    this._placeConnectors(node, rankTops, rankBottoms);\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeConnectors\"]);\r\n                /**\r\n                 * PLACE EDGES\r\n                 * (self-loops handled above)\r\n                 */\r\n                const getInPoint = (node, edge) => {\r\n                    node = (node.isScopeNode ? node.childGraphs[0].entryNode : node);\r\n                    const dstConnector = node.connector(\"IN\", edge.dstConnector);\r\n                    return dstConnector.boundingBox().topCenter();\r\n                };\r\n                const getInProxyPoint = (node, inPoint) => {\r\n                    const proxyPoint = inPoint.clone();\r\n                    proxyPoint.y = rankTops[node.rank];\r\n                    return proxyPoint;\r\n                };\r\n                const getOutPoint = (node, edge) => {\r\n                    node = (node.isScopeNode ? node.childGraphs[0].exitNode : node);\r\n                    const srcConnector = node.connector(\"OUT\", edge.srcConnector);\r\n                    return srcConnector.boundingBox().bottomCenter();\r\n                };\r\n                const getOutProxyPoint = (node, outPoint) => {\r\n                    const proxyPoint = outPoint.clone();\r\n                    proxyPoint.y = rankBottoms[node.rank + node.rankSpan - 1];\r\n                    return proxyPoint;\r\n                };\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\"]);\r\n                // mark nodes that do not need proxies\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"markNoProxies\"]);\r\n                nodeHasInProxies.length = subgraph.maxId() + 1;\r\n                nodeHasOutProxies.length = subgraph.maxId() + 1;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                    nodeHasInProxies[node.id] = true;\r\n                    nodeHasOutProxies[node.id] = true;\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.levelGraph().ranks(), (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (levelNode, pos) => {\r\n                        const node = levelNode.layoutNode;\r\n                        if (node.isVirtual) {\r\n                            return;\r\n                        }\r\n                        let leftBoundary = Number.NEGATIVE_INFINITY;\r\n                        if (pos > 0) {\r\n                            leftBoundary = rank[pos - 1].layoutNode.boundingBox().right();\r\n                        }\r\n                        let rightBoundary = Number.POSITIVE_INFINITY;\r\n                        if (pos < rank.length - 1) {\r\n                            rightBoundary = rank[pos + 1].layoutNode.boundingBox().left();\r\n                        }\r\n                        if (node.graph.numInEdges(node.id) > 0 && node.inConnectorBundles.length === 0 && (!node.isScopeNode || node.childGraphs[0].entryNode.inConnectorBundles.length === 0)) {\r\n                            let minPos = Number.POSITIVE_INFINITY;\r\n                            let maxPos = Number.NEGATIVE_INFINITY;\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.graph.inEdges(node.id), (edge) => {\r\n                                const dstPoint = getInPoint(node, edge);\r\n                                const dstProxyPoint = getInProxyPoint(node, dstPoint);\r\n                                if (dstPoint.y === dstProxyPoint.y) {\r\n                                    return;\r\n                                }\r\n                                const srcPoint = getOutPoint(node.graph.node(edge.src), edge);\r\n                                const intersection = dstPoint.clone().sub(dstPoint.clone().sub(srcPoint).setY(dstPoint.y - dstProxyPoint.y));\r\n                                minPos = Math.min(minPos, intersection.x);\r\n                                maxPos = Math.max(maxPos, intersection.x);\r\n                            });\r\n                            if (minPos > leftBoundary && maxPos < rightBoundary) {\r\n                                nodeHasInProxies[node.id] = false;\r\n                            }\r\n                        }\r\n                        if (node.graph.numOutEdges(node.id) > 0 && node.outConnectorBundles.length === 0 && (!node.isScopeNode || node.childGraphs[0].exitNode.outConnectorBundles.length === 0)) {\r\n                            let minPos = Number.POSITIVE_INFINITY;\r\n                            let maxPos = Number.NEGATIVE_INFINITY;\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.graph.outEdges(node.id), (edge) => {\r\n                                const srcPoint = getOutPoint(node, edge);\r\n                                const srcProxyPoint = getOutProxyPoint(node, srcPoint);\r\n                                if (srcPoint.y === srcProxyPoint.y) {\r\n                                    return;\r\n                                }\r\n                                const dstPoint = getInPoint(node.graph.node(edge.dst), edge);\r\n                                const intersection = srcPoint.clone().add(dstPoint.clone().sub(srcPoint).setY(srcProxyPoint.y - srcPoint.y));\r\n                                minPos = Math.min(minPos, intersection.x);\r\n                                maxPos = Math.max(maxPos, intersection.x);\r\n                            });\r\n                            if (minPos > leftBoundary && maxPos < rightBoundary) {\r\n                                nodeHasOutProxies[node.id] = false;\r\n                            }\r\n                        }\r\n                    });\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"markNoProxies\"]);\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), (edge) => {\r\n                    if (edge.isReplica) {\r\n                        return; // replica edges are added with their primary\r\n                    }\r\n                    let startNode = subgraph.node(edge.src);\r\n                    if (startNode.isVirtual) {\r\n                        return; // do not assign points to this edge\r\n                    }\r\n                    let startHasOutProxies = nodeHasOutProxies[startNode.id];\r\n                    if (startNode.isScopeNode) {\r\n                        startNode = startNode.childGraphs[0].exitNode;\r\n                    }\r\n                    const startPoint = getOutPoint(startNode, edge);\r\n                    const startProxyPoint = (edge.srcBundle !== null ? edge.srcBundle.position() : getOutProxyPoint(startNode, startPoint));\r\n                    edge.points = [startPoint];\r\n                    if (startPoint.y !== startProxyPoint.y) {\r\n                        if (startHasOutProxies) {\r\n                            edge.points.push(startProxyPoint);\r\n                        }\r\n                        else if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(startNode.outConnectors, connector => !connector.isTemporary)) {\r\n                            edge.points.push(startPoint.clone().add(new _geometry_vector__WEBPACK_IMPORTED_MODULE_20__.default(0, _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2)));\r\n                        }\r\n                    }\r\n                    let nextNode = subgraph.node(edge.dst);\r\n                    let tmpEdge = null;\r\n                    while (nextNode.isVirtual || nextNode.isBundle) {\r\n                        const nextPoint = getInPoint(nextNode, edge);\r\n                        const nextInProxyPoint = getInProxyPoint(nextNode, nextPoint);\r\n                        const nextOutProxyPoint = getOutProxyPoint(nextNode, nextPoint);\r\n                        if (nextInProxyPoint.y !== nextPoint.y) {\r\n                            edge.points.push(nextInProxyPoint);\r\n                        }\r\n                        edge.points.push(nextPoint);\r\n                        if (nextOutProxyPoint.y !== nextPoint.y) {\r\n                            edge.points.push(nextOutProxyPoint);\r\n                        }\r\n                        tmpEdge = subgraph.outEdges(nextNode.id)[0];\r\n                        nextNode = subgraph.node(tmpEdge.dst);\r\n                    }\r\n                    let endNode = nextNode;\r\n                    let endHasInProxies = nodeHasInProxies[endNode.id];\r\n                    if (endNode.isScopeNode) {\r\n                        endNode = endNode.childGraphs[0].entryNode;\r\n                    }\r\n                    if (tmpEdge !== null) {\r\n                        edge.dstConnector = tmpEdge.dstConnector;\r\n                    }\r\n                    const endPoint = getInPoint(endNode, edge);\r\n                    const endProxyPoint = (edge.dstBundle !== null ? edge.dstBundle.position() : getInProxyPoint(endNode, endPoint));\r\n                    if (endProxyPoint.y !== endPoint.y) {\r\n                        if (endHasInProxies) {\r\n                            edge.points.push(endProxyPoint);\r\n                        }\r\n                        else if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(endNode.inConnectors, connector => !connector.isTemporary)) {\r\n                            edge.points.push(endPoint.clone().sub(new _geometry_vector__WEBPACK_IMPORTED_MODULE_20__.default(0, _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2)));\r\n                        }\r\n                    }\r\n                    edge.points.push(endPoint);\r\n                    // redirect edge from start to end\r\n                    if (tmpEdge !== null) {\r\n                        edge.graph.removeEdge(edge.id);\r\n                        edge.dst = tmpEdge.dst;\r\n                        edge.graph.addEdge(edge, edge.id);\r\n                    }\r\n                    // place replicas\r\n                    if (edge.srcBundle !== null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.srcBundle.edges, (bundleEdge) => {\r\n                            if (bundleEdge.isReplica) {\r\n                                bundleEdge.points = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(edge.points);\r\n                                bundleEdge.points[0] = getOutPoint(startNode, bundleEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                    if (edge.dstBundle !== null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.dstBundle.edges, (bundleEdge) => {\r\n                            if (bundleEdge.isReplica) {\r\n                                bundleEdge.points = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(edge.points);\r\n                                bundleEdge.points[bundleEdge.points.length - 1] = getInPoint(endNode, bundleEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"removeVirtual\"]);\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.clone(subgraph.nodes()), (node) => {\r\n                    // remove virtual nodes and edges\r\n                    if (node.isVirtual) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.inEdgesIds(node.id), (inEdgeId) => {\r\n                            subgraph.removeEdge(inEdgeId);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.outEdgesIds(node.id), (outEdgeId) => {\r\n                            subgraph.removeEdge(outEdgeId);\r\n                        });\r\n                        subgraph.removeNode(node.id);\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"removeVirtual\"]);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\"]);\r\n                // mark crossings for later angle optimization\r\n                if (this._options.optimizeAngles) {\r\n                    this._markCrossings(subgraph, segmentsPerRank, crossingsPerRank, rankTops, rankBottoms);\r\n                }\r\n                // set parent bounding box on last component\r\n                const parent = subgraph.parentNode;\r\n                if (parent !== null && subgraph === lodash__WEBPACK_IMPORTED_MODULE_2__.last(parent.childGraphs)) {\r\n                    let width = 0;\r\n                    let height = 0;\r\n                    let boundingBox;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.childGraphs, (childGraph) => {\r\n                        boundingBox = childGraph.boundingBox();\r\n                        if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                            _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(boundingBox.width, \"boundingBox has invalid width\");\r\n                        }\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(parent.outConnectors, connector => !connector.isTemporary)) {\r\n                            boundingBox.height -= _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        }\r\n                        width += boundingBox.width + this._options.spaceBetweenComponents;\r\n                        height = Math.max(height, boundingBox.height);\r\n                    });\r\n                    width += 2 * parent.padding - this._options.spaceBetweenComponents;\r\n                    if (parent.selfLoop !== null) {\r\n                        // add space for self loop on right side\r\n                        width += this._options.targetEdgeLength;\r\n                    }\r\n                    height += 2 * subgraph.parentNode.padding;\r\n                    parent.updateSize({ width: width, height: height });\r\n                    if (parent.isScopeNode) {\r\n                        const left = boundingBox.x;\r\n                        subgraph.entryNode.setWidth(boundingBox.width);\r\n                        subgraph.entryNode.setPosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_20__.default(left, subgraph.entryNode.y));\r\n                        subgraph.exitNode.setWidth(boundingBox.width);\r\n                        subgraph.exitNode.setPosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_20__.default(left, subgraph.exitNode.y));\r\n                    }\r\n                }\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"changeParentSize\"]);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\"]);\r\n            });\r\n            yield placeSubgraph(graph, 0);\r\n        });\r\n    }\r\n    _assignX(subgraph, offset = 0) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"getRanks\"]);\r\n            const levelGraph = subgraph.levelGraph();\r\n            const ranks = levelGraph.ranks();\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"getRanks\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\"]);\r\n            let xAssignments;\r\n            if (this._options.webWorkers && this._options.maxWorkers >= 4) {\r\n                let numNodesPerRank, levelNodes, levelEdges;\r\n                const numNodesPerRankBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * ranks.length);\r\n                numNodesPerRank = new Int32Array(numNodesPerRankBuf);\r\n                const levelNodesBuf = new this._bufferClass(Float64Array.BYTES_PER_ELEMENT * 4 * levelGraph.numNodes());\r\n                levelNodes = new Float64Array(levelNodesBuf);\r\n                const levelEdgesBuf = new this._bufferClass(Float64Array.BYTES_PER_ELEMENT * 3 * levelGraph.numEdges());\r\n                levelEdges = new Float64Array(levelEdgesBuf);\r\n                let n = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank, r) => {\r\n                    numNodesPerRank[r] = rank.length;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (node) => {\r\n                        levelNodes[n++] = node.id;\r\n                        levelNodes[n++] = node.layoutNode.width;\r\n                        levelNodes[n++] = node.isFirst;\r\n                        levelNodes[n++] = node.isLast;\r\n                    });\r\n                });\r\n                let e = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), (edge) => {\r\n                    levelEdges[e++] = edge.src;\r\n                    levelEdges[e++] = edge.dst;\r\n                    levelEdges[e++] = edge.weight;\r\n                });\r\n                xAssignments = yield Promise.all([\r\n                    this._pool.exec(\"alignMedian\", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, \"UP\", \"LEFT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, \"UP\", \"RIGHT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, \"DOWN\", \"LEFT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, \"DOWN\", \"RIGHT\", this._options.spaceBetweenNodes])[1],\r\n                ]);\r\n            }\r\n            else {\r\n                xAssignments = ([\r\n                    this._alignMedian(levelGraph, \"UP\", \"LEFT\"),\r\n                    this._alignMedian(levelGraph, \"UP\", \"RIGHT\"),\r\n                    this._alignMedian(levelGraph, \"DOWN\", \"LEFT\"),\r\n                    this._alignMedian(levelGraph, \"DOWN\", \"RIGHT\"),\r\n                ]);\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\"]);\r\n            // align left-most and right-most nodes\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"merge\"]);\r\n            let minMaxX = Number.POSITIVE_INFINITY;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(xAssignments, (xAssignment) => {\r\n                minMaxX = Math.min(minMaxX, lodash__WEBPACK_IMPORTED_MODULE_2__.max(xAssignment));\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach([1, 3], (i) => {\r\n                const xAssignment = xAssignments[i];\r\n                const maxX = lodash__WEBPACK_IMPORTED_MODULE_2__.max(xAssignment);\r\n                if (maxX === minMaxX) {\r\n                    return; // no need to adjust this graph\r\n                }\r\n                const diff = minMaxX - maxX;\r\n                for (let i = 0; i < xAssignment.length; ++i) {\r\n                    xAssignment[i] += diff;\r\n                }\r\n            });\r\n            let minX = Number.POSITIVE_INFINITY;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n                if (node.isFirst) {\r\n                    const xs = lodash__WEBPACK_IMPORTED_MODULE_2__.map(xAssignments, xAssignment => xAssignment[node.id]);\r\n                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(xs).asc();\r\n                    let x = (xs[1] + xs[2]) / 2;\r\n                    //x = xs[0]; // comment inPlaceSort and uncomment this line to see 1 of the 4 merged layouts\r\n                    x -= node.layoutNode.width / 2;\r\n                    minX = Math.min(minX, x);\r\n                    node.x = offset + x;\r\n                }\r\n            });\r\n            const diff = 0 - minX;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n                if (node.isFirst) {\r\n                    node.x += diff;\r\n                    node.layoutNode.updatePosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_20__.default(node.x, node.layoutNode.y));\r\n                }\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"merge\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\"]);\r\n        });\r\n    }\r\n    _alignMedian(levelGraph, neighborDir, preference) {\r\n        const ranks = levelGraph.ranks();\r\n        const firstRank = (neighborDir === \"UP\" ? 1 : (ranks.length - 2));\r\n        const lastRank = (neighborDir === \"UP\" ? (ranks.length - 1) : 0);\r\n        const verticalDir = (neighborDir === \"UP\" ? 1 : -1);\r\n        const neighborOutMethod = (neighborDir === \"UP\" ? \"outEdges\" : \"inEdges\");\r\n        const neighborInMethod = (neighborDir === \"UP\" ? \"inEdges\" : \"outEdges\");\r\n        const neighborEdgeInAttr = (neighborDir === \"UP\" ? \"dst\" : \"src\");\r\n        const blockPerNode = new Array(levelGraph.maxId() + 1);\r\n        const nodesPerBlock = new Array(levelGraph.maxId() + 1);\r\n        const blockWidths = new Array(levelGraph.maxId() + 1);\r\n        const blockGraph = new _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__.default();\r\n        const maxWidth = levelGraph.maxWidth();\r\n        const neighbors = new Array(maxWidth);\r\n        const neighborsUsable = new Array(maxWidth);\r\n        for (let n = 0; n < maxWidth; ++n) {\r\n            neighbors[n] = [];\r\n            neighborsUsable[n] = [];\r\n        }\r\n        // every node of the first rank is a block on its own\r\n        const r = firstRank - verticalDir;\r\n        let blockId = 0;\r\n        for (let n = 0; n < ranks[r].length; ++n) {\r\n            blockGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(blockId.toString()));\r\n            blockPerNode[ranks[r][n].id] = blockId;\r\n            nodesPerBlock[blockId] = [ranks[r][n].id];\r\n            blockWidths[blockId] = ranks[r][n].layoutNode.width;\r\n            blockId++;\r\n        }\r\n        for (let n = 1; n < ranks[r].length; ++n) {\r\n            const edgeLength = (ranks[r][n - 1].layoutNode.width + ranks[r][n].layoutNode.width) / 2 + this._options.spaceBetweenNodes;\r\n            blockGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));\r\n        }\r\n        for (let r = firstRank; r - verticalDir !== lastRank; r += verticalDir) {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"createNeighborList\"]);\r\n            // create sorted list of neighbors\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r], (node, n) => {\r\n                neighbors[n].length = 0;\r\n                neighborsUsable[n].length = 0;\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r - verticalDir], (neighbor, n) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph[neighborOutMethod](neighbor.id), (edge) => {\r\n                    const node = levelGraph.node(edge[neighborEdgeInAttr]);\r\n                    neighbors[node.position].push(n);\r\n                });\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"createNeighborList\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"markConflicts\"]);\r\n            // mark segments that cross a heavy segment as non-usable\r\n            let heavyLeft = -1;\r\n            let n = 0;\r\n            for (let tmpN = 0; tmpN < ranks[r].length; ++tmpN) {\r\n                const hasHeavy = lodash__WEBPACK_IMPORTED_MODULE_2__.some(levelGraph[neighborInMethod](ranks[r][tmpN].id), edge => edge.weight === Number.POSITIVE_INFINITY);\r\n                if (tmpN === ranks[r].length - 1 || hasHeavy) {\r\n                    let heavyRight = ranks[r - verticalDir].length;\r\n                    if (hasHeavy) {\r\n                        heavyRight = neighbors[tmpN][0];\r\n                    }\r\n                    while (n <= tmpN) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[n], (neighborPos, neighborIndex) => {\r\n                            neighborsUsable[n][neighborIndex] = neighborPos >= heavyLeft && neighborPos <= heavyRight;\r\n                        });\r\n                        n++;\r\n                    }\r\n                    heavyLeft = heavyRight;\r\n                }\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"markConflicts\"]);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"findNeighbor\"]);\r\n            let maxNeighborTaken = (preference === \"LEFT\" ? Number.NEGATIVE_INFINITY : Number.POSITIVE_INFINITY);\r\n            const compare = (preference === \"LEFT\" ? ((a, b) => a < b) : ((a, b) => a > b));\r\n            const nMin = (preference === \"LEFT\" ? 0 : ranks[r].length - 1);\r\n            const nMax = (preference === \"LEFT\" ? ranks[r].length - 1 : 0);\r\n            const horizontalDir = (preference === \"LEFT\" ? 1 : -1);\r\n            for (let n = nMin; n - horizontalDir !== nMax; n += horizontalDir) {\r\n                let neighbor = null;\r\n                if (neighbors[n].length > 0) {\r\n                    const leftMedian = Math.floor((neighbors[n].length - 1) / 2);\r\n                    const rightMedian = Math.floor((neighbors[n].length) / 2);\r\n                    const tryOrder = (preference === \"LEFT\" ? [leftMedian, rightMedian] : [rightMedian, leftMedian]);\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tryOrder, (neighborIndex) => {\r\n                        if (neighbor !== null) {\r\n                            return; // already found\r\n                        }\r\n                        if (neighborsUsable[n][neighborIndex] && compare(maxNeighborTaken, neighbors[n][neighborIndex])) {\r\n                            neighbor = ranks[r - verticalDir][neighbors[n][neighborIndex]];\r\n                            maxNeighborTaken = neighbors[n][neighborIndex];\r\n                        }\r\n                    });\r\n                }\r\n                if (neighbor === null) {\r\n                    blockGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(blockId.toString()));\r\n                    blockPerNode[ranks[r][n].id] = blockId;\r\n                    nodesPerBlock[blockId] = [ranks[r][n].id];\r\n                    blockWidths[blockId] = ranks[r][n].layoutNode.width;\r\n                    blockId++;\r\n                }\r\n                else {\r\n                    const blockId = blockPerNode[neighbor.id];\r\n                    blockPerNode[ranks[r][n].id] = blockId;\r\n                    nodesPerBlock[blockId].push(ranks[r][n].id);\r\n                    blockWidths[blockId] = Math.max(blockWidths[blockId], ranks[r][n].layoutNode.width);\r\n                }\r\n            }\r\n            for (let n = 1; n < ranks[r].length; ++n) {\r\n                const edgeLength = (ranks[r][n - 1].layoutNode.width + ranks[r][n].layoutNode.width) / 2 + this._options.spaceBetweenNodes;\r\n                blockGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"findNeighbor\"]);\r\n        }\r\n        const xAssignment = new Array(levelGraph.maxId() + 1);\r\n        // compact\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.start([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"rank\"]);\r\n        blockGraph.rank();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n            xAssignment[node.id] = blockGraph.node(blockPerNode[node.id]).rank;\r\n        });\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_19__.default.stop([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"rank\"]);\r\n        return xAssignment;\r\n    }\r\n    _placeConnectors(node, rankTops, rankBottoms) {\r\n        if (node.inConnectors.length === 0 && node.outConnectors.length === 0) {\r\n            return; // no connectors\r\n        }\r\n        let tmpInConnectors = [];\r\n        let tmpOutConnectors = [];\r\n        const SPACE = _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n        const SIZE = _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE;\r\n        const inY = node.y - SIZE / 2;\r\n        const outY = node.y + node.height - SIZE / 2;\r\n        let inPointer = 0;\r\n        let outPointer = 0;\r\n        let x = node.x;\r\n        /**\r\n         * Places simple in- and out-connectors between tunnel connectors\r\n         * @param x\r\n         * @param tmpInConnectors\r\n         * @param tmpOutConnectors\r\n         */\r\n        const placeTmpConnectors = (x, tmpInConnectors, tmpOutConnectors) => {\r\n            let length = Math.max(tmpInConnectors.length, tmpOutConnectors.length) * (SIZE + SPACE) - SPACE;\r\n            let inSpace = SPACE;\r\n            let inOffset = 0;\r\n            if (tmpInConnectors.length < tmpOutConnectors.length) {\r\n                inSpace = (length - (tmpInConnectors.length * SIZE)) / (tmpInConnectors.length + 1);\r\n                inOffset = inSpace;\r\n            }\r\n            let outSpace = SPACE;\r\n            let outOffset = 0;\r\n            if (tmpOutConnectors.length < tmpInConnectors.length) {\r\n                outSpace = (length - (tmpOutConnectors.length * SIZE)) / (tmpOutConnectors.length + 1);\r\n                outOffset = outSpace;\r\n            }\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpInConnectors, (connector, i) => {\r\n                connector.x = x + inOffset + i * (inSpace + SIZE);\r\n                connector.y = inY;\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpOutConnectors, (connector, i) => {\r\n                connector.x = x + outOffset + i * (outSpace + SIZE);\r\n                connector.y = outY;\r\n            });\r\n            return x + length + SPACE;\r\n        };\r\n        while (inPointer < node.inConnectors.length || outPointer < node.outConnectors.length) {\r\n            if (inPointer === node.inConnectors.length) {\r\n                // only out connectors left\r\n                tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n            }\r\n            else if (outPointer === node.outConnectors.length) {\r\n                // only in connectors left\r\n                tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n            }\r\n            else {\r\n                let scoped = false;\r\n                if (node.inConnectors[inPointer].isScoped) {\r\n                    scoped = true;\r\n                    while (!node.outConnectors[outPointer].isScoped) {\r\n                        tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n                    }\r\n                }\r\n                else if (node.outConnectors[outPointer].isScoped) {\r\n                    scoped = true;\r\n                    while (!node.inConnectors[inPointer].isScoped) {\r\n                        tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n                    }\r\n                }\r\n                else {\r\n                    tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n                    tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n                }\r\n                if (scoped) {\r\n                    x = placeTmpConnectors(x, tmpInConnectors, tmpOutConnectors);\r\n                    let scopedConnectorIn = node.inConnectors[inPointer++];\r\n                    scopedConnectorIn.x = x;\r\n                    scopedConnectorIn.y = inY;\r\n                    let scopedConnectorOut = node.outConnectors[outPointer++];\r\n                    scopedConnectorOut.x = x;\r\n                    scopedConnectorOut.y = outY;\r\n                    x += SIZE + SPACE;\r\n                    tmpInConnectors = [];\r\n                    tmpOutConnectors = [];\r\n                }\r\n            }\r\n        }\r\n        placeTmpConnectors(x, tmpInConnectors, tmpOutConnectors);\r\n        let auxBox = new _geometry_box__WEBPACK_IMPORTED_MODULE_5__.default(node.x, node.y, Math.max(node.inConnectors.length, node.outConnectors.length) * (SPACE + SIZE) - SPACE, SIZE).centerIn(node.boundingBox());\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.connectors(), (connector) => {\r\n            connector.translate(auxBox.x - node.x + (connector.isTemporary ? SPACE / 2 : 0), connector.isTemporary ? SPACE / 2 : 0);\r\n        });\r\n        // place bundles\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.inConnectorBundles, (inBundle) => {\r\n            const top = rankTops[node.rank];\r\n            inBundle.y = Math.min(top, node.y - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2 - this._options.targetEdgeLength / 3);\r\n            inBundle.x = lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(inBundle.connectors, (name) => node.connector(\"IN\", name).x)) + SIZE / 2;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.outConnectorBundles, (outBundle) => {\r\n            const bottom = rankBottoms[node.rank + node.rankSpan - 1];\r\n            outBundle.y = Math.max(bottom, node.y + node.height + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2 + this._options.targetEdgeLength / 3);\r\n            outBundle.x = lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(outBundle.connectors, (name) => node.connector(\"OUT\", name).x)) + SIZE / 2;\r\n        });\r\n    }\r\n    _markCrossings(subgraph, segmentsPerRank, crossingsPerRank, rankTops, rankBottoms) {\r\n        const endpointsPerRank = new Array(rankTops.length);\r\n        for (let r = 1; r < rankTops.length; ++r) {\r\n            endpointsPerRank[r] = [];\r\n        }\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.rawSegments(), (segment) => {\r\n                let startRank = lodash__WEBPACK_IMPORTED_MODULE_2__.sortedIndex(rankBottoms, segment.start.y);\r\n                if ((startRank < rankTops.length - 1) && (segment.end.y >= rankTops[startRank + 1])) {\r\n                    let start = segment.start.clone();\r\n                    if (segment.start.y < rankBottoms[startRank]) {\r\n                        start.add(segment.vector().setY(rankBottoms[startRank] - segment.start.y));\r\n                    }\r\n                    let end = segment.end.clone();\r\n                    if (segment.end.y > rankTops[startRank + 1]) {\r\n                        end = start.clone().add(segment.vector().setY(this._options.targetEdgeLength));\r\n                    }\r\n                    segment = new _geometry_segment__WEBPACK_IMPORTED_MODULE_17__.default(start, end);\r\n                    endpointsPerRank[startRank + 1].push([segment.start, segment]);\r\n                    endpointsPerRank[startRank + 1].push([segment.end, segment]);\r\n                    segmentsPerRank[startRank + 1].push(segment);\r\n                }\r\n            });\r\n        });\r\n        for (let r = 1; r < rankTops.length; ++r) {\r\n            const pointsSorted = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(endpointsPerRank[r], ([point, segment]) => point.x); // sort by x\r\n            const openSegments = new Set();\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(pointsSorted, ([point, segment]) => {\r\n                if (openSegments.has(segment)) {\r\n                    openSegments.delete(segment);\r\n                }\r\n                else {\r\n                    openSegments.forEach((otherSegment) => {\r\n                        if ((segment.start.x !== otherSegment.start.x) && (segment.end.x !== otherSegment.end.x) &&\r\n                            (Math.sign(segment.start.x - otherSegment.start.x) !== Math.sign(segment.end.x - otherSegment.end.x))) {\r\n                            crossingsPerRank[r].push([segment, otherSegment]);\r\n                        }\r\n                    });\r\n                    openSegments.add(segment);\r\n                }\r\n            });\r\n        }\r\n    }\r\n    _optimizeAngles(layoutGraph, rankTops, segmentsPerRank, crossingsPerRank) {\r\n        const forces = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(crossingsPerRank, (crossings, r) => {\r\n            if (crossings.length > 0) {\r\n                const deltaXs = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(crossings, ([segmentA, segmentB]) => {\r\n                    const vectorA = segmentA.vector();\r\n                    const vectorB = segmentB.vector();\r\n                    deltaXs.push([vectorA.x, vectorB.x]);\r\n                });\r\n                const allDeltaXsSquared = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(segmentsPerRank[r], (segment) => {\r\n                    const vector = segment.vector();\r\n                    allDeltaXsSquared.push(vector.x * vector.x);\r\n                });\r\n                let min = this._options.targetEdgeLength / 2;\r\n                let max = 2 * this._options.targetEdgeLength;\r\n                let minCost = Number.POSITIVE_INFINITY;\r\n                let best;\r\n                for (let deltaY = min; deltaY <= max; ++deltaY) {\r\n                    let cost = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(deltaXs, ([deltaXA, deltaXB]) => {\r\n                        const angle = Math.atan2(deltaY, deltaXA) - Math.atan2(deltaY, deltaXB);\r\n                        cost += this._options.weightCrossings * (Math.cos(2 * angle) + 1) / 2;\r\n                    });\r\n                    const deltaYSquared = deltaY * deltaY;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(allDeltaXsSquared, deltaXSquared => {\r\n                        cost += this._options.weightLengths * Math.sqrt(deltaYSquared + deltaXSquared) / this._options.targetEdgeLength;\r\n                    });\r\n                    if (cost < minCost) {\r\n                        minCost = cost;\r\n                        best = deltaY;\r\n                    }\r\n                }\r\n                const diff = best - this._options.targetEdgeLength;\r\n                if (diff >= 1) {\r\n                    forces.push([rankTops[r] - 1, diff]);\r\n                }\r\n            }\r\n        });\r\n        const points = [];\r\n        const oldTops = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutGraph.allNodes(), (node) => {\r\n            points.push([node.y, \"NODE\", node, \"TOP\"]);\r\n            points.push([node.y + node.height, \"NODE\", node, \"BOTTOM\"]);\r\n            oldTops.set(node, node.y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.points, (point, i) => {\r\n                points.push([point.y, \"EDGE\", edge, i]);\r\n            });\r\n        });\r\n        const pointsSorted = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(points, \"0\"); // sort by y\r\n        let forcePointer = 0;\r\n        let totalForce = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(pointsSorted, ([pointY, type, object, position]) => {\r\n            while (forcePointer < forces.length && forces[forcePointer][0] < pointY) {\r\n                totalForce += forces[forcePointer][1];\r\n                forcePointer++;\r\n            }\r\n            if (type === \"NODE\") {\r\n                if (position === \"TOP\") {\r\n                    object.translateWithoutChildren(0, totalForce);\r\n                }\r\n                else { // \"BOTTOM\"\r\n                    const oldHeight = object.height;\r\n                    // new height = old height + total force + old top - new top\r\n                    object.height += totalForce + oldTops.get(object) - object.y;\r\n                    const heightDiff = object.height - oldHeight;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(object.outConnectors, (connector) => {\r\n                        connector.y += heightDiff;\r\n                    });\r\n                }\r\n            }\r\n            else { // \"EDGE\"\r\n                object.points[position].y += totalForce;\r\n            }\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/sugiyamaLayouter.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SugiyamaLayouter)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! seedrandom */ \"./node_modules/seedrandom/index.js\");\n/* harmony import */ var seedrandom__WEBPACK_IMPORTED_MODULE_3___default = /*#__PURE__*/__webpack_require__.n(seedrandom__WEBPACK_IMPORTED_MODULE_3__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _layouter__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ./layouter */ \"./src/layouter/layouter.ts\");\n/* harmony import */ var _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../layoutGraph/layoutEdge */ \"./src/layoutGraph/layoutEdge.ts\");\n/* harmony import */ var _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../layoutGraph/layoutNode */ \"./src/layoutGraph/layoutNode.ts\");\n/* harmony import */ var _levelGraph_levelNode__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../levelGraph/levelNode */ \"./src/levelGraph/levelNode.ts\");\n/* harmony import */ var _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../order/orderGraph */ \"./src/order/orderGraph.ts\");\n/* harmony import */ var _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../order/orderGroup */ \"./src/order/orderGroup.ts\");\n/* harmony import */ var _order_orderNode__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! ../order/orderNode */ \"./src/order/orderNode.ts\");\n/* harmony import */ var _order_orderRank__WEBPACK_IMPORTED_MODULE_14__ = __webpack_require__(/*! ../order/orderRank */ \"./src/order/orderRank.ts\");\n/* harmony import */ var _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__ = __webpack_require__(/*! ../rank/rankGraph */ \"./src/rank/rankGraph.ts\");\n/* harmony import */ var _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__ = __webpack_require__(/*! ../rank/rankNode */ \"./src/rank/rankNode.ts\");\n/* harmony import */ var _geometry_segment__WEBPACK_IMPORTED_MODULE_17__ = __webpack_require__(/*! ../geometry/segment */ \"./src/geometry/segment.ts\");\n/* harmony import */ var _geometry_segmentGrid__WEBPACK_IMPORTED_MODULE_18__ = __webpack_require__(/*! ../geometry/segmentGrid */ \"./src/geometry/segmentGrid.ts\");\n/* harmony import */ var _util_shuffle__WEBPACK_IMPORTED_MODULE_19__ = __webpack_require__(/*! ../util/shuffle */ \"./src/util/shuffle.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_20__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_21__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _wasm_wasm__WEBPACK_IMPORTED_MODULE_22__ = __webpack_require__(/*! ../wasm/wasm */ \"./src/wasm/wasm.ts\");\n/* harmony import */ var _util_workerPool__WEBPACK_IMPORTED_MODULE_23__ = __webpack_require__(/*! ../util/workerPool */ \"./src/util/workerPool.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nconst TIMER_DO_LAYOUT = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\"]);\r\nconst TIMER_ADD_VIRTUAL_NODES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"addVirtualNodes\"]);\r\nconst TIMER_ASSIGN_COORDINATES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\"]);\r\nconst TIMER_ASSIGN_Y = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"assignY\"]);\r\nconst TIMER_PLACE_SUBGRAPH = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\"]);\r\nconst TIMER_ASSIGN_X = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\"]);\r\nconst TIMER_ALIGN_MEDIAN = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\"]);\r\nconst TIMER_CREATE_NEIGHBOR_LIST = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"createNeighborList\"]);\r\nconst TIMER_FIND_NEIGHBOR = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"findNeighbor\"]);\r\nconst TIMER_MARK_CONFLICTS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"markConflicts\"]);\r\nconst TIMER_RANK = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"alignMedian\", \"rank\"]);\r\nconst TIMER_GET_RANKS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"getRanks\"]);\r\nconst TIMER_MERGE = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"assignX\", \"merge\"]);\r\nconst TIMER_CHANGE_PARENT_SIZE = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"changeParentSize\"]);\r\nconst TIMER_PLACE_CONNECTORS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeConnectors\"]);\r\nconst TIMER_PLACE_EDGES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\"]);\r\nconst TIMER_MARK_NO_PROXIES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"markNoProxies\"]);\r\nconst TIMER_REMOVE_VIRTUAL = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignCoordinates\", \"placeSubgraph\", \"placeEdges\", \"removeVirtual\"]);\r\nconst TIMER_ASSIGN_RANKS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"assignRanks\"]);\r\nconst TIMER_OPTIMIZE_ANGLES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"optimizeAngles\"]);\r\nconst TIMER_ORDER_RANKS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\"]);\r\nconst TIMER_DO_ORDER = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\"]);\r\nconst TIMER_INSERT_NODES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"insertNodes\"]);\r\nconst TIMER_ORDER_CONNECTORS = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderConnectors\"]);\r\nconst TIMER_ORDER_NODES = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"orderNodes\"]);\r\nconst TIMER_PREORDER = _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"preorder\"]);\r\nclass SugiyamaLayouter extends _layouter__WEBPACK_IMPORTED_MODULE_7__.default {\r\n    constructor(options = {}) {\r\n        super(options);\r\n        this._pool = null;\r\n        this._options = lodash__WEBPACK_IMPORTED_MODULE_2__.defaults(options, this._options, {\r\n            jointOrder: true,\r\n            compactRanks: true,\r\n            numShuffles: 0,\r\n            optimizeAngles: false,\r\n            bundle: false,\r\n            spaceBetweenComponents: 50,\r\n            webAssembly: false,\r\n            webWorkers: false,\r\n            maxWorkers: (typeof (navigator) !== \"undefined\" ? (navigator.hardwareConcurrency - 1) : 0),\r\n            sharedArrayBuffer: false,\r\n            keepWorkers: true,\r\n        });\r\n        if (this._options.webWorkers && this._options.maxWorkers > 0) {\r\n            let workerPath = '/worker/worker.js';\r\n            let layouterDirPos = window.location.href.indexOf(_util_constants__WEBPACK_IMPORTED_MODULE_0__.ROOT_DIR);\r\n            if (layouterDirPos > -1) {\r\n                workerPath = window.location.href.substr(0, layouterDirPos + _util_constants__WEBPACK_IMPORTED_MODULE_0__.ROOT_DIR.length) + '/worker/worker.js';\r\n            }\r\n            this._pool = _util_workerPool__WEBPACK_IMPORTED_MODULE_23__.default.get(workerPath, Math.min(Math.max(this._options.numShuffles, 4), this._options.maxWorkers), this);\r\n        }\r\n        if (this._options.webAssembly) {\r\n            let wasmPath = '/wasm/countCrossings.js';\r\n            let layouterDirPos = window.location.href.indexOf('npg-dag-layout');\r\n            if (layouterDirPos > -1) {\r\n                wasmPath = window.location.href.substr(0, layouterDirPos + 'npg-dag-layout'.length) + '/wasm/countCrossings.js';\r\n            }\r\n            try {\r\n                this._wasm = new _wasm_wasm__WEBPACK_IMPORTED_MODULE_22__.default(wasmPath, this);\r\n            }\r\n            catch (e) {\r\n                this._wasm = null;\r\n            }\r\n        }\r\n        if (this._options.sharedArrayBuffer && typeof (SharedArrayBuffer) === \"undefined\") {\r\n            this._options.sharedArrayBuffer = false;\r\n        }\r\n        this._bufferClass = this._options.sharedArrayBuffer ? SharedArrayBuffer : ArrayBuffer;\r\n    }\r\n    /**\r\n     * Gives back the worker pool; unless keepWorkers is disabled, its workers stay alive for the next layouter.\r\n     */\r\n    cleanUp() {\r\n        if (this._pool !== null) {\r\n            this._pool.release(this._options.keepWorkers);\r\n            this._pool = null;\r\n        }\r\n    }\r\n    ready() {\r\n        return (this._pool !== null ? this._pool.ready() : Promise.resolve());\r\n    }\r\n    disableWasm() {\r\n        this._wasm = null;\r\n    }\r\n    disableWorkers() {\r\n        this._options[\"webWorkers\"] = false;\r\n    }\r\n    doLayout(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (graph.numNodes() === 0) {\r\n                return;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_DO_LAYOUT);\r\n            // STEP 1: ASSIGN RANKS\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ASSIGN_RANKS);\r\n            this._assignRanks(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ASSIGN_RANKS);\r\n            // STEP 2: ADD VIRTUAL NODES\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ADD_VIRTUAL_NODES);\r\n            this._addVirtualNodes(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ADD_VIRTUAL_NODES);\r\n            // STEP 3: ORDER RANKS\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ORDER_RANKS);\r\n            yield this._orderRanks(graph);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ORDER_RANKS);\r\n            // STEP 4: ASSIGN COORDINATES & REMOVE VIRTUAL NODES\r\n            const rankTops = [];\r\n            const segmentsPerRank = [];\r\n            const crossingsPerRank = [];\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ASSIGN_COORDINATES);\r\n            yield this._assignCoordinates(graph, rankTops, segmentsPerRank, crossingsPerRank);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ASSIGN_COORDINATES);\r\n            // STEP 5 (OPTIONAL): OPTIMIZE ANGLES\r\n            if (this._options.optimizeAngles) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_OPTIMIZE_ANGLES);\r\n                this._optimizeAngles(graph, rankTops, segmentsPerRank, crossingsPerRank);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_OPTIMIZE_ANGLES);\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_DO_LAYOUT);\r\n        });\r\n    }\r\n    _assignRanks(graph) {\r\n        const assignRanksForSubgraph = (subgraph) => {\r\n            if (subgraph.numNodes() === 0) {\r\n                return; // do nothing for empty subgraphs\r\n            }\r\n            // first determine the rank span of all nodes\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                    assignRanksForSubgraph(childGraph);\r\n                });\r\n            });\r\n            const rankGraph = new _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__.default();\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), node => {\r\n                rankGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(node.label()), node.id);\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), edge => {\r\n                rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(edge.src, edge.dst, subgraph.node(edge.src).rankSpan));\r\n            });\r\n            rankGraph.rank();\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), node => {\r\n                node.rank = rankGraph.node(node.id).rank;\r\n                subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan);\r\n            });\r\n            if (subgraph.parentNode !== null && this._options.compactRanks) {\r\n                subgraph.parentNode.rankSpan = Math.max(subgraph.parentNode.rankSpan, subgraph.numRanks);\r\n            }\r\n        };\r\n        assignRanksForSubgraph(graph);\r\n        // transform ranking from local to global\r\n        const makeRanksAbsoluteCompact = (subgraph, offset) => {\r\n            subgraph.minRank = offset;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                node.rank += offset;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                    makeRanksAbsoluteCompact(childGraph, node.rank);\r\n                });\r\n                subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan - subgraph.minRank);\r\n            });\r\n        };\r\n        const makeRanksAbsolute = (subgraph, offset) => {\r\n            subgraph.minRank = offset;\r\n            let newRanks = 0;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.ranks(), (rank) => {\r\n                let maxChild = 1;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (node) => {\r\n                    node.rank += offset + newRanks;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                        makeRanksAbsolute(childGraph, node.rank);\r\n                        node.rankSpan = Math.max(node.rankSpan, childGraph.numRanks);\r\n                        maxChild = Math.max(maxChild, node.rankSpan);\r\n                    });\r\n                    subgraph.numRanks = Math.max(subgraph.numRanks, node.rank + node.rankSpan - subgraph.minRank);\r\n                });\r\n                newRanks += maxChild - 1;\r\n            });\r\n        };\r\n        if (this._options.compactRanks) {\r\n            makeRanksAbsoluteCompact(graph, 0);\r\n        }\r\n        else {\r\n            makeRanksAbsolute(graph, 0);\r\n        }\r\n    }\r\n    _addVirtualNodes(graph, addToLevelGraph = false) {\r\n        // place intermediate nodes between long edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allEdges(), (edge) => {\r\n            if (edge.isReplica) {\r\n                return;\r\n            }\r\n            let srcNode = edge.graph.node(edge.src);\r\n            let dstNode = edge.graph.node(edge.dst);\r\n            if (srcNode.rank + srcNode.rankSpan < dstNode.rank) {\r\n                let tmpSrcId = srcNode.id;\r\n                let tmpDstId;\r\n                const dstConnector = edge.dstConnector;\r\n                let bundle = ((edge.srcBundle !== null) && (edge.srcBundle.edges.length > 1));\r\n                for (let tmpDstRank = srcNode.rank + srcNode.rankSpan; tmpDstRank < dstNode.rank; ++tmpDstRank) {\r\n                    const newNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, !bundle, bundle);\r\n                    bundle = ((edge.dstBundle !== null) && (edge.dstBundle.edges.length > 1) && (tmpDstRank === dstNode.rank - 2));\r\n                    newNode.rank = tmpDstRank;\r\n                    tmpDstId = edge.graph.addNode(newNode, null);\r\n                    if (addToLevelGraph) {\r\n                        const levelNode = newNode.graph.levelGraph().addLayoutNode(newNode);\r\n                        levelNode.position = lodash__WEBPACK_IMPORTED_MODULE_2__.last(srcNode.levelNodes).position;\r\n                    }\r\n                    if (tmpDstRank === srcNode.rank + srcNode.rankSpan) {\r\n                        // original edge is redirected from source to first virtual node\r\n                        edge.graph.redirectEdge(edge.id, edge.src, tmpDstId);\r\n                        edge.dstConnector = null;\r\n                        // add bundle edges\r\n                        if (edge.srcBundle !== null && edge.srcBundle.edges.length > 1) {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.srcBundle.edges, (bundleEdge) => {\r\n                                if (bundleEdge.isReplica) {\r\n                                    bundleEdge.graph.redirectEdge(bundleEdge.id, bundleEdge.src, tmpDstId);\r\n                                }\r\n                            });\r\n                        }\r\n                        if (addToLevelGraph) {\r\n                            const levelEdge = edge.graph.levelGraph().edgeBetween(lodash__WEBPACK_IMPORTED_MODULE_2__.last(srcNode.levelNodes).id, lodash__WEBPACK_IMPORTED_MODULE_2__.first(dstNode.levelNodes).id);\r\n                            if (levelEdge !== undefined) {\r\n                                levelEdge.graph.removeEdge(levelEdge.id);\r\n                            }\r\n                            edge.graph.levelGraph().addLayoutEdge(edge);\r\n                        }\r\n                    }\r\n                    else {\r\n                        const tmpEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcId, tmpDstId);\r\n                        if (!bundle) {\r\n                            tmpEdge.weight = Number.POSITIVE_INFINITY;\r\n                        }\r\n                        tmpEdge.isInverted = edge.isInverted;\r\n                        edge.graph.addEdge(tmpEdge, null);\r\n                        if (addToLevelGraph) {\r\n                            edge.graph.levelGraph().addLayoutEdge(tmpEdge);\r\n                        }\r\n                    }\r\n                    tmpSrcId = tmpDstId;\r\n                }\r\n                // last virtual edge has the original dstConnector\r\n                const tmpEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcId, dstNode.id, null, dstConnector);\r\n                tmpEdge.isInverted = edge.isInverted;\r\n                edge.graph.addEdge(tmpEdge, null);\r\n                if (addToLevelGraph) {\r\n                    edge.graph.levelGraph().addLayoutEdge(tmpEdge);\r\n                }\r\n                // add bundle edges\r\n                if ((edge.dstBundle !== null) && (edge.dstBundle.edges.length > 1)) {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.dstBundle.edges, (bundleEdge) => {\r\n                        if (bundleEdge.isReplica) {\r\n                            bundleEdge.graph.redirectEdge(bundleEdge.id, tmpSrcId, bundleEdge.dst);\r\n                        }\r\n                    });\r\n                }\r\n            }\r\n        });\r\n    }\r\n    _updateLevelNodeRanks(graph) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allNodes(), (layoutNode) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutNode.levelNodes, (levelNode, r) => {\r\n                levelNode.rank = layoutNode.rank + r;\r\n            });\r\n        });\r\n    }\r\n    countCrossings(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const orderGraph = this._createConnectorGraph(graph, true, false, false, true);\r\n            return yield orderGraph.order({\r\n                resolveConflicts: false,\r\n                countInitial: true,\r\n                countOnly: true,\r\n            });\r\n        });\r\n    }\r\n    _createConnectorGraph(graph, isPreorder, shuffleNodes = false, shuffleConnectors = false, isCounting = false) {\r\n        const orderGraph = new _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__.default(this._wasm);\r\n        const orderRank = [];\r\n        for (let r = 0; r < graph.numRanks; ++r) {\r\n            orderRank[r] = new _order_orderRank__WEBPACK_IMPORTED_MODULE_14__.default(r);\r\n            orderGraph.addRank(orderRank[r]);\r\n        }\r\n        const connectorMap = new Map();\r\n        const levelNodeMap = new Map();\r\n        const addConnector = (connectorGroup, connector) => {\r\n            const connectorNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(connector, false, false);\r\n            connectorGroup.addNode(connectorNode);\r\n            connectorMap.set(connector, connectorNode.id);\r\n            if (connector.isScoped) {\r\n                connectorMap.set(connector.counterpart, connectorNode.id);\r\n            }\r\n        };\r\n        // add nodes\r\n        const addConnectorsForSubgraph = (subgraph, indizes = null) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.levelGraph().ranks(), (rank, r) => {\r\n                let index = (indizes === null ? 0 : indizes[r]);\r\n                if (shuffleNodes) {\r\n                    rank = _util_shuffle__WEBPACK_IMPORTED_MODULE_19__.default.shuffle(rank);\r\n                }\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (levelNode) => {\r\n                    if (isPreorder && !isCounting) {\r\n                        levelNode.position = index;\r\n                    }\r\n                    const node = levelNode.layoutNode;\r\n                    if (levelNode.isLast) {\r\n                        let childIndizes = null;\r\n                        if (node.isScopeNode) {\r\n                            childIndizes = lodash__WEBPACK_IMPORTED_MODULE_2__.map(node.levelNodes, \"position\");\r\n                        }\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.childGraphs, (childGraph) => {\r\n                            addConnectorsForSubgraph(childGraph, childIndizes);\r\n                        });\r\n                    }\r\n                    if (node.isScopeNode) {\r\n                        index += node.childGraphs[0].maxNodesPerRank();\r\n                        return; // do not add connectors for scope nodes\r\n                    }\r\n                    let connectorGroup;\r\n                    if (isCounting && node.hasScopedConnectors) {\r\n                        connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                        orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                        connectorGroup.position = index;\r\n                        let inPointer = 0;\r\n                        let outPointer = 0;\r\n                        while (inPointer < node.inConnectors.length || outPointer < node.outConnectors.length) {\r\n                            if (inPointer === node.inConnectors.length) {\r\n                                // only out connectors left\r\n                                addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                            }\r\n                            else if (outPointer === node.outConnectors.length) {\r\n                                // only in connectors left\r\n                                addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                            }\r\n                            else {\r\n                                let scoped = false;\r\n                                if (node.inConnectors[inPointer].isScoped) {\r\n                                    scoped = true;\r\n                                    while (!node.outConnectors[outPointer].isScoped) {\r\n                                        addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                                    }\r\n                                }\r\n                                else if (node.outConnectors[outPointer].isScoped) {\r\n                                    scoped = true;\r\n                                    while (!node.inConnectors[inPointer].isScoped) {\r\n                                        addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    }\r\n                                }\r\n                                else {\r\n                                    addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    addConnector(connectorGroup, node.outConnectors[outPointer++]);\r\n                                }\r\n                                if (scoped) {\r\n                                    addConnector(connectorGroup, node.inConnectors[inPointer++]);\r\n                                    outPointer++;\r\n                                }\r\n                            }\r\n                        }\r\n                    }\r\n                    else {\r\n                        if (isPreorder || levelNode.isFirst) {\r\n                            connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                            orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                            connectorGroup.position = index;\r\n                            if (levelNode.isFirst) {\r\n                                // add input connectors\r\n                                let connectors = node.inConnectors;\r\n                                if (shuffleConnectors) {\r\n                                    connectors = _util_shuffle__WEBPACK_IMPORTED_MODULE_19__.default.shuffle(connectors);\r\n                                }\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                                    addConnector(connectorGroup, connector);\r\n                                });\r\n                            }\r\n                        }\r\n                        if (isPreorder || levelNode.isLast) {\r\n                            if (!isPreorder && !node.hasScopedConnectors) {\r\n                                connectorGroup = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(levelNode);\r\n                                orderRank[levelNode.rank].addGroup(connectorGroup);\r\n                                connectorGroup.position = index;\r\n                            }\r\n                            if (levelNode.isLast) {\r\n                                // add output connectors\r\n                                let connectors = node.outConnectors;\r\n                                if (shuffleConnectors) {\r\n                                    connectors = _util_shuffle__WEBPACK_IMPORTED_MODULE_19__.default.shuffle(connectors);\r\n                                }\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                                    if (!connector.isScoped) {\r\n                                        const connectorNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(connector, false, false);\r\n                                        connectorGroup.addNode(connectorNode, node.hasScopedConnectors ? null : null);\r\n                                        connectorMap.set(connector, connectorNode.id);\r\n                                    }\r\n                                });\r\n                            }\r\n                        }\r\n                        if (isPreorder && node.rankSpan > 1) {\r\n                            const orderNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(null, false, false);\r\n                            connectorGroup.addNode(orderNode);\r\n                            levelNodeMap.set(levelNode, orderNode);\r\n                        }\r\n                    }\r\n                    index++;\r\n                });\r\n            });\r\n        };\r\n        addConnectorsForSubgraph(graph);\r\n        // add edges\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allEdges(), (edge) => {\r\n            let srcNode = edge.graph.node(edge.src);\r\n            if (srcNode.isScopeNode) {\r\n                srcNode = srcNode.childGraphs[0].exitNode;\r\n            }\r\n            let dstNode = edge.graph.node(edge.dst);\r\n            if (dstNode.isScopeNode) {\r\n                dstNode = dstNode.childGraphs[0].entryNode;\r\n            }\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(dstNode.rank > srcNode.rank, \"edge not between neighboring ranks\", edge, srcNode, dstNode);\r\n            }\r\n            let srcOrderNodeId = connectorMap.get(srcNode.connector(\"OUT\", edge.srcConnector));\r\n            let dstOrderNodeId = connectorMap.get(dstNode.connector(\"IN\", edge.dstConnector));\r\n            orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(srcOrderNodeId, dstOrderNodeId, 1));\r\n        });\r\n        if (isPreorder) {\r\n            // add intranode edges\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.allNodes(), (node) => {\r\n                if (!node.isScopeNode && node.rankSpan > 1) {\r\n                    for (let r = 0; r < node.levelNodes.length - 1; ++r) {\r\n                        const srcNode = node.levelNodes[r];\r\n                        const dstNode = node.levelNodes[r + 1];\r\n                        let srcOrderNode = levelNodeMap.get(srcNode);\r\n                        let dstOrderNode = levelNodeMap.get(dstNode);\r\n                        orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(srcOrderNode.id, dstOrderNode.id, 1));\r\n                    }\r\n                }\r\n            });\r\n        }\r\n        return orderGraph;\r\n    }\r\n    doOrder(graph, shuffle = false) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_DO_ORDER);\r\n            /**\r\n             * STEP 1 (OPTIONAL): ORDER NODES BASED ON CONNECTORS\r\n             * In this step, scope insides and outsides are handled in the same order graph.\r\n             * If there are nested scopes, they are flattened.\r\n             */\r\n            if (this._options.jointOrder) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_PREORDER);\r\n                // order\r\n                const connectorOrderGraph = this._createConnectorGraph(graph, true, shuffle, shuffle);\r\n                yield connectorOrderGraph.order({\r\n                    orderGroups: true,\r\n                    resolveConflicts: false,\r\n                });\r\n                // copy order information from order graph to layout graph\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectorOrderGraph.groups(), (orderGroup) => {\r\n                    const levelNode = orderGroup.reference;\r\n                    if (levelNode !== null) {\r\n                        levelNode.position = orderGroup.position;\r\n                        let tmpNode = levelNode;\r\n                        while (tmpNode.layoutNode.graph.entryNode !== null) {\r\n                            tmpNode = tmpNode.layoutNode.graph.parentNode.levelNodes[tmpNode.rank - tmpNode.layoutNode.graph.parentNode.rank];\r\n                            tmpNode.position = levelNode.position;\r\n                        }\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_PREORDER);\r\n            }\r\n            /**\r\n             * STEP 2: ORDER NODES (OPTIONAL) & RESOLVE CONFLICTS\r\n             * This is done strictly hierarchically.\r\n             * Child graphs are represented as a chain over multiple ranks in their parent.\r\n             */\r\n            const nodeMap = new Map(); // map from level node to corresponding order node\r\n            // child graphs are visited before their parents\r\n            const allGraphs = graph.allGraphs();\r\n            for (let i = allGraphs.length - 1; i >= 0; --i) {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ORDER_NODES);\r\n                const subgraph = allGraphs[i];\r\n                this._addVirtualNodes(subgraph, true);\r\n                const levelGraph = subgraph.levelGraph();\r\n                levelGraph.invalidateRankOrder();\r\n                // init graph and ranks\r\n                const orderGraph = new _order_orderGraph__WEBPACK_IMPORTED_MODULE_11__.default(this._wasm);\r\n                const orderGroups = new Array(subgraph.numRanks);\r\n                for (let r = subgraph.minRank; r < subgraph.minRank + subgraph.numRanks; ++r) {\r\n                    const orderRank = new _order_orderRank__WEBPACK_IMPORTED_MODULE_14__.default(r);\r\n                    orderGraph.addRank(orderRank);\r\n                    orderGroups[r] = new _order_orderGroup__WEBPACK_IMPORTED_MODULE_12__.default(null);\r\n                    orderRank.addGroup(orderGroups[r]);\r\n                }\r\n                // add nodes\r\n                let levelNodes = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(levelGraph.nodes());\r\n                if (shuffle && !this._options.jointOrder) {\r\n                    _util_shuffle__WEBPACK_IMPORTED_MODULE_19__.default.shuffle(levelNodes);\r\n                }\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelNodes, (levelNode) => {\r\n                    const orderNode = new _order_orderNode__WEBPACK_IMPORTED_MODULE_13__.default(levelNode, levelNode.layoutNode.isVirtual || levelNode.layoutNode.isBundle, levelNode.layoutNode.rankSpan > 1, levelNode.layoutNode.label());\r\n                    orderGroups[levelNode.rank].addNode(orderNode, levelNode.id);\r\n                    nodeMap.set(levelNode.id, orderNode.id);\r\n                    if (this._options.jointOrder) {\r\n                        orderNode.position = levelNode.position;\r\n                    }\r\n                });\r\n                // add edges\r\n                // for each pair of nodes, sum up the weights of edges in-between\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), (edge) => {\r\n                    const existingEdge = orderGraph.edgeBetween(edge.src, edge.dst);\r\n                    if (existingEdge === undefined) {\r\n                        orderGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(edge.src, edge.dst, edge.weight));\r\n                    }\r\n                    else {\r\n                        existingEdge.weight += edge.weight;\r\n                    }\r\n                });\r\n                if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertAll(orderGraph.edges(), edge => {\r\n                        const srcNode = edge.graph.node(edge.src);\r\n                        const dstNode = edge.graph.node(edge.dst);\r\n                        return (srcNode.group.rank.rank + 1 === dstNode.group.rank.rank);\r\n                    }, \"order graph edge not between neighboring ranks\");\r\n                }\r\n                // do order\r\n                yield orderGraph.order({\r\n                    debug: false,\r\n                    resolveX: true,\r\n                    countInitial: this._options.jointOrder,\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ORDER_NODES);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_INSERT_NODES);\r\n                // copy node order into layout graph\r\n                const newOrderNodes = new Set();\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(orderGraph.nodes(), (orderNode) => {\r\n                    let levelNode = orderNode.reference;\r\n                    if (levelNode === null) {\r\n                        // virtual node was created by orderGraph.order() => add this node to layout graph\r\n                        const newLayoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, true);\r\n                        newLayoutNode.rank = orderNode.rank;\r\n                        subgraph.addNode(newLayoutNode, null);\r\n                        newOrderNodes.add(orderNode);\r\n                        levelNode = levelGraph.addLayoutNode(newLayoutNode);\r\n                        orderNode.reference = levelNode;\r\n                    }\r\n                    else {\r\n                        if (levelNode.isFirst) {\r\n                            levelNode.layoutNode.updateRank(orderNode.rank);\r\n                        }\r\n                    }\r\n                    subgraph.numRanks = Math.max(subgraph.numRanks, levelNode.rank - subgraph.minRank + 1);\r\n                    levelNode.position = orderNode.position;\r\n                });\r\n                let tmpSubgraph = subgraph;\r\n                while (tmpSubgraph.parentNode !== null) {\r\n                    const parent = tmpSubgraph.parentNode;\r\n                    const prevRankSpan = parent.rankSpan;\r\n                    const newRankSpan = Math.max(prevRankSpan, tmpSubgraph.numRanks);\r\n                    const diff = newRankSpan - prevRankSpan;\r\n                    if (diff !== 0) {\r\n                        const levelGraph = parent.graph.levelGraph();\r\n                        parent.rankSpan = newRankSpan;\r\n                        /**\r\n                         * UPDATE LEVEL NODES REPRESENTATION IN PARENT\r\n                         */\r\n                        let positions = lodash__WEBPACK_IMPORTED_MODULE_2__.map(parent.levelNodes, \"position\");\r\n                        positions.length = newRankSpan;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.fill(positions, positions[prevRankSpan - 1], prevRankSpan);\r\n                        const lastLevelNode = lodash__WEBPACK_IMPORTED_MODULE_2__.last(parent.levelNodes);\r\n                        // add new nodes\r\n                        const newLevelNodes = [];\r\n                        for (let r = 0; r < diff; ++r) {\r\n                            const newNode = new _levelGraph_levelNode__WEBPACK_IMPORTED_MODULE_10__.default(parent, lastLevelNode.rank + r, 0);\r\n                            levelGraph.addNode(newNode);\r\n                            newLevelNodes.push(newNode);\r\n                        }\r\n                        parent.levelNodes.length--;\r\n                        Array.prototype.push.apply(parent.levelNodes, newLevelNodes);\r\n                        parent.levelNodes.push(lastLevelNode);\r\n                        lastLevelNode.rank += diff;\r\n                        // redirect last edge\r\n                        const lastEdge = levelGraph.inEdges(lastLevelNode.id)[0];\r\n                        levelGraph.redirectEdge(lastEdge.id, lodash__WEBPACK_IMPORTED_MODULE_2__.last(newLevelNodes).id, lastLevelNode.id);\r\n                        // update positions\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.levelNodes, (levelNode, r) => {\r\n                            levelNode.position = positions[r];\r\n                        });\r\n                        // add edges between new nodes\r\n                        for (let r = prevRankSpan - 2; r < newRankSpan - 2; ++r) {\r\n                            levelGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(parent.levelNodes[r].id, parent.levelNodes[r + 1].id, Number.POSITIVE_INFINITY));\r\n                        }\r\n                        /////////////////////////////////////////////////////\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.graph.bfs(parent.id), (node) => {\r\n                            if (node !== parent) {\r\n                                node.offsetRank(diff);\r\n                            }\r\n                            node.graph.numRanks = Math.max(node.graph.numRanks, node.rank + node.rankSpan - node.graph.minRank);\r\n                        });\r\n                    }\r\n                    tmpSubgraph = parent.graph;\r\n                }\r\n                // find for all new nodes the dominating and dominated non-new node\r\n                const visited = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(orderGraph.maxId() + 1), false);\r\n                const newLevelNodesPerEdge = new Map();\r\n                newOrderNodes.forEach((orderNode) => {\r\n                    if (visited[orderNode.id]) {\r\n                        return; // start and end node already set\r\n                    }\r\n                    visited[orderNode.id] = true;\r\n                    let tmpOrderNode = orderNode;\r\n                    const nodes = [orderNode.reference];\r\n                    while (newOrderNodes.has(tmpOrderNode) && orderGraph.inEdges(tmpOrderNode.id).length > 0) {\r\n                        tmpOrderNode = orderGraph.node(orderGraph.inEdges(tmpOrderNode.id)[0].src);\r\n                        if (newOrderNodes.has(tmpOrderNode)) {\r\n                            nodes.push(tmpOrderNode.reference);\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(!visited[tmpOrderNode.id], \"new node on multiple paths\");\r\n                            }\r\n                            visited[tmpOrderNode.id] = true;\r\n                        }\r\n                    }\r\n                    const startNode = tmpOrderNode;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.reverse(nodes);\r\n                    tmpOrderNode = orderNode;\r\n                    while (newOrderNodes.has(tmpOrderNode) && orderGraph.outEdges(tmpOrderNode.id).length > 0) {\r\n                        tmpOrderNode = orderGraph.node(orderGraph.outEdges(tmpOrderNode.id)[0].dst);\r\n                        if (newOrderNodes.has(tmpOrderNode)) {\r\n                            nodes.push(tmpOrderNode.reference);\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assert(!visited[tmpOrderNode.id], \"new node on multiple paths\");\r\n                            }\r\n                            visited[tmpOrderNode.id] = true;\r\n                        }\r\n                    }\r\n                    const endNode = tmpOrderNode;\r\n                    const key = startNode.id + \"_\" + endNode.id;\r\n                    newLevelNodesPerEdge.set(key, nodes);\r\n                });\r\n                levelGraph.invalidateRankOrder();\r\n                const ranks = levelGraph.ranks();\r\n                // reroute edges that were intermitted by new virtual nodes\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), levelEdge => {\r\n                    const orderSrcNodeId = nodeMap.get(levelEdge.src);\r\n                    const orderDstNodeId = nodeMap.get(levelEdge.dst);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(orderSrcNodeId, \"orderSrcNodeId is not a number\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(orderSrcNodeId, \"orderSrcNodeId is not a number\");\r\n                    }\r\n                    if (orderGraph.edgeBetween(orderSrcNodeId, orderDstNodeId) === undefined) {\r\n                        levelGraph.removeEdge(levelEdge.id);\r\n                        const srcLayoutNode = levelGraph.node(levelEdge.src).layoutNode;\r\n                        const dstLayoutNode = levelGraph.node(levelEdge.dst).layoutNode;\r\n                        const key = orderSrcNodeId + \"_\" + orderDstNodeId;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edgesBetween(srcLayoutNode.id, dstLayoutNode.id), (layoutEdge, e) => {\r\n                            if (layoutEdge.isReplica) {\r\n                                return;\r\n                            }\r\n                            let newNodes = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(newLevelNodesPerEdge.get(key));\r\n                            const dstConnector = layoutEdge.dstConnector;\r\n                            if (e > 0) {\r\n                                let clonedNewNodes = [];\r\n                                // create a copy of all new nodes because each edge needs its own virtual nodes\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(newNodes, (levelNode) => {\r\n                                    const newLayoutNode = new _layoutGraph_layoutNode__WEBPACK_IMPORTED_MODULE_9__.default({ width: 0, height: 0 }, 0, 0, true);\r\n                                    newLayoutNode.rank = levelNode.layoutNode.rank;\r\n                                    subgraph.addNode(newLayoutNode, null);\r\n                                    const newLevelNode = levelGraph.addLayoutNode(newLayoutNode);\r\n                                    const rank = ranks[newLayoutNode.rank - subgraph.minRank];\r\n                                    for (let pos = levelNode.position; pos < rank.length; ++pos) {\r\n                                        rank[pos].position++;\r\n                                    }\r\n                                    rank.splice(levelNode.position - 1, 0, newLevelNode);\r\n                                    newLevelNode.position = levelNode.position - 1;\r\n                                    clonedNewNodes.push(newLevelNode);\r\n                                });\r\n                                newNodes = clonedNewNodes;\r\n                            }\r\n                            newNodes.push(orderGraph.node(orderDstNodeId).reference);\r\n                            // original edge gets rerouted to first new node\r\n                            subgraph.removeEdge(layoutEdge.id);\r\n                            layoutEdge.dst = newNodes[0].layoutNode.id;\r\n                            layoutEdge.dstConnector = null;\r\n                            subgraph.addEdge(layoutEdge, layoutEdge.id);\r\n                            levelGraph.addLayoutEdge(layoutEdge);\r\n                            for (let n = 1; n < newNodes.length; ++n) {\r\n                                const tmpSrcLayoutNodeId = newNodes[n - 1].layoutNode.id;\r\n                                const tmpDstLayoutNodeId = newNodes[n].layoutNode.id;\r\n                                // last edge gets the original dst connector\r\n                                const tmpDstConnector = ((n === newNodes.length - 1) ? dstConnector : null);\r\n                                const newLayoutEdge = new _layoutGraph_layoutEdge__WEBPACK_IMPORTED_MODULE_8__.default(tmpSrcLayoutNodeId, tmpDstLayoutNodeId, null, tmpDstConnector);\r\n                                subgraph.addEdge(newLayoutEdge, null);\r\n                                levelGraph.addLayoutEdge(newLayoutEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_INSERT_NODES);\r\n            }\r\n            this._updateLevelNodeRanks(graph);\r\n            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertAll(graph.allEdges(), edge => edge.graph.node(edge.src).rank + edge.graph.node(edge.src).rankSpan === edge.graph.node(edge.dst).rank, \"edge not between neighboring ranks\");\r\n            }\r\n            /**\r\n             * STEP 3: ORDER CONNECTORS\r\n             */\r\n            // order connectors\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ORDER_CONNECTORS);\r\n            const connectorOrderGraph = this._createConnectorGraph(graph, false, false, shuffle && !this._options.jointOrder);\r\n            yield connectorOrderGraph.order({\r\n                resolveConflicts: false,\r\n            });\r\n            // copy order information from order graph to layout graph\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectorOrderGraph.groups(), (orderGroup) => {\r\n                const levelNode = orderGroup.reference;\r\n                if (levelNode !== null) {\r\n                    const layoutNode = levelNode.layoutNode;\r\n                    const connectors = { \"IN\": [], \"OUT\": [] };\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(orderGroup.orderedNodes(), (orderNode) => {\r\n                        if (orderNode.reference !== null) {\r\n                            const connector = orderNode.reference;\r\n                            connectors[connector.type].push(connector);\r\n                            if (connector.isScoped) {\r\n                                connectors[\"OUT\"].push(connector.counterpart);\r\n                            }\r\n                        }\r\n                    });\r\n                    if (connectors[\"IN\"].length > 0 || connectors[\"OUT\"].length > 0) {\r\n                        if (connectors[\"IN\"].length > 0 && layoutNode.inConnectorBundles.length > 0) {\r\n                            this._bundleConnectors(connectors[\"IN\"], connectors[\"OUT\"], layoutNode.inConnectorBundles);\r\n                        }\r\n                        if (connectors[\"OUT\"].length > 0 && layoutNode.outConnectorBundles.length > 0) {\r\n                            this._bundleConnectors(connectors[\"OUT\"], connectors[\"IN\"], layoutNode.outConnectorBundles);\r\n                        }\r\n                        if (connectors[\"IN\"].length > 0) {\r\n                            layoutNode.inConnectors = connectors[\"IN\"];\r\n                        }\r\n                        if (connectors[\"OUT\"].length > 0) {\r\n                            layoutNode.outConnectors = connectors[\"OUT\"];\r\n                        }\r\n                    }\r\n                }\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ORDER_CONNECTORS);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_DO_ORDER);\r\n        });\r\n    }\r\n    _orderAndCount(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            const graphCopy = graph.cloneForOrdering();\r\n            yield this.doOrder(graphCopy);\r\n            return yield this.countCrossings(graphCopy);\r\n        });\r\n    }\r\n    _orderRanks(graph) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (this._options.numShuffles === 0) {\r\n                yield this.doOrder(graph);\r\n            }\r\n            else {\r\n                if (!this._options.bundle && this._options.webWorkers) {\r\n                    const allGraphs = graph.allGraphs();\r\n                    const numNodesTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => subgraph.numNodes()));\r\n                    const numInConnectorsTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(subgraph.nodes(), node => node.numInConnectors()))));\r\n                    const numOutConnectorsTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(subgraph.nodes(), node => node.numOutConnectors()))));\r\n                    const numEdgesTotal = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(allGraphs, subgraph => subgraph.numEdges()));\r\n                    // DATA PASSED TO WORKER\r\n                    // metadata: level, parentNodeId, #nodes, #in-connectors, #out-connectors, #edges, minRank, numRanks\r\n                    // nodes: id, rank, rankSpan, isVirtual, isScopeNode\r\n                    // inConnectors: nodeId, counterPartId\r\n                    // outConnectors: nodeId, counterPartId\r\n                    // edges: id, srcId, dstId, srcConnectorId, dstConnectorId, weight\r\n                    const sizeMetadata = 8 * allGraphs.length;\r\n                    const sizeNodes = 5 * numNodesTotal;\r\n                    const sizeInConnectors = numInConnectorsTotal;\r\n                    const sizeOutConnectors = 2 * numOutConnectorsTotal;\r\n                    const sizeEdges = 8 * numEdgesTotal;\r\n                    const metadataBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeMetadata);\r\n                    const metadata = new Int32Array(metadataBuf);\r\n                    const nodesBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeNodes);\r\n                    const nodes = new Int32Array(nodesBuf);\r\n                    const inConnectorsBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeInConnectors);\r\n                    const inConnectors = new Int32Array(inConnectorsBuf);\r\n                    const outConnectorsBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeOutConnectors);\r\n                    const outConnectors = new Int32Array(outConnectorsBuf);\r\n                    const edgesBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * sizeEdges);\r\n                    const edges = new Int32Array(edgesBuf);\r\n                    let n = 0;\r\n                    let i = 0;\r\n                    let o = 0;\r\n                    let e = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(allGraphs, (subgraph, g) => {\r\n                        const graphNodes = subgraph.nodes();\r\n                        let numInConnectors = 0;\r\n                        let numOutConnectors = 0;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphNodes, (node) => {\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.inConnectors, (connector) => {\r\n                                inConnectors[i++] = connector.node.id;\r\n                                numInConnectors++;\r\n                            });\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.outConnectors, (connector) => {\r\n                                outConnectors[o++] = connector.node.id;\r\n                                outConnectors[o++] = (connector.isScoped ? connector.node.connectorIndex(\"IN\", connector.counterpart.name) : -1);\r\n                                numOutConnectors++;\r\n                            });\r\n                        });\r\n                        const graphEdges = subgraph.edges();\r\n                        metadata[8 * g] = (subgraph.parentNode === null ? 0 : subgraph.parentNode.parents().length + 1);\r\n                        metadata[8 * g + 1] = (subgraph.parentNode === null ? -1 : subgraph.parentNode.id);\r\n                        metadata[8 * g + 2] = graphNodes.length;\r\n                        metadata[8 * g + 3] = numInConnectors;\r\n                        metadata[8 * g + 4] = numOutConnectors;\r\n                        metadata[8 * g + 5] = graphEdges.length;\r\n                        metadata[8 * g + 6] = subgraph.minRank;\r\n                        metadata[8 * g + 7] = subgraph.numRanks;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphNodes, (node) => {\r\n                            nodes[n++] = node.id;\r\n                            nodes[n++] = node.rank;\r\n                            nodes[n++] = node.rankSpan;\r\n                            nodes[n++] = node.isVirtual ? 1 : 0;\r\n                            nodes[n++] = node.isScopeNode ? 1 : 0;\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graphEdges, (edge) => {\r\n                            edges[e++] = edge.id; // id\r\n                            edges[e++] = edge.src; // srcNodeId\r\n                            edges[e++] = edge.dst; // dstNodeId\r\n                            let srcNode = subgraph.node(edge.src);\r\n                            let dstNode = subgraph.node(edge.dst);\r\n                            if (srcNode.isScopeNode) {\r\n                                srcNode = srcNode.childGraphs[0].exitNode;\r\n                            }\r\n                            if (dstNode.isScopeNode) {\r\n                                dstNode = dstNode.childGraphs[0].entryNode;\r\n                            }\r\n                            edges[e++] = srcNode.connectorIndex(\"OUT\", edge.srcConnector); // srcConnectorId\r\n                            edges[e++] = dstNode.connectorIndex(\"IN\", edge.dstConnector); // dstConnectorId\r\n                            edges[e++] = (edge.weight === Number.POSITIVE_INFINITY ? -1 : edge.weight); // weight\r\n                        });\r\n                    });\r\n                    // the buffers are sent to every worker once instead of with every shuffle\r\n                    const data = this._pool.setData([allGraphs.length, metadataBuf, nodesBuf, inConnectorsBuf, outConnectorsBuf, edgesBuf]);\r\n                    const startedPromises = [];\r\n                    const donePromises = [null];\r\n                    for (let s = 0; s < this._options.numShuffles; ++s) {\r\n                        const [startedPromise, donePromise] = this._pool.exec(\"orderRanks\", [s + 1, data, this._options.webAssembly]);\r\n                        startedPromises.push(startedPromise);\r\n                        donePromises.push(donePromise);\r\n                    }\r\n                    yield Promise.all(startedPromises);\r\n                    donePromises[0] = this._orderAndCount(graph);\r\n                    const results = yield Promise.all(donePromises);\r\n                    this._pool.clearData(data);\r\n                    let minCrossings = results[0];\r\n                    let minIndex = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(results, (result, index) => {\r\n                        if (result < minCrossings) {\r\n                            minCrossings = result;\r\n                            minIndex = index;\r\n                        }\r\n                    });\r\n                    seedrandom__WEBPACK_IMPORTED_MODULE_3__(minIndex, { global: true });\r\n                    yield this.doOrder(graph, minIndex > 0);\r\n                }\r\n                else {\r\n                    const graphCopy = graph.cloneForOrdering();\r\n                    yield this.doOrder(graphCopy);\r\n                    let minCrossings = yield this.countCrossings(graphCopy);\r\n                    let bestGraphCopy = graphCopy;\r\n                    for (let i = 0; i < this._options.numShuffles; ++i) {\r\n                        if (minCrossings === 0) {\r\n                            break;\r\n                        }\r\n                        const graphCopy = graph.cloneForOrdering();\r\n                        yield this.doOrder(graphCopy, true);\r\n                        let numCrossings = yield this.countCrossings(graphCopy);\r\n                        if (numCrossings < minCrossings) {\r\n                            minCrossings = numCrossings;\r\n                            bestGraphCopy = graphCopy;\r\n                        }\r\n                    }\r\n                    bestGraphCopy.copyInto(graph);\r\n                }\r\n            }\r\n        });\r\n    }\r\n    _bundleConnectors(connectors, counterPartConnectors, bundles) {\r\n        // order bundles by the mean of their connectors positions\r\n        // within a bundle, the connectors do not change their relative position\r\n        let connectorByName = new Map();\r\n        let indexByConnector = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector, pos) => {\r\n            connectorByName.set(connector.name, connector);\r\n            indexByConnector.set(connector.name, pos);\r\n        });\r\n        let bundleMeans = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(bundles, (bundle) => {\r\n            bundle.connectors = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(bundle.connectors, (name) => indexByConnector.get(name));\r\n            bundleMeans.push([bundle, lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(bundle.connectors, (name) => indexByConnector.get(name)))]);\r\n        });\r\n        connectors.length = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(bundleMeans, \"1\"), ([bundle, mean]) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(bundle.connectors, (name) => {\r\n                const connector = connectorByName.get(name);\r\n                connectors.push(connector);\r\n            });\r\n        });\r\n        // reflect unbroken sequences of scoped connectors on other side\r\n        const scopeGroups = [];\r\n        let group = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector, pos) => {\r\n            if (connector.isScoped) {\r\n                group.push(connector);\r\n            }\r\n            if ((pos === connectors.length - 1) || !connectors[pos + 1].isScoped) {\r\n                scopeGroups.push(group);\r\n                group = [];\r\n            }\r\n        });\r\n        const counterMeans = [];\r\n        let scopeCount = 0;\r\n        let scopeSum = 0;\r\n        let scopeGroupPointer = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(counterPartConnectors, (connector, pos) => {\r\n            if (connector.isScoped) {\r\n                scopeSum += pos;\r\n                if (++scopeCount === scopeGroups[scopeGroupPointer].length) {\r\n                    counterMeans.push([lodash__WEBPACK_IMPORTED_MODULE_2__.map(scopeGroups[scopeGroupPointer++], \"counterpart\"), pos / scopeCount]);\r\n                    scopeCount = 0;\r\n                    scopeSum = 0;\r\n                }\r\n            }\r\n            else {\r\n                counterMeans.push([[connector], pos]);\r\n            }\r\n        });\r\n        counterPartConnectors.length = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(counterMeans, \"1\"), ([connectors, mean]) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(connectors, (connector) => {\r\n                counterPartConnectors.push(connector);\r\n            });\r\n        });\r\n    }\r\n    /**\r\n     * Assigns coordinates to the nodes, the connectors and the edges.\r\n     * @param graph\r\n     * @param rankTops\r\n     * @param segmentsPerRank\r\n     * @param crossingsPerRank\r\n     * @private\r\n     */\r\n    _assignCoordinates(graph, rankTops, segmentsPerRank, crossingsPerRank) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            // assign y\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ASSIGN_Y);\r\n            rankTops.length = graph.numRanks + 1;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.fill(rankTops, Number.POSITIVE_INFINITY);\r\n            const rankBottoms = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(graph.numRanks), Number.NEGATIVE_INFINITY);\r\n            const globalRanks = graph.globalRanks();\r\n            rankTops[0] = 0;\r\n            for (let r = 0; r < globalRanks.length; ++r) {\r\n                crossingsPerRank[r] = [];\r\n                segmentsPerRank[r] = [];\r\n                let maxBottom = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(globalRanks[r], (node) => {\r\n                    node.y = rankTops[r];\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.parents(), (parent) => {\r\n                        if (parent.rank === node.rank) {\r\n                            node.y += parent.padding;\r\n                        }\r\n                    });\r\n                    node.updateSize({ width: 2 * node.padding, height: 2 * node.padding });\r\n                    let height = node.height;\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(node.inConnectors, connector => !connector.isTemporary)) {\r\n                        node.y += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(node.outConnectors, connector => !connector.isTemporary)) {\r\n                        height += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                    }\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.parents(), (parent) => {\r\n                        if (parent.rank + parent.rankSpan - 1 === node.rank) {\r\n                            height += parent.padding;\r\n                            if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(parent.outConnectors, connector => !connector.isTemporary)) {\r\n                                height += _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                            }\r\n                        }\r\n                    });\r\n                    maxBottom = Math.max(maxBottom, node.y + height);\r\n                });\r\n                rankBottoms[r] = maxBottom;\r\n                rankTops[r + 1] = maxBottom + this._options.targetEdgeLength;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ASSIGN_Y);\r\n            const nodeHasInProxies = [];\r\n            const nodeHasOutProxies = [];\r\n            // assign x and set size; assign edge and connector coordinates\r\n            const placeSubgraph = (subgraph, offset) => __awaiter(this, void 0, void 0, function* () {\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_PLACE_SUBGRAPH);\r\n                // place all subgraphs in order to know their size\r\n                const nodes = subgraph.nodes();\r\n                for (let n = 0; n < nodes.length; ++n) {\r\n                    let childOffset = 0;\r\n                    for (let c = 0; c < nodes[n].childGraphs.length; ++c) {\r\n                        const childGraph = nodes[n].childGraphs[c];\r\n                        if (childGraph.numNodes() > 0) {\r\n                            yield placeSubgraph(childGraph, childOffset);\r\n                            childOffset += childGraph.boundingBox().width + this._options.spaceBetweenComponents;\r\n                        }\r\n                    }\r\n                }\r\n                // assign x\r\n                yield this._assignX(subgraph, offset + (subgraph.parentNode !== null ? subgraph.parentNode.padding : 0));\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_CHANGE_PARENT_SIZE);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_PLACE_CONNECTORS);\r\n                // place connectors\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                    this._placeConnectors(node, rankTops, rankBottoms);\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_PLACE_CONNECTORS);\r\n                /**\r\n                 * PLACE EDGES\r\n                 * (self-loops handled above)\r\n                 */\r\n                const getInPoint = (node, edge) => {\r\n                    node = (node.isScopeNode ? node.childGraphs[0].entryNode : node);\r\n                    const dstConnector = node.connector(\"IN\", edge.dstConnector);\r\n                    return dstConnector.boundingBox().topCenter();\r\n                };\r\n                const getInProxyPoint = (node, inPoint) => {\r\n                    const proxyPoint = inPoint.clone();\r\n                    proxyPoint.y = rankTops[node.rank];\r\n                    return proxyPoint;\r\n                };\r\n                const getOutPoint = (node, edge) => {\r\n                    node = (node.isScopeNode ? node.childGraphs[0].exitNode : node);\r\n                    const srcConnector = node.connector(\"OUT\", edge.srcConnector);\r\n                    return srcConnector.boundingBox().bottomCenter();\r\n                };\r\n                const getOutProxyPoint = (node, outPoint) => {\r\n                    const proxyPoint = outPoint.clone();\r\n                    proxyPoint.y = rankBottoms[node.rank + node.rankSpan - 1];\r\n                    return proxyPoint;\r\n                };\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_PLACE_EDGES);\r\n                // mark nodes that do not need proxies\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_MARK_NO_PROXIES);\r\n                nodeHasInProxies.length = subgraph.maxId() + 1;\r\n                nodeHasOutProxies.length = subgraph.maxId() + 1;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.nodes(), (node) => {\r\n                    nodeHasInProxies[node.id] = true;\r\n                    nodeHasOutProxies[node.id] = true;\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.levelGraph().ranks(), (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (levelNode, pos) => {\r\n                        const node = levelNode.layoutNode;\r\n                        if (node.isVirtual) {\r\n                            return;\r\n                        }\r\n                        let leftBoundary = Number.NEGATIVE_INFINITY;\r\n                        if (pos > 0) {\r\n                            leftBoundary = rank[pos - 1].layoutNode.boundingBox().right();\r\n                        }\r\n                        let rightBoundary = Number.POSITIVE_INFINITY;\r\n                        if (pos < rank.length - 1) {\r\n                            rightBoundary = rank[pos + 1].layoutNode.boundingBox().left();\r\n                        }\r\n                        if (node.graph.numInEdges(node.id) > 0 && node.inConnectorBundles.length === 0 && (!node.isScopeNode || node.childGraphs[0].entryNode.inConnectorBundles.length === 0)) {\r\n                            let minPos = Number.POSITIVE_INFINITY;\r\n                            let maxPos = Number.NEGATIVE_INFINITY;\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.graph.inEdges(node.id), (edge) => {\r\n                                const dstPoint = getInPoint(node, edge);\r\n                                const dstProxyPoint = getInProxyPoint(node, dstPoint);\r\n                                if (dstPoint.y === dstProxyPoint.y) {\r\n                                    return;\r\n                                }\r\n                                const srcPoint = getOutPoint(node.graph.node(edge.src), edge);\r\n                                const intersection = dstPoint.clone().sub(dstPoint.clone().sub(srcPoint).setY(dstPoint.y - dstProxyPoint.y));\r\n                                minPos = Math.min(minPos, intersection.x);\r\n                                maxPos = Math.max(maxPos, intersection.x);\r\n                            });\r\n                            if (minPos > leftBoundary && maxPos < rightBoundary) {\r\n                                nodeHasInProxies[node.id] = false;\r\n                            }\r\n                        }\r\n                        if (node.graph.numOutEdges(node.id) > 0 && node.outConnectorBundles.length === 0 && (!node.isScopeNode || node.childGraphs[0].exitNode.outConnectorBundles.length === 0)) {\r\n                            let minPos = Number.POSITIVE_INFINITY;\r\n                            let maxPos = Number.NEGATIVE_INFINITY;\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.graph.outEdges(node.id), (edge) => {\r\n                                const srcPoint = getOutPoint(node, edge);\r\n                                const srcProxyPoint = getOutProxyPoint(node, srcPoint);\r\n                                if (srcPoint.y === srcProxyPoint.y) {\r\n                                    return;\r\n                                }\r\n                                const dstPoint = getInPoint(node.graph.node(edge.dst), edge);\r\n                                const intersection = srcPoint.clone().add(dstPoint.clone().sub(srcPoint).setY(srcProxyPoint.y - srcPoint.y));\r\n                                minPos = Math.min(minPos, intersection.x);\r\n                                maxPos = Math.max(maxPos, intersection.x);\r\n                            });\r\n                            if (minPos > leftBoundary && maxPos < rightBoundary) {\r\n                                nodeHasOutProxies[node.id] = false;\r\n                            }\r\n                        }\r\n                    });\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_MARK_NO_PROXIES);\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), (edge) => {\r\n                    if (edge.isReplica) {\r\n                        return; // replica edges are added with their primary\r\n                    }\r\n                    let startNode = subgraph.node(edge.src);\r\n                    if (startNode.isVirtual) {\r\n                        return; // do not assign points to this edge\r\n                    }\r\n                    let startHasOutProxies = nodeHasOutProxies[startNode.id];\r\n                    if (startNode.isScopeNode) {\r\n                        startNode = startNode.childGraphs[0].exitNode;\r\n                    }\r\n                    const startPoint = getOutPoint(startNode, edge);\r\n                    const startProxyPoint = (edge.srcBundle !== null ? edge.srcBundle.position() : getOutProxyPoint(startNode, startPoint));\r\n                    edge.points = [startPoint];\r\n                    if (startPoint.y !== startProxyPoint.y) {\r\n                        if (startHasOutProxies) {\r\n                            edge.points.push(startProxyPoint);\r\n                        }\r\n                        else if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(startNode.outConnectors, connector => !connector.isTemporary)) {\r\n                            edge.points.push(startPoint.clone().add(new _geometry_vector__WEBPACK_IMPORTED_MODULE_21__.default(0, _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2)));\r\n                        }\r\n                    }\r\n                    let nextNode = subgraph.node(edge.dst);\r\n                    let tmpEdge = null;\r\n                    while (nextNode.isVirtual || nextNode.isBundle) {\r\n                        const nextPoint = getInPoint(nextNode, edge);\r\n                        const nextInProxyPoint = getInProxyPoint(nextNode, nextPoint);\r\n                        const nextOutProxyPoint = getOutProxyPoint(nextNode, nextPoint);\r\n                        if (nextInProxyPoint.y !== nextPoint.y) {\r\n                            edge.points.push(nextInProxyPoint);\r\n                        }\r\n                        edge.points.push(nextPoint);\r\n                        if (nextOutProxyPoint.y !== nextPoint.y) {\r\n                            edge.points.push(nextOutProxyPoint);\r\n                        }\r\n                        tmpEdge = subgraph.outEdges(nextNode.id)[0];\r\n                        nextNode = subgraph.node(tmpEdge.dst);\r\n                    }\r\n                    let endNode = nextNode;\r\n                    let endHasInProxies = nodeHasInProxies[endNode.id];\r\n                    if (endNode.isScopeNode) {\r\n                        endNode = endNode.childGraphs[0].entryNode;\r\n                    }\r\n                    if (tmpEdge !== null) {\r\n                        edge.dstConnector = tmpEdge.dstConnector;\r\n                    }\r\n                    const endPoint = getInPoint(endNode, edge);\r\n                    const endProxyPoint = (edge.dstBundle !== null ? edge.dstBundle.position() : getInProxyPoint(endNode, endPoint));\r\n                    if (endProxyPoint.y !== endPoint.y) {\r\n                        if (endHasInProxies) {\r\n                            edge.points.push(endProxyPoint);\r\n                        }\r\n                        else if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(endNode.inConnectors, connector => !connector.isTemporary)) {\r\n                            edge.points.push(endPoint.clone().sub(new _geometry_vector__WEBPACK_IMPORTED_MODULE_21__.default(0, _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2)));\r\n                        }\r\n                    }\r\n                    edge.points.push(endPoint);\r\n                    // redirect edge from start to end\r\n                    if (tmpEdge !== null) {\r\n                        edge.graph.removeEdge(edge.id);\r\n                        edge.dst = tmpEdge.dst;\r\n                        edge.graph.addEdge(edge, edge.id);\r\n                    }\r\n                    // place replicas\r\n                    if (edge.srcBundle !== null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.srcBundle.edges, (bundleEdge) => {\r\n                            if (bundleEdge.isReplica) {\r\n                                bundleEdge.points = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(edge.points);\r\n                                bundleEdge.points[0] = getOutPoint(startNode, bundleEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                    if (edge.dstBundle !== null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.dstBundle.edges, (bundleEdge) => {\r\n                            if (bundleEdge.isReplica) {\r\n                                bundleEdge.points = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(edge.points);\r\n                                bundleEdge.points[bundleEdge.points.length - 1] = getInPoint(endNode, bundleEdge);\r\n                            }\r\n                        });\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_REMOVE_VIRTUAL);\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.clone(subgraph.nodes()), (node) => {\r\n                    // remove virtual nodes and edges\r\n                    if (node.isVirtual) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.inEdgesIds(node.id), (inEdgeId) => {\r\n                            subgraph.removeEdge(inEdgeId);\r\n                        });\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.outEdgesIds(node.id), (outEdgeId) => {\r\n                            subgraph.removeEdge(outEdgeId);\r\n                        });\r\n                        subgraph.removeNode(node.id);\r\n                    }\r\n                });\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_REMOVE_VIRTUAL);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_PLACE_EDGES);\r\n                // mark crossings for later angle optimization\r\n                if (this._options.optimizeAngles) {\r\n                    this._markCrossings(subgraph, segmentsPerRank, crossingsPerRank, rankTops, rankBottoms);\r\n                }\r\n                // set parent bounding box on last component\r\n                const parent = subgraph.parentNode;\r\n                if (parent !== null && subgraph === lodash__WEBPACK_IMPORTED_MODULE_2__.last(parent.childGraphs)) {\r\n                    let width = 0;\r\n                    let height = 0;\r\n                    let boundingBox;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(parent.childGraphs, (childGraph) => {\r\n                        boundingBox = childGraph.boundingBox();\r\n                        if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                            _util_assert__WEBPACK_IMPORTED_MODULE_4__.default.assertFiniteNumber(boundingBox.width, \"boundingBox has invalid width\");\r\n                        }\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(parent.outConnectors, connector => !connector.isTemporary)) {\r\n                            boundingBox.height -= _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2;\r\n                        }\r\n                        width += boundingBox.width + this._options.spaceBetweenComponents;\r\n                        height = Math.max(height, boundingBox.height);\r\n                    });\r\n                    width += 2 * parent.padding - this._options.spaceBetweenComponents;\r\n                    if (parent.selfLoop !== null) {\r\n                        // add space for self loop on right side\r\n                        width += this._options.targetEdgeLength;\r\n                    }\r\n                    height += 2 * subgraph.parentNode.padding;\r\n                    parent.updateSize({ width: width, height: height });\r\n                    if (parent.isScopeNode) {\r\n                        const left = boundingBox.x;\r\n                        subgraph.entryNode.setWidth(boundingBox.width);\r\n                        subgraph.entryNode.setPosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_21__.default(left, subgraph.entryNode.y));\r\n                        subgraph.exitNode.setWidth(boundingBox.width);\r\n                        subgraph.exitNode.setPosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_21__.default(left, subgraph.exitNode.y));\r\n                    }\r\n                }\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_CHANGE_PARENT_SIZE);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_PLACE_SUBGRAPH);\r\n            });\r\n            yield placeSubgraph(graph, 0);\r\n        });\r\n    }\r\n    _assignX(subgraph, offset = 0) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ASSIGN_X);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_GET_RANKS);\r\n            const levelGraph = subgraph.levelGraph();\r\n            const ranks = levelGraph.ranks();\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_GET_RANKS);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_ALIGN_MEDIAN);\r\n            let xAssignments;\r\n            if (this._options.webWorkers && this._options.maxWorkers >= 4) {\r\n                let numNodesPerRank, levelNodes, levelEdges;\r\n                const numNodesPerRankBuf = new this._bufferClass(Int32Array.BYTES_PER_ELEMENT * ranks.length);\r\n                numNodesPerRank = new Int32Array(numNodesPerRankBuf);\r\n                const levelNodesBuf = new this._bufferClass(Float64Array.BYTES_PER_ELEMENT * 4 * levelGraph.numNodes());\r\n                levelNodes = new Float64Array(levelNodesBuf);\r\n                const levelEdgesBuf = new this._bufferClass(Float64Array.BYTES_PER_ELEMENT * 3 * levelGraph.numEdges());\r\n                levelEdges = new Float64Array(levelEdgesBuf);\r\n                let n = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank, r) => {\r\n                    numNodesPerRank[r] = rank.length;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank, (node) => {\r\n                        levelNodes[n++] = node.id;\r\n                        levelNodes[n++] = node.layoutNode.width;\r\n                        levelNodes[n++] = node.isFirst;\r\n                        levelNodes[n++] = node.isLast;\r\n                    });\r\n                });\r\n                let e = 0;\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.edges(), (edge) => {\r\n                    levelEdges[e++] = edge.src;\r\n                    levelEdges[e++] = edge.dst;\r\n                    levelEdges[e++] = edge.weight;\r\n                });\r\n                const data = this._pool.setData([ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf]);\r\n                xAssignments = yield Promise.all([\r\n                    this._pool.exec(\"alignMedian\", [data, \"UP\", \"LEFT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [data, \"UP\", \"RIGHT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [data, \"DOWN\", \"LEFT\", this._options.spaceBetweenNodes])[1],\r\n                    this._pool.exec(\"alignMedian\", [data, \"DOWN\", \"RIGHT\", this._options.spaceBetweenNodes])[1],\r\n                ]);\r\n                this._pool.clearData(data);\r\n            }\r\n            else {\r\n                xAssignments = ([\r\n                    this._alignMedian(levelGraph, \"UP\", \"LEFT\"),\r\n                    this._alignMedian(levelGraph, \"UP\", \"RIGHT\"),\r\n                    this._alignMedian(levelGraph, \"DOWN\", \"LEFT\"),\r\n                    this._alignMedian(levelGraph, \"DOWN\", \"RIGHT\"),\r\n                ]);\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ALIGN_MEDIAN);\r\n            // align left-most and right-most nodes\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_MERGE);\r\n            let minMaxX = Number.POSITIVE_INFINITY;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(xAssignments, (xAssignment) => {\r\n                minMaxX = Math.min(minMaxX, lodash__WEBPACK_IMPORTED_MODULE_2__.max(xAssignment));\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach([1, 3], (i) => {\r\n                const xAssignment = xAssignments[i];\r\n                const maxX = lodash__WEBPACK_IMPORTED_MODULE_2__.max(xAssignment);\r\n                if (maxX === minMaxX) {\r\n                    return; // no need to adjust this graph\r\n                }\r\n                const diff = minMaxX - maxX;\r\n                for (let i = 0; i < xAssignment.length; ++i) {\r\n                    xAssignment[i] += diff;\r\n                }\r\n            });\r\n            let minX = Number.POSITIVE_INFINITY;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n                if (node.isFirst) {\r\n                    const xs = lodash__WEBPACK_IMPORTED_MODULE_2__.map(xAssignments, xAssignment => xAssignment[node.id]);\r\n                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(xs).asc();\r\n                    let x = (xs[1] + xs[2]) / 2;\r\n                    //x = xs[0]; // comment inPlaceSort and uncomment this line to see 1 of the 4 merged layouts\r\n                    x -= node.layoutNode.width / 2;\r\n                    minX = Math.min(minX, x);\r\n                    node.x = offset + x;\r\n                }\r\n            });\r\n            const diff = 0 - minX;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n                if (node.isFirst) {\r\n                    node.x += diff;\r\n                    node.layoutNode.updatePosition(new _geometry_vector__WEBPACK_IMPORTED_MODULE_21__.default(node.x, node.layoutNode.y));\r\n                }\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_MERGE);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_ASSIGN_X);\r\n        });\r\n    }\r\n    _alignMedian(levelGraph, neighborDir, preference) {\r\n        const ranks = levelGraph.ranks();\r\n        const firstRank = (neighborDir === \"UP\" ? 1 : (ranks.length - 2));\r\n        const lastRank = (neighborDir === \"UP\" ? (ranks.length - 1) : 0);\r\n        const verticalDir = (neighborDir === \"UP\" ? 1 : -1);\r\n        const neighborOutMethod = (neighborDir === \"UP\" ? \"outEdges\" : \"inEdges\");\r\n        const neighborInMethod = (neighborDir === \"UP\" ? \"inEdges\" : \"outEdges\");\r\n        const neighborEdgeInAttr = (neighborDir === \"UP\" ? \"dst\" : \"src\");\r\n        const blockPerNode = new Array(levelGraph.maxId() + 1);\r\n        const nodesPerBlock = new Array(levelGraph.maxId() + 1);\r\n        const blockWidths = new Array(levelGraph.maxId() + 1);\r\n        const blockGraph = new _rank_rankGraph__WEBPACK_IMPORTED_MODULE_15__.default();\r\n        const maxWidth = levelGraph.maxWidth();\r\n        const neighbors = new Array(maxWidth);\r\n        const neighborsUsable = new Array(maxWidth);\r\n        for (let n = 0; n < maxWidth; ++n) {\r\n            neighbors[n] = [];\r\n            neighborsUsable[n] = [];\r\n        }\r\n        // every node of the first rank is a block on its own\r\n        const r = firstRank - verticalDir;\r\n        let blockId = 0;\r\n        for (let n = 0; n < ranks[r].length; ++n) {\r\n            blockGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(blockId.toString()));\r\n            blockPerNode[ranks[r][n].id] = blockId;\r\n            nodesPerBlock[blockId] = [ranks[r][n].id];\r\n            blockWidths[blockId] = ranks[r][n].layoutNode.width;\r\n            blockId++;\r\n        }\r\n        for (let n = 1; n < ranks[r].length; ++n) {\r\n            const edgeLength = (ranks[r][n - 1].layoutNode.width + ranks[r][n].layoutNode.width) / 2 + this._options.spaceBetweenNodes;\r\n            blockGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));\r\n        }\r\n        for (let r = firstRank; r - verticalDir !== lastRank; r += verticalDir) {\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_CREATE_NEIGHBOR_LIST);\r\n            // create sorted list of neighbors\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r], (node, n) => {\r\n                neighbors[n].length = 0;\r\n                neighborsUsable[n].length = 0;\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r - verticalDir], (neighbor, n) => {\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph[neighborOutMethod](neighbor.id), (edge) => {\r\n                    const node = levelGraph.node(edge[neighborEdgeInAttr]);\r\n                    neighbors[node.position].push(n);\r\n                });\r\n            });\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_CREATE_NEIGHBOR_LIST);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_MARK_CONFLICTS);\r\n            // mark segments that cross a heavy segment as non-usable\r\n            let heavyLeft = -1;\r\n            let n = 0;\r\n            for (let tmpN = 0; tmpN < ranks[r].length; ++tmpN) {\r\n                const hasHeavy = lodash__WEBPACK_IMPORTED_MODULE_2__.some(levelGraph[neighborInMethod](ranks[r][tmpN].id), edge => edge.weight === Number.POSITIVE_INFINITY);\r\n                if (tmpN === ranks[r].length - 1 || hasHeavy) {\r\n                    let heavyRight = ranks[r - verticalDir].length;\r\n                    if (hasHeavy) {\r\n                        heavyRight = neighbors[tmpN][0];\r\n                    }\r\n                    while (n <= tmpN) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[n], (neighborPos, neighborIndex) => {\r\n                            neighborsUsable[n][neighborIndex] = neighborPos >= heavyLeft && neighborPos <= heavyRight;\r\n                        });\r\n                        n++;\r\n                    }\r\n                    heavyLeft = heavyRight;\r\n                }\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_MARK_CONFLICTS);\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_FIND_NEIGHBOR);\r\n            let maxNeighborTaken = (preference === \"LEFT\" ? Number.NEGATIVE_INFINITY : Number.POSITIVE_INFINITY);\r\n            const compare = (preference === \"LEFT\" ? ((a, b) => a < b) : ((a, b) => a > b));\r\n            const nMin = (preference === \"LEFT\" ? 0 : ranks[r].length - 1);\r\n            const nMax = (preference === \"LEFT\" ? ranks[r].length - 1 : 0);\r\n            const horizontalDir = (preference === \"LEFT\" ? 1 : -1);\r\n            for (let n = nMin; n - horizontalDir !== nMax; n += horizontalDir) {\r\n                let neighbor = null;\r\n                if (neighbors[n].length > 0) {\r\n                    const leftMedian = Math.floor((neighbors[n].length - 1) / 2);\r\n                    const rightMedian = Math.floor((neighbors[n].length) / 2);\r\n                    const tryOrder = (preference === \"LEFT\" ? [leftMedian, rightMedian] : [rightMedian, leftMedian]);\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tryOrder, (neighborIndex) => {\r\n                        if (neighbor !== null) {\r\n                            return; // already found\r\n                        }\r\n                        if (neighborsUsable[n][neighborIndex] && compare(maxNeighborTaken, neighbors[n][neighborIndex])) {\r\n                            neighbor = ranks[r - verticalDir][neighbors[n][neighborIndex]];\r\n                            maxNeighborTaken = neighbors[n][neighborIndex];\r\n                        }\r\n                    });\r\n                }\r\n                if (neighbor === null) {\r\n                    blockGraph.addNode(new _rank_rankNode__WEBPACK_IMPORTED_MODULE_16__.default(blockId.toString()));\r\n                    blockPerNode[ranks[r][n].id] = blockId;\r\n                    nodesPerBlock[blockId] = [ranks[r][n].id];\r\n                    blockWidths[blockId] = ranks[r][n].layoutNode.width;\r\n                    blockId++;\r\n                }\r\n                else {\r\n                    const blockId = blockPerNode[neighbor.id];\r\n                    blockPerNode[ranks[r][n].id] = blockId;\r\n                    nodesPerBlock[blockId].push(ranks[r][n].id);\r\n                    blockWidths[blockId] = Math.max(blockWidths[blockId], ranks[r][n].layoutNode.width);\r\n                }\r\n            }\r\n            for (let n = 1; n < ranks[r].length; ++n) {\r\n                const edgeLength = (ranks[r][n - 1].layoutNode.width + ranks[r][n].layoutNode.width) / 2 + this._options.spaceBetweenNodes;\r\n                blockGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_6__.default(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_FIND_NEIGHBOR);\r\n        }\r\n        const xAssignment = new Array(levelGraph.maxId() + 1);\r\n        // compact\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.start(TIMER_RANK);\r\n        blockGraph.rank();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(levelGraph.nodes(), (node) => {\r\n            xAssignment[node.id] = blockGraph.node(blockPerNode[node.id]).rank;\r\n        });\r\n        _util_timer__WEBPACK_IMPORTED_MODULE_20__.default.stop(TIMER_RANK);\r\n        return xAssignment;\r\n    }\r\n    _placeConnectors(node, rankTops, rankBottoms) {\r\n        if (node.inConnectors.length === 0 && node.outConnectors.length === 0) {\r\n            return; // no connectors\r\n        }\r\n        let tmpInConnectors = [];\r\n        let tmpOutConnectors = [];\r\n        const SPACE = _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING;\r\n        const SIZE = _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE;\r\n        const inY = node.y - SIZE / 2;\r\n        const outY = node.y + node.height - SIZE / 2;\r\n        let inPointer = 0;\r\n        let outPointer = 0;\r\n        let x = node.x;\r\n        /**\r\n         * Places simple in- and out-connectors between tunnel connectors\r\n         * @param x\r\n         * @param tmpInConnectors\r\n         * @param tmpOutConnectors\r\n         */\r\n        const placeTmpConnectors = (x, tmpInConnectors, tmpOutConnectors) => {\r\n            let length = Math.max(tmpInConnectors.length, tmpOutConnectors.length) * (SIZE + SPACE) - SPACE;\r\n            let inSpace = SPACE;\r\n            let inOffset = 0;\r\n            if (tmpInConnectors.length < tmpOutConnectors.length) {\r\n                inSpace = (length - (tmpInConnectors.length * SIZE)) / (tmpInConnectors.length + 1);\r\n                inOffset = inSpace;\r\n            }\r\n            let outSpace = SPACE;\r\n            let outOffset = 0;\r\n            if (tmpOutConnectors.length < tmpInConnectors.length) {\r\n                outSpace = (length - (tmpOutConnectors.length * SIZE)) / (tmpOutConnectors.length + 1);\r\n                outOffset = outSpace;\r\n            }\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpInConnectors, (connector, i) => {\r\n                connector.x = x + inOffset + i * (inSpace + SIZE);\r\n                connector.y = inY;\r\n            });\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpOutConnectors, (connector, i) => {\r\n                connector.x = x + outOffset + i * (outSpace + SIZE);\r\n                connector.y = outY;\r\n            });\r\n            return x + length + SPACE;\r\n        };\r\n        while (inPointer < node.inConnectors.length || outPointer < node.outConnectors.length) {\r\n            if (inPointer === node.inConnectors.length) {\r\n                // only out connectors left\r\n                tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n            }\r\n            else if (outPointer === node.outConnectors.length) {\r\n                // only in connectors left\r\n                tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n            }\r\n            else {\r\n                let scoped = false;\r\n                if (node.inConnectors[inPointer].isScoped) {\r\n                    scoped = true;\r\n                    while (!node.outConnectors[outPointer].isScoped) {\r\n                        tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n                    }\r\n                }\r\n                else if (node.outConnectors[outPointer].isScoped) {\r\n                    scoped = true;\r\n                    while (!node.inConnectors[inPointer].isScoped) {\r\n                        tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n                    }\r\n                }\r\n                else {\r\n                    tmpInConnectors.push(node.inConnectors[inPointer++]);\r\n                    tmpOutConnectors.push(node.outConnectors[outPointer++]);\r\n                }\r\n                if (scoped) {\r\n                    x = placeTmpConnectors(x, tmpInConnectors, tmpOutConnectors);\r\n                    let scopedConnectorIn = node.inConnectors[inPointer++];\r\n                    scopedConnectorIn.x = x;\r\n                    scopedConnectorIn.y = inY;\r\n                    let scopedConnectorOut = node.outConnectors[outPointer++];\r\n                    scopedConnectorOut.x = x;\r\n                    scopedConnectorOut.y = outY;\r\n                    x += SIZE + SPACE;\r\n                    tmpInConnectors = [];\r\n                    tmpOutConnectors = [];\r\n                }\r\n            }\r\n        }\r\n        placeTmpConnectors(x, tmpInConnectors, tmpOutConnectors);\r\n        let auxBox = new _geometry_box__WEBPACK_IMPORTED_MODULE_5__.default(node.x, node.y, Math.max(node.inConnectors.length, node.outConnectors.length) * (SPACE + SIZE) - SPACE, SIZE).centerIn(node.boundingBox());\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.connectors(), (connector) => {\r\n            connector.translate(auxBox.x - node.x + (connector.isTemporary ? SPACE / 2 : 0), connector.isTemporary ? SPACE / 2 : 0);\r\n        });\r\n        // place bundles\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.inConnectorBundles, (inBundle) => {\r\n            const top = rankTops[node.rank];\r\n            inBundle.y = Math.min(top, node.y - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2 - this._options.targetEdgeLength / 3);\r\n            inBundle.x = lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(inBundle.connectors, (name) => node.connector(\"IN\", name).x)) + SIZE / 2;\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(node.outConnectorBundles, (outBundle) => {\r\n            const bottom = rankBottoms[node.rank + node.rankSpan - 1];\r\n            outBundle.y = Math.max(bottom, node.y + node.height + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE / 2 + this._options.targetEdgeLength / 3);\r\n            outBundle.x = lodash__WEBPACK_IMPORTED_MODULE_2__.mean(lodash__WEBPACK_IMPORTED_MODULE_2__.map(outBundle.connectors, (name) => node.connector(\"OUT\", name).x)) + SIZE / 2;\r\n        });\r\n    }\r\n    _markCrossings(subgraph, segmentsPerRank, crossingsPerRank, rankTops, rankBottoms) {\r\n        const newSegmentsPerRank = new Array(rankTops.length);\r\n        for (let r = 1; r < rankTops.length; ++r) {\r\n            newSegmentsPerRank[r] = [];\r\n        }\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(subgraph.edges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.rawSegments(), (segment) => {\r\n                let startRank = lodash__WEBPACK_IMPORTED_MODULE_2__.sortedIndex(rankBottoms, segment.start.y);\r\n                if ((startRank < rankTops.length - 1) && (segment.end.y >= rankTops[startRank + 1])) {\r\n                    let start = segment.start.clone();\r\n                    if (segment.start.y < rankBottoms[startRank]) {\r\n                        start.add(segment.vector().setY(rankBottoms[startRank] - segment.start.y));\r\n                    }\r\n                    let end = segment.end.clone();\r\n                    if (segment.end.y > rankTops[startRank + 1]) {\r\n                        end = start.clone().add(segment.vector().setY(this._options.targetEdgeLength));\r\n                    }\r\n                    segment = new _geometry_segment__WEBPACK_IMPORTED_MODULE_17__.default(start, end);\r\n                    newSegmentsPerRank[startRank + 1].push(segment);\r\n                    segmentsPerRank[startRank + 1].push(segment);\r\n                }\r\n            });\r\n        });\r\n        // the grid only tests segments that are close to each other, a sweep over x would test all overlapping pairs\r\n        for (let r = 1; r < rankTops.length; ++r) {\r\n            const segments = newSegmentsPerRank[r];\r\n            if (segments.length > 1) {\r\n                new _geometry_segmentGrid__WEBPACK_IMPORTED_MODULE_18__.default(segments).forEachCrossing((i, j) => {\r\n                    crossingsPerRank[r].push([segments[j], segments[i]]);\r\n                });\r\n            }\r\n        }\r\n    }\r\n    _optimizeAngles(layoutGraph, rankTops, segmentsPerRank, crossingsPerRank) {\r\n        const forces = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(crossingsPerRank, (crossings, r) => {\r\n            if (crossings.length > 0) {\r\n                const deltaXs = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(crossings, ([segmentA, segmentB]) => {\r\n                    const vectorA = segmentA.vector();\r\n                    const vectorB = segmentB.vector();\r\n                    deltaXs.push([vectorA.x, vectorB.x]);\r\n                });\r\n                const allDeltaXsSquared = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(segmentsPerRank[r], (segment) => {\r\n                    const vector = segment.vector();\r\n                    allDeltaXsSquared.push(vector.x * vector.x);\r\n                });\r\n                let min = this._options.targetEdgeLength / 2;\r\n                let max = 2 * this._options.targetEdgeLength;\r\n                let minCost = Number.POSITIVE_INFINITY;\r\n                let best;\r\n                for (let deltaY = min; deltaY <= max; ++deltaY) {\r\n                    let cost = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(deltaXs, ([deltaXA, deltaXB]) => {\r\n                        const angle = Math.atan2(deltaY, deltaXA) - Math.atan2(deltaY, deltaXB);\r\n                        cost += this._options.weightCrossings * (Math.cos(2 * angle) + 1) / 2;\r\n                    });\r\n                    const deltaYSquared = deltaY * deltaY;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(allDeltaXsSquared, deltaXSquared => {\r\n                        cost += this._options.weightLengths * Math.sqrt(deltaYSquared + deltaXSquared) / this._options.targetEdgeLength;\r\n                    });\r\n                    if (cost < minCost) {\r\n                        minCost = cost;\r\n                        best = deltaY;\r\n                    }\r\n                }\r\n                const diff = best - this._options.targetEdgeLength;\r\n                if (diff >= 1) {\r\n                    forces.push([rankTops[r] - 1, diff]);\r\n                }\r\n            }\r\n        });\r\n        const points = [];\r\n        const oldTops = new Map();\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutGraph.allNodes(), (node) => {\r\n            points.push([node.y, \"NODE\", node, \"TOP\"]);\r\n            points.push([node.y + node.height, \"NODE\", node, \"BOTTOM\"]);\r\n            oldTops.set(node, node.y);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(layoutGraph.allEdges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(edge.points, (point, i) => {\r\n                points.push([point.y, \"EDGE\", edge, i]);\r\n            });\r\n        });\r\n        const pointsSorted = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(points, \"0\"); // sort by y\r\n        let forcePointer = 0;\r\n        let totalForce = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(pointsSorted, ([pointY, type, object, position]) => {\r\n            while (forcePointer < forces.length && forces[forcePointer][0] < pointY) {\r\n                totalForce += forces[forcePointer][1];\r\n                forcePointer++;\r\n            }\r\n            if (type === \"NODE\") {\r\n                if (position === \"TOP\") {\r\n                    object.translateWithoutChildren(0, totalForce);\r\n                }\r\n                else { // \"BOTTOM\"\r\n                    const oldHeight = object.height;\r\n                    // new height = old height + total force + old top - new top\r\n                    object.height += totalForce + oldTops.get(object) - object.y;\r\n                    const heightDiff = object.height - oldHeight;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(object.outConnectors, (connector) => {\r\n                        connector.y += heightDiff;\r\n                    });\r\n                }\r\n            }\r\n            else { // \"EDGE\"\r\n                object.points[position].y += totalForce;\r\n            }\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/layouter/sugiyamaLayouter.ts?");
 
 /***/ }),
 
@@ -3791,7 +3813,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ OrderGraph)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _graph_graph__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../graph/graph */ \"./src/graph/graph.ts\");\n/* harmony import */ var _orderGroup__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ./orderGroup */ \"./src/order/orderGroup.ts\");\n/* harmony import */ var _orderNode__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ./orderNode */ \"./src/order/orderNode.ts\");\n/* harmony import */ var _orderRank__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ./orderRank */ \"./src/order/orderRank.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass OrderGraph {\r\n    constructor(wasm = null) {\r\n        this._groupEdgesAdded = false;\r\n        this._rankGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._groupGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._nodeGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._wasm = wasm;\r\n    }\r\n    toString() {\r\n        const obj = {\r\n            nodes: {},\r\n            edges: [],\r\n        };\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(this.groups(), \"position\"), (group) => {\r\n            obj.nodes[group.id] = {\r\n                label: group.label(),\r\n                child: {\r\n                    nodes: {},\r\n                    edges: [],\r\n                },\r\n            };\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.orderedNodes(), (node) => {\r\n                obj.nodes[group.id].child.nodes[node.id] = {\r\n                    label: node.label(),\r\n                    child: null\r\n                };\r\n            });\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this.groupEdges(), (edge) => {\r\n            obj.edges.push({ src: edge.src, dst: edge.dst, weight: edge.weight });\r\n        });\r\n        return JSON.stringify(obj);\r\n    }\r\n    addRank(rank, id = null) {\r\n        rank.orderGraph = this;\r\n        return this._rankGraph.addNode(rank, id);\r\n    }\r\n    addGroup(group, id = null) {\r\n        return this._groupGraph.addNode(group, id);\r\n    }\r\n    addNode(node, id = null) {\r\n        return this._nodeGraph.addNode(node, id);\r\n    }\r\n    addEdge(edge, id = null) {\r\n        return this._nodeGraph.addEdge(edge, id);\r\n    }\r\n    removeEdge(id) {\r\n        this._nodeGraph.removeEdge(id);\r\n    }\r\n    _addGroupEdges() {\r\n        if (!this._groupEdgesAdded) {\r\n            this._groupEdgesAdded = true;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this._nodeGraph.edges(), (edge) => {\r\n                const srcGroupId = this._nodeGraph.node(edge.src).group.id;\r\n                const dstGroupId = this._nodeGraph.node(edge.dst).group.id;\r\n                const groupEdge = this._groupGraph.edgeBetween(srcGroupId, dstGroupId);\r\n                if (groupEdge === undefined) {\r\n                    this._groupGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcGroupId, dstGroupId, edge.weight));\r\n                }\r\n                else {\r\n                    groupEdge.weight += edge.weight;\r\n                }\r\n            });\r\n        }\r\n    }\r\n    _addRankEdges() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this._groupGraph.edges(), (edge) => {\r\n            const srcRankId = this._groupGraph.node(edge.src).rank.id;\r\n            const dstRankId = this._groupGraph.node(edge.dst).rank.id;\r\n            if (!this._rankGraph.hasEdge(srcRankId, dstRankId)) {\r\n                this._rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcRankId, dstRankId));\r\n            }\r\n        });\r\n    }\r\n    node(id) {\r\n        return this._nodeGraph.node(id);\r\n    }\r\n    group(id) {\r\n        return this._groupGraph.node(id);\r\n    }\r\n    nodes() {\r\n        return this._nodeGraph.nodes();\r\n    }\r\n    groups() {\r\n        return this._groupGraph.nodes();\r\n    }\r\n    ranks() {\r\n        return this._rankGraph.toposort();\r\n    }\r\n    edges() {\r\n        return this._nodeGraph.edges();\r\n    }\r\n    inEdges(id) {\r\n        return this._nodeGraph.inEdges(id);\r\n    }\r\n    outEdges(id) {\r\n        return this._nodeGraph.outEdges(id);\r\n    }\r\n    inNeighbors(id) {\r\n        return this._nodeGraph.inNeighbors(id);\r\n    }\r\n    outNeighbors(id) {\r\n        return this._nodeGraph.outNeighbors(id);\r\n    }\r\n    incidentEdges(id) {\r\n        return this._nodeGraph.incidentEdges(id);\r\n    }\r\n    edgeBetween(srcId, dstId) {\r\n        return this._nodeGraph.edgeBetween(srcId, dstId);\r\n    }\r\n    maxId() {\r\n        return this._nodeGraph.maxId();\r\n    }\r\n    groupEdges() {\r\n        this._addGroupEdges();\r\n        return this._groupGraph.edges();\r\n    }\r\n    order(options = {}) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (this._nodeGraph.numNodes() === 0) {\r\n                return;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\"]);\r\n            options = lodash__WEBPACK_IMPORTED_MODULE_2__.defaults(options, {\r\n                method: \"barycenter\",\r\n                countOnly: false,\r\n                orderGroups: false,\r\n                countInitial: false,\r\n                resolveConflicts: true,\r\n                resolveX: true,\r\n            });\r\n            let groupOffsetsPos, numNodesPerGroup, groupOrder, groupPositions, order, positions, neighbors, crossings, virtual, intranode, intranodePathEnd, moving, sink, rankWidths, numEdgesPerRank, moved, tmpOrder;\r\n            const doOrderSprings = (graph) => __awaiter(this, void 0, void 0, function* () {\r\n                // store new positions\r\n                const ranks = graph._rankGraph.toposort();\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.groups, (group) => {\r\n                        group.orderNodesByX();\r\n                    });\r\n                    rank.orderGroupsByX();\r\n                });\r\n            });\r\n            const doOrder = (graph) => __awaiter(this, void 0, void 0, function* () {\r\n                const assertOrderAndPositionCoherence = (r = null) => {\r\n                    if (r === null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.range(ranks.length), r => assertOrderAndPositionCoherence(r));\r\n                        return;\r\n                    }\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(order[r], (nodeId, pos) => positions[nodeId] === pos, \"positions and orders do not match\");\r\n                };\r\n                const assertEdgesBetweenNeighboringRanks = () => {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(this.edges(), edge => {\r\n                        return this.node(edge.src).rank + 1 === this.node(edge.dst).rank;\r\n                    }, \"edge not between neighboring ranks\");\r\n                };\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\"]);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"setup\"]);\r\n                const numRanks = graph._rankGraph.numNodes();\r\n                let minRank = Number.POSITIVE_INFINITY;\r\n                const ranks = graph._rankGraph.toposort();\r\n                groupOrder.length = numRanks;\r\n                order.length = numRanks;\r\n                crossings.length = numRanks;\r\n                numEdgesPerRank.length = numRanks;\r\n                let maxEdgesPerRank = 0;\r\n                let maxEdgeWeight = 0;\r\n                // set neighbors\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank, r) => {\r\n                    let offset = 0;\r\n                    minRank = Math.min(minRank, rank.rank);\r\n                    order[r] = new Array(lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(rank.groups, group => numNodesPerGroup[group.id])));\r\n                    groupOrder[r] = new Array(rank.groups.length);\r\n                    crossings[r] = Number.POSITIVE_INFINITY;\r\n                    numEdgesPerRank[r] = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.orderedGroups(), (group, groupPos) => {\r\n                        groupOffsetsPos[group.id] = offset;\r\n                        numNodesPerGroup[group.id] = group.nodes.length;\r\n                        offset += group.nodes.length;\r\n                        groupOrder[r][groupPos] = group.id;\r\n                        groupPositions[group.id] = groupPos;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.orderedNodes(), (node, posInGroup) => {\r\n                            node.rank = r;\r\n                            const pos = groupOffsetsPos[group.id] + posInGroup;\r\n                            order[r][pos] = node.id;\r\n                            positions[node.id] = pos;\r\n                            neighbors[0][node.id] = [];\r\n                            neighbors[1][node.id] = [];\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph._nodeGraph.inEdges(node.id), (edge) => {\r\n                                neighbors[0][node.id].push({\r\n                                    end: edge.src,\r\n                                    weight: edge.weight,\r\n                                });\r\n                                maxEdgeWeight = Math.max(maxEdgeWeight, edge.weight === Number.POSITIVE_INFINITY ? 1 : edge.weight);\r\n                            });\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph._nodeGraph.outEdges(node.id), (edge) => {\r\n                                neighbors[1][node.id].push({\r\n                                    end: edge.dst,\r\n                                    weight: edge.weight,\r\n                                });\r\n                            });\r\n                            numEdgesPerRank[r] += graph._nodeGraph.numInEdges(node.id);\r\n                        });\r\n                    });\r\n                    maxEdgesPerRank = Math.max(maxEdgesPerRank, numEdgesPerRank[r]);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        assertOrderAndPositionCoherence(r);\r\n                    }\r\n                });\r\n                crossings[0] = 0;\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"setup\"]);\r\n                const countCrossings = (testOrder, r, direction = 0, preventConflicts = false) => {\r\n                    if (preventConflicts) {\r\n                        const originalOrder = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(order[r]);\r\n                        order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(testOrder);\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        let hasConflict = false;\r\n                        if (r > 0) {\r\n                            hasConflict = hasConflict || (getConflict(\"HEAVYHEAVY\", r) !== null) || (getConflict(\"HEAVYLIGHT\", r) !== null);\r\n                        }\r\n                        if (r < ranks.length - 1) {\r\n                            hasConflict = hasConflict || (getConflict(\"HEAVYHEAVY\", r + 1) !== null) || (getConflict(\"HEAVYLIGHT\", r + 1) !== null);\r\n                        }\r\n                        order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(originalOrder);\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        if (hasConflict) {\r\n                            return Number.POSITIVE_INFINITY;\r\n                        }\r\n                    }\r\n                    const edges = [];\r\n                    const northR = (direction === 0 ? (r - 1) : (r + 1));\r\n                    for (let southPos = 0; southPos < testOrder.length; ++southPos) {\r\n                        const southNodeId = testOrder[southPos];\r\n                        for (let neighbor = 0; neighbor < neighbors[direction][southNodeId].length; ++neighbor) {\r\n                            let weight = neighbors[direction][southNodeId][neighbor].weight;\r\n                            if (weight === Number.POSITIVE_INFINITY) {\r\n                                weight = 1;\r\n                            }\r\n                            edges.push([southPos, positions[neighbors[direction][southNodeId][neighbor].end], weight]);\r\n                        }\r\n                    }\r\n                    // north and south are swapped compared to the _countCrossings signature\r\n                    // result is the same, but this is faster in ordering the edges\r\n                    return this._countCrossings(testOrder.length, order[northR].length, edges);\r\n                };\r\n                const changeNodePosInOrder = (oldOrder, oldPos, newPos) => {\r\n                    const newOrder = new Array(oldOrder.length);\r\n                    if (oldPos < newPos) {\r\n                        for (let pos = 0; pos < oldPos; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                        for (let pos = oldPos + 1; pos <= newPos; ++pos) {\r\n                            newOrder[pos - 1] = oldOrder[pos];\r\n                        }\r\n                        newOrder[newPos] = oldOrder[oldPos];\r\n                        for (let pos = newPos + 1; pos < oldOrder.length; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                    }\r\n                    else {\r\n                        for (let pos = 0; pos < newPos; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                        newOrder[newPos] = oldOrder[oldPos];\r\n                        for (let pos = newPos; pos < oldPos; ++pos) {\r\n                            newOrder[pos + 1] = oldOrder[pos];\r\n                        }\r\n                        for (let pos = oldPos + 1; pos < oldOrder.length; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                    }\r\n                    return newOrder;\r\n                };\r\n                /**\r\n                 * Sweeps the ranks up and down and reorders the nodes according to the barycenter heuristic\r\n                 * @param preventConflicts\r\n                 */\r\n                const reorder = (preventConflicts = false) => {\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"reorder\"]);\r\n                    const multiplicator = maxEdgeWeight * maxEdgesPerRank + 1;\r\n                    let boolDirection = 1;\r\n                    let boolOppositeDirection = 0;\r\n                    let signDirection = 1;\r\n                    let minCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                    let improveCounter = 2;\r\n                    while (improveCounter > 0) {\r\n                        improveCounter--;\r\n                        let firstRank = boolDirection ? 1 : ranks.length - 2;\r\n                        let lastRank = boolDirection ? ranks.length - 1 : 0;\r\n                        const crossingOffsetNorth = boolDirection ? 0 : 1;\r\n                        const crossingOffsetSouth = boolDirection ? 1 : 0;\r\n                        const northDirection = boolDirection ? 0 : 1;\r\n                        const southDirection = boolDirection ? 1 : 0;\r\n                        for (let r = firstRank; r - signDirection !== lastRank; r += signDirection) {\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                assertOrderAndPositionCoherence(r);\r\n                            }\r\n                            if (crossings[r + crossingOffsetNorth] === 0) {\r\n                                // no need to reorder\r\n                                continue;\r\n                            }\r\n                            const tryNewOrder = (newOrder) => {\r\n                                // count crossings with new order\r\n                                const prevCrossingsNorth = crossings[r + crossingOffsetNorth];\r\n                                const newCrossingsNorth = countCrossings(newOrder, r, northDirection, preventConflicts);\r\n                                let newCrossingsSouth = 0;\r\n                                let prevCrossingsSouth = 0;\r\n                                if (r !== lastRank) {\r\n                                    prevCrossingsSouth = crossings[r + crossingOffsetSouth];\r\n                                    newCrossingsSouth = countCrossings(newOrder, r, southDirection, preventConflicts);\r\n                                }\r\n                                const fewerCrossingsNorth = newCrossingsNorth < prevCrossingsNorth;\r\n                                if (fewerCrossingsNorth) {\r\n                                    crossings[r + crossingOffsetNorth] = newCrossingsNorth;\r\n                                    if (r !== lastRank) {\r\n                                        crossings[r + crossingOffsetSouth] = newCrossingsSouth;\r\n                                    }\r\n                                    order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(newOrder);\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                                        positions[nodeId] = pos;\r\n                                    });\r\n                                    const fewerCrossingsTotal = (newCrossingsNorth + newCrossingsSouth < prevCrossingsNorth + prevCrossingsSouth);\r\n                                    return (1 + (fewerCrossingsTotal ? 1 : 0));\r\n                                }\r\n                                else {\r\n                                    return 0;\r\n                                }\r\n                            };\r\n                            const newNodeOrder = new Array(order[r].length);\r\n                            let hasChanged = true;\r\n                            while (hasChanged) {\r\n                                hasChanged = false;\r\n                                let groupMeans = [];\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupOrder[r], (groupId) => {\r\n                                    // calculate mean position of neighbors\r\n                                    let nodeMeans = [];\r\n                                    let groupSum = 0;\r\n                                    let groupNum = 0;\r\n                                    for (let pos = groupOffsetsPos[groupId]; pos < groupOffsetsPos[groupId] + numNodesPerGroup[groupId]; ++pos) {\r\n                                        const nodeId = order[r][pos];\r\n                                        let sum = 0;\r\n                                        let num = 0;\r\n                                        for (let neighbor = 0; neighbor < neighbors[boolOppositeDirection][nodeId].length; ++neighbor) {\r\n                                            let weight = neighbors[boolOppositeDirection][nodeId][neighbor].weight;\r\n                                            if (weight === Number.POSITIVE_INFINITY) {\r\n                                                weight = 1;\r\n                                            }\r\n                                            const neighborPos = positions[neighbors[boolOppositeDirection][nodeId][neighbor].end];\r\n                                            sum += weight * neighborPos;\r\n                                            num += weight;\r\n                                        }\r\n                                        if (num > 0) {\r\n                                            nodeMeans.push([nodeId, multiplicator * sum / num + pos]);\r\n                                        }\r\n                                        else {\r\n                                            nodeMeans.push([nodeId, multiplicator * pos + pos]);\r\n                                        }\r\n                                        groupSum += sum;\r\n                                        groupNum += num;\r\n                                    }\r\n                                    // sort by the means\r\n                                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(nodeMeans).asc(pair => pair[1]);\r\n                                    for (let posInGroup = 0; posInGroup < numNodesPerGroup[groupId]; ++posInGroup) {\r\n                                        newNodeOrder[groupOffsetsPos[groupId] + posInGroup] = nodeMeans[posInGroup][0];\r\n                                    }\r\n                                    if (groupNum > 0) {\r\n                                        groupMeans.push([groupId, multiplicator * groupSum / groupNum + groupPositions[groupId]]);\r\n                                    }\r\n                                    else {\r\n                                        groupMeans.push([groupId, multiplicator * groupPositions[groupId] + groupPositions[groupId]]);\r\n                                    }\r\n                                });\r\n                                if (options[\"orderGroups\"]) {\r\n                                    // reorder groups\r\n                                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(groupMeans).asc(pair => pair[1]);\r\n                                    const newGroupOrder = lodash__WEBPACK_IMPORTED_MODULE_2__.map(groupMeans, \"0\");\r\n                                    const changes = this._getChanges(newGroupOrder, groupPositions);\r\n                                    for (let c = 0; c < changes.length; ++c) {\r\n                                        const tmpGroupOrder = new Array(order[r]);\r\n                                        for (let pos = 0; pos < groupOrder[r].length; ++pos) {\r\n                                            tmpGroupOrder[pos] = groupOrder[r][pos];\r\n                                        }\r\n                                        for (let pos = changes[c][0]; pos <= changes[c][1]; ++pos) {\r\n                                            tmpGroupOrder[pos] = newGroupOrder[pos];\r\n                                        }\r\n                                        // transform new group order to node order\r\n                                        const tmpOrder = [];\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpGroupOrder, (groupId) => {\r\n                                            for (let posInGroup = 0; posInGroup < numNodesPerGroup[groupId]; ++posInGroup) {\r\n                                                tmpOrder.push(order[r][groupOffsetsPos[groupId] + posInGroup]);\r\n                                            }\r\n                                        });\r\n                                        const result = tryNewOrder(tmpOrder);\r\n                                        if (result > 0) {\r\n                                            // store new group order\r\n                                            groupOrder[r] = tmpGroupOrder;\r\n                                            this._setGroupPositionAndOffset(groupOrder[r], groupPositions, groupOffsetsPos, numNodesPerGroup);\r\n                                            hasChanged = true;\r\n                                        }\r\n                                    }\r\n                                }\r\n                                if (!hasChanged) {\r\n                                    // reorder nodes\r\n                                    const changes = this._getChanges(newNodeOrder, positions);\r\n                                    for (let c = 0; c < changes.length; ++c) {\r\n                                        const tmpOrder = new Array(order[r]);\r\n                                        for (let pos = 0; pos < order[r].length; ++pos) {\r\n                                            tmpOrder[pos] = order[r][pos];\r\n                                        }\r\n                                        for (let pos = changes[c][0]; pos <= changes[c][1]; ++pos) {\r\n                                            tmpOrder[pos] = newNodeOrder[pos];\r\n                                        }\r\n                                        const result = tryNewOrder(tmpOrder);\r\n                                        if (result > 0) {\r\n                                            hasChanged = true;\r\n                                        }\r\n                                    }\r\n                                }\r\n                            }\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                assertOrderAndPositionCoherence(r);\r\n                            }\r\n                        }\r\n                        boolDirection = boolOppositeDirection;\r\n                        boolOppositeDirection = boolDirection ? 0 : 1;\r\n                        signDirection *= -1;\r\n                        for (let r = 1; r < ranks.length; ++r) {\r\n                            if (crossings[r] === Number.POSITIVE_INFINITY) {\r\n                                crossings[r] = countCrossings(order[r], r);\r\n                            }\r\n                        }\r\n                        const newCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                        if (newCrossings < minCrossings) {\r\n                            minCrossings = newCrossings;\r\n                            improveCounter = 2;\r\n                        }\r\n                    }\r\n                    for (let r = 0; r < ranks.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        this._setGroupPositionAndOffset(groupOrder[r], groupPositions, groupOffsetsPos, numNodesPerGroup);\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"reorder\"]);\r\n                };\r\n                const getConflict = (type, r) => {\r\n                    let heavyLeftNorth = -1;\r\n                    let heavyLeftSouth = -1;\r\n                    let pos = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        let hasHeavy = lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY);\r\n                        if (type === \"HEAVYLIGHT\") {\r\n                            hasHeavy && (hasHeavy = intranode[tmpNodeId]);\r\n                        }\r\n                        if (tmpPos === order[r].length - 1 || hasHeavy) {\r\n                            let heavyRightNorth = order[r - 1].length;\r\n                            let heavyRightSouth = order[r].length;\r\n                            if (hasHeavy) {\r\n                                heavyRightNorth = positions[neighbors[0][tmpNodeId][0].end];\r\n                                heavyRightSouth = tmpPos;\r\n                            }\r\n                            while (pos <= tmpPos) {\r\n                                const nodeId = order[r][pos];\r\n                                for (let neighbor = 0; neighbor < neighbors[0][nodeId].length; ++neighbor) {\r\n                                    if (type === \"HEAVYLIGHT\" || neighbors[0][nodeId][neighbor].weight === Number.POSITIVE_INFINITY) {\r\n                                        const neighborPos = positions[neighbors[0][nodeId][neighbor].end];\r\n                                        if (neighborPos < heavyLeftNorth) {\r\n                                            return [r, heavyLeftNorth, heavyLeftSouth, neighborPos, pos];\r\n                                        }\r\n                                        if (neighborPos > heavyRightNorth) {\r\n                                            return [r, heavyRightNorth, heavyRightSouth, neighborPos, pos];\r\n                                        }\r\n                                    }\r\n                                }\r\n                                pos++;\r\n                            }\r\n                            heavyLeftNorth = heavyRightNorth;\r\n                            heavyLeftSouth = heavyRightSouth;\r\n                        }\r\n                    }\r\n                    return null;\r\n                };\r\n                /**\r\n                 * Resolves all heavy-heavy conflicts between rank r-1 and r.\r\n                 */\r\n                const heavy = [];\r\n                const resolveHeavyHeavy = (r) => {\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyHeavy\"]);\r\n                    heavy.length = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY)) {\r\n                            heavy.push(tmpNodeId);\r\n                        }\r\n                    }\r\n                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(heavy).asc(southNodeId => positions[neighbors[0][southNodeId][0].end]);\r\n                    let pointer = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY)) {\r\n                            order[r][tmpPos] = heavy[pointer++];\r\n                            positions[order[r][tmpPos]] = tmpPos;\r\n                        }\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyHeavy\"]);\r\n                };\r\n                /**\r\n                 * Resolves all conflicts.\r\n                 */\r\n                const resolveConflicts = () => {\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(ranks.length), r => groupOrder[r].length === 1, \"conflict resolution with more than one group per rank\");\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\"]);\r\n                    for (let r = 0; r < order.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r].groups[0].nodes, (node) => {\r\n                            virtual[node.id] = node.isVirtual;\r\n                            intranode[node.id] = node.isIntranode;\r\n                            intranodePathEnd[node.id] = node.isIntranode && (neighbors[1][node.id].length === 0 || neighbors[1][node.id][0].weight < Number.POSITIVE_INFINITY);\r\n                            sink[node.id] = (graph._nodeGraph.numOutEdges(node.id) === 0);\r\n                            moving[node.id] = true;\r\n                        });\r\n                        rankWidths[r] = order[r].length;\r\n                    }\r\n                    const addEdge = (srcNode, dstNode, weight) => {\r\n                        if (srcNode.isVirtual && dstNode.isVirtual) {\r\n                            weight = Number.POSITIVE_INFINITY;\r\n                        }\r\n                        const newEdge = new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcNode.id, dstNode.id, weight);\r\n                        const newEdgeId = this.addEdge(newEdge);\r\n                        graph.addEdge(newEdge, newEdgeId);\r\n                        neighbors[0][dstNode.id].push({ end: srcNode.id, weight: weight });\r\n                        neighbors[1][srcNode.id].push({ end: dstNode.id, weight: weight });\r\n                    };\r\n                    const removeEdge = (srcNode, dstNode) => {\r\n                        const edge = graph.edgeBetween(srcNode.id, dstNode.id);\r\n                        graph.removeEdge(edge.id);\r\n                        this.removeEdge(edge.id);\r\n                        let upEdgeIndex;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[0][dstNode.id], (neighbor, i) => {\r\n                            if (neighbor.end === srcNode.id) {\r\n                                upEdgeIndex = i;\r\n                            }\r\n                        });\r\n                        neighbors[0][dstNode.id].splice(upEdgeIndex, 1);\r\n                        let downEdgeIndex;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[1][srcNode.id], (neighbor, i) => {\r\n                            if (neighbor.end === dstNode.id) {\r\n                                downEdgeIndex = i;\r\n                            }\r\n                        });\r\n                        neighbors[1][srcNode.id].splice(downEdgeIndex, 1);\r\n                    };\r\n                    const addNodeToRank = (r, node) => {\r\n                        order[r].push(node.id);\r\n                        ranks[r].groups[0].addNode(node, node.id);\r\n                        node.rank = r;\r\n                    };\r\n                    const createNode = () => {\r\n                        const newNode = new _orderNode__WEBPACK_IMPORTED_MODULE_7__.default(null, true, false);\r\n                        this.addNode(newNode);\r\n                        neighbors[0][newNode.id] = [];\r\n                        neighbors[1][newNode.id] = [];\r\n                        virtual[newNode.id] = true;\r\n                        intranode[newNode.id] = false;\r\n                        intranodePathEnd[newNode.id] = false;\r\n                        moving[newNode.id] = true;\r\n                        sink[newNode.id] = false;\r\n                        return newNode;\r\n                    };\r\n                    const createRank = () => {\r\n                        if (ranks.length > 10000) {\r\n                            throw new Error(\"halt\");\r\n                        }\r\n                        const newR = ranks.length;\r\n                        const newRank = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(lodash__WEBPACK_IMPORTED_MODULE_2__.last(ranks).rank + 1);\r\n                        this.addRank(newRank);\r\n                        const newGroup = new _orderGroup__WEBPACK_IMPORTED_MODULE_6__.default(null);\r\n                        newRank.addGroup(newGroup);\r\n                        const newRankComponent = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(lodash__WEBPACK_IMPORTED_MODULE_2__.last(ranks).rank + 1);\r\n                        graph.addRank(newRankComponent);\r\n                        ranks.push(newRankComponent);\r\n                        newRankComponent.addGroup(newGroup);\r\n                        this._groupGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(ranks[newR - 1].groups[0].id, ranks[newR].groups[0].id));\r\n                        this._rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(ranks[newR - 1].id, ranks[newR].id));\r\n                        newRankComponent.order = [0];\r\n                        groupOrder[newR] = [newGroup.id];\r\n                        groupPositions[newGroup.id] = 0;\r\n                        groupOffsetsPos[newGroup.id] = 0;\r\n                        numNodesPerGroup[newGroup.id] = 0;\r\n                        order[newR] = [];\r\n                        crossings[newR] = 0;\r\n                        rankWidths[newR] = 0;\r\n                    };\r\n                    const resolveHeavyLight = (conflict) => {\r\n                        _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\"]);\r\n                        const [r, crossedNorthPos, crossedSouthPos, crossingNorthPos, crossingSouthPos] = conflict;\r\n                        const crossedNorthNodeId = order[r - 1][crossedNorthPos];\r\n                        const crossedNorthNode = graph.node(crossedNorthNodeId);\r\n                        const crossedSouthNodeId = order[r][crossedSouthPos];\r\n                        const crossedSouthNode = graph.node(crossedSouthNodeId);\r\n                        const crossingNorthNodeId = order[r - 1][crossingNorthPos];\r\n                        let crossingNorthNode = graph.node(crossingNorthNodeId);\r\n                        const crossingSouthNodeId = order[r][crossingSouthPos];\r\n                        let crossingSouthNode = graph.node(crossingSouthNodeId);\r\n                        let crossingEdge;\r\n                        const resolveY = () => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveY\"]);\r\n                            // mark nodes that must not be moved\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r - 1], (nodeId) => {\r\n                                if (intranode[nodeId]) {\r\n                                    moving[nodeId] = false;\r\n                                    let tmpNodeId = nodeId;\r\n                                    while (graph.outEdges(tmpNodeId).length > 0 && graph.outEdges(tmpNodeId)[0].weight === Number.POSITIVE_INFINITY) {\r\n                                        tmpNodeId = graph.outEdges(tmpNodeId)[0].dst;\r\n                                        moving[tmpNodeId] = false;\r\n                                    }\r\n                                }\r\n                                else if (sink[nodeId]) {\r\n                                    // sink on rank r - 1\r\n                                    moving[nodeId] = false;\r\n                                }\r\n                            });\r\n                            // create new rank if necessary\r\n                            if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(order[order.length - 1], nodeId => moving[nodeId])) {\r\n                                if (order.length > 10000) {\r\n                                    throw new Error(\"halt\");\r\n                                }\r\n                                createRank();\r\n                            }\r\n                            // move nodes down and create virtual nodes\r\n                            for (let tmpR = ranks.length - 1; tmpR >= r; --tmpR) {\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[tmpR - 1], (nodeId) => {\r\n                                    const node = graph.node(nodeId);\r\n                                    if (moving[nodeId]) {\r\n                                        addNodeToRank(tmpR, node);\r\n                                        if (tmpR === r) {\r\n                                            // create a virtual node for each in edge and route edge through new node\r\n                                            const sortedEdges = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(graph.inEdges(nodeId), edge => positions[edge.src]);\r\n                                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(sortedEdges, inEdge => {\r\n                                                const newNode = createNode();\r\n                                                addNodeToRank(r - 1, newNode);\r\n                                                const srcNode = graph.node(inEdge.src);\r\n                                                removeEdge(srcNode, node);\r\n                                                addEdge(srcNode, newNode, inEdge.weight);\r\n                                                addEdge(newNode, node, inEdge.weight);\r\n                                            });\r\n                                        }\r\n                                    }\r\n                                    else {\r\n                                        // `node` is non-moving\r\n                                        if (intranodePathEnd[nodeId]) {\r\n                                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(graph.outEdges(node.id), edge => graph.node(edge.dst).rank === tmpR + 1, \"edge below intranode path end not spanning two ranks\");\r\n                                            }\r\n                                            // create a virtual node for each out edge and route edge through new node\r\n                                            // sort edges to prevent crossings between them\r\n                                            const sortedEdges = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(graph.outEdges(nodeId), edge => positions[edge.dst]);\r\n                                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(sortedEdges, outEdge => {\r\n                                                const newNode = createNode();\r\n                                                addNodeToRank(tmpR, newNode);\r\n                                                const dstNode = graph.node(outEdge.dst);\r\n                                                removeEdge(node, dstNode);\r\n                                                addEdge(node, newNode, outEdge.weight);\r\n                                                addEdge(newNode, dstNode, outEdge.weight);\r\n                                            });\r\n                                        }\r\n                                        else if (!sink[nodeId]) {\r\n                                            // there is a an intranode segment between upper and this rank\r\n                                            // => change order within this rank\r\n                                            const lowerNode = graph.outNeighbors(nodeId)[0];\r\n                                            addNodeToRank(tmpR, lowerNode);\r\n                                        }\r\n                                        if (tmpR === r) {\r\n                                            // readd node\r\n                                            addNodeToRank(r - 1, node);\r\n                                        }\r\n                                        // set as moving (default value) for next resolution\r\n                                        moving[nodeId] = true;\r\n                                    }\r\n                                });\r\n                            }\r\n                            for (let tmpR = r - 1; tmpR < ranks.length; ++tmpR) {\r\n                                // keep only nodes that have been (re-)added during y resolution\r\n                                tmpOrder.length = 0;\r\n                                ranks[tmpR].groups[0].clear();\r\n                                for (let pos = rankWidths[tmpR]; pos < order[tmpR].length; ++pos) {\r\n                                    const nodeId = order[tmpR][pos];\r\n                                    const node = graph.node(nodeId);\r\n                                    tmpOrder.push(nodeId);\r\n                                    ranks[tmpR].groups[0].addNode(node, nodeId);\r\n                                    node.rank = tmpR;\r\n                                }\r\n                                numNodesPerGroup[ranks[tmpR].groups[0].id] = tmpOrder.length;\r\n                                rankWidths[tmpR] = tmpOrder.length;\r\n                                // copy back and update positions\r\n                                order[tmpR].length = 0;\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpOrder, (nodeId, pos) => {\r\n                                    order[tmpR].push(nodeId);\r\n                                    positions[nodeId] = pos;\r\n                                });\r\n                            }\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, r + 1), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after y resolution with r = \" + r);\r\n                            }\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveY\"]);\r\n                        };\r\n                        const checkXResolution = (side) => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"checkX\"]);\r\n                            const nodesPerRank = new Array(ranks.length);\r\n                            const minGreenNodePerRank = new Array(ranks.length);\r\n                            const maxRedNodePerRank = new Array(ranks.length);\r\n                            let conflict = false;\r\n                            for (let r = 0; r < ranks.length; ++r) {\r\n                                nodesPerRank[r] = new Map();\r\n                                minGreenNodePerRank[r] = (side === \"RIGHT\" ? Number.POSITIVE_INFINITY : Number.NEGATIVE_INFINITY);\r\n                                maxRedNodePerRank[r] = (side === \"RIGHT\" ? Number.NEGATIVE_INFINITY : Number.POSITIVE_INFINITY);\r\n                            }\r\n                            const queue = [];\r\n                            let minRank = r - 1;\r\n                            let maxRank = r;\r\n                            const moveDir = (side === \"LEFT\" ? 1 : -1);\r\n                            const minFun = (side === \"RIGHT\" ? Math.min : Math.max);\r\n                            const maxFun = (side === \"RIGHT\" ? Math.max : Math.min);\r\n                            const geFun = (side === \"RIGHT\" ? ((a, b) => a >= b) : ((a, b) => a <= b));\r\n                            const addNodeToGroup = (r, node, group) => {\r\n                                nodesPerRank[r].set(node, group);\r\n                                queue.push([node, group]);\r\n                                const addIntermediate = () => {\r\n                                    if (geFun(maxRedNodePerRank[r], minGreenNodePerRank[r])) {\r\n                                        const intermediate = [];\r\n                                        for (let pos = maxRedNodePerRank[r]; pos !== minGreenNodePerRank[r]; pos += moveDir) {\r\n                                            const node = graph.node(order[r][pos]);\r\n                                            if (!nodesPerRank[r].has(node)) {\r\n                                                intermediate.push([node, \"YELLOW\"]);\r\n                                            }\r\n                                            else if (node.rank === minRank) {\r\n                                                intermediate.push([node, nodesPerRank[r].get(node)]); // check boundaries again\r\n                                            }\r\n                                        }\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(intermediate, ([node, group]) => {\r\n                                            addNodeToGroup(r, node, group);\r\n                                        });\r\n                                    }\r\n                                };\r\n                                if (group === \"RED\") {\r\n                                    const prev = maxRedNodePerRank[r];\r\n                                    maxRedNodePerRank[r] = maxFun(maxRedNodePerRank[r], positions[node.id]);\r\n                                    if (maxRedNodePerRank[r] !== prev && minGreenNodePerRank[r] !== Number.POSITIVE_INFINITY && minGreenNodePerRank[r] !== Number.NEGATIVE_INFINITY) {\r\n                                        addIntermediate();\r\n                                    }\r\n                                }\r\n                                else {\r\n                                    // potentially heavy\r\n                                    const prev = minGreenNodePerRank[r];\r\n                                    minGreenNodePerRank[r] = minFun(minGreenNodePerRank[r], positions[node.id]);\r\n                                    if (minGreenNodePerRank[r] !== prev && maxRedNodePerRank[r] !== Number.POSITIVE_INFINITY && maxRedNodePerRank[r] !== Number.NEGATIVE_INFINITY) {\r\n                                        addIntermediate();\r\n                                    }\r\n                                }\r\n                            };\r\n                            addNodeToGroup(r - 1, crossedNorthNode, \"GREEN\");\r\n                            addNodeToGroup(r, crossedSouthNode, \"GREEN\");\r\n                            addNodeToGroup(r - 1, crossingNorthNode, \"RED\");\r\n                            addNodeToGroup(r, crossingSouthNode, \"RED\");\r\n                            let queuePointer = 0;\r\n                            while (queuePointer < queue.length && !conflict) {\r\n                                const [node, group] = queue[queuePointer++];\r\n                                if (nodesPerRank[node.rank].get(node) !== group) {\r\n                                    continue; // group has changed in the meantime\r\n                                }\r\n                                const addNeighbors = (neighborMethod, neighborProperty, rankOffset) => {\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph[neighborMethod](node.id), edge => {\r\n                                        if (edge === crossingEdge) {\r\n                                            return;\r\n                                        }\r\n                                        const neighborRank = node.rank + rankOffset;\r\n                                        const neighbor = graph.node(edge[neighborProperty]);\r\n                                        if (!nodesPerRank[neighborRank].has(neighbor)) {\r\n                                            // add neighbor to same group as this node\r\n                                            addNodeToGroup(neighborRank, neighbor, group);\r\n                                        }\r\n                                        else {\r\n                                            // check for conflict or group change\r\n                                            const neighborGroup = nodesPerRank[neighborRank].get(neighbor);\r\n                                            if (neighborGroup !== group) {\r\n                                                if (neighborGroup === \"YELLOW\") {\r\n                                                    addNodeToGroup(neighborRank, neighbor, group);\r\n                                                }\r\n                                                else if (group === \"YELLOW\") {\r\n                                                    addNodeToGroup(node.rank, node, neighborGroup);\r\n                                                }\r\n                                                else {\r\n                                                    // one is \"GREEN\" and the other is \"RED\"\r\n                                                    conflict = true;\r\n                                                }\r\n                                            }\r\n                                        }\r\n                                    });\r\n                                };\r\n                                if (node.rank > minRank) {\r\n                                    addNeighbors(\"inEdges\", \"src\", -1);\r\n                                }\r\n                                if (node.rank === minRank && geFun(positions[node.id], minGreenNodePerRank[node.rank])) {\r\n                                    let foundNewMinRank = false;\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.inEdges(node.id), inEdge => {\r\n                                        if (inEdge.weight === Number.POSITIVE_INFINITY) {\r\n                                            foundNewMinRank = true;\r\n                                        }\r\n                                    });\r\n                                    if (foundNewMinRank) {\r\n                                        minRank--;\r\n                                        nodesPerRank[node.rank].forEach((group, borderNode) => {\r\n                                            queue.push([borderNode, group]);\r\n                                        });\r\n                                    }\r\n                                }\r\n                                if (node.rank < maxRank) {\r\n                                    addNeighbors(\"outEdges\", \"dst\", 1);\r\n                                }\r\n                            }\r\n                            if (conflict) {\r\n                                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"checkX\"]);\r\n                                return null;\r\n                            }\r\n                            // group nodes\r\n                            const nodesPerRankGrouped = [];\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(nodesPerRank, (nodes, r) => {\r\n                                nodesPerRankGrouped[r] = {\r\n                                    \"GREEN\": new Set(),\r\n                                    \"MOVING\": new Set(),\r\n                                };\r\n                                minGreenNodePerRank[r] = (side === \"RIGHT\" ? Number.POSITIVE_INFINITY : Number.NEGATIVE_INFINITY);\r\n                                nodes.forEach((group, node) => {\r\n                                    if (group === \"GREEN\") {\r\n                                        nodesPerRankGrouped[r][\"GREEN\"].add(node);\r\n                                        minGreenNodePerRank[r] = minFun(minGreenNodePerRank[r], positions[node.id]);\r\n                                    }\r\n                                });\r\n                                nodes.forEach((group, node) => {\r\n                                    if (group === \"RED\" && geFun(positions[node.id], minGreenNodePerRank[node.rank])) {\r\n                                        nodesPerRankGrouped[r][\"MOVING\"].add(node);\r\n                                    }\r\n                                });\r\n                            });\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"checkX\"]);\r\n                            return nodesPerRankGrouped;\r\n                        };\r\n                        const resolveX = (side, nodesPerRank) => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveX\"]);\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(nodesPerRank, (rank, r) => {\r\n                                if (rank[\"MOVING\"].size === 0 || rank[\"GREEN\"].size === 0) {\r\n                                    return;\r\n                                }\r\n                                const green = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(Array.from(rank[\"GREEN\"]), node => positions[node.id]);\r\n                                // `moving` is the subset of red nodes that is on the wrong side of the green nodes\r\n                                const moving = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(Array.from(rank[\"MOVING\"]), node => positions[node.id]);\r\n                                const newOrder = [];\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], nodeId => {\r\n                                    const node = graph.node(nodeId);\r\n                                    if (rank[\"MOVING\"].has(node)) {\r\n                                        return; // do nothing\r\n                                    }\r\n                                    if (side === \"RIGHT\" && nodeId === green[0].id) {\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(moving, movingNode => {\r\n                                            newOrder.push(movingNode.id);\r\n                                        });\r\n                                    }\r\n                                    newOrder.push(nodeId);\r\n                                    if (side === \"LEFT\" && nodeId === lodash__WEBPACK_IMPORTED_MODULE_2__.last(green).id) {\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(moving, movingNode => {\r\n                                            newOrder.push(movingNode.id);\r\n                                        });\r\n                                    }\r\n                                });\r\n                                order[r] = newOrder;\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                                    positions[nodeId] = pos;\r\n                                });\r\n                            });\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(r + 1), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after x resolution\");\r\n                            }\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveX\"]);\r\n                        };\r\n                        didResolveY = false;\r\n                        if (options[\"resolveX\"]) {\r\n                            crossingEdge = graph.edgeBetween(crossingNorthNode.id, crossingSouthNode.id);\r\n                            const leftResolution = checkXResolution(\"LEFT\");\r\n                            const rightResolution = checkXResolution(\"RIGHT\");\r\n                            if (leftResolution === null) {\r\n                                if (rightResolution === null) {\r\n                                    resolveY();\r\n                                    didResolveY = true;\r\n                                }\r\n                                else {\r\n                                    resolveX(\"RIGHT\", rightResolution);\r\n                                }\r\n                            }\r\n                            else {\r\n                                if (rightResolution === null) {\r\n                                    resolveX(\"LEFT\", leftResolution);\r\n                                }\r\n                                else {\r\n                                    const numNodesLeft = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(leftResolution, rank => rank[\"MOVING\"].size));\r\n                                    const numNodesRight = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(rightResolution, rank => rank[\"MOVING\"].size));\r\n                                    if (numNodesLeft < numNodesRight) {\r\n                                        resolveX(\"LEFT\", leftResolution);\r\n                                    }\r\n                                    else {\r\n                                        resolveX(\"RIGHT\", rightResolution);\r\n                                    }\r\n                                }\r\n                            }\r\n                        }\r\n                        else {\r\n                            resolveY();\r\n                            didResolveY = true;\r\n                        }\r\n                        _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\"]);\r\n                    };\r\n                    let didResolveY = false;\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        resolveHeavyHeavy(r);\r\n                        while (true) {\r\n                            const conflict = getConflict(\"HEAVYLIGHT\", r);\r\n                            if (conflict === null) {\r\n                                break;\r\n                            }\r\n                            resolveHeavyLight(conflict);\r\n                            if (didResolveY) {\r\n                                break;\r\n                            }\r\n                        }\r\n                    }\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        resolveHeavyHeavy(r);\r\n                    }\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after resolution\");\r\n                    }\r\n                    for (let tmpR = 1; tmpR < ranks.length; ++tmpR) {\r\n                        crossings[tmpR] = countCrossings(order[tmpR], tmpR);\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\"]);\r\n                };\r\n                if (options[\"countInitial\"]) {\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        crossings[r] = countCrossings(order[r], r, 0);\r\n                    }\r\n                }\r\n                if (options[\"countOnly\"]) {\r\n                    return lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                }\r\n                if (this._wasm !== null && options[\"resolveConflicts\"]) {\r\n                    yield this._wasm.reorder(order, neighbors[0], graph._nodeGraph.maxId(), numEdgesPerRank);\r\n                    for (let r = 0; r < ranks.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                    }\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        crossings[r] = countCrossings(order[r], r, 0);\r\n                    }\r\n                }\r\n                else {\r\n                    reorder();\r\n                }\r\n                if (options[\"resolveConflicts\"]) {\r\n                    resolveConflicts();\r\n                    resolveConflicts();\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after resolveConflicts\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after resolveConflicts\");\r\n                    }\r\n                    reorder(true);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after reorder with preventConflict\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after reorder with preventConflict\");\r\n                        assertEdgesBetweenNeighboringRanks();\r\n                    }\r\n                }\r\n                // transform component ranks to absolute ranks\r\n                if (minRank > 0 && minRank < Number.POSITIVE_INFINITY) {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.nodes(), (node) => {\r\n                        node.rank += minRank;\r\n                    });\r\n                }\r\n                // store new positions\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.groups, (group) => {\r\n                        group.position = groupPositions[group.id];\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.nodes, (node) => {\r\n                            node.position = positions[node.id];\r\n                        });\r\n                        group.orderNodes();\r\n                    });\r\n                    rank.orderGroups();\r\n                });\r\n                const numCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\"]);\r\n                return numCrossings;\r\n            });\r\n            this._addGroupEdges();\r\n            const numRanks = this._rankGraph.maxId();\r\n            const numGroups = this._groupGraph.maxId();\r\n            const numNodes = this._nodeGraph.maxId();\r\n            groupOffsetsPos = new Array(numGroups); // number of nodes in groups left of this group (reflecting current order) by id\r\n            numNodesPerGroup = new Array(numGroups); // number of nodes in group by id\r\n            groupOrder = new Array(numRanks); // current order of groups on this level (e. g. 2, 0, 1)\r\n            groupPositions = new Array(numGroups); // position of each group by id; roughly inverse of groupOrder (e. g. 1, 2, 0)\r\n            order = new Array(numRanks); // current order of nodes on this level (e. g. 2, 0, 1)\r\n            positions = new Array(numNodes); // inverse of order (e. g. 1, 2, 0)\r\n            neighbors = [\r\n                new Array(numNodes),\r\n                new Array(numNodes),\r\n            ];\r\n            crossings = new Array(numRanks); // number of crossings above each rank\r\n            virtual = new Array(numNodes);\r\n            intranode = new Array(numNodes);\r\n            intranodePathEnd = new Array(numNodes);\r\n            moving = new Array(numNodes);\r\n            sink = new Array(numNodes);\r\n            rankWidths = new Array(numRanks);\r\n            moved = new Array(numNodes);\r\n            numEdgesPerRank = new Array(numRanks);\r\n            tmpOrder = [];\r\n            let numCrossings = 0;\r\n            const groupComponents = this._groupGraph.components();\r\n            for (let i = 0; i < groupComponents.length; ++i) {\r\n                const groupGraphComponent = groupComponents[i];\r\n                const componentGraph = new OrderGraph();\r\n                const ranks = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupGraphComponent.nodes(), (group) => {\r\n                    if (ranks[group.rank.id] === undefined) {\r\n                        ranks[group.rank.id] = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(group.rank.rank);\r\n                        componentGraph.addRank(ranks[group.rank.id]);\r\n                    }\r\n                    ranks[group.rank.id].addGroup(group, group.id);\r\n                    const groupNodes = group.nodes;\r\n                    group.nodes = [];\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupNodes, (node) => {\r\n                        group.addNode(node, node.id);\r\n                    });\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(componentGraph.nodes(), (newNode) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this.outEdges(newNode.id), (edge) => {\r\n                        componentGraph.addEdge(edge, edge.id);\r\n                    });\r\n                });\r\n                if (componentGraph._rankGraph.numNodes() < 2 || componentGraph._nodeGraph.numEdges() < componentGraph._rankGraph.numNodes()) {\r\n                    // with 0 or one edges, there is nothing to reorder\r\n                    continue;\r\n                }\r\n                componentGraph._addGroupEdges();\r\n                componentGraph._addRankEdges();\r\n                if (options[\"method\"] === \"spring\") {\r\n                    yield doOrderSprings(componentGraph);\r\n                }\r\n                else {\r\n                    numCrossings += yield doOrder(componentGraph);\r\n                }\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\"]);\r\n            return numCrossings;\r\n        });\r\n    }\r\n    /**\r\n     * Adapted from Barth, W., Jünger, M., & Mutzel, P. (2002, August). Simple and efficient bilayer cross counting.\r\n     * In International Symposium on Graph Drawing (pp. 130-141). Springer, Berlin, Heidelberg.\r\n     * @param numNorth\r\n     * @param numSouth\r\n     * @param edges\r\n     * @private\r\n     */\r\n    _countCrossings(numNorth, numSouth, edges) {\r\n        // build south sequence\r\n        (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(edges).asc([\r\n            e => e[0],\r\n            e => e[1],\r\n        ]);\r\n        // build the accumulator tree\r\n        let firstIndex = 1;\r\n        while (firstIndex < numSouth) {\r\n            firstIndex *= 2; // number of tree nodes\r\n        }\r\n        const treeSize = 2 * firstIndex - 1;\r\n        firstIndex -= 1; // index of leftmost leaf\r\n        const tree = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(treeSize), 0);\r\n        // compute the total weight of the crossings\r\n        let crossWeight = 0;\r\n        for (let i = 0; i < edges.length; ++i) {\r\n            let index = edges[i][1] + firstIndex;\r\n            tree[index] += edges[i][2];\r\n            let weightSum = 0;\r\n            while (index > 0) {\r\n                if (index % 2) {\r\n                    weightSum += tree[index + 1];\r\n                }\r\n                index = Math.floor((index - 1) / 2);\r\n                tree[index] += edges[i][2];\r\n            }\r\n            crossWeight += edges[i][2] * weightSum;\r\n        }\r\n        return crossWeight;\r\n    }\r\n    _getChanges(newOrder, positions) {\r\n        const changes = [];\r\n        const permutation = new Array(newOrder.length);\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(newOrder, (nodeId, pos) => {\r\n            permutation[pos] = positions[nodeId];\r\n        });\r\n        let seqStart = null;\r\n        let seqEnd = -1;\r\n        for (let pos = 0; pos < permutation.length; ++pos) {\r\n            if (permutation[pos] > pos) {\r\n                if (seqStart === null) {\r\n                    seqStart = pos;\r\n                    seqEnd = permutation[pos];\r\n                }\r\n                else {\r\n                    if (seqEnd < pos) {\r\n                        changes.push([seqStart, pos - 1]);\r\n                        seqStart = pos;\r\n                        seqEnd = permutation[pos];\r\n                    }\r\n                    else {\r\n                        seqEnd = Math.max(seqEnd, permutation[pos]);\r\n                    }\r\n                }\r\n            }\r\n            if (permutation[pos] === pos && seqStart !== null && seqEnd < pos) {\r\n                changes.push([seqStart, pos - 1]);\r\n                seqStart = null;\r\n            }\r\n        }\r\n        if (seqStart !== null) {\r\n            changes.push([seqStart, permutation.length - 1]);\r\n        }\r\n        return changes;\r\n    }\r\n    _setGroupPositionAndOffset(groupOrder, groupPositions, groupOffsetsPos, numNodesPerGroup) {\r\n        let offset = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupOrder, (groupId, pos) => {\r\n            groupPositions[groupId] = pos;\r\n            groupOffsetsPos[groupId] = offset;\r\n            offset += numNodesPerGroup[groupId];\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/order/orderGraph.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ OrderGraph)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var fast_sort__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! fast-sort */ \"./node_modules/fast-sort/dist/sort.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var _util_assert__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../util/assert */ \"./src/util/assert.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _graph_graph__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../graph/graph */ \"./src/graph/graph.ts\");\n/* harmony import */ var _orderGroup__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ./orderGroup */ \"./src/order/orderGroup.ts\");\n/* harmony import */ var _orderNode__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ./orderNode */ \"./src/order/orderNode.ts\");\n/* harmony import */ var _orderRank__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ./orderRank */ \"./src/order/orderRank.ts\");\n/* harmony import */ var _util_timer__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../util/timer */ \"./src/util/timer.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nconst TIMER_ORDER = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\"]);\r\nconst TIMER_DO_ORDER = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\"]);\r\nconst TIMER_REORDER = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"reorder\"]);\r\nconst TIMER_RESOLVE = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\"]);\r\nconst TIMER_RESOLVE_HEAVY_HEAVY = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyHeavy\"]);\r\nconst TIMER_RESOLVE_HEAVY_LIGHT = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\"]);\r\nconst TIMER_CHECK_X = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"checkX\"]);\r\nconst TIMER_RESOLVE_X = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveX\"]);\r\nconst TIMER_RESOLVE_Y = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"resolve\", \"resolveHeavyLight\", \"resolveY\"]);\r\nconst TIMER_SETUP = _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.register([\"doLayout\", \"orderRanks\", \"doOrder\", \"order\", \"doOrder\", \"setup\"]);\r\nclass OrderGraph {\r\n    constructor(wasm = null) {\r\n        this._groupEdgesAdded = false;\r\n        this._rankGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._groupGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._nodeGraph = new _graph_graph__WEBPACK_IMPORTED_MODULE_5__.default();\r\n        this._wasm = wasm;\r\n    }\r\n    toString() {\r\n        const obj = {\r\n            nodes: {},\r\n            edges: [],\r\n        };\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(this.groups(), \"position\"), (group) => {\r\n            obj.nodes[group.id] = {\r\n                label: group.label(),\r\n                child: {\r\n                    nodes: {},\r\n                    edges: [],\r\n                },\r\n            };\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.orderedNodes(), (node) => {\r\n                obj.nodes[group.id].child.nodes[node.id] = {\r\n                    label: node.label(),\r\n                    child: null\r\n                };\r\n            });\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this.groupEdges(), (edge) => {\r\n            obj.edges.push({ src: edge.src, dst: edge.dst, weight: edge.weight });\r\n        });\r\n        return JSON.stringify(obj);\r\n    }\r\n    addRank(rank, id = null) {\r\n        rank.orderGraph = this;\r\n        return this._rankGraph.addNode(rank, id);\r\n    }\r\n    addGroup(group, id = null) {\r\n        return this._groupGraph.addNode(group, id);\r\n    }\r\n    addNode(node, id = null) {\r\n        return this._nodeGraph.addNode(node, id);\r\n    }\r\n    addEdge(edge, id = null) {\r\n        return this._nodeGraph.addEdge(edge, id);\r\n    }\r\n    removeEdge(id) {\r\n        this._nodeGraph.removeEdge(id);\r\n    }\r\n    _addGroupEdges() {\r\n        if (!this._groupEdgesAdded) {\r\n            this._groupEdgesAdded = true;\r\n            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this._nodeGraph.edges(), (edge) => {\r\n                const srcGroupId = this._nodeGraph.node(edge.src).group.id;\r\n                const dstGroupId = this._nodeGraph.node(edge.dst).group.id;\r\n                const groupEdge = this._groupGraph.edgeBetween(srcGroupId, dstGroupId);\r\n                if (groupEdge === undefined) {\r\n                    this._groupGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcGroupId, dstGroupId, edge.weight));\r\n                }\r\n                else {\r\n                    groupEdge.weight += edge.weight;\r\n                }\r\n            });\r\n        }\r\n    }\r\n    _addRankEdges() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this._groupGraph.edges(), (edge) => {\r\n            const srcRankId = this._groupGraph.node(edge.src).rank.id;\r\n            const dstRankId = this._groupGraph.node(edge.dst).rank.id;\r\n            if (!this._rankGraph.hasEdge(srcRankId, dstRankId)) {\r\n                this._rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcRankId, dstRankId));\r\n            }\r\n        });\r\n    }\r\n    node(id) {\r\n        return this._nodeGraph.node(id);\r\n    }\r\n    group(id) {\r\n        return this._groupGraph.node(id);\r\n    }\r\n    nodes() {\r\n        return this._nodeGraph.nodes();\r\n    }\r\n    groups() {\r\n        return this._groupGraph.nodes();\r\n    }\r\n    ranks() {\r\n        return this._rankGraph.toposort();\r\n    }\r\n    edges() {\r\n        return this._nodeGraph.edges();\r\n    }\r\n    inEdges(id) {\r\n        return this._nodeGraph.inEdges(id);\r\n    }\r\n    outEdges(id) {\r\n        return this._nodeGraph.outEdges(id);\r\n    }\r\n    inNeighbors(id) {\r\n        return this._nodeGraph.inNeighbors(id);\r\n    }\r\n    outNeighbors(id) {\r\n        return this._nodeGraph.outNeighbors(id);\r\n    }\r\n    incidentEdges(id) {\r\n        return this._nodeGraph.incidentEdges(id);\r\n    }\r\n    edgeBetween(srcId, dstId) {\r\n        return this._nodeGraph.edgeBetween(srcId, dstId);\r\n    }\r\n    maxId() {\r\n        return this._nodeGraph.maxId();\r\n    }\r\n    groupEdges() {\r\n        this._addGroupEdges();\r\n        return this._groupGraph.edges();\r\n    }\r\n    order(options = {}) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            if (this._nodeGraph.numNodes() === 0) {\r\n                return;\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_ORDER);\r\n            options = lodash__WEBPACK_IMPORTED_MODULE_2__.defaults(options, {\r\n                method: \"barycenter\",\r\n                countOnly: false,\r\n                orderGroups: false,\r\n                countInitial: false,\r\n                resolveConflicts: true,\r\n                resolveX: true,\r\n            });\r\n            let groupOffsetsPos, numNodesPerGroup, groupOrder, groupPositions, order, positions, neighbors, crossings, virtual, intranode, intranodePathEnd, moving, sink, rankWidths, numEdgesPerRank, moved, tmpOrder;\r\n            const doOrderSprings = (graph) => __awaiter(this, void 0, void 0, function* () {\r\n                // store new positions\r\n                const ranks = graph._rankGraph.toposort();\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.groups, (group) => {\r\n                        group.orderNodesByX();\r\n                    });\r\n                    rank.orderGroupsByX();\r\n                });\r\n            });\r\n            const doOrder = (graph) => __awaiter(this, void 0, void 0, function* () {\r\n                const assertOrderAndPositionCoherence = (r = null) => {\r\n                    if (r === null) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(lodash__WEBPACK_IMPORTED_MODULE_2__.range(ranks.length), r => assertOrderAndPositionCoherence(r));\r\n                        return;\r\n                    }\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(order[r], (nodeId, pos) => positions[nodeId] === pos, \"positions and orders do not match\");\r\n                };\r\n                const assertEdgesBetweenNeighboringRanks = () => {\r\n                    _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(this.edges(), edge => {\r\n                        return this.node(edge.src).rank + 1 === this.node(edge.dst).rank;\r\n                    }, \"edge not between neighboring ranks\");\r\n                };\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_DO_ORDER);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_SETUP);\r\n                const numRanks = graph._rankGraph.numNodes();\r\n                let minRank = Number.POSITIVE_INFINITY;\r\n                const ranks = graph._rankGraph.toposort();\r\n                groupOrder.length = numRanks;\r\n                order.length = numRanks;\r\n                crossings.length = numRanks;\r\n                numEdgesPerRank.length = numRanks;\r\n                let maxEdgesPerRank = 0;\r\n                let maxEdgeWeight = 0;\r\n                // set neighbors\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank, r) => {\r\n                    let offset = 0;\r\n                    minRank = Math.min(minRank, rank.rank);\r\n                    order[r] = new Array(lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(rank.groups, group => numNodesPerGroup[group.id])));\r\n                    groupOrder[r] = new Array(rank.groups.length);\r\n                    crossings[r] = Number.POSITIVE_INFINITY;\r\n                    numEdgesPerRank[r] = 0;\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.orderedGroups(), (group, groupPos) => {\r\n                        groupOffsetsPos[group.id] = offset;\r\n                        numNodesPerGroup[group.id] = group.nodes.length;\r\n                        offset += group.nodes.length;\r\n                        groupOrder[r][groupPos] = group.id;\r\n                        groupPositions[group.id] = groupPos;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.orderedNodes(), (node, posInGroup) => {\r\n                            node.rank = r;\r\n                            const pos = groupOffsetsPos[group.id] + posInGroup;\r\n                            order[r][pos] = node.id;\r\n                            positions[node.id] = pos;\r\n                            neighbors[0][node.id] = [];\r\n                            neighbors[1][node.id] = [];\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph._nodeGraph.inEdges(node.id), (edge) => {\r\n                                neighbors[0][node.id].push({\r\n                                    end: edge.src,\r\n                                    weight: edge.weight,\r\n                                });\r\n                                maxEdgeWeight = Math.max(maxEdgeWeight, edge.weight === Number.POSITIVE_INFINITY ? 1 : edge.weight);\r\n                            });\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph._nodeGraph.outEdges(node.id), (edge) => {\r\n                                neighbors[1][node.id].push({\r\n                                    end: edge.dst,\r\n                                    weight: edge.weight,\r\n                                });\r\n                            });\r\n                            numEdgesPerRank[r] += graph._nodeGraph.numInEdges(node.id);\r\n                        });\r\n                    });\r\n                    maxEdgesPerRank = Math.max(maxEdgesPerRank, numEdgesPerRank[r]);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        assertOrderAndPositionCoherence(r);\r\n                    }\r\n                });\r\n                crossings[0] = 0;\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_SETUP);\r\n                const countCrossings = (testOrder, r, direction = 0, preventConflicts = false) => {\r\n                    if (preventConflicts) {\r\n                        const originalOrder = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(order[r]);\r\n                        order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(testOrder);\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        let hasConflict = false;\r\n                        if (r > 0) {\r\n                            hasConflict = hasConflict || (getConflict(\"HEAVYHEAVY\", r) !== null) || (getConflict(\"HEAVYLIGHT\", r) !== null);\r\n                        }\r\n                        if (r < ranks.length - 1) {\r\n                            hasConflict = hasConflict || (getConflict(\"HEAVYHEAVY\", r + 1) !== null) || (getConflict(\"HEAVYLIGHT\", r + 1) !== null);\r\n                        }\r\n                        order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.clone(originalOrder);\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        if (hasConflict) {\r\n                            return Number.POSITIVE_INFINITY;\r\n                        }\r\n                    }\r\n                    const edges = [];\r\n                    const northR = (direction === 0 ? (r - 1) : (r + 1));\r\n                    for (let southPos = 0; southPos < testOrder.length; ++southPos) {\r\n                        const southNodeId = testOrder[southPos];\r\n                        for (let neighbor = 0; neighbor < neighbors[direction][southNodeId].length; ++neighbor) {\r\n                            let weight = neighbors[direction][southNodeId][neighbor].weight;\r\n                            if (weight === Number.POSITIVE_INFINITY) {\r\n                                weight = 1;\r\n                            }\r\n                            edges.push([southPos, positions[neighbors[direction][southNodeId][neighbor].end], weight]);\r\n                        }\r\n                    }\r\n                    // north and south are swapped compared to the _countCrossings signature\r\n                    // result is the same, but this is faster in ordering the edges\r\n                    return this._countCrossings(testOrder.length, order[northR].length, edges);\r\n                };\r\n                const changeNodePosInOrder = (oldOrder, oldPos, newPos) => {\r\n                    const newOrder = new Array(oldOrder.length);\r\n                    if (oldPos < newPos) {\r\n                        for (let pos = 0; pos < oldPos; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                        for (let pos = oldPos + 1; pos <= newPos; ++pos) {\r\n                            newOrder[pos - 1] = oldOrder[pos];\r\n                        }\r\n                        newOrder[newPos] = oldOrder[oldPos];\r\n                        for (let pos = newPos + 1; pos < oldOrder.length; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                    }\r\n                    else {\r\n                        for (let pos = 0; pos < newPos; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                        newOrder[newPos] = oldOrder[oldPos];\r\n                        for (let pos = newPos; pos < oldPos; ++pos) {\r\n                            newOrder[pos + 1] = oldOrder[pos];\r\n                        }\r\n                        for (let pos = oldPos + 1; pos < oldOrder.length; ++pos) {\r\n                            newOrder[pos] = oldOrder[pos];\r\n                        }\r\n                    }\r\n                    return newOrder;\r\n                };\r\n                /**\r\n                 * Sweeps the ranks up and down and reorders the nodes according to the barycenter heuristic\r\n                 * @param preventConflicts\r\n                 */\r\n                const reorder = (preventConflicts = false) => {\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_REORDER);\r\n                    const multiplicator = maxEdgeWeight * maxEdgesPerRank + 1;\r\n                    let boolDirection = 1;\r\n                    let boolOppositeDirection = 0;\r\n                    let signDirection = 1;\r\n                    let minCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                    let improveCounter = 2;\r\n                    while (improveCounter > 0) {\r\n                        improveCounter--;\r\n                        let firstRank = boolDirection ? 1 : ranks.length - 2;\r\n                        let lastRank = boolDirection ? ranks.length - 1 : 0;\r\n                        const crossingOffsetNorth = boolDirection ? 0 : 1;\r\n                        const crossingOffsetSouth = boolDirection ? 1 : 0;\r\n                        const northDirection = boolDirection ? 0 : 1;\r\n                        const southDirection = boolDirection ? 1 : 0;\r\n                        for (let r = firstRank; r - signDirection !== lastRank; r += signDirection) {\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                assertOrderAndPositionCoherence(r);\r\n                            }\r\n                            if (crossings[r + crossingOffsetNorth] === 0) {\r\n                                // no need to reorder\r\n                                continue;\r\n                            }\r\n                            const tryNewOrder = (newOrder) => {\r\n                                // count crossings with new order\r\n                                const prevCrossingsNorth = crossings[r + crossingOffsetNorth];\r\n                                const newCrossingsNorth = countCrossings(newOrder, r, northDirection, preventConflicts);\r\n                                let newCrossingsSouth = 0;\r\n                                let prevCrossingsSouth = 0;\r\n                                if (r !== lastRank) {\r\n                                    prevCrossingsSouth = crossings[r + crossingOffsetSouth];\r\n                                    newCrossingsSouth = countCrossings(newOrder, r, southDirection, preventConflicts);\r\n                                }\r\n                                const fewerCrossingsNorth = newCrossingsNorth < prevCrossingsNorth;\r\n                                if (fewerCrossingsNorth) {\r\n                                    crossings[r + crossingOffsetNorth] = newCrossingsNorth;\r\n                                    if (r !== lastRank) {\r\n                                        crossings[r + crossingOffsetSouth] = newCrossingsSouth;\r\n                                    }\r\n                                    order[r] = lodash__WEBPACK_IMPORTED_MODULE_2__.cloneDeep(newOrder);\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                                        positions[nodeId] = pos;\r\n                                    });\r\n                                    const fewerCrossingsTotal = (newCrossingsNorth + newCrossingsSouth < prevCrossingsNorth + prevCrossingsSouth);\r\n                                    return (1 + (fewerCrossingsTotal ? 1 : 0));\r\n                                }\r\n                                else {\r\n                                    return 0;\r\n                                }\r\n                            };\r\n                            const newNodeOrder = new Array(order[r].length);\r\n                            let hasChanged = true;\r\n                            while (hasChanged) {\r\n                                hasChanged = false;\r\n                                let groupMeans = [];\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupOrder[r], (groupId) => {\r\n                                    // calculate mean position of neighbors\r\n                                    let nodeMeans = [];\r\n                                    let groupSum = 0;\r\n                                    let groupNum = 0;\r\n                                    for (let pos = groupOffsetsPos[groupId]; pos < groupOffsetsPos[groupId] + numNodesPerGroup[groupId]; ++pos) {\r\n                                        const nodeId = order[r][pos];\r\n                                        let sum = 0;\r\n                                        let num = 0;\r\n                                        for (let neighbor = 0; neighbor < neighbors[boolOppositeDirection][nodeId].length; ++neighbor) {\r\n                                            let weight = neighbors[boolOppositeDirection][nodeId][neighbor].weight;\r\n                                            if (weight === Number.POSITIVE_INFINITY) {\r\n                                                weight = 1;\r\n                                            }\r\n                                            const neighborPos = positions[neighbors[boolOppositeDirection][nodeId][neighbor].end];\r\n                                            sum += weight * neighborPos;\r\n                                            num += weight;\r\n                                        }\r\n                                        if (num > 0) {\r\n                                            nodeMeans.push([nodeId, multiplicator * sum / num + pos]);\r\n                                        }\r\n                                        else {\r\n                                            nodeMeans.push([nodeId, multiplicator * pos + pos]);\r\n                                        }\r\n                                        groupSum += sum;\r\n                                        groupNum += num;\r\n                                    }\r\n                                    // sort by the means\r\n                                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(nodeMeans).asc(pair => pair[1]);\r\n                                    for (let posInGroup = 0; posInGroup < numNodesPerGroup[groupId]; ++posInGroup) {\r\n                                        newNodeOrder[groupOffsetsPos[groupId] + posInGroup] = nodeMeans[posInGroup][0];\r\n                                    }\r\n                                    if (groupNum > 0) {\r\n                                        groupMeans.push([groupId, multiplicator * groupSum / groupNum + groupPositions[groupId]]);\r\n                                    }\r\n                                    else {\r\n                                        groupMeans.push([groupId, multiplicator * groupPositions[groupId] + groupPositions[groupId]]);\r\n                                    }\r\n                                });\r\n                                if (options[\"orderGroups\"]) {\r\n                                    // reorder groups\r\n                                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(groupMeans).asc(pair => pair[1]);\r\n                                    const newGroupOrder = lodash__WEBPACK_IMPORTED_MODULE_2__.map(groupMeans, \"0\");\r\n                                    const changes = this._getChanges(newGroupOrder, groupPositions);\r\n                                    for (let c = 0; c < changes.length; ++c) {\r\n                                        const tmpGroupOrder = new Array(order[r]);\r\n                                        for (let pos = 0; pos < groupOrder[r].length; ++pos) {\r\n                                            tmpGroupOrder[pos] = groupOrder[r][pos];\r\n                                        }\r\n                                        for (let pos = changes[c][0]; pos <= changes[c][1]; ++pos) {\r\n                                            tmpGroupOrder[pos] = newGroupOrder[pos];\r\n                                        }\r\n                                        // transform new group order to node order\r\n                                        const tmpOrder = [];\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpGroupOrder, (groupId) => {\r\n                                            for (let posInGroup = 0; posInGroup < numNodesPerGroup[groupId]; ++posInGroup) {\r\n                                                tmpOrder.push(order[r][groupOffsetsPos[groupId] + posInGroup]);\r\n                                            }\r\n                                        });\r\n                                        const result = tryNewOrder(tmpOrder);\r\n                                        if (result > 0) {\r\n                                            // store new group order\r\n                                            groupOrder[r] = tmpGroupOrder;\r\n                                            this._setGroupPositionAndOffset(groupOrder[r], groupPositions, groupOffsetsPos, numNodesPerGroup);\r\n                                            hasChanged = true;\r\n                                        }\r\n                                    }\r\n                                }\r\n                                if (!hasChanged) {\r\n                                    // reorder nodes\r\n                                    const changes = this._getChanges(newNodeOrder, positions);\r\n                                    for (let c = 0; c < changes.length; ++c) {\r\n                                        const tmpOrder = new Array(order[r]);\r\n                                        for (let pos = 0; pos < order[r].length; ++pos) {\r\n                                            tmpOrder[pos] = order[r][pos];\r\n                                        }\r\n                                        for (let pos = changes[c][0]; pos <= changes[c][1]; ++pos) {\r\n                                            tmpOrder[pos] = newNodeOrder[pos];\r\n                                        }\r\n                                        const result = tryNewOrder(tmpOrder);\r\n                                        if (result > 0) {\r\n                                            hasChanged = true;\r\n                                        }\r\n                                    }\r\n                                }\r\n                            }\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                assertOrderAndPositionCoherence(r);\r\n                            }\r\n                        }\r\n                        boolDirection = boolOppositeDirection;\r\n                        boolOppositeDirection = boolDirection ? 0 : 1;\r\n                        signDirection *= -1;\r\n                        for (let r = 1; r < ranks.length; ++r) {\r\n                            if (crossings[r] === Number.POSITIVE_INFINITY) {\r\n                                crossings[r] = countCrossings(order[r], r);\r\n                            }\r\n                        }\r\n                        const newCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                        if (newCrossings < minCrossings) {\r\n                            minCrossings = newCrossings;\r\n                            improveCounter = 2;\r\n                        }\r\n                    }\r\n                    for (let r = 0; r < ranks.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                        this._setGroupPositionAndOffset(groupOrder[r], groupPositions, groupOffsetsPos, numNodesPerGroup);\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_REORDER);\r\n                };\r\n                const getConflict = (type, r) => {\r\n                    let heavyLeftNorth = -1;\r\n                    let heavyLeftSouth = -1;\r\n                    let pos = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        let hasHeavy = lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY);\r\n                        if (type === \"HEAVYLIGHT\") {\r\n                            hasHeavy && (hasHeavy = intranode[tmpNodeId]);\r\n                        }\r\n                        if (tmpPos === order[r].length - 1 || hasHeavy) {\r\n                            let heavyRightNorth = order[r - 1].length;\r\n                            let heavyRightSouth = order[r].length;\r\n                            if (hasHeavy) {\r\n                                heavyRightNorth = positions[neighbors[0][tmpNodeId][0].end];\r\n                                heavyRightSouth = tmpPos;\r\n                            }\r\n                            while (pos <= tmpPos) {\r\n                                const nodeId = order[r][pos];\r\n                                for (let neighbor = 0; neighbor < neighbors[0][nodeId].length; ++neighbor) {\r\n                                    if (type === \"HEAVYLIGHT\" || neighbors[0][nodeId][neighbor].weight === Number.POSITIVE_INFINITY) {\r\n                                        const neighborPos = positions[neighbors[0][nodeId][neighbor].end];\r\n                                        if (neighborPos < heavyLeftNorth) {\r\n                                            return [r, heavyLeftNorth, heavyLeftSouth, neighborPos, pos];\r\n                                        }\r\n                                        if (neighborPos > heavyRightNorth) {\r\n                                            return [r, heavyRightNorth, heavyRightSouth, neighborPos, pos];\r\n                                        }\r\n                                    }\r\n                                }\r\n                                pos++;\r\n                            }\r\n                            heavyLeftNorth = heavyRightNorth;\r\n                            heavyLeftSouth = heavyRightSouth;\r\n                        }\r\n                    }\r\n                    return null;\r\n                };\r\n                /**\r\n                 * Resolves all heavy-heavy conflicts between rank r-1 and r.\r\n                 */\r\n                const heavy = [];\r\n                const resolveHeavyHeavy = (r) => {\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_RESOLVE_HEAVY_HEAVY);\r\n                    heavy.length = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY)) {\r\n                            heavy.push(tmpNodeId);\r\n                        }\r\n                    }\r\n                    (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(heavy).asc(southNodeId => positions[neighbors[0][southNodeId][0].end]);\r\n                    let pointer = 0;\r\n                    for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {\r\n                        const tmpNodeId = order[r][tmpPos];\r\n                        if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(neighbors[0][tmpNodeId], neighbor => neighbor.weight === Number.POSITIVE_INFINITY)) {\r\n                            order[r][tmpPos] = heavy[pointer++];\r\n                            positions[order[r][tmpPos]] = tmpPos;\r\n                        }\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_RESOLVE_HEAVY_HEAVY);\r\n                };\r\n                /**\r\n                 * Resolves all conflicts.\r\n                 */\r\n                const resolveConflicts = () => {\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(ranks.length), r => groupOrder[r].length === 1, \"conflict resolution with more than one group per rank\");\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_RESOLVE);\r\n                    for (let r = 0; r < order.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks[r].groups[0].nodes, (node) => {\r\n                            virtual[node.id] = node.isVirtual;\r\n                            intranode[node.id] = node.isIntranode;\r\n                            intranodePathEnd[node.id] = node.isIntranode && (neighbors[1][node.id].length === 0 || neighbors[1][node.id][0].weight < Number.POSITIVE_INFINITY);\r\n                            sink[node.id] = (graph._nodeGraph.numOutEdges(node.id) === 0);\r\n                            moving[node.id] = true;\r\n                        });\r\n                        rankWidths[r] = order[r].length;\r\n                    }\r\n                    const addEdge = (srcNode, dstNode, weight) => {\r\n                        if (srcNode.isVirtual && dstNode.isVirtual) {\r\n                            weight = Number.POSITIVE_INFINITY;\r\n                        }\r\n                        const newEdge = new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(srcNode.id, dstNode.id, weight);\r\n                        const newEdgeId = this.addEdge(newEdge);\r\n                        graph.addEdge(newEdge, newEdgeId);\r\n                        neighbors[0][dstNode.id].push({ end: srcNode.id, weight: weight });\r\n                        neighbors[1][srcNode.id].push({ end: dstNode.id, weight: weight });\r\n                    };\r\n                    const removeEdge = (srcNode, dstNode) => {\r\n                        const edge = graph.edgeBetween(srcNode.id, dstNode.id);\r\n                        graph.removeEdge(edge.id);\r\n                        this.removeEdge(edge.id);\r\n                        let upEdgeIndex;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[0][dstNode.id], (neighbor, i) => {\r\n                            if (neighbor.end === srcNode.id) {\r\n                                upEdgeIndex = i;\r\n                            }\r\n                        });\r\n                        neighbors[0][dstNode.id].splice(upEdgeIndex, 1);\r\n                        let downEdgeIndex;\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(neighbors[1][srcNode.id], (neighbor, i) => {\r\n                            if (neighbor.end === dstNode.id) {\r\n                                downEdgeIndex = i;\r\n                            }\r\n                        });\r\n                        neighbors[1][srcNode.id].splice(downEdgeIndex, 1);\r\n                    };\r\n                    const addNodeToRank = (r, node) => {\r\n                        order[r].push(node.id);\r\n                        ranks[r].groups[0].addNode(node, node.id);\r\n                        node.rank = r;\r\n                    };\r\n                    const createNode = () => {\r\n                        const newNode = new _orderNode__WEBPACK_IMPORTED_MODULE_7__.default(null, true, false);\r\n                        this.addNode(newNode);\r\n                        neighbors[0][newNode.id] = [];\r\n                        neighbors[1][newNode.id] = [];\r\n                        virtual[newNode.id] = true;\r\n                        intranode[newNode.id] = false;\r\n                        intranodePathEnd[newNode.id] = false;\r\n                        moving[newNode.id] = true;\r\n                        sink[newNode.id] = false;\r\n                        return newNode;\r\n                    };\r\n                    const createRank = () => {\r\n                        if (ranks.length > 10000) {\r\n                            throw new Error(\"halt\");\r\n                        }\r\n                        const newR = ranks.length;\r\n                        const newRank = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(lodash__WEBPACK_IMPORTED_MODULE_2__.last(ranks).rank + 1);\r\n                        this.addRank(newRank);\r\n                        const newGroup = new _orderGroup__WEBPACK_IMPORTED_MODULE_6__.default(null);\r\n                        newRank.addGroup(newGroup);\r\n                        const newRankComponent = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(lodash__WEBPACK_IMPORTED_MODULE_2__.last(ranks).rank + 1);\r\n                        graph.addRank(newRankComponent);\r\n                        ranks.push(newRankComponent);\r\n                        newRankComponent.addGroup(newGroup);\r\n                        this._groupGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(ranks[newR - 1].groups[0].id, ranks[newR].groups[0].id));\r\n                        this._rankGraph.addEdge(new _graph_edge__WEBPACK_IMPORTED_MODULE_4__.default(ranks[newR - 1].id, ranks[newR].id));\r\n                        newRankComponent.order = [0];\r\n                        groupOrder[newR] = [newGroup.id];\r\n                        groupPositions[newGroup.id] = 0;\r\n                        groupOffsetsPos[newGroup.id] = 0;\r\n                        numNodesPerGroup[newGroup.id] = 0;\r\n                        order[newR] = [];\r\n                        crossings[newR] = 0;\r\n                        rankWidths[newR] = 0;\r\n                    };\r\n                    const resolveHeavyLight = (conflict) => {\r\n                        _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_RESOLVE_HEAVY_LIGHT);\r\n                        const [r, crossedNorthPos, crossedSouthPos, crossingNorthPos, crossingSouthPos] = conflict;\r\n                        const crossedNorthNodeId = order[r - 1][crossedNorthPos];\r\n                        const crossedNorthNode = graph.node(crossedNorthNodeId);\r\n                        const crossedSouthNodeId = order[r][crossedSouthPos];\r\n                        const crossedSouthNode = graph.node(crossedSouthNodeId);\r\n                        const crossingNorthNodeId = order[r - 1][crossingNorthPos];\r\n                        let crossingNorthNode = graph.node(crossingNorthNodeId);\r\n                        const crossingSouthNodeId = order[r][crossingSouthPos];\r\n                        let crossingSouthNode = graph.node(crossingSouthNodeId);\r\n                        let crossingEdge;\r\n                        const resolveY = () => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_RESOLVE_Y);\r\n                            // mark nodes that must not be moved\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r - 1], (nodeId) => {\r\n                                if (intranode[nodeId]) {\r\n                                    moving[nodeId] = false;\r\n                                    let tmpNodeId = nodeId;\r\n                                    while (graph.outEdges(tmpNodeId).length > 0 && graph.outEdges(tmpNodeId)[0].weight === Number.POSITIVE_INFINITY) {\r\n                                        tmpNodeId = graph.outEdges(tmpNodeId)[0].dst;\r\n                                        moving[tmpNodeId] = false;\r\n                                    }\r\n                                }\r\n                                else if (sink[nodeId]) {\r\n                                    // sink on rank r - 1\r\n                                    moving[nodeId] = false;\r\n                                }\r\n                            });\r\n                            // create new rank if necessary\r\n                            if (lodash__WEBPACK_IMPORTED_MODULE_2__.some(order[order.length - 1], nodeId => moving[nodeId])) {\r\n                                if (order.length > 10000) {\r\n                                    throw new Error(\"halt\");\r\n                                }\r\n                                createRank();\r\n                            }\r\n                            // move nodes down and create virtual nodes\r\n                            for (let tmpR = ranks.length - 1; tmpR >= r; --tmpR) {\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[tmpR - 1], (nodeId) => {\r\n                                    const node = graph.node(nodeId);\r\n                                    if (moving[nodeId]) {\r\n                                        addNodeToRank(tmpR, node);\r\n                                        if (tmpR === r) {\r\n                                            // create a virtual node for each in edge and route edge through new node\r\n                                            const sortedEdges = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(graph.inEdges(nodeId), edge => positions[edge.src]);\r\n                                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(sortedEdges, inEdge => {\r\n                                                const newNode = createNode();\r\n                                                addNodeToRank(r - 1, newNode);\r\n                                                const srcNode = graph.node(inEdge.src);\r\n                                                removeEdge(srcNode, node);\r\n                                                addEdge(srcNode, newNode, inEdge.weight);\r\n                                                addEdge(newNode, node, inEdge.weight);\r\n                                            });\r\n                                        }\r\n                                    }\r\n                                    else {\r\n                                        // `node` is non-moving\r\n                                        if (intranodePathEnd[nodeId]) {\r\n                                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(graph.outEdges(node.id), edge => graph.node(edge.dst).rank === tmpR + 1, \"edge below intranode path end not spanning two ranks\");\r\n                                            }\r\n                                            // create a virtual node for each out edge and route edge through new node\r\n                                            // sort edges to prevent crossings between them\r\n                                            const sortedEdges = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(graph.outEdges(nodeId), edge => positions[edge.dst]);\r\n                                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(sortedEdges, outEdge => {\r\n                                                const newNode = createNode();\r\n                                                addNodeToRank(tmpR, newNode);\r\n                                                const dstNode = graph.node(outEdge.dst);\r\n                                                removeEdge(node, dstNode);\r\n                                                addEdge(node, newNode, outEdge.weight);\r\n                                                addEdge(newNode, dstNode, outEdge.weight);\r\n                                            });\r\n                                        }\r\n                                        else if (!sink[nodeId]) {\r\n                                            // there is a an intranode segment between upper and this rank\r\n                                            // => change order within this rank\r\n                                            const lowerNode = graph.outNeighbors(nodeId)[0];\r\n                                            addNodeToRank(tmpR, lowerNode);\r\n                                        }\r\n                                        if (tmpR === r) {\r\n                                            // readd node\r\n                                            addNodeToRank(r - 1, node);\r\n                                        }\r\n                                        // set as moving (default value) for next resolution\r\n                                        moving[nodeId] = true;\r\n                                    }\r\n                                });\r\n                            }\r\n                            for (let tmpR = r - 1; tmpR < ranks.length; ++tmpR) {\r\n                                // keep only nodes that have been (re-)added during y resolution\r\n                                tmpOrder.length = 0;\r\n                                ranks[tmpR].groups[0].clear();\r\n                                for (let pos = rankWidths[tmpR]; pos < order[tmpR].length; ++pos) {\r\n                                    const nodeId = order[tmpR][pos];\r\n                                    const node = graph.node(nodeId);\r\n                                    tmpOrder.push(nodeId);\r\n                                    ranks[tmpR].groups[0].addNode(node, nodeId);\r\n                                    node.rank = tmpR;\r\n                                }\r\n                                numNodesPerGroup[ranks[tmpR].groups[0].id] = tmpOrder.length;\r\n                                rankWidths[tmpR] = tmpOrder.length;\r\n                                // copy back and update positions\r\n                                order[tmpR].length = 0;\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(tmpOrder, (nodeId, pos) => {\r\n                                    order[tmpR].push(nodeId);\r\n                                    positions[nodeId] = pos;\r\n                                });\r\n                            }\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, r + 1), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after y resolution with r = \" + r);\r\n                            }\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_RESOLVE_Y);\r\n                        };\r\n                        const checkXResolution = (side) => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_CHECK_X);\r\n                            const nodesPerRank = new Array(ranks.length);\r\n                            const minGreenNodePerRank = new Array(ranks.length);\r\n                            const maxRedNodePerRank = new Array(ranks.length);\r\n                            let conflict = false;\r\n                            for (let r = 0; r < ranks.length; ++r) {\r\n                                nodesPerRank[r] = new Map();\r\n                                minGreenNodePerRank[r] = (side === \"RIGHT\" ? Number.POSITIVE_INFINITY : Number.NEGATIVE_INFINITY);\r\n                                maxRedNodePerRank[r] = (side === \"RIGHT\" ? Number.NEGATIVE_INFINITY : Number.POSITIVE_INFINITY);\r\n                            }\r\n                            const queue = [];\r\n                            let minRank = r - 1;\r\n                            let maxRank = r;\r\n                            const moveDir = (side === \"LEFT\" ? 1 : -1);\r\n                            const minFun = (side === \"RIGHT\" ? Math.min : Math.max);\r\n                            const maxFun = (side === \"RIGHT\" ? Math.max : Math.min);\r\n                            const geFun = (side === \"RIGHT\" ? ((a, b) => a >= b) : ((a, b) => a <= b));\r\n                            const addNodeToGroup = (r, node, group) => {\r\n                                nodesPerRank[r].set(node, group);\r\n                                queue.push([node, group]);\r\n                                const addIntermediate = () => {\r\n                                    if (geFun(maxRedNodePerRank[r], minGreenNodePerRank[r])) {\r\n                                        const intermediate = [];\r\n                                        for (let pos = maxRedNodePerRank[r]; pos !== minGreenNodePerRank[r]; pos += moveDir) {\r\n                                            const node = graph.node(order[r][pos]);\r\n                                            if (!nodesPerRank[r].has(node)) {\r\n                                                intermediate.push([node, \"YELLOW\"]);\r\n                                            }\r\n                                            else if (node.rank === minRank) {\r\n                                                intermediate.push([node, nodesPerRank[r].get(node)]); // check boundaries again\r\n                                            }\r\n                                        }\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(intermediate, ([node, group]) => {\r\n                                            addNodeToGroup(r, node, group);\r\n                                        });\r\n                                    }\r\n                                };\r\n                                if (group === \"RED\") {\r\n                                    const prev = maxRedNodePerRank[r];\r\n                                    maxRedNodePerRank[r] = maxFun(maxRedNodePerRank[r], positions[node.id]);\r\n                                    if (maxRedNodePerRank[r] !== prev && minGreenNodePerRank[r] !== Number.POSITIVE_INFINITY && minGreenNodePerRank[r] !== Number.NEGATIVE_INFINITY) {\r\n                                        addIntermediate();\r\n                                    }\r\n                                }\r\n                                else {\r\n                                    // potentially heavy\r\n                                    const prev = minGreenNodePerRank[r];\r\n                                    minGreenNodePerRank[r] = minFun(minGreenNodePerRank[r], positions[node.id]);\r\n                                    if (minGreenNodePerRank[r] !== prev && maxRedNodePerRank[r] !== Number.POSITIVE_INFINITY && maxRedNodePerRank[r] !== Number.NEGATIVE_INFINITY) {\r\n                                        addIntermediate();\r\n                                    }\r\n                                }\r\n                            };\r\n                            addNodeToGroup(r - 1, crossedNorthNode, \"GREEN\");\r\n                            addNodeToGroup(r, crossedSouthNode, \"GREEN\");\r\n                            addNodeToGroup(r - 1, crossingNorthNode, \"RED\");\r\n                            addNodeToGroup(r, crossingSouthNode, \"RED\");\r\n                            let queuePointer = 0;\r\n                            while (queuePointer < queue.length && !conflict) {\r\n                                const [node, group] = queue[queuePointer++];\r\n                                if (nodesPerRank[node.rank].get(node) !== group) {\r\n                                    continue; // group has changed in the meantime\r\n                                }\r\n                                const addNeighbors = (neighborMethod, neighborProperty, rankOffset) => {\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph[neighborMethod](node.id), edge => {\r\n                                        if (edge === crossingEdge) {\r\n                                            return;\r\n                                        }\r\n                                        const neighborRank = node.rank + rankOffset;\r\n                                        const neighbor = graph.node(edge[neighborProperty]);\r\n                                        if (!nodesPerRank[neighborRank].has(neighbor)) {\r\n                                            // add neighbor to same group as this node\r\n                                            addNodeToGroup(neighborRank, neighbor, group);\r\n                                        }\r\n                                        else {\r\n                                            // check for conflict or group change\r\n                                            const neighborGroup = nodesPerRank[neighborRank].get(neighbor);\r\n                                            if (neighborGroup !== group) {\r\n                                                if (neighborGroup === \"YELLOW\") {\r\n                                                    addNodeToGroup(neighborRank, neighbor, group);\r\n                                                }\r\n                                                else if (group === \"YELLOW\") {\r\n                                                    addNodeToGroup(node.rank, node, neighborGroup);\r\n                                                }\r\n                                                else {\r\n                                                    // one is \"GREEN\" and the other is \"RED\"\r\n                                                    conflict = true;\r\n                                                }\r\n                                            }\r\n                                        }\r\n                                    });\r\n                                };\r\n                                if (node.rank > minRank) {\r\n                                    addNeighbors(\"inEdges\", \"src\", -1);\r\n                                }\r\n                                if (node.rank === minRank && geFun(positions[node.id], minGreenNodePerRank[node.rank])) {\r\n                                    let foundNewMinRank = false;\r\n                                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.inEdges(node.id), inEdge => {\r\n                                        if (inEdge.weight === Number.POSITIVE_INFINITY) {\r\n                                            foundNewMinRank = true;\r\n                                        }\r\n                                    });\r\n                                    if (foundNewMinRank) {\r\n                                        minRank--;\r\n                                        nodesPerRank[node.rank].forEach((group, borderNode) => {\r\n                                            queue.push([borderNode, group]);\r\n                                        });\r\n                                    }\r\n                                }\r\n                                if (node.rank < maxRank) {\r\n                                    addNeighbors(\"outEdges\", \"dst\", 1);\r\n                                }\r\n                            }\r\n                            if (conflict) {\r\n                                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_CHECK_X);\r\n                                return null;\r\n                            }\r\n                            // group nodes\r\n                            const nodesPerRankGrouped = [];\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(nodesPerRank, (nodes, r) => {\r\n                                nodesPerRankGrouped[r] = {\r\n                                    \"GREEN\": new Set(),\r\n                                    \"MOVING\": new Set(),\r\n                                };\r\n                                minGreenNodePerRank[r] = (side === \"RIGHT\" ? Number.POSITIVE_INFINITY : Number.NEGATIVE_INFINITY);\r\n                                nodes.forEach((group, node) => {\r\n                                    if (group === \"GREEN\") {\r\n                                        nodesPerRankGrouped[r][\"GREEN\"].add(node);\r\n                                        minGreenNodePerRank[r] = minFun(minGreenNodePerRank[r], positions[node.id]);\r\n                                    }\r\n                                });\r\n                                nodes.forEach((group, node) => {\r\n                                    if (group === \"RED\" && geFun(positions[node.id], minGreenNodePerRank[node.rank])) {\r\n                                        nodesPerRankGrouped[r][\"MOVING\"].add(node);\r\n                                    }\r\n                                });\r\n                            });\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_CHECK_X);\r\n                            return nodesPerRankGrouped;\r\n                        };\r\n                        const resolveX = (side, nodesPerRank) => {\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.start(TIMER_RESOLVE_X);\r\n                            lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(nodesPerRank, (rank, r) => {\r\n                                if (rank[\"MOVING\"].size === 0 || rank[\"GREEN\"].size === 0) {\r\n                                    return;\r\n                                }\r\n                                const green = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(Array.from(rank[\"GREEN\"]), node => positions[node.id]);\r\n                                // `moving` is the subset of red nodes that is on the wrong side of the green nodes\r\n                                const moving = lodash__WEBPACK_IMPORTED_MODULE_2__.sortBy(Array.from(rank[\"MOVING\"]), node => positions[node.id]);\r\n                                const newOrder = [];\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], nodeId => {\r\n                                    const node = graph.node(nodeId);\r\n                                    if (rank[\"MOVING\"].has(node)) {\r\n                                        return; // do nothing\r\n                                    }\r\n                                    if (side === \"RIGHT\" && nodeId === green[0].id) {\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(moving, movingNode => {\r\n                                            newOrder.push(movingNode.id);\r\n                                        });\r\n                                    }\r\n                                    newOrder.push(nodeId);\r\n                                    if (side === \"LEFT\" && nodeId === lodash__WEBPACK_IMPORTED_MODULE_2__.last(green).id) {\r\n                                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(moving, movingNode => {\r\n                                            newOrder.push(movingNode.id);\r\n                                        });\r\n                                    }\r\n                                });\r\n                                order[r] = newOrder;\r\n                                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                                    positions[nodeId] = pos;\r\n                                });\r\n                            });\r\n                            if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                                _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(r + 1), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after x resolution\");\r\n                            }\r\n                            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_RESOLVE_X);\r\n                        };\r\n                        didResolveY = false;\r\n                        if (options[\"resolveX\"]) {\r\n                            crossingEdge = graph.edgeBetween(crossingNorthNode.id, crossingSouthNode.id);\r\n                            const leftResolution = checkXResolution(\"LEFT\");\r\n                            const rightResolution = checkXResolution(\"RIGHT\");\r\n                            if (leftResolution === null) {\r\n                                if (rightResolution === null) {\r\n                                    resolveY();\r\n                                    didResolveY = true;\r\n                                }\r\n                                else {\r\n                                    resolveX(\"RIGHT\", rightResolution);\r\n                                }\r\n                            }\r\n                            else {\r\n                                if (rightResolution === null) {\r\n                                    resolveX(\"LEFT\", leftResolution);\r\n                                }\r\n                                else {\r\n                                    const numNodesLeft = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(leftResolution, rank => rank[\"MOVING\"].size));\r\n                                    const numNodesRight = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(lodash__WEBPACK_IMPORTED_MODULE_2__.map(rightResolution, rank => rank[\"MOVING\"].size));\r\n                                    if (numNodesLeft < numNodesRight) {\r\n                                        resolveX(\"LEFT\", leftResolution);\r\n                                    }\r\n                                    else {\r\n                                        resolveX(\"RIGHT\", rightResolution);\r\n                                    }\r\n                                }\r\n                            }\r\n                        }\r\n                        else {\r\n                            resolveY();\r\n                            didResolveY = true;\r\n                        }\r\n                        _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_RESOLVE_HEAVY_LIGHT);\r\n                    };\r\n                    let didResolveY = false;\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        resolveHeavyHeavy(r);\r\n                        while (true) {\r\n                            const conflict = getConflict(\"HEAVYLIGHT\", r);\r\n                            if (conflict === null) {\r\n                                break;\r\n                            }\r\n                            resolveHeavyLight(conflict);\r\n                            if (didResolveY) {\r\n                                break;\r\n                            }\r\n                        }\r\n                    }\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        resolveHeavyHeavy(r);\r\n                    }\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after resolution\");\r\n                    }\r\n                    for (let tmpR = 1; tmpR < ranks.length; ++tmpR) {\r\n                        crossings[tmpR] = countCrossings(order[tmpR], tmpR);\r\n                    }\r\n                    _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_RESOLVE);\r\n                };\r\n                if (options[\"countInitial\"]) {\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        crossings[r] = countCrossings(order[r], r, 0);\r\n                    }\r\n                }\r\n                if (options[\"countOnly\"]) {\r\n                    return lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                }\r\n                if (this._wasm !== null && options[\"resolveConflicts\"]) {\r\n                    yield this._wasm.reorder(order, neighbors[0], graph._nodeGraph.maxId(), numEdgesPerRank);\r\n                    for (let r = 0; r < ranks.length; ++r) {\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(order[r], (nodeId, pos) => {\r\n                            positions[nodeId] = pos;\r\n                        });\r\n                    }\r\n                    for (let r = 1; r < ranks.length; ++r) {\r\n                        crossings[r] = countCrossings(order[r], r, 0);\r\n                    }\r\n                }\r\n                else {\r\n                    reorder();\r\n                }\r\n                if (options[\"resolveConflicts\"]) {\r\n                    resolveConflicts();\r\n                    resolveConflicts();\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after resolveConflicts\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after resolveConflicts\");\r\n                    }\r\n                    reorder(true);\r\n                    if (_util_constants__WEBPACK_IMPORTED_MODULE_0__.DEBUG) {\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYHEAVY\", r) === null, \"heavy-heavy conflict after reorder with preventConflict\");\r\n                        _util_assert__WEBPACK_IMPORTED_MODULE_3__.default.assertAll(lodash__WEBPACK_IMPORTED_MODULE_2__.range(1, ranks.length), r => getConflict(\"HEAVYLIGHT\", r) === null, \"heavy-light conflict after reorder with preventConflict\");\r\n                        assertEdgesBetweenNeighboringRanks();\r\n                    }\r\n                }\r\n                // transform component ranks to absolute ranks\r\n                if (minRank > 0 && minRank < Number.POSITIVE_INFINITY) {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(graph.nodes(), (node) => {\r\n                        node.rank += minRank;\r\n                    });\r\n                }\r\n                // store new positions\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(ranks, (rank) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(rank.groups, (group) => {\r\n                        group.position = groupPositions[group.id];\r\n                        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(group.nodes, (node) => {\r\n                            node.position = positions[node.id];\r\n                        });\r\n                        group.orderNodes();\r\n                    });\r\n                    rank.orderGroups();\r\n                });\r\n                const numCrossings = lodash__WEBPACK_IMPORTED_MODULE_2__.sum(crossings);\r\n                _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_DO_ORDER);\r\n                return numCrossings;\r\n            });\r\n            this._addGroupEdges();\r\n            const numRanks = this._rankGraph.maxId();\r\n            const numGroups = this._groupGraph.maxId();\r\n            const numNodes = this._nodeGraph.maxId();\r\n            groupOffsetsPos = new Array(numGroups); // number of nodes in groups left of this group (reflecting current order) by id\r\n            numNodesPerGroup = new Array(numGroups); // number of nodes in group by id\r\n            groupOrder = new Array(numRanks); // current order of groups on this level (e. g. 2, 0, 1)\r\n            groupPositions = new Array(numGroups); // position of each group by id; roughly inverse of groupOrder (e. g. 1, 2, 0)\r\n            order = new Array(numRanks); // current order of nodes on this level (e. g. 2, 0, 1)\r\n            positions = new Array(numNodes); // inverse of order (e. g. 1, 2, 0)\r\n            neighbors = [\r\n                new Array(numNodes),\r\n                new Array(numNodes),\r\n            ];\r\n            crossings = new Array(numRanks); // number of crossings above each rank\r\n            virtual = new Array(numNodes);\r\n            intranode = new Array(numNodes);\r\n            intranodePathEnd = new Array(numNodes);\r\n            moving = new Array(numNodes);\r\n            sink = new Array(numNodes);\r\n            rankWidths = new Array(numRanks);\r\n            moved = new Array(numNodes);\r\n            numEdgesPerRank = new Array(numRanks);\r\n            tmpOrder = [];\r\n            let numCrossings = 0;\r\n            const groupComponents = this._groupGraph.components();\r\n            for (let i = 0; i < groupComponents.length; ++i) {\r\n                const groupGraphComponent = groupComponents[i];\r\n                const componentGraph = new OrderGraph();\r\n                const ranks = [];\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupGraphComponent.nodes(), (group) => {\r\n                    if (ranks[group.rank.id] === undefined) {\r\n                        ranks[group.rank.id] = new _orderRank__WEBPACK_IMPORTED_MODULE_8__.default(group.rank.rank);\r\n                        componentGraph.addRank(ranks[group.rank.id]);\r\n                    }\r\n                    ranks[group.rank.id].addGroup(group, group.id);\r\n                    const groupNodes = group.nodes;\r\n                    group.nodes = [];\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupNodes, (node) => {\r\n                        group.addNode(node, node.id);\r\n                    });\r\n                });\r\n                lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(componentGraph.nodes(), (newNode) => {\r\n                    lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(this.outEdges(newNode.id), (edge) => {\r\n                        componentGraph.addEdge(edge, edge.id);\r\n                    });\r\n                });\r\n                if (componentGraph._rankGraph.numNodes() < 2 || componentGraph._nodeGraph.numEdges() < componentGraph._rankGraph.numNodes()) {\r\n                    // with 0 or one edges, there is nothing to reorder\r\n                    continue;\r\n                }\r\n                componentGraph._addGroupEdges();\r\n                componentGraph._addRankEdges();\r\n                if (options[\"method\"] === \"spring\") {\r\n                    yield doOrderSprings(componentGraph);\r\n                }\r\n                else {\r\n                    numCrossings += yield doOrder(componentGraph);\r\n                }\r\n            }\r\n            _util_timer__WEBPACK_IMPORTED_MODULE_9__.default.stop(TIMER_ORDER);\r\n            return numCrossings;\r\n        });\r\n    }\r\n    /**\r\n     * Adapted from Barth, W., Jünger, M., & Mutzel, P. (2002, August). Simple and efficient bilayer cross counting.\r\n     * In International Symposium on Graph Drawing (pp. 130-141). Springer, Berlin, Heidelberg.\r\n     * @param numNorth\r\n     * @param numSouth\r\n     * @param edges\r\n     * @private\r\n     */\r\n    _countCrossings(numNorth, numSouth, edges) {\r\n        // build south sequence\r\n        (0,fast_sort__WEBPACK_IMPORTED_MODULE_1__.inPlaceSort)(edges).asc([\r\n            e => e[0],\r\n            e => e[1],\r\n        ]);\r\n        // build the accumulator tree\r\n        let firstIndex = 1;\r\n        while (firstIndex < numSouth) {\r\n            firstIndex *= 2; // number of tree nodes\r\n        }\r\n        const treeSize = 2 * firstIndex - 1;\r\n        firstIndex -= 1; // index of leftmost leaf\r\n        const tree = lodash__WEBPACK_IMPORTED_MODULE_2__.fill(new Array(treeSize), 0);\r\n        // compute the total weight of the crossings\r\n        let crossWeight = 0;\r\n        for (let i = 0; i < edges.length; ++i) {\r\n            let index = edges[i][1] + firstIndex;\r\n            tree[index] += edges[i][2];\r\n            let weightSum = 0;\r\n            while (index > 0) {\r\n                if (index % 2) {\r\n                    weightSum += tree[index + 1];\r\n                }\r\n                index = Math.floor((index - 1) / 2);\r\n                tree[index] += edges[i][2];\r\n            }\r\n            crossWeight += edges[i][2] * weightSum;\r\n        }\r\n        return crossWeight;\r\n    }\r\n    _getChanges(newOrder, positions) {\r\n        const changes = [];\r\n        const permutation = new Array(newOrder.length);\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(newOrder, (nodeId, pos) => {\r\n            permutation[pos] = positions[nodeId];\r\n        });\r\n        let seqStart = null;\r\n        let seqEnd = -1;\r\n        for (let pos = 0; pos < permutation.length; ++pos) {\r\n            if (permutation[pos] > pos) {\r\n                if (seqStart === null) {\r\n                    seqStart = pos;\r\n                    seqEnd = permutation[pos];\r\n                }\r\n                else {\r\n                    if (seqEnd < pos) {\r\n                        changes.push([seqStart, pos - 1]);\r\n                        seqStart = pos;\r\n                        seqEnd = permutation[pos];\r\n                    }\r\n                    else {\r\n                        seqEnd = Math.max(seqEnd, permutation[pos]);\r\n                    }\r\n                }\r\n            }\r\n            if (permutation[pos] === pos && seqStart !== null && seqEnd < pos) {\r\n                changes.push([seqStart, pos - 1]);\r\n                seqStart = null;\r\n            }\r\n        }\r\n        if (seqStart !== null) {\r\n            changes.push([seqStart, permutation.length - 1]);\r\n        }\r\n        return changes;\r\n    }\r\n    _setGroupPositionAndOffset(groupOrder, groupPositions, groupOffsetsPos, numNodesPerGroup) {\r\n        let offset = 0;\r\n        lodash__WEBPACK_IMPORTED_MODULE_2__.forEach(groupOrder, (groupId, pos) => {\r\n            groupPositions[groupId] = pos;\r\n            groupOffsetsPos[groupId] = offset;\r\n            offset += numNodesPerGroup[groupId];\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/order/orderGraph.ts?");
 
 /***/ }),
 
@@ -3828,6 +3850,17 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 
 /***/ }),
 
+/***/ "./src/parse/binaryParser.ts":
+/*!***********************************!*\
+  !*** ./src/parse/binaryParser.ts ***!
+  \***********************************/
+/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
+
+"use strict";
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ BinaryParser)\n/* harmony export */ });\n/* harmony import */ var _parser__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./parser */ \"./src/parse/parser.ts\");\n/* harmony import */ var _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../renderGraph/renderGraph */ \"./src/renderGraph/renderGraph.ts\");\n\r\n\r\n/**\r\n * Builds render graphs from the binary layout input compiled by experiments/bench/binary.py, which holds the graph\r\n * structure in flat 32 bit integer sections and all labels and connector names in a string table.\r\n * The sections are read through typed array views on the buffer, so no intermediate JSON object tree is built.\r\n * Edges get their precomputed label instead of their attributes.\r\n */\r\nclass BinaryParser {\r\n    /**\r\n     * Parses the binary graph starting at byteOffset of an ArrayBuffer or SharedArrayBuffer.\r\n     */\r\n    static parse(buffer, byteOffset = 0) {\r\n        if (byteOffset % 4 !== 0) {\r\n            buffer = new Uint8Array(buffer, byteOffset).slice().buffer;\r\n            byteOffset = 0;\r\n        }\r\n        const header = new Uint32Array(buffer, byteOffset, 8);\r\n        if (header[0] !== BinaryParser.MAGIC) {\r\n            throw new Error(\"Not a binary graph\");\r\n        }\r\n        if (header[1] !== BinaryParser.VERSION) {\r\n            throw new Error(\"Unsupported binary graph version: \" + header[1]);\r\n        }\r\n        const [numGraphs, numNodes, numConnectors, numEdges, numStrings, numBytes] = header.subarray(2);\r\n        let offset = byteOffset + header.byteLength;\r\n        const section = (length) => {\r\n            const view = new Int32Array(buffer, offset, length);\r\n            offset += view.byteLength;\r\n            return view;\r\n        };\r\n        const graphs = section(4 * numGraphs);\r\n        const nodes = section(BinaryParser.NODE_FIELDS * numNodes);\r\n        const connectors = section(numConnectors);\r\n        const edges = section(BinaryParser.EDGE_FIELDS * numEdges);\r\n        const stringOffsets = section(numStrings + 1);\r\n        const bytes = new Uint8Array(buffer, offset, numBytes);\r\n        // strings are decoded once on first use; TextDecoder does not accept views on shared memory\r\n        const SharedArrayBufferClass = globalThis[\"SharedArrayBuffer\"];\r\n        const shared = (typeof SharedArrayBufferClass === \"function\" && buffer instanceof SharedArrayBufferClass);\r\n        const decoder = new TextDecoder();\r\n        const strings = new Array(numStrings);\r\n        const string = (i) => {\r\n            if (i < 0) {\r\n                return null;\r\n            }\r\n            if (strings[i] === undefined) {\r\n                const view = bytes.subarray(stringOffsets[i], stringOffsets[i + 1]);\r\n                strings[i] = decoder.decode(shared ? view.slice() : view);\r\n            }\r\n            return strings[i];\r\n        };\r\n        const build = (g) => {\r\n            const graph = new _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_1__.default();\r\n            const nodeEnd = graphs[4 * g] + graphs[4 * g + 1];\r\n            for (let i = graphs[4 * g]; i < nodeEnd; ++i) {\r\n                const n = BinaryParser.NODE_FIELDS * i;\r\n                const type = BinaryParser.TYPES[nodes[n + 1]];\r\n                const node = new (_parser__WEBPACK_IMPORTED_MODULE_0__.default.classForType(type))(type, string(nodes[n + 2]));\r\n                if (nodes[n + 3] >= 0) {\r\n                    node.setChildGraph(build(nodes[n + 3]));\r\n                }\r\n                const inStart = nodes[n + 6];\r\n                const outStart = inStart + nodes[n + 7];\r\n                const inConnectors = [];\r\n                for (let c = inStart; c < outStart; ++c) {\r\n                    inConnectors.push(string(connectors[c]));\r\n                }\r\n                const outConnectors = [];\r\n                for (let c = outStart; c < outStart + nodes[n + 8]; ++c) {\r\n                    outConnectors.push(string(connectors[c]));\r\n                }\r\n                node.setConnectors(inConnectors, outConnectors);\r\n                node.scopeEntry = (nodes[n + 4] >= 0 ? nodes[n + 4] : null);\r\n                node.scopeExit = (nodes[n + 5] >= 0 ? nodes[n + 5] : null);\r\n                graph.addNode(node, nodes[n]);\r\n            }\r\n            const edgeEnd = graphs[4 * g + 2] + graphs[4 * g + 3];\r\n            for (let i = graphs[4 * g + 2]; i < edgeEnd; ++i) {\r\n                const e = BinaryParser.EDGE_FIELDS * i;\r\n                const edge = new (_parser__WEBPACK_IMPORTED_MODULE_0__.default.classForType(BinaryParser.TYPES[edges[e + 2]]))(edges[e], edges[e + 1], string(edges[e + 3]), string(edges[e + 4]), {});\r\n                edge.compiledLabel = string(edges[e + 5]);\r\n                graph.addEdge(edge);\r\n            }\r\n            return graph;\r\n        };\r\n        return build(0);\r\n    }\r\n}\r\nBinaryParser.MAGIC = 0x42464453;\r\nBinaryParser.VERSION = 1;\r\nBinaryParser.TYPES = [\"AccessNode\", \"LibraryNode\", \"MapEntry\", \"MapExit\", \"NestedSDFG\", \"SDFGState\", \"Tasklet\", \"Memlet\", \"InterstateEdge\"];\r\nBinaryParser.NODE_FIELDS = 9;\r\nBinaryParser.EDGE_FIELDS = 6;\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/parse/binaryParser.ts?");
+
+/***/ }),
+
 /***/ "./src/parse/loader.ts":
 /*!*****************************!*\
   !*** ./src/parse/loader.ts ***!
@@ -3835,7 +3868,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Loader)\n/* harmony export */ });\n/* harmony import */ var _parser__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./parser */ \"./src/parse/parser.ts\");\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n\r\n\r\nclass Loader {\r\n    static load(name, basePath = null) {\r\n        if (basePath === null) {\r\n            basePath = Loader.getBasePath();\r\n        }\r\n        return fetch(basePath + name + \".json\")\r\n            .then(response => response.json())\r\n            .then(json => _parser__WEBPACK_IMPORTED_MODULE_0__.default.parse(json))\r\n            .catch(() => null);\r\n    }\r\n    static loadXhr(name, basePath = \"./graphs/\") {\r\n        if (basePath === null) {\r\n            basePath = Loader.getBasePath();\r\n        }\r\n        const doXhr = (path) => {\r\n            return new Promise(function (resolve, reject) {\r\n                const xhr = new XMLHttpRequest();\r\n                xhr.onload = function () {\r\n                    if (this.status < 400) {\r\n                        resolve(xhr.response);\r\n                    }\r\n                    else {\r\n                        reject({\r\n                            status: this.status,\r\n                            statusText: xhr.statusText\r\n                        });\r\n                    }\r\n                };\r\n                xhr.onerror = function () {\r\n                    reject({ status: this.status, statusText: xhr.statusText });\r\n                };\r\n                xhr.open('GET', path);\r\n                xhr.send();\r\n            });\r\n        };\r\n        return doXhr(basePath + name + \".json\")\r\n            .then(response => JSON.parse(response))\r\n            .then(json => _parser__WEBPACK_IMPORTED_MODULE_0__.default.parse(json))\r\n            .catch(() => null);\r\n    }\r\n    static getBasePath() {\r\n        let graphDir = '/graphs/';\r\n        let layouterDirPos = window.location.href.indexOf(_util_constants__WEBPACK_IMPORTED_MODULE_1__.ROOT_DIR);\r\n        if (layouterDirPos > -1) {\r\n            graphDir = window.location.href.substr(0, layouterDirPos + _util_constants__WEBPACK_IMPORTED_MODULE_1__.ROOT_DIR.length) + '/graphs/';\r\n        }\r\n        return graphDir;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/parse/loader.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Loader)\n/* harmony export */ });\n/* harmony import */ var _binaryParser__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./binaryParser */ \"./src/parse/binaryParser.ts\");\n/* harmony import */ var _parser__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./parser */ \"./src/parse/parser.ts\");\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n\r\n\r\n\r\nclass Loader {\r\n    static load(name, basePath = null) {\r\n        if (basePath === null) {\r\n            basePath = Loader.getBasePath();\r\n        }\r\n        return fetch(basePath + name + \".json\")\r\n            .then(response => response.json())\r\n            .then(json => _parser__WEBPACK_IMPORTED_MODULE_1__.default.parse(json))\r\n            .catch(() => null);\r\n    }\r\n    static loadXhr(name, basePath = \"./graphs/\") {\r\n        if (basePath === null) {\r\n            basePath = Loader.getBasePath();\r\n        }\r\n        return Loader._xhr(basePath + name + \".json\", \"text\")\r\n            .then(response => JSON.parse(response))\r\n            .then(json => _parser__WEBPACK_IMPORTED_MODULE_1__.default.parse(json))\r\n            .catch(() => null);\r\n    }\r\n    /**\r\n     * Loads a graph compiled by experiments/bench/binary.py (name + \".bin\") and builds it directly from the buffer,\r\n     * see BinaryParser. With shared, the file is held in a SharedArrayBuffer (if available) first.\r\n     */\r\n    static loadBinary(name, basePath = \"./graphs/\", shared = false) {\r\n        return Loader.fetchBinary(name, basePath, shared)\r\n            .then(buffer => _binaryParser__WEBPACK_IMPORTED_MODULE_0__.default.parse(buffer))\r\n            .catch(() => null);\r\n    }\r\n    /**\r\n     * Fetches the binary file of a graph as ArrayBuffer, or as SharedArrayBuffer with shared (if the environment\r\n     * provides it, e.g. cross-origin isolated pages), which can be passed to workers without copying.\r\n     */\r\n    static fetchBinary(name, basePath = \"./graphs/\", shared = false) {\r\n        if (basePath === null) {\r\n            basePath = Loader.getBasePath();\r\n        }\r\n        return Loader._xhr(basePath + name + \".bin\", \"arraybuffer\").then((buffer) => {\r\n            const SharedArrayBufferClass = globalThis[\"SharedArrayBuffer\"];\r\n            if (!shared || typeof SharedArrayBufferClass !== \"function\") {\r\n                return buffer;\r\n            }\r\n            const sharedBuffer = new SharedArrayBufferClass(buffer.byteLength);\r\n            new Uint8Array(sharedBuffer).set(new Uint8Array(buffer));\r\n            return sharedBuffer;\r\n        });\r\n    }\r\n    static _xhr(path, responseType) {\r\n        return new Promise(function (resolve, reject) {\r\n            const xhr = new XMLHttpRequest();\r\n            xhr.responseType = responseType;\r\n            xhr.onload = function () {\r\n                if (this.status < 400) {\r\n                    resolve(xhr.response);\r\n                }\r\n                else {\r\n                    reject({\r\n                        status: this.status,\r\n                        statusText: xhr.statusText\r\n                    });\r\n                }\r\n            };\r\n            xhr.onerror = function () {\r\n                reject({ status: this.status, statusText: xhr.statusText });\r\n            };\r\n            xhr.open('GET', path);\r\n            xhr.send();\r\n        });\r\n    }\r\n    static getBasePath() {\r\n        let graphDir = '/graphs/';\r\n        let layouterDirPos = window.location.href.indexOf(_util_constants__WEBPACK_IMPORTED_MODULE_2__.ROOT_DIR);\r\n        if (layouterDirPos > -1) {\r\n            graphDir = window.location.href.substr(0, layouterDirPos + _util_constants__WEBPACK_IMPORTED_MODULE_2__.ROOT_DIR.length) + '/graphs/';\r\n        }\r\n        return graphDir;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/parse/loader.ts?");
 
 /***/ }),
 
@@ -3846,7 +3879,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Parser)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _renderGraph_accessNode__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../renderGraph/accessNode */ \"./src/renderGraph/accessNode.ts\");\n/* harmony import */ var _renderGraph_interstateEdge__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../renderGraph/interstateEdge */ \"./src/renderGraph/interstateEdge.ts\");\n/* harmony import */ var _renderGraph_libraryNode__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../renderGraph/libraryNode */ \"./src/renderGraph/libraryNode.ts\");\n/* harmony import */ var _renderGraph_mapEntry__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../renderGraph/mapEntry */ \"./src/renderGraph/mapEntry.ts\");\n/* harmony import */ var _renderGraph_mapExit__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../renderGraph/mapExit */ \"./src/renderGraph/mapExit.ts\");\n/* harmony import */ var _renderGraph_memlet__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../renderGraph/memlet */ \"./src/renderGraph/memlet.ts\");\n/* harmony import */ var _renderGraph_nestedSdfg__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../renderGraph/nestedSdfg */ \"./src/renderGraph/nestedSdfg.ts\");\n/* harmony import */ var _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../renderGraph/renderGraph */ \"./src/renderGraph/renderGraph.ts\");\n/* harmony import */ var _renderGraph_sdfgState__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../renderGraph/sdfgState */ \"./src/renderGraph/sdfgState.ts\");\n/* harmony import */ var _renderGraph_tasklet__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../renderGraph/tasklet */ \"./src/renderGraph/tasklet.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Parser {\r\n    static parse(json) {\r\n        const graph = new _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_8__.default();\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(json.nodes, (jsonNode) => {\r\n            this.addNode(graph, jsonNode);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(json.edges, (jsonEdge) => {\r\n            const edge = new (this.classForType(jsonEdge.attributes.data.type))(parseInt(jsonEdge.src), parseInt(jsonEdge.dst), jsonEdge.src_connector, jsonEdge.dst_connector, jsonEdge.attributes.data.attributes);\r\n            graph.addEdge(edge);\r\n        });\r\n        return graph;\r\n    }\r\n    static addNode(graph, jsonNode) {\r\n        const node = new (this.classForType(jsonNode.type))(jsonNode.type, jsonNode.label);\r\n        // set child graph\r\n        if (jsonNode.type === \"NestedSDFG\") {\r\n            node.setChildGraph(this.parse(jsonNode.attributes.sdfg));\r\n        }\r\n        if (jsonNode.type === \"SDFGState\") {\r\n            node.setChildGraph(this.parse(jsonNode));\r\n        }\r\n        // set connectors\r\n        let inConnectors = [];\r\n        if (jsonNode.attributes.in_connectors) {\r\n            if (Array.isArray(jsonNode.attributes.in_connectors)) {\r\n                inConnectors = jsonNode.attributes.in_connectors;\r\n            }\r\n            else {\r\n                inConnectors = Object.keys(jsonNode.attributes.in_connectors);\r\n            }\r\n        }\r\n        let outConnectors = [];\r\n        if (jsonNode.attributes.out_connectors) {\r\n            if (Array.isArray(jsonNode.attributes.out_connectors)) {\r\n                outConnectors = jsonNode.attributes.out_connectors;\r\n            }\r\n            else {\r\n                outConnectors = Object.keys(jsonNode.attributes.out_connectors);\r\n            }\r\n        }\r\n        node.setConnectors(inConnectors, outConnectors);\r\n        // set scope entry and exit\r\n        node.scopeEntry = jsonNode.scope_entry ? parseInt(jsonNode.scope_entry) : null;\r\n        node.scopeExit = jsonNode.scope_exit ? parseInt(jsonNode.scope_exit) : null;\r\n        graph.addNode(node, jsonNode.id);\r\n    }\r\n    static classForType(type) {\r\n        const types = {\r\n            \"AccessNode\": _renderGraph_accessNode__WEBPACK_IMPORTED_MODULE_1__.default,\r\n            \"LibraryNode\": _renderGraph_libraryNode__WEBPACK_IMPORTED_MODULE_3__.default,\r\n            \"MapEntry\": _renderGraph_mapEntry__WEBPACK_IMPORTED_MODULE_4__.default,\r\n            \"MapExit\": _renderGraph_mapExit__WEBPACK_IMPORTED_MODULE_5__.default,\r\n            \"NestedSDFG\": _renderGraph_nestedSdfg__WEBPACK_IMPORTED_MODULE_7__.default,\r\n            \"SDFGState\": _renderGraph_sdfgState__WEBPACK_IMPORTED_MODULE_9__.default,\r\n            \"Tasklet\": _renderGraph_tasklet__WEBPACK_IMPORTED_MODULE_10__.default,\r\n            \"Memlet\": _renderGraph_memlet__WEBPACK_IMPORTED_MODULE_6__.default,\r\n            \"InterstateEdge\": _renderGraph_interstateEdge__WEBPACK_IMPORTED_MODULE_2__.default,\r\n        };\r\n        if (!types.hasOwnProperty(type)) {\r\n            throw new Error(\"Unknown node or edge type: \" + type);\r\n        }\r\n        return types[type];\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/parse/parser.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Parser)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _renderGraph_accessNode__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../renderGraph/accessNode */ \"./src/renderGraph/accessNode.ts\");\n/* harmony import */ var _renderGraph_interstateEdge__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../renderGraph/interstateEdge */ \"./src/renderGraph/interstateEdge.ts\");\n/* harmony import */ var _renderGraph_libraryNode__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../renderGraph/libraryNode */ \"./src/renderGraph/libraryNode.ts\");\n/* harmony import */ var _renderGraph_mapEntry__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../renderGraph/mapEntry */ \"./src/renderGraph/mapEntry.ts\");\n/* harmony import */ var _renderGraph_mapExit__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../renderGraph/mapExit */ \"./src/renderGraph/mapExit.ts\");\n/* harmony import */ var _renderGraph_memlet__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../renderGraph/memlet */ \"./src/renderGraph/memlet.ts\");\n/* harmony import */ var _renderGraph_nestedSdfg__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../renderGraph/nestedSdfg */ \"./src/renderGraph/nestedSdfg.ts\");\n/* harmony import */ var _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../renderGraph/renderGraph */ \"./src/renderGraph/renderGraph.ts\");\n/* harmony import */ var _renderGraph_sdfgState__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../renderGraph/sdfgState */ \"./src/renderGraph/sdfgState.ts\");\n/* harmony import */ var _renderGraph_tasklet__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../renderGraph/tasklet */ \"./src/renderGraph/tasklet.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Parser {\r\n    static parse(json) {\r\n        const graph = new _renderGraph_renderGraph__WEBPACK_IMPORTED_MODULE_8__.default();\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(json.nodes, (jsonNode) => {\r\n            this.addNode(graph, jsonNode);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(json.edges, (jsonEdge) => {\r\n            const edge = new (this.classForType(jsonEdge.attributes.data.type))(parseInt(jsonEdge.src), parseInt(jsonEdge.dst), jsonEdge.src_connector, jsonEdge.dst_connector, jsonEdge.attributes.data.attributes);\r\n            graph.addEdge(edge);\r\n        });\r\n        return graph;\r\n    }\r\n    static addNode(graph, jsonNode) {\r\n        const node = new (this.classForType(jsonNode.type))(jsonNode.type, jsonNode.label);\r\n        // set child graph\r\n        if (jsonNode.type === \"NestedSDFG\") {\r\n            node.setChildGraph(this.parse(jsonNode.attributes.sdfg));\r\n        }\r\n        if (jsonNode.type === \"SDFGState\") {\r\n            node.setChildGraph(this.parse(jsonNode));\r\n        }\r\n        // set connectors\r\n        let inConnectors = [];\r\n        if (jsonNode.attributes.in_connectors) {\r\n            if (Array.isArray(jsonNode.attributes.in_connectors)) {\r\n                inConnectors = jsonNode.attributes.in_connectors;\r\n            }\r\n            else {\r\n                inConnectors = Object.keys(jsonNode.attributes.in_connectors);\r\n            }\r\n        }\r\n        let outConnectors = [];\r\n        if (jsonNode.attributes.out_connectors) {\r\n            if (Array.isArray(jsonNode.attributes.out_connectors)) {\r\n                outConnectors = jsonNode.attributes.out_connectors;\r\n            }\r\n            else {\r\n                outConnectors = Object.keys(jsonNode.attributes.out_connectors);\r\n            }\r\n        }\r\n        node.setConnectors(inConnectors, outConnectors);\r\n        node.collapsed = (jsonNode.attributes.is_collapsed === true);\r\n        // set scope entry and exit\r\n        node.scopeEntry = jsonNode.scope_entry ? parseInt(jsonNode.scope_entry) : null;\r\n        node.scopeExit = jsonNode.scope_exit ? parseInt(jsonNode.scope_exit) : null;\r\n        graph.addNode(node, jsonNode.id);\r\n    }\r\n    static classForType(type) {\r\n        const types = {\r\n            \"AccessNode\": _renderGraph_accessNode__WEBPACK_IMPORTED_MODULE_1__.default,\r\n            \"LibraryNode\": _renderGraph_libraryNode__WEBPACK_IMPORTED_MODULE_3__.default,\r\n            \"MapEntry\": _renderGraph_mapEntry__WEBPACK_IMPORTED_MODULE_4__.default,\r\n            \"MapExit\": _renderGraph_mapExit__WEBPACK_IMPORTED_MODULE_5__.default,\r\n            \"NestedSDFG\": _renderGraph_nestedSdfg__WEBPACK_IMPORTED_MODULE_7__.default,\r\n            \"SDFGState\": _renderGraph_sdfgState__WEBPACK_IMPORTED_MODULE_9__.default,\r\n            \"Tasklet\": _renderGraph_tasklet__WEBPACK_IMPORTED_MODULE_10__.default,\r\n            \"Memlet\": _renderGraph_memlet__WEBPACK_IMPORTED_MODULE_6__.default,\r\n            \"InterstateEdge\": _renderGraph_interstateEdge__WEBPACK_IMPORTED_MODULE_2__.default,\r\n        };\r\n        if (!types.hasOwnProperty(type)) {\r\n            throw new Error(\"Unknown node or edge type: \" + type);\r\n        }\r\n        return types[type];\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/parse/parser.ts?");
 
 /***/ }),
 
@@ -3945,7 +3978,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ InterstateEdge)\n/* harmony export */ });\n/* harmony import */ var _renderEdge__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./renderEdge */ \"./src/renderGraph/renderEdge.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\nclass InterstateEdge extends _renderEdge__WEBPACK_IMPORTED_MODULE_0__.default {\r\n    label() {\r\n        return this.attributes.label || \"\";\r\n    }\r\n    color() {\r\n        return _renderer_color__WEBPACK_IMPORTED_MODULE_1__.default.fromNumber(0xBECBD7);\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/interstateEdge.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ InterstateEdge)\n/* harmony export */ });\n/* harmony import */ var _renderEdge__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./renderEdge */ \"./src/renderGraph/renderEdge.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\nclass InterstateEdge extends _renderEdge__WEBPACK_IMPORTED_MODULE_0__.default {\r\n    label() {\r\n        if (this.compiledLabel !== null) {\r\n            return this.compiledLabel;\r\n        }\r\n        return this.attributes.label || \"\";\r\n    }\r\n    color() {\r\n        return _renderer_color__WEBPACK_IMPORTED_MODULE_1__.default.fromNumber(0xBECBD7);\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/interstateEdge.ts?");
 
 /***/ }),
 
@@ -3989,7 +4022,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Memlet)\n/* harmony export */ });\n/* harmony import */ var _renderEdge__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./renderEdge */ \"./src/renderGraph/renderEdge.ts\");\n\r\nclass Memlet extends _renderEdge__WEBPACK_IMPORTED_MODULE_0__.default {\r\n    label() {\r\n        if (!this.attributes.subset) {\r\n            return \"\";\r\n        }\r\n        let label = this.attributes.data || \"\";\r\n        const subset = this.sdfgPropertyToString(this.attributes.subset);\r\n        label += (subset.length <= 3 ? subset : \"[...]\");\r\n        if (this.attributes.other_subset) {\r\n            const otherSubset = this.sdfgPropertyToString(this.attributes.other_subset);\r\n            label += ' -> ' + (otherSubset.length <= 3 ? otherSubset : \"[...]\");\r\n        }\r\n        if (this.attributes.wcr) {\r\n            label += \"\\n\" + 'CR: ' + this.sdfgPropertyToString(this.attributes.wcr);\r\n        }\r\n        return label;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/memlet.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Memlet)\n/* harmony export */ });\n/* harmony import */ var _renderEdge__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./renderEdge */ \"./src/renderGraph/renderEdge.ts\");\n\r\nclass Memlet extends _renderEdge__WEBPACK_IMPORTED_MODULE_0__.default {\r\n    label() {\r\n        if (this.compiledLabel !== null) {\r\n            return this.compiledLabel;\r\n        }\r\n        if (!this.attributes.subset) {\r\n            return \"\";\r\n        }\r\n        let label = this.attributes.data || \"\";\r\n        const subset = this.sdfgPropertyToString(this.attributes.subset);\r\n        label += (subset.length <= 3 ? subset : \"[...]\");\r\n        if (this.attributes.other_subset) {\r\n            const otherSubset = this.sdfgPropertyToString(this.attributes.other_subset);\r\n            label += ' -> ' + (otherSubset.length <= 3 ? otherSubset : \"[...]\");\r\n        }\r\n        if (this.attributes.wcr) {\r\n            label += \"\\n\" + 'CR: ' + this.sdfgPropertyToString(this.attributes.wcr);\r\n        }\r\n        return label;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/memlet.ts?");
 
 /***/ }),
 
@@ -4022,7 +4055,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderEdge)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\n\r\n\r\nclass RenderEdge extends _graph_edge__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor(src, dst, srcConnector = null, dstConnector = null, attributes = {}) {\r\n        super(src, dst);\r\n        this.labelFontSize = 10;\r\n        this.srcConnector = null;\r\n        this.dstConnector = null;\r\n        this.attributes = {};\r\n        this.x = null;\r\n        this.y = null;\r\n        this.width = null;\r\n        this.height = null;\r\n        this.labelSize = null;\r\n        this.labelX = null;\r\n        this.labelY = null;\r\n        this.points = [];\r\n        this.layoutEdge = null;\r\n        this.srcConnector = srcConnector || null;\r\n        this.dstConnector = dstConnector || null;\r\n        this.attributes = attributes;\r\n    }\r\n    sdfgPropertyToString(property) {\r\n        if (property === null) {\r\n            return \"\";\r\n        }\r\n        if (typeof property === \"boolean\") {\r\n            return property ? \"True\" : \"False\";\r\n        }\r\n        else if (property.type === \"Indices\" || property.type === \"subsets.Indices\") {\r\n            let indices = property.indices;\r\n            let preview = '[';\r\n            for (let index of indices) {\r\n                preview += this.sdfgPropertyToString(index) + ', ';\r\n            }\r\n            return preview.slice(0, -2) + ']';\r\n        }\r\n        else if (property.type === \"Range\" || property.type === \"subsets.Range\") {\r\n            let ranges = property.ranges;\r\n            // Generate string from range\r\n            let preview = '[';\r\n            for (let range of ranges) {\r\n                preview += this.sdfgRangeToString(range) + ', ';\r\n            }\r\n            return preview.slice(0, -2) + ']';\r\n        }\r\n        else if (property.language !== undefined) {\r\n            // Code\r\n            if (property.string_data !== '' && property.string_data !== undefined && property.string_data !== null) {\r\n                return '<pre class=\"code\"><code>' + property.string_data.trim() +\r\n                    '</code></pre><div class=\"clearfix\"></div>';\r\n            }\r\n            return '';\r\n        }\r\n        else if (property.approx !== undefined && property.main !== undefined) {\r\n            // SymExpr\r\n            return property.main;\r\n        }\r\n        else if (property.constructor == Object) {\r\n            // General dictionary\r\n            return '<pre class=\"code\"><code>' + JSON.stringify(property, undefined, 4) +\r\n                '</code></pre><div class=\"clearfix\"></div>';\r\n        }\r\n        else if (property.constructor == Array) {\r\n            // General array\r\n            let result = '[ ';\r\n            let first = true;\r\n            for (let subprop of property) {\r\n                if (!first)\r\n                    result += ', ';\r\n                result += this.sdfgPropertyToString(subprop);\r\n                first = false;\r\n            }\r\n            return result + ' ]';\r\n        }\r\n        else {\r\n            return property;\r\n        }\r\n    }\r\n    sdfgRangeToString(range) {\r\n        let preview = '';\r\n        if (range.start == range.end && range.step == 1 && range.tile == 1) {\r\n            preview += this.sdfgPropertyToString(range.start);\r\n        }\r\n        else {\r\n            let endp1 = this.sdfgPropertyToString(range.end) + ' + 1';\r\n            // Try to simplify using math.js\r\n            preview += this.sdfgPropertyToString(range.start) + ':' + endp1;\r\n            if (range.step != 1) {\r\n                preview += ':' + this.sdfgPropertyToString(range.step);\r\n                if (range.tile != 1)\r\n                    preview += ':' + this.sdfgPropertyToString(range.tile);\r\n            }\r\n            else if (range.tile != 1) {\r\n                preview += '::' + this.sdfgPropertyToString(range.tile);\r\n            }\r\n        }\r\n        return preview;\r\n    }\r\n    updateBoundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.points, (point) => {\r\n            minX = Math.min(minX, point.x);\r\n            maxX = Math.max(maxX, point.x);\r\n            minY = Math.min(minY, point.y);\r\n            maxY = Math.max(maxY, point.y);\r\n        });\r\n        this.x = minX;\r\n        this.y = minY;\r\n        this.width = maxX - minX;\r\n        this.height = maxY - minY;\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    color() {\r\n        return _renderer_color__WEBPACK_IMPORTED_MODULE_3__.default.BLACK;\r\n    }\r\n    lineWidth() {\r\n        return 1;\r\n    }\r\n    lineStyle() {\r\n        return \"solid\";\r\n    }\r\n}\r\n;\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderEdge.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderEdge)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_edge__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../graph/edge */ \"./src/graph/edge.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\n\r\n\r\nclass RenderEdge extends _graph_edge__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor(src, dst, srcConnector = null, dstConnector = null, attributes = {}) {\r\n        super(src, dst);\r\n        this.labelFontSize = 10;\r\n        this.srcConnector = null;\r\n        this.dstConnector = null;\r\n        this.attributes = {};\r\n        // label computed when the graph was compiled to the binary format (see BinaryParser), used instead of attributes\r\n        this.compiledLabel = null;\r\n        this.x = null;\r\n        this.y = null;\r\n        this.width = null;\r\n        this.height = null;\r\n        this.labelSize = null;\r\n        this.labelX = null;\r\n        this.labelY = null;\r\n        this.points = [];\r\n        this.layoutEdge = null;\r\n        this.srcConnector = srcConnector || null;\r\n        this.dstConnector = dstConnector || null;\r\n        this.attributes = attributes;\r\n    }\r\n    sdfgPropertyToString(property) {\r\n        if (property === null) {\r\n            return \"\";\r\n        }\r\n        if (typeof property === \"boolean\") {\r\n            return property ? \"True\" : \"False\";\r\n        }\r\n        else if (property.type === \"Indices\" || property.type === \"subsets.Indices\") {\r\n            let indices = property.indices;\r\n            let preview = '[';\r\n            for (let index of indices) {\r\n                preview += this.sdfgPropertyToString(index) + ', ';\r\n            }\r\n            return preview.slice(0, -2) + ']';\r\n        }\r\n        else if (property.type === \"Range\" || property.type === \"subsets.Range\") {\r\n            let ranges = property.ranges;\r\n            // Generate string from range\r\n            let preview = '[';\r\n            for (let range of ranges) {\r\n                preview += this.sdfgRangeToString(range) + ', ';\r\n            }\r\n            return preview.slice(0, -2) + ']';\r\n        }\r\n        else if (property.language !== undefined) {\r\n            // Code\r\n            if (property.string_data !== '' && property.string_data !== undefined && property.string_data !== null) {\r\n                return '<pre class=\"code\"><code>' + property.string_data.trim() +\r\n                    '</code></pre><div class=\"clearfix\"></div>';\r\n            }\r\n            return '';\r\n        }\r\n        else if (property.approx !== undefined && property.main !== undefined) {\r\n            // SymExpr\r\n            return property.main;\r\n        }\r\n        else if (property.constructor == Object) {\r\n            // General dictionary\r\n            return '<pre class=\"code\"><code>' + JSON.stringify(property, undefined, 4) +\r\n                '</code></pre><div class=\"clearfix\"></div>';\r\n        }\r\n        else if (property.constructor == Array) {\r\n            // General array\r\n            let result = '[ ';\r\n            let first = true;\r\n            for (let subprop of property) {\r\n                if (!first)\r\n                    result += ', ';\r\n                result += this.sdfgPropertyToString(subprop);\r\n                first = false;\r\n            }\r\n            return result + ' ]';\r\n        }\r\n        else {\r\n            return property;\r\n        }\r\n    }\r\n    sdfgRangeToString(range) {\r\n        let preview = '';\r\n        if (range.start == range.end && range.step == 1 && range.tile == 1) {\r\n            preview += this.sdfgPropertyToString(range.start);\r\n        }\r\n        else {\r\n            let endp1 = this.sdfgPropertyToString(range.end) + ' + 1';\r\n            // Try to simplify using math.js\r\n            preview += this.sdfgPropertyToString(range.start) + ':' + endp1;\r\n            if (range.step != 1) {\r\n                preview += ':' + this.sdfgPropertyToString(range.step);\r\n                if (range.tile != 1)\r\n                    preview += ':' + this.sdfgPropertyToString(range.tile);\r\n            }\r\n            else if (range.tile != 1) {\r\n                preview += '::' + this.sdfgPropertyToString(range.tile);\r\n            }\r\n        }\r\n        return preview;\r\n    }\r\n    updateBoundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.points, (point) => {\r\n            minX = Math.min(minX, point.x);\r\n            maxX = Math.max(maxX, point.x);\r\n            minY = Math.min(minY, point.y);\r\n            maxY = Math.max(maxY, point.y);\r\n        });\r\n        this.x = minX;\r\n        this.y = minY;\r\n        this.width = maxX - minX;\r\n        this.height = maxY - minY;\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    color() {\r\n        return _renderer_color__WEBPACK_IMPORTED_MODULE_3__.default.BLACK;\r\n    }\r\n    lineWidth() {\r\n        return 1;\r\n    }\r\n    lineStyle() {\r\n        return \"solid\";\r\n    }\r\n}\r\n;\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderEdge.ts?");
 
 /***/ }),
 
@@ -4033,7 +4066,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderGraph)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_graph__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../graph/graph */ \"./src/graph/graph.ts\");\n\r\n\r\n\r\nclass RenderGraph extends _graph_graph__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor() {\r\n        super(...arguments);\r\n        this.layoutGraph = null;\r\n    }\r\n    boundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.nodes(), (node) => {\r\n            const box = node.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.edges(), (edge) => {\r\n            const box = edge.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(minX, minY, maxX - minX, maxY - minY);\r\n    }\r\n    numNodes() {\r\n        return this.allNodes().length;\r\n    }\r\n    numEdges() {\r\n        return this.allEdges().length;\r\n    }\r\n    numConnectors() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_0__.sum(lodash__WEBPACK_IMPORTED_MODULE_0__.map(this.allNodes(), node => node.inConnectors.length + node.outConnectors.length));\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderGraph.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderGraph)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_graph__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../graph/graph */ \"./src/graph/graph.ts\");\n\r\n\r\n\r\nclass RenderGraph extends _graph_graph__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor() {\r\n        super(...arguments);\r\n        this.layoutGraph = null;\r\n    }\r\n    boundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.nodes(), (node) => {\r\n            const box = node.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this.edges(), (edge) => {\r\n            const box = edge.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(minX, minY, maxX - minX, maxY - minY);\r\n    }\r\n    /**\r\n     * Collapses all nodes with a child graph that are nested at least depth levels deep (0 for the top level)\r\n     * and expands the others.\r\n     */\r\n    collapseFrom(depth) {\r\n        const collapse = (graph, level) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.nodes(), (node) => {\r\n                if (node.childGraph !== null) {\r\n                    node.collapsed = (level >= depth);\r\n                    collapse(node.childGraph, level + 1);\r\n                }\r\n            });\r\n        };\r\n        collapse(this, 0);\r\n    }\r\n    numNodes() {\r\n        return this.allNodes().length;\r\n    }\r\n    numEdges() {\r\n        return this.allEdges().length;\r\n    }\r\n    numConnectors() {\r\n        return lodash__WEBPACK_IMPORTED_MODULE_0__.sum(lodash__WEBPACK_IMPORTED_MODULE_0__.map(this.allNodes(), node => node.inConnectors.length + node.outConnectors.length));\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderGraph.ts?");
 
 /***/ }),
 
@@ -4044,7 +4077,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderNode)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_node__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../graph/node */ \"./src/graph/node.ts\");\n/* harmony import */ var _renderConnector__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./renderConnector */ \"./src/renderGraph/renderConnector.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\nclass RenderNode extends _graph_node__WEBPACK_IMPORTED_MODULE_3__.default {\r\n    constructor(type, label = \"\", backgroundColor = _renderer_color__WEBPACK_IMPORTED_MODULE_5__.default.WHITE, borderColor = _renderer_color__WEBPACK_IMPORTED_MODULE_5__.default.BLACK) {\r\n        super(label);\r\n        this.childPadding = 0;\r\n        this.labelPaddingX = 10;\r\n        this.labelPaddingY = 10;\r\n        this.labelFontSize = 12;\r\n        this.connectorPadding = 10;\r\n        this.id = null;\r\n        this.graph = null;\r\n        this.inConnectors = [];\r\n        this.outConnectors = [];\r\n        this.scopeEntry = null;\r\n        this.layoutGraph = null;\r\n        this.layoutNode = null;\r\n        this.x = null;\r\n        this.y = null;\r\n        this.width = 0;\r\n        this.height = 0;\r\n        this.labelSize = { width: 0, height: 0 };\r\n        this._type = null;\r\n        this._type = type;\r\n        this.backgroundColor = backgroundColor;\r\n        this.borderColor = borderColor;\r\n    }\r\n    type() {\r\n        return this._type;\r\n    }\r\n    updateSize(minimumSize) {\r\n        this.width = Math.max(this.width, minimumSize.width);\r\n        this.height = Math.max(this.height, minimumSize.height);\r\n    }\r\n    setConnectors(inConnectors, outConnectors) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(inConnectors, (name) => {\r\n            this.inConnectors.push(new _renderConnector__WEBPACK_IMPORTED_MODULE_4__.default(name.toString(), this));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(outConnectors, (name) => {\r\n            this.outConnectors.push(new _renderConnector__WEBPACK_IMPORTED_MODULE_4__.default(name.toString(), this));\r\n        });\r\n        // update width\r\n        this.width = Math.max(this.width, this.connectorsWidth());\r\n    }\r\n    size() {\r\n        return {\r\n            width: this.width,\r\n            height: this.height,\r\n        };\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_2__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    /**\r\n     * Calculates the width to fit both the in-connectors and out-connectors including some padding.\r\n     */\r\n    connectorsWidth() {\r\n        const numConnectors = Math.max(this.inConnectors.length, this.outConnectors.length);\r\n        return numConnectors * (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING + 2 * this.connectorPadding;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderNode.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RenderNode)\n/* harmony export */ });\n/* harmony import */ var _util_constants__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ../util/constants */ \"./src/util/constants.ts\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _graph_node__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../graph/node */ \"./src/graph/node.ts\");\n/* harmony import */ var _renderConnector__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./renderConnector */ \"./src/renderGraph/renderConnector.ts\");\n/* harmony import */ var _renderer_color__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../renderer/color */ \"./src/renderer/color.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\nclass RenderNode extends _graph_node__WEBPACK_IMPORTED_MODULE_3__.default {\r\n    constructor(type, label = \"\", backgroundColor = _renderer_color__WEBPACK_IMPORTED_MODULE_5__.default.WHITE, borderColor = _renderer_color__WEBPACK_IMPORTED_MODULE_5__.default.BLACK) {\r\n        super(label);\r\n        this.childPadding = 0;\r\n        this.labelPaddingX = 10;\r\n        this.labelPaddingY = 10;\r\n        this.labelFontSize = 12;\r\n        this.connectorPadding = 10;\r\n        this.id = null;\r\n        this.graph = null;\r\n        this.inConnectors = [];\r\n        this.outConnectors = [];\r\n        this.scopeEntry = null;\r\n        this.layoutGraph = null;\r\n        this.layoutNode = null;\r\n        // collapsed nodes with a child graph are laid out without it by layouters with the option lazy,\r\n        // which then set isPlaceholder and leave the child graph without layout\r\n        this.collapsed = false;\r\n        this.isPlaceholder = false;\r\n        this.x = null;\r\n        this.y = null;\r\n        this.width = 0;\r\n        this.height = 0;\r\n        this.labelSize = { width: 0, height: 0 };\r\n        this._type = null;\r\n        this._type = type;\r\n        this.backgroundColor = backgroundColor;\r\n        this.borderColor = borderColor;\r\n    }\r\n    type() {\r\n        return this._type;\r\n    }\r\n    updateSize(minimumSize) {\r\n        this.width = Math.max(this.width, minimumSize.width);\r\n        this.height = Math.max(this.height, minimumSize.height);\r\n    }\r\n    setConnectors(inConnectors, outConnectors) {\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(inConnectors, (name) => {\r\n            this.inConnectors.push(new _renderConnector__WEBPACK_IMPORTED_MODULE_4__.default(name.toString(), this));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(outConnectors, (name) => {\r\n            this.outConnectors.push(new _renderConnector__WEBPACK_IMPORTED_MODULE_4__.default(name.toString(), this));\r\n        });\r\n        // update width\r\n        this.width = Math.max(this.width, this.connectorsWidth());\r\n    }\r\n    size() {\r\n        return {\r\n            width: this.width,\r\n            height: this.height,\r\n        };\r\n    }\r\n    /**\r\n     * Size of the node without its child graph, i.e. of its label and connectors, as before any layout.\r\n     */\r\n    collapsedSize() {\r\n        return {\r\n            width: Math.max(this.labelSize.width, this.connectorsWidth()),\r\n            height: this.labelSize.height,\r\n        };\r\n    }\r\n    boundingBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_2__.default(this.x, this.y, this.width, this.height);\r\n    }\r\n    /**\r\n     * Calculates the width to fit both the in-connectors and out-connectors including some padding.\r\n     */\r\n    connectorsWidth() {\r\n        const numConnectors = Math.max(this.inConnectors.length, this.outConnectors.length);\r\n        return numConnectors * (_util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SIZE + _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING) - _util_constants__WEBPACK_IMPORTED_MODULE_0__.CONNECTOR_SPACING + 2 * this.connectorPadding;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderGraph/renderNode.ts?");
 
 /***/ }),
 
@@ -4099,7 +4132,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ PixiContainer)\n/* harmony export */ });\n/* harmony import */ var pixi_js__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! pixi.js */ \"./node_modules/pixi.js/dist/esm/pixi.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _rendererContainer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./rendererContainer */ \"./src/renderer/rendererContainer.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_circle__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/circle */ \"./src/shapes/circle.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_line__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/line */ \"./src/shapes/line.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/abstractPolygon */ \"./src/shapes/abstractPolygon.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../shapes/shapeCollection */ \"./src/shapes/shapeCollection.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass PixiContainer extends _rendererContainer__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor() {\r\n        super();\r\n        this.pixiContainer = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Container();\r\n    }\r\n    _renderShape(shape) {\r\n        if (shape instanceof _shapes_rectangle__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n            const rectangle = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            rectangle.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            rectangle.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            rectangle.drawRect(0, 0, shape.width, shape.height);\r\n            rectangle.endFill();\r\n            rectangle.x = shape.x;\r\n            rectangle.y = shape.y;\r\n            if (shape.zIndex !== null) {\r\n                rectangle.zIndex = shape.zIndex;\r\n            }\r\n            this.pixiContainer.addChild(rectangle);\r\n        }\r\n        else if (shape instanceof _shapes_circle__WEBPACK_IMPORTED_MODULE_4__.default) {\r\n            const circle = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            circle.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            circle.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            circle.drawCircle(center.x, center.y, shape.width / 2);\r\n            circle.endFill();\r\n            this.pixiContainer.addChild(circle);\r\n        }\r\n        else if (shape instanceof _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n            const ellipse = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            ellipse.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            ellipse.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            ellipse.drawEllipse(center.x, center.y, shape.width / 2, shape.height / 2);\r\n            ellipse.endFill();\r\n            this.pixiContainer.addChild(ellipse);\r\n        }\r\n        else if (shape instanceof _shapes_line__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n            const line = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            line.lineStyle(shape.lineWidth);\r\n            line.moveTo(shape.x1, shape.y1);\r\n            line.lineTo(shape.x2, shape.y2);\r\n            this.pixiContainer.addChild(line);\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            let line = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            line.lineStyle(1, shape.color.number(), shape.color.alpha);\r\n            line.moveTo(lodash__WEBPACK_IMPORTED_MODULE_1__.head(shape.points()).x, lodash__WEBPACK_IMPORTED_MODULE_1__.head(shape.points()).y);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.tail(shape.points()), (point) => {\r\n                line.lineTo(point.x, point.y);\r\n            });\r\n            // draw arrow head\r\n            const end = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(lodash__WEBPACK_IMPORTED_MODULE_1__.last(shape.points()).x, lodash__WEBPACK_IMPORTED_MODULE_1__.last(shape.points()).y);\r\n            const dir = end.clone().sub(shape.points()[shape.points().length - 2]);\r\n            const angle = dir.angle();\r\n            const point1 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y + 3)).rotateAround(end, angle);\r\n            line.lineTo(point1.x, point1.y);\r\n            line.moveTo(end.x, end.y);\r\n            const point2 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y - 3)).rotateAround(end, angle);\r\n            line.lineTo(point2.x, point2.y);\r\n            line.zIndex = -1;\r\n            this.pixiContainer.addChild(line);\r\n        }\r\n        else if (shape instanceof _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_9__.default) {\r\n            const polygon = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            polygon.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            polygon.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            polygon.drawPolygon(shape.getPath());\r\n            polygon.endFill();\r\n            this.pixiContainer.addChild(polygon);\r\n        }\r\n        else if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_10__.default) {\r\n            const fontStyle = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.TextStyle({ fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex() });\r\n            const pixiText = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Text(shape.text, fontStyle);\r\n            pixiText.x = shape.x;\r\n            pixiText.y = shape.y;\r\n            this.pixiContainer.addChild(pixiText);\r\n        }\r\n        else if (shape instanceof _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_11__.default) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shape.getShapes(), (childShape) => {\r\n                this._renderShape(childShape);\r\n            });\r\n        }\r\n    }\r\n    removeChildren() {\r\n        super.removeChildren();\r\n        this.pixiContainer.removeChildren();\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/pixiContainer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ PixiContainer)\n/* harmony export */ });\n/* harmony import */ var pixi_js__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! pixi.js */ \"./node_modules/pixi.js/dist/esm/pixi.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _rendererContainer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./rendererContainer */ \"./src/renderer/rendererContainer.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_circle__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/circle */ \"./src/shapes/circle.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_line__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/line */ \"./src/shapes/line.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/abstractPolygon */ \"./src/shapes/abstractPolygon.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../shapes/shapeCollection */ \"./src/shapes/shapeCollection.ts\");\n/* harmony import */ var _color__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ./color */ \"./src/renderer/color.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass PixiContainer extends _rendererContainer__WEBPACK_IMPORTED_MODULE_2__.default {\r\n    constructor() {\r\n        super();\r\n        this.pixiContainer = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Container();\r\n    }\r\n    _renderShape(shape) {\r\n        if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_10__.default) {\r\n            const fontStyle = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.TextStyle({ fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex() });\r\n            const pixiText = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Text(shape.text, fontStyle);\r\n            pixiText.x = shape.x;\r\n            pixiText.y = shape.y;\r\n            this.pixiContainer.addChild(pixiText);\r\n        }\r\n        else if (shape instanceof _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_11__.default) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shape.getShapes(), (childShape) => {\r\n                this._renderShape(childShape);\r\n            });\r\n        }\r\n        else {\r\n            const graphics = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics();\r\n            if (this._draw(graphics, shape)) {\r\n                this.pixiContainer.addChild(graphics);\r\n            }\r\n        }\r\n    }\r\n    /**\r\n     * Draws a shape other than text into the graphics object; returns false if the shape cannot be drawn.\r\n     */\r\n    _draw(graphics, shape) {\r\n        if (shape instanceof _shapes_rectangle__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            graphics.drawRect(0, 0, shape.width, shape.height);\r\n            graphics.endFill();\r\n            graphics.x = shape.x;\r\n            graphics.y = shape.y;\r\n            if (shape.zIndex !== null) {\r\n                graphics.zIndex = shape.zIndex;\r\n            }\r\n        }\r\n        else if (shape instanceof _shapes_circle__WEBPACK_IMPORTED_MODULE_4__.default) {\r\n            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            graphics.drawCircle(center.x, center.y, shape.width / 2);\r\n            graphics.endFill();\r\n        }\r\n        else if (shape instanceof _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            graphics.drawEllipse(center.x, center.y, shape.width / 2, shape.height / 2);\r\n            graphics.endFill();\r\n        }\r\n        else if (shape instanceof _shapes_line__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n            graphics.lineStyle(shape.lineWidth);\r\n            graphics.moveTo(shape.x1, shape.y1);\r\n            graphics.lineTo(shape.x2, shape.y2);\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            graphics.lineStyle(1, shape.color.number(), shape.color.alpha);\r\n            graphics.moveTo(lodash__WEBPACK_IMPORTED_MODULE_1__.head(shape.points()).x, lodash__WEBPACK_IMPORTED_MODULE_1__.head(shape.points()).y);\r\n            lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(lodash__WEBPACK_IMPORTED_MODULE_1__.tail(shape.points()), (point) => {\r\n                graphics.lineTo(point.x, point.y);\r\n            });\r\n            // draw arrow head\r\n            const end = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(lodash__WEBPACK_IMPORTED_MODULE_1__.last(shape.points()).x, lodash__WEBPACK_IMPORTED_MODULE_1__.last(shape.points()).y);\r\n            const dir = end.clone().sub(shape.points()[shape.points().length - 2]);\r\n            const angle = dir.angle();\r\n            const point1 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y + 3)).rotateAround(end, angle);\r\n            graphics.lineTo(point1.x, point1.y);\r\n            graphics.moveTo(end.x, end.y);\r\n            const point2 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y - 3)).rotateAround(end, angle);\r\n            graphics.lineTo(point2.x, point2.y);\r\n            graphics.zIndex = -1;\r\n        }\r\n        else if (shape instanceof _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_9__.default) {\r\n            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);\r\n            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);\r\n            graphics.drawPolygon(shape.getPath());\r\n            graphics.endFill();\r\n        }\r\n        else {\r\n            return false;\r\n        }\r\n        return true;\r\n    }\r\n    _numShownObjects() {\r\n        return this.pixiContainer.children.length;\r\n    }\r\n    _createObject(kind) {\r\n        return (kind === \"text\" ? new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Text(\"\") : new pixi_js__WEBPACK_IMPORTED_MODULE_0__.Graphics());\r\n    }\r\n    _drawObject(object, shape, simplified) {\r\n        if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_10__.default) {\r\n            object.text = shape.text;\r\n            object.style = new pixi_js__WEBPACK_IMPORTED_MODULE_0__.TextStyle({ fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex() });\r\n            object.x = shape.x;\r\n            object.y = shape.y;\r\n            return;\r\n        }\r\n        const graphics = object;\r\n        graphics.clear();\r\n        graphics.x = 0;\r\n        graphics.y = 0;\r\n        if (!simplified) {\r\n            this._draw(graphics, shape);\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            // straight line without arrow head\r\n            const points = shape.points();\r\n            graphics.lineStyle(1, shape.color.number(), shape.color.alpha);\r\n            graphics.moveTo(lodash__WEBPACK_IMPORTED_MODULE_1__.head(points).x, lodash__WEBPACK_IMPORTED_MODULE_1__.head(points).y);\r\n            graphics.lineTo(lodash__WEBPACK_IMPORTED_MODULE_1__.last(points).x, lodash__WEBPACK_IMPORTED_MODULE_1__.last(points).y);\r\n        }\r\n        else {\r\n            const box = shape.boundingBox();\r\n            const background = shape.backgroundColor || _color__WEBPACK_IMPORTED_MODULE_12__.default.WHITE;\r\n            const border = shape.borderColor || shape.color || _color__WEBPACK_IMPORTED_MODULE_12__.default.BLACK;\r\n            graphics.lineStyle(1, border.number(), border.alpha);\r\n            graphics.beginFill(background.number(), background.alpha);\r\n            graphics.drawRect(box.x, box.y, box.width, box.height);\r\n            graphics.endFill();\r\n        }\r\n    }\r\n    _showObject(object, order) {\r\n        // with sortableChildren, the objects are drawn in the order of their shapes\r\n        this.pixiContainer.sortableChildren = true;\r\n        object.zIndex = order;\r\n        this.pixiContainer.addChild(object);\r\n    }\r\n    _hideObject(object) {\r\n        this.pixiContainer.removeChild(object);\r\n    }\r\n    removeChildren() {\r\n        super.removeChildren();\r\n        this.pixiContainer.removeChildren();\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/pixiContainer.ts?");
 
 /***/ }),
 
@@ -4110,7 +4143,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ PixiRenderer)\n/* harmony export */ });\n/* harmony import */ var pixi_viewport__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! pixi-viewport */ \"./node_modules/pixi-viewport/dist/esm/viewport.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var pixi_js__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! pixi.js */ \"./node_modules/pixi.js/dist/esm/pixi.js\");\n/* harmony import */ var _pixiContainer__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ./pixiContainer */ \"./src/renderer/pixiContainer.ts\");\n/* harmony import */ var _renderer__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./renderer */ \"./src/renderer/renderer.ts\");\n\r\n\r\n\r\n\r\n\r\nclass PixiRenderer extends _renderer__WEBPACK_IMPORTED_MODULE_4__.default {\r\n    constructor(domContainer) {\r\n        super();\r\n        this._app = new pixi_js__WEBPACK_IMPORTED_MODULE_2__.Application({\r\n            width: domContainer.clientWidth,\r\n            height: domContainer.clientHeight,\r\n            antialias: true,\r\n        });\r\n        this._app.renderer.backgroundColor = 0xFFFFFF;\r\n        domContainer.appendChild(this._app.view);\r\n        this._viewport = new pixi_viewport__WEBPACK_IMPORTED_MODULE_0__.Viewport({\r\n            screenWidth: domContainer.clientWidth,\r\n            screenHeight: domContainer.clientHeight,\r\n            worldWidth: domContainer.clientWidth,\r\n            worldHeight: domContainer.clientHeight,\r\n            interaction: this._app.renderer.plugins.interaction, // the interaction module is important for wheel to work properly when renderer.view is placed or scaled\r\n        });\r\n        this._app.stage.addChild(this._viewport);\r\n        this._container = new _pixiContainer__WEBPACK_IMPORTED_MODULE_3__.default();\r\n        this._viewport.addChild(this._container.pixiContainer);\r\n        this._viewport.interactive = true;\r\n        this._viewport.drag().pinch().wheel().decelerate();\r\n        document.addEventListener(\"keydown\", (e) => {\r\n            if (e.ctrlKey && e.key === \"s\") {\r\n                e.preventDefault();\r\n                let fileName = prompt(\"Save as:\", \"screenshot\");\r\n                if (fileName !== null && fileName !== \"\") {\r\n                    if (!fileName.endsWith(\".png\")) {\r\n                        fileName += \".png\";\r\n                    }\r\n                    this.savePng(fileName);\r\n                }\r\n            }\r\n        });\r\n    }\r\n    /**\r\n     * Adapted from https://www.html5gamedevs.com/topic/31190-saving-pixi-content-to-image/.\r\n     */\r\n    savePng(fileName) {\r\n        this._app.renderer.extract.canvas(this._viewport.children[0]).toBlob(function (b) {\r\n            const a = document.createElement('a');\r\n            document.body.append(a);\r\n            a.download = fileName;\r\n            a.href = URL.createObjectURL(b);\r\n            a.click();\r\n            a.remove();\r\n        }, 'image/png');\r\n    }\r\n    /**\r\n     * Shows a graph in the designated container.\r\n     * @param graph Graph with layout information for all nodes and edges (x, y, width, height).\r\n     */\r\n    _render(graph) {\r\n        this._container.removeChildren();\r\n        const box = graph.boundingBox();\r\n        this._viewport.moveCenter(box.width / 2, box.height / 2);\r\n        this._viewport.setZoom(Math.min(1, this._viewport.worldWidth / box.width, this._viewport.worldHeight / box.height), true);\r\n        const shapes = this._getShapesForGraph(graph);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._additionalShapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        this._container.render();\r\n    }\r\n    getTextSize(text, fontSize, fontFamily) {\r\n        const fontStyle = new pixi_js__WEBPACK_IMPORTED_MODULE_2__.TextStyle({ fontFamily: fontFamily, fontSize: fontSize });\r\n        return pixi_js__WEBPACK_IMPORTED_MODULE_2__.TextMetrics.measureText(text, fontStyle);\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/pixiRenderer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ PixiRenderer)\n/* harmony export */ });\n/* harmony import */ var pixi_viewport__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! pixi-viewport */ \"./node_modules/pixi-viewport/dist/esm/viewport.es.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var pixi_js__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! pixi.js */ \"./node_modules/pixi.js/dist/esm/pixi.js\");\n/* harmony import */ var _pixiContainer__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ./pixiContainer */ \"./src/renderer/pixiContainer.ts\");\n/* harmony import */ var _renderer__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./renderer */ \"./src/renderer/renderer.ts\");\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\nclass PixiRenderer extends _renderer__WEBPACK_IMPORTED_MODULE_4__.default {\r\n    /**\r\n     * @param domContainer Element to draw into.\r\n     * @param options Culling options of the container (see Renderer._setContainerOptions).\r\n     */\r\n    constructor(domContainer, options = {}) {\r\n        super();\r\n        this._app = new pixi_js__WEBPACK_IMPORTED_MODULE_2__.Application({\r\n            width: domContainer.clientWidth,\r\n            height: domContainer.clientHeight,\r\n            antialias: true,\r\n        });\r\n        this._app.renderer.backgroundColor = 0xFFFFFF;\r\n        domContainer.appendChild(this._app.view);\r\n        this._viewport = new pixi_viewport__WEBPACK_IMPORTED_MODULE_0__.Viewport({\r\n            screenWidth: domContainer.clientWidth,\r\n            screenHeight: domContainer.clientHeight,\r\n            worldWidth: domContainer.clientWidth,\r\n            worldHeight: domContainer.clientHeight,\r\n            interaction: this._app.renderer.plugins.interaction, // the interaction module is important for wheel to work properly when renderer.view is placed or scaled\r\n        });\r\n        this._app.stage.addChild(this._viewport);\r\n        this._container = new _pixiContainer__WEBPACK_IMPORTED_MODULE_3__.default();\r\n        this._setContainerOptions(options);\r\n        this._viewport.addChild(this._container.pixiContainer);\r\n        this._viewport.interactive = true;\r\n        this._viewport.drag().pinch().wheel().decelerate();\r\n        // runs before the stage is drawn; updateView returns right away if the view did not change\r\n        this._app.ticker.add(() => {\r\n            const bounds = this._viewport.getVisibleBounds();\r\n            this._container.updateView(new _geometry_box__WEBPACK_IMPORTED_MODULE_5__.default(bounds.x, bounds.y, bounds.width, bounds.height), this._viewport.scale.x);\r\n        });\r\n        this._addDocumentListener(\"keydown\", (e) => {\r\n            if (e.ctrlKey && e.key === \"s\") {\r\n                e.preventDefault();\r\n                let fileName = prompt(\"Save as:\", \"screenshot\");\r\n                if (fileName !== null && fileName !== \"\") {\r\n                    if (!fileName.endsWith(\".png\")) {\r\n                        fileName += \".png\";\r\n                    }\r\n                    this.savePng(fileName);\r\n                }\r\n            }\r\n        });\r\n    }\r\n    /**\r\n     * Adapted from https://www.html5gamedevs.com/topic/31190-saving-pixi-content-to-image/.\r\n     */\r\n    savePng(fileName) {\r\n        this._app.renderer.extract.canvas(this._viewport.children[0]).toBlob(function (b) {\r\n            const a = document.createElement('a');\r\n            document.body.append(a);\r\n            a.download = fileName;\r\n            a.href = URL.createObjectURL(b);\r\n            a.click();\r\n            a.remove();\r\n        }, 'image/png');\r\n    }\r\n    /**\r\n     * Shows a graph in the designated container.\r\n     * @param graph Graph with layout information for all nodes and edges (x, y, width, height).\r\n     */\r\n    _render(graph) {\r\n        this._container.removeChildren();\r\n        const box = graph.boundingBox();\r\n        this._viewport.moveCenter(box.width / 2, box.height / 2);\r\n        this._viewport.setZoom(Math.min(1, this._viewport.worldWidth / box.width, this._viewport.worldHeight / box.height), true);\r\n        const shapes = this._getShapesForGraph(graph);\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(shapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_1__.forEach(this._additionalShapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        this._container.render();\r\n    }\r\n    setView(x, y, zoom) {\r\n        this._viewport.setZoom(zoom, true);\r\n        this._viewport.moveCenter(x, y);\r\n    }\r\n    viewSize() {\r\n        return { width: this._viewport.screenWidth, height: this._viewport.screenHeight };\r\n    }\r\n    cleanUp() {\r\n        super.cleanUp();\r\n        this._app.destroy(true, { children: true });\r\n    }\r\n    getTextSize(text, fontSize, fontFamily) {\r\n        const fontStyle = new pixi_js__WEBPACK_IMPORTED_MODULE_2__.TextStyle({ fontFamily: fontFamily, fontSize: fontSize });\r\n        return pixi_js__WEBPACK_IMPORTED_MODULE_2__.TextMetrics.measureText(text, fontStyle);\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/pixiRenderer.ts?");
 
 /***/ }),
 
@@ -4121,7 +4154,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Renderer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _color__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./color */ \"./src/renderer/color.ts\");\n/* harmony import */ var _shapes_downwardTrapezoid__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/downwardTrapezoid */ \"./src/shapes/downwardTrapezoid.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_foldedCornerRectangle__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/foldedCornerRectangle */ \"./src/shapes/foldedCornerRectangle.ts\");\n/* harmony import */ var _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../bench/layoutAnalysis */ \"./src/bench/layoutAnalysis.ts\");\n/* harmony import */ var _parse_loader__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../parse/loader */ \"./src/parse/loader.ts\");\n/* harmony import */ var _shapes_octagon__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/octagon */ \"./src/shapes/octagon.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_upwardTrapezoid__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../shapes/upwardTrapezoid */ \"./src/shapes/upwardTrapezoid.ts\");\n/* harmony import */ var _layouter_sugiyamaLayouter__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! ../layouter/sugiyamaLayouter */ \"./src/layouter/sugiyamaLayouter.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Renderer {\r\n    constructor() {\r\n        this._additionalShapes = [];\r\n    }\r\n    show(layouter, name, validate = false, printCost = false, loadFunction = _parse_loader__WEBPACK_IMPORTED_MODULE_8__.default.loadXhr) {\r\n        loadFunction(name).then((graph) => {\r\n            this.layoutAndRender(graph, layouter, validate, printCost);\r\n        });\r\n    }\r\n    layoutAndRender(graph, layouter = new _layouter_sugiyamaLayouter__WEBPACK_IMPORTED_MODULE_13__.default(), validate = false, printCost = false) {\r\n        this.setSizes(graph);\r\n        layouter.layout(graph).then((layout) => {\r\n            if (validate) {\r\n                const layoutAnalysis = new _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__.default(layout);\r\n                if (layoutAnalysis.validate()) {\r\n                    console.log(\"Layout satisfies constraints.\");\r\n                }\r\n                else {\r\n                    console.log(\"Layout violates constraints.\");\r\n                }\r\n            }\r\n            if (printCost) {\r\n                const layoutAnalysis = new _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__.default(layout);\r\n                console.log(\"Weighted cost: \" + layoutAnalysis.cost(true).toFixed(0));\r\n            }\r\n            this._render(graph);\r\n        });\r\n    }\r\n    setSizes(graph) {\r\n        // set node sizes\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.allNodes(), (node) => {\r\n            node.labelSize = this.labelSize(node);\r\n            node.updateSize(node.labelSize);\r\n        });\r\n        // set edge label sizes\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.allEdges(), (edge) => {\r\n            edge.labelSize = this.edgeLabelSize(edge);\r\n        });\r\n    }\r\n    labelSize(node) {\r\n        const textBox = (new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, 0, 0, node.label(), node.labelFontSize)).boundingBox();\r\n        return {\r\n            width: textBox.width + 2 * node.labelPaddingX,\r\n            height: textBox.height + 2 * node.labelPaddingY,\r\n        };\r\n    }\r\n    edgeLabelSize(edge) {\r\n        return (new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, 0, 0, edge.label(), edge.labelFontSize)).boundingBox().size();\r\n    }\r\n    /**\r\n     * Adds an offset to center the label within the node (if necessary).\r\n     */\r\n    _labelPosition(node) {\r\n        const labelSize = node.labelSize;\r\n        const labelBox = new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(node.x + node.labelPaddingX, node.y + node.labelPaddingY, labelSize.width, labelSize.height);\r\n        return labelBox.centerIn(node.boundingBox()).topLeft();\r\n    }\r\n    _getShapesForGraph(graph) {\r\n        const shapes = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.nodes(), (node) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForNode(node), shape => shapes.push(shape));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.edges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForEdge(edge), shape => shapes.push(shape));\r\n        });\r\n        return shapes;\r\n    }\r\n    _getShapesForNode(node) {\r\n        const shapes = [];\r\n        switch (node.type()) {\r\n            case \"AccessNode\":\r\n            case \"GenericNode\":\r\n                shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(node, node.x, node.y, node.width, node.height, node.backgroundColor || _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK, node.borderColor || _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"LibraryNode\":\r\n                shapes.push(new _shapes_foldedCornerRectangle__WEBPACK_IMPORTED_MODULE_6__.default(node, node.x, node.y, node.width, node.height));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"NestedSDFG\":\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height));\r\n                break;\r\n            case \"SDFGState\":\r\n                const color = new _color__WEBPACK_IMPORTED_MODULE_2__.default(0xDE, 0xEB, 0xF7);\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height, color, color));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, node.x + 5, node.y + 5, node.label()));\r\n                break;\r\n            case \"Tasklet\":\r\n                shapes.push(new _shapes_octagon__WEBPACK_IMPORTED_MODULE_9__.default(node, node.x, node.y, node.width, node.height));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"GenericContainerNode\":\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height, node.backgroundColor, node.borderColor));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, node.x + 5, node.y + 5, node.label()));\r\n                break;\r\n        }\r\n        if (node.type().endsWith(\"Entry\")) {\r\n            shapes.push(new _shapes_upwardTrapezoid__WEBPACK_IMPORTED_MODULE_12__.default(node, node.x, node.y, node.width, node.height));\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n        }\r\n        if (node.type().endsWith(\"Exit\")) {\r\n            shapes.push(new _shapes_downwardTrapezoid__WEBPACK_IMPORTED_MODULE_3__.default(node, node.x, node.y, node.width, node.height));\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n        }\r\n        // add child graph shapes\r\n        if (node.childGraph !== null) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForGraph(node.childGraph), (shape) => {\r\n                shapes.push(shape);\r\n            });\r\n        }\r\n        // add connector shapes\r\n        const backgroundColorUnscoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0xf0fdff);\r\n        const backgroundColorScoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0xc1dfe6).fade(0.56);\r\n        const borderColorUnscoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK;\r\n        const borderColorScoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK.fade(0.56);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.inConnectors, (connector) => {\r\n            const backgroundColor = (connector.name.startsWith('IN_') ? backgroundColorScoped : backgroundColorUnscoped);\r\n            const borderColor = (connector.name.startsWith('IN_') ? borderColorScoped : borderColorUnscoped);\r\n            shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(connector, connector.x, connector.y, connector.width, connector.height, backgroundColor, borderColor));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.outConnectors, (connector) => {\r\n            const backgroundColor = (connector.name.startsWith('OUT_') ? backgroundColorScoped : backgroundColorUnscoped);\r\n            const borderColor = (connector.name.startsWith('OUT_') ? borderColorScoped : borderColorUnscoped);\r\n            shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(connector, connector.x, connector.y, connector.width, connector.height, backgroundColor, borderColor));\r\n        });\r\n        return shapes;\r\n    }\r\n    _getShapesForEdge(edge) {\r\n        const shapes = [new _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_4__.default(edge, lodash__WEBPACK_IMPORTED_MODULE_0__.clone(edge.points), edge.color(), edge.lineWidth(), edge.lineStyle())];\r\n        if (edge.labelX) {\r\n            const labelSize = this.edgeLabelSize(edge);\r\n            const labelBackground = new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(null, edge.labelX - 3, edge.labelY - 3, labelSize.width + 6, labelSize.height + 6, _color__WEBPACK_IMPORTED_MODULE_2__.default.WHITE.fade(0.8), _color__WEBPACK_IMPORTED_MODULE_2__.default.TRANSPARENT);\r\n            labelBackground.zIndex = 2;\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, edge.labelX, edge.labelY, edge.label(), edge.labelFontSize, _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0x666666)));\r\n        }\r\n        return shapes;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/renderer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Renderer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _color__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./color */ \"./src/renderer/color.ts\");\n/* harmony import */ var _shapes_downwardTrapezoid__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/downwardTrapezoid */ \"./src/shapes/downwardTrapezoid.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_foldedCornerRectangle__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/foldedCornerRectangle */ \"./src/shapes/foldedCornerRectangle.ts\");\n/* harmony import */ var _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../bench/layoutAnalysis */ \"./src/bench/layoutAnalysis.ts\");\n/* harmony import */ var _parse_loader__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../parse/loader */ \"./src/parse/loader.ts\");\n/* harmony import */ var _shapes_octagon__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/octagon */ \"./src/shapes/octagon.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_upwardTrapezoid__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../shapes/upwardTrapezoid */ \"./src/shapes/upwardTrapezoid.ts\");\n/* harmony import */ var _layouter_sugiyamaLayouter__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! ../layouter/sugiyamaLayouter */ \"./src/layouter/sugiyamaLayouter.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass Renderer {\r\n    constructor() {\r\n        this._additionalShapes = [];\r\n        this._listeners = [];\r\n    }\r\n    /**\r\n     * Shows a graph that is already laid out.\r\n     */\r\n    render(graph) {\r\n        this._render(graph);\r\n    }\r\n    /**\r\n     * Number of display objects that are shown and, with culling, kept in pools for reuse.\r\n     */\r\n    numDisplayObjects() {\r\n        return this._container.numDisplayObjects();\r\n    }\r\n    /**\r\n     * Removes the event listeners and the drawing area of the renderer.\r\n     */\r\n    cleanUp() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._listeners, ([type, listener]) => {\r\n            document.removeEventListener(type, listener);\r\n        });\r\n        this._listeners.length = 0;\r\n    }\r\n    /**\r\n     * Sets the options of the container: with culling, only the shapes in the view are drawn, in pooled display\r\n     * objects and simplified below lodZoom (see RendererContainer).\r\n     */\r\n    _setContainerOptions(options) {\r\n        options = lodash__WEBPACK_IMPORTED_MODULE_0__.defaults(options, {\r\n            culling: false,\r\n            lodZoom: 0.5,\r\n            margin: 0.25,\r\n            minScreenSize: 1,\r\n        });\r\n        this._container.culling = options.culling;\r\n        this._container.lodZoom = options.lodZoom;\r\n        this._container.margin = options.margin;\r\n        this._container.minScreenSize = options.minScreenSize;\r\n    }\r\n    _addDocumentListener(type, listener) {\r\n        document.addEventListener(type, listener);\r\n        this._listeners.push([type, listener]);\r\n    }\r\n    show(layouter, name, validate = false, printCost = false, loadFunction = _parse_loader__WEBPACK_IMPORTED_MODULE_8__.default.loadXhr) {\r\n        loadFunction(name).then((graph) => {\r\n            this.layoutAndRender(graph, layouter, validate, printCost);\r\n        });\r\n    }\r\n    layoutAndRender(graph, layouter = new _layouter_sugiyamaLayouter__WEBPACK_IMPORTED_MODULE_13__.default(), validate = false, printCost = false) {\r\n        this.setSizes(graph);\r\n        layouter.layout(graph).then((layout) => {\r\n            if (validate) {\r\n                const layoutAnalysis = new _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__.default(layout);\r\n                if (layoutAnalysis.validate()) {\r\n                    console.log(\"Layout satisfies constraints.\");\r\n                }\r\n                else {\r\n                    console.log(\"Layout violates constraints.\");\r\n                }\r\n            }\r\n            if (printCost) {\r\n                const layoutAnalysis = new _bench_layoutAnalysis__WEBPACK_IMPORTED_MODULE_7__.default(layout);\r\n                console.log(\"Weighted cost: \" + layoutAnalysis.cost(true).toFixed(0));\r\n            }\r\n            this._render(graph);\r\n        });\r\n    }\r\n    setSizes(graph) {\r\n        // set node sizes\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.allNodes(), (node) => {\r\n            node.labelSize = this.labelSize(node);\r\n            node.updateSize(node.labelSize);\r\n        });\r\n        // set edge label sizes\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.allEdges(), (edge) => {\r\n            edge.labelSize = this.edgeLabelSize(edge);\r\n        });\r\n    }\r\n    labelSize(node) {\r\n        const textBox = (new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, 0, 0, node.label(), node.labelFontSize)).boundingBox();\r\n        return {\r\n            width: textBox.width + 2 * node.labelPaddingX,\r\n            height: textBox.height + 2 * node.labelPaddingY,\r\n        };\r\n    }\r\n    edgeLabelSize(edge) {\r\n        return (new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, 0, 0, edge.label(), edge.labelFontSize)).boundingBox().size();\r\n    }\r\n    /**\r\n     * Adds an offset to center the label within the node (if necessary).\r\n     */\r\n    _labelPosition(node) {\r\n        const labelSize = node.labelSize;\r\n        const labelBox = new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(node.x + node.labelPaddingX, node.y + node.labelPaddingY, labelSize.width, labelSize.height);\r\n        return labelBox.centerIn(node.boundingBox()).topLeft();\r\n    }\r\n    _getShapesForGraph(graph) {\r\n        const shapes = [];\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.nodes(), (node) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForNode(node), shape => shapes.push(shape));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(graph.edges(), (edge) => {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForEdge(edge), shape => shapes.push(shape));\r\n        });\r\n        return shapes;\r\n    }\r\n    _getShapesForNode(node) {\r\n        const shapes = [];\r\n        switch (node.type()) {\r\n            case \"AccessNode\":\r\n            case \"GenericNode\":\r\n                shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(node, node.x, node.y, node.width, node.height, node.backgroundColor || _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK, node.borderColor || _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"LibraryNode\":\r\n                shapes.push(new _shapes_foldedCornerRectangle__WEBPACK_IMPORTED_MODULE_6__.default(node, node.x, node.y, node.width, node.height));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"NestedSDFG\":\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height));\r\n                if (node.isPlaceholder) {\r\n                    shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                }\r\n                break;\r\n            case \"SDFGState\":\r\n                const color = new _color__WEBPACK_IMPORTED_MODULE_2__.default(0xDE, 0xEB, 0xF7);\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height, color, color));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, node.x + 5, node.y + 5, node.label()));\r\n                break;\r\n            case \"Tasklet\":\r\n                shapes.push(new _shapes_octagon__WEBPACK_IMPORTED_MODULE_9__.default(node, node.x, node.y, node.width, node.height));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n                break;\r\n            case \"GenericContainerNode\":\r\n                shapes.push(new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(node, node.x, node.y, node.width, node.height, node.backgroundColor, node.borderColor));\r\n                shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, node.x + 5, node.y + 5, node.label()));\r\n                break;\r\n        }\r\n        if (node.type().endsWith(\"Entry\")) {\r\n            shapes.push(new _shapes_upwardTrapezoid__WEBPACK_IMPORTED_MODULE_12__.default(node, node.x, node.y, node.width, node.height));\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n        }\r\n        if (node.type().endsWith(\"Exit\")) {\r\n            shapes.push(new _shapes_downwardTrapezoid__WEBPACK_IMPORTED_MODULE_3__.default(node, node.x, node.y, node.width, node.height));\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));\r\n        }\r\n        // add child graph shapes\r\n        if (node.childGraph !== null && !node.isPlaceholder) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._getShapesForGraph(node.childGraph), (shape) => {\r\n                shapes.push(shape);\r\n            });\r\n        }\r\n        // add connector shapes\r\n        const backgroundColorUnscoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0xf0fdff);\r\n        const backgroundColorScoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0xc1dfe6).fade(0.56);\r\n        const borderColorUnscoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK;\r\n        const borderColorScoped = _color__WEBPACK_IMPORTED_MODULE_2__.default.BLACK.fade(0.56);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.inConnectors, (connector) => {\r\n            const backgroundColor = (connector.name.startsWith('IN_') ? backgroundColorScoped : backgroundColorUnscoped);\r\n            const borderColor = (connector.name.startsWith('IN_') ? borderColorScoped : borderColorUnscoped);\r\n            shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(connector, connector.x, connector.y, connector.width, connector.height, backgroundColor, borderColor));\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(node.outConnectors, (connector) => {\r\n            const backgroundColor = (connector.name.startsWith('OUT_') ? backgroundColorScoped : backgroundColorUnscoped);\r\n            const borderColor = (connector.name.startsWith('OUT_') ? borderColorScoped : borderColorUnscoped);\r\n            shapes.push(new _shapes_ellipse__WEBPACK_IMPORTED_MODULE_5__.default(connector, connector.x, connector.y, connector.width, connector.height, backgroundColor, borderColor));\r\n        });\r\n        return shapes;\r\n    }\r\n    _getShapesForEdge(edge) {\r\n        const shapes = [new _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_4__.default(edge, lodash__WEBPACK_IMPORTED_MODULE_0__.clone(edge.points), edge.color(), edge.lineWidth(), edge.lineStyle())];\r\n        if (edge.labelX) {\r\n            const labelSize = this.edgeLabelSize(edge);\r\n            const labelBackground = new _shapes_rectangle__WEBPACK_IMPORTED_MODULE_10__.default(null, edge.labelX - 3, edge.labelY - 3, labelSize.width + 6, labelSize.height + 6, _color__WEBPACK_IMPORTED_MODULE_2__.default.WHITE.fade(0.8), _color__WEBPACK_IMPORTED_MODULE_2__.default.TRANSPARENT);\r\n            labelBackground.zIndex = 2;\r\n            shapes.push(new _shapes_text__WEBPACK_IMPORTED_MODULE_11__.default(this, edge.labelX, edge.labelY, edge.label(), edge.labelFontSize, _color__WEBPACK_IMPORTED_MODULE_2__.default.fromNumber(0x666666)));\r\n        }\r\n        return shapes;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/renderer.ts?");
 
 /***/ }),
 
@@ -4132,7 +4165,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RendererContainer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n\r\n\r\nclass RendererContainer {\r\n    constructor() {\r\n        this._children = [];\r\n    }\r\n    addChild(shape) {\r\n        this._children.push(shape);\r\n    }\r\n    removeChildren() {\r\n        this._children.length = 0;\r\n    }\r\n    render() {\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            this._renderShape(shape);\r\n        });\r\n    }\r\n    contentBoundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            const box = shape.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            shape.offset(-minX, -minY);\r\n        });\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(0, 0, maxX - minX, maxY - minY);\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/rendererContainer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RendererContainer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n/* harmony import */ var _geometry_boxGrid__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../geometry/boxGrid */ \"./src/geometry/boxGrid.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _shapes_mathText__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/mathText */ \"./src/shapes/mathText.ts\");\n/* harmony import */ var _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/shapeCollection */ \"./src/shapes/shapeCollection.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n/**\r\n * Draws shapes, either all of them at once or, with culling enabled, only those in the current view.\r\n * With culling, render() only indexes the shapes and updateView(view, zoom) shows the shapes that overlap the view\r\n * (enlarged by margin times its size on every side) in display objects taken from pools of objects released by\r\n * shapes that left the view. Below lodZoom, shapes are drawn simplified: without text, as plain boxes, and edges\r\n * between the same two nodes as one straight line. Shapes (except edges) smaller than minScreenSize on the screen\r\n * are not drawn.\r\n */\r\nclass RendererContainer {\r\n    constructor() {\r\n        this._children = [];\r\n        this.culling = false;\r\n        this.lodZoom = 0.5;\r\n        this.margin = 0.25;\r\n        this.minScreenSize = 1;\r\n        // offset by which contentBoundingBox moved the shapes\r\n        this.contentOffset = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(0, 0);\r\n        this._shapes = []; // flat list of the shapes in drawing order\r\n        this._grid = null;\r\n        this._sizes = null; // larger side of every shape\r\n        this._bundleLeaders = null; // whether an edge is drawn in simplified mode\r\n        this._shown = new Map(); // display object of every shown shape\r\n        this._pools = new Map();\r\n        this._simplified = false;\r\n        this._lastView = null;\r\n    }\r\n    addChild(shape) {\r\n        this._children.push(shape);\r\n    }\r\n    removeChildren() {\r\n        this._children.length = 0;\r\n        this._shown.forEach((object, i) => this._release(i, object));\r\n        this._shown.clear();\r\n        this._shapes = [];\r\n        this._grid = null;\r\n        this._lastView = null;\r\n    }\r\n    render() {\r\n        if (this.culling) {\r\n            this._index();\r\n            return;\r\n        }\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            this._renderShape(shape);\r\n        });\r\n    }\r\n    /**\r\n     * Shows the shapes in the view (world coordinates) at the given zoom, if culling is enabled.\r\n     */\r\n    updateView(view, zoom) {\r\n        if (!this.culling || this._grid === null) {\r\n            return;\r\n        }\r\n        const key = [view.x, view.y, view.width, view.height, zoom];\r\n        if (this._lastView !== null && lodash__WEBPACK_IMPORTED_MODULE_0__.isEqual(key, this._lastView)) {\r\n            return;\r\n        }\r\n        this._lastView = key;\r\n        const simplified = (zoom < this.lodZoom);\r\n        if (simplified !== this._simplified) {\r\n            this._shown.forEach((object, i) => this._release(i, object));\r\n            this._shown.clear();\r\n            this._simplified = simplified;\r\n        }\r\n        const minSize = this.minScreenSize / zoom;\r\n        const visible = new Set();\r\n        this._grid.forEachInBox(view.x - this.margin * view.width, view.y - this.margin * view.height, (1 + 2 * this.margin) * view.width, (1 + 2 * this.margin) * view.height, (i) => {\r\n            const shape = this._shapes[i];\r\n            if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n                if (!simplified || this._bundleLeaders[i] === 1) {\r\n                    visible.add(i);\r\n                }\r\n            }\r\n            else if (this._sizes[i] >= minSize && !(simplified && this._isLabel(shape))) {\r\n                visible.add(i);\r\n            }\r\n        });\r\n        this._shown.forEach((object, i) => {\r\n            if (!visible.has(i)) {\r\n                this._release(i, object);\r\n                this._shown.delete(i);\r\n            }\r\n        });\r\n        let added = false;\r\n        visible.forEach((i) => {\r\n            if (this._shown.has(i)) {\r\n                return;\r\n            }\r\n            const kind = this._objectKind(this._shapes[i], simplified);\r\n            if (kind === null) {\r\n                return;\r\n            }\r\n            const pool = this._pools.get(kind);\r\n            const object = (pool !== undefined && pool.length > 0) ? pool.pop() : this._createObject(kind);\r\n            this._drawObject(object, this._shapes[i], simplified);\r\n            this._showObject(object, i);\r\n            this._shown.set(i, object);\r\n            added = true;\r\n        });\r\n        if (added) {\r\n            this._arrangeObjects(this._shown);\r\n        }\r\n    }\r\n    /**\r\n     * Number of display objects that are shown and that are kept in pools for reuse (with culling).\r\n     */\r\n    numDisplayObjects() {\r\n        return {\r\n            shown: this._numShownObjects(),\r\n            pooled: lodash__WEBPACK_IMPORTED_MODULE_0__.sum(lodash__WEBPACK_IMPORTED_MODULE_0__.map(Array.from(this._pools.values()), (pool) => pool.length)),\r\n        };\r\n    }\r\n    contentBoundingBox() {\r\n        let minX = Number.POSITIVE_INFINITY;\r\n        let maxX = Number.NEGATIVE_INFINITY;\r\n        let minY = Number.POSITIVE_INFINITY;\r\n        let maxY = Number.NEGATIVE_INFINITY;\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            const box = shape.boundingBox();\r\n            minX = Math.min(minX, box.x);\r\n            maxX = Math.max(maxX, box.x + box.width);\r\n            minY = Math.min(minY, box.y);\r\n            maxY = Math.max(maxY, box.y + box.height);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, (shape) => {\r\n            shape.offset(-minX, -minY);\r\n        });\r\n        this.contentOffset = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(-minX, -minY);\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_1__.default(0, 0, maxX - minX, maxY - minY);\r\n    }\r\n    _index() {\r\n        const shapes = [];\r\n        const addShape = (shape) => {\r\n            if (shape instanceof _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n                lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shape.getShapes(), addShape);\r\n            }\r\n            else {\r\n                shapes.push(shape);\r\n            }\r\n        };\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._children, addShape);\r\n        const n = shapes.length;\r\n        const xs = new Float64Array(n);\r\n        const ys = new Float64Array(n);\r\n        const widths = new Float64Array(n);\r\n        const heights = new Float64Array(n);\r\n        this._sizes = new Float64Array(n);\r\n        this._bundleLeaders = new Uint8Array(n);\r\n        const bundles = new Map(); // node pairs with a drawn edge per graph\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shapes, (shape, i) => {\r\n            const box = shape.boundingBox();\r\n            xs[i] = box.x;\r\n            ys[i] = box.y;\r\n            widths[i] = box.width;\r\n            heights[i] = box.height;\r\n            this._sizes[i] = Math.max(box.width, box.height);\r\n            if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n                // edges between the same nodes of the same graph are drawn as one line when simplified\r\n                const edge = shape.reference;\r\n                if (edge === null || edge === undefined || edge.graph === undefined) {\r\n                    this._bundleLeaders[i] = 1;\r\n                    return;\r\n                }\r\n                if (!bundles.has(edge.graph)) {\r\n                    bundles.set(edge.graph, new Set());\r\n                }\r\n                const pair = edge.src + \" \" + edge.dst;\r\n                if (!bundles.get(edge.graph).has(pair)) {\r\n                    bundles.get(edge.graph).add(pair);\r\n                    this._bundleLeaders[i] = 1;\r\n                }\r\n            }\r\n        });\r\n        this._shapes = shapes;\r\n        this._grid = new _geometry_boxGrid__WEBPACK_IMPORTED_MODULE_2__.default(xs, ys, widths, heights, n);\r\n        this._lastView = null;\r\n    }\r\n    _release(i, object) {\r\n        this._hideObject(object);\r\n        const kind = this._objectKind(this._shapes[i], this._simplified);\r\n        if (!this._pools.has(kind)) {\r\n            this._pools.set(kind, []);\r\n        }\r\n        this._pools.get(kind).push(object);\r\n    }\r\n    /**\r\n     * Kind of display object the shape is drawn in (null if it cannot be drawn); objects are only reused for shapes\r\n     * of the same kind.\r\n     */\r\n    _objectKind(shape, simplified) {\r\n        return (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_6__.default && !simplified) ? \"text\" : \"graphics\";\r\n    }\r\n    /**\r\n     * Whether the shape is a label, which is left out when drawing simplified.\r\n     */\r\n    _isLabel(shape) {\r\n        return shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_6__.default || shape instanceof _shapes_mathText__WEBPACK_IMPORTED_MODULE_4__.default;\r\n    }\r\n    _createObject(kind) {\r\n        throw new Error(\"Culling is not supported by this renderer\");\r\n    }\r\n    /**\r\n     * Draws the shape into the display object, which may have shown another shape of the same kind before.\r\n     */\r\n    _drawObject(object, shape, simplified) {\r\n    }\r\n    _showObject(object, order) {\r\n    }\r\n    _hideObject(object) {\r\n    }\r\n    /**\r\n     * Brings the shown objects into the drawing order of their shapes after new ones were added.\r\n     */\r\n    _arrangeObjects(shown) {\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/rendererContainer.ts?");
 
 /***/ }),
 
@@ -4143,7 +4176,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SvgContainer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _rendererContainer__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./rendererContainer */ \"./src/renderer/rendererContainer.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_circle__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/circle */ \"./src/shapes/circle.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_line__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/line */ \"./src/shapes/line.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../shapes/abstractPolygon */ \"./src/shapes/abstractPolygon.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/shapeCollection */ \"./src/shapes/shapeCollection.ts\");\n/* harmony import */ var _shapes_mathText__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ../shapes/mathText */ \"./src/shapes/mathText.ts\");\n/* harmony import */ var _shapes_arc__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../shapes/arc */ \"./src/shapes/arc.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass SvgContainer extends _rendererContainer__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    constructor(domContainer) {\r\n        super();\r\n        this._contentWidth = 0;\r\n        this._contentHeight = 0;\r\n        this._zoom = 1;\r\n        this._translate = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(0, 0);\r\n        this._svg = document.createElementNS(\"http://www.w3.org/2000/svg\", \"svg\");\r\n        this._svg.setAttribute('xmlns', 'http://www.w3.org/2000/svg');\r\n        this._svg.style.width = \"100%\";\r\n        this._svg.style.height = \"100%\";\r\n        this._svg.style.display = \"block\";\r\n        domContainer.appendChild(this._svg);\r\n        this._svgContainer = document.createElementNS(\"http://www.w3.org/2000/svg\", \"g\");\r\n        this._svg.appendChild(this._svgContainer);\r\n        const size = this._svg.getBoundingClientRect();\r\n        this._width = size.width;\r\n        this._height = size.height;\r\n    }\r\n    saveSvg(fileName) {\r\n        const svgStyle = this._svg.getAttribute('style');\r\n        const svgContainerStyle = this._svgContainer.getAttribute('style');\r\n        this._svg.removeAttribute('style');\r\n        this._svgContainer.removeAttribute('style');\r\n        const size = this._svgContainer.getBoundingClientRect();\r\n        this._svg.setAttribute('width', size.width.toString());\r\n        this._svg.setAttribute('height', size.height.toString());\r\n        const serializer = new XMLSerializer();\r\n        const data = '<?xml version=\"1.0\" standalone=\"no\"?>' + serializer.serializeToString(this._svg);\r\n        const a = document.createElement('a');\r\n        document.body.append(a);\r\n        a.download = fileName;\r\n        a.href = \"data:image/svg+xml;charset=utf-8,\" + encodeURIComponent(data);\r\n        a.click();\r\n        a.remove();\r\n        this._svg.setAttribute('style', svgStyle);\r\n        this._svgContainer.setAttribute('style', svgContainerStyle);\r\n    }\r\n    addElement(element) {\r\n        this._svgContainer.appendChild(element);\r\n    }\r\n    _renderShape(shape) {\r\n        if (shape instanceof _shapes_rectangle__WEBPACK_IMPORTED_MODULE_2__.default) {\r\n            const rectangle = document.createElementNS(\"http://www.w3.org/2000/svg\", \"rect\");\r\n            rectangle.setAttribute('x', shape.x.toString());\r\n            rectangle.setAttribute('y', shape.y.toString());\r\n            rectangle.setAttribute('width', shape.width.toString());\r\n            rectangle.setAttribute('height', shape.height.toString());\r\n            if (shape.lineStyle === \"dashed\") {\r\n                rectangle.setAttribute('stroke-dasharray', '4');\r\n            }\r\n            this._addBackgroundAndBorder(rectangle, shape.backgroundColor, shape.borderColor);\r\n            if (shape.zIndex !== null) {\r\n            }\r\n            this._svgContainer.appendChild(rectangle);\r\n        }\r\n        else if (shape instanceof _shapes_circle__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n            const circle = document.createElementNS(\"http://www.w3.org/2000/svg\", \"circle\");\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            circle.setAttribute('cx', center.x.toString());\r\n            circle.setAttribute('cy', center.y.toString());\r\n            circle.setAttribute('r', (shape.width / 2).toString());\r\n            this._addBackgroundAndBorder(circle, shape.backgroundColor, shape.borderColor);\r\n            this._svgContainer.appendChild(circle);\r\n        }\r\n        else if (shape instanceof _shapes_arc__WEBPACK_IMPORTED_MODULE_12__.default) {\r\n            // adapted from opsb: https://stackoverflow.com/a/18473154\r\n            const polarToCartesian = (centerX, centerY, radius, angle) => {\r\n                return {\r\n                    x: centerX + (radius * Math.cos(angle)),\r\n                    y: centerY + (radius * Math.sin(angle)),\r\n                };\r\n            };\r\n            const describeArc = (x, y, radius, startAngle, endAngle) => {\r\n                const start = polarToCartesian(x, y, radius, endAngle);\r\n                const end = polarToCartesian(x, y, radius, startAngle);\r\n                const largeArcFlag = (endAngle - startAngle <= Math.PI ? \"0\" : \"1\");\r\n                return [\r\n                    \"M\", start.x, start.y,\r\n                    \"A\", radius, radius, 0, largeArcFlag, 0, end.x, end.y\r\n                ].join(\" \");\r\n            };\r\n            const arc = document.createElementNS(\"http://www.w3.org/2000/svg\", \"path\");\r\n            arc.setAttribute('d', describeArc(shape.x + shape.radius, shape.y + shape.radius, shape.radius, shape.startAngle, shape.endAngle));\r\n            if (shape.lineStyle === \"dashed\") {\r\n                arc.setAttribute('stroke-dasharray', '4');\r\n            }\r\n            this._addBackgroundAndBorder(arc, shape.backgroundColor, shape.borderColor);\r\n            this._svgContainer.appendChild(arc);\r\n        }\r\n        if (shape instanceof _shapes_ellipse__WEBPACK_IMPORTED_MODULE_4__.default) {\r\n            const ellipse = document.createElementNS(\"http://www.w3.org/2000/svg\", \"ellipse\");\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            ellipse.setAttribute('cx', center.x.toString());\r\n            ellipse.setAttribute('cy', center.y.toString());\r\n            ellipse.setAttribute('rx', (shape.width / 2).toString());\r\n            ellipse.setAttribute('ry', (shape.height / 2).toString());\r\n            this._addBackgroundAndBorder(ellipse, shape.backgroundColor, shape.borderColor);\r\n            this._svgContainer.appendChild(ellipse);\r\n        }\r\n        else if (shape instanceof _shapes_line__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n            const line = document.createElementNS(\"http://www.w3.org/2000/svg\", \"line\");\r\n            line.setAttribute('x1', shape.x1.toString());\r\n            line.setAttribute('y1', shape.y1.toString());\r\n            line.setAttribute('x2', shape.x2.toString());\r\n            line.setAttribute('y2', shape.y2.toString());\r\n            line.setAttribute('stroke-width', shape.lineWidth.toString());\r\n            line.setAttribute('stroke', shape.color.hex());\r\n            line.setAttribute('stroke-opacity', shape.color.alpha.toString());\r\n            this._svgContainer.appendChild(line);\r\n            if (shape.style === \"dashed\") {\r\n                line.setAttribute('stroke-dasharray', '4');\r\n            }\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n            const path = document.createElementNS(\"http://www.w3.org/2000/svg\", \"path\");\r\n            path.setAttribute('stroke-width', shape.lineWidth.toString());\r\n            path.setAttribute('stroke', shape.color.hex());\r\n            path.setAttribute('stroke-opacity', shape.color.alpha.toString());\r\n            path.setAttribute('fill', 'none');\r\n            let description = \"M \" + lodash__WEBPACK_IMPORTED_MODULE_0__.head(shape.points()).x.toString() + \",\" + lodash__WEBPACK_IMPORTED_MODULE_0__.head(shape.points()).y.toString() + \" \";\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(lodash__WEBPACK_IMPORTED_MODULE_0__.tail(shape.points()), (point) => {\r\n                description += \"L \" + point.x.toString() + \",\" + point.y.toString() + \" \";\r\n            });\r\n            path.setAttribute('d', description);\r\n            if (shape.lineStyle === \"dashed\") {\r\n                path.setAttribute('stroke-dasharray', '4');\r\n            }\r\n            this._svgContainer.appendChild(path);\r\n            // draw arrow head\r\n            const headPath = document.createElementNS(\"http://www.w3.org/2000/svg\", \"path\");\r\n            headPath.setAttribute('stroke-width', shape.lineWidth.toString());\r\n            headPath.setAttribute('stroke', shape.color.hex());\r\n            headPath.setAttribute('stroke-opacity', shape.color.alpha.toString());\r\n            headPath.setAttribute('fill', 'none');\r\n            const end = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(lodash__WEBPACK_IMPORTED_MODULE_0__.last(shape.points()).x, lodash__WEBPACK_IMPORTED_MODULE_0__.last(shape.points()).y);\r\n            const dir = end.clone().sub(shape.points()[shape.points().length - 2]);\r\n            const angle = dir.angle();\r\n            const point1 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y + 3)).rotateAround(end, angle);\r\n            let headDescription = \"M \" + point1.x.toString() + \",\" + point1.y.toString() + \" \";\r\n            headDescription += \"L \" + end.x.toString() + \",\" + end.y.toString() + \" \";\r\n            const point2 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y - 3)).rotateAround(end, angle);\r\n            headDescription += \"L \" + point2.x.toString() + \",\" + point2.y.toString();\r\n            headPath.setAttribute('d', headDescription);\r\n            this._svgContainer.appendChild(headPath);\r\n        }\r\n        else if (shape instanceof _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            const polygon = document.createElementNS(\"http://www.w3.org/2000/svg\", \"polygon\");\r\n            this._addBackgroundAndBorder(polygon, shape.backgroundColor, shape.borderColor);\r\n            const points = shape.getPath();\r\n            let description = \"\";\r\n            for (let i = 0; i < points.length; i += 2) {\r\n                description += points[i] + \",\" + points[i + 1] + \" \";\r\n            }\r\n            polygon.setAttribute('points', description);\r\n            this._svgContainer.appendChild(polygon);\r\n        }\r\n        else if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_9__.default) {\r\n            const text = document.createElementNS(\"http://www.w3.org/2000/svg\", \"text\");\r\n            text.setAttribute('x', shape.x.toString());\r\n            text.setAttribute('y', (shape.y + shape.fontSize).toString());\r\n            text.setAttribute('font-family', shape.fontFamily);\r\n            text.setAttribute('font-size', shape.fontSize.toString());\r\n            text.appendChild(document.createTextNode(shape.text));\r\n            this._svgContainer.appendChild(text);\r\n        }\r\n        else if (shape instanceof _shapes_mathText__WEBPACK_IMPORTED_MODULE_11__.default) {\r\n            const foreignObject = document.createElementNS(\"http://www.w3.org/2000/svg\", \"foreignObject\");\r\n            foreignObject.setAttribute('x', shape.x.toString());\r\n            foreignObject.setAttribute('y', shape.y.toString());\r\n            foreignObject.setAttribute('width', shape.width.toString());\r\n            foreignObject.setAttribute('height', shape.height.toString());\r\n            foreignObject.setAttribute('color', shape.color.hex());\r\n            foreignObject.style.overflow = 'visible';\r\n            this._svgContainer.appendChild(foreignObject);\r\n            shape.svg.style.position = 'absolute';\r\n            foreignObject.appendChild(shape.svg);\r\n        }\r\n        else if (shape instanceof _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_10__.default) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shape.getShapes(), (childShape) => {\r\n                this._renderShape(childShape);\r\n            });\r\n        }\r\n    }\r\n    width() {\r\n        return this._width;\r\n    }\r\n    height() {\r\n        return this._height;\r\n    }\r\n    toWorld(vector) {\r\n        return vector.multiplyScalar(1 / this._zoom);\r\n    }\r\n    toScreen(vector) {\r\n        return vector.multiplyScalar(this._zoom);\r\n    }\r\n    setZoom(zoom, animate = true) {\r\n        if (zoom !== this._zoom) {\r\n            this._zoom = zoom;\r\n            this._updateTransform();\r\n            if (animate) {\r\n                this._svgContainer.style.transition = 'transform 100ms linear';\r\n            }\r\n            else {\r\n                this._svgContainer.style.transition = '';\r\n            }\r\n            clearTimeout(this._transitionTimeout);\r\n            this._transitionTimeout = setTimeout(() => {\r\n                this._svgContainer.style.transition = 'transform 10ms linear';\r\n            }, 100);\r\n        }\r\n    }\r\n    getZoom() {\r\n        return this._zoom;\r\n    }\r\n    translate(offset) {\r\n        this._translate.sub(offset);\r\n        this._updateTransform();\r\n    }\r\n    getContentTopLeft() {\r\n        return this._translate.clone();\r\n    }\r\n    getContentCenter() {\r\n        return this._translate.clone().add(new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(this._contentWidth / 2, this._contentHeight / 2));\r\n    }\r\n    getCenter() {\r\n        return new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(this._width / 2, this._height / 2);\r\n    }\r\n    render() {\r\n        super.render();\r\n        const size = this._svgContainer.getBBox();\r\n        this._contentWidth = size.width;\r\n        this._contentHeight = size.height;\r\n        requestAnimationFrame(() => {\r\n            this._svgContainer.style.transition = 'transform 10ms linear';\r\n        });\r\n    }\r\n    _updateTransform() {\r\n        this._svgContainer.style.transform = 'matrix(' + this._zoom + ',0,0,' + this._zoom + ',' + this._translate.x * this._zoom + ',' + this._translate.y * this._zoom + ')';\r\n    }\r\n    _addBackgroundAndBorder(element, backgroundColor, borderColor) {\r\n        element.setAttribute('fill', backgroundColor.hex());\r\n        element.setAttribute('fill-opacity', backgroundColor.alpha.toString());\r\n        element.setAttribute('stroke', borderColor.hex());\r\n        element.setAttribute('stroke-opacity', borderColor.alpha.toString());\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/svgContainer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SvgContainer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _rendererContainer__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./rendererContainer */ \"./src/renderer/rendererContainer.ts\");\n/* harmony import */ var _shapes_rectangle__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ../shapes/rectangle */ \"./src/shapes/rectangle.ts\");\n/* harmony import */ var _shapes_circle__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../shapes/circle */ \"./src/shapes/circle.ts\");\n/* harmony import */ var _shapes_ellipse__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ../shapes/ellipse */ \"./src/shapes/ellipse.ts\");\n/* harmony import */ var _shapes_line__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ../shapes/line */ \"./src/shapes/line.ts\");\n/* harmony import */ var _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! ../shapes/edgeShape */ \"./src/shapes/edgeShape.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n/* harmony import */ var _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! ../shapes/abstractPolygon */ \"./src/shapes/abstractPolygon.ts\");\n/* harmony import */ var _shapes_text__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! ../shapes/text */ \"./src/shapes/text.ts\");\n/* harmony import */ var _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! ../shapes/shapeCollection */ \"./src/shapes/shapeCollection.ts\");\n/* harmony import */ var _color__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! ./color */ \"./src/renderer/color.ts\");\n/* harmony import */ var _shapes_mathText__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! ../shapes/mathText */ \"./src/shapes/mathText.ts\");\n/* harmony import */ var _shapes_arc__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! ../shapes/arc */ \"./src/shapes/arc.ts\");\n/* harmony import */ var _geometry_box__WEBPACK_IMPORTED_MODULE_14__ = __webpack_require__(/*! ../geometry/box */ \"./src/geometry/box.ts\");\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\n\r\nclass SvgContainer extends _rendererContainer__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    constructor(domContainer) {\r\n        super();\r\n        this._contentWidth = 0;\r\n        this._contentHeight = 0;\r\n        this._zoom = 1;\r\n        this._translate = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(0, 0);\r\n        this._svg = document.createElementNS(\"http://www.w3.org/2000/svg\", \"svg\");\r\n        this._svg.setAttribute('xmlns', 'http://www.w3.org/2000/svg');\r\n        this._svg.style.width = \"100%\";\r\n        this._svg.style.height = \"100%\";\r\n        this._svg.style.display = \"block\";\r\n        domContainer.appendChild(this._svg);\r\n        this._svgContainer = document.createElementNS(\"http://www.w3.org/2000/svg\", \"g\");\r\n        this._svg.appendChild(this._svgContainer);\r\n        const size = this._svg.getBoundingClientRect();\r\n        this._width = size.width;\r\n        this._height = size.height;\r\n    }\r\n    saveSvg(fileName) {\r\n        const svgStyle = this._svg.getAttribute('style');\r\n        const svgContainerStyle = this._svgContainer.getAttribute('style');\r\n        this._svg.removeAttribute('style');\r\n        this._svgContainer.removeAttribute('style');\r\n        const size = this._svgContainer.getBoundingClientRect();\r\n        this._svg.setAttribute('width', size.width.toString());\r\n        this._svg.setAttribute('height', size.height.toString());\r\n        const serializer = new XMLSerializer();\r\n        const data = '<?xml version=\"1.0\" standalone=\"no\"?>' + serializer.serializeToString(this._svg);\r\n        const a = document.createElement('a');\r\n        document.body.append(a);\r\n        a.download = fileName;\r\n        a.href = \"data:image/svg+xml;charset=utf-8,\" + encodeURIComponent(data);\r\n        a.click();\r\n        a.remove();\r\n        this._svg.setAttribute('style', svgStyle);\r\n        this._svgContainer.setAttribute('style', svgContainerStyle);\r\n    }\r\n    addElement(element) {\r\n        this._svgContainer.appendChild(element);\r\n    }\r\n    _renderShape(shape) {\r\n        if (shape instanceof _shapes_shapeCollection__WEBPACK_IMPORTED_MODULE_10__.default) {\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shape.getShapes(), (childShape) => {\r\n                this._renderShape(childShape);\r\n            });\r\n            return;\r\n        }\r\n        const kind = this._objectKind(shape, false);\r\n        if (kind !== null) {\r\n            const element = this._createObject(kind);\r\n            this._drawObject(element, shape, false);\r\n            this._svgContainer.appendChild(element);\r\n        }\r\n    }\r\n    _objectKind(shape, simplified) {\r\n        if (simplified) {\r\n            return (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__.default ? \"line\" : \"rect\");\r\n        }\r\n        if (shape instanceof _shapes_rectangle__WEBPACK_IMPORTED_MODULE_2__.default) {\r\n            return \"rect\";\r\n        }\r\n        else if (shape instanceof _shapes_circle__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n            return \"circle\";\r\n        }\r\n        else if (shape instanceof _shapes_arc__WEBPACK_IMPORTED_MODULE_13__.default) {\r\n            return \"path\";\r\n        }\r\n        else if (shape instanceof _shapes_ellipse__WEBPACK_IMPORTED_MODULE_4__.default) {\r\n            return \"ellipse\";\r\n        }\r\n        else if (shape instanceof _shapes_line__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n            return \"line\";\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n            return \"g\";\r\n        }\r\n        else if (shape instanceof _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            return \"polygon\";\r\n        }\r\n        else if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_9__.default) {\r\n            return \"text\";\r\n        }\r\n        else if (shape instanceof _shapes_mathText__WEBPACK_IMPORTED_MODULE_12__.default) {\r\n            return \"foreignObject\";\r\n        }\r\n        return null;\r\n    }\r\n    _numShownObjects() {\r\n        return this._svgContainer.childElementCount;\r\n    }\r\n    _createObject(kind) {\r\n        const element = document.createElementNS(\"http://www.w3.org/2000/svg\", kind);\r\n        if (kind === \"g\") {\r\n            // edge with arrow head\r\n            element.appendChild(document.createElementNS(\"http://www.w3.org/2000/svg\", \"path\"));\r\n            element.appendChild(document.createElementNS(\"http://www.w3.org/2000/svg\", \"path\"));\r\n        }\r\n        return element;\r\n    }\r\n    /**\r\n     * Sets all attributes of the element (created by _createObject for the kind of the shape) to draw the shape.\r\n     */\r\n    _drawObject(element, shape, simplified) {\r\n        if (simplified) {\r\n            if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n                // straight line without arrow head\r\n                const points = shape.points();\r\n                this._setLine(element, lodash__WEBPACK_IMPORTED_MODULE_0__.head(points), lodash__WEBPACK_IMPORTED_MODULE_0__.last(points), shape.lineWidth, shape.color, \"solid\");\r\n            }\r\n            else {\r\n                const box = shape.boundingBox();\r\n                this._setBox(element, box.x, box.y, box.width, box.height);\r\n                this._addBackgroundAndBorder(element, shape.backgroundColor || _color__WEBPACK_IMPORTED_MODULE_11__.default.WHITE, shape.borderColor || shape.color || _color__WEBPACK_IMPORTED_MODULE_11__.default.BLACK);\r\n                this._setDashed(element, false);\r\n            }\r\n            return;\r\n        }\r\n        if (shape instanceof _shapes_rectangle__WEBPACK_IMPORTED_MODULE_2__.default) {\r\n            this._setBox(element, shape.x, shape.y, shape.width, shape.height);\r\n            this._setDashed(element, shape.lineStyle === \"dashed\");\r\n            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);\r\n        }\r\n        else if (shape instanceof _shapes_circle__WEBPACK_IMPORTED_MODULE_3__.default) {\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            element.setAttribute('cx', center.x.toString());\r\n            element.setAttribute('cy', center.y.toString());\r\n            element.setAttribute('r', (shape.width / 2).toString());\r\n            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);\r\n        }\r\n        else if (shape instanceof _shapes_arc__WEBPACK_IMPORTED_MODULE_13__.default) {\r\n            // adapted from opsb: https://stackoverflow.com/a/18473154\r\n            const polarToCartesian = (centerX, centerY, radius, angle) => {\r\n                return {\r\n                    x: centerX + (radius * Math.cos(angle)),\r\n                    y: centerY + (radius * Math.sin(angle)),\r\n                };\r\n            };\r\n            const describeArc = (x, y, radius, startAngle, endAngle) => {\r\n                const start = polarToCartesian(x, y, radius, endAngle);\r\n                const end = polarToCartesian(x, y, radius, startAngle);\r\n                const largeArcFlag = (endAngle - startAngle <= Math.PI ? \"0\" : \"1\");\r\n                return [\r\n                    \"M\", start.x, start.y,\r\n                    \"A\", radius, radius, 0, largeArcFlag, 0, end.x, end.y\r\n                ].join(\" \");\r\n            };\r\n            element.setAttribute('d', describeArc(shape.x + shape.radius, shape.y + shape.radius, shape.radius, shape.startAngle, shape.endAngle));\r\n            this._setDashed(element, shape.lineStyle === \"dashed\");\r\n            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);\r\n        }\r\n        else if (shape instanceof _shapes_ellipse__WEBPACK_IMPORTED_MODULE_4__.default) {\r\n            const box = shape.boundingBox();\r\n            const center = box.center();\r\n            element.setAttribute('cx', center.x.toString());\r\n            element.setAttribute('cy', center.y.toString());\r\n            element.setAttribute('rx', (shape.width / 2).toString());\r\n            element.setAttribute('ry', (shape.height / 2).toString());\r\n            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);\r\n        }\r\n        else if (shape instanceof _shapes_line__WEBPACK_IMPORTED_MODULE_5__.default) {\r\n            this._setLine(element, new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(shape.x1, shape.y1), new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(shape.x2, shape.y2), shape.lineWidth, shape.color, shape.style);\r\n        }\r\n        else if (shape instanceof _shapes_edgeShape__WEBPACK_IMPORTED_MODULE_6__.default) {\r\n            const path = element.childNodes[0];\r\n            const headPath = element.childNodes[1];\r\n            const points = shape.points();\r\n            this._setStroke(path, shape.lineWidth, shape.color);\r\n            let description = \"M \" + lodash__WEBPACK_IMPORTED_MODULE_0__.head(points).x.toString() + \",\" + lodash__WEBPACK_IMPORTED_MODULE_0__.head(points).y.toString() + \" \";\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(lodash__WEBPACK_IMPORTED_MODULE_0__.tail(points), (point) => {\r\n                description += \"L \" + point.x.toString() + \",\" + point.y.toString() + \" \";\r\n            });\r\n            path.setAttribute('d', description);\r\n            this._setDashed(path, shape.lineStyle === \"dashed\");\r\n            // draw arrow head\r\n            this._setStroke(headPath, shape.lineWidth, shape.color);\r\n            const end = new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(lodash__WEBPACK_IMPORTED_MODULE_0__.last(points).x, lodash__WEBPACK_IMPORTED_MODULE_0__.last(points).y);\r\n            const dir = end.clone().sub(points[points.length - 2]);\r\n            const angle = dir.angle();\r\n            const point1 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y + 3)).rotateAround(end, angle);\r\n            let headDescription = \"M \" + point1.x.toString() + \",\" + point1.y.toString() + \" \";\r\n            headDescription += \"L \" + end.x.toString() + \",\" + end.y.toString() + \" \";\r\n            const point2 = (new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(end.x - 5, end.y - 3)).rotateAround(end, angle);\r\n            headDescription += \"L \" + point2.x.toString() + \",\" + point2.y.toString();\r\n            headPath.setAttribute('d', headDescription);\r\n        }\r\n        else if (shape instanceof _shapes_abstractPolygon__WEBPACK_IMPORTED_MODULE_8__.default) {\r\n            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);\r\n            const points = shape.getPath();\r\n            let description = \"\";\r\n            for (let i = 0; i < points.length; i += 2) {\r\n                description += points[i] + \",\" + points[i + 1] + \" \";\r\n            }\r\n            element.setAttribute('points', description);\r\n        }\r\n        else if (shape instanceof _shapes_text__WEBPACK_IMPORTED_MODULE_9__.default) {\r\n            element.setAttribute('x', shape.x.toString());\r\n            element.setAttribute('y', (shape.y + shape.fontSize).toString());\r\n            element.setAttribute('font-family', shape.fontFamily);\r\n            element.setAttribute('font-size', shape.fontSize.toString());\r\n            element.textContent = shape.text;\r\n        }\r\n        else if (shape instanceof _shapes_mathText__WEBPACK_IMPORTED_MODULE_12__.default) {\r\n            this._setBox(element, shape.x, shape.y, shape.width, shape.height);\r\n            element.setAttribute('color', shape.color.hex());\r\n            element.style.overflow = 'visible';\r\n            shape.svg.style.position = 'absolute';\r\n            element.textContent = \"\";\r\n            element.appendChild(shape.svg);\r\n        }\r\n    }\r\n    _showObject(element, order) {\r\n        this._svgContainer.appendChild(element);\r\n    }\r\n    _hideObject(element) {\r\n        element.remove();\r\n    }\r\n    _arrangeObjects(shown) {\r\n        // moves only the elements that are out of the order of their shapes\r\n        const order = lodash__WEBPACK_IMPORTED_MODULE_0__.sortBy(Array.from(shown.keys()));\r\n        let next = this._svgContainer.firstChild;\r\n        for (const i of order) {\r\n            const element = shown.get(i);\r\n            if (element === next) {\r\n                next = next.nextSibling;\r\n            }\r\n            else {\r\n                this._svgContainer.insertBefore(element, next);\r\n            }\r\n        }\r\n    }\r\n    width() {\r\n        return this._width;\r\n    }\r\n    height() {\r\n        return this._height;\r\n    }\r\n    toWorld(vector) {\r\n        return vector.multiplyScalar(1 / this._zoom);\r\n    }\r\n    toScreen(vector) {\r\n        return vector.multiplyScalar(this._zoom);\r\n    }\r\n    setZoom(zoom, animate = true) {\r\n        if (zoom !== this._zoom) {\r\n            this._zoom = zoom;\r\n            this._updateTransform();\r\n            if (animate) {\r\n                this._svgContainer.style.transition = 'transform 100ms linear';\r\n            }\r\n            else {\r\n                this._svgContainer.style.transition = '';\r\n            }\r\n            clearTimeout(this._transitionTimeout);\r\n            this._transitionTimeout = setTimeout(() => {\r\n                this._svgContainer.style.transition = 'transform 10ms linear';\r\n            }, 100);\r\n        }\r\n    }\r\n    getZoom() {\r\n        return this._zoom;\r\n    }\r\n    translate(offset) {\r\n        this._translate.sub(offset);\r\n        this._updateTransform();\r\n    }\r\n    getContentTopLeft() {\r\n        return this._translate.clone();\r\n    }\r\n    getContentCenter() {\r\n        return this._translate.clone().add(new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(this._contentWidth / 2, this._contentHeight / 2));\r\n    }\r\n    getCenter() {\r\n        return new _geometry_vector__WEBPACK_IMPORTED_MODULE_7__.default(this._width / 2, this._height / 2);\r\n    }\r\n    /**\r\n     * Part of the world that is visible at the current zoom and translation.\r\n     */\r\n    viewBox() {\r\n        return new _geometry_box__WEBPACK_IMPORTED_MODULE_14__.default(-this._translate.x, -this._translate.y, this._width / this._zoom, this._height / this._zoom);\r\n    }\r\n    contentBoundingBox() {\r\n        const box = super.contentBoundingBox();\r\n        this._contentWidth = box.width;\r\n        this._contentHeight = box.height;\r\n        return box;\r\n    }\r\n    remove() {\r\n        this._svg.remove();\r\n    }\r\n    render() {\r\n        super.render();\r\n        if (!this.culling) {\r\n            const size = this._svgContainer.getBBox();\r\n            this._contentWidth = size.width;\r\n            this._contentHeight = size.height;\r\n        }\r\n        requestAnimationFrame(() => {\r\n            this._svgContainer.style.transition = 'transform 10ms linear';\r\n        });\r\n    }\r\n    _updateTransform() {\r\n        this._svgContainer.style.transform = 'matrix(' + this._zoom + ',0,0,' + this._zoom + ',' + this._translate.x * this._zoom + ',' + this._translate.y * this._zoom + ')';\r\n    }\r\n    _addBackgroundAndBorder(element, backgroundColor, borderColor) {\r\n        element.setAttribute('fill', backgroundColor.hex());\r\n        element.setAttribute('fill-opacity', backgroundColor.alpha.toString());\r\n        element.setAttribute('stroke', borderColor.hex());\r\n        element.setAttribute('stroke-opacity', borderColor.alpha.toString());\r\n    }\r\n    _setBox(element, x, y, width, height) {\r\n        element.setAttribute('x', x.toString());\r\n        element.setAttribute('y', y.toString());\r\n        element.setAttribute('width', width.toString());\r\n        element.setAttribute('height', height.toString());\r\n    }\r\n    _setStroke(element, lineWidth, color) {\r\n        element.setAttribute('stroke-width', lineWidth.toString());\r\n        element.setAttribute('stroke', color.hex());\r\n        element.setAttribute('stroke-opacity', color.alpha.toString());\r\n        element.setAttribute('fill', 'none');\r\n    }\r\n    _setLine(element, start, end, lineWidth, color, style) {\r\n        element.setAttribute('x1', start.x.toString());\r\n        element.setAttribute('y1', start.y.toString());\r\n        element.setAttribute('x2', end.x.toString());\r\n        element.setAttribute('y2', end.y.toString());\r\n        this._setStroke(element, lineWidth, color);\r\n        this._setDashed(element, style === \"dashed\");\r\n    }\r\n    _setDashed(element, dashed) {\r\n        if (dashed) {\r\n            element.setAttribute('stroke-dasharray', '4');\r\n        }\r\n        else {\r\n            element.removeAttribute('stroke-dasharray');\r\n        }\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/svgContainer.ts?");
 
 /***/ }),
 
@@ -4154,7 +4187,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SvgRenderer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _renderer__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./renderer */ \"./src/renderer/renderer.ts\");\n/* harmony import */ var _svgContainer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./svgContainer */ \"./src/renderer/svgContainer.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\nclass SvgRenderer extends _renderer__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    constructor(domContainer) {\r\n        super();\r\n        this._weightExponent = 2;\r\n        this._friction = 0.999;\r\n        this._container = new _svgContainer__WEBPACK_IMPORTED_MODULE_2__.default(domContainer);\r\n        document.addEventListener(\"keydown\", (e) => {\r\n            if (e.ctrlKey && e.key === \"s\") {\r\n                e.preventDefault();\r\n                let fileName = prompt(\"Save as:\", \"screenshot\");\r\n                if (fileName !== null && fileName !== \"\") {\r\n                    if (!fileName.endsWith(\".svg\")) {\r\n                        fileName += \".svg\";\r\n                    }\r\n                    this._container.saveSvg(fileName);\r\n                }\r\n            }\r\n        });\r\n        const history = [];\r\n        let isMouseDown = false;\r\n        let x, y, mouseDownX, mouseDownY, mouseDownTopLeft;\r\n        let v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n        document.addEventListener(\"mousedown\", (e) => {\r\n            isMouseDown = true;\r\n            mouseDownX = e.clientX;\r\n            mouseDownY = e.clientY;\r\n            mouseDownTopLeft = this._container.getContentTopLeft();\r\n            v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n        });\r\n        document.addEventListener(\"mouseup\", (e) => {\r\n            const now = performance.now();\r\n            isMouseDown = false;\r\n            if (history.length < 2) {\r\n                return;\r\n            }\r\n            v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n            let divisor = 0;\r\n            for (let i = 1; i <= Math.min(10, history.length - 1); ++i) {\r\n                let index = history.length - i - 1;\r\n                let element = history[index];\r\n                let nextElement = history[index + 1];\r\n                if (now - nextElement[0] > 100) {\r\n                    break;\r\n                }\r\n                const multiplier = 1 / Math.pow(i, this._weightExponent);\r\n                const diff = (nextElement[1].clone()).sub(element[1].clone()).multiplyScalar((1 / (nextElement[0] - element[0])) * multiplier);\r\n                divisor += multiplier;\r\n                v.add(diff);\r\n            }\r\n            v.multiplyScalar(1 / divisor);\r\n            v = this._container.toWorld(v);\r\n            history.length = 0;\r\n        });\r\n        document.addEventListener(\"mousemove\", (e) => {\r\n            const now = performance.now();\r\n            x = e.clientX;\r\n            y = e.clientY;\r\n            if (isMouseDown) {\r\n                history.push([now, new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(x, y)]);\r\n                if (history.length === 100) {\r\n                    history.splice(0, 89);\r\n                }\r\n            }\r\n        });\r\n        document.addEventListener(\"wheel\", (e) => {\r\n            const mouse = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(e.clientX, e.clientY);\r\n            const worldMouseBefore = this._container.toWorld(mouse.clone());\r\n            this._container.setZoom(this._container.getZoom() * (1 + e.deltaY * -0.002));\r\n            const worldMouseAfter = this._container.toWorld(mouse.clone());\r\n            this._container.translate(worldMouseAfter.sub(worldMouseBefore).invert());\r\n        });\r\n        let prevTime = performance.now();\r\n        const step = () => {\r\n            const now = performance.now();\r\n            if (v.length() > 0.1) {\r\n                this._container.translate(v.clone().multiplyScalar(now - prevTime).invert());\r\n                v.multiplyScalar(Math.pow(this._friction, now - prevTime));\r\n            }\r\n            else if (isMouseDown) {\r\n                const newCenter = this._container.getContentTopLeft();\r\n                this._container.translate(newCenter.sub(mouseDownTopLeft).add(this._container.toWorld(new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(x - mouseDownX, y - mouseDownY).invert())));\r\n            }\r\n            prevTime = now;\r\n            window.requestAnimationFrame(step);\r\n        };\r\n        window.requestAnimationFrame(step);\r\n    }\r\n    _render(graph) {\r\n        this._container.removeChildren();\r\n        const shapes = this._getShapesForGraph(graph);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._additionalShapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        const box = this._container.contentBoundingBox();\r\n        const zoom = Math.min(1, this._container.width() / box.width, this._container.height() / box.height);\r\n        this._container.setZoom(zoom, false);\r\n        this._container.translate(new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default((box.width - this._container.width() / zoom) / 2, (box.height - this._container.height() / zoom) / 2));\r\n        this._container.render();\r\n    }\r\n    getTextSize(text, fontSize, fontFamily) {\r\n        const node = document.createElementNS(\"http://www.w3.org/2000/svg\", \"text\");\r\n        node.appendChild(document.createTextNode(text));\r\n        node.setAttribute('font-family', fontFamily);\r\n        node.setAttribute('font-size', fontSize.toString());\r\n        this._container.addElement(node);\r\n        const size = node.getBBox();\r\n        node.remove();\r\n        return size;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/svgRenderer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ SvgRenderer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _renderer__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./renderer */ \"./src/renderer/renderer.ts\");\n/* harmony import */ var _svgContainer__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./svgContainer */ \"./src/renderer/svgContainer.ts\");\n/* harmony import */ var _geometry_vector__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ../geometry/vector */ \"./src/geometry/vector.ts\");\n\r\n\r\n\r\n\r\nclass SvgRenderer extends _renderer__WEBPACK_IMPORTED_MODULE_1__.default {\r\n    /**\r\n     * @param domContainer Element to draw into.\r\n     * @param options Culling options of the container (see Renderer._setContainerOptions).\r\n     */\r\n    constructor(domContainer, options = {}) {\r\n        super();\r\n        this._animationFrame = null;\r\n        this._weightExponent = 2;\r\n        this._friction = 0.999;\r\n        this._container = new _svgContainer__WEBPACK_IMPORTED_MODULE_2__.default(domContainer);\r\n        this._setContainerOptions(options);\r\n        this._addDocumentListener(\"keydown\", (e) => {\r\n            if (e.ctrlKey && e.key === \"s\") {\r\n                e.preventDefault();\r\n                let fileName = prompt(\"Save as:\", \"screenshot\");\r\n                if (fileName !== null && fileName !== \"\") {\r\n                    if (!fileName.endsWith(\".svg\")) {\r\n                        fileName += \".svg\";\r\n                    }\r\n                    this._container.saveSvg(fileName);\r\n                }\r\n            }\r\n        });\r\n        const history = [];\r\n        let isMouseDown = false;\r\n        let x, y, mouseDownX, mouseDownY, mouseDownTopLeft;\r\n        let v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n        this._addDocumentListener(\"mousedown\", (e) => {\r\n            isMouseDown = true;\r\n            mouseDownX = e.clientX;\r\n            mouseDownY = e.clientY;\r\n            mouseDownTopLeft = this._container.getContentTopLeft();\r\n            v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n        });\r\n        this._addDocumentListener(\"mouseup\", (e) => {\r\n            const now = performance.now();\r\n            isMouseDown = false;\r\n            if (history.length < 2) {\r\n                return;\r\n            }\r\n            v = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(0, 0);\r\n            let divisor = 0;\r\n            for (let i = 1; i <= Math.min(10, history.length - 1); ++i) {\r\n                let index = history.length - i - 1;\r\n                let element = history[index];\r\n                let nextElement = history[index + 1];\r\n                if (now - nextElement[0] > 100) {\r\n                    break;\r\n                }\r\n                const multiplier = 1 / Math.pow(i, this._weightExponent);\r\n                const diff = (nextElement[1].clone()).sub(element[1].clone()).multiplyScalar((1 / (nextElement[0] - element[0])) * multiplier);\r\n                divisor += multiplier;\r\n                v.add(diff);\r\n            }\r\n            v.multiplyScalar(1 / divisor);\r\n            v = this._container.toWorld(v);\r\n            history.length = 0;\r\n        });\r\n        this._addDocumentListener(\"mousemove\", (e) => {\r\n            const now = performance.now();\r\n            x = e.clientX;\r\n            y = e.clientY;\r\n            if (isMouseDown) {\r\n                history.push([now, new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(x, y)]);\r\n                if (history.length === 100) {\r\n                    history.splice(0, 89);\r\n                }\r\n            }\r\n        });\r\n        this._addDocumentListener(\"wheel\", (e) => {\r\n            const mouse = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(e.clientX, e.clientY);\r\n            const worldMouseBefore = this._container.toWorld(mouse.clone());\r\n            this._container.setZoom(this._container.getZoom() * (1 + e.deltaY * -0.002));\r\n            const worldMouseAfter = this._container.toWorld(mouse.clone());\r\n            this._container.translate(worldMouseAfter.sub(worldMouseBefore).invert());\r\n        });\r\n        let prevTime = performance.now();\r\n        const step = () => {\r\n            const now = performance.now();\r\n            if (v.length() > 0.1) {\r\n                this._container.translate(v.clone().multiplyScalar(now - prevTime).invert());\r\n                v.multiplyScalar(Math.pow(this._friction, now - prevTime));\r\n            }\r\n            else if (isMouseDown) {\r\n                const newCenter = this._container.getContentTopLeft();\r\n                this._container.translate(newCenter.sub(mouseDownTopLeft).add(this._container.toWorld(new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(x - mouseDownX, y - mouseDownY).invert())));\r\n            }\r\n            prevTime = now;\r\n            this._container.updateView(this._container.viewBox(), this._container.getZoom());\r\n            this._animationFrame = window.requestAnimationFrame(step);\r\n        };\r\n        this._animationFrame = window.requestAnimationFrame(step);\r\n    }\r\n    setView(x, y, zoom) {\r\n        this._container.setZoom(zoom, false);\r\n        // the shapes were moved so that the content starts at the origin\r\n        const center = new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(x, y).add(this._container.contentOffset);\r\n        const view = this._container.viewBox();\r\n        this._container.translate(center.sub(new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default(view.width / 2, view.height / 2)).add(this._container.getContentTopLeft()));\r\n    }\r\n    viewSize() {\r\n        return { width: this._container.width(), height: this._container.height() };\r\n    }\r\n    cleanUp() {\r\n        super.cleanUp();\r\n        window.cancelAnimationFrame(this._animationFrame);\r\n        this._container.remove();\r\n    }\r\n    _render(graph) {\r\n        this._container.removeChildren();\r\n        const shapes = this._getShapesForGraph(graph);\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(shapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(this._additionalShapes, (shape) => {\r\n            this._container.addChild(shape);\r\n        });\r\n        const box = this._container.contentBoundingBox();\r\n        const zoom = Math.min(1, this._container.width() / box.width, this._container.height() / box.height);\r\n        this._container.setZoom(zoom, false);\r\n        this._container.translate(new _geometry_vector__WEBPACK_IMPORTED_MODULE_3__.default((box.width - this._container.width() / zoom) / 2, (box.height - this._container.height() / zoom) / 2));\r\n        this._container.render();\r\n    }\r\n    getTextSize(text, fontSize, fontFamily) {\r\n        const node = document.createElementNS(\"http://www.w3.org/2000/svg\", \"text\");\r\n        node.appendChild(document.createTextNode(text));\r\n        node.setAttribute('font-family', fontFamily);\r\n        node.setAttribute('font-size', fontSize.toString());\r\n        this._container.addElement(node);\r\n        const size = node.getBBox();\r\n        node.remove();\r\n        return size;\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/renderer/svgRenderer.ts?");
 
 /***/ }),
 
@@ -4385,7 +4418,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Timer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n\r\nclass Timer {\r\n    static reset() {\r\n        Timer._timers = new Map();\r\n        Timer._measurements = new Map();\r\n    }\r\n    static start(path) {\r\n        const id = path.join(\"|\");\r\n        let timers = Timer._timers.get(id);\r\n        if (timers === undefined) {\r\n            timers = [];\r\n            Timer._timers.set(id, timers);\r\n        }\r\n        timers.push(performance.now());\r\n    }\r\n    static stop(path) {\r\n        const stopTime = performance.now();\r\n        const id = path.join(\"|\");\r\n        const timers = Timer._timers.get(id);\r\n        const startTime = timers[timers.length - 1];\r\n        timers.length = timers.length - 1;\r\n        let measurements = Timer._measurements.get(id);\r\n        if (measurements === undefined) {\r\n            measurements = [];\r\n            Timer._measurements.set(id, measurements);\r\n        }\r\n        if (timers.length === 0) {\r\n            measurements.push(stopTime - startTime); // for recursive calls, only add outermost\r\n        }\r\n    }\r\n    static getTimes() {\r\n        const timePerPath = { children: {} };\r\n        Timer._measurements.forEach((measurements, id) => {\r\n            const path = id.split(\"|\");\r\n            let slot = timePerPath;\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(path, part => {\r\n                if (slot.children[part] === undefined) {\r\n                    slot.children[part] = {\r\n                        children: {},\r\n                    };\r\n                }\r\n                slot = slot.children[part];\r\n            });\r\n            slot[\"sum\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.sum(measurements);\r\n            slot[\"mean\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.mean(measurements);\r\n            slot[\"min\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.min(measurements);\r\n            slot[\"max\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.max(measurements);\r\n            slot[\"count\"] = measurements.length;\r\n        });\r\n        return timePerPath;\r\n    }\r\n    static getTimesPerPath() {\r\n        const timesPerPath = {};\r\n        Timer._measurements.forEach((measurements, id) => {\r\n            timesPerPath[id] = lodash__WEBPACK_IMPORTED_MODULE_0__.sum(measurements);\r\n        });\r\n        return timesPerPath;\r\n    }\r\n    static getCountPerPath() {\r\n        const countPerPath = {};\r\n        Timer._measurements.forEach((measurements, id) => {\r\n            countPerPath[id] = measurements.length;\r\n        });\r\n        return countPerPath;\r\n    }\r\n    static printTimes(times = null) {\r\n        const printTimes = (slot, name = \"\", level = 0, parentTime = 0) => {\r\n            if (level > 0) {\r\n                let timeString = (slot.sum > 1000 ? ((slot.sum / 1000).toFixed(1) + \" s\") : (slot.sum.toFixed(1) + \" ms\"));\r\n                if (level > 1) {\r\n                    timeString += \"; \" + (100 * slot.sum / parentTime).toFixed(0) + \"% of parent\";\r\n                }\r\n                timeString += \"; called \" + slot.count + \" times; average: \";\r\n                timeString += (slot.mean > 1000 ? ((slot.mean / 1000).toFixed(1) + \" s\") : (slot.mean.toFixed(1) + \" ms\"));\r\n                timeString += \"; min: \";\r\n                timeString += (slot.min > 1000 ? ((slot.min / 1000).toFixed(1) + \" s\") : (slot.min.toFixed(1) + \" ms\"));\r\n                timeString += \"; max: \";\r\n                timeString += (slot.max > 1000 ? ((slot.max / 1000).toFixed(1) + \" s\") : (slot.max.toFixed(1) + \" ms\"));\r\n                console.log(lodash__WEBPACK_IMPORTED_MODULE_0__.repeat(\"| \", level - 1) + name + \": \" + timeString);\r\n            }\r\n            for (let name in slot.children) {\r\n                printTimes(slot.children[name], name, level + 1, slot.sum);\r\n            }\r\n        };\r\n        if (times === null) {\r\n            times = Timer.getTimes();\r\n        }\r\n        printTimes(times);\r\n    }\r\n    static combineTimes(times) {\r\n        const summary = { children: {} };\r\n        const combineTimes = (summarySlot, timeSlots, level = 0) => {\r\n            if (level > 0) {\r\n                summarySlot[\"times\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.map(timeSlots, \"sum\");\r\n            }\r\n            for (let name in timeSlots[0].children) {\r\n                summarySlot.children[name] = {\r\n                    children: {},\r\n                };\r\n                combineTimes(summarySlot.children[name], lodash__WEBPACK_IMPORTED_MODULE_0__.map(timeSlots, slot => slot.children[name]), level + 1);\r\n            }\r\n        };\r\n        combineTimes(summary, times);\r\n        return summary;\r\n    }\r\n}\r\nTimer._timers = new Map();\r\nTimer._measurements = new Map();\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/util/timer.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Timer)\n/* harmony export */ });\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! lodash */ \"./node_modules/lodash/lodash.js\");\n/* harmony import */ var lodash__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(lodash__WEBPACK_IMPORTED_MODULE_0__);\n\r\n/**\r\n * Hierarchical timers identified by paths like [\"doLayout\", \"orderRanks\"].\r\n * Paths are registered once (as module constants next to their use) and then referred to by their numeric id.\r\n * Collection is disabled by default, so that start and stop only check a flag; it is enabled for breakdowns and\r\n * printTimes. Outermost calls are written as (id, duration) pairs into a preallocated ring buffer, which is folded\r\n * into the sums, counts, minima and maxima per path before it wraps and whenever results are read.\r\n */\r\nclass Timer {\r\n    /**\r\n     * Clears all measurements; registered paths keep their ids.\r\n     */\r\n    static reset() {\r\n        Timer._depths.fill(0);\r\n        Timer._sums.fill(0);\r\n        Timer._counts.fill(0);\r\n        Timer._mins.fill(Infinity);\r\n        Timer._maxs.fill(-Infinity);\r\n        Timer._written = 0;\r\n        Timer._folded = 0;\r\n        Timer._calls = 0;\r\n        Timer._memoryStarts = new Map();\r\n        Timer._memoryPeaks = new Map();\r\n        Timer._peakPerPath = new Map();\r\n        Timer._deltaPerPath = new Map();\r\n        Timer._heapBase = null;\r\n        Timer._heapPeak = null;\r\n        Timer._traceEvents = [];\r\n    }\r\n    /**\r\n     * Enables or disables the collection of times. The memory and trace modes only record while it is enabled.\r\n     */\r\n    static setEnabled(enabled) {\r\n        Timer._enabled = enabled;\r\n    }\r\n    static isEnabled() {\r\n        return Timer._enabled;\r\n    }\r\n    /**\r\n     * Enables or disables the trace mode. In trace mode, every start and stop is recorded as begin and end event\r\n     * with its timestamp, and other parts (like the WorkerPool) can add events with traceEvent.\r\n     */\r\n    static setTraceMode(enabled) {\r\n        Timer._trace = enabled;\r\n    }\r\n    static isTracing() {\r\n        return Timer._trace;\r\n    }\r\n    /**\r\n     * Adds an event (name, ph, ts in microseconds, tid, args, ...) to the trace if the trace mode is enabled.\r\n     */\r\n    static traceEvent(event) {\r\n        if (Timer._trace) {\r\n            Timer._traceEvents.push(Object.assign({ cat: \"layout\", pid: 0, tid: 0 }, event));\r\n        }\r\n    }\r\n    /**\r\n     * Recorded trace events since the last reset with thread name metadata (main thread, worker i in thread i + 1),\r\n     * ready for {\"traceEvents\": ...} files of chrome://tracing or Perfetto.\r\n     */\r\n    static getTraceEvents() {\r\n        const threads = lodash__WEBPACK_IMPORTED_MODULE_0__.uniq(lodash__WEBPACK_IMPORTED_MODULE_0__.map(Timer._traceEvents, \"tid\").concat([0])).sort((a, b) => a - b);\r\n        const metadata = lodash__WEBPACK_IMPORTED_MODULE_0__.map(threads, tid => ({\r\n            name: \"thread_name\",\r\n            ph: \"M\",\r\n            pid: 0,\r\n            tid: tid,\r\n            args: { name: (tid === 0 ? \"main\" : \"worker \" + (tid - 1)) },\r\n        }));\r\n        return metadata.concat(Timer._traceEvents);\r\n    }\r\n    /**\r\n     * Returns the id of a path, registering it on first use.\r\n     */\r\n    static register(path) {\r\n        const key = path.join(\"|\");\r\n        let id = Timer._ids.get(key);\r\n        if (id === undefined) {\r\n            id = Timer._paths.length;\r\n            Timer._ids.set(key, id);\r\n            Timer._paths.push(key);\r\n            Timer._names.push(path[path.length - 1]);\r\n            if (id >= Timer._depths.length) {\r\n                Timer._grow(2 * Timer._depths.length);\r\n            }\r\n            Timer._mins[id] = Infinity;\r\n            Timer._maxs[id] = -Infinity;\r\n        }\r\n        return id;\r\n    }\r\n    static _grow(capacity) {\r\n        const grow = (array, fill = 0) => {\r\n            const grown = new (array.constructor)(capacity).fill(fill);\r\n            grown.set(array);\r\n            return grown;\r\n        };\r\n        Timer._depths = grow(Timer._depths);\r\n        Timer._startTimes = grow(Timer._startTimes);\r\n        Timer._sums = grow(Timer._sums);\r\n        Timer._counts = grow(Timer._counts);\r\n        Timer._mins = grow(Timer._mins, Infinity);\r\n        Timer._maxs = grow(Timer._maxs, -Infinity);\r\n    }\r\n    /**\r\n     * Folds the samples of the ring buffer not yet counted into the statistics per path.\r\n     */\r\n    static _fold() {\r\n        const ring = Timer._ring;\r\n        for (let sample = Timer._folded; sample < Timer._written; ++sample) {\r\n            const slot = 2 * (sample % Timer.RING_SIZE);\r\n            const id = ring[slot];\r\n            const duration = ring[slot + 1];\r\n            Timer._sums[id] += duration;\r\n            Timer._counts[id]++;\r\n            if (duration < Timer._mins[id]) {\r\n                Timer._mins[id] = duration;\r\n            }\r\n            if (duration > Timer._maxs[id]) {\r\n                Timer._maxs[id] = duration;\r\n            }\r\n        }\r\n        Timer._folded = Timer._written;\r\n    }\r\n    /**\r\n     * Enables or disables the memory mode. In memory mode, the used JS heap is sampled at every start and stop\r\n     * (process.memoryUsage in Node.js, performance.memory in Chrome), and for every path the peak above the heap\r\n     * at its start and the difference between stop and start are recorded. Peaks between two samples are not seen.\r\n     */\r\n    static setMemoryMode(enabled) {\r\n        Timer._memory = enabled;\r\n    }\r\n    /**\r\n     * Used JS heap in bytes, or null if the environment does not report it.\r\n     */\r\n    static usedHeap() {\r\n        if (typeof process !== \"undefined\" && typeof process.memoryUsage === \"function\") {\r\n            return process.memoryUsage().heapUsed;\r\n        }\r\n        if (typeof performance !== \"undefined\" && performance[\"memory\"] !== undefined) {\r\n            return performance[\"memory\"].usedJSHeapSize;\r\n        }\r\n        return null;\r\n    }\r\n    static _sampleMemory() {\r\n        const heap = Timer.usedHeap();\r\n        if (heap === null) {\r\n            return null;\r\n        }\r\n        if (Timer._heapBase === null) {\r\n            Timer._heapBase = heap;\r\n        }\r\n        Timer._heapPeak = Math.max(Timer._heapPeak === null ? heap : Timer._heapPeak, heap);\r\n        Timer._memoryPeaks.forEach((peak, id) => {\r\n            if (heap > peak) {\r\n                Timer._memoryPeaks.set(id, heap);\r\n            }\r\n        });\r\n        return heap;\r\n    }\r\n    static start(path) {\r\n        if (!Timer._enabled) {\r\n            return;\r\n        }\r\n        const id = (typeof path === \"number\" ? path : Timer.register(path));\r\n        const startTime = performance.now();\r\n        if (Timer._trace) {\r\n            Timer.traceEvent({ name: Timer._names[id], cat: \"timer\", ph: \"B\", ts: startTime * 1000, args: { path: Timer._paths[id] } });\r\n        }\r\n        const outermost = (Timer._depths[id]++ === 0);\r\n        if (outermost) {\r\n            Timer._startTimes[id] = startTime;\r\n        }\r\n        if (Timer._memory) {\r\n            const heap = Timer._sampleMemory();\r\n            if (outermost && heap !== null) {\r\n                Timer._memoryStarts.set(id, heap);\r\n                Timer._memoryPeaks.set(id, heap);\r\n            }\r\n        }\r\n    }\r\n    static stop(path) {\r\n        if (!Timer._enabled) {\r\n            return;\r\n        }\r\n        const stopTime = performance.now();\r\n        const id = (typeof path === \"number\" ? path : Timer.register(path));\r\n        Timer._calls++;\r\n        if (Timer._trace) {\r\n            Timer.traceEvent({ name: Timer._names[id], cat: \"timer\", ph: \"E\", ts: stopTime * 1000, args: { path: Timer._paths[id] } });\r\n        }\r\n        if (Timer._depths[id] === 0 || --Timer._depths[id] > 0) {\r\n            return; // for recursive calls, only add outermost\r\n        }\r\n        if (Timer._written - Timer._folded === Timer.RING_SIZE) {\r\n            Timer._fold();\r\n        }\r\n        const slot = 2 * (Timer._written % Timer.RING_SIZE);\r\n        Timer._ring[slot] = id;\r\n        Timer._ring[slot + 1] = stopTime - Timer._startTimes[id];\r\n        Timer._written++;\r\n        if (Timer._memory) {\r\n            const heap = Timer._sampleMemory();\r\n            if (heap !== null && Timer._memoryStarts.has(id)) {\r\n                const start = Timer._memoryStarts.get(id);\r\n                const peak = Timer._memoryPeaks.get(id) - start;\r\n                Timer._peakPerPath.set(id, Math.max(Timer._peakPerPath.get(id) || 0, peak));\r\n                Timer._deltaPerPath.set(id, (Timer._deltaPerPath.get(id) || 0) + heap - start);\r\n                Timer._memoryStarts.delete(id);\r\n                Timer._memoryPeaks.delete(id);\r\n            }\r\n        }\r\n    }\r\n    /**\r\n     * Measures the cost of a start/stop pair (including the loop) with collection enabled, in ms.\r\n     * The result is kept for getOverhead; the calibration path does not appear in any result.\r\n     */\r\n    static calibrate(pairs = 10000) {\r\n        const id = Timer.register([\"timerCalibration\"]);\r\n        const [enabled, memory, trace, calls] = [Timer._enabled, Timer._memory, Timer._trace, Timer._calls];\r\n        Timer._enabled = true;\r\n        Timer._memory = false;\r\n        Timer._trace = false;\r\n        // a first round only warms up the code, like the many calls of a layout do\r\n        let begin = 0;\r\n        for (let round = 0; round < 2; ++round) {\r\n            begin = performance.now();\r\n            for (let i = 0; i < pairs; ++i) {\r\n                Timer.start(id);\r\n                Timer.stop(id);\r\n            }\r\n        }\r\n        Timer._overheadPerCall = (performance.now() - begin) / pairs;\r\n        Timer._fold();\r\n        Timer._sums[id] = 0;\r\n        Timer._counts[id] = 0;\r\n        Timer._mins[id] = Infinity;\r\n        Timer._maxs[id] = -Infinity;\r\n        [Timer._enabled, Timer._memory, Timer._trace, Timer._calls] = [enabled, memory, trace, calls];\r\n        return Timer._overheadPerCall;\r\n    }\r\n    /**\r\n     * Number of start/stop pairs since the last reset, the calibrated cost of one pair and their product, the\r\n     * estimated time the instrumentation added to the measured times (in ms).\r\n     */\r\n    static getOverhead() {\r\n        if (Timer._overheadPerCall === null) {\r\n            Timer.calibrate();\r\n        }\r\n        return {\r\n            timerCalls: Timer._calls,\r\n            timerOverheadPerCall: Timer._overheadPerCall,\r\n            timerOverhead: Timer._calls * Timer._overheadPerCall,\r\n        };\r\n    }\r\n    /**\r\n     * Calls f with the id and path of every path measured since the last reset, in the order of registration.\r\n     */\r\n    static _forEachMeasured(f) {\r\n        Timer._fold();\r\n        for (let id = 0; id < Timer._paths.length; ++id) {\r\n            if (Timer._counts[id] > 0) {\r\n                f(id, Timer._paths[id]);\r\n            }\r\n        }\r\n    }\r\n    static getTimes() {\r\n        const timePerPath = { children: {} };\r\n        Timer._forEachMeasured((id, key) => {\r\n            const path = key.split(\"|\");\r\n            let slot = timePerPath;\r\n            lodash__WEBPACK_IMPORTED_MODULE_0__.forEach(path, part => {\r\n                if (slot.children[part] === undefined) {\r\n                    slot.children[part] = {\r\n                        children: {},\r\n                    };\r\n                }\r\n                slot = slot.children[part];\r\n            });\r\n            slot[\"sum\"] = Timer._sums[id];\r\n            slot[\"mean\"] = Timer._sums[id] / Timer._counts[id];\r\n            slot[\"min\"] = Timer._mins[id];\r\n            slot[\"max\"] = Timer._maxs[id];\r\n            slot[\"count\"] = Timer._counts[id];\r\n        });\r\n        return timePerPath;\r\n    }\r\n    static getTimesPerPath() {\r\n        const timesPerPath = {};\r\n        Timer._forEachMeasured((id, path) => {\r\n            timesPerPath[path] = Timer._sums[id];\r\n        });\r\n        return timesPerPath;\r\n    }\r\n    static getCountPerPath() {\r\n        const countPerPath = {};\r\n        Timer._forEachMeasured((id, path) => {\r\n            countPerPath[path] = Timer._counts[id];\r\n        });\r\n        return countPerPath;\r\n    }\r\n    /**\r\n     * Maximum heap growth in bytes during any call of every path (sampled peak minus heap at the start of the call),\r\n     * shaped like getTimesPerPath. Empty unless the memory mode was enabled.\r\n     */\r\n    static getPeakMemoryPerPath() {\r\n        const peakPerPath = {};\r\n        Timer._peakPerPath.forEach((peak, id) => {\r\n            peakPerPath[Timer._paths[id]] = peak;\r\n        });\r\n        return peakPerPath;\r\n    }\r\n    /**\r\n     * Sum of the heap differences in bytes between stop and start over all calls of every path (memory retained,\r\n     * negative if garbage was collected), shaped like getTimesPerPath.\r\n     */\r\n    static getMemoryDeltaPerPath() {\r\n        const deltaPerPath = {};\r\n        Timer._deltaPerPath.forEach((delta, id) => {\r\n            deltaPerPath[Timer._paths[id]] = delta;\r\n        });\r\n        return deltaPerPath;\r\n    }\r\n    /**\r\n     * Heap at the first sample and highest sampled heap since the last reset, in bytes (null without samples).\r\n     */\r\n    static getHeapRange() {\r\n        return { heapBase: Timer._heapBase, heapPeak: Timer._heapPeak };\r\n    }\r\n    static printTimes(times = null) {\r\n        const printTimes = (slot, name = \"\", level = 0, parentTime = 0) => {\r\n            if (level > 0) {\r\n                let timeString = (slot.sum > 1000 ? ((slot.sum / 1000).toFixed(1) + \" s\") : (slot.sum.toFixed(1) + \" ms\"));\r\n                if (level > 1) {\r\n                    timeString += \"; \" + (100 * slot.sum / parentTime).toFixed(0) + \"% of parent\";\r\n                }\r\n                timeString += \"; called \" + slot.count + \" times; average: \";\r\n                timeString += (slot.mean > 1000 ? ((slot.mean / 1000).toFixed(1) + \" s\") : (slot.mean.toFixed(1) + \" ms\"));\r\n                timeString += \"; min: \";\r\n                timeString += (slot.min > 1000 ? ((slot.min / 1000).toFixed(1) + \" s\") : (slot.min.toFixed(1) + \" ms\"));\r\n                timeString += \"; max: \";\r\n                timeString += (slot.max > 1000 ? ((slot.max / 1000).toFixed(1) + \" s\") : (slot.max.toFixed(1) + \" ms\"));\r\n                console.log(lodash__WEBPACK_IMPORTED_MODULE_0__.repeat(\"| \", level - 1) + name + \": \" + timeString);\r\n            }\r\n            for (let name in slot.children) {\r\n                printTimes(slot.children[name], name, level + 1, slot.sum);\r\n            }\r\n        };\r\n        if (times === null) {\r\n            times = Timer.getTimes();\r\n        }\r\n        printTimes(times);\r\n    }\r\n    static combineTimes(times) {\r\n        const summary = { children: {} };\r\n        const combineTimes = (summarySlot, timeSlots, level = 0) => {\r\n            if (level > 0) {\r\n                summarySlot[\"times\"] = lodash__WEBPACK_IMPORTED_MODULE_0__.map(timeSlots, \"sum\");\r\n            }\r\n            for (let name in timeSlots[0].children) {\r\n                summarySlot.children[name] = {\r\n                    children: {},\r\n                };\r\n                combineTimes(summarySlot.children[name], lodash__WEBPACK_IMPORTED_MODULE_0__.map(timeSlots, slot => slot.children[name]), level + 1);\r\n            }\r\n        };\r\n        combineTimes(summary, times);\r\n        return summary;\r\n    }\r\n}\r\nTimer.RING_SIZE = 4096;\r\nTimer._enabled = false;\r\nTimer._ids = new Map();\r\nTimer._paths = [];\r\nTimer._names = [];\r\nTimer._depths = new Int32Array(64);\r\nTimer._startTimes = new Float64Array(64);\r\nTimer._sums = new Float64Array(64);\r\nTimer._counts = new Float64Array(64);\r\nTimer._mins = new Float64Array(64);\r\nTimer._maxs = new Float64Array(64);\r\nTimer._ring = new Float64Array(2 * Timer.RING_SIZE);\r\nTimer._written = 0;\r\nTimer._folded = 0;\r\nTimer._calls = 0;\r\nTimer._overheadPerCall = null;\r\n// memory mode: heap usage is sampled at every start and stop\r\nTimer._memory = false;\r\nTimer._memoryStarts = new Map();\r\nTimer._memoryPeaks = new Map();\r\nTimer._peakPerPath = new Map();\r\nTimer._deltaPerPath = new Map();\r\nTimer._heapBase = null;\r\nTimer._heapPeak = null;\r\n// trace mode: spans are also recorded as events of the Chrome trace event format, thread 0 is the main thread\r\nTimer._trace = false;\r\nTimer._traceEvents = [];\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/util/timer.ts?");
 
 /***/ }),
 
@@ -4396,7 +4429,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpac
 /***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ WorkerPool)\n/* harmony export */ });\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\nclass WorkerPool {\r\n    constructor(workerPath, numWorkers, layouter) {\r\n        this._ready = true;\r\n        this._workers = [];\r\n        this._inUse = [];\r\n        this._startedCallbacks = [];\r\n        this._doneCallbacks = [];\r\n        this._queue = [];\r\n        this._queuePointer = 0;\r\n        for (let i = 0; i < numWorkers; ++i) {\r\n            let tmpI = i;\r\n            try {\r\n                this._workers[i] = new Worker(workerPath);\r\n            }\r\n            catch (e) {\r\n                layouter.disableWorkers();\r\n                return;\r\n            }\r\n            this._inUse[i] = false;\r\n            this._workers[i].onmessage = e => {\r\n                const taskId = e.data[0];\r\n                if (e.data[1] === \"strt\") {\r\n                    this._startedCallbacks[taskId]();\r\n                }\r\n                else {\r\n                    this._inUse[tmpI] = false;\r\n                    this._ready = true;\r\n                    this._doneCallbacks[taskId](e.data[2]);\r\n                    this.tryDispatch();\r\n                }\r\n            };\r\n        }\r\n    }\r\n    cleanUp() {\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            this._workers[i].terminate();\r\n            delete this._workers[i];\r\n        }\r\n    }\r\n    tryDispatch() {\r\n        if (!this._ready) {\r\n            return;\r\n        }\r\n        if (this._queuePointer < this._queue.length) {\r\n            const [taskId, functionName, args, transferables] = this._queue[this._queuePointer];\r\n            let started = false;\r\n            for (let i = 0; i < this._workers.length; ++i) {\r\n                if (!this._inUse[i]) {\r\n                    this._inUse[i] = true;\r\n                    this._workers[i].postMessage([\"exec\", taskId, functionName, ...args], transferables);\r\n                    this._queuePointer++;\r\n                    started = true;\r\n                }\r\n                if (i === this._workers.length - 1) {\r\n                    this._ready = false;\r\n                }\r\n                if (started) {\r\n                    break;\r\n                }\r\n            }\r\n            this.tryDispatch();\r\n        }\r\n    }\r\n    exec(functionName, args = [], transferables = []) {\r\n        const taskId = this._queue.length;\r\n        const readyCallback = new Promise(resolve => {\r\n            this._startedCallbacks[taskId] = resolve;\r\n        });\r\n        const doneCallback = new Promise(resolve => {\r\n            this._doneCallbacks[taskId] = resolve;\r\n        });\r\n        this._queue.push([taskId, functionName, args, transferables]);\r\n        this.tryDispatch();\r\n        return [readyCallback, doneCallback];\r\n    }\r\n    static apply(functionName, args = []) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            let context;\r\n            if (typeof (window) !== \"undefined\") {\r\n                context = window;\r\n            }\r\n            else {\r\n                context = __webpack_require__.g;\r\n            }\r\n            return yield context[functionName].apply(context, args);\r\n        });\r\n    }\r\n    static registerWorker() {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            let context;\r\n            if (typeof (window) !== \"undefined\") {\r\n                context = window;\r\n            }\r\n            else {\r\n                context = __webpack_require__.g;\r\n            }\r\n            context.onmessage = function (e) {\r\n                return __awaiter(this, void 0, void 0, function* () {\r\n                    if (e.data[0] === \"exec\") {\r\n                        context.taskId = e.data[1];\r\n                        context.postMessage([context.taskId, \"strt\"]);\r\n                        const result = yield WorkerPool.apply(e.data[2], e.data.slice(3));\r\n                        context.postMessage([context.taskId, \"done\", result]);\r\n                    }\r\n                });\r\n            };\r\n        });\r\n    }\r\n}\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/util/workerPool.ts?");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ WorkerPool)\n/* harmony export */ });\n/* harmony import */ var _timer__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./timer */ \"./src/util/timer.ts\");\nvar __awaiter = (undefined && undefined.__awaiter) || function (thisArg, _arguments, P, generator) {\r\n    function adopt(value) { return value instanceof P ? value : new P(function (resolve) { resolve(value); }); }\r\n    return new (P || (P = Promise))(function (resolve, reject) {\r\n        function fulfilled(value) { try { step(generator.next(value)); } catch (e) { reject(e); } }\r\n        function rejected(value) { try { step(generator[\"throw\"](value)); } catch (e) { reject(e); } }\r\n        function step(result) { result.done ? resolve(result.value) : adopt(result.value).then(fulfilled, rejected); }\r\n        step((generator = generator.apply(thisArg, _arguments || [])).next());\r\n    });\r\n};\r\n\r\n/**\r\n * Pool of web workers that run the functions of worker/worker.js.\r\n * Pools are shared by all layouters with the same worker script and number of workers (see WorkerPool.get) and\r\n * live across layouts; their workers load their script right at construction, ready() resolves once all of them\r\n * are up.\r\n * Every task goes to the queue of one worker (round robin); a worker that runs out of tasks steals half of the\r\n * longest queue. Up to batchSize tasks are posted to a worker at once, so it can start the next one without\r\n * waiting for the main thread.\r\n * Data used by many tasks (like the buffers of the graph to order) is sent to every worker once with setData and\r\n * referenced in the arguments of the tasks by the returned WorkerPool.dataRef; SharedArrayBuffers are not copied.\r\n */\r\nclass WorkerPool {\r\n    constructor(workerPath, numWorkers, layouter, batchSize = 2) {\r\n        this._key = null;\r\n        this._users = 0;\r\n        this._workers = [];\r\n        this._running = []; // number of tasks posted to a worker and not done yet\r\n        this._localQueues = []; // task ids per worker, taken from the front, stolen from the back\r\n        this._nextWorker = 0;\r\n        this._nextTaskId = 0;\r\n        this._tasks = new Map(); // tasks by id until they are done\r\n        this._numDataSets = 0;\r\n        this._batchSize = Math.max(1, batchSize);\r\n        const readyPromises = [];\r\n        for (let i = 0; i < numWorkers; ++i) {\r\n            let tmpI = i;\r\n            try {\r\n                this._workers[i] = new Worker(workerPath);\r\n            }\r\n            catch (e) {\r\n                // the workers created so far are terminated and will never report that they are ready\r\n                this.cleanUp();\r\n                readyPromises.length = 0;\r\n                layouter.disableWorkers();\r\n                break;\r\n            }\r\n            this._running[i] = 0;\r\n            this._localQueues[i] = [];\r\n            let readyCallback;\r\n            readyPromises.push(new Promise(resolve => {\r\n                readyCallback = resolve;\r\n            }));\r\n            this._workers[i].onmessage = e => {\r\n                const taskId = e.data[0];\r\n                if (e.data[1] === \"ready\") {\r\n                    readyCallback();\r\n                }\r\n                else if (e.data[1] === \"strt\") {\r\n                    this._traceTask(taskId, \"B\", tmpI + 1, e.data[2]);\r\n                    this._tasks.get(taskId).started();\r\n                }\r\n                else {\r\n                    this._traceTask(taskId, \"E\", tmpI + 1, e.data[3]);\r\n                    this._traceTask(taskId, \"done\", 0);\r\n                    this._running[tmpI]--;\r\n                    const task = this._tasks.get(taskId);\r\n                    this._tasks.delete(taskId);\r\n                    task.done(e.data[2]);\r\n                    this.tryDispatch();\r\n                }\r\n            };\r\n            this._workers[i].postMessage([\"warm\"]);\r\n        }\r\n        this._readyPromise = Promise.all(readyPromises).then(() => undefined);\r\n    }\r\n    /**\r\n     * Returns the pool for the worker script and number of workers, creating it if there is none yet.\r\n     * Every call has to be matched by a call of release.\r\n     */\r\n    static get(workerPath, numWorkers, layouter) {\r\n        const key = workerPath + \"|\" + numWorkers;\r\n        let pool = WorkerPool._pools.get(key);\r\n        if (pool === undefined) {\r\n            pool = new WorkerPool(workerPath, numWorkers, layouter);\r\n            pool._key = key;\r\n            WorkerPool._pools.set(key, pool);\r\n        }\r\n        else if (pool._workers.length === 0) {\r\n            layouter.disableWorkers();\r\n        }\r\n        pool._users++;\r\n        return pool;\r\n    }\r\n    /**\r\n     * Terminates the workers of all pools created by get.\r\n     */\r\n    static terminateAll() {\r\n        WorkerPool._pools.forEach(pool => pool.cleanUp());\r\n        WorkerPool._pools.clear();\r\n    }\r\n    /**\r\n     * Gives the pool back after get; with keep, its workers stay alive for the next layouts even if nobody uses it.\r\n     */\r\n    release(keep = true) {\r\n        this._users--;\r\n        if (this._users <= 0 && !keep) {\r\n            this.cleanUp();\r\n        }\r\n    }\r\n    cleanUp() {\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            this._workers[i].terminate();\r\n            delete this._workers[i];\r\n        }\r\n        this._workers.length = 0;\r\n        if (this._key !== null && WorkerPool._pools.get(this._key) === this) {\r\n            WorkerPool._pools.delete(this._key);\r\n        }\r\n    }\r\n    /**\r\n     * Resolves once all workers have loaded their script.\r\n     */\r\n    ready() {\r\n        return this._readyPromise;\r\n    }\r\n    /**\r\n     * Sends the values to every worker once and returns a reference that stands for them in the arguments of exec\r\n     * (the values are inserted in place of the reference). ArrayBuffers are copied once per worker,\r\n     * SharedArrayBuffers are read in place. The workers keep the values until clearData.\r\n     */\r\n    setData(values) {\r\n        const name = \"data\" + (this._numDataSets++);\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            this._workers[i].postMessage([\"data\", name, values]);\r\n        }\r\n        return WorkerPool.dataRef(name);\r\n    }\r\n    clearData(ref) {\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            this._workers[i].postMessage([\"clear\", ref.poolData]);\r\n        }\r\n    }\r\n    static dataRef(name) {\r\n        return { poolData: name };\r\n    }\r\n    /**\r\n     * Adds a trace event of a task: phase \"B\" or \"E\" for its execution on the thread of its worker (at the time the\r\n     * worker reported in milliseconds since the epoch, if given), any other phase as instant event on the main thread.\r\n     */\r\n    _traceTask(taskId, phase, tid, workerTime = undefined, args = {}) {\r\n        if (!_timer__WEBPACK_IMPORTED_MODULE_0__.default.isTracing()) {\r\n            return;\r\n        }\r\n        let time = performance.now();\r\n        if (workerTime !== undefined && performance.timeOrigin !== undefined) {\r\n            time = workerTime - performance.timeOrigin;\r\n        }\r\n        const functionName = this._tasks.get(taskId).functionName;\r\n        const event = { cat: \"pool\", ts: time * 1000, tid: tid, args: Object.assign({ taskId: taskId, function: functionName }, args) };\r\n        if (phase === \"B\" || phase === \"E\") {\r\n            _timer__WEBPACK_IMPORTED_MODULE_0__.default.traceEvent(Object.assign(event, { name: functionName, ph: phase }));\r\n        }\r\n        else {\r\n            _timer__WEBPACK_IMPORTED_MODULE_0__.default.traceEvent(Object.assign(event, { name: phase, ph: \"i\", s: \"t\" }));\r\n        }\r\n    }\r\n    /**\r\n     * Posts tasks to every worker that has fewer than batchSize tasks, from its own queue or else stolen from the\r\n     * back of the longest queue.\r\n     */\r\n    tryDispatch() {\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            const free = this._batchSize - this._running[i];\r\n            if (free <= 0) {\r\n                continue;\r\n            }\r\n            if (this._localQueues[i].length === 0) {\r\n                this._steal(i);\r\n            }\r\n            const taskIds = this._localQueues[i].splice(0, free);\r\n            if (taskIds.length === 0) {\r\n                continue;\r\n            }\r\n            const tasks = [];\r\n            let transferables = [];\r\n            for (const taskId of taskIds) {\r\n                const task = this._tasks.get(taskId);\r\n                this._traceTask(taskId, \"post\", 0, undefined, { worker: i });\r\n                tasks.push([taskId, task.functionName, task.args]);\r\n                transferables = transferables.concat(task.transferables);\r\n                // the arguments are not needed anymore once posted\r\n                task.args = null;\r\n                task.transferables = null;\r\n            }\r\n            this._running[i] += taskIds.length;\r\n            this._workers[i].postMessage([\"exec\", tasks], transferables);\r\n        }\r\n    }\r\n    _steal(thief) {\r\n        let victim = -1;\r\n        for (let i = 0; i < this._workers.length; ++i) {\r\n            if (i !== thief && (victim === -1 || this._localQueues[i].length > this._localQueues[victim].length)) {\r\n                victim = i;\r\n            }\r\n        }\r\n        if (victim === -1 || this._localQueues[victim].length === 0) {\r\n            return;\r\n        }\r\n        const numStolen = Math.ceil(this._localQueues[victim].length / 2);\r\n        this._localQueues[thief] = this._localQueues[victim].splice(this._localQueues[victim].length - numStolen, numStolen);\r\n    }\r\n    exec(functionName, args = [], transferables = []) {\r\n        const taskId = this._nextTaskId++;\r\n        const task = { functionName: functionName, args: args, transferables: transferables, started: null, done: null };\r\n        const readyCallback = new Promise(resolve => {\r\n            task.started = resolve;\r\n        });\r\n        const doneCallback = new Promise(resolve => {\r\n            task.done = resolve;\r\n        });\r\n        this._tasks.set(taskId, task);\r\n        this._traceTask(taskId, \"enqueue\", 0);\r\n        if (this._workers.length > 0) {\r\n            this._localQueues[this._nextWorker].push(taskId);\r\n            this._nextWorker = (this._nextWorker + 1) % this._workers.length;\r\n        }\r\n        this.tryDispatch();\r\n        return [readyCallback, doneCallback];\r\n    }\r\n    static apply(functionName, args = []) {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            let context;\r\n            if (typeof (window) !== \"undefined\") {\r\n                context = window;\r\n            }\r\n            else {\r\n                context = __webpack_require__.g;\r\n            }\r\n            return yield context[functionName].apply(context, args);\r\n        });\r\n    }\r\n    static registerWorker() {\r\n        return __awaiter(this, void 0, void 0, function* () {\r\n            let context;\r\n            if (typeof (window) !== \"undefined\") {\r\n                context = window;\r\n            }\r\n            else {\r\n                context = __webpack_require__.g;\r\n            }\r\n            const data = new Map();\r\n            // tasks are run one after the other, also when a batch arrives while a task is still awaited\r\n            let previous = Promise.resolve();\r\n            const run = (taskId, functionName, args) => __awaiter(this, void 0, void 0, function* () {\r\n                // the times (ms since the epoch) place the execution on the timeline of the main thread in traces\r\n                context.postMessage([taskId, \"strt\", performance.timeOrigin + performance.now()]);\r\n                const resolvedArgs = [];\r\n                for (const arg of args) {\r\n                    if (arg !== null && typeof arg === \"object\" && arg.poolData !== undefined) {\r\n                        resolvedArgs.push(...data.get(arg.poolData));\r\n                    }\r\n                    else {\r\n                        resolvedArgs.push(arg);\r\n                    }\r\n                }\r\n                const result = yield WorkerPool.apply(functionName, resolvedArgs);\r\n                context.postMessage([taskId, \"done\", result, performance.timeOrigin + performance.now()]);\r\n            });\r\n            context.onmessage = function (e) {\r\n                switch (e.data[0]) {\r\n                    case \"warm\":\r\n                        context.postMessage([null, \"ready\"]);\r\n                        break;\r\n                    case \"data\":\r\n                        data.set(e.data[1], e.data[2]);\r\n                        break;\r\n                    case \"clear\":\r\n                        data.delete(e.data[1]);\r\n                        break;\r\n                    case \"exec\":\r\n                        for (const [taskId, functionName, args] of e.data[1]) {\r\n                            previous = previous.then(() => run(taskId, functionName, args));\r\n                        }\r\n                        break;\r\n                }\r\n            };\r\n        });\r\n    }\r\n}\r\nWorkerPool._pools = new Map();\r\n\n\n//# sourceURL=webpack://%5Bname%5D/./src/util/workerPool.ts?");
 
 /***/ }),
 
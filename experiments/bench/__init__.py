@@ -1,30 +1,138 @@
-import subprocess
 import os
+import time
+import urllib.parse
 
+# repository root; the experiment pages, dist/ and graphs/ are resolved against it
+# (defined before the submodule imports, which import it from here)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 
-def _file_path(file):
-    return 'file://' + os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), file)
+from experiments.bench.node import NodePool
+from experiments.bench.pool import BrowserPool
+from experiments.bench.server import ResultServer
 
 
-def _open_firefox(url):
-    p = subprocess.Popen([
-        'firefox',
-        url,
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    p.communicate()
+def profile_path(output):
+    '''
+    Directory of the CPU profiles of a result file (results.jsonl -> results.profiles).
+    '''
+    return os.path.splitext(output)[0] + '.profiles'
 
 
-def _open_chrome(url):
-    p = subprocess.Popen([
-        'google-chrome',
-        '--allow-file-access-from-files',
-        url,
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    p.communicate()
+def _graphs(experiment):
+    '''
+    Graphs of an experiment: its "graphs" list, or the graphs matching its "query" over the catalog
+    (e.g. "nodes > 5000 and has_ports"), restricted to "graphs" if both are given.
+    '''
+    if "query" not in experiment:
+        return experiment["graphs"]
+    from experiments.bench import catalog
+    return catalog.select(experiment["query"], experiment.get("graphs"))
 
 
-def _open_browser(browser, url):
-    if browser == 'firefox':
-        _open_firefox(url)
-    else:
-        _open_chrome(url)
\ No newline at end of file
+def _run_setups(browser, page, setups, output, workers=None, pin=False, cache=True, batch_size=20, budget=None, dry_run=False):
+    '''
+    Runs the experiment page (path relative to the repository) once per (setup, run) pair and writes all results
+    to the JSONL file `output`. Runs found in the result cache are not executed again, their cached entries are
+    written to the output instead.
+    Runs are grouped by graph into batches of up to `batch_size` runs, so that a page loads and sizes its graph only
+    once per batch. The batches are run longest predicted first (see experiments.bench.schedule); with a `budget`
+    in seconds, runs are dropped until the predicted time fits and no batch is started after the budget is used up.
+    The plan is written to schedule.plan_path(output) and returned; with `dry_run`, it is only printed and returned.
+    With browser 'node', the batches run in node processes (experiments/headless.js) instead of the page.
+    Setups with binary=1 load their graph from the binary file of experiments.bench.binary, which is compiled first
+    if it is missing or older than the graph; they are batched separately from the setups loading the JSON file.
+    The CPU profiles of setups with profile=1 are written to profile_path(output); these runs are neither taken
+    from nor added to the cache, as their entries refer to the profile files.
+    '''
+    # imported here so that `python -m experiments.bench.cache` does not import the module twice
+    from experiments.bench.cache import ResultCache, run_key
+    from experiments.bench import schedule
+    from experiments.bench.pool import _spare_cores
+    result_cache = ResultCache() if cache else None
+    profile_dir = None
+    if any(int(setup.get('profile', 0)) == 1 for setup, run in setups):
+        if browser == 'firefox':
+            raise ValueError('CPU profiles are only recorded in chrome and node')
+        profile_dir = profile_path(output)
+    # node sizes differ from the ones measured in a browser, so node results are cached separately
+    cache_page = ('node:' + page) if browser == 'node' else page
+    cached = []
+    runs = []
+    for setup, run in setups:
+        key = None
+        if result_cache is not None and int(setup.get('profile', 0)) != 1:
+            key = run_key(cache_page, setup, run, result_cache.build)
+            if key in result_cache:
+                cached.append(result_cache.get(key))
+                continue
+        runs.append((setup, run, key))
+    if len(cached) > 0:
+        print(str(len(cached)) + ' of ' + str(len(setups)) + ' runs taken from the cache')
+    if workers is None:
+        workers = len(_spare_cores())
+    plan = schedule.plan(browser, page, runs, workers, budget, batch_size)
+    print(plan.summary())
+    if dry_run:
+        if result_cache is not None:
+            result_cache.close()
+        return plan
+    if profile_dir is not None:
+        os.makedirs(profile_dir, exist_ok=True)
+    with ResultServer(output, result_cache) as server:
+        server.append(cached)
+        binary_graphs = sorted(set(batch['graph'] for batch, keys, batch_runs in plan.batches if batch.get('binary') == 1))
+        if len(binary_graphs) > 0:
+            from experiments.bench import binary
+            binary.compile_graphs(binary_graphs)
+        batches = [batch for batch, keys, batch_runs in plan.batches]
+        paths = [server.add_batch(batch, keys) for batch, keys, batch_runs in plan.batches]
+        start = time.time()
+        deadline = None if budget is None else start + budget
+        if browser == 'node':
+            with NodePool(workers, pin, profile_dir=profile_dir) as pool:
+                results = pool.map(batches, deadline)
+                durations = pool.durations
+            for path, entries in zip(paths, results):
+                if entries is not None:
+                    server.store_batch(path, entries)
+        else:
+            urls = [server.url(page + '?' + urllib.parse.urlencode({'pool': 1, 'batch': path})) for path in paths]
+            with BrowserPool(browser, workers, pin, profile_dir=profile_dir) as pool:
+                results = pool.map(urls, deadline)
+                durations = pool.durations
+        plan.elapsed = time.time() - start
+    if result_cache is not None:
+        result_cache.close()
+    plan.durations = durations
+    schedule.record(plan, results, durations)
+    plan.write(schedule.plan_path(output))
+    not_started = sum(duration is None for duration in durations)
+    if not_started > 0:
+        print(str(not_started) + ' batches not started within the budget')
+    # a batch without entries failed as a whole
+    failed = sum(len(keys) if entries is None else sum(entry is None for entry in entries)
+                 for (batch, keys, batch_runs), entries, duration in zip(plan.batches, results, durations)
+                 if duration is not None)
+    if failed > 0:
+        print(str(failed) + ' runs failed')
+    return plan
+
+
+def _batches(graph, runs, batch_size, binary=False):
+    def new_batch():
+        return dict({'graph': graph, 'setups': []}, **({'binary': 1} if binary else {}))
+
+    batch = new_batch()
+    keys = []
+    for setup, key in runs:
+        if len(keys) >= batch_size:
+            yield batch, keys
+            batch = new_batch()
+            keys = []
+        if len(batch['setups']) > 0 and batch['setups'][-1]['setup'] == setup:
+            batch['setups'][-1]['runs'] += 1
+        else:
+            batch['setups'].append({'setup': setup, 'runs': 1})
+        keys.append(key)
+    if len(keys) > 0:
+        yield batch, keys
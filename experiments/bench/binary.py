@@ -0,0 +1,337 @@
+import argparse
+import json
+import math
+import os
+import re
+import struct
+import sys
+from array import array
+from experiments.bench import ROOT_DIR
+
+'''
+Compiler of SDFGs (graphs/**/*.json) into the compact binary layout input read by src/parse/binaryParser.ts
+(Loader.loadBinary). Only what Parser.parse uses for layout is kept: the graph nesting, node ids, types, labels,
+connectors and scope entries/exits, the edges with their connectors and their labels, which are computed here
+like Memlet.label and InterstateEdge.label so that the edge attributes do not have to be shipped.
+
+All numbers are little-endian 32 bit integers, -1 stands for null:
+    header      magic "SDFB", version, number of graphs, nodes, connectors, edges, strings, string bytes
+    graphs      per graph: first node, number of nodes, first edge, number of edges (graph 0 is the SDFG)
+    nodes       per node: id, type, label, child graph, scope entry, scope exit, first connector,
+                number of in connectors, number of out connectors
+    connectors  string per connector, in connectors of a node before its out connectors
+    edges       per edge: src, dst, type, src connector, dst connector, label
+    strings     offsets of the strings into the string bytes (number of strings + 1), then the UTF-8 bytes
+Types index TYPES, labels and connectors index the string table (every distinct string is stored once).
+The binary file is written next to the JSON file with the extension BINARY_EXTENSION.
+'''
+
+MAGIC = 0x42464453  # "SDFB"
+VERSION = 1
+TYPES = ['AccessNode', 'LibraryNode', 'MapEntry', 'MapExit', 'NestedSDFG', 'SDFGState', 'Tasklet', 'Memlet',
+         'InterstateEdge']
+BINARY_EXTENSION = '.bin'
+GRAPH_DIR = os.path.join(ROOT_DIR, 'graphs')
+
+_HEADER = struct.Struct('<8I')
+_NODE_FIELDS = 9
+_EDGE_FIELDS = 6
+_ARRAY_INDEX = re.compile(r'0|[1-9][0-9]*')
+
+
+def _js_truthy(value):
+    if value is None or value is False or value == '':
+        return False
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value == value and value != 0
+    return True
+
+
+def _js_number(value):
+    # Number(value) of JavaScript for strings, booleans and numbers
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, (int, float)):
+        return value
+    text = value.strip()
+    if text == '':
+        return 0
+    try:
+        return float(text) if '_' not in text and text.lower() not in ('inf', 'nan', '-inf', '+inf') else math.nan
+    except ValueError:
+        return math.nan
+
+
+def _js_str(value):
+    # String(value) of JavaScript for the values JSON can hold
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return 'NaN'
+        if math.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        if value.is_integer() and abs(value) < 1e21:
+            return str(int(value))
+        return re.sub(r'e([+-])0*(\d)', r'e\1\2', repr(value))
+    if isinstance(value, list):
+        return ','.join('' if item is None else _js_str(item) for item in value)
+    return '[object Object]'
+
+
+def _js_json(value, indent=''):
+    # JSON.stringify(value, undefined, 4), which writes integral numbers without decimal point
+    inner = indent + '    '
+    if isinstance(value, dict) and len(value) > 0:
+        items = [inner + json.dumps(key, ensure_ascii=False) + ': ' + _js_json(item, inner) for key, item in value.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + indent + '}'
+    if isinstance(value, list) and len(value) > 0:
+        return '[\n' + ',\n'.join(inner + _js_json(item, inner) for item in value) + '\n' + indent + ']'
+    if isinstance(value, float):
+        return _js_str(value) if math.isfinite(value) else 'null'
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _js_loose_equal(a, b):
+    # a == b of JavaScript for JSON values, parsed objects are never equal to each other
+    if a is None or b is None:
+        return a is None and b is None
+    if isinstance(a, (dict, list)) and isinstance(b, (dict, list)):
+        return a is b
+    if isinstance(a, (dict, list)):
+        a = _js_str(a)
+    if isinstance(b, (dict, list)):
+        b = _js_str(b)
+    if isinstance(a, str) and isinstance(b, str):
+        return a == b
+    return _js_number(a) == _js_number(b)
+
+
+def _utf16_length(text):
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def _property_to_string(prop):
+    # RenderEdge.sdfgPropertyToString, which returns non-string values unchanged
+    if prop is None:
+        return ''
+    if isinstance(prop, bool):
+        return 'True' if prop else 'False'
+    if isinstance(prop, dict):
+        if prop.get('type') in ('Indices', 'subsets.Indices'):
+            preview = '['
+            for index in prop.get('indices') or []:
+                preview += _js_str(_property_to_string(index)) + ', '
+            return preview[:-2] + ']'
+        if prop.get('type') in ('Range', 'subsets.Range'):
+            preview = '['
+            for prop_range in prop.get('ranges') or []:
+                preview += _range_to_string(prop_range) + ', '
+            return preview[:-2] + ']'
+        if 'language' in prop:
+            string_data = prop.get('string_data')
+            if string_data is not None and string_data != '':
+                return '<pre class="code"><code>' + string_data.strip() + '</code></pre><div class="clearfix"></div>'
+            return ''
+        if 'approx' in prop and 'main' in prop:
+            return prop['main']
+        return '<pre class="code"><code>' + _js_json(prop) + '</code></pre><div class="clearfix"></div>'
+    if isinstance(prop, list):
+        return '[ ' + ', '.join(_js_str(_property_to_string(item)) for item in prop) + ' ]'
+    return prop
+
+
+def _range_to_string(prop_range):
+    # RenderEdge.sdfgRangeToString
+    start, end = prop_range.get('start'), prop_range.get('end')
+    step, tile = prop_range.get('step'), prop_range.get('tile')
+    if _js_loose_equal(start, end) and _js_loose_equal(step, 1) and _js_loose_equal(tile, 1):
+        return _js_str(_property_to_string(start))
+    preview = _js_str(_property_to_string(start)) + ':' + _js_str(_property_to_string(end)) + ' + 1'
+    if not _js_loose_equal(step, 1):
+        preview += ':' + _js_str(_property_to_string(step))
+        if not _js_loose_equal(tile, 1):
+            preview += ':' + _js_str(_property_to_string(tile))
+    elif not _js_loose_equal(tile, 1):
+        preview += '::' + _js_str(_property_to_string(tile))
+    return preview
+
+
+def _short(value):
+    return value if isinstance(value, str) and _utf16_length(value) <= 3 else '[...]'
+
+
+def edge_label(edge_type, attributes):
+    '''
+    Label of an edge as the render graph computes it (Memlet.label, InterstateEdge.label).
+    '''
+    if edge_type == 'InterstateEdge':
+        return _js_str(attributes.get('label')) if _js_truthy(attributes.get('label')) else ''
+    if not _js_truthy(attributes.get('subset')):
+        return ''
+    label = _js_str(attributes.get('data')) if _js_truthy(attributes.get('data')) else ''
+    label += _short(_property_to_string(attributes['subset']))
+    if _js_truthy(attributes.get('other_subset')):
+        label += ' -> ' + _short(_property_to_string(attributes['other_subset']))
+    if _js_truthy(attributes.get('wcr')):
+        label += '\n' + 'CR: ' + _js_str(_property_to_string(attributes['wcr']))
+    return label
+
+
+def _connector_names(connectors):
+    # Object.keys order: array index keys ascending, then the other keys in insertion order
+    if not _js_truthy(connectors):
+        return []
+    if isinstance(connectors, list):
+        return [_js_str(name) for name in connectors]
+    indices = [key for key in connectors if _ARRAY_INDEX.fullmatch(key) and int(key) < 2 ** 32 - 1]
+    index_keys = set(indices)
+    return sorted(indices, key=int) + [key for key in connectors if key not in index_keys]
+
+
+class _Compiler:
+    def __init__(self):
+        self.graphs = array('i')
+        self.nodes = array('i')
+        self.connectors = array('i')
+        self.edges = array('i')
+        self.strings = {}
+
+    def string(self, value):
+        if value is None:
+            return -1
+        return self.strings.setdefault(value, len(self.strings))
+
+    def type_index(self, node_or_edge_type):
+        if node_or_edge_type not in TYPES:
+            raise ValueError('Unknown node or edge type: ' + str(node_or_edge_type))
+        return TYPES.index(node_or_edge_type)
+
+    def add_graph(self, sdfg):
+        '''
+        Adds a graph and (after all its nodes) its child graphs, returns its index.
+        '''
+        index = len(self.graphs) // 4
+        json_nodes = sdfg.get('nodes') or []
+        json_edges = sdfg.get('edges') or []
+        self.graphs.extend([len(self.nodes) // _NODE_FIELDS, len(json_nodes), len(self.edges) // _EDGE_FIELDS,
+                            len(json_edges)])
+        children = []
+        for json_node in json_nodes:
+            attributes = json_node.get('attributes') or {}
+            in_connectors = _connector_names(attributes.get('in_connectors'))
+            out_connectors = _connector_names(attributes.get('out_connectors'))
+            if json_node['type'] == 'NestedSDFG':
+                children.append((len(self.nodes), attributes['sdfg']))
+            elif json_node['type'] == 'SDFGState':
+                children.append((len(self.nodes), json_node))
+            self.nodes.extend([
+                int(json_node['id']),
+                self.type_index(json_node['type']),
+                self.string(_js_str(json_node['label']) if json_node.get('label') is not None else json_node.get('label', '')),
+                -1,
+                int(json_node['scope_entry']) if _js_truthy(json_node.get('scope_entry')) else -1,
+                int(json_node['scope_exit']) if _js_truthy(json_node.get('scope_exit')) else -1,
+                len(self.connectors),
+                len(in_connectors),
+                len(out_connectors),
+            ])
+            self.connectors.extend(self.string(name) for name in in_connectors + out_connectors)
+        for json_edge in json_edges:
+            data = json_edge['attributes']['data']
+            self.edges.extend([
+                int(json_edge['src']),
+                int(json_edge['dst']),
+                self.type_index(data['type']),
+                self.string(_js_str(json_edge['src_connector'])) if _js_truthy(json_edge.get('src_connector')) else -1,
+                self.string(_js_str(json_edge['dst_connector'])) if _js_truthy(json_edge.get('dst_connector')) else -1,
+                self.string(edge_label(data['type'], data.get('attributes') or {})),
+            ])
+        for position, child in children:
+            self.nodes[position + 3] = self.add_graph(child)
+        return index
+
+    def to_bytes(self):
+        encoded = [value.encode('utf-8', 'surrogatepass') for value in self.strings]
+        offsets = array('i', [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        sections = [self.graphs, self.nodes, self.connectors, self.edges, offsets]
+        if sys.byteorder == 'big':
+            for section in sections:
+                section.byteswap()
+        header = _HEADER.pack(MAGIC, VERSION, len(self.graphs) // 4, len(self.nodes) // _NODE_FIELDS,
+                              len(self.connectors), len(self.edges) // _EDGE_FIELDS, len(encoded), offsets[-1])
+        return b''.join([header] + [section.tobytes() for section in sections] + encoded)
+
+
+def compile_sdfg(sdfg):
+    '''
+    Binary representation (bytes) of a parsed SDFG.
+    '''
+    compiler = _Compiler()
+    compiler.add_graph(sdfg)
+    return compiler.to_bytes()
+
+
+def binary_path(graph, graph_dir=GRAPH_DIR):
+    return os.path.join(graph_dir, graph + BINARY_EXTENSION)
+
+
+def _is_current(json_path, path):
+    if not os.path.exists(path) or os.stat(path).st_mtime_ns < os.stat(json_path).st_mtime_ns:
+        return False
+    with open(path, 'rb') as file:
+        header = file.read(8)
+    return len(header) == 8 and struct.unpack('<2I', header) == (MAGIC, VERSION)
+
+
+def compile_graph(graph, graph_dir=GRAPH_DIR, force=False):
+    '''
+    Writes the binary file of a graph (name relative to the graph directory, without extension) unless it is newer
+    than the JSON file and of the current version; returns its path.
+    '''
+    json_path = os.path.join(graph_dir, graph + '.json')
+    path = binary_path(graph, graph_dir)
+    if force or not _is_current(json_path, path):
+        with open(json_path, encoding='utf-8') as file:
+            data = compile_sdfg(json.load(file))
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    return path
+
+
+def compile_graphs(graphs=None, graph_dir=GRAPH_DIR, force=False, verbose=False):
+    '''
+    Compiles the given graphs, or all graphs of the graph directory; returns the names of the compiled graphs.
+    '''
+    if graphs is None:
+        graphs = []
+        for directory, subdirectories, files in os.walk(graph_dir):
+            subdirectories.sort()
+            for file in sorted(files):
+                if file.endswith('.json'):
+                    path = os.path.relpath(os.path.join(directory, file), graph_dir)
+                    graphs.append(path[:-len('.json')].replace(os.sep, '/'))
+    for graph in graphs:
+        if verbose:
+            print(graph)
+        compile_graph(graph, graph_dir, force)
+    return list(graphs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile SDFGs into the binary layout input of Loader.loadBinary.')
+    parser.add_argument('graphs', nargs='*', help='graph names (default: all graphs of the graph directory)')
+    parser.add_argument('--graphs-dir', default=GRAPH_DIR, help='graph directory')
+    parser.add_argument('--force', action='store_true', help='compile also the graphs whose binary file is current')
+    args = parser.parse_args()
+    compile_graphs(args.graphs or None, args.graphs_dir, args.force, verbose=True)
@@ -0,0 +1,150 @@
+import argparse
+import functools
+import hashlib
+import json
+import os
+from experiments.bench import ROOT_DIR
+
+'''
+Content-addressed cache of experiment results.
+Every run is keyed on its setup, the contents of the graph file, the layoutLib build and the run index,
+so re-running a sweep only executes runs that are new or whose inputs changed.
+The cache is an append-only JSONL file of {"key", "build", "entry"} records.
+'''
+
+CACHE_PATH = os.path.join(ROOT_DIR, 'experiments', '.cache', 'results.jsonl')
+
+
+@functools.lru_cache(maxsize=None)
+def _file_hash(path, mtime, size):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_hash(path):
+    stat = os.stat(path)
+    return _file_hash(path, stat.st_mtime_ns, stat.st_size)
+
+
+def build_hash():
+    return file_hash(os.path.join(ROOT_DIR, 'dist', 'layoutLib.js'))[:16]
+
+
+def graph_hash(graph):
+    path = os.path.join(ROOT_DIR, 'graphs', graph + '.json')
+    return file_hash(path) if os.path.exists(path) else None
+
+
+def run_key(page, setup, run, build):
+    description = {
+        'page': page,
+        'setup': setup,
+        'graph': graph_hash(setup['graph']),
+        'build': build,
+        'run': run,
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=CACHE_PATH, build=None):
+        self.path = path
+        self.build = build_hash() if build is None else build
+        self._entries = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    if line.strip() == '':
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # partially written line of an interrupted sweep
+                    self._entries[record['key']] = record['entry']
+        self._file = None
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def add(self, key, entry):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps({'key': key, 'build': self.build, 'entry': entry}) + '\n')
+        self._file.flush()
+        self._entries[key] = entry
+
+    def sync(self):
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def evict(path=CACHE_PATH, build=None):
+    '''
+    Removes all entries of the given build, or all entries not belonging to the current build if no build is given.
+    Returns the number of removed entries.
+    '''
+    if not os.path.exists(path):
+        return 0
+    current = build_hash()
+    kept = []
+    removed = 0
+    with open(path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                removed += 1
+                continue
+            stale = (record['build'] == build) if build is not None else (record['build'] != current)
+            if stale:
+                removed += 1
+            else:
+                kept.append(line if line.endswith('\n') else line + '\n')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as file:
+        file.writelines(kept)
+    os.replace(tmp_path, path)
+    return removed
+
+
+def _stats(path=CACHE_PATH):
+    builds = {}
+    if os.path.exists(path):
+        with open(path) as file:
+            for line in file:
+                try:
+                    build = json.loads(line)['build']
+                except ValueError:
+                    continue
+                builds[build] = builds.get(build, 0) + 1
+    current = build_hash()
+    for build, count in builds.items():
+        print(build + ': ' + str(count) + ' entries' + (' (current build)' if build == current else ''))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inspect or clean the experiment result cache.')
+    parser.add_argument('command', choices=['stats', 'evict'])
+    parser.add_argument('--build', default=None, help='build hash to evict (default: every build but the current one)')
+    parser.add_argument('--path', default=CACHE_PATH)
+    args = parser.parse_args()
+    if args.command == 'evict':
+        print('removed ' + str(evict(args.path, args.build)) + ' entries')
+    else:
+        _stats(args.path)
@@ -0,0 +1,414 @@
+import argparse
+import json
+import os
+import re
+from json.decoder import scanstring
+import pandas as pd
+from experiments.bench import ROOT_DIR
+from experiments.bench.cache import file_hash
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+'''
+Catalog of the SDFGs in the graphs directory.
+For every graph file (graphs/**/*.json), the catalog records its size: node, edge and state counts, nesting depth,
+connector counts, map scope sizes and the content hash. The files are read with a streaming JSON parser (ijson if it
+is installed, a small tokenizer otherwise), so even SDFGs of several hundred MB are never held in memory.
+The statistics are kept in an index file that is only updated for files whose modification time or hash changed.
+Graphs can then be selected by query and times normalized by graph size without opening the graphs:
+    graphs = catalog.select('nodes > 5000 and has_ports')
+    df = catalog.normalize(df, ['time'], by='nodes')
+'''
+
+GRAPH_DIR = os.path.join(ROOT_DIR, 'graphs')
+INDEX_PATH = os.path.join(ROOT_DIR, 'experiments', '.cache', 'catalog.json')
+INDEX_VERSION = 1
+
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# all characters a number can contain, so that a number cut by the end of a chunk is recognized
+_NUMBER = re.compile(r'[-+0-9.eE]+')
+_LITERALS = {'true': ('boolean', True), 'false': ('boolean', False), 'null': ('null', None)}
+
+
+def _events_stdlib(file):
+    '''
+    Incremental JSON tokenizer yielding (event, value) pairs like ijson.basic_parse:
+    start_map, map_key, end_map, start_array, end_array, string, number, boolean and null.
+    '''
+    buffer = ''
+    position = 0
+    eof = False
+    # for every open container, whether it is a map; for maps, whether the next string is a key
+    containers = []
+    expect_key = False
+
+    def more():
+        nonlocal buffer, position, eof
+        chunk = file.read(_CHUNK_SIZE)
+        if chunk == '':
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position >= len(buffer):
+            if not more():
+                break
+            continue
+        char = buffer[position]
+        if char == '{':
+            containers.append(True)
+            expect_key = True
+            position += 1
+            yield 'start_map', None
+        elif char == '}':
+            containers.pop()
+            expect_key = False
+            position += 1
+            yield 'end_map', None
+        elif char == '[':
+            containers.append(False)
+            position += 1
+            yield 'start_array', None
+        elif char == ']':
+            containers.pop()
+            position += 1
+            yield 'end_array', None
+        elif char == ',':
+            expect_key = len(containers) > 0 and containers[-1]
+            position += 1
+        elif char == ':':
+            expect_key = False
+            position += 1
+        elif char == '"':
+            try:
+                value, end = scanstring(buffer, position + 1)
+            except ValueError:
+                # the string continues in the next chunk
+                if eof or not more():
+                    raise
+                continue
+            position = end
+            yield ('map_key' if expect_key else 'string'), value
+        else:
+            match = _NUMBER.match(buffer, position)
+            if match is not None:
+                if match.end() == len(buffer) and not eof and more():
+                    continue
+                text = match.group()
+                position = match.end()
+                yield 'number', (float(text) if any(c in text for c in '.eE') else int(text))
+                continue
+            word = re.match(r'[a-z]+', buffer[position:position + 5])
+            if word is not None and word.group() in _LITERALS:
+                event, value = _LITERALS[word.group()]
+                position += len(word.group())
+                yield event, value
+            elif len(buffer) - position < 5 and not eof and more():
+                continue
+            else:
+                raise ValueError('invalid JSON at position ' + str(position) + ': ' + buffer[position:position + 20])
+
+
+def events(path):
+    '''
+    Parse events of a JSON file, read incrementally.
+    '''
+    if ijson is not None:
+        with open(path, 'rb') as file:
+            yield from ijson.basic_parse(file, use_float=True)
+    else:
+        with open(path, 'r', encoding='utf-8') as file:
+            yield from _events_stdlib(file)
+
+
+class _Graph:
+    def __init__(self, depth):
+        self.depth = depth
+        self.scope_entries = {}
+
+
+class _Statistics:
+    '''
+    Collects the statistics of an SDFG from its parse events.
+    Graphs are the SDFG itself, its states and nested SDFGs; nodes and edges are counted on all levels.
+    '''
+
+    def __init__(self):
+        self.nodes = 0
+        self.edges = 0
+        self.states = 0
+        self.nested_sdfgs = 0
+        self.maps = 0
+        self.memlets = 0
+        self.interstate_edges = 0
+        self.connectors = 0
+        self.nodes_with_connectors = 0
+        self.max_connectors = 0
+        self.edges_with_connectors = 0
+        self.depth = 0
+        self.scope_depth = 0
+        self.scope_sizes = []
+        self.node_types = {}
+
+    def _end_graph(self, graph):
+        # number of nodes per map scope and nesting depth of the scopes inside this graph
+        sizes = {}
+        for entry in graph.scope_entries.values():
+            if entry is not None:
+                sizes[entry] = sizes.get(entry, 0) + 1
+        self.scope_sizes.extend(sizes.values())
+        depths = {}
+        for node in graph.scope_entries:
+            chain = []
+            current = node
+            while current is not None and current not in depths and current not in chain:
+                chain.append(current)
+                current = graph.scope_entries.get(current)
+            for scoped in reversed(chain):
+                entry = graph.scope_entries.get(scoped)
+                depths[scoped] = 0 if entry is None else depths.get(entry, 0) + 1
+        if len(depths) > 0:
+            self.scope_depth = max(self.scope_depth, max(depths.values()))
+
+    def _end_node(self, node, graph):
+        self.nodes += 1
+        node_type = node.get('type')
+        self.node_types[node_type] = self.node_types.get(node_type, 0) + 1
+        if node_type == 'SDFGState':
+            self.states += 1
+        elif node_type == 'NestedSDFG':
+            self.nested_sdfgs += 1
+        elif node_type == 'MapEntry':
+            self.maps += 1
+        connectors = node['in'] + node['out']
+        self.connectors += connectors
+        if connectors > 0:
+            self.nodes_with_connectors += 1
+        self.max_connectors = max(self.max_connectors, connectors)
+        if 'id' in node:
+            graph.scope_entries[node['id']] = node.get('scope_entry')
+
+    def _end_edge(self, edge):
+        self.edges += 1
+        if edge.get('type') == 'InterstateEdge':
+            self.interstate_edges += 1
+        else:
+            self.memlets += 1
+        if edge.get('src_connector') is not None or edge.get('dst_connector') is not None:
+            self.edges_with_connectors += 1
+
+    def consume(self, parse_events):
+        # one (role, object, is_map, key) frame per open container, key being the last map key of a map
+        frames = []
+        graphs = []
+        for event, value in parse_events:
+            role, obj, is_map, key = frames[-1] if len(frames) > 0 else (None, None, False, None)
+            if event == 'map_key':
+                frames[-1] = (role, obj, is_map, value)
+                if role in ('in_connectors', 'out_connectors'):
+                    obj[role[:-len('_connectors')]] += 1
+                continue
+            if event in ('end_map', 'end_array'):
+                role, obj, is_map, key = frames.pop()
+                if role == 'graph':
+                    self._end_graph(graphs.pop())
+                elif role == 'node':
+                    if obj['graph'] is not None:
+                        self._end_graph(graphs.pop())
+                    self._end_node(obj, graphs[-1])
+                elif role == 'edge':
+                    self._end_edge(obj)
+                continue
+            if role in ('in_connectors', 'out_connectors') and not is_map:
+                obj[role[:-len('_connectors')]] += 1
+            if event not in ('start_map', 'start_array'):
+                if role == 'node' and key in ('type', 'id', 'scope_entry'):
+                    obj[key] = value if (key == 'type' or value is None) else str(value)
+                elif role == 'edge' and key in ('src_connector', 'dst_connector'):
+                    obj[key] = value
+                elif role == 'edge_data' and key == 'type':
+                    obj['type'] = value
+                continue
+            new_role, new_obj = 'other', None
+            if role is None:
+                new_role, new_obj = 'graph', _Graph(0)
+            elif role in ('graph', 'node') and key in ('nodes', 'edges') and event == 'start_array':
+                if role == 'node' and obj['graph'] is None:
+                    # the node is a state with its own graph
+                    obj['graph'] = _Graph(graphs[-1].depth + 1)
+                    graphs.append(obj['graph'])
+                    self.depth = max(self.depth, obj['graph'].depth)
+                new_role = key
+            elif role == 'nodes' and event == 'start_map':
+                new_role, new_obj = 'node', {'in': 0, 'out': 0, 'graph': None}
+            elif role == 'node' and key == 'attributes':
+                new_role, new_obj = 'node_attributes', obj
+            elif role == 'node_attributes' and key in ('in_connectors', 'out_connectors'):
+                new_role, new_obj = key, obj
+            elif role == 'node_attributes' and key == 'sdfg' and event == 'start_map':
+                new_role, new_obj = 'graph', _Graph(graphs[-1].depth + 1)
+            elif role == 'edges' and event == 'start_map':
+                new_role, new_obj = 'edge', {}
+            elif role == 'edge' and key == 'attributes':
+                new_role, new_obj = 'edge_attributes', obj
+            elif role == 'edge_attributes' and key == 'data':
+                new_role, new_obj = 'edge_data', obj
+            if new_role == 'graph':
+                graphs.append(new_obj)
+                self.depth = max(self.depth, new_obj.depth)
+            frames.append((new_role, new_obj, event == 'start_map', None))
+        return self
+
+    def result(self):
+        sizes = self.scope_sizes
+        return {
+            'nodes': self.nodes,
+            'edges': self.edges,
+            'states': self.states,
+            'nested_sdfgs': self.nested_sdfgs,
+            'maps': self.maps,
+            'memlets': self.memlets,
+            'interstate_edges': self.interstate_edges,
+            'depth': self.depth,
+            'scope_depth': self.scope_depth,
+            'scopes': len(sizes),
+            'max_scope_size': max(sizes) if len(sizes) > 0 else 0,
+            'mean_scope_size': sum(sizes) / len(sizes) if len(sizes) > 0 else 0.0,
+            'connectors': self.connectors,
+            'nodes_with_connectors': self.nodes_with_connectors,
+            'max_connectors': self.max_connectors,
+            'edges_with_connectors': self.edges_with_connectors,
+            'has_ports': self.edges_with_connectors > 0,
+            'node_types': self.node_types,
+        }
+
+
+def graph_statistics(path):
+    '''
+    Size statistics of one SDFG file, computed from a single streaming pass.
+    '''
+    return _Statistics().consume(events(path)).result()
+
+
+def _graph_files(graph_dir):
+    for directory, subdirectories, files in os.walk(graph_dir):
+        subdirectories.sort()
+        for file in sorted(files):
+            if file.endswith('.json'):
+                path = os.path.join(directory, file)
+                yield os.path.relpath(path, graph_dir)[:-len('.json')].replace(os.sep, '/'), path
+
+
+def _read_index(index_path):
+    if os.path.exists(index_path):
+        try:
+            with open(index_path) as file:
+                index = json.load(file)
+            if index.get('version') == INDEX_VERSION:
+                return index
+        except ValueError:
+            pass
+    return {'version': INDEX_VERSION, 'graphs': {}}
+
+
+def build(graph_dir=GRAPH_DIR, index_path=INDEX_PATH, force=False, verbose=False):
+    '''
+    Updates the index of all graph files and returns it. Only files that are new or whose modification time and
+    size changed are hashed again, and only files whose hash changed are parsed again.
+    '''
+    index = _read_index(index_path) if not force else {'version': INDEX_VERSION, 'graphs': {}}
+    old_graphs = index['graphs']
+    graphs = {}
+    changed = len(old_graphs) == 0
+    for name, path in _graph_files(graph_dir):
+        stat = os.stat(path)
+        record = old_graphs.get(name)
+        if record is not None and record['mtime'] == stat.st_mtime_ns and record['bytes'] == stat.st_size:
+            graphs[name] = record
+            continue
+        content_hash = file_hash(path)
+        if record is None or record['hash'] != content_hash:
+            if verbose:
+                print('parsing ' + name)
+            record = dict(graph_statistics(path), hash=content_hash)
+        record = dict(record, mtime=stat.st_mtime_ns, bytes=stat.st_size)
+        graphs[name] = record
+        changed = True
+    changed = changed or set(graphs) != set(old_graphs)
+    index = {'version': INDEX_VERSION, 'graph_dir': os.path.abspath(graph_dir), 'graphs': graphs}
+    if changed:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(index, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, index_path)
+    return index
+
+
+def load(graph_dir=GRAPH_DIR, index_path=INDEX_PATH, update=True):
+    '''
+    The catalog as DataFrame with one row per graph (index: graph name), updated first unless `update` is False.
+    '''
+    index = build(graph_dir, index_path) if update else _read_index(index_path)
+    df = pd.DataFrame.from_dict(index['graphs'], orient='index')
+    df.index.name = 'graph'
+    return df.drop(columns=['node_types', 'mtime'], errors='ignore').sort_index()
+
+
+def select(query=None, graphs=None, **kwargs):
+    '''
+    Names of the graphs matching a pandas query over the catalog columns, e.g. 'nodes > 5000 and has_ports',
+    optionally restricted to the given graphs (e.g. a group of experiments.bench.graphs) and in their order.
+    '''
+    df = load(**kwargs)
+    if graphs is not None:
+        df = df.reindex([graph for graph in graphs if graph in df.index])
+    if query is not None:
+        df = df.query(query)
+    return list(df.index)
+
+
+def join(df, columns=('nodes', 'edges'), on='graph', catalog=None, **kwargs):
+    '''
+    Adds the given catalog columns to a result DataFrame with a graph column.
+    '''
+    catalog = load(**kwargs) if catalog is None else catalog
+    return df.join(catalog[list(columns)], on=on)
+
+
+def normalize(df, columns, by='nodes', on='graph', catalog=None, **kwargs):
+    '''
+    Divides the given result columns by the size of their graph (a catalog column like nodes or edges),
+    e.g. to get the time per node. The normalized columns are added as e.g. "time_per_node".
+    '''
+    sizes = join(df[[on]], [by], on, catalog, **kwargs)[by]
+    return df.assign(**{column + '_per_' + by.rstrip('s'): df[column] / sizes for column in columns})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build and query the catalog of the graphs directory.')
+    parser.add_argument('command', choices=['build', 'query', 'show'])
+    parser.add_argument('query', nargs='?', default=None, help='pandas query, e.g. "nodes > 5000 and has_ports"')
+    parser.add_argument('--graphs', default=GRAPH_DIR, help='graph directory')
+    parser.add_argument('--index', default=INDEX_PATH, help='index file')
+    parser.add_argument('--force', action='store_true', help='parse all graphs again')
+    args = parser.parse_args()
+    if args.command == 'build':
+        index = build(args.graphs, args.index, args.force, verbose=True)
+        print(str(len(index['graphs'])) + ' graphs in ' + args.index)
+    elif args.command == 'query':
+        for graph in select(args.query, graph_dir=args.graphs, index_path=args.index):
+            print(graph)
+    else:
+        pd.set_option('display.max_rows', None)
+        pd.set_option('display.width', None)
+        catalog = load(args.graphs, args.index)
+        print(catalog if args.query is None else catalog.query(args.query))
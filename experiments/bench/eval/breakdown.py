@@ -0,0 +1,282 @@
+import re
+import numpy as np
+import pandas as pd
+from experiments.bench import store
+
+'''
+Analysis of timer breakdowns.
+Breakdowns of all layouters are brought into one long format with one row per run and timer path
+(columns: run, path, value and the id columns like name and graph):
+- Timer.getTimesPerPath and Timer.getCountPerPath entries: {"doLayout": 10, "doLayout|assignRanks": 2, ...}
+- Timer.combineTimes results: {"children": {"doLayout": {"times": [...], "children": {...}}}}, one run per time
+- dagre's debug timing logs ("rank time: 11919ms", one line per call), nested according to DAGRE_TREE
+On this format, tree_times computes inclusive, exclusive (self) and "other" time per timer node and phases maps
+timer paths to phases declaratively, all with vectorized pandas operations.
+'''
+
+SEPARATOR = '|'
+
+# parent of every step of dagre's layout, the root "total" is the time of the whole layout call
+DAGRE_TREE = {
+    'layout': 'total',
+    'buildLayoutGraph': 'layout',
+    'runLayout': 'layout',
+    'updateInputGraph': 'layout',
+}
+DAGRE_ROOT = 'total'
+
+# phases as lists of timer paths; a path only counts the time not spent in mapped paths below it,
+# so e.g. the conflict resolution inside the ordering is not counted twice
+SUGIYAMA_ROOT = 'doLayout'
+SUGIYAMA_PHASES = {
+    'rank': ['doLayout|assignRanks'],
+    'order': ['doLayout|orderRanks'],
+    'coords': ['doLayout|assignCoordinates'],
+}
+SUGIYAMA_RESOLVE_PHASES = {
+    'rank': ['doLayout|assignRanks'],
+    'order': ['doLayout|orderRanks'],
+    'resolve': ['doLayout|orderRanks|doOrder|order|doOrder|resolve', 'doLayout|orderRanks|doOrder|insertNodes'],
+    'coords': ['doLayout|assignCoordinates'],
+}
+# the same phases for dagre, so that both layouters can be compared
+DAGRE_PHASES = {
+    'rank': ['total|layout|runLayout|rank', 'total|layout|runLayout|normalizeRanks', 'total|layout|runLayout|assignRankMinMax'],
+    'order': ['total|layout|runLayout|order'],
+    'coords': ['total|layout|runLayout|position', 'total|layout|runLayout|assignNodeIntersects'],
+}
+
+# entry fields of breakdowns and counts with the instrumentation overhead, see Timer.getOverhead
+OVERHEAD_COLUMNS = ['timerCalls', 'timerOverheadPerCall', 'timerOverhead']
+
+_DAGRE_LINE = re.compile(r'^\s*(.+?)(?: time)?:\s*([0-9.]+)\s*ms\s*$')
+
+
+def _parent(path):
+    return path.rsplit(SEPARATOR, 1)[0] if SEPARATOR in path else None
+
+
+def _is_path(key, entry):
+    # timer paths contain the separator, except for the roots which are recognized by their children
+    return SEPARATOR in key or any(other.startswith(key + SEPARATOR) for other in entry)
+
+
+def flatten_combined(summary):
+    '''
+    Converts a Timer.combineTimes result into one {path: time} dict per run.
+    '''
+    runs = []
+
+    def visit(slot, prefix):
+        for name, child in slot['children'].items():
+            path = name if prefix is None else prefix + SEPARATOR + name
+            for run, time in enumerate(child.get('times', [])):
+                while len(runs) <= run:
+                    runs.append({})
+                runs[run][path] = time
+            visit(child, path)
+
+    visit(summary, None)
+    return runs
+
+
+def parse_dagre_log(text):
+    '''
+    Parses the debug timing output of one dagre layout into a {path: time in ms} dict.
+    Steps called several times (e.g. once per nested graph) are summed up.
+    '''
+    times = {}
+    for line in text.splitlines():
+        match = _DAGRE_LINE.match(line)
+        if match is None:
+            continue
+        name = match.group(1).strip()
+        path = name
+        if name != DAGRE_ROOT:
+            parent = DAGRE_TREE.get(name, 'runLayout')
+            path = name
+            while parent is not None:
+                path = parent + SEPARATOR + path
+                parent = DAGRE_TREE.get(parent)
+        times[path] = times.get(path, 0) + float(match.group(2))
+    return times
+
+
+def to_long(entries, id_columns=('name', 'graph')):
+    '''
+    Long DataFrame (run, id columns, path, value) of a list of result entries.
+    Entries may be flat path dicts, path dicts with a combineTimes result in "children" (one run per time)
+    or dagre path dicts from parse_dagre_log; the run is the index of the flattened entry.
+    '''
+    runs = []
+    for entry in entries:
+        ids = {column: entry.get(column) for column in id_columns}
+        if 'children' in entry:
+            flat_runs = flatten_combined(entry)
+        else:
+            flat_runs = [{key: value for key, value in entry.items() if key not in id_columns}]
+        for flat in flat_runs:
+            runs.append((ids, flat))
+    rows = [(run, path, value) for run, (ids, flat) in enumerate(runs) for path, value in flat.items()
+            if isinstance(value, (int, float)) and _is_path(path, flat)]
+    df = pd.DataFrame(rows, columns=['run', 'path', 'value'])
+    id_df = pd.DataFrame([ids for ids, flat in runs], columns=list(id_columns))
+    return df.join(id_df, on='run')[['run', *id_columns, 'path', 'value']]
+
+
+def from_store(results, paths=None, graphs=None, names=None, id_columns=('name', 'graph')):
+    '''
+    Long DataFrame of the breakdowns in an experiments.bench.store.Store, the entry row being the run.
+    '''
+    df = results.breakdown(paths, graphs, names, columns=id_columns).rename(columns={'row': 'run'})
+    for column in ['path', *id_columns]:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+    return df[['run', *id_columns, 'path', 'value']]
+
+
+def load(source, paths=None, graphs=None, names=None, id_columns=('name', 'graph')):
+    '''
+    Long DataFrame of the breakdowns in a result file, read through its columnar store.
+    '''
+    return from_store(store.open_results(source), paths, graphs, names, id_columns)
+
+
+def load_dagre_logs(files, **ids):
+    '''
+    Long DataFrame of dagre timing logs, one run per file. The keyword arguments (e.g. name and graph)
+    are added as id columns.
+    '''
+    entries = []
+    for file in files:
+        with open(file) as f:
+            entries.append({**ids, **parse_dagre_log(f.read())})
+    return to_long(entries, id_columns=tuple(ids))
+
+
+def tree_times(df):
+    '''
+    Adds the columns parent, depth, inclusive (the measured time), children (sum of the measured children),
+    exclusive (inclusive - children, the self time) to a long DataFrame.
+    Nodes that were not measured themselves (only below them) get the sum of their children as inclusive time.
+    '''
+    df = df.copy()
+    paths = pd.Series(df['path'].unique())
+    # add missing ancestors, so that every path has its parent in the same run
+    ancestors = set()
+    for path in paths:
+        parent = _parent(path)
+        while parent is not None and parent not in ancestors:
+            ancestors.add(parent)
+            parent = _parent(parent)
+    missing = sorted(ancestors - set(paths))
+    parent_of = {path: _parent(path) for path in list(paths) + missing}
+    df['inclusive'] = df['value']
+    keys = [column for column in df.columns if column not in ('path', 'value', 'inclusive')]
+    if len(missing) > 0:
+        # unmeasured ancestors, deepest first so that their sums propagate upwards
+        for path in sorted(missing, key=lambda p: -p.count(SEPARATOR)):
+            children = df[df['path'].map(parent_of) == path]
+            if len(children) == 0:
+                continue
+            sums = children.groupby(keys, as_index=False, dropna=False)['inclusive'].sum()
+            sums['path'] = path
+            sums['value'] = np.nan
+            df = pd.concat([df, sums], ignore_index=True)
+    df['parent'] = df['path'].map(parent_of)
+    df['depth'] = df['path'].str.count(re.escape(SEPARATOR))
+    children = df[df['parent'].notna()].groupby([*keys, 'parent'], dropna=False, as_index=False)['inclusive'].sum()
+    children = children.rename(columns={'parent': 'path', 'inclusive': 'children'})
+    df = df.merge(children, on=[*keys, 'path'], how='left')
+    df['children'] = df['children'].fillna(0)
+    df['exclusive'] = df['inclusive'] - df['children']
+    return df
+
+
+def with_other(df):
+    '''
+    Adds an "<path>|other" row for every node with children, holding its exclusive time, so that the children
+    of every node add up to its inclusive time (e.g. for stacked plots).
+    '''
+    if 'exclusive' not in df.columns:
+        df = tree_times(df)
+    other = df[df['children'] > 0].copy()
+    other['parent'] = other['path']
+    other['path'] = other['path'] + SEPARATOR + 'other'
+    other['depth'] += 1
+    other['value'] = other['exclusive']
+    other['inclusive'] = other['exclusive']
+    other['children'] = 0.0
+    return pd.concat([df, other], ignore_index=True)
+
+
+def _phase_matrix(paths, mapping):
+    '''
+    Coefficients (paths x phases) such that the phase times are the inclusive path times times the matrix:
+    every mapped path counts +1 for its phase and -1 for the phase of its closest mapped ancestor.
+    '''
+    phase_of = {path: phase for phase, phase_paths in mapping.items() for path in phase_paths}
+    phases = list(mapping)
+    matrix = pd.DataFrame(0.0, index=paths, columns=phases)
+    for path in paths:
+        if path not in phase_of:
+            continue
+        matrix.loc[path, phase_of[path]] += 1
+        ancestor = _parent(path)
+        while ancestor is not None and ancestor not in phase_of:
+            ancestor = _parent(ancestor)
+        if ancestor is not None:
+            matrix.loc[path, phase_of[ancestor]] -= 1
+    return matrix
+
+
+def phases(df, mapping, root=None, id_columns=('name', 'graph')):
+    '''
+    Wide DataFrame with one row per run and one column per phase of the mapping ({phase: [paths]}).
+    With a root path, an "other" column holds the time of the root not covered by any phase.
+    '''
+    id_columns = [column for column in id_columns if column in df.columns]
+    times = df.pivot_table(index='run', columns='path', values='value', aggfunc='sum')
+    matrix = _phase_matrix(list(times.columns), mapping)
+    result = times.fillna(0).to_numpy() @ matrix.to_numpy()
+    result = pd.DataFrame(result, index=times.index, columns=matrix.columns)
+    if root is not None:
+        result['other'] = times[root] - result.sum(axis=1) if root in times.columns else np.nan
+    ids = df.drop_duplicates('run').set_index('run')[id_columns]
+    return ids.join(result, how='right').reset_index()
+
+
+def stacked(phase_df, phase_columns, id_columns=('name', 'graph')):
+    '''
+    Long DataFrame (run, id columns, phase, time) with the cumulative time up to and including every phase,
+    i.e. the heights of the bars of a stacked bar plot in the order of phase_columns.
+    '''
+    cumulative = phase_df[list(phase_columns)].cumsum(axis=1)
+    cumulative = pd.concat([phase_df[['run', *[c for c in id_columns if c in phase_df.columns]]], cumulative], axis=1)
+    return cumulative.melt(id_vars=[c for c in cumulative.columns if c not in phase_columns],
+                           value_vars=list(phase_columns), var_name='phase', value_name='time')
+
+
+def overhead(source, root=SUGIYAMA_ROOT, graphs=None, names=None, id_columns=('name', 'graph')):
+    '''
+    Timer overhead of every run of a breakdown result file: the number of timer calls, the calibrated cost per call
+    and their product (ms), and the share of the root time it accounts for.
+    '''
+    df = store.load(source, columns=[*id_columns, *OVERHEAD_COLUMNS], graphs=graphs, names=names, paths=[root])
+    df['overhead_share'] = df['timerOverhead'] / df[root]
+    return df
+
+
+def summarize(df, by, columns):
+    '''
+    Median, standard deviation, quartiles and number of runs of the given columns per group.
+    '''
+    grouped = df.groupby(by, observed=True)[list(columns)]
+    summary = pd.concat({
+        'median': grouped.median(),
+        'std': grouped.std(),
+        'q25': grouped.quantile(0.25),
+        'q75': grouped.quantile(0.75),
+        'count': grouped.count(),
+    }, axis=1)
+    return summary
@@ -0,0 +1,378 @@
+import argparse
+import functools
+import numpy as np
+import pandas as pd
+
+'''
+Offline layout quality analysis.
+The quality experiments with measure 'geometry' store the final layout of every run as flat arrays
+(see src/bench/layoutGeometry.ts). This module recomputes the metrics of LayoutAnalysis from them with NumPy,
+so metrics and cost weights can be changed and evaluated over many stored layouts without running a layouter:
+segmentCrossings, segmentCrossingsWithAngles, edgeLengths, bends, cost and the checks of validate().
+Candidate pairs of segments and boxes are found with a sort-based sweep along the axis with fewer overlaps.
+'''
+
+EPSILON = 1e-10
+
+_GEOMETRY_FIELDS = {
+    # name: (dtype, number of columns)
+    'nodes': (np.float64, 6),
+    'edgeOffsets': (np.int64, 1),
+    'points': (np.float64, 2),
+    'edgeParents': (np.int64, 1),
+    'edgeCycles': (np.int8, 1),
+    'scopes': (np.int64, 2),
+    'connectors': (np.float64, 3),
+}
+
+
+def _expand(begin, counts):
+    '''
+    For every i, enumerates begin[i], ..., begin[i] + counts[i] - 1; returns the repeated i and the enumerated values.
+    '''
+    counts = np.maximum(counts, 0)
+    owners = np.repeat(np.arange(len(counts)), counts)
+    firsts = np.cumsum(counts) - counts
+    return owners, np.repeat(begin, counts) + np.arange(counts.sum()) - np.repeat(firsts, counts)
+
+
+def _overlapping_pairs(lo, hi):
+    '''
+    Returns all pairs (i, j), i != j, of intervals [lo, hi] that overlap (including touching ends), each pair once.
+    '''
+    order = np.argsort(lo, kind='stable')
+    sorted_lo = lo[order]
+    begin = np.arange(1, len(lo) + 1)
+    counts = np.searchsorted(sorted_lo, hi[order], side='right') - begin
+    i, j = _expand(begin, counts)
+    return order[i], order[j]
+
+
+def _num_overlapping_pairs(lo, hi):
+    sorted_lo = np.sort(lo)
+    return int(np.maximum(np.searchsorted(sorted_lo, hi, side='right') - np.searchsorted(sorted_lo, lo, side='left') - 1, 0).sum())
+
+
+def _crossing_pairs(lo_a, hi_a, lo_b, hi_b):
+    '''
+    Returns all pairs (a, b) of intervals of the first and second set that overlap (including touching ends).
+    '''
+    order_b = np.argsort(lo_b, kind='stable')
+    sorted_lo_b = lo_b[order_b]
+    # intervals b starting within a
+    begin = np.searchsorted(sorted_lo_b, lo_a, side='left')
+    a_first, b_first = _expand(begin, np.searchsorted(sorted_lo_b, hi_a, side='right') - begin)
+    # intervals a starting within b, but after its start
+    order_a = np.argsort(lo_a, kind='stable')
+    sorted_lo_a = lo_a[order_a]
+    begin = np.searchsorted(sorted_lo_a, lo_b, side='right')
+    b_second, a_second = _expand(begin, np.searchsorted(sorted_lo_a, hi_b, side='right') - begin)
+    return (np.concatenate([a_first, order_a[a_second]]).astype(np.int64),
+            np.concatenate([order_b[b_first], b_second]).astype(np.int64))
+
+
+def _boxes_intersect(a, b):
+    '''
+    Box.intersects for arrays of boxes (x, y, width, height): boxes touching at their border do not intersect.
+    '''
+    return ((a[:, 0] + EPSILON < b[:, 0] + b[:, 2]) & (a[:, 0] + a[:, 2] > b[:, 0] + EPSILON)
+            & (a[:, 1] + EPSILON < b[:, 1] + b[:, 3]) & (a[:, 1] + a[:, 3] > b[:, 1] + EPSILON))
+
+
+def _boxes_contained(a, b):
+    '''
+    Box.containedIn for arrays of boxes.
+    '''
+    return ((a[:, 0] + EPSILON >= b[:, 0]) & (a[:, 1] + EPSILON >= b[:, 1])
+            & (a[:, 0] + a[:, 2] <= b[:, 0] + b[:, 2] + EPSILON) & (a[:, 1] + a[:, 3] <= b[:, 1] + b[:, 3] + EPSILON))
+
+
+def _segment_boxes(segments):
+    lower = np.minimum(segments[:, :2], segments[:, 2:])
+    upper = np.maximum(segments[:, :2], segments[:, 2:])
+    return np.hstack([lower, upper - lower])
+
+
+def _orientation(segments, points):
+    '''
+    Segment.orientation for arrays of segments (start x, start y, end x, end y) and points.
+    '''
+    return np.sign((segments[:, 3] - segments[:, 1]) * (points[:, 0] - segments[:, 2])
+                   - (segments[:, 2] - segments[:, 0]) * (points[:, 1] - segments[:, 3]))
+
+
+class Layout:
+    '''
+    Geometry of one layout with the metrics of LayoutAnalysis (in snake_case).
+    '''
+
+    def __init__(self, geometry):
+        arrays = {}
+        for name, (dtype, columns) in _GEOMETRY_FIELDS.items():
+            array = np.asarray(geometry[name], dtype=dtype)
+            arrays[name] = array if columns == 1 else array.reshape(-1, columns)
+        self.boxes = arrays['nodes'][:, :4]
+        self.ranks = arrays['nodes'][:, 4].astype(np.int64)
+        self.parents = arrays['nodes'][:, 5].astype(np.int64)
+        self.edge_offsets = arrays['edgeOffsets']
+        self.points = arrays['points']
+        self.edge_parents = arrays['edgeParents']
+        self.edge_cycles = arrays['edgeCycles'].astype(bool)
+        self.scopes = arrays['scopes']
+        self.connectors = arrays['connectors']
+
+    def num_nodes(self):
+        return len(self.boxes)
+
+    def num_edges(self):
+        return len(self.edge_parents)
+
+    @functools.cached_property
+    def _ancestors(self):
+        '''
+        Matrix with the parent, grandparent, ... of every node in its columns, padded with -1.
+        '''
+        levels = [self.parents]
+        while len(levels[-1]) > 0 and np.any(levels[-1] >= 0):
+            previous = levels[-1]
+            levels.append(np.where(previous >= 0, self.parents[np.maximum(previous, 0)], -1))
+        return np.stack(levels[:-1], axis=1) if len(levels) > 1 else np.full((len(self.parents), 0), -1)
+
+    @functools.cached_property
+    def _edge_ancestors(self):
+        '''
+        Matrix with all nodes containing an edge (LayoutEdge.parents) in its columns, padded with -1.
+        '''
+        ancestors = self._ancestors[np.maximum(self.edge_parents, 0)]
+        ancestors[self.edge_parents < 0] = -1
+        return np.hstack([self.edge_parents[:, np.newaxis], ancestors])
+
+    @functools.cached_property
+    def _segments(self):
+        '''
+        Segments of all edges as in LayoutEdge.segments, i.e. consecutive collinear pieces merged,
+        and the index of the edge of every segment.
+        '''
+        num_points = np.diff(self.edge_offsets)
+        edge_of_point = np.repeat(np.arange(len(num_points)), num_points)
+        deltas = np.diff(self.points, axis=0)
+        keep = np.ones(len(self.points), dtype=bool)
+        if len(deltas) > 1:
+            cross = deltas[:-1, 0] * deltas[1:, 1] - deltas[1:, 0] * deltas[:-1, 1]
+            keep[1:-1] = np.abs(cross) >= EPSILON
+        # first and last point of every edge are always kept
+        non_empty = num_points > 0
+        keep[self.edge_offsets[:-1][non_empty]] = True
+        keep[self.edge_offsets[1:][non_empty] - 1] = True
+        kept = np.flatnonzero(keep)
+        same_edge = edge_of_point[kept[:-1]] == edge_of_point[kept[1:]]
+        starts = kept[:-1][same_edge]
+        ends = kept[1:][same_edge]
+        return np.hstack([self.points[starts], self.points[ends]]), edge_of_point[starts]
+
+    @functools.cached_property
+    def _crossings(self):
+        '''
+        Pairs of crossing segments among the unique segments, as in LayoutAnalysis._getAllCrossingSegments.
+        '''
+        segments = np.unique(self._segments[0], axis=0)
+        boxes = _segment_boxes(segments)
+        # sweep along the axis with fewer pairs of overlapping intervals
+        x_pairs = _num_overlapping_pairs(boxes[:, 0], boxes[:, 0] + boxes[:, 2])
+        y_pairs = _num_overlapping_pairs(boxes[:, 1], boxes[:, 1] + boxes[:, 3])
+        axis = 0 if x_pairs <= y_pairs else 1
+        i, j = _overlapping_pairs(boxes[:, axis], boxes[:, axis] + boxes[:, axis + 2])
+        a = segments[i]
+        b = segments[j]
+        crossing = ~(np.all(a[:, :2] == b[:, :2], axis=1) | np.all(a[:, 2:] == b[:, 2:], axis=1))
+        crossing &= _boxes_intersect(boxes[i], boxes[j])
+        crossing &= _orientation(a, b[:, :2]) != _orientation(a, b[:, 2:])
+        crossing &= _orientation(b, a[:, :2]) != _orientation(b, a[:, 2:])
+        return a[crossing], b[crossing]
+
+    def segment_crossings(self):
+        return len(self._crossings[0])
+
+    def segment_crossings_with_angles(self):
+        '''
+        Every crossing costs 1 + cos(angle)^2, which equals 1 + (cos(2 * angle) + 1) / 2 of LayoutAnalysis.
+        '''
+        a, b = self._crossings
+        u = a[:, 2:] - a[:, :2]
+        v = b[:, 2:] - b[:, :2]
+        dot = np.sum(u * v, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            angle_cost = dot * dot / (np.sum(u * u, axis=1) * np.sum(v * v, axis=1))
+        return float(np.sum(1 + angle_cost))
+
+    def edge_lengths(self, target_edge_length=50):
+        segments, edges = self._segments
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        factors = np.bincount(edges, weights=lengths, minlength=self.num_edges()) / target_edge_length
+        with np.errstate(divide='ignore'):
+            return float(np.sum(np.maximum(factors, 1 / factors)))
+
+    def bends(self):
+        return len(self._segments[1]) - self.num_edges()
+
+    def cost(self, weight_bends=0.2, weight_crossings=1, weight_lengths=0.1, target_edge_length=50):
+        return (weight_crossings * self.segment_crossings_with_angles()
+                + weight_bends * self.bends()
+                + weight_lengths * self.edge_lengths(target_edge_length))
+
+    def check_upward_flow(self):
+        first = self.points[self.edge_offsets[:-1], 1]
+        last = self.points[self.edge_offsets[1:] - 1, 1]
+        return not np.any(~self.edge_cycles & (first > last))
+
+    def check_node_overlaps(self):
+        boxes = self.boxes
+        i, j = _overlapping_pairs(boxes[:, 0], boxes[:, 0] + boxes[:, 2])
+        overlap = _boxes_intersect(boxes[i], boxes[j])
+        i, j = i[overlap], j[overlap]
+        related = (np.any(self._ancestors[i] == j[:, np.newaxis], axis=1)
+                   | np.any(self._ancestors[j] == i[:, np.newaxis], axis=1))
+        return not np.any(~related)
+
+    def check_edge_overlaps(self):
+        segments, edges = self._segments
+        segment_boxes = _segment_boxes(segments)
+        s, n = _crossing_pairs(segment_boxes[:, 0], segment_boxes[:, 0] + segment_boxes[:, 2],
+                               self.boxes[:, 0], self.boxes[:, 0] + self.boxes[:, 2])
+        keep = _boxes_intersect(segment_boxes[s], self.boxes[n])
+        s, n = s[keep], n[keep]
+        # Segment.intersectsBox: the segment intersects the box unless all corners lie on the same side
+        boxes = self.boxes[n]
+        corners = [boxes[:, :2], boxes[:, :2] + boxes[:, 2:] * [1, 0], boxes[:, :2] + boxes[:, 2:], boxes[:, :2] + boxes[:, 2:] * [0, 1]]
+        sides = np.stack([_orientation(segments[s], corner) for corner in corners], axis=1)
+        intersects = ~np.all(sides == sides[:, :1], axis=1)
+        s, n = s[intersects], n[intersects]
+        is_parent = np.any(self._edge_ancestors[edges[s]] == n[:, np.newaxis], axis=1)
+        return not np.any(~is_parent)
+
+    def check_node_containment(self):
+        for ancestors in self._ancestors.T:
+            inner = ancestors >= 0
+            if not np.all(_boxes_contained(self.boxes[inner], self.boxes[ancestors[inner]])):
+                return False
+        return True
+
+    def check_edge_containment(self):
+        num_points = np.diff(self.edge_offsets)
+        starts = self.edge_offsets[:-1][num_points > 0]
+        lower = np.minimum.reduceat(self.points, starts, axis=0) if len(starts) > 0 else np.zeros((0, 2))
+        upper = np.maximum.reduceat(self.points, starts, axis=0) if len(starts) > 0 else np.zeros((0, 2))
+        edge_boxes = np.hstack([lower, upper - lower])
+        for ancestors in self._edge_ancestors[num_points > 0].T:
+            inner = ancestors >= 0
+            if not np.all(_boxes_contained(edge_boxes[inner], self.boxes[ancestors[inner]])):
+                return False
+        return True
+
+    def check_map_alignment(self):
+        entries = self.boxes[self.scopes[:, 0]]
+        exits = self.boxes[self.scopes[:, 1]]
+        return bool(np.all((entries[:, 0] == exits[:, 0]) & (entries[:, 2] == exits[:, 2])))
+
+    def check_connector_alignment(self):
+        return bool(np.all(self.connectors[:, 1] == self.connectors[:, 2]))
+
+    def validate(self):
+        return (
+            self.check_upward_flow() and
+            self.check_node_overlaps() and
+            self.check_edge_overlaps() and
+            self.check_node_containment() and
+            self.check_edge_containment() and
+            self.check_map_alignment() and
+            self.check_connector_alignment()
+        )
+
+
+def save(path, entries):
+    '''
+    Packs the result entries of a 'geometry' experiment into one compressed .npz file:
+    per field the concatenated arrays of all layouts plus the offsets of every layout, and name and graph per layout.
+    '''
+    entries = [entry for entry in entries if entry.get('geometry') is not None]
+    arrays = {
+        'name': np.array([entry.get('name', '???') for entry in entries], dtype=str),
+        'graph': np.array([entry.get('graph', '') for entry in entries], dtype=str),
+    }
+    for name, (dtype, columns) in _GEOMETRY_FIELDS.items():
+        parts = [np.asarray(entry['geometry'][name], dtype=dtype) for entry in entries]
+        arrays[name] = np.concatenate(parts) if len(parts) > 0 else np.zeros(0, dtype=dtype)
+        arrays[name + '_offsets'] = np.concatenate([[0], np.cumsum([len(part) for part in parts])]).astype(np.int64)
+    np.savez_compressed(path, **arrays)
+
+
+def load(path):
+    '''
+    Loads the layouts of a file written by save as a list of dicts with name, graph and layout.
+    '''
+    with np.load(path) as file:
+        arrays = {name: file[name] for name in file.files}
+    layouts = []
+    for i in range(len(arrays['name'])):
+        geometry = {}
+        for name in _GEOMETRY_FIELDS:
+            offsets = arrays[name + '_offsets']
+            geometry[name] = arrays[name][offsets[i]:offsets[i + 1]]
+        layouts.append({'name': str(arrays['name'][i]), 'graph': str(arrays['graph'][i]), 'layout': Layout(geometry)})
+    return layouts
+
+
+def evaluate(layouts, target_edge_length=50, validate=False):
+    '''
+    Returns a DataFrame with the unweighted cost components (and the validation result) of every layout,
+    from the dicts returned by load or result entries with geometry.
+    Costs for other weights can then be computed with cost without touching the geometry again.
+    '''
+    rows = []
+    for item in layouts:
+        layout = item['layout'] if 'layout' in item else Layout(item['geometry'])
+        row = {
+            'name': item.get('name', '???'),
+            'graph': item.get('graph'),
+            'nodes': layout.num_nodes(),
+            'edges': layout.num_edges(),
+            'crossings': layout.segment_crossings(),
+            'crossings_with_angles': layout.segment_crossings_with_angles(),
+            'bends': layout.bends(),
+            'lengths': layout.edge_lengths(target_edge_length),
+        }
+        if validate:
+            row['valid'] = layout.validate()
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def cost(df, weight_bends=0.2, weight_crossings=1, weight_lengths=0.1):
+    '''
+    Weighted cost of every row of a DataFrame returned by evaluate, like LayoutAnalysis.cost.
+    '''
+    return weight_crossings * df['crossings_with_angles'] + weight_bends * df['bends'] + weight_lengths * df['lengths']
+
+
+if __name__ == '__main__':
+    from experiments.bench.server import read
+
+    parser = argparse.ArgumentParser(description='Pack and evaluate stored layout geometries.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    pack_parser = subparsers.add_parser('pack', help='pack the geometries of a result file into an .npz file')
+    pack_parser.add_argument('results')
+    pack_parser.add_argument('output')
+    evaluate_parser = subparsers.add_parser('evaluate', help='print the summed cost per layouter setup')
+    evaluate_parser.add_argument('layouts', help='.npz file written by pack')
+    evaluate_parser.add_argument('--weight-bends', type=float, default=0.2)
+    evaluate_parser.add_argument('--weight-crossings', type=float, default=1)
+    evaluate_parser.add_argument('--weight-lengths', type=float, default=0.1)
+    evaluate_parser.add_argument('--target-edge-length', type=float, default=50)
+    evaluate_parser.add_argument('--validate', action='store_true')
+    args = parser.parse_args()
+    if args.command == 'pack':
+        save(args.output, read(args.results))
+    else:
+        df = evaluate(load(args.layouts), args.target_edge_length, args.validate)
+        df['cost'] = cost(df, args.weight_bends, args.weight_crossings, args.weight_lengths)
+        print(df.groupby('name').sum(numeric_only=True))
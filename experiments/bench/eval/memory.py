@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from experiments.bench import store
+from experiments.bench.eval import breakdown
+
+'''
+Analysis of the memory mode of the Timer (experiments.bench.performance.memory).
+The entries have the shape of timer breakdowns, with heap sizes in bytes instead of times, so they are loaded in the
+long format of experiments.bench.eval.breakdown. Unlike times, peaks of nested paths do not add up: the peak of a
+phase is the highest peak of its paths, and the peak of a parent already includes the peaks of its children.
+'''
+
+MB = 2 ** 20
+
+# entry fields next to the paths, see Bench.memorySized
+HEAP_COLUMNS = ['heapBase', 'heapPeak', 'uaMemory', 'layoutNodes']
+
+
+def load(source, paths=None, graphs=None, names=None, id_columns=('name', 'graph'), unit=MB):
+    '''
+    Long DataFrame (run, id columns, path, value) of a memory result file, the values in MB (or the given unit).
+    '''
+    df = breakdown.load(source, paths, graphs, names, id_columns)
+    df['value'] = df['value'] / unit
+    return df
+
+
+def load_heap(source, graphs=None, names=None, id_columns=('name', 'graph'), unit=MB):
+    '''
+    One row per run with the heap before the layout, the highest sampled heap and, if measured, the memory of the
+    page (uaMemory) in MB, and the number of nodes of the layout graph.
+    '''
+    columns = list(id_columns) + HEAP_COLUMNS
+    df = store.load(source, columns=columns, graphs=graphs, names=names)
+    df = df[[column for column in columns if column in df.columns]].rename_axis('run').reset_index()
+    for column in ['heapBase', 'heapPeak', 'uaMemory']:
+        if column in df.columns:
+            df[column] = df[column] / unit
+    if 'heapPeak' in df.columns:
+        df['heapGrowth'] = df['heapPeak'] - df['heapBase']
+    return df
+
+
+def phase_peaks(df, mapping, root=None, id_columns=('name', 'graph')):
+    '''
+    Wide DataFrame with one row per run and one column per phase of the mapping ({phase: [paths]}) holding the
+    highest peak of its paths. With a root path, a "total" column holds the peak of the root.
+    '''
+    id_columns = [column for column in id_columns if column in df.columns]
+    peaks = df.pivot_table(index='run', columns='path', values='value', aggfunc='max')
+    result = pd.DataFrame(index=peaks.index)
+    for phase, paths in mapping.items():
+        present = [path for path in paths if path in peaks.columns]
+        result[phase] = peaks[present].max(axis=1) if len(present) > 0 else np.nan
+    if root is not None:
+        result['total'] = peaks[root] if root in peaks.columns else np.nan
+    ids = df.drop_duplicates('run').set_index('run')[id_columns]
+    return ids.join(result, how='right').reset_index()
+
+
+def largest_paths(df, by=('name',), n=10):
+    '''
+    The n paths with the highest median peak per group, e.g. to find the parts that allocate the most.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    medians = df.groupby(by + ['path'], observed=True)['value'].median().rename('median').reset_index()
+    return medians.sort_values('median', ascending=False).groupby(by, observed=True).head(n)
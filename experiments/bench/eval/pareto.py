@@ -1,26 +1,146 @@
+import bisect
 import numpy as np
+import pandas as pd
 
 '''
-Helps calculate the pareto frontier.
+Helps calculate pareto frontiers.
+All objectives are minimized (pass `maximize` to flip some of them). A point dominates another one if it is at least
+as good in every objective and better in at least one, so identical points never dominate each other and share their
+rank. Points with a NaN objective (e.g. failed runs) are not part of any frontier.
 '''
 
+# maximum number of points compared against all others at once in the k-dimensional sort
+_CHUNK_SIZE = 1024
 
-# adapted from Peter: https://stackoverflow.com/a/40239615
-def _is_pareto_efficient(costs):
-    is_efficient = np.ones(costs.shape[0], dtype=bool)
-    for i, c in enumerate(costs):
-        if is_efficient[i]:
-            is_efficient[is_efficient] = np.any(costs[is_efficient] < c, axis=1)
-            is_efficient[i] = True
-    return is_efficient
+
+def _as_costs(costs, maximize=()):
+    costs = np.array(costs, dtype=float)
+    if costs.ndim == 1:
+        costs = costs[:, np.newaxis]
+    for column in maximize:
+        costs[:, column] = -costs[:, column]
+    return costs
+
+
+def is_efficient(costs, maximize=()):
+    '''
+    Returns a boolean mask of the non-dominated points of an (n, k) array.
+    For two objectives this is a single sort, O(n log n).
+    '''
+    costs = _as_costs(costs, maximize)
+    if costs.shape[1] != 2:
+        return ranks(costs) == 0
+    valid = ~np.any(np.isnan(costs), axis=1)
+    efficient = np.zeros(len(costs), dtype=bool)
+    indices = np.flatnonzero(valid)
+    if len(indices) == 0:
+        return efficient
+    x, y = costs[indices, 0], costs[indices, 1]
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+    # the first point of every group of equal x has the smallest y of the group
+    group_start = np.concatenate([[True], x[1:] != x[:-1]])
+    group = np.cumsum(group_start) - 1
+    group_min = y[group_start]
+    # smallest y among all points with a strictly smaller x
+    before = np.concatenate([[np.inf], np.minimum.accumulate(group_min)[:-1]])
+    efficient[indices[order]] = (y == group_min[group]) & (y < before[group])
+    return efficient
+
+
+def _ranks_2d(costs):
+    # identical points get the same rank, so only distinct points are ranked
+    unique, inverse = np.unique(costs, axis=0, return_inverse=True)
+    # np.unique sorts lexicographically: every point can only be dominated by points before it, and a front
+    # dominates a point iff the smallest y of the front is at most the y of the point
+    front_min_y = []
+    unique_ranks = np.empty(len(unique), dtype=np.int64)
+    for i, y in enumerate(unique[:, 1]):
+        rank = bisect.bisect_right(front_min_y, y)
+        if rank == len(front_min_y):
+            front_min_y.append(y)
+        else:
+            front_min_y[rank] = y
+        unique_ranks[i] = rank
+    return unique_ranks[inverse.reshape(-1)]
+
+
+def _dominated(candidates, others):
+    '''
+    Returns for every candidate whether any of the other points dominates it.
+    '''
+    dominated = np.zeros(len(candidates), dtype=bool)
+    for start in range(0, len(others), _CHUNK_SIZE):
+        chunk = others[start:start + _CHUNK_SIZE]
+        at_most = np.all(chunk[np.newaxis, :, :] <= candidates[:, np.newaxis, :], axis=2)
+        less = np.any(chunk[np.newaxis, :, :] < candidates[:, np.newaxis, :], axis=2)
+        dominated |= np.any(at_most & less, axis=1)
+    return dominated
+
+
+def _ranks_kd(costs):
+    unique, inverse = np.unique(costs, axis=0, return_inverse=True)
+    unique_ranks = np.full(len(unique), -1, dtype=np.int64)
+    remaining = np.arange(len(unique))
+    rank = 0
+    while len(remaining) > 0:
+        front = np.zeros(len(remaining), dtype=bool)
+        for start in range(0, len(remaining), _CHUNK_SIZE):
+            candidates = unique[remaining[start:start + _CHUNK_SIZE]]
+            # in lexicographic order, only points before a candidate can dominate it, and a dominated candidate
+            # is also dominated by a point of the front, so comparing with the front found so far and the chunk suffices
+            others = np.concatenate([unique[remaining[:start][front[:start]]], candidates])
+            front[start:start + _CHUNK_SIZE] = ~_dominated(candidates, others)
+        unique_ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+    return unique_ranks[inverse.reshape(-1)]
+
+
+def ranks(costs, maximize=()):
+    '''
+    Non-dominated sort of an (n, k) array: returns the frontier rank of every point (0 for the pareto frontier,
+    1 for the frontier of the remaining points, ...) as float array, NaN for points with a NaN objective.
+    '''
+    costs = _as_costs(costs, maximize)
+    result = np.full(len(costs), np.nan)
+    valid = ~np.any(np.isnan(costs), axis=1)
+    if not np.any(valid):
+        return result
+    result[valid] = _ranks_2d(costs[valid]) if costs.shape[1] == 2 else _ranks_kd(costs[valid])
+    return result
+
+
+def frontier_ranks(df, objectives, maximize=(), by=None):
+    '''
+    Frontier rank of every row of a DataFrame for the given objective columns, computed per group if `by` is given.
+    '''
+    maximize = [objectives.index(column) for column in maximize]
+    if by is None:
+        return pd.Series(ranks(df[objectives].to_numpy(), maximize), index=df.index)
+    return df.groupby(by, group_keys=False)[objectives].apply(
+        lambda group: pd.Series(ranks(group.to_numpy(), maximize), index=group.index)).reindex(df.index)
+
+
+def layers(df, x, y, maximize=(), by=None, max_rank=None):
+    '''
+    Points of the frontier layers of two objectives for plotting: the rows of df with a column "rank" added,
+    sorted by group, rank and x. Connecting the points of every (group, rank) draws its frontier.
+    '''
+    df = df.assign(rank=frontier_ranks(df, [x, y], maximize, by))
+    df = df[df['rank'].notna()]
+    if max_rank is not None:
+        df = df[df['rank'] <= max_rank]
+    keys = ([] if by is None else ([by] if isinstance(by, str) else list(by))) + ['rank', x, y]
+    return df.sort_values(keys)
 
 
 def lines(cost_dict, time_dict):
-    mask = _is_pareto_efficient(np.transpose(np.vstack((list(cost_dict.values()), list(time_dict.values())))))
-    efficient_names = np.array(list(cost_dict.keys()))[mask]
-    points = list(map(lambda name: (cost_dict[name], time_dict[name]), efficient_names))
-    points.sort(key=(lambda point: point[0] / point[1]))
-    lines = []
-    for i in range(len(points) - 1):
-        lines.append((points[i], points[i + 1]))
-    return lines
\ No newline at end of file
+    '''
+    Segments of the pareto frontier of named (cost, time) points, ordered by cost.
+    '''
+    names = list(cost_dict.keys())
+    frontier = layers(pd.DataFrame({'cost': [cost_dict[name] for name in names],
+                                    'time': [time_dict[name] for name in names]}), 'cost', 'time', max_rank=0)
+    points = list(zip(frontier['cost'], frontier['time']))
+    return [(points[i], points[i + 1]) for i in range(len(points) - 1)]
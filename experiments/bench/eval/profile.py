@@ -0,0 +1,213 @@
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+from experiments.bench import profile_path
+from experiments.bench import store
+
+'''
+Aggregation of the sampling CPU profiles of experiments.bench.performance.profile.
+Every profile (DevTools .cpuprofile: a call tree of nodes with call frames, the sampled node ids and the time deltas
+between the samples) is reduced to the time per distinct call stack. Stacks of all runs are kept in one long
+DataFrame (run, id columns, stack, time in µs), the stack being the frames from the outermost call joined by ';',
+so that they can be merged across runs and graphs, written as folded stacks (flamegraph.pl, speedscope) or as
+speedscope file, and broken down into the self and total time of every function.
+'''
+
+STACK_SEPARATOR = ';'
+
+# frames of the profiler itself, not part of any stack
+_SKIPPED_FRAMES = {'(root)'}
+
+
+def _frame_name(call_frame):
+    name = call_frame['functionName'] or '(anonymous)'
+    url = call_frame.get('url', '')
+    if url == '':
+        return name
+    return '%s (%s:%d)' % (name, url.rsplit('/', 1)[-1], call_frame['lineNumber'] + 1)
+
+
+def stacks(profile):
+    '''
+    Time in µs per call stack of a profile, as dict {stack: time}.
+    A sample accounts for the time until the next sample, the last one for the mean time between samples.
+    '''
+    nodes = profile['nodes']
+    index = {node['id']: i for i, node in enumerate(nodes)}
+    samples = np.array([index[sample] for sample in profile.get('samples', [])], dtype=np.int64)
+    if len(samples) == 0:
+        return {}
+    deltas = np.asarray(profile['timeDeltas'], dtype=float)
+    durations = np.append(deltas[1:], deltas[1:].mean() if len(deltas) > 1 else 0.0)
+    self_times = np.bincount(samples, weights=durations, minlength=len(nodes))
+    # stacks of all nodes in one pass from the roots, children always have a node as parent
+    names = [None] * len(nodes)
+    children = set(child for node in nodes for child in node.get('children', []))
+    todo = [(i, ()) for i, node in enumerate(nodes) if node['id'] not in children]
+    while len(todo) > 0:
+        i, parent_stack = todo.pop()
+        name = _frame_name(nodes[i]['callFrame'])
+        stack = parent_stack if name in _SKIPPED_FRAMES else parent_stack + (name,)
+        names[i] = stack
+        todo.extend((index[child], stack) for child in nodes[i].get('children', []))
+    result = {}
+    for i in np.flatnonzero(self_times):
+        key = STACK_SEPARATOR.join(names[i])
+        result[key] = result.get(key, 0.0) + float(self_times[i])
+    return result
+
+
+def read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def load(source, profile_dir=None, graphs=None, names=None, id_columns=('name', 'graph')):
+    '''
+    Long DataFrame (run, id columns, stack, time) of the profiles of all entries of a result file that have one,
+    read from profile_dir (profile_path(source) if None). Runs whose profile file is missing are left out.
+    '''
+    if profile_dir is None:
+        profile_dir = profile_path(source)
+    entries = store.load(source, columns=[*id_columns, 'profile'], graphs=graphs, names=names)
+    frames = []
+    for run, entry in entries.iterrows():
+        if not isinstance(entry.get('profile'), str):
+            continue
+        path = os.path.join(profile_dir, entry['profile'] + '.cpuprofile')
+        if not os.path.exists(path):
+            continue
+        times = stacks(read(path))
+        frame = pd.DataFrame({'stack': list(times.keys()), 'time': list(times.values())})
+        frame.insert(0, 'run', run)
+        for i, column in enumerate(id_columns):
+            frame.insert(1 + i, column, entry[column])
+        frames.append(frame)
+    if len(frames) == 0:
+        return pd.DataFrame(columns=['run', *id_columns, 'stack', 'time'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def functions(stack_df, id_columns=('name', 'graph')):
+    '''
+    Self time (time of the stacks ending in the function) and total time (time of the stacks containing it,
+    recursive calls counted once) of every function per run.
+    '''
+    id_columns = [column for column in id_columns if column in stack_df.columns]
+    frames = stack_df['stack'].str.split(STACK_SEPARATOR)
+    leaves = frames.str[-1]
+    exploded = stack_df[['run', 'time']].assign(function=frames.map(lambda f: list(dict.fromkeys(f)))).explode('function')
+    total = exploded.groupby(['run', 'function'])['time'].sum().rename('total')
+    self_time = stack_df.assign(function=leaves).groupby(['run', 'function'])['time'].sum().rename('self')
+    result = pd.concat([self_time, total], axis=1).fillna({'self': 0.0}).reset_index()
+    ids = stack_df.drop_duplicates('run').set_index('run')[id_columns]
+    return result.join(ids, on='run')[['run', *id_columns, 'function', 'self', 'total']]
+
+
+def _per_run(df, columns, sizes, size, by, on):
+    # mean of the columns per run and group, divided by the graph size of every run if sizes is given
+    runs = df.drop_duplicates('run')
+    num_runs = runs.groupby(by, observed=True)['run'].count().rename('runs')
+    if sizes is not None:
+        df = df.join(runs.join(sizes[[size]], on=on).set_index('run')[size], on='run')
+        df[columns] = df[columns].div(df[size], axis=0)
+    keys = [column for column in df.columns if column not in by + columns + ['run', on, size]]
+    df = df.groupby(by + keys, observed=True)[columns].sum().reset_index().join(num_runs, on=by)
+    df[columns] = df[columns].div(df['runs'], axis=0)
+    return df.drop(columns='runs')
+
+
+def hot_functions(function_df, sizes=None, size='nodes', by=('name',), on='graph', n=20):
+    '''
+    The n functions with the most self time per group of `by`. self and total are the mean time per run in µs and
+    share the fraction of the profiled time of the group. With sizes (indexed by graph, e.g. a catalog DataFrame),
+    self_per_node and total_per_node are the mean time per run divided by the graph size (column `size`).
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    function_df = function_df[list(dict.fromkeys(['run', *by, on, 'function', 'self', 'total']))]
+    df = _per_run(function_df, ['self', 'total'], None, size, by, on)
+    df['share'] = df['self'] / df.groupby(by, observed=True)['self'].transform('sum')
+    if sizes is not None:
+        suffix = '_per_' + size.rstrip('s')
+        normalized = _per_run(function_df, ['self', 'total'], sizes, size, by, on)
+        df = df.merge(normalized.rename(columns={'self': 'self' + suffix, 'total': 'total' + suffix}),
+                      on=by + ['function'])
+    df = df.sort_values('self', ascending=False)
+    return df.groupby(by, observed=True).head(n).reset_index(drop=True)
+
+
+def merge(stack_df, sizes=None, size='nodes', by=('name',), on='graph'):
+    '''
+    Mean time per run of every stack per group of `by`, divided by the graph size of every run if sizes is given.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    return _per_run(stack_df[list(dict.fromkeys(['run', *by, on, 'stack', 'time']))], ['time'], sizes, size, by, on)
+
+
+def write_folded(merged_df, path, scale=1.0):
+    '''
+    Writes the stacks of merge() as folded stacks ("a;b;c 123" per line) for flamegraph.pl or speedscope.
+    The weights are integers, so normalized times (µs per node) should be scaled, e.g. by 1000 for ns per node.
+    '''
+    weights = (merged_df.groupby('stack')['time'].sum() * scale).round().astype(np.int64)
+    with open(path, 'w') as file:
+        for stack, weight in weights[weights > 0].items():
+            file.write(stack + ' ' + str(weight) + '\n')
+
+
+def write_speedscope(merged_df, path, by=('name',), unit='microseconds', scale=1.0, name='layout'):
+    '''
+    Writes the stacks of merge() as speedscope file with one sampled profile per group of `by`,
+    the times multiplied by scale in the given unit.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    frame_index = {}
+    profiles = []
+    for group, df in merged_df.groupby(by, observed=True):
+        samples = []
+        for stack in df['stack']:
+            samples.append([frame_index.setdefault(frame, len(frame_index)) for frame in stack.split(STACK_SEPARATOR)])
+        weights = (df['time'] * scale).tolist()
+        profiles.append({
+            'type': 'sampled',
+            'name': ' '.join(str(value) for value in (group if isinstance(group, tuple) else (group,))),
+            'unit': unit,
+            'startValue': 0,
+            'endValue': float(sum(weights)),
+            'samples': samples,
+            'weights': weights,
+        })
+    with open(path, 'w') as file:
+        json.dump({
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': [{'name': frame} for frame in frame_index]},
+            'profiles': profiles,
+            'name': name,
+            'exporter': 'experiments.bench.eval.profile',
+        }, file)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Merge the CPU profiles of a result file.')
+    parser.add_argument('results', help='result file of experiments.bench.performance.profile')
+    parser.add_argument('--folded', help='write folded stacks to this file')
+    parser.add_argument('--speedscope', help='write a speedscope file with one profile per layouter')
+    parser.add_argument('--per-node', action='store_true', help='divide the times by the number of nodes (catalog)')
+    parser.add_argument('--top', type=int, default=20, help='number of functions to print per layouter')
+    args = parser.parse_args()
+    sizes = None
+    if args.per_node:
+        from experiments.bench import catalog
+        sizes = catalog.load()
+    stack_df = load(args.results)
+    pd.set_option('display.width', None)
+    pd.set_option('display.max_colwidth', 80)
+    print(hot_functions(functions(stack_df), sizes, n=args.top).to_string())
+    merged = merge(stack_df, sizes)
+    if args.folded is not None:
+        write_folded(merged, args.folded, 1000.0 if args.per_node else 1.0)
+    if args.speedscope is not None:
+        write_speedscope(merged, args.speedscope, unit='nanoseconds' if args.per_node else 'microseconds',
+                         scale=1000.0 if args.per_node else 1.0)
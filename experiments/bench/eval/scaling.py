@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from experiments.bench.eval import breakdown
+
+'''
+Empirical complexity exponents.
+For a quantity that grows like t = c * n^k with the graph size n, k is the slope of log t over log n.
+The fits use the median of every (group, size) and closed-form least squares over groupby sums, so all groups
+(layouters, phases or timer paths) are fitted at once.
+'''
+
+
+def fit(df, size='nodes', value='time', by=('name',), min_value=0.0):
+    '''
+    Fits value = coefficient * size^exponent per group of `by` on the medians per size.
+    Returns one row per group with exponent, coefficient, its standard error, r2 and the number of sizes.
+    Medians at or below min_value (e.g. phases that take no measurable time) are not used.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    medians = df.groupby(by + [size], observed=True, dropna=False)[value].median().reset_index()
+    medians = medians[(medians[value] > min_value) & (medians[size] > 0)]
+    x = np.log(medians[size].astype(float))
+    y = np.log(medians[value].astype(float))
+    sums = pd.DataFrame({'n': 1, 'x': x, 'y': y, 'xx': x * x, 'xy': x * y, 'yy': y * y})
+    for column in by:
+        sums[column] = medians[column]
+    sums = sums.groupby(by, observed=True, dropna=False).sum()
+    n = sums['n']
+    sxx = sums['xx'] - sums['x'] ** 2 / n
+    sxy = sums['xy'] - sums['x'] * sums['y'] / n
+    syy = sums['yy'] - sums['y'] ** 2 / n
+    exponent = sxy / sxx
+    intercept = (sums['y'] - exponent * sums['x']) / n
+    residual = (syy - exponent * sxy).clip(lower=0)
+    result = pd.DataFrame({
+        'exponent': exponent,
+        'stderr': np.sqrt(residual / (n - 2) / sxx).where(n > 2),
+        'coefficient': np.exp(intercept),
+        'r2': (1 - residual / syy).where(syy > 0),
+        'sizes': n,
+    })
+    return result[n > 1].reset_index()
+
+
+def fit_phases(phase_df, sizes, phases, size='nodes', by=('name',), on='graph'):
+    '''
+    Exponents of the phase times of breakdown.phases per group and phase; sizes is indexed by graph
+    (e.g. a catalog DataFrame), size the column to use.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    df = phase_df.join(sizes[[size]], on=on).melt(id_vars=by + [size], value_vars=list(phases),
+                                                   var_name='phase', value_name='time')
+    return fit(df, size, 'time', by + ['phase'])
+
+
+def fit_paths(long_df, sizes, size='nodes', by=('name',), on='graph', min_value=0.0):
+    '''
+    Exponents of the inclusive time of every timer path of a long breakdown DataFrame, sorted by exponent,
+    so that the parts that grow fastest with the graph size come first.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+    df = breakdown.tree_times(long_df).join(sizes[[size]], on=on)
+    return fit(df, size, 'inclusive', by + ['path'], min_value).sort_values('exponent', ascending=False)
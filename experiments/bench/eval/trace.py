@@ -0,0 +1,188 @@
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from experiments.bench.server import read
+
+'''
+Analysis of the layout timelines of experiments.bench.performance.trace.
+Every entry holds Chrome trace events: begin/end ("B"/"E") of the timer spans on the main thread (tid 0), and for
+every task of the worker pool the instant events "enqueue", "post" and "done" on the main thread and its execution
+as begin/end on the thread of its worker (tid = worker index + 1). Timestamps are in µs, here converted to ms.
+
+From the tasks, the time of a run is split into parallel windows (while at least one task is enqueued or running)
+and serial time (everything else, which the main thread has to do alone). The critical path is the serial time plus
+the longest task of every window, i.e. the time of the run with unlimited workers and free dispatch; the speedup
+bound relates it to the time the run would take on one thread (serial time plus all task times).
+'''
+
+MAIN_THREAD = 0
+
+
+def events(entry):
+    '''
+    DataFrame of the trace events of an entry (without metadata) with the columns name, cat, ph, ts (ms), tid,
+    task, function and path, in the order of recording.
+    '''
+    rows = []
+    for event in entry.get('traceEvents', []):
+        if event.get('ph') == 'M':
+            continue
+        args = event.get('args', {})
+        rows.append((event['name'], event.get('cat'), event['ph'], event['ts'] / 1000, event.get('tid', MAIN_THREAD),
+                     args.get('taskId'), args.get('function'), args.get('path')))
+    return pd.DataFrame(rows, columns=['name', 'cat', 'ph', 'ts', 'tid', 'task', 'function', 'path'])
+
+
+def spans(event_df):
+    '''
+    Matches the begin and end events of every thread: one row per span with tid, name, path (timer spans), task
+    (worker tasks), start, end, duration and depth (nesting level on its thread).
+    '''
+    rows = []
+    for tid, df in event_df[event_df['ph'].isin(['B', 'E'])].groupby('tid', sort=True):
+        stack = []
+        for event in df.itertuples(index=False):
+            if event.ph == 'B':
+                stack.append(event)
+            elif len(stack) > 0:
+                begin = stack.pop()
+                rows.append((tid, begin.name, begin.path, begin.task, begin.ts, event.ts, len(stack)))
+    df = pd.DataFrame(rows, columns=['tid', 'name', 'path', 'task', 'start', 'end', 'depth'])
+    df['duration'] = df['end'] - df['start']
+    return df.sort_values(['tid', 'start'], ignore_index=True)
+
+
+def tasks(event_df):
+    '''
+    One row per task of the worker pool with its function, worker and the times of enqueue, post, start, end and
+    done, and the latencies derived from them:
+    - queue_delay: enqueue to post (waiting for a free worker)
+    - start_delay: post to start (message passing and worker wake-up)
+    - dispatch_latency: enqueue to start
+    - result_latency: end to done (returning the result to the main thread)
+    '''
+    pool = event_df[event_df['task'].notna() & (event_df['cat'] == 'pool')]
+    columns = ['task', 'function', 'worker', 'enqueue', 'post', 'start', 'end', 'done']
+    if len(pool) == 0:
+        return pd.DataFrame(columns=columns + ['duration', 'queue_delay', 'start_delay', 'dispatch_latency',
+                                               'result_latency'])
+    kind = pool['ph'].where(pool['ph'] == 'i', pool['ph'].map({'B': 'start', 'E': 'end'}))
+    kind = kind.where(kind != 'i', pool['name'])
+    df = pool.assign(kind=kind).pivot_table(index='task', columns='kind', values='ts', aggfunc='first')
+    df = df.reindex(columns=['enqueue', 'post', 'start', 'end', 'done'])
+    df['function'] = pool.groupby('task')['function'].first()
+    df['worker'] = pool[pool['ph'] != 'i'].groupby('task')['tid'].first() - 1
+    df = df.reset_index()[columns]
+    df.columns.name = None
+    df['task'] = df['task'].astype(int)
+    df['duration'] = df['end'] - df['start']
+    df['queue_delay'] = df['post'] - df['enqueue']
+    df['start_delay'] = df['start'] - df['post']
+    df['dispatch_latency'] = df['start'] - df['enqueue']
+    df['result_latency'] = df['done'] - df['end']
+    return df
+
+
+def _union(intervals):
+    # merges overlapping (start, end) intervals, returns the sorted disjoint intervals
+    merged = []
+    for start, end in sorted(intervals):
+        if len(merged) > 0 and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def analyze_entry(entry, within=None):
+    '''
+    Summary of one run: wall time, serial and parallel time, task time, number of tasks and workers, worker
+    utilization (task time over workers times parallel time), mean and maximum dispatch latency, mean queue delay,
+    critical path and speedup bound, all in ms.
+    With `within` (a timer path like "doLayout|orderRanks"), only the spans of this path and the tasks enqueued
+    during them are considered.
+    '''
+    event_df = events(entry)
+    span_df = spans(event_df)
+    main = span_df[span_df['tid'] == MAIN_THREAD]
+    if within is not None:
+        main = main[main['path'] == within]
+    else:
+        main = main[main['depth'] == 0]
+    extent = _union(zip(main['start'], main['end']))
+    wall = sum(end - start for start, end in extent)
+    task_df = tasks(event_df)
+    if len(extent) > 0 and len(task_df) > 0:
+        starts = np.array([start for start, end in extent])
+        ends = np.array([end for start, end in extent])
+        position = np.searchsorted(starts, task_df['enqueue'].to_numpy(), side='right') - 1
+        inside = (position >= 0) & (task_df['enqueue'].to_numpy() <= ends[np.maximum(position, 0)])
+        task_df = task_df[inside]
+    task_df = task_df.dropna(subset=['enqueue', 'start', 'end'])
+    windows = _union(zip(task_df['enqueue'], task_df['done'].fillna(task_df['end'])))
+    parallel = sum(end - start for start, end in windows)
+    longest = 0.0
+    for start, end in windows:
+        in_window = task_df[(task_df['enqueue'] >= start) & (task_df['enqueue'] <= end)]
+        longest += in_window['duration'].max()
+    serial = max(wall - parallel, 0.0)
+    task_time = task_df['duration'].sum()
+    workers = task_df['worker'].nunique()
+    critical_path = serial + longest
+    return {
+        'wall': wall,
+        'serial': serial,
+        'parallel': parallel,
+        'task_time': task_time,
+        'tasks': len(task_df),
+        'workers': workers,
+        'utilization': task_time / (workers * parallel) if workers > 0 and parallel > 0 else np.nan,
+        'dispatch_latency': task_df['dispatch_latency'].mean(),
+        'max_dispatch_latency': task_df['dispatch_latency'].max(),
+        'queue_delay': task_df['queue_delay'].mean(),
+        'critical_path': critical_path,
+        'speedup_bound': (serial + task_time) / critical_path if critical_path > 0 else np.nan,
+    }
+
+
+def analyze(source, within=None, id_columns=('name', 'graph')):
+    '''
+    One row per run (entries with trace events of a result file or a list of entries) with the id columns and the
+    summary of analyze_entry.
+    '''
+    entries = read(source) if isinstance(source, str) else source
+    rows = []
+    for run, entry in enumerate(entries):
+        if entry is None or 'traceEvents' not in entry:
+            continue
+        row = {'run': run}
+        row.update({column: entry.get(column) for column in id_columns})
+        row.update(analyze_entry(entry, within))
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def write_trace(entry, path):
+    '''
+    Writes the trace of an entry as JSON file for chrome://tracing or https://ui.perfetto.dev.
+    '''
+    with open(path, 'w') as file:
+        json.dump({
+            'traceEvents': entry['traceEvents'],
+            'displayTimeUnit': 'ms',
+            'otherData': {key: value for key, value in entry.items() if isinstance(value, str)},
+        }, file)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Summarize the layout timelines of a result file.')
+    parser.add_argument('results', help='result file of experiments.bench.performance.trace')
+    parser.add_argument('--within', help='timer path to restrict the analysis to, e.g. doLayout|orderRanks')
+    parser.add_argument('--export', type=int, help='write the trace of the run with this index to --output')
+    parser.add_argument('--output', default='trace.json')
+    args = parser.parse_args()
+    if args.export is not None:
+        write_trace(read(args.results)[args.export], args.output)
+    pd.set_option('display.width', None)
+    print(analyze(args.results, args.within).groupby(['name', 'graph']).median(numeric_only=True).to_string())
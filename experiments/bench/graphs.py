@@ -1,3 +1,5 @@
+# graph groups of the paper experiments; other selections can be made by size with experiments.bench.catalog,
+# e.g. {"query": "nodes > 5000 and has_ports", "layouters": [...], "runs": 5} in an experiment
 POLY = ["npbench/polybench/adi", "npbench/polybench/atax", "npbench/polybench/bicg",
                     "npbench/polybench/cholesky", "npbench/polybench/correlation", "npbench/polybench/covariance",
                     "npbench/polybench/deriche", "npbench/polybench/doitgen", "npbench/polybench/durbin",
@@ -0,0 +1,93 @@
+import json
+import os
+import selectors
+import subprocess
+import time
+from experiments.bench.pool import _Pool, _write_profile
+from experiments.bench import ROOT_DIR
+
+'''
+Runs experiments in long-lived Node.js processes (experiments/headless.js) instead of browsers.
+Every process reads batches as JSON lines from stdin and answers with one line of result entries per batch.
+There is no browser start-up, page load or DOM text measurement per batch, so this backend is useful for large
+sweeps over algorithmic options; node sizes come from the deterministic text metrics of the HeadlessRenderer.
+'''
+
+SCRIPT_PATH = os.path.join(ROOT_DIR, 'experiments', 'headless.js')
+
+
+class _Node:
+    def __init__(self, core=None, graph_dir=None, profile_dir=None):
+        self._profile_dir = profile_dir
+        preexec_fn = None
+        if core is not None and hasattr(os, 'sched_setaffinity'):
+            preexec_fn = (lambda: os.sched_setaffinity(0, {core}))
+        command = ['node', '--expose-gc', SCRIPT_PATH]
+        if graph_dir is not None:
+            command.append(graph_dir)
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.DEVNULL, cwd=ROOT_DIR, preexec_fn=preexec_fn)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._process.stdout, selectors.EVENT_READ)
+        self._buffer = b''
+        self._next_id = 0
+
+    def run(self, batch, timeout=None):
+        request = dict(batch, id=self._next_id)
+        self._next_id += 1
+        self._process.stdin.write((json.dumps(request) + '\n').encode())
+        self._process.stdin.flush()
+        response = json.loads(self._readline(timeout))
+        if response.get('id') != request['id']:
+            raise RuntimeError('unexpected response ' + str(response.get('id')))
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        if self._profile_dir is not None:
+            for title, profile in response.get('profiles', {}).items():
+                _write_profile(self._profile_dir, title, profile)
+        return response['entries']
+
+    def close(self):
+        self._selector.close()
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        self._process.terminate()
+        try:
+            self._process.wait(10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+    def _readline(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while b'\n' not in self._buffer:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            if not self._selector.select(remaining):
+                raise TimeoutError('no response within ' + str(timeout) + 's')
+            chunk = os.read(self._process.stdout.fileno(), 1 << 16)
+            if not chunk:
+                raise ConnectionError('node exited with ' + str(self._process.poll()))
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line
+
+
+class NodePool(_Pool):
+    '''
+    Runs batches (see experiments.bench._batches) on `workers` persistent node processes (default: one per spare
+    core), see _Pool; map returns the list of result entries of every batch.
+    With `profile_dir`, the CPU profiles of runs with profile=1 are written to this directory.
+    '''
+
+    _JOB = 'batch'
+
+    def __init__(self, workers=None, pin=False, timeout=600, graph_dir=None, profile_dir=None):
+        super().__init__(workers, pin, timeout, profile_dir)
+        self._graph_dir = graph_dir
+
+    def _start(self, w):
+        return _Node(self._cores[w], self._graph_dir, self._profile_dir)
+
+    def _describe(self, batch):
+        return batch['graph']
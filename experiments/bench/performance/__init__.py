@@ -1,20 +1,47 @@
-import urllib.parse
-from experiments.bench import _open_browser, _file_path
+from experiments.bench import _graphs, _run_setups
 
+# URL parameters of the adaptive run control (see src/bench/runControl.ts)
+ADAPTIVE_PARAMETERS = ('warmupRuns', 'minRuns', 'maxRuns', 'targetCi', 'budget')
 
-def _run_experiments(browser, experiments, breakdown=False, count=False):
-    _open_browser(browser, _file_path('clearStorage.html'))
+
+def _run_experiments(browser, experiments, breakdown=False, count=False, output='results.jsonl', workers=None, pin=False, cache=True, batch_size=20, adaptive=None, memory=None, profile=False, trace=False, budget=None, dry_run=False):
+    '''
+    Runs every layouter on every graph of the experiments `runs` times.
+    With `adaptive` (a dict of ADAPTIVE_PARAMETERS, e.g. {'targetCi': 0.02, 'budget': 30000}, or an "adaptive" key
+    of an experiment), the time of every (layouter, graph) pair is measured in a single entry that repeats the layout
+    until the confidence interval is narrow enough, and `runs` is ignored.
+    With `memory` ('peak' or 'delta'), every entry holds the heap usage per timer path in bytes instead of times.
+    With `profile`, every run is also recorded as sampling CPU profile (see experiments.bench.eval.profile).
+    With `trace`, every entry holds the times per timer path and the trace events of the timer spans and the tasks
+    of the worker pool (see experiments.bench.eval.trace).
+    With `budget` in seconds, runs are dropped to fit it (see experiments.bench.schedule); returns the plan.
+    '''
+    if memory not in (None, 'peak', 'delta'):
+        raise ValueError('memory has to be None, "peak" or "delta"')
+    setups = []
     for experiment in experiments:
-        for layouter in experiment["layouters"]:
-            for graph in experiment["graphs"]:
-                for run in range(experiment["runs"]):
+        experiment_adaptive = experiment.get("adaptive", adaptive)
+        if experiment_adaptive is not None and (breakdown or count or memory is not None or trace):
+            raise ValueError('adaptive runs only measure the total time')
+        for graph in _graphs(experiment):
+            for layouter in experiment["layouters"]:
+                runs = 1 if experiment_adaptive is not None else experiment["runs"]
+                for run in range(runs):
                     setup = layouter.copy()
                     setup['breakdown'] = int(breakdown)
                     setup['count'] = int(count)
+                    if memory is not None:
+                        setup['memory'] = memory
+                    if profile:
+                        setup['profile'] = 1
+                    if trace:
+                        setup['trace'] = 1
+                    if experiment_adaptive is not None:
+                        unknown = set(experiment_adaptive) - set(ADAPTIVE_PARAMETERS)
+                        if len(unknown) > 0:
+                            raise ValueError('unknown adaptive parameters: ' + ', '.join(sorted(unknown)))
+                        setup['adaptive'] = 1
+                        setup.update(experiment_adaptive)
                     setup['graph'] = graph
-                    _run_experiment(browser, setup)
-    _open_browser(browser, _file_path('downloadStorage.html'))
-
-
-def _run_experiment(browser, experiment):
-    _open_browser(browser, _file_path('performance.html') + '?' + urllib.parse.urlencode(experiment, doseq=False))
\ No newline at end of file
+                    setups.append((setup, run))
+    return _run_setups(browser, 'experiments/performance.html', setups, output, workers, pin, cache, batch_size, budget, dry_run)
@@ -5,9 +5,13 @@ Measure the time spent in various parts of the layouter.
 '''
 
 
-def firefox(experiments):
-    _run_experiments('firefox', experiments, True)
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, True, **kwargs)
 
 
-def chrome(experiments):
-    _run_experiments('chrome', experiments, True)
\ No newline at end of file
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, True, **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, True, **kwargs)
@@ -5,9 +5,13 @@ Count how many times different parts of the layouter are executed.
 '''
 
 
-def firefox(experiments):
-    _run_experiments('firefox', experiments, True, True)
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, True, True, **kwargs)
 
 
-def chrome(experiments):
-    _run_experiments('chrome', experiments, True, True)
\ No newline at end of file
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, True, True, **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, True, True, **kwargs)
@@ -0,0 +1,34 @@
+from experiments.bench import _graphs, _run_setups
+
+'''
+Measure the time between frames while the view of a laid out graph is zoomed and moved along a scripted path
+(see Bench.frameTimes in src/bench/bench.ts), together with the heap before and after and the number of display
+objects. Besides the layouter parameters, the "layouters" of an experiment take the renderer parameters renderer
+('svg' or 'pixi'), culling (0 or 1), lodZoom, margin and minScreenSize.
+Frames are only drawn at full rate in a visible window, so the pages run one at a time unless `workers` is given.
+'''
+
+
+def _run_frames(browser, experiments, frames=120, output='results.jsonl', workers=1, pin=False, cache=True, batch_size=20, budget=None, dry_run=False):
+    setups = []
+    for experiment in experiments:
+        for graph in _graphs(experiment):
+            for layouter in experiment["layouters"]:
+                for run in range(experiment["runs"]):
+                    setup = layouter.copy()
+                    setup['frames'] = frames
+                    setup['graph'] = graph
+                    setups.append((setup, run))
+    return _run_setups(browser, 'experiments/frames.html', setups, output, workers, pin, cache, batch_size, budget, dry_run)
+
+
+def firefox(experiments, **kwargs):
+    _run_frames('firefox', experiments, **kwargs)
+
+
+def chrome(experiments, **kwargs):
+    _run_frames('chrome', experiments, **kwargs)
+
+
+def node(experiments, **kwargs):
+    raise ValueError('frames are only drawn in a browser')
@@ -0,0 +1,19 @@
+from . import _run_experiments
+
+'''
+Measure the heap usage of the parts of the layouter: the peak heap growth during every timer path (memory='peak')
+or the heap retained by it (memory='delta'), in bytes.
+Heap sizes are only available in chrome (performance.memory) and node, firefox reports none.
+'''
+
+
+def firefox(experiments, memory='peak', **kwargs):
+    _run_experiments('firefox', experiments, memory=memory, **kwargs)
+
+
+def chrome(experiments, memory='peak', **kwargs):
+    _run_experiments('chrome', experiments, memory=memory, **kwargs)
+
+
+def node(experiments, memory='peak', **kwargs):
+    _run_experiments('node', experiments, memory=memory, **kwargs)
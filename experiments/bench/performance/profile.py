@@ -0,0 +1,15 @@
+from . import _run_experiments
+
+'''
+Record a sampling CPU profile of every layout, next to its time (which includes the profiling overhead).
+The profiles are written to a directory next to the output (results.jsonl -> results.profiles), one .cpuprofile
+file per run, and are aggregated by experiments.bench.eval.profile. Firefox does not record profiles.
+'''
+
+
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, profile=True, **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, profile=True, **kwargs)
@@ -5,9 +5,13 @@ Measure the total time spent in a layouter.
 '''
 
 
-def firefox(experiments):
-    _run_experiments('firefox', experiments, 0)
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, 0, **kwargs)
 
 
-def chrome(experiments):
-    _run_experiments('chrome', experiments, 0)
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, 0, **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, 0, **kwargs)
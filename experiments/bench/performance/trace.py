@@ -0,0 +1,19 @@
+from . import _run_experiments
+
+'''
+Record a timeline of every layout: begin and end of every timer span on the main thread and the enqueueing,
+posting, execution and completion of every task of the worker pool, as Chrome trace events.
+Worker utilization, dispatch latency and the critical path are computed by experiments.bench.eval.trace.
+'''
+
+
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, trace=True, **kwargs)
+
+
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, trace=True, **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, trace=True, **kwargs)
@@ -0,0 +1,215 @@
+import json
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from experiments.bench.remote import ChromeSession, FirefoxSession
+
+'''
+Keeps a number of headless browsers alive and feeds experiment URLs to them as a work queue.
+The experiment pages expose a promise "window.benchDone" that resolves to their result entry.
+'''
+
+# preferences written into fresh Firefox profiles
+_FIREFOX_PREFS = {
+    'security.fileuri.strict_origin_policy': False,
+    'browser.shell.checkDefaultBrowser': False,
+    'datareporting.policy.dataSubmissionEnabled': False,
+    'toolkit.startup.max_resumed_crashes': -1,
+}
+
+
+# sampling interval of CPU profiles in microseconds
+PROFILE_INTERVAL = 100
+
+
+def _write_profile(directory, title, profile):
+    # titles are generated by the pages, but must not leave the profile directory
+    path = os.path.join(directory, os.path.basename(title) + '.cpuprofile')
+    with open(path, 'w') as file:
+        json.dump(profile, file, separators=(',', ':'))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _spare_cores():
+    if hasattr(os, 'sched_getaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    # leave the first core to the harness itself
+    return cores[1:] if len(cores) > 1 else cores
+
+
+class _Browser:
+    def __init__(self, browser, core=None, timeout=60, profile_dir=None):
+        self._browser = browser
+        self._profile_dir = profile_dir
+        self._profile = tempfile.mkdtemp(prefix='bench-' + browser + '-')
+        self._port = _free_port()
+        preexec_fn = None
+        if core is not None and hasattr(os, 'sched_setaffinity'):
+            preexec_fn = (lambda: os.sched_setaffinity(0, {core}))
+        if browser == 'firefox':
+            with open(os.path.join(self._profile, 'user.js'), 'w') as file:
+                for name, value in _FIREFOX_PREFS.items():
+                    file.write('user_pref(%s, %s);\n' % (json.dumps(name), json.dumps(value)))
+            command = ['firefox', '--headless', '--no-remote', '--profile', self._profile,
+                       '--remote-debugging-port', str(self._port), 'about:blank']
+        else:
+            command = ['google-chrome', '--headless=new', '--no-first-run', '--no-default-browser-check',
+                       '--allow-file-access-from-files', '--user-data-dir=' + self._profile,
+                       '--enable-precise-memory-info', '--js-flags=--expose-gc',
+                       '--remote-debugging-port=' + str(self._port), 'about:blank']
+        self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                         preexec_fn=preexec_fn)
+        self._session = self._connect(timeout)
+        if profile_dir is not None:
+            # runs with profile=1 call console.profile, which records with these settings
+            self._session.call('Profiler.enable')
+            self._session.call('Profiler.setSamplingInterval', interval=PROFILE_INTERVAL)
+
+    def run(self, url, timeout=None):
+        self._session.settimeout(timeout)
+        self._session.navigate(url)
+        result = self._session.evaluate('Promise.resolve(window.benchDone).then(r => JSON.stringify(r))')
+        if self._profile_dir is not None:
+            for event in self._session.take_events('Profiler.consoleProfileFinished'):
+                _write_profile(self._profile_dir, event['title'], event['profile'])
+        return None if result is None else json.loads(result)
+
+    def close(self):
+        try:
+            self._session.close()
+        except (OSError, AttributeError):
+            pass
+        self._process.terminate()
+        try:
+            self._process.wait(10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        shutil.rmtree(self._profile, ignore_errors=True)
+
+    def _connect(self, timeout):
+        deadline = time.time() + timeout
+        while True:
+            try:
+                if self._browser == 'firefox':
+                    return FirefoxSession(self._port, timeout)
+                urllib.request.urlopen('http://127.0.0.1:%d/json/version' % self._port, timeout=1).read()
+                return ChromeSession(self._port, timeout)
+            except (OSError, ConnectionError):
+                if self._process.poll() is not None or time.time() > deadline:
+                    self.close()
+                    raise RuntimeError('could not start ' + self._browser)
+                time.sleep(0.1)
+
+
+class _Pool:
+    '''
+    Feeds jobs as a work queue to `workers` persistent workers (default: one per spare core), which are started by
+    _start when they get their first job and started again after a failed one.
+    With `pin`, every worker is bound to its own idle core so that at most one experiment runs per core,
+    which keeps timing measurements from interfering with each other.
+    '''
+
+    # name of a job in failure messages
+    _JOB = 'job'
+
+    def __init__(self, workers=None, pin=False, timeout=600, profile_dir=None):
+        cores = _spare_cores()
+        if workers is None:
+            workers = len(cores)
+        if pin:
+            workers = min(workers, len(cores))
+        self._cores = cores[:workers] if pin else [None] * workers
+        self._workers = [None] * workers
+        self._timeout = timeout
+        self._profile_dir = profile_dir
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def map(self, jobs, deadline=None):
+        '''
+        Runs all jobs and returns their results in the same order (None for failed jobs).
+        No job is started after `deadline` (a time.time() value); those not started are None as well.
+        The wall-clock seconds of every job (None if not started) are left in `durations`.
+        '''
+        pending = queue.Queue()
+        for job in enumerate(jobs):
+            pending.put(job)
+        results = [None] * len(jobs)
+        self.durations = [None] * len(jobs)
+        threads = [threading.Thread(target=self._work, args=(w, pending, results, deadline), daemon=True)
+                   for w in range(len(self._cores))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def close(self):
+        for w, worker in enumerate(self._workers):
+            if worker is not None:
+                worker.close()
+                self._workers[w] = None
+
+    def _start(self, w):
+        '''
+        Starts worker `w` (on self._cores[w]); the worker runs jobs with run(job, timeout) and is stopped with close().
+        '''
+        raise NotImplementedError()
+
+    def _describe(self, job):
+        return str(job)
+
+    def _work(self, w, pending, results, deadline=None):
+        while True:
+            try:
+                index, job = pending.get_nowait()
+            except queue.Empty:
+                return
+            if deadline is not None and time.time() > deadline:
+                continue
+            start = time.time()
+            try:
+                if self._workers[w] is None:
+                    self._workers[w] = self._start(w)
+                results[index] = self._workers[w].run(job, self._timeout)
+            except (OSError, ConnectionError, RuntimeError, ValueError) as e:
+                print(self._JOB + ' failed: ' + self._describe(job) + ' (' + str(e) + ')')
+                # the worker may be in an unusable state, still busy with a timed out job or it did not start,
+                # start a fresh one for the next job
+                if self._workers[w] is not None:
+                    self._workers[w].close()
+                    self._workers[w] = None
+            self.durations[index] = time.time() - start
+
+
+class BrowserPool(_Pool):
+    '''
+    Runs experiment URLs on `workers` persistent headless browsers (default: one per spare core), see _Pool.
+    With `profile_dir`, the CPU profiles of runs with profile=1 are written to this directory (chrome only).
+    '''
+
+    _JOB = 'run'
+
+    def __init__(self, browser, workers=None, pin=False, timeout=600, profile_dir=None):
+        super().__init__(workers, pin, timeout, profile_dir)
+        self._browser = browser
+
+    def _start(self, w):
+        return _Browser(self._browser, self._cores[w], profile_dir=self._profile_dir)
@@ -1,23 +1,17 @@
-import urllib.parse
-import inspect
-import os
-import pandas as pd
-import json
-from experiments.bench import _open_browser, _file_path
+from experiments.bench import _graphs, _run_setups
 
 
-def _run_experiments(browser, experiments, measure):
-    _open_browser(browser, _file_path('clearStorage.html'))
+def _run_experiments(browser, experiments, measure, output='results.jsonl', workers=None, pin=False, cache=True, batch_size=20, budget=None, dry_run=False):
+    # a list of measures is taken from one layout per run and stored in one entry
+    if not isinstance(measure, str):
+        measure = ','.join(measure)
+    setups = []
     for experiment in experiments:
-        for layouter in experiment["layouters"]:
-            for graph in experiment["graphs"]:
+        for graph in _graphs(experiment):
+            for layouter in experiment["layouters"]:
                 for run in range(experiment["runs"]):
                     setup = layouter.copy()
                     setup['measure'] = measure
                     setup['graph'] = graph
-                    _run_experiment(browser, setup)
-    _open_browser(browser, _file_path('downloadStorage.html'))
-
-
-def _run_experiment(browser, experiment):
-    _open_browser(browser, _file_path('quality.html') + '?' + urllib.parse.urlencode(experiment, doseq=False))
\ No newline at end of file
+                    setups.append((setup, run))
+    return _run_setups(browser, 'experiments/quality.html', setups, output, workers, pin, cache, batch_size, budget, dry_run)
@@ -1,9 +1,13 @@
 from . import _run_experiments
 
 
-def firefox(experiments):
-    _run_experiments('firefox', experiments, 'cost')
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, 'cost', **kwargs)
 
 
-def chrome(experiments):
-    _run_experiments('chrome', experiments, 'cost')
\ No newline at end of file
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, 'cost', **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, 'cost', **kwargs)
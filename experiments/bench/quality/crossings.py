@@ -1,9 +1,13 @@
 from . import _run_experiments
 
 
-def firefox(experiments):
-    _run_experiments('firefox', experiments, 'crossings')
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, 'crossings', **kwargs)
 
 
-def chrome(experiments):
-    _run_experiments('chrome', experiments, 'crossings')
\ No newline at end of file
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, 'crossings', **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, 'crossings', **kwargs)
@@ -0,0 +1,17 @@
+from . import _run_experiments
+
+'''
+Store the geometry of the final layouts, to be evaluated with experiments.bench.eval.layout_quality.
+'''
+
+
+def firefox(experiments, **kwargs):
+    _run_experiments('firefox', experiments, 'geometry', **kwargs)
+
+
+def chrome(experiments, **kwargs):
+    _run_experiments('chrome', experiments, 'geometry', **kwargs)
+
+
+def node(experiments, **kwargs):
+    _run_experiments('node', experiments, 'geometry', **kwargs)
@@ -0,0 +1,20 @@
+from . import _run_experiments
+
+'''
+Several quality measures of one layout per run, stored in one entry, e.g.
+measures.chrome(experiments, ['cost', 'crossings', 'time']).
+Available are validate, cost, crossings, bends, lengths, area, ranks, geometry and time (the time of the same
+layout in ms, a single sample that includes no warm-up; use experiments.bench.performance.time for timing studies).
+'''
+
+
+def firefox(experiments, measures, **kwargs):
+    _run_experiments('firefox', experiments, measures, **kwargs)
+
+
+def chrome(experiments, measures, **kwargs):
+    _run_experiments('chrome', experiments, measures, **kwargs)
+
+
+def node(experiments, measures, **kwargs):
+    _run_experiments('node', experiments, measures, **kwargs)
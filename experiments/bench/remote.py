@@ -0,0 +1,201 @@
+import base64
+import collections
+import json
+import os
+import socket
+import struct
+import urllib.parse
+import urllib.request
+
+'''
+Minimal remote-control clients for headless browsers.
+Chrome is driven over the DevTools protocol (CDP), Firefox over WebDriver BiDi.
+Both speak JSON over a WebSocket, for which a small client is included so that no extra packages are needed.
+'''
+
+
+class WebSocket:
+    def __init__(self, url, timeout=None):
+        parts = urllib.parse.urlparse(url)
+        self._buffer = b''
+        self._socket = socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        key = base64.b64encode(os.urandom(16)).decode()
+        self._socket.sendall((
+            'GET ' + path + ' HTTP/1.1\r\n'
+            'Host: ' + parts.netloc + '\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            'Sec-WebSocket-Key: ' + key + '\r\n'
+            'Sec-WebSocket-Version: 13\r\n\r\n'
+        ).encode())
+        header = self._read_until(b'\r\n\r\n')
+        if b' 101 ' not in header.split(b'\r\n')[0]:
+            raise ConnectionError('websocket handshake failed: ' + header.split(b'\r\n')[0].decode())
+
+    def settimeout(self, timeout):
+        self._socket.settimeout(timeout)
+
+    def send(self, text):
+        payload = text.encode()
+        header = bytes([0x81])  # FIN + text frame
+        if len(payload) < 126:
+            header += bytes([0x80 | len(payload)])
+        elif len(payload) < 1 << 16:
+            header += bytes([0x80 | 126]) + struct.pack('!H', len(payload))
+        else:
+            header += bytes([0x80 | 127]) + struct.pack('!Q', len(payload))
+        mask = os.urandom(4)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self._socket.sendall(header + mask + masked)
+
+    def recv(self):
+        message = b''
+        while True:
+            first, second = self._read_exact(2)
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack('!H', self._read_exact(2))[0]
+            elif length == 127:
+                length = struct.unpack('!Q', self._read_exact(8))[0]
+            payload = self._read_exact(length)
+            if opcode == 0x8:  # close
+                raise ConnectionError('websocket closed by peer')
+            if opcode == 0x9:  # ping
+                self._socket.sendall(bytes([0x8A, 0x80 | len(payload)]) + b'\0\0\0\0' + payload)
+                continue
+            if opcode == 0xA:  # pong
+                continue
+            message += payload
+            if first & 0x80:
+                return message.decode()
+
+    def close(self):
+        try:
+            self._socket.close()
+        except OSError:
+            pass
+
+    def _read_exact(self, n):
+        while len(self._buffer) < n:
+            chunk = self._socket.recv(max(65536, n - len(self._buffer)))
+            if not chunk:
+                raise ConnectionError('websocket connection lost')
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
+
+    def _read_until(self, delimiter):
+        while delimiter not in self._buffer:
+            chunk = self._socket.recv(65536)
+            if not chunk:
+                raise ConnectionError('websocket connection lost')
+            self._buffer += chunk
+        end = self._buffer.index(delimiter) + len(delimiter)
+        data, self._buffer = self._buffer[:end], self._buffer[end:]
+        return data
+
+
+class _Session:
+    def __init__(self, url, timeout=None):
+        self._socket = WebSocket(url, timeout)
+        self._next_id = 0
+        self._events = collections.deque()
+
+    def settimeout(self, timeout):
+        self._socket.settimeout(timeout)
+
+    def call(self, method, **params):
+        self._next_id += 1
+        message_id = self._next_id
+        self._socket.send(json.dumps({'id': message_id, 'method': method, 'params': params}))
+        while True:
+            message = json.loads(self._socket.recv())
+            if message.get('id') == message_id:
+                return self._unwrap(message)
+            if 'method' in message:
+                self._events.append(message)
+
+    def wait_event(self, method):
+        for i, event in enumerate(self._events):
+            if event['method'] == method:
+                del self._events[i]
+                return event.get('params', {})
+        while True:
+            message = json.loads(self._socket.recv())
+            if message.get('method') == method:
+                return message.get('params', {})
+            if 'method' in message:
+                self._events.append(message)
+
+    def take_events(self, method):
+        '''
+        Removes the events of the given method received so far from the queue and returns their parameters.
+        '''
+        taken = [event.get('params', {}) for event in self._events if event['method'] == method]
+        self._events = collections.deque(event for event in self._events if event['method'] != method)
+        return taken
+
+    def close(self):
+        self._socket.close()
+
+    def _unwrap(self, message):
+        if 'error' in message:
+            raise RuntimeError(message['error'] if isinstance(message['error'], str) else json.dumps(message['error']))
+        return message.get('result', {})
+
+
+class ChromeSession(_Session):
+    '''
+    Controls the first page target of a Chrome instance started with --remote-debugging-port.
+    '''
+
+    def __init__(self, port, timeout=None):
+        targets = json.loads(urllib.request.urlopen('http://127.0.0.1:%d/json/list' % port, timeout=timeout).read())
+        pages = [target for target in targets if target['type'] == 'page']
+        if len(pages) == 0:
+            request = urllib.request.Request('http://127.0.0.1:%d/json/new?about:blank' % port, method='PUT')
+            pages = [json.loads(urllib.request.urlopen(request, timeout=timeout).read())]
+        super().__init__(pages[0]['webSocketDebuggerUrl'], timeout)
+        self.call('Page.enable')
+        self.call('Runtime.enable')
+
+    def navigate(self, url):
+        self._events.clear()
+        self.call('Page.navigate', url=url)
+        self.wait_event('Page.loadEventFired')
+
+    def evaluate(self, expression):
+        result = self.call('Runtime.evaluate', expression=expression, awaitPromise=True, returnByValue=True)
+        if 'exceptionDetails' in result:
+            raise RuntimeError(result['exceptionDetails'].get('text', 'evaluation failed'))
+        return result['result'].get('value')
+
+
+class FirefoxSession(_Session):
+    '''
+    Controls the top-level browsing context of a Firefox instance started with --remote-debugging-port.
+    '''
+
+    def __init__(self, port, timeout=None):
+        super().__init__('ws://127.0.0.1:%d/session' % port, timeout)
+        self.call('session.new', capabilities={})
+        self._context = self.call('browsingContext.getTree')['contexts'][0]['context']
+
+    def navigate(self, url):
+        self.call('browsingContext.navigate', context=self._context, url=url, wait='complete')
+
+    def evaluate(self, expression):
+        result = self.call('script.evaluate', expression=expression, target={'context': self._context},
+                           awaitPromise=True)
+        if result.get('type') == 'exception':
+            raise RuntimeError(result['exceptionDetails'].get('text', 'evaluation failed'))
+        return result['result'].get('value')
+
+    def _unwrap(self, message):
+        if message.get('type') == 'error':
+            raise RuntimeError(message.get('error', '') + ': ' + message.get('message', ''))
+        return message.get('result', {})
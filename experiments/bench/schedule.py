@@ -0,0 +1,304 @@
+import argparse
+import heapq
+import json
+import os
+import time
+import numpy as np
+from experiments.bench import _batches
+from experiments.bench import ROOT_DIR
+
+'''
+Cost model and scheduler for experiment sweeps.
+Every executed run is recorded in a history file with the wall-clock seconds it took (the wallTime of its entry),
+every batch with the seconds spent around its runs (loading and sizing the graph, starting the page). The cost of a
+run is predicted from the history of the same browser, page and setup (all parameters except graph and name):
+1. the median of its runs on the same graph,
+2. a power law seconds = c * nodes^k fitted over the graph sizes of the setup,
+3. with a single size, its median scaled to the graph size by the exponent of all setups of the page,
+4. the power law of all setups of the page, or DEFAULT_SECONDS_PER_NODE if the page has no history yet.
+Graph sizes are the node counts of the catalog (experiments.bench.catalog).
+Batches are run longest predicted first, so that the pool, which hands the next batch to the first free worker,
+schedules them longest-processing-time-first and no worker is left with a long batch at the end.
+With a budget in seconds, runs are dropped until the predicted makespan fits: first the repetitions beyond the
+MIN_RUNS lowest runs of every (setup, graph) pair (highest run index first, then most expensive), then whole pairs,
+most expensive first. So every pair that is measured keeps enough runs for a median and a spread, at the price of
+measuring fewer pairs within the budget. Batches are only
+started until the budget is used up. Dropped runs are not cached, so running the same sweep again runs them.
+The plan is written next to the output (plan_path) with the predicted and actual seconds of every batch and the
+dropped runs, to judge the model and to plan the next sweep.
+'''
+
+HISTORY_PATH = os.path.join(ROOT_DIR, 'experiments', '.cache', 'history.jsonl')
+
+# used until a page has a history: seconds per run and graph node, and per batch
+DEFAULT_SECONDS_PER_NODE = 1e-3
+DEFAULT_BATCH_SECONDS = 2.0
+# runs of a (setup, graph) pair that are only dropped together with the pair
+MIN_RUNS = 3
+# exponents of fitted power laws are clipped to this range, so that few noisy sizes do not extrapolate wildly
+EXPONENT_RANGE = (0.5, 3.0)
+
+
+def signature(setup):
+    '''
+    The parameters of a setup that determine the cost of its runs (all but graph and name) as canonical string.
+    '''
+    return json.dumps({name: value for name, value in setup.items() if name not in ('graph', 'name')},
+                      sort_keys=True)
+
+
+def plan_path(output):
+    '''
+    Path of the plan of a sweep writing to `output` ("results.jsonl" -> "results.plan.json").
+    '''
+    return os.path.splitext(output)[0] + '.plan.json'
+
+
+def graph_sizes(graphs):
+    '''
+    Node counts of the graphs from the catalog; graphs missing from it get the median size of the catalog.
+    '''
+    from experiments.bench import catalog
+    nodes = {graph: record['nodes'] for graph, record in catalog.build()['graphs'].items() if record.get('nodes')}
+    default = float(np.median(list(nodes.values()))) if len(nodes) > 0 else 1000.0
+    return {graph: float(nodes.get(graph, default)) for graph in graphs}
+
+
+def _fit(sizes, values):
+    '''
+    (c, k) of values = c * sizes^k fitted on the logs, None with less than two distinct sizes.
+    '''
+    x = np.log(np.asarray(sizes, dtype=float))
+    y = np.log(np.maximum(np.asarray(values, dtype=float), 1e-6))
+    if len(np.unique(x)) < 2:
+        return None
+    exponent = float(np.clip(np.polyfit(x, y, 1)[0], *EXPONENT_RANGE))
+    return float(np.exp(np.mean(y - exponent * x))), exponent
+
+
+class CostModel:
+    '''
+    Predicts the seconds of runs and batches of one browser and page from the history (see the module description).
+    '''
+
+    def __init__(self, browser, page, path=HISTORY_PATH):
+        self._runs = {}
+        self._overheads = []
+        if os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('browser') != browser or record.get('page') != page:
+                        continue
+                    if record['type'] == 'run':
+                        self._runs.setdefault(record['signature'], []).append(
+                            (record['graph'], record['nodes'], record['seconds']))
+                    elif record['type'] == 'batch':
+                        self._overheads.append((record['nodes'], record['seconds']))
+        self._fits = {}
+        for key, runs in self._runs.items():
+            self._fits[key] = _fit([nodes for graph, nodes, seconds in runs], [seconds for graph, nodes, seconds in runs])
+        all_runs = [run for runs in self._runs.values() for run in runs]
+        self._page_fit = _fit([nodes for graph, nodes, seconds in all_runs], [seconds for graph, nodes, seconds in all_runs])
+        if self._page_fit is None and len(all_runs) > 0:
+            self._page_fit = (float(np.median([seconds / nodes for graph, nodes, seconds in all_runs])), 1.0)
+        self._overhead_fit = _fit([nodes for nodes, seconds in self._overheads], [seconds for nodes, seconds in self._overheads])
+
+    def run_seconds(self, setup, graph, nodes):
+        '''
+        Predicted seconds of one run and the source of the prediction ('graph', 'setup', 'scaled', 'page' or
+        'default', see the module description).
+        '''
+        runs = self._runs.get(signature(setup), [])
+        same_graph = [seconds for run_graph, run_nodes, seconds in runs if run_graph == graph]
+        if len(same_graph) > 0:
+            return float(np.median(same_graph)), 'graph'
+        fit = self._fits.get(signature(setup))
+        if fit is not None:
+            return fit[0] * nodes ** fit[1], 'setup'
+        if len(runs) > 0:
+            exponent = self._page_fit[1] if self._page_fit is not None else 1.0
+            median_nodes = float(np.median([run_nodes for run_graph, run_nodes, seconds in runs]))
+            return float(np.median([seconds for run_graph, run_nodes, seconds in runs])) * (nodes / median_nodes) ** exponent, 'scaled'
+        if self._page_fit is not None:
+            return self._page_fit[0] * nodes ** self._page_fit[1], 'page'
+        return DEFAULT_SECONDS_PER_NODE * nodes, 'default'
+
+    def batch_seconds(self, nodes):
+        '''
+        Predicted seconds a batch takes besides its runs.
+        '''
+        if self._overhead_fit is not None:
+            return self._overhead_fit[0] * nodes ** self._overhead_fit[1]
+        if len(self._overheads) > 0:
+            return float(np.median([seconds for batch_nodes, seconds in self._overheads]))
+        return DEFAULT_BATCH_SECONDS
+
+
+def makespan(seconds, workers):
+    '''
+    Time until all jobs are done if every job goes to the first free of `workers` workers in the given order.
+    '''
+    loads = [0.0] * max(1, workers)
+    for job in seconds:
+        heapq.heapreplace(loads, loads[0] + job)
+    return max(loads)
+
+
+class Plan:
+    '''
+    Batches of a sweep in the order they are run, with their predicted seconds, and the runs dropped for the budget.
+    '''
+
+    def __init__(self, browser, page, workers, budget):
+        self.browser = browser
+        self.page = page
+        self.workers = workers
+        self.budget = budget
+        self.batches = []  # (batch, keys, runs) with the (setup, run) pairs of the batch
+        self.predicted = []
+        self.sizes = {}
+        self.dropped = []  # (setup, run, predicted seconds)
+        self.durations = None
+        self.elapsed = None
+
+    def makespan(self):
+        return makespan(self.predicted, self.workers)
+
+    def summary(self):
+        text = '%d batches, %d runs, predicted %.0f s on %d workers' % (
+            len(self.batches), sum(len(runs) for batch, keys, runs in self.batches), self.makespan(), self.workers)
+        if len(self.dropped) > 0:
+            text += ', %d runs dropped for the budget of %.0f s' % (len(self.dropped), self.budget)
+        return text
+
+    def to_dict(self):
+        batches = []
+        for b, (batch, keys, runs) in enumerate(self.batches):
+            record = {
+                'graph': batch['graph'],
+                'nodes': self.sizes.get(batch['graph']),
+                'runs': [[setup.get('name'), run] for setup, run in runs],
+                'predicted': self.predicted[b],
+            }
+            if self.durations is not None:
+                record['seconds'] = self.durations[b]
+            batches.append(record)
+        return {
+            'browser': self.browser,
+            'page': self.page,
+            'workers': self.workers,
+            'budget': self.budget,
+            'predicted': self.makespan(),
+            'elapsed': self.elapsed,
+            'batches': batches,
+            'dropped': [{'graph': setup['graph'], 'name': setup.get('name'), 'run': run, 'predicted': seconds, 'setup': setup}
+                        for setup, run, seconds in self.dropped],
+        }
+
+    def write(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=1)
+
+
+def plan(browser, page, runs, workers, budget=None, batch_size=20, history=HISTORY_PATH, min_runs=MIN_RUNS):
+    '''
+    Plans the (setup, run, key) triples on `workers` workers: groups them into batches by graph (see
+    experiments.bench._batches), drops runs if the predicted makespan exceeds `budget` seconds and orders the
+    batches longest first. The `min_runs` lowest runs of a (setup, graph) pair are only dropped all together.
+    '''
+    model = CostModel(browser, page, history)
+    result = Plan(browser, page, workers, budget)
+    result.sizes = graph_sizes(sorted(set(setup['graph'] for setup, run, key in runs)))
+    seconds = [model.run_seconds(setup, setup['graph'], result.sizes[setup['graph']])[0] for setup, run, key in runs]
+
+    def batches(kept):
+        runs_per_graph = {}
+        for i in kept:
+            setup, run, key = runs[i]
+            runs_per_graph.setdefault((setup['graph'], int(setup.get('binary', 0)) == 1), []).append(i)
+        planned = []
+        for (graph, is_binary), indices in runs_per_graph.items():
+            for batch, batch_indices in _batches(graph, [(runs[i][0], i) for i in indices], batch_size, is_binary):
+                cost = model.batch_seconds(result.sizes[graph]) + sum(seconds[i] for i in batch_indices)
+                planned.append((cost, batch, batch_indices))
+        planned.sort(key=lambda job: -job[0])
+        return planned
+
+    # groups of runs dropped together: the repetitions beyond min_runs one by one (highest run index, then most
+    # expensive), then the (setup, graph) pairs, most expensive first
+    runs_per_pair = {}
+    for i, (setup, run, key) in enumerate(runs):
+        runs_per_pair.setdefault(json.dumps(setup, sort_keys=True), []).append(i)
+    repetitions = []
+    pairs = []
+    for indices in runs_per_pair.values():
+        indices = sorted(indices, key=lambda i: runs[i][1])
+        repetitions += indices[min_runs:]
+        pairs.append(indices[:min_runs])
+    removal = [[i] for i in sorted(repetitions, key=lambda i: (-runs[i][1], -seconds[i]))]
+    removal += sorted(pairs, key=lambda indices: -sum(seconds[i] for i in indices))
+    num_removed = 0
+    if budget is not None:
+        low, high = 0, len(removal)
+        while low < high:
+            middle = (low + high) // 2
+            dropped = set(i for group in removal[:middle] for i in group)
+            kept = [i for i in range(len(runs)) if i not in dropped]
+            if makespan([cost for cost, batch, indices in batches(kept)], workers) <= budget:
+                high = middle
+            else:
+                low = middle + 1
+        num_removed = low
+    removed = set(i for group in removal[:num_removed] for i in group)
+    for cost, batch, indices in batches([i for i in range(len(runs)) if i not in removed]):
+        result.batches.append((batch, [runs[i][2] for i in indices], [(runs[i][0], runs[i][1]) for i in indices]))
+        result.predicted.append(cost)
+    result.dropped = [(runs[i][0], runs[i][1], seconds[i]) for i in sorted(removed)]
+    return result
+
+
+def record(result, results, durations, path=HISTORY_PATH):
+    '''
+    Adds the runs and batches of an executed plan to the history: the wallTime of every entry and the rest of the
+    duration of every batch.
+    '''
+    now = time.time()
+    records = []
+    for (batch, keys, runs), entries, duration in zip(result.batches, results, durations):
+        if entries is None or duration is None:
+            continue
+        nodes = result.sizes[batch['graph']]
+        run_seconds = 0.0
+        for (setup, run), entry in zip(runs, entries):
+            if entry is None or entry.get('wallTime') is None:
+                continue
+            run_seconds += entry['wallTime'] / 1000
+            records.append({'type': 'run', 'browser': result.browser, 'page': result.page, 'signature': signature(setup),
+                            'graph': batch['graph'], 'nodes': nodes, 'seconds': entry['wallTime'] / 1000, 'time': now})
+        records.append({'type': 'batch', 'browser': result.browser, 'page': result.page, 'graph': batch['graph'],
+                        'nodes': nodes, 'seconds': max(0.0, duration - run_seconds), 'time': now})
+    if len(records) > 0:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a') as file:
+            for item in records:
+                file.write(json.dumps(item) + '\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the predicted and actual seconds of the batches of a sweep.')
+    parser.add_argument('plan', help='plan file written next to the output of a sweep (results.plan.json)')
+    args = parser.parse_args()
+    with open(args.plan) as file:
+        written = json.load(file)
+    print('predicted %.0f s, took %s s on %d workers' % (
+        written['predicted'], 'n/a' if written['elapsed'] is None else '%.0f' % written['elapsed'], written['workers']))
+    for batch in written['batches']:
+        actual = batch.get('seconds')
+        print('%10.1f %10s  %s (%d runs)' % (batch['predicted'], 'n/a' if actual is None else '%.1f' % actual,
+                                            batch['graph'], len(batch['runs'])))
+    if len(written['dropped']) > 0:
+        print('%d runs dropped for the budget' % len(written['dropped']))
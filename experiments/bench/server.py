@@ -0,0 +1,222 @@
+import asyncio
+import json
+import mimetypes
+import os
+import threading
+import urllib.parse
+from experiments.bench import ROOT_DIR
+
+'''
+Small HTTP server for the experiments.
+It serves the repository (experiment pages, dist/, worker/ and graphs/) and appends every result entry
+POSTed to /results as one line to a JSONL file. Appends are flushed immediately and fsynced in batches,
+so results of a crashed sweep are not lost. Entries POSTed to /results/<key> are also added to the result cache.
+Batches of setups for one graph are registered with add_batch; the page GETs the batch from /batches/<id> and
+POSTs the list of entries (one per run, null for failed runs) back to the same path. Backends without pages
+(experiments.bench.node) hand the entries of their batches to store_batch directly.
+'''
+
+_REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+class ResultServer:
+    def __init__(self, output, cache=None, root=ROOT_DIR, port=0, fsync_every=64, fsync_interval=1.0):
+        self._output = output
+        self._cache = cache
+        self._root = os.path.realpath(root)
+        self._port = port
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._file = None
+        self._pending = 0
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._batches = {}
+        self.num_entries = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        self._file = open(self._output, 'w')
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._serve, args=(started,), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._sync()
+        self._file.close()
+
+    def url(self, path=''):
+        return 'http://127.0.0.1:%d/%s' % (self._port, path.lstrip('/'))
+
+    def _serve(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, '127.0.0.1', self._port))
+        self._port = self._server.sockets[0].getsockname()[1]
+        sync_task = self._loop.create_task(self._sync_periodically())
+        started.set()
+        self._loop.run_forever()
+        sync_task.cancel()
+        self._server.close()
+        self._loop.run_until_complete(asyncio.gather(sync_task, self._server.wait_closed(), return_exceptions=True))
+
+    async def _sync_periodically(self):
+        while True:
+            await asyncio.sleep(self._fsync_interval)
+            if self._pending > 0:
+                self._sync()
+
+    def add_batch(self, batch, keys):
+        '''
+        Registers a batch {"graph", "setups": [{"setup", "runs"}]} and the cache keys of its runs (or None),
+        returns the path of the batch.
+        '''
+        batch_id = str(len(self._batches))
+        self._batches[batch_id] = (json.dumps(batch).encode(), keys)
+        return '/batches/' + batch_id
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        if self._cache is not None:
+            self._cache.sync()
+        self._pending = 0
+
+    def append(self, entries):
+        for entry in entries:
+            self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        self.num_entries += len(entries)
+        self._pending += len(entries)
+        if self._pending >= self._fsync_every:
+            self._sync()
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            if len(request_line) < 2:
+                return
+            method, target = request_line[0], request_line[1]
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1')
+                if line in ('\r\n', '\n', ''):
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            path = urllib.parse.unquote(urllib.parse.urlparse(target).path)
+            if method == 'POST':
+                await self._post(writer, path, body)
+            elif method in ('GET', 'HEAD'):
+                await self._get(writer, path, method == 'HEAD')
+            else:
+                await self._respond(writer, 405)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _post(self, writer, path, body):
+        parts = path.strip('/').split('/')
+        if parts[0] == 'batches' and len(parts) == 2 and parts[1] in self._batches:
+            await self._post_batch(writer, parts[1], body)
+            return
+        if parts[0] != 'results' or len(parts) > 2:
+            await self._respond(writer, 404)
+            return
+        try:
+            entries = json.loads(body)
+        except ValueError:
+            await self._respond(writer, 400)
+            return
+        entries = entries if isinstance(entries, list) else [entries]
+        if len(parts) == 2 and self._cache is not None:
+            for entry in entries:
+                self._cache.add(parts[1], entry)
+        self.append(entries)
+        await self._respond(writer, 204)
+
+    async def _post_batch(self, writer, batch_id, body):
+        try:
+            entries = json.loads(body)
+        except ValueError:
+            await self._respond(writer, 400)
+            return
+        self.store_batch('/batches/' + batch_id, entries)
+        await self._respond(writer, 204)
+
+    def store_batch(self, path, entries):
+        '''
+        Stores the entries of the batch registered under `path` (one per run, None for failed runs)
+        in the output and, for runs with a cache key, in the result cache.
+        '''
+        keys = self._batches[path.rsplit('/', 1)[1]][1]
+        for key, entry in zip(keys, entries):
+            if entry is not None and key is not None and self._cache is not None:
+                self._cache.add(key, entry)
+        self.append([entry for entry in entries if entry is not None])
+
+    async def _get(self, writer, path, head_only):
+        parts = path.strip('/').split('/')
+        if parts[0] == 'batches' and len(parts) == 2 and parts[1] in self._batches:
+            batch = self._batches[parts[1]][0]
+            await self._respond(writer, 200, 'application/json', len(batch))
+            if not head_only:
+                writer.write(batch)
+                await writer.drain()
+            return
+        file_path = os.path.realpath(os.path.join(self._root, path.lstrip('/')))
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, 'index.html')
+        if not file_path.startswith(self._root + os.sep) or not os.path.isfile(file_path):
+            await self._respond(writer, 404)
+            return
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        await self._respond(writer, 200, content_type, os.path.getsize(file_path))
+        if head_only:
+            return
+        with open(file_path, 'rb') as file:
+            while True:
+                chunk = file.read(1 << 20)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await writer.drain()
+
+    async def _respond(self, writer, status, content_type=None, length=0):
+        header = 'HTTP/1.1 %d %s\r\n' % (status, _REASONS[status])
+        if content_type is not None:
+            header += 'Content-Type: ' + content_type + '\r\n'
+        header += 'Content-Length: %d\r\n' % length
+        # cross-origin isolation allows the layouter to use SharedArrayBuffer
+        header += 'Cross-Origin-Opener-Policy: same-origin\r\n'
+        header += 'Cross-Origin-Embedder-Policy: require-corp\r\n'
+        header += 'Cache-Control: no-store\r\n'
+        header += 'Connection: close\r\n\r\n'
+        writer.write(header.encode('latin-1'))
+        await writer.drain()
+
+
+def read(path):
+    '''
+    Reads result entries from a JSON array file or a JSONL file.
+    '''
+    with open(path) as file:
+        if path.endswith('.jsonl'):
+            return [json.loads(line) for line in file if line.strip() != '']
+        return json.load(file)
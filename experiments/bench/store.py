@@ -0,0 +1,326 @@
+import argparse
+import array
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+'''
+Columnar store for experiment results.
+A result file (JSON array or JSONL) is ingested once into a directory of .npy columns next to it
+("results.json" -> "results.store"), which is re-created only if the result file changes:
+- entries/<field>.npy: one value per entry; numbers as float64, strings (e.g. name, graph) as int32 codes into a
+  dictionary kept in meta.json. Nested values like layout geometries are not stored (see eval.layout_quality).
+- paths/row.npy, paths/id.npy, paths/value.npy: timer breakdowns ("doLayout|orderRanks": 12.3) in long format,
+  one (entry row, path id, value) triple per measured path, sorted by entry row.
+- tree/parent.npy, tree/depth.npy: the hierarchy of the pipe-separated paths, one node per path id.
+Columns are loaded memory-mapped and only when requested, and rows are selected by graph and name before
+anything else is read, so large sweeps do not have to fit into memory.
+'''
+
+VERSION = 1
+
+_PATH_SEPARATOR = '|'
+
+
+def _entries(source):
+    with open(source) as file:
+        if source.endswith('.jsonl'):
+            for line in file:
+                if line.strip() != '':
+                    yield json.loads(line)
+        else:
+            yield from json.load(file)
+
+
+def _path_keys(entry):
+    '''
+    Keys of the timer paths in an entry: all keys containing the separator and the roots of these paths.
+    '''
+    paths = {key for key in entry if _PATH_SEPARATOR in key}
+    roots = {path.split(_PATH_SEPARATOR, 1)[0] for path in paths}
+    return paths | (roots & set(entry))
+
+
+def store_path(source):
+    return os.path.splitext(source)[0] + '.store'
+
+
+class _Builder:
+    def __init__(self):
+        self.num_rows = 0
+        self.numeric = {}
+        self.categorical = {}
+        self.dictionaries = {}
+        self.skipped = set()
+        self.path_ids = {}
+        self.path_rows = array.array('q')
+        self.path_values = array.array('d')
+        self.path_id_column = array.array('i')
+
+    def _path_id(self, path):
+        path_id = self.path_ids.get(path)
+        if path_id is None:
+            if _PATH_SEPARATOR in path:
+                # parents come first, so every path has a smaller id than its children
+                self._path_id(path.rsplit(_PATH_SEPARATOR, 1)[0])
+            path_id = len(self.path_ids)
+            self.path_ids[path] = path_id
+        return path_id
+
+    def add(self, entry):
+        row = self.num_rows
+        path_keys = _path_keys(entry)
+        for path in sorted(path_keys):
+            value = entry[path]
+            if isinstance(value, (int, float)) and value is not None:
+                self.path_rows.append(row)
+                self.path_id_column.append(self._path_id(path))
+                self.path_values.append(float(value))
+        for key, value in entry.items():
+            if key in path_keys or key in self.skipped:
+                continue
+            if isinstance(value, str) and key not in self.numeric:
+                codes = self.categorical.get(key)
+                if codes is None:
+                    codes = self.categorical[key] = array.array('i', [-1] * row)
+                    self.dictionaries[key] = {}
+                dictionary = self.dictionaries[key]
+                codes.append(dictionary.setdefault(value, len(dictionary)))
+            elif isinstance(value, (bool, int, float)) and key not in self.categorical:
+                values = self.numeric.get(key)
+                if values is None:
+                    values = self.numeric[key] = array.array('d', [np.nan] * row)
+                values.append(float(value))
+            elif value is not None and not isinstance(value, (str, bool, int, float)):
+                self.skipped.add(key)
+                self.numeric.pop(key, None)
+                self.categorical.pop(key, None)
+        self.num_rows += 1
+        # fill the fields missing in this entry
+        for values in self.numeric.values():
+            if len(values) < self.num_rows:
+                values.append(np.nan)
+        for codes in self.categorical.values():
+            if len(codes) < self.num_rows:
+                codes.append(-1)
+
+    def write(self, path, source):
+        os.makedirs(os.path.join(path, 'entries'))
+        os.makedirs(os.path.join(path, 'paths'))
+        os.makedirs(os.path.join(path, 'tree'))
+        for key, values in self.numeric.items():
+            np.save(os.path.join(path, 'entries', key + '.npy'), np.frombuffer(values, dtype=np.float64))
+        for key, codes in self.categorical.items():
+            np.save(os.path.join(path, 'entries', key + '.npy'), np.frombuffer(codes, dtype=np.int32))
+        np.save(os.path.join(path, 'paths', 'row.npy'), np.frombuffer(self.path_rows, dtype=np.int64))
+        np.save(os.path.join(path, 'paths', 'id.npy'), np.frombuffer(self.path_id_column, dtype=np.int32))
+        np.save(os.path.join(path, 'paths', 'value.npy'), np.frombuffer(self.path_values, dtype=np.float64))
+        paths = sorted(self.path_ids, key=self.path_ids.get)
+        parents = [self.path_ids[p.rsplit(_PATH_SEPARATOR, 1)[0]] if _PATH_SEPARATOR in p else -1 for p in paths]
+        np.save(os.path.join(path, 'tree', 'parent.npy'), np.array(parents, dtype=np.int32))
+        np.save(os.path.join(path, 'tree', 'depth.npy'), np.array([p.count(_PATH_SEPARATOR) for p in paths], dtype=np.int16))
+        stat = os.stat(source)
+        meta = {
+            'version': VERSION,
+            'source': os.path.basename(source),
+            'source_mtime': stat.st_mtime_ns,
+            'source_size': stat.st_size,
+            'rows': self.num_rows,
+            'numeric': sorted(self.numeric),
+            'categories': {key: sorted(dictionary, key=dictionary.get) for key, dictionary in self.dictionaries.items() if key in self.categorical},
+            'skipped': sorted(self.skipped),
+            'paths': paths,
+        }
+        with open(os.path.join(path, 'meta.json'), 'w') as file:
+            json.dump(meta, file)
+
+
+def _up_to_date(source, path):
+    try:
+        with open(os.path.join(path, 'meta.json')) as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return False
+    stat = os.stat(source)
+    return meta.get('version') == VERSION and meta['source_mtime'] == stat.st_mtime_ns and meta['source_size'] == stat.st_size
+
+
+def ingest(source, path=None, force=False):
+    '''
+    Converts a result file into a store (unless the store is up to date) and returns the path of the store.
+    '''
+    path = store_path(source) if path is None else path
+    if not force and _up_to_date(source, path):
+        return path
+    builder = _Builder()
+    for entry in _entries(source):
+        builder.add(entry)
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    builder.write(tmp_path, source)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+class Store:
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as file:
+            self._meta = json.load(file)
+        self._path_ids = {p: i for i, p in enumerate(self._meta['paths'])}
+
+    def __len__(self):
+        return self._meta['rows']
+
+    def columns(self):
+        return self._meta['numeric'] + list(self._meta['categories'])
+
+    def paths(self):
+        return list(self._meta['paths'])
+
+    def path_tree(self):
+        '''
+        Hierarchy of the timer paths: one row per path with id, parent path (None at the top), depth and last part.
+        '''
+        paths = self._meta['paths']
+        parents = self._load('tree', 'parent')
+        return pd.DataFrame({
+            'path': paths,
+            'parent': [paths[parent] if parent >= 0 else None for parent in parents],
+            'depth': np.asarray(self._load('tree', 'depth')),
+            'part': [p.rsplit(_PATH_SEPARATOR, 1)[-1] for p in paths],
+        })
+
+    def descendants(self, path, include_self=True):
+        '''
+        All paths below the given path in the hierarchy.
+        '''
+        prefix = path + _PATH_SEPARATOR
+        return [p for p in self._meta['paths'] if p.startswith(prefix) or (include_self and p == path)]
+
+    def _load(self, directory, name):
+        return np.load(os.path.join(self.path, directory, name + '.npy'), mmap_mode='r')
+
+    def _column(self, name, rows):
+        values = self._load('entries', name)[rows]
+        if name in self._meta['categories']:
+            return pd.Categorical.from_codes(values, categories=self._meta['categories'][name])
+        return np.asarray(values)
+
+    def _codes(self, name, values):
+        categories = self._meta['categories'].get(name, [])
+        return [categories.index(value) for value in values if value in categories]
+
+    def rows(self, graphs=None, names=None):
+        '''
+        Indices of the entries of the given graphs and names (all if None).
+        '''
+        mask = np.ones(len(self), dtype=bool)
+        for name, values in (('graph', graphs), ('name', names)):
+            if values is not None:
+                if isinstance(values, str):
+                    values = [values]
+                if name not in self._meta['categories']:
+                    return np.zeros(0, dtype=np.int64)
+                mask &= np.isin(self._load('entries', name), self._codes(name, values))
+        return np.flatnonzero(mask)
+
+    def entries(self, columns=None, graphs=None, names=None, rows=None):
+        '''
+        DataFrame of the scalar fields, indexed by entry row; only the given columns and rows are read.
+        '''
+        rows = self.rows(graphs, names) if rows is None else rows
+        columns = self.columns() if columns is None else [c for c in columns if c in self.columns()]
+        return pd.DataFrame({column: self._column(column, rows) for column in columns}, index=pd.Index(rows, name='row'))
+
+    def _path_positions(self, rows):
+        # the long table is sorted by entry row, so the values of every entry are a contiguous range
+        path_rows = self._load('paths', 'row')
+        starts = np.searchsorted(path_rows, rows, side='left')
+        ends = np.searchsorted(path_rows, rows, side='right')
+        counts = ends - starts
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return offsets + np.arange(counts.sum())
+
+    def breakdown(self, paths=None, graphs=None, names=None, columns=('name', 'graph')):
+        '''
+        Timer values in long format: one row per entry and path with the columns row, path, depth, value and the
+        requested entry columns. `paths` restricts the result to the given paths (all if None).
+        '''
+        rows = self.rows(graphs, names)
+        positions = self._path_positions(rows)
+        path_rows = np.asarray(self._load('paths', 'row')[positions])
+        path_ids = np.asarray(self._load('paths', 'id')[positions])
+        values = np.asarray(self._load('paths', 'value')[positions])
+        if paths is not None:
+            keep = np.isin(path_ids, [self._path_ids[p] for p in paths if p in self._path_ids])
+            path_rows, path_ids, values = path_rows[keep], path_ids[keep], values[keep]
+        depths = np.asarray(self._load('tree', 'depth'))
+        df = pd.DataFrame({
+            'row': path_rows,
+            'path': pd.Categorical.from_codes(path_ids, categories=self._meta['paths']),
+            'depth': depths[path_ids],
+            'value': values,
+        })
+        if len(columns) > 0:
+            df = df.join(self.entries(columns, rows=rows), on='row')
+        return df
+
+    def wide(self, paths=None, columns=None, graphs=None, names=None):
+        '''
+        Entries with one column per timer path (NaN where a path was not measured), like pd.json_normalize of the
+        raw results, but only for the requested paths (all if None) and entry columns.
+        '''
+        rows = self.rows(graphs, names)
+        df = self.entries(columns, rows=rows)
+        paths = self.paths() if paths is None else list(paths)
+        positions = self._path_positions(rows)
+        path_rows = np.asarray(self._load('paths', 'row')[positions])
+        path_ids = np.asarray(self._load('paths', 'id')[positions])
+        values = np.asarray(self._load('paths', 'value')[positions])
+        column_of_id = np.full(len(self._meta['paths']), -1)
+        for column, path in enumerate(paths):
+            if path in self._path_ids:
+                column_of_id[self._path_ids[path]] = column
+        columns_of_values = column_of_id[path_ids]
+        keep = columns_of_values >= 0
+        matrix = np.full((len(rows), len(paths)), np.nan)
+        matrix[np.searchsorted(rows, path_rows[keep]), columns_of_values[keep]] = values[keep]
+        return pd.concat([df, pd.DataFrame(matrix, index=df.index, columns=paths)], axis=1)
+
+
+def open_results(source):
+    '''
+    Returns the store of a result file, ingesting it first if needed.
+    '''
+    return Store(ingest(source))
+
+
+def load(source, columns=None, graphs=None, names=None, paths=None):
+    '''
+    Loads the entries of a result file as DataFrame, replacing json.load and pd.json_normalize in the plot scripts.
+    Only the given entry columns (all if None) and timer paths (none if None, all if 'all') of the entries of the
+    given graphs and names are read. String fields are returned as plain columns instead of categoricals.
+    '''
+    store = open_results(source)
+    if paths is None:
+        df = store.entries(columns, graphs, names)
+    else:
+        df = store.wide(None if paths == 'all' else paths, columns, graphs, names)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+    return df
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ingest result files into columnar stores.')
+    parser.add_argument('sources', nargs='+')
+    parser.add_argument('--force', action='store_true', help='ingest even if the store is up to date')
+    args = parser.parse_args()
+    for source in args.sources:
+        store = Store(ingest(source, force=args.force))
+        print(store.path + ': ' + str(len(store)) + ' entries, ' + str(len(store.paths())) + ' timer paths')
@@ -0,0 +1,102 @@
+import argparse
+import itertools
+import runpy
+import time
+from experiments.bench.performance import _run_experiments as _run_performance
+from experiments.bench.performance.frames import _run_frames
+from experiments.bench.quality import _run_experiments as _run_quality
+
+'''
+Declarative experiment sweeps. A sweep is a dict like
+    {
+        'measure': 'breakdown',     # time, breakdown, count, memory, trace, profile, frames or quality measures
+        'browser': 'firefox',       # firefox, chrome or node
+        'layouters': [{'name': 'SUG', 'layouter': 'sugiyama'},
+                      grid('SUG-S{numShuffles}', layouter='sugiyama', numShuffles=[1, 10, 100], jointOrder=0)],
+        'graphs': WIDE,             # and/or a catalog 'query', like the experiments of the measure modules
+        'runs': 5,
+        'budget': 3600,             # optional, in seconds
+        'output': 'results/shuffling.jsonl',
+    }
+Other keys (output, workers, pin, cache, batch_size, adaptive, memory, frames) are passed to the runner of the
+measure. Runs are scheduled by experiments.bench.schedule: longest batches first, thinned to fit the budget.
+Scripts define a list SWEEPS and run it with run(SWEEPS), or are run with
+    python -m experiments.bench.sweep experiments/scripts/shuffling/shuffling.py [--budget 28800] [--plan]
+which only prints the plans with --plan.
+'''
+
+PERFORMANCE_MEASURES = {
+    'time': {},
+    'breakdown': {'breakdown': True},
+    'count': {'breakdown': True, 'count': True},
+    'memory': {'memory': 'peak'},
+    'trace': {'trace': True},
+    'profile': {'profile': True},
+}
+
+# keys of a sweep that describe its experiment instead of being passed to the runner
+_EXPERIMENT_KEYS = ('measure', 'browser', 'layouters', 'graphs', 'query', 'runs', 'budget')
+
+
+def grid(name, **parameters):
+    '''
+    One setup per combination of the list-valued parameters (the others are the same in all setups), named by
+    formatting `name` with the parameters, e.g. grid('SUG-S{numShuffles}', layouter='sugiyama', numShuffles=[0, 1]).
+    '''
+    names = [parameter for parameter, value in parameters.items() if isinstance(value, (list, tuple))]
+    setups = []
+    for values in itertools.product(*(parameters[parameter] for parameter in names)):
+        setup = dict(parameters, **dict(zip(names, values)))
+        setups.append(dict({'name': name.format(**setup)}, **setup))
+    return setups
+
+
+def _layouters(sweep):
+    layouters = []
+    for layouter in sweep['layouters']:
+        layouters.extend(layouter if isinstance(layouter, list) else [layouter])
+    return layouters
+
+
+def run_sweep(sweep, budget=None, dry_run=False):
+    '''
+    Runs one sweep, within `budget` seconds if given (or the budget of the sweep, whichever is lower), and returns
+    its plan (see experiments.bench.schedule).
+    '''
+    if sweep.get('budget') is not None:
+        budget = sweep['budget'] if budget is None else min(budget, sweep['budget'])
+    experiment = {'layouters': _layouters(sweep), 'runs': sweep.get('runs', 1)}
+    for key in ('graphs', 'query'):
+        if key in sweep:
+            experiment[key] = sweep[key]
+    kwargs = {key: value for key, value in sweep.items() if key not in _EXPERIMENT_KEYS}
+    browser = sweep.get('browser', 'chrome')
+    measure = sweep.get('measure', 'time')
+    if measure == 'frames':
+        return _run_frames(browser, [experiment], budget=budget, dry_run=dry_run, **kwargs)
+    if isinstance(measure, str) and measure in PERFORMANCE_MEASURES:
+        kwargs = dict(PERFORMANCE_MEASURES[measure], **kwargs)
+        return _run_performance(browser, [experiment], budget=budget, dry_run=dry_run, **kwargs)
+    return _run_quality(browser, [experiment], measure, budget=budget, dry_run=dry_run, **kwargs)
+
+
+def run(sweeps, budget=None, dry_run=False):
+    '''
+    Runs the sweeps one after the other; with `budget` in seconds, every sweep gets what the previous ones left
+    (with `dry_run`, what their predicted times left). Returns their plans.
+    '''
+    start = time.time()
+    plans = []
+    for sweep in sweeps:
+        used = sum(plan.makespan() for plan in plans) if dry_run else time.time() - start
+        plans.append(run_sweep(sweep, None if budget is None else max(0.0, budget - used), dry_run))
+    return plans
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the sweeps defined as SWEEPS in a script.')
+    parser.add_argument('script', help='python file defining SWEEPS')
+    parser.add_argument('--budget', type=float, default=None, help='seconds for all sweeps together')
+    parser.add_argument('--plan', action='store_true', help='only print the plans')
+    args = parser.parse_args()
+    run(runpy.run_path(args.script)['SWEEPS'], args.budget, args.plan)
@@ -0,0 +1,271 @@
+import argparse
+import inspect
+import json
+import os
+import random
+from experiments.bench import ROOT_DIR
+
+'''
+Generator of synthetic SDFGs for scaling experiments.
+The graphs have the structure the layouters expect from real SDFGs: an SDFG is a (possibly cyclic) graph of states
+connected by interstate edges, every state holds an acyclic dataflow graph of access nodes, tasklets, map scopes
+(MapEntry and MapExit with scoped IN_/OUT_ connector pairs around their contents) and nested SDFGs.
+Edges only connect nodes of the same scope, or enter a scope through its entry and leave it through its exit.
+All randomness comes from the seed, so the same parameters always give the same file.
+'''
+
+SYNTHETIC_DIR = 'synthetic'
+
+_RANGE = {"type": "Range", "ranges": [{"start": "0", "end": "N - 1", "step": "1", "tile": "1"}]}
+
+
+class _State:
+    '''
+    Nodes and edges of one state under construction. A port is a (node id, connector name or None) pair.
+    '''
+
+    def __init__(self, generator, label):
+        self.generator = generator
+        self.label = label
+        self.nodes = []
+        self.edges = []
+
+    def add_node(self, node_type, label, scope_entry, in_connectors=(), out_connectors=(), attributes=None):
+        node_id = len(self.nodes)
+        node_attributes = {
+            "label": label,
+            "in_connectors": {name: None for name in in_connectors},
+            "out_connectors": {name: None for name in out_connectors},
+        }
+        node_attributes.update(attributes or {})
+        self.nodes.append({
+            "type": node_type,
+            "label": label,
+            "id": node_id,
+            "scope_entry": None if scope_entry is None else str(scope_entry),
+            "scope_exit": None,
+            "attributes": node_attributes,
+        })
+        self.generator.num_nodes += 1
+        return node_id
+
+    def add_edge(self, src, dst):
+        data = "A" + str(src[0])
+        self.edges.append({
+            "type": "MultiConnectorEdge",
+            "src": str(src[0]),
+            "dst": str(dst[0]),
+            "src_connector": src[1],
+            "dst_connector": dst[1],
+            "attributes": {"data": {"type": "Memlet", "attributes": {"data": data, "subset": _RANGE}}},
+        })
+        self.generator.num_edges += 1
+
+    def to_json(self, state_id):
+        return {
+            "type": "SDFGState",
+            "label": self.label,
+            "id": state_id,
+            "collapsed": False,
+            "scope_dict": {},
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "attributes": {"in_connectors": {}, "out_connectors": {}},
+        }
+
+
+class Generator:
+    '''
+    Builds a synthetic SDFG with about `nodes` nodes (states, scopes and nested SDFGs included):
+    - state_size: nodes per state, so the SDFG has about nodes / state_size states
+    - depth: maximum nesting depth of nested SDFGs (0: no nested SDFGs)
+    - map_depth: maximum nesting depth of map scopes inside a state
+    - map_fraction: probability that a new unit of a scope is a map scope
+    - nested_fraction: probability that a new unit of a scope is a nested SDFG
+    - fan_in, fan_out: maximum number of inputs and outputs of tasklets, maps and nested SDFGs (their connectors)
+    - density: additional edges per node, added between earlier outputs and later access nodes
+    - locality: number of most recent outputs an input is connected to (smaller is more local, i.e. longer chains)
+    - loops: probability of a backward interstate edge per state, creating cycles in the state graph
+    '''
+
+    def __init__(self, nodes=1000, state_size=250, depth=1, map_depth=2, map_fraction=0.15, nested_fraction=0.01,
+                 fan_in=3, fan_out=2, density=0.1, locality=8, loops=0.2, seed=0):
+        self.target = nodes
+        self.state_size = state_size
+        self.depth = depth
+        self.map_depth = map_depth
+        self.map_fraction = map_fraction
+        self.nested_fraction = nested_fraction
+        self.fan_in = fan_in
+        self.fan_out = fan_out
+        self.density = density
+        self.locality = locality
+        self.loops = loops
+        self.random = random.Random(seed)
+        self.num_nodes = 0
+        self.num_edges = 0
+
+    def _source(self, state, available, scope_entry):
+        # an output port to connect an input to; a new access node if none is available
+        if len(available) == 0:
+            node = state.add_node("AccessNode", "A" + str(len(state.nodes)), scope_entry)
+            available.append((node, None))
+        window = available[-self.locality:]
+        return self.random.choice(window)
+
+    def _block(self, state, scope_entry, budget, map_level, sdfg_level, sources, sinks):
+        '''
+        Adds about `budget` nodes to the scope of scope_entry. Inputs of new units are connected to the outputs of
+        earlier ones (starting with the ports in sources), and the ports in sinks are connected at the end.
+        '''
+        available = list(sources)
+        access_nodes = []
+        start = self.num_nodes
+        while self.num_nodes - start < budget:
+            remaining = budget - (self.num_nodes - start)
+            choice = self.random.random()
+            if map_level < self.map_depth and remaining >= 6 and choice < self.map_fraction:
+                outputs = self._map(state, scope_entry, min(remaining - 2, self._unit_size(remaining)),
+                                    map_level, sdfg_level, available)
+            elif sdfg_level < self.depth and remaining >= 8 and choice < self.map_fraction + self.nested_fraction:
+                outputs = self._nested_sdfg(state, scope_entry, min(remaining - 1, self._unit_size(remaining)),
+                                            sdfg_level, available)
+            elif choice < 0.6:
+                node = state.add_node("Tasklet", "t" + str(len(state.nodes)), scope_entry,
+                                      ["in" + str(i) for i in range(self.random.randint(1, self.fan_in))],
+                                      ["out" + str(i) for i in range(self.random.randint(1, self.fan_out))])
+                for connector in state.nodes[node]["attributes"]["in_connectors"]:
+                    state.add_edge(self._source(state, available, scope_entry), (node, connector))
+                outputs = [(node, connector) for connector in state.nodes[node]["attributes"]["out_connectors"]]
+            else:
+                node = state.add_node("AccessNode", "A" + str(len(state.nodes)), scope_entry)
+                if len(available) > 0:
+                    state.add_edge(self._source(state, available, scope_entry), (node, None))
+                access_nodes.append((len(available), node))
+                outputs = [(node, None)]
+            available.extend(outputs)
+        # more edges into access nodes, always from outputs created before the access node (acyclic)
+        for _ in range(int(round(self.density * (self.num_nodes - start)))):
+            if len(access_nodes) == 0:
+                break
+            position, node = self.random.choice(access_nodes)
+            if position > 0:
+                state.add_edge(available[self.random.randrange(max(0, position - self.locality), position)], (node, None))
+        for sink in sinks:
+            state.add_edge(self._source(state, available, scope_entry), sink)
+        return available
+
+    def _unit_size(self, remaining):
+        # sizes of scopes and nested SDFGs vary over orders of magnitude, like in real SDFGs
+        return max(4, int(remaining * self.random.random() ** 2))
+
+    def _map(self, state, scope_entry, budget, map_level, sdfg_level, available):
+        names_in = ["v" + str(i) for i in range(self.random.randint(1, self.fan_in))]
+        names_out = ["v" + str(i) for i in range(self.random.randint(1, self.fan_out))]
+        label = "map_" + str(len(state.nodes))
+        entry = state.add_node("MapEntry", label + "[i=0:N]", scope_entry,
+                               ["IN_" + name for name in names_in], ["OUT_" + name for name in names_in])
+        for name in names_in:
+            state.add_edge(self._source(state, available, scope_entry), (entry, "IN_" + name))
+        # the exit is created before the contents, so that it can be passed as sink; ids do not need to be ordered
+        exit_node = state.add_node("MapExit", label, entry,
+                                   ["IN_" + name for name in names_out], ["OUT_" + name for name in names_out])
+        state.nodes[entry]["scope_exit"] = str(exit_node)
+        self._block(state, entry, budget, map_level + 1, sdfg_level,
+                    [(entry, "OUT_" + name) for name in names_in], [(exit_node, "IN_" + name) for name in names_out])
+        return [(exit_node, "OUT_" + name) for name in names_out]
+
+    def _nested_sdfg(self, state, scope_entry, budget, sdfg_level, available):
+        names_in = ["in" + str(i) for i in range(self.random.randint(1, self.fan_in))]
+        names_out = ["out" + str(i) for i in range(self.random.randint(1, self.fan_out))]
+        label = "nested_" + str(len(state.nodes))
+        node = state.add_node("NestedSDFG", label, scope_entry, names_in, names_out)
+        state.nodes[node]["attributes"]["sdfg"] = self._sdfg(label, budget, sdfg_level + 1)
+        for name in names_in:
+            state.add_edge(self._source(state, available, scope_entry), (node, name))
+        return [(node, name) for name in names_out]
+
+    def _sdfg(self, label, budget, sdfg_level):
+        num_states = max(1, int(round(budget / self.state_size)))
+        start = self.num_nodes
+        states = []
+        for s in range(num_states):
+            state = _State(self, label + "_state" + str(s))
+            self.num_nodes += 1  # the state node itself
+            remaining = budget - (self.num_nodes - start)
+            state_budget = max(1, remaining // (num_states - s))
+            self._block(state, None, state_budget, 0, sdfg_level, [], [])
+            states.append(state.to_json(s))
+        edges = []
+        for s in range(1, num_states):
+            edges.append(self._interstate_edge(s - 1, s))
+            if self.random.random() < self.loops:
+                edges.append(self._interstate_edge(s, self.random.randrange(0, s)))
+        return {
+            "type": "SDFG",
+            "label": label,
+            "attributes": {"name": label},
+            "nodes": states,
+            "edges": edges,
+            "start_state": 0,
+        }
+
+    def _interstate_edge(self, src, dst):
+        self.num_edges += 1
+        label = "" if dst > src else "i < N"
+        return {
+            "type": "Edge",
+            "src": str(src),
+            "dst": str(dst),
+            "attributes": {"data": {"type": "InterstateEdge", "attributes": {"label": label}, "label": label}},
+        }
+
+    def generate(self):
+        self.num_nodes = 0
+        self.num_edges = 0
+        return self._sdfg("synthetic", self.target, 0)
+
+
+def name(nodes, seed=0, **kwargs):
+    '''
+    Graph name (relative to the graphs directory, without extension) of a synthetic SDFG.
+    Only the parameters that differ from the defaults of Generator are part of the name.
+    '''
+    defaults = {key: parameter.default for key, parameter in inspect.signature(Generator).parameters.items()}
+    parts = ['n' + str(nodes)]
+    parts += [key + str(value) for key, value in sorted(kwargs.items()) if value != defaults[key]]
+    parts.append('s' + str(seed))
+    return SYNTHETIC_DIR + '/' + '_'.join(parts)
+
+
+def write(nodes, seed=0, graph_dir=os.path.join(ROOT_DIR, 'graphs'), **kwargs):
+    '''
+    Generates a synthetic SDFG and writes it to the graphs directory unless it exists already; returns its name.
+    '''
+    graph = name(nodes, seed, **kwargs)
+    path = os.path.join(graph_dir, graph + '.json')
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sdfg = Generator(nodes, seed=seed, **kwargs).generate()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(sdfg, file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    return graph
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write synthetic SDFGs to the graphs directory.')
+    parser.add_argument('nodes', type=int, nargs='+', help='approximate number of nodes of every graph')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--state-size', type=int, default=250)
+    parser.add_argument('--depth', type=int, default=1, help='maximum nesting depth of nested SDFGs')
+    parser.add_argument('--map-depth', type=int, default=2, help='maximum nesting depth of map scopes')
+    parser.add_argument('--fan-in', type=int, default=3)
+    parser.add_argument('--fan-out', type=int, default=2)
+    parser.add_argument('--density', type=float, default=0.1, help='additional edges per node')
+    parser.add_argument('--graphs', default=os.path.join(ROOT_DIR, 'graphs'), help='graph directory')
+    args = parser.parse_args()
+    for nodes in args.nodes:
+        print(write(nodes, args.seed, args.graphs, state_size=args.state_size, depth=args.depth,
+                    map_depth=args.map_depth, fan_in=args.fan_in, fan_out=args.fan_out, density=args.density))
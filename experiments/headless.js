@@ -0,0 +1,242 @@
+/*
+ * Runs experiments with layoutLib in Node.js, without a browser.
+ * Reads one request per line from stdin and writes one response per line to stdout.
+ * A request is either a batch like the ones the experiment pages fetch,
+ *     {"id": ..., "graph": "npbench/polybench/atax", "setups": [{"setup": {...}, "runs": 3}]}
+ * where a setup holds the same parameters as the URL of performance.html or quality.html,
+ * or a single setup
+ *     {"id": ..., "graph": "bert", "layouter": "sugiyama", "options": {...}, "measure": "cost", "runs": 3}
+ * The response is {"id": ..., "entries": [...]} with one entry per run (null for failed runs),
+ * or {"id": ..., "error": "..."} if the graph could not be loaded. Every entry holds the time the whole run took in ms
+ * (wallTime, for the cost model of experiments/bench/schedule.py).
+ * Measures "time", "breakdown", "count", "memory" and "trace" correspond to performance.html, all others to quality.html.
+ * Quality measures can be combined, e.g. "cost,crossings,time" takes all of them (including the layout time) from one
+ * layout and returns them in one entry.
+ * With adaptive=1, "time" runs until the confidence interval of the mean is narrow enough (see RunControl).
+ * With "binary": 1, the batch loads the graph from the binary file compiled by experiments/bench/binary.py instead of
+ * the JSON file, and the entries of time, breakdown, count, memory and trace runs hold the format, time (loadTime, ms)
+ * and heap growth (loadHeap, bytes) of loading the graph.
+ * With profile=1, every run is recorded as sampling CPU profile (interval profileInterval in microseconds, default
+ * 100); the entry refers to its profile by a title, and the response holds the profiles as {"profiles": {title: ...}}.
+ * Node sizes are computed by the HeadlessRenderer, so they differ slightly from the ones of a browser.
+ *
+ * Usage: node experiments/headless.js [graph directory]
+ */
+const fs = require("fs");
+const inspector = require("inspector");
+const path = require("path");
+const readline = require("readline");
+const vm = require("vm");
+
+// stdout carries the responses, log output of the layouter goes to stderr
+console.log = console.error;
+
+const rootDir = path.dirname(__dirname);
+const layoutLibPath = path.join(rootDir, "dist", "layoutLib.js");
+vm.runInThisContext(fs.readFileSync(layoutLibPath, "utf8"), {filename: layoutLibPath});
+
+const graphDir = (process.argv.length > 2 ? process.argv[2] : path.join(rootDir, "graphs"));
+const renderer = new layoutLib.renderer.HeadlessRenderer();
+
+function loadFile(name, basePath) {
+    return fs.promises.readFile(path.join(basePath, name + ".json"), "utf8")
+        .then(text => layoutLib.Parser.parse(JSON.parse(text)))
+        .catch(() => null);
+}
+
+function loadBinaryFile(name, basePath) {
+    return fs.promises.readFile(path.join(basePath, name + ".bin"))
+        .then(data => layoutLib.BinaryParser.parse(data.buffer, data.byteOffset))
+        .catch(() => null);
+}
+
+const PERFORMANCE_MEASURES = ['time', 'breakdown', 'count', 'memory', 'trace'];
+
+// get(name) returns the setup parameter as string or null, like URLSearchParams.get in the experiment pages
+function createLayouter(get) {
+    let layouterClass;
+    switch (get('layouter')) {
+        case 'dagre':
+            layouterClass = layoutLib.layouter.DagreLayouter;
+            break;
+        case 'magnetic':
+            layouterClass = layoutLib.layouter.MagneticSpringLayouter;
+            break;
+        default:
+            layouterClass = layoutLib.layouter.SugiyamaLayouter;
+            break;
+    }
+    const options = {};
+    options["compactRanks"] = (parseInt(get('compactRanks') || "1") === 1);
+    options["jointOrder"] = (parseInt(get('jointOrder') || "1") === 1);
+    options["numShuffles"] = parseInt(get('numShuffles') || "0");
+    options["optimizeAngles"] = (parseInt(get('optimizeAngles') || "0") === 1);
+    options["bundle"] = (parseInt(get('bundle') || "0") === 1);
+    // there are no web workers in node, parallel runs are handled by running one process per core
+    options["webWorkers"] = false;
+    options["maxWorkers"] = 0;
+    options["lazy"] = (parseInt(get('lazy') || "0") === 1);
+    // iteration, cooling, tolerance and repulsion cutoff of the magnetic spring layouter, only if given
+    for (const option of ['numIterations', 'rampIterations', 'cooling', 'tolerance', 'repulsionCutoff']) {
+        if (get(option) !== null) {
+            options[option] = parseFloat(get(option));
+        }
+    }
+    return new layouterClass(options);
+}
+
+function measureOf(get) {
+    if (get('measure') !== null) {
+        return get('measure');
+    }
+    if (get('memory') !== null) {
+        return 'memory';
+    }
+    if (parseInt(get('trace') || "0") === 1) {
+        return 'trace';
+    }
+    if (parseInt(get('breakdown') || "0") === 1) {
+        return 'breakdown';
+    }
+    return (parseInt(get('count') || "0") === 1) ? 'count' : 'time';
+}
+
+// options of layoutLib.RunControl for adaptive timing (setup parameter adaptive=1)
+function runControlOptions(get) {
+    const options = {};
+    const names = {warmupRuns: 'warmupRuns', minRuns: 'minRuns', maxRuns: 'maxRuns', targetRelativeCi: 'targetCi', budget: 'budget'};
+    for (const option in names) {
+        if (get(names[option]) !== null) {
+            options[option] = parseFloat(get(names[option]));
+        }
+    }
+    return options;
+}
+
+async function runSetup(renderGraph, graph, get) {
+    const measure = measureOf(get);
+    const layouter = createLayouter(get);
+    // lazy=1: the nested graphs from depth collapseDepth on (0 for the top-level states) are laid out collapsed
+    if (parseInt(get('lazy') || "0") === 1) {
+        renderGraph.collapseFrom(get('collapseDepth') !== null ? parseInt(get('collapseDepth')) : Number.POSITIVE_INFINITY);
+    }
+    try {
+        const entry = {name: get('name') || '???', graph: graph};
+        switch (measure) {
+            case 'time':
+                if (parseInt(get('adaptive') || "0") === 1) {
+                    const statistics = await layoutLib.Bench.runtimeAdaptive(renderGraph, layouter, runControlOptions(get));
+                    return Object.assign(entry, {time: statistics.median}, statistics);
+                }
+                entry["time"] = (await layoutLib.Bench.runtimeSized(renderGraph, layouter, 1))[0];
+                return entry;
+            case 'breakdown':
+                return Object.assign(await layoutLib.Bench.runtimeSized(renderGraph, layouter, 1, true), entry);
+            case 'memory':
+                return Object.assign(await layoutLib.Bench.memorySized(renderGraph, layouter, get('memory') === 'delta'), entry);
+            case 'trace':
+                return Object.assign(await layoutLib.Bench.traceSized(renderGraph, layouter), entry);
+            case 'count':
+                return Object.assign(await layoutLib.Bench.runtimeSized(renderGraph, layouter, 1, false, true), entry);
+            default:
+                // one or more comma-separated quality measures, all taken from one layout
+                return Object.assign(entry, await layoutLib.Bench.runMeasures(measure.split(','), renderGraph, layouter));
+        }
+    } finally {
+        layouter.cleanUp();
+    }
+}
+
+// in-process DevTools session for CPU profiles; unlike --cpu-prof, which writes one profile per process at exit,
+// it can record every run separately
+let profilerSession = null;
+
+function profilerPost(method, params = {}) {
+    return new Promise((resolve, reject) => {
+        profilerSession.post(method, params, (error, result) => (error ? reject(error) : resolve(result)));
+    });
+}
+
+async function runProfiled(renderGraph, graph, get, profiles) {
+    if (parseInt(get('profile') || "0") !== 1) {
+        return runSetup(renderGraph, graph, get);
+    }
+    if (profilerSession === null) {
+        profilerSession = new inspector.Session();
+        profilerSession.connect();
+        await profilerPost("Profiler.enable");
+    }
+    await profilerPost("Profiler.setSamplingInterval", {interval: parseInt(get('profileInterval') || "100")});
+    await profilerPost("Profiler.start");
+    let entry = null;
+    try {
+        entry = await runSetup(renderGraph, graph, get);
+    } finally {
+        const {profile} = await profilerPost("Profiler.stop");
+        if (entry !== null) {
+            entry["profile"] = Date.now().toString(36) + "-" + Math.random().toString(36).slice(2, 10);
+            profiles[entry["profile"]] = profile;
+        }
+    }
+    return entry;
+}
+
+function setupsOf(request) {
+    if (request.setups !== undefined) {
+        return request.setups;
+    }
+    const setup = Object.assign({}, request.options || {});
+    for (const name of ['layouter', 'measure', 'name']) {
+        if (request[name] !== undefined) {
+            setup[name] = request[name];
+        }
+    }
+    return [{setup: setup, runs: (request.runs === undefined ? 1 : request.runs)}];
+}
+
+async function handle(request) {
+    const binary = (parseInt(request.binary || "0") === 1);
+    let load;
+    try {
+        load = await layoutLib.Bench.loadSizedTimed(binary ? loadBinaryFile : loadFile, request.graph, renderer, graphDir);
+    } catch (e) {
+        return {id: request.id, error: e.message};
+    }
+    const loadInfo = {format: (binary ? 'binary' : 'json'), loadTime: load.loadTime, loadHeap: load.loadHeap};
+    const entries = [];
+    const profiles = {};
+    for (const {setup, runs} of setupsOf(request)) {
+        const get = (name) => ((setup[name] === undefined || setup[name] === null) ? null : String(setup[name]));
+        for (let run = 0; run < runs; ++run) {
+            const start = performance.now();
+            const entry = await runProfiled(load.renderGraph, request.graph, get, profiles).catch(() => null);
+            if (entry !== null) {
+                entry["wallTime"] = performance.now() - start;
+            }
+            entries.push((entry === null || !PERFORMANCE_MEASURES.includes(measureOf(get))) ? entry : Object.assign(entry, loadInfo));
+        }
+    }
+    const response = {id: request.id, entries: entries};
+    if (Object.keys(profiles).length > 0) {
+        response["profiles"] = profiles;
+    }
+    return response;
+}
+
+async function main() {
+    const lines = readline.createInterface({input: process.stdin, crlfDelay: Infinity});
+    for await (const line of lines) {
+        if (line.trim() === "") {
+            continue;
+        }
+        let response;
+        try {
+            response = await handle(JSON.parse(line));
+        } catch (e) {
+            response = {id: null, error: e.message};
+        }
+        process.stdout.write(JSON.stringify(response) + "\n");
+    }
+}
+
+main();
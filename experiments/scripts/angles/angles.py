@@ -1,8 +1,8 @@
 from experiments.bench.graphs import *
-import experiments.bench.quality.cost as cost
+import experiments.bench.quality.measures as measures
 
 layouters = [
     {'name': 'SUG-J', 'layouter': 'sugiyama'},
     {'name': 'SUG-JA', 'layouter': 'sugiyama', 'optimizeAngles': 1},
 ]
-cost.chrome([{"layouters": layouters, "graphs": POLY + TALL + PORT + WIDE, "runs": 1}])
\ No newline at end of file
+measures.chrome([{"layouters": layouters, "graphs": POLY + TALL + PORT + WIDE, "runs": 1}], ['cost', 'crossings'])
\ No newline at end of file
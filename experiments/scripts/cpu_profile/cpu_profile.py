@@ -0,0 +1,20 @@
+from experiments.bench import catalog
+from experiments.bench import synthetic
+from experiments.bench.eval import profile
+import experiments.bench.performance.profile as prof
+
+# CPU profiles of the sugiyama layouters on synthetic graphs of three sizes
+graphs = [synthetic.write(size, seed) for size in [1000, 10000, 100000] for seed in range(2)]
+layouters = [
+    {'name': 'SUG', 'layouter': 'sugiyama', 'jointOrder': 0, 'numShuffles': 0},
+    {'name': 'SUG-J', 'layouter': 'sugiyama', 'jointOrder': 1, 'numShuffles': 0},
+]
+prof.node([{"layouters": layouters, "graphs": graphs, "runs": 2}], output='results/profile.jsonl')
+
+# hottest functions by self time per node, and flame graphs of the time per node (ns) for speedscope
+sizes = catalog.load()
+stack_df = profile.load('results/profile.jsonl')
+print(profile.hot_functions(profile.functions(stack_df), sizes, n=30).to_string())
+merged = profile.merge(stack_df, sizes)
+profile.write_folded(merged[merged['name'] == 'SUG-J'], 'results/profile_SUG-J.folded', scale=1000)
+profile.write_speedscope(merged, 'results/profile.speedscope.json', unit='nanoseconds', scale=1000)
@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
-import json
 import seaborn as sns
 import pandas as pd
+from experiments.bench.eval import breakdown
 from matplotlib import rc
 import matplotlib.patches as mpatches
 
@@ -19,49 +19,17 @@ for graph in ["bert"]:
     colors = sns.color_palette()
     colors = ["gray", colors[0], colors[2], colors[3]]
 
-    part_dfs = [
-        pd.DataFrame(),
-        pd.DataFrame(),
-        pd.DataFrame(),
-        pd.DataFrame(),
-    ]
+    # both layouters in one table with the same phases, "other" being the rest of the layout time
+    dagre_df = breakdown.phases(breakdown.load_dagre_logs(['../results/' + graph + '/' + 'run' + str(i) + '.txt' for i in range(1, 6)], name="DAG", graph=graph),
+                                breakdown.DAGRE_PHASES, root=breakdown.DAGRE_ROOT)
+    sugiyama_df = breakdown.phases(breakdown.load('../../performance_breakdown/results/performance_breakdown.json', graphs=[graph]),
+                                   breakdown.SUGIYAMA_PHASES, root=breakdown.SUGIYAMA_ROOT)
+    sugiyama_df["name"] = "SUG-J"
+    df = pd.concat([dagre_df, sugiyama_df], ignore_index=True).rename(columns={"name": "layouter"})
+    stacked_df = breakdown.stacked(df, ["rank", "order", "coords", "other"], id_columns=("layouter", "graph"))
+    stacked_df["time"] /= 1000
+    part_dfs = [part_df for phase, part_df in stacked_df.groupby("phase", sort=False)]
     bars = []
-    for i in range(1, 6):
-        with open('../results/' + graph + '/' + 'run' + str(i) + '.txt') as file:
-            run_df = pd.DataFrame(pd.read_csv(file, sep=":", names=["part", "time"]))
-            run_df['run'] = i
-            run_df['time'] = run_df['time'].map(lambda time: int(time.rstrip('ms').strip()))
-            run_df = run_df.groupby(['run', 'part'], as_index=False).sum()
-            for step, part in enumerate(["rank", "order", "coords", "other"]):
-                measures = {}
-                for measure in ["rank time", "normalizeRanks time", "assignRankMinMax time", "order time", "position time", "assignNodeIntersects time", "total"]:
-                    measures[measure] = int(run_df[run_df["part"] == measure]["time"])
-                row = {}
-                row["layouter"] = "DAG"
-                rank = measures["rank time"] + measures["normalizeRanks time"] + measures["assignRankMinMax time"]
-                order =  measures["order time"]
-                coords = measures["position time"] + measures["assignNodeIntersects time"]
-                other = measures["total"] - rank - order - coords
-                times = [rank, order, coords, other]
-                row["time"] = sum(times[0:step+1]) / 1000
-                part_dfs[step] = part_dfs[step].append(row, ignore_index=True)
-
-    with open('../../performance_breakdown/results/performance_breakdown.json') as file:
-        df = pd.json_normalize(json.load(file))
-        df = df[df["graph"] == "bert"]
-        for step, part in enumerate(["rank", "order", "resolve", "coords"]):
-            part_df = pd.DataFrame()
-            for i in range(df.shape[0]):
-                measures = df.iloc[i].copy()
-                row = {}
-                row["layouter"] = "SUG-J"
-                rank = measures["doLayout|assignRanks"]
-                order =  measures["doLayout|orderRanks"]
-                coords = measures["doLayout|assignCoordinates"]
-                times = [rank, order, coords, 0]
-                row["time"] = sum(times[0:step+1]) / 1000
-                part_dfs[step] = part_dfs[step].append(row, ignore_index=True)
-
     part_dfs.reverse()
     handles = []
     for step, part_df in enumerate(part_dfs):
@@ -83,4 +51,4 @@ for graph in ["bert"]:
     plt.savefig('dagre_breakdown_' + graph + '.pdf', bbox_inches='tight')
     plt.show()
 
-    print(part_dfs[3].groupby(["layouter"]).median() / part_dfs[0].groupby(["layouter"]).median())
\ No newline at end of file
+    print(breakdown.summarize(df, "layouter", ["rank", "order", "coords", "other"])["median"])
\ No newline at end of file
@@ -0,0 +1,15 @@
+from experiments.bench import synthetic
+import experiments.bench.performance.memory as memory
+
+# synthetic graphs from 10^2 to 10^5 nodes, three seeds per size
+sizes = [100, 316, 1000, 3162, 10000, 31623, 100000]
+graphs = [synthetic.write(size, seed) for size in sizes for seed in range(3)]
+
+layouters = [
+    {'name': 'SUG', 'layouter': 'sugiyama', 'jointOrder': 0, 'numShuffles': 0},
+    {'name': 'SUG-J', 'layouter': 'sugiyama', 'jointOrder': 1, 'numShuffles': 0},
+]
+
+# heap peaks per timer path, node reports the heap exactly and runs the garbage collector before every layout
+memory.node([{"layouters": layouters, "graphs": graphs, "runs": 3}], output='results/memory_peak.jsonl')
+memory.node([{"layouters": layouters, "graphs": graphs, "runs": 3}], memory='delta', output='results/memory_delta.jsonl')
@@ -0,0 +1,39 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+import pandas as pd
+from experiments.bench import catalog
+from experiments.bench.eval import breakdown
+from experiments.bench.eval import memory
+from experiments.bench.eval import scaling
+from matplotlib import rc
+
+rc('text', usetex=True)
+pd.set_option('display.max_rows', None)
+pd.set_option('display.max_columns', None)
+pd.set_option('display.width', None)
+
+sizes = catalog.load()
+phase_names = ["rank", "order", "resolve", "coords", "total"]
+
+long_df = memory.load('../results/memory_peak.jsonl')
+peak_df = memory.phase_peaks(long_df, breakdown.SUGIYAMA_RESOLVE_PHASES, root=breakdown.SUGIYAMA_ROOT)
+print(memory.largest_paths(long_df))
+print(scaling.fit_phases(peak_df, sizes, phase_names))
+
+heap_df = memory.load_heap('../results/memory_peak.jsonl')
+print(catalog.normalize(heap_df, ['heapGrowth'], by='nodes').groupby('name')['heapGrowth_per_node'].median())
+
+df = peak_df.join(sizes[['nodes']], on='graph').melt(id_vars=['name', 'nodes'], value_vars=phase_names, var_name='phase', value_name='peak')
+df = df[df['peak'] > 0]
+for name in ["SUG", "SUG-J"]:
+    fig, ax = plt.subplots()
+    plt.grid(color='#E0E0E0')
+    sns.set_theme(style="whitegrid")
+    sns.lineplot(data=df[df['name'] == name], x='nodes', y='peak', hue='phase', marker='o', errorbar=('pi', 50))
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    plt.xlabel('Nodes')
+    plt.ylabel('Peak heap growth [MB]')
+    plt.title(name)
+    plt.savefig('memory_' + name + '.pdf', bbox_inches='tight')
+    plt.show()
@@ -1,8 +1,12 @@
 from experiments.bench.graphs import *
 import experiments.bench.performance.breakdown as bd
+import experiments.bench.performance.trace as trace
 
 layouters = [
     {'name': 'SUG-J', 'layouter': 'sugiyama', 'jointOrder': 'true', 'numShuffles': 0, 'webWorkers': 0, 'maxWorkers': 0, 'breakdown': 1},
     {'name': 'SUG-JM7', 'layouter': 'sugiyama', 'jointOrder': 'true', 'numShuffles': 0, 'webWorkers': 1, 'maxWorkers': 7, 'breakdown': 1},
 ]
-bd.chrome([{"layouters": layouters, "graphs": WIDE, "runs": 10}])
\ No newline at end of file
+bd.chrome([{"layouters": layouters, "graphs": WIDE, "runs": 10}])
+
+# timeline of the multi-threaded run: worker utilization, dispatch latency and critical path of the alignments
+trace.chrome([{"layouters": layouters[1:], "graphs": WIDE, "runs": 5}], output='results/multithreading_coordinates_trace.jsonl')
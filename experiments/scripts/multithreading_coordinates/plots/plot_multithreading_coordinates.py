@@ -1,31 +1,34 @@
 import matplotlib.ticker
 import matplotlib.pyplot as plt
-import json
 import seaborn as sns
-import pandas as pd
+from experiments.bench import store
+from experiments.bench.eval import trace
 
 matplotlib.rc('text', usetex=True)
 
-with open('../results/multithreading_coordinates.json') as file:
-    df = pd.json_normalize(json.load(file))
-    df = df.sort_values(['name', 'graph'])
-    df["graph"] = df["graph"].map(lambda name: r"\textit{" + name + "}")
-    df["layouter"] = df["name"].map(lambda name: "Multi-threaded" if "M" in name else "Single-threaded")
-    df = df[df["layouter"] != "-"]
-    df["time"] = df["doLayout|assignCoordinates|placeSubgraph|assignX"].map(lambda time: time / 1000)
+df = store.load('../results/multithreading_coordinates.json', paths=['doLayout|assignCoordinates|placeSubgraph|assignX'])
+df = df.sort_values(['name', 'graph'])
+df["graph"] = df["graph"].map(lambda name: r"\textit{" + name + "}")
+df["layouter"] = df["name"].map(lambda name: "Multi-threaded" if "M" in name else "Single-threaded")
+df = df[df["layouter"] != "-"]
+df["time"] = df["doLayout|assignCoordinates|placeSubgraph|assignX"].map(lambda time: time / 1000)
 
-    fig, ax = plt.subplots()
+fig, ax = plt.subplots()
 
-    sns.set_theme(style="whitegrid", font_scale=1.5)
-    g = sns.catplot(
-        data=df, kind="bar",
-        x="graph", y="time", hue="layouter",
-        ci="sd", legend=False
-    )
-    g.despine(left=True)
-    g.set_axis_labels("", "Time [s]")
-    for ax in g.axes.flat:
-        ax.get_yaxis().set_major_formatter(matplotlib.ticker.FuncFormatter(lambda x, p: format(x, '.1f')))
-        ax.legend(loc='upper right')
-    plt.savefig('multithreading_coordinates.pdf', bbox_inches='tight')
-    plt.show()
\ No newline at end of file
+sns.set_theme(style="whitegrid", font_scale=1.5)
+g = sns.catplot(
+    data=df, kind="bar",
+    x="graph", y="time", hue="layouter",
+    ci="sd", legend=False
+)
+g.despine(left=True)
+g.set_axis_labels("", "Time [s]")
+for ax in g.axes.flat:
+    ax.get_yaxis().set_major_formatter(matplotlib.ticker.FuncFormatter(lambda x, p: format(x, '.1f')))
+    ax.legend(loc='upper right')
+plt.savefig('multithreading_coordinates.pdf', bbox_inches='tight')
+plt.show()
+
+# timeline of the four parallel alignments: worker utilization, dispatch latency and the bound on the speedup
+trace_df = trace.analyze('../results/multithreading_coordinates_trace.jsonl', within='doLayout|assignCoordinates|placeSubgraph|assignX')
+print(trace_df.groupby("graph")[["wall", "serial", "task_time", "critical_path", "speedup_bound", "utilization", "dispatch_latency", "max_dispatch_latency"]].median())
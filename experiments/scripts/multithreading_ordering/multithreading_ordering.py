@@ -1,10 +1,17 @@
 from experiments.bench.graphs import *
-import experiments.bench.performance.breakdown as bd
+from experiments.bench import sweep
 
-layouters = []
-for i in range(0, 11, 1):
-    layouters.append({'name': 'SUG-JS' + str(i), 'layouter': 'sugiyama', 'jointOrder': 'true', 'numShuffles': i, 'webWorkers': 0, 'maxWorkers': 0, 'breakdown': 1})
-for i in range(0, 11, 1):
-    layouters.append({'name': 'SUG-JS' + str(i) + 'M7', 'layouter': 'sugiyama', 'jointOrder': 'true', 'numShuffles': i, 'webWorkers': 1, 'maxWorkers': 7, 'sharedArrayBuffer': 0, 'breakdown': 1})
+layouters = [
+    sweep.grid('SUG-JS{numShuffles}', layouter='sugiyama', jointOrder='true', numShuffles=list(range(0, 11, 1)), webWorkers=0, maxWorkers=0, breakdown=1),
+    sweep.grid('SUG-JS{numShuffles}M7', layouter='sugiyama', jointOrder='true', numShuffles=list(range(0, 11, 1)), webWorkers=1, maxWorkers=7, sharedArrayBuffer=0, breakdown=1),
+]
 
-bd.firefox([{"layouters": layouters, "graphs": WIDE, "runs": 5}])
\ No newline at end of file
+SWEEPS = [
+    {'measure': 'breakdown', 'browser': 'firefox', 'layouters': layouters, 'graphs': WIDE, 'runs': 5},
+    # timelines of the multi-threaded runs: worker utilization, dispatch latency and critical path of the ordering
+    {'measure': 'trace', 'browser': 'firefox', 'layouters': [layouters[1]], 'graphs': WIDE, 'runs': 2,
+     'output': 'results/multithreading_ordering_trace.jsonl'},
+]
+
+if __name__ == '__main__':
+    sweep.run(SWEEPS)
@@ -1,5 +1,5 @@
 from experiments.bench.graphs import *
-import experiments.bench.quality.cost as cost
+import experiments.bench.quality.measures as measures
 
 layouters = [
     {'name': 'DAG', 'layouter': 'dagre', 'jointOrder': 0, 'numShuffles': 0},
@@ -22,4 +22,5 @@ experiments = [
     },
 ]
 
-cost.chrome(experiments)
\ No newline at end of file
+# crossings, bends and lengths break the cost down, all from the same layout
+measures.chrome(experiments, ['cost', 'crossings', 'bends', 'lengths'])
\ No newline at end of file
@@ -0,0 +1,41 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+import pandas as pd
+from experiments.bench import catalog
+from experiments.bench import store
+from experiments.bench.eval import breakdown
+from experiments.bench.eval import scaling
+from matplotlib import rc
+
+rc('text', usetex=True)
+pd.set_option('display.max_rows', None)
+pd.set_option('display.max_columns', None)
+pd.set_option('display.width', None)
+
+sizes = catalog.load()
+phase_names = ["rank", "order", "resolve", "coords", "other"]
+
+# exponents of the total time of every layouter
+time_df = store.load('../results/scaling_time.jsonl', columns=['name', 'graph', 'time'])
+print(scaling.fit(time_df.join(sizes[['nodes']], on='graph'), 'nodes', 'time'))
+
+# exponents of the phases and of every timer path, fastest growing first
+long_df = breakdown.load('../results/scaling_breakdown.jsonl')
+phase_df = breakdown.phases(long_df, breakdown.SUGIYAMA_RESOLVE_PHASES, root=breakdown.SUGIYAMA_ROOT)
+print(scaling.fit_phases(phase_df, sizes, phase_names))
+print(scaling.fit_paths(long_df, sizes, min_value=1).head(20))
+
+df = phase_df.join(sizes[['nodes']], on='graph').melt(id_vars=['name', 'nodes'], value_vars=phase_names, var_name='phase', value_name='time')
+df = df[df['time'] > 0]
+for name in ["SUG-J"]:
+    fig, ax = plt.subplots()
+    plt.grid(color='#E0E0E0')
+    sns.set_theme(style="whitegrid")
+    sns.lineplot(data=df[df['name'] == name], x='nodes', y='time', hue='phase', marker='o', errorbar=('pi', 50))
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    plt.xlabel('Nodes')
+    plt.ylabel('Time [ms]')
+    plt.title(name)
+    plt.savefig('scaling_' + name + '.pdf', bbox_inches='tight')
+    plt.show()
@@ -0,0 +1,24 @@
+from experiments.bench import synthetic
+import experiments.bench.performance.breakdown as bd
+import experiments.bench.performance.time as time
+
+# synthetic graphs from 10^2 to 10^5 nodes, three seeds per size
+sizes = [100, 316, 1000, 3162, 10000, 31623, 100000]
+graphs = [synthetic.write(size, seed) for size in sizes for seed in range(3)]
+
+layouters = [
+    {'name': 'SUG', 'layouter': 'sugiyama', 'jointOrder': 0, 'numShuffles': 0},
+    {'name': 'SUG-J', 'layouter': 'sugiyama', 'jointOrder': 1, 'numShuffles': 0},
+]
+# the force-directed layouter with repulsion cut off at 10 * spaceBetweenNodes, a repulsion ramp of 250 iterations,
+# cooling and early stopping; with its defaults (all pairs repel, 1000 iterations), 10^4 nodes take too long
+MAG_S = {'name': 'MAG-S', 'layouter': 'magnetic', 'repulsionCutoff': 300, 'rampIterations': 250, 'cooling': 0.9,
+         'tolerance': 0.1}
+
+# per-phase times of the sugiyama layouters and total times of all layouters (dagre has no timer breakdown),
+# the force-directed layouter only up to 10^4 nodes; both in one sweep, as every sweep rewrites its output
+bd.node([{"layouters": layouters, "graphs": graphs, "runs": 3}], output='results/scaling_breakdown.jsonl')
+time.node([{"layouters": [{'name': 'DAG', 'layouter': 'dagre'}] + layouters, "graphs": graphs, "runs": 3},
+           {"layouters": [MAG_S],
+            "graphs": [synthetic.write(size, seed) for size in sizes if size <= 10000 for seed in range(3)], "runs": 3}],
+          output='results/scaling_time.jsonl')
@@ -1,9 +1,16 @@
 from experiments.bench.graphs import *
-import experiments.bench.quality.crossings as crossings
+from experiments.bench import sweep
 
-layouters = []
-for num_shuffles in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]:
-    layouters.append({'name': 'SUG-S' + str(num_shuffles), 'layouter': 'sugiyama', 'numShuffles': num_shuffles, 'jointOrder': 0})
-    layouters.append({'name': 'SUG-JS' + str(num_shuffles), 'layouter': 'sugiyama', 'numShuffles': num_shuffles, 'jointOrder': 1})
-graphs = PORT + WIDE + TALL + POLY
-crossings.chrome([{"layouters": layouters, "graphs": graphs, "runs": 1}])
\ No newline at end of file
+SWEEPS = [{
+    'measure': ['crossings', 'cost', 'time'],
+    'browser': 'chrome',
+    'layouters': [
+        sweep.grid('SUG-S{numShuffles}', layouter='sugiyama', numShuffles=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100], jointOrder=0),
+        sweep.grid('SUG-JS{numShuffles}', layouter='sugiyama', numShuffles=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100], jointOrder=1),
+    ],
+    'graphs': PORT + WIDE + TALL + POLY,
+    'runs': 1,
+}]
+
+if __name__ == '__main__':
+    sweep.run(SWEEPS)
@@ -1,8 +1,11 @@
+import * as _ from "lodash";
 import LayoutAnalysis from "./layoutAnalysis";
+import LayoutGeometry from "./layoutGeometry";
 import LayoutGraph from "../layoutGraph/layoutGraph";
 import Layouter from "../layouter/layouter";
 import PerformanceAnalysis from "./performanceAnalysis";
 import RenderGraph from "../renderGraph/renderGraph";
+import RunControl from "./runControl";
 import Renderer from "../renderer/renderer";
 import Serializer from "../util/serializer";
 import Timer from "../util/timer";
@@ -21,55 +24,265 @@ export default class Bench {
     public static FN_CROSSINGS = "crossings";
     public static FN_AREA = "area";
     public static FN_RANKS = "ranks";
+    public static FN_GEOMETRY = "geometry";
+    public static FN_BENDS = "bends";
+    public static FN_LENGTHS = "lengths";
+    public static FN_TIME = "time";
+    public static MEASURES = [Bench.FN_VALIDATE, Bench.FN_COST, Bench.FN_CROSSINGS, Bench.FN_AREA, Bench.FN_RANKS, Bench.FN_GEOMETRY, Bench.FN_BENDS, Bench.FN_LENGTHS, Bench.FN_TIME];
 
     public static runtime(loadFunction: (name: string, basePath: string) => Promise<RenderGraph>, layouter: Layouter, graphs: Array<string> = Bench.GRAPHS_ALL, renderer: Renderer = null, runs: number = 10, breakdown: boolean = false, basePath: string = "/graphs/", count: boolean = false) {
         const promises = graphs.map(name => {
-            return () => loadFunction(name, basePath).then(async (renderGraph: RenderGraph) => {
-                if (renderGraph === null) {
-                    throw new Error('could not load graph');
-                }
-                if (renderer !== null) {
-                    renderer.setSizes(renderGraph);
-                }
-                if (count) {
-                    await layouter.layout(renderGraph);
-                    return Timer.getCountPerPath();
-                }
-                const performanceAnalysis = new PerformanceAnalysis(layouter);
-                return performanceAnalysis.measure(renderGraph, runs, breakdown);
+            return () => Bench.loadSized(loadFunction, name, renderer, basePath).then((renderGraph: RenderGraph) => {
+                return Bench.runtimeSized(renderGraph, layouter, runs, breakdown, count);
             }).catch(e => new Error(e.message));
         });
         return Serializer.serializePromises(promises);
     }
 
-    public static run(f: string, loadFunction: (name: string, basePath: string) => Promise<RenderGraph>, layouter: Layouter, graphs: Array<string> = Bench.GRAPHS_ALL, renderer: Renderer = null, basePath: string = "/graphs/") {
+    /**
+     * Evaluates the layouts of the given graphs with the function f, or with all functions of a list of functions
+     * (one record per graph, see runMeasures).
+     */
+    public static run(f: string | Array<string>, loadFunction: (name: string, basePath: string) => Promise<RenderGraph>, layouter: Layouter, graphs: Array<string> = Bench.GRAPHS_ALL, renderer: Renderer = null, basePath: string = "/graphs/") {
         const promises = graphs.map(name => {
-            return () => loadFunction(name, basePath).then(async (renderGraph: RenderGraph) => {
-                if (renderer !== null) {
-                    renderer.setSizes(renderGraph);
+            return () => Bench.loadSized(loadFunction, name, renderer, basePath).then((renderGraph: RenderGraph) => {
+                if (Array.isArray(f)) {
+                    return Bench.runMeasures(f, renderGraph, layouter, false);
                 }
-                return await layouter.layout(renderGraph).then((layout: LayoutGraph) => {
-                    let layoutAnalysis;
-                    switch (f) {
-                        case Bench.FN_VALIDATE:
-                            layoutAnalysis = new LayoutAnalysis(layout, layouter.getOptionsForAnalysis());
-                            return layoutAnalysis.validate();
-                        case Bench.FN_COST:
-                            layoutAnalysis = new LayoutAnalysis(layout, layouter.getOptionsForAnalysis());
-                            return layoutAnalysis.cost();
-                        case Bench.FN_CROSSINGS:
-                            layoutAnalysis = new LayoutAnalysis(layout, layouter.getOptionsForAnalysis());
-                            return layoutAnalysis.segmentCrossings();
-                        case Bench.FN_AREA:
-                            const box = layout.boundingBox();
-                            return box.width * box.height / 1000000;
-                        case Bench.FN_RANKS:
-                            return layout.numRanks;
-                    }
-                    throw new Error("unknown function " + f);
-                });
+                return Bench.runSized(f, renderGraph, layouter, false);
             });
         });
         return Serializer.serializePromises(promises);
     }
+
+    /**
+     * Loads a graph and sets the sizes of its nodes and connectors.
+     * The result can be laid out many times (see runtimeSized and runSized), which avoids parsing and measuring
+     * the same graph again for every layouter setup.
+     */
+    public static loadSized(loadFunction: (name: string, basePath: string) => Promise<RenderGraph>, name: string, renderer: Renderer = null, basePath: string = "/graphs/"): Promise<RenderGraph> {
+        return Bench.loadSizedTimed(loadFunction, name, renderer, basePath).then(result => result.renderGraph);
+    }
+
+    /**
+     * Like loadSized, but also returns how long loading and parsing the graph took (loadTime in ms, without setting
+     * the sizes) and by how much the used heap grew meanwhile (loadHeap in bytes, null if not reported).
+     * The garbage collector runs before loading if it is exposed, but not after, so loadHeap includes the garbage
+     * of parsing (e.g. the JSON object tree) and approximates the peak of loading.
+     */
+    public static async loadSizedTimed(loadFunction: (name: string, basePath: string) => Promise<RenderGraph>, name: string, renderer: Renderer = null, basePath: string = "/graphs/"): Promise<any> {
+        if (typeof globalThis["gc"] === "function") {
+            globalThis["gc"]();
+        }
+        const heapBefore = Timer.usedHeap();
+        const start = performance.now();
+        const renderGraph = await loadFunction(name, basePath);
+        const loadTime = performance.now() - start;
+        const heapAfter = Timer.usedHeap();
+        if (renderGraph === null) {
+            throw new Error('could not load graph');
+        }
+        if (renderer !== null) {
+            renderer.setSizes(renderGraph);
+        }
+        return {
+            renderGraph: renderGraph,
+            loadTime: loadTime,
+            loadHeap: (heapBefore === null || heapAfter === null) ? null : heapAfter - heapBefore,
+        };
+    }
+
+    public static async runtimeSized(renderGraph: RenderGraph, layouter: Layouter, runs: number = 10, breakdown: boolean = false, count: boolean = false): Promise<any> {
+        if (count) {
+            Timer.reset();
+            Timer.setEnabled(true);
+            try {
+                await layouter.layout(_.cloneDeep(renderGraph));
+            } finally {
+                Timer.setEnabled(false);
+            }
+            return Object.assign(Timer.getCountPerPath(), Timer.getOverhead());
+        }
+        const performanceAnalysis = new PerformanceAnalysis(layouter);
+        const result = await performanceAnalysis.measure(renderGraph, runs, breakdown);
+        if (breakdown && runs === 1) {
+            // the timer overhead of this run, to judge how much the instrumentation distorts the breakdown
+            return Object.assign(result, Timer.getOverhead());
+        }
+        return result;
+    }
+
+    /**
+     * Lays out a copy of the graph with the memory mode of the Timer enabled and returns the heap peaks (or, with
+     * delta set, the retained heap differences) per timer path in bytes, together with the heap before the layout
+     * (heapBase) and the highest sampled heap (heapPeak).
+     * If the garbage collector is exposed (node --expose-gc, chrome --js-flags=--expose-gc), it runs before the layout.
+     * Where performance.measureUserAgentSpecificMemory is available (cross-origin isolated pages), the memory of the
+     * whole page while the layout is still referenced is added as uaMemory. layoutNodes is the number of nodes of
+     * the layout graph.
+     */
+    public static async memorySized(renderGraph: RenderGraph, layouter: Layouter, delta: boolean = false): Promise<any> {
+        const graphCopy = _.cloneDeep(renderGraph);
+        if (typeof globalThis["gc"] === "function") {
+            globalThis["gc"]();
+        }
+        Timer.reset();
+        Timer.setEnabled(true);
+        Timer.setMemoryMode(true);
+        let layout;
+        try {
+            // the layout stays referenced until the memory of the page has been measured
+            layout = await layouter.layout(graphCopy);
+        } finally {
+            Timer.setMemoryMode(false);
+            Timer.setEnabled(false);
+        }
+        const result = Object.assign(delta ? Timer.getMemoryDeltaPerPath() : Timer.getPeakMemoryPerPath(), Timer.getHeapRange());
+        if (typeof performance["measureUserAgentSpecificMemory"] === "function" && globalThis["crossOriginIsolated"]) {
+            try {
+                result["uaMemory"] = (await performance["measureUserAgentSpecificMemory"]()).bytes;
+            } catch (e) {
+                // not available in every isolated context (e.g. headless Chrome throws a SecurityError)
+            }
+        }
+        result["layoutNodes"] = layout.allNodes().length;
+        return result;
+    }
+
+    /**
+     * Lays out a copy of the graph with the trace mode of the Timer enabled and returns the times per timer path
+     * (like a breakdown) together with the trace events of the timer spans and of the tasks of the worker pool.
+     */
+    public static async traceSized(renderGraph: RenderGraph, layouter: Layouter): Promise<any> {
+        const graphCopy = _.cloneDeep(renderGraph);
+        Timer.reset();
+        Timer.setEnabled(true);
+        Timer.setTraceMode(true);
+        try {
+            await layouter.layout(graphCopy);
+        } finally {
+            Timer.setTraceMode(false);
+            Timer.setEnabled(false);
+        }
+        return Object.assign(Timer.getTimesPerPath(), {traceEvents: Timer.getTraceEvents()});
+    }
+
+    /**
+     * Measures the layout time adaptively, see RunControl for the options.
+     * Returns the statistics of the runs including the number of samples and the confidence interval of the mean.
+     */
+    public static async runtimeAdaptive(renderGraph: RenderGraph, layouter: Layouter, runControlOptions: any = {}): Promise<any> {
+        const performanceAnalysis = new PerformanceAnalysis(layouter);
+        return performanceAnalysis.measureAdaptive(renderGraph, new RunControl(runControlOptions));
+    }
+
+    /**
+     * Renders the laid out graph and moves the view along a scripted path for numFrames frames: from the whole
+     * graph, zoomed to fit, to zoom 1 and back while the center moves diagonally across the graph.
+     * Returns the mean, 95th percentile and maximum time between frames in ms, the used heap before and after the
+     * frames in bytes (null if unknown) and the highest numbers of shown and pooled display objects.
+     */
+    public static async frameTimes(renderer: Renderer, renderGraph: RenderGraph, numFrames: number = 120): Promise<any> {
+        const nextFrame = () => new Promise<number>(resolve => requestAnimationFrame(resolve));
+        const box = renderGraph.boundingBox();
+        const size = renderer.viewSize();
+        const fitZoom = Math.min(1, size.width / box.width, size.height / box.height);
+        renderer.render(renderGraph);
+        await nextFrame();
+        await nextFrame();
+        const heapBefore = Timer.usedHeap();
+        let maxShown = 0;
+        let maxPooled = 0;
+        const times = [];
+        let previous = await nextFrame();
+        for (let i = 0; i < numFrames; ++i) {
+            const t = (numFrames > 1 ? i / (numFrames - 1) : 0);
+            renderer.setView(box.x + t * box.width, box.y + t * box.height, fitZoom * Math.pow(1 / fitZoom, Math.sin(Math.PI * t)));
+            const now = await nextFrame();
+            times.push(now - previous);
+            previous = now;
+            const objects = renderer.numDisplayObjects();
+            maxShown = Math.max(maxShown, objects.shown);
+            maxPooled = Math.max(maxPooled, objects.pooled);
+        }
+        const heapAfter = Timer.usedHeap();
+        const sorted = _.sortBy(times);
+        return {
+            frames: numFrames,
+            frameMean: _.mean(times),
+            frameP95: sorted[Math.min(sorted.length - 1, Math.floor(0.95 * sorted.length))],
+            frameMax: _.last(sorted),
+            heapBefore: heapBefore,
+            heapAfter: heapAfter,
+            maxShown: maxShown,
+            maxPooled: maxPooled,
+        };
+    }
+
+    /**
+     * Lays out the graph and evaluates the layout with the function f.
+     * If copy is set, a copy of the graph is laid out and the given graph stays untouched.
+     */
+    public static async runSized(f: string, renderGraph: RenderGraph, layouter: Layouter, copy: boolean = true): Promise<any> {
+        return (await Bench.runMeasures([f], renderGraph, layouter, copy))[f];
+    }
+
+    /**
+     * Lays out the graph once and evaluates the layout with all functions in fs, returns a record with one entry
+     * per function. All functions share one LayoutAnalysis, so e.g. cost and crossings find the crossing segments
+     * only once. With Bench.FN_TIME, the record holds the time of the layout in ms (without copying the graph).
+     * If copy is set, a copy of the graph is laid out and the given graph stays untouched.
+     */
+    public static async runMeasures(fs: Array<string>, renderGraph: RenderGraph, layouter: Layouter, copy: boolean = true): Promise<any> {
+        _.forEach(fs, (f: string) => {
+            if (!_.includes(Bench.MEASURES, f)) {
+                throw new Error("unknown function " + f);
+            }
+        });
+        const graph = copy ? _.cloneDeep(renderGraph) : renderGraph;
+        const start = performance.now();
+        const layout = await layouter.layout(graph);
+        const time = performance.now() - start;
+        let layoutAnalysis = null;
+        const analysis = () => {
+            if (layoutAnalysis === null) {
+                layoutAnalysis = new LayoutAnalysis(layout, layouter.getOptionsForAnalysis());
+            }
+            return layoutAnalysis;
+        };
+        const result = {};
+        _.forEach(fs, (f: string) => {
+            switch (f) {
+                case Bench.FN_VALIDATE:
+                    result[f] = analysis().validate();
+                    break;
+                case Bench.FN_COST:
+                    result[f] = analysis().cost();
+                    break;
+                case Bench.FN_CROSSINGS:
+                    result[f] = analysis().segmentCrossings();
+                    break;
+                case Bench.FN_BENDS:
+                    result[f] = analysis().bends();
+                    break;
+                case Bench.FN_LENGTHS:
+                    result[f] = analysis().edgeLengths();
+                    break;
+                case Bench.FN_AREA:
+                    const box = layout.boundingBox();
+                    result[f] = box.width * box.height / 1000000;
+                    break;
+                case Bench.FN_RANKS:
+                    result[f] = layout.numRanks;
+                    break;
+                case Bench.FN_GEOMETRY:
+                    result[f] = LayoutGeometry.fromLayout(layout);
+                    break;
+                case Bench.FN_TIME:
+                    result[f] = time;
+                    break;
+            }
+        });
+        return result;
+    }
 }
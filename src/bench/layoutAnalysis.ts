@@ -5,17 +5,27 @@ import LayoutEdge from "../layoutGraph/layoutEdge";
 import LayoutGraph from "../layoutGraph/layoutGraph";
 import LayoutNode from "../layoutGraph/layoutNode";
 import Segment from "../geometry/segment";
+import SegmentGrid from "../geometry/segmentGrid";
 
+/**
+ * Quality measures and validation checks of a layout.
+ * The segment lists, the grid index of the segments (see SegmentGrid), the crossing counts and the parents of nodes
+ * and edges are only computed when a measure needs them and are kept afterwards, so one analysis can evaluate several
+ * measures of the same layout (see Bench.runMeasures) without repeating the expensive parts.
+ */
 export default class LayoutAnalysis {
     private readonly _layoutGraph: LayoutGraph;
     private readonly _options: any;
     private readonly _nodes: Array<LayoutNode>;
     private readonly _edges: Array<LayoutEdge>;
-    private readonly _segments: Array<Segment>;
-    private readonly _uniqueSegments: Array<Segment>;
-    private readonly _nodeParents: Map<LayoutNode, Set<LayoutNode>>;
-    private readonly _edgeParents: Map<LayoutEdge, Set<LayoutNode>>;
-
+    private _segments: Array<Segment> = null;
+    private _uniqueSegments: Array<Segment> = null;
+    private _segmentGrid: SegmentGrid = null;
+    private _crossingSegments: Array<[Segment, Segment]> = null;
+    private _numCrossings: number = null;
+    private _crossingCost: number = null;
+    private _nodeParents: Map<LayoutNode, Set<LayoutNode>> = null;
+    private _edgeParents: Map<LayoutEdge, Set<LayoutNode>> = null;
 
     constructor(layout: LayoutGraph, options: any = {}) {
         this._layoutGraph = layout;
@@ -27,33 +37,16 @@ export default class LayoutAnalysis {
         });
         this._nodes = this._layoutGraph.allNodes();
         this._edges = this._layoutGraph.allEdges();
-        this._segments = _.flatMap(this._edges, (edge: LayoutEdge) => edge.segments());
-        this._uniqueSegments = _.map(_.uniqBy(_.map(this._segments, segment => [segment, segment.start.x + "_" + segment.start.y + "_" + segment.end.x + "_" + segment.end.y]), "1"), "0");
-
-        // precalculate all parents for nodes and edges
-        this._nodeParents = new Map();
-        _.forEach(this._nodes, (node: LayoutNode) => {
-            const parents: Set<LayoutNode> = new Set();
-            _.forEach(node.parents(), (parent: LayoutNode) => {
-                parents.add(parent);
-            });
-            this._nodeParents.set(node, parents);
-        });
-        this._edgeParents = new Map();
-        _.forEach(this._edges, (edge: LayoutEdge) => {
-            const parents: Set<LayoutNode> = new Set();
-            _.forEach(edge.parents(), (parent: LayoutNode) => {
-                parents.add(parent);
-            });
-            this._edgeParents.set(edge, parents);
-        });
     }
 
     /**
      * Returns the total number of pairwise segment crossings in the graph.
      */
     segmentCrossings(): number {
-        return this._getAllCrossingSegments().length;
+        if (this._numCrossings === null) {
+            this._numCrossings = this._getSegmentGrid().countCrossings();
+        }
+        return this._numCrossings;
     }
 
     /**
@@ -62,13 +55,10 @@ export default class LayoutAnalysis {
      * Orthogonal crossings have a cost of 1, almost parallel segments a cost very close to 2.
      */
     segmentCrossingsWithAngles(): number {
-        let cost = 0;
-        _.forEach(this._getAllCrossingSegments(), ([segI, segJ]) => {
-            const angle = segI.vector().acuteAngleTo(segJ.vector());
-            const angleCost = (Math.cos(2 * angle) + 1) / 2;
-            cost += 1 + angleCost;
-        });
-        return cost;
+        if (this._crossingCost === null) {
+            this._crossingCost = this._getSegmentGrid().crossingCost();
+        }
+        return this._crossingCost;
     }
 
     edgeLengths(): number {
@@ -175,7 +165,7 @@ export default class LayoutAnalysis {
             const nodeI = this._nodes[i];
             _.forEach(_.intersection(overlaps["y"][i], overlaps["x"][i]), (j: number) => {
                 const edgeJ = this._edges[j];
-                if (this._edgeIntersectsNode(edgeJ, nodeI) && !this._edgeParents.get(edgeJ).has(nodeI)) {
+                if (this._edgeIntersectsNode(edgeJ, nodeI) && !this._getEdgeParents().get(edgeJ).has(nodeI)) {
                     console.log("node overlaps edge", nodeI, edgeJ);
                     overlap = true;
                 }
@@ -188,11 +178,11 @@ export default class LayoutAnalysis {
         for (let i = 0; i < this._nodes.length; ++i) {
             const node = this._nodes[i];
             let contained = true;
-            this._nodeParents.get(node).forEach((parent: LayoutNode) => {
+            this._getNodeParents().get(node).forEach((parent: LayoutNode) => {
                 contained = contained && node.boundingBox().containedIn(parent.boundingBox());
             });
             if (!contained) {
-                console.log("node not contained in parent", node, node.boundingBox(), _.map(Array.from(this._nodeParents.get(node)), (parent: LayoutNode) => parent.boundingBox()));
+                console.log("node not contained in parent", node, node.boundingBox(), _.map(Array.from(this._getNodeParents().get(node)), (parent: LayoutNode) => parent.boundingBox()));
                 return false;
             }
         }
@@ -203,7 +193,7 @@ export default class LayoutAnalysis {
         for (let i = 0; i < this._edges.length; ++i) {
             const edge = this._edges[i];
             let contained = true;
-            this._edgeParents.get(edge).forEach((parent: LayoutNode) => {
+            this._getEdgeParents().get(edge).forEach((parent: LayoutNode) => {
                 contained = contained && edge.boundingBox().containedIn(parent.boundingBox())
             });
             if (!contained) {
@@ -277,7 +267,7 @@ export default class LayoutAnalysis {
     }
 
     bends(): number {
-        return this._segments.length - this._edges.length;
+        return this._getSegments().length - this._edges.length;
     }
 
     cost(breakdown: boolean = false): number {
@@ -308,11 +298,60 @@ export default class LayoutAnalysis {
     }
 
     private _nodesRelated(nodeA: LayoutNode, nodeB: LayoutNode): boolean {
-        return this._nodeParents.get(nodeA).has(nodeB) || this._nodeParents.get(nodeB).has(nodeA);
+        const nodeParents = this._getNodeParents();
+        return nodeParents.get(nodeA).has(nodeB) || nodeParents.get(nodeB).has(nodeA);
+    }
+
+    private _getSegments(): Array<Segment> {
+        if (this._segments === null) {
+            this._segments = _.flatMap(this._edges, (edge: LayoutEdge) => edge.segments());
+        }
+        return this._segments;
+    }
+
+    private _getUniqueSegments(): Array<Segment> {
+        if (this._uniqueSegments === null) {
+            this._uniqueSegments = _.map(_.uniqBy(_.map(this._getSegments(), segment => [segment, segment.start.x + "_" + segment.start.y + "_" + segment.end.x + "_" + segment.end.y]), "1"), "0");
+        }
+        return this._uniqueSegments;
+    }
+
+    private _getSegmentGrid(): SegmentGrid {
+        if (this._segmentGrid === null) {
+            this._segmentGrid = new SegmentGrid(this._getUniqueSegments());
+        }
+        return this._segmentGrid;
+    }
+
+    private _getCrossingSegments(): Array<[Segment, Segment]> {
+        if (this._crossingSegments === null) {
+            this._crossingSegments = this._getSegmentGrid().crossingPairs();
+        }
+        return this._crossingSegments;
+    }
+
+    private _getNodeParents(): Map<LayoutNode, Set<LayoutNode>> {
+        if (this._nodeParents === null) {
+            this._nodeParents = new Map();
+            _.forEach(this._nodes, (node: LayoutNode) => {
+                this._nodeParents.set(node, new Set(node.parents()));
+            });
+        }
+        return this._nodeParents;
+    }
+
+    private _getEdgeParents(): Map<LayoutEdge, Set<LayoutNode>> {
+        if (this._edgeParents === null) {
+            this._edgeParents = new Map();
+            _.forEach(this._edges, (edge: LayoutEdge) => {
+                this._edgeParents.set(edge, new Set(edge.parents()));
+            });
+        }
+        return this._edgeParents;
     }
 
     private _printCrossings(): void {
-        _.map(_.sortBy(_.map(this._getAllCrossingSegments(), ([segI, segJ]: [Segment, Segment]) => {
+        _.map(_.sortBy(_.map(this._getCrossingSegments(), ([segI, segJ]: [Segment, Segment]) => {
             const point = segI.intersection(segJ);
             return {
                 pointx: point.x,
@@ -322,44 +361,4 @@ export default class LayoutAnalysis {
             };
         }), ["pointy", "pointx"]), data => console.log("(" + data.pointx.toFixed(0) + " / " + data.pointy.toFixed(0) + ")", data.segi.toString(), data.segj.toString()));
     }
-
-    private _getAllCrossingSegments(): Array<[Segment, Segment]> {
-        const overlaps = {};
-        _.forEach(["x", "y"], axis => {
-            overlaps[axis] = new Array(this._segments.length);
-            for (let i = 0; i < this._uniqueSegments.length; ++i) {
-                overlaps[axis][i] = [];
-            }
-            const endpoints = [];
-            for (let i = 0; i < this._uniqueSegments.length; ++i) {
-                endpoints.push([this._uniqueSegments[i].start[axis], i, this._uniqueSegments[i].start[axis] <= this._uniqueSegments[i].end[axis]]);
-                endpoints.push([this._uniqueSegments[i].end[axis], i, this._uniqueSegments[i].start[axis] > this._uniqueSegments[i].end[axis]]);
-            }
-            let openSegments = new Set();
-            inPlaceSort(endpoints).asc([endpoint => endpoint[0], endpoint => endpoint[2]]);
-            _.forEach(endpoints, ([coord, segId, isFirst]) => {
-                if (isFirst) {
-                    openSegments.forEach((openSegId: number) => {
-                        let min = Math.min(openSegId, segId);
-                        let max = Math.max(openSegId, segId);
-                        overlaps[axis][min].push(max);
-                    });
-                    openSegments.add(segId);
-                } else {
-                    openSegments.delete(segId);
-                }
-            });
-        });
-        const intersections = [];
-        for (let i = 0; i < this._uniqueSegments.length; ++i) {
-            const segI = this._uniqueSegments[i];
-            _.forEach(_.intersection(overlaps["y"][i], overlaps["x"][i]), (j: number) => {
-                const segJ = this._uniqueSegments[j];
-                if (segI.intersects(segJ)) {
-                    intersections.push([segI, segJ]);
-                }
-            });
-        }
-        return intersections;
-    }
-}
\ No newline at end of file
+}
@@ -0,0 +1,75 @@
+import * as _ from "lodash";
+import LayoutConnector from "../layoutGraph/layoutConnector";
+import LayoutEdge from "../layoutGraph/layoutEdge";
+import LayoutGraph from "../layoutGraph/layoutGraph";
+import LayoutNode from "../layoutGraph/layoutNode";
+import Vector from "../geometry/vector";
+
+/**
+ * Flat array representation of a finished layout, holding everything LayoutAnalysis needs.
+ * It is written into the result entries of the quality experiments and evaluated offline by
+ * experiments.bench.eval.layout_quality, so metrics can be recomputed without laying out the graph again.
+ */
+export default class LayoutGeometry {
+    public static readonly VERSION = 1;
+
+    /**
+     * Returns the geometry as an object of flat number arrays:
+     * - nodes: x, y, width, height, rank and parent index (-1 at the top level) of every node
+     * - edgeOffsets: index of the first point of every edge in points, followed by the total number of points
+     * - points: x and y of every edge point
+     * - edgeParents: index of the node containing the edge (-1 at the top level)
+     * - edgeCycles: 1 if the graph of the edge may have cycles (such edges may flow upwards), 0 otherwise
+     * - scopes: indices of entry and exit node of every graph with a scope
+     * - connectors: node index and x of the IN and OUT connector of every pair of scoped connectors
+     */
+    public static fromLayout(layout: LayoutGraph): object {
+        const nodes = layout.allNodes();
+        const edges = layout.allEdges();
+        const nodeIndices: Map<LayoutNode, number> = new Map();
+        _.forEach(nodes, (node: LayoutNode, n: number) => nodeIndices.set(node, n));
+        const parentIndex = (graph: LayoutGraph) => (graph.parentNode === null ? -1 : nodeIndices.get(graph.parentNode));
+
+        const nodeArray = [];
+        const connectorArray = [];
+        _.forEach(nodes, (node: LayoutNode, n: number) => {
+            nodeArray.push(node.x, node.y, node.width, node.height, (node.rank === null ? -1 : node.rank), parentIndex(node.graph));
+            _.forEach(node.inConnectors, (inConnector: LayoutConnector) => {
+                if (inConnector.isScoped) {
+                    const outConnector = node.connector("OUT", "OUT_" + inConnector.name.substr(3));
+                    connectorArray.push(n, inConnector.x, outConnector.x);
+                }
+            });
+        });
+
+        const edgeOffsets = [];
+        const points = [];
+        const edgeParents = [];
+        const edgeCycles = [];
+        _.forEach(edges, (edge: LayoutEdge) => {
+            edgeOffsets.push(points.length / 2);
+            _.forEach(edge.points, (point: Vector) => points.push(point.x, point.y));
+            edgeParents.push(parentIndex(edge.graph));
+            edgeCycles.push(edge.graph.mayHaveCycles ? 1 : 0);
+        });
+        edgeOffsets.push(points.length / 2);
+
+        const scopeArray = [];
+        _.forEach(layout.allGraphs(), (graph: LayoutGraph) => {
+            if (graph.entryNode !== null && graph.exitNode !== null) {
+                scopeArray.push(nodeIndices.get(graph.entryNode), nodeIndices.get(graph.exitNode));
+            }
+        });
+
+        return {
+            version: LayoutGeometry.VERSION,
+            nodes: nodeArray,
+            edgeOffsets: edgeOffsets,
+            points: points,
+            edgeParents: edgeParents,
+            edgeCycles: edgeCycles,
+            scopes: scopeArray,
+            connectors: connectorArray,
+        };
+    }
+}
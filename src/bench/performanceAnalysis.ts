@@ -1,5 +1,6 @@
 import * as _ from "lodash";
 import Layouter from "../layouter/layouter";
+import RunControl from "./runControl";
 import Timer from "../util/timer";
 import RenderGraph from "../renderGraph/renderGraph";
 
@@ -12,12 +13,23 @@ export default class PerformanceAnalysis {
 
     public async measure(graph: RenderGraph, runs: number = 10, breakdown: boolean = false): Promise<any> {
         const graphCopy = _.cloneDeep(graph);
+        // the timers only collect for breakdowns, plain timings are not instrumented
+        const enabled = Timer.isEnabled();
+        Timer.setEnabled(breakdown);
+        try {
+            return await this._measureRuns(graphCopy, runs, breakdown);
+        } finally {
+            Timer.setEnabled(enabled);
+        }
+    }
+
+    private async _measureRuns(graphCopy: RenderGraph, runs: number, breakdown: boolean): Promise<any> {
         const times = [];
         for (let run = 0; run < runs; ++run) {
             Timer.reset();
-            const start = Date.now();
+            const start = performance.now();
             await this._layouter.layout(graphCopy);
-            const end = Date.now();
+            const end = performance.now();
             if (breakdown) {
                 if (runs === 1) {
                     return Timer.getTimesPerPath();
@@ -37,4 +49,24 @@ export default class PerformanceAnalysis {
             //return _.sortBy(times)[Math.floor(runs / 2)] + " (" + "±" + (2 * this.sd(times)).toFixed(0) + ")";
         }
     }
+
+    /**
+     * Measures the layout time with as many runs as the run control needs to reach its target confidence interval
+     * and returns the statistics of RunControl.sample.
+     */
+    public async measureAdaptive(graph: RenderGraph, runControl: RunControl): Promise<any> {
+        const graphCopy = _.cloneDeep(graph);
+        const enabled = Timer.isEnabled();
+        Timer.setEnabled(false);
+        try {
+            return await runControl.sample(async () => {
+                Timer.reset();
+                const start = performance.now();
+                await this._layouter.layout(graphCopy);
+                return performance.now() - start;
+            });
+        } finally {
+            Timer.setEnabled(enabled);
+        }
+    }
 }
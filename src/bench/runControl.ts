@@ -0,0 +1,150 @@
+import * as _ from "lodash";
+
+/**
+ * Repeats a measurement until its mean is known precisely enough.
+ * The first runs (JIT warm-up) are discarded. After that, runs are repeated until the confidence interval of the
+ * mean is narrower than targetRelativeCi times the mean, the time budget is used up or maxRuns is reached.
+ * Outliers (e.g. runs with a garbage collection pause) are flagged by their modified z-score and not used for
+ * the mean and confidence interval.
+ */
+export default class RunControl {
+    private readonly _options: any;
+
+    constructor(options: any = {}) {
+        this._options = _.defaults(options, {
+            warmupRuns: 1,
+            minRuns: 3,
+            maxRuns: 100,
+            targetRelativeCi: 0.02,
+            budget: 60000, // ms, including the warm-up runs
+            confidence: 0.95,
+            outlierThreshold: 3.5,
+        });
+    }
+
+    /**
+     * Calls measure until the stopping criterion is met and returns the statistics of the measured times:
+     * times (all runs after the warm-up), warmup, outliers (indices into times), samples (number of runs used),
+     * median, mean, ciLow, ciHigh, relativeCi, converged (whether the target interval was reached) and stopReason.
+     */
+    public async sample(measure: () => Promise<number>): Promise<any> {
+        const start = performance.now();
+        const elapsed = () => performance.now() - start;
+        const warmup = [];
+        while (warmup.length < this._options.warmupRuns && elapsed() < this._options.budget) {
+            warmup.push(await measure());
+        }
+        const times = [];
+        let statistics = null;
+        let stopReason = null;
+        while (stopReason === null) {
+            times.push(await measure());
+            statistics = RunControl.statistics(times, this._options.confidence, this._options.outlierThreshold);
+            if (times.length >= this._options.minRuns && statistics.relativeCi <= this._options.targetRelativeCi) {
+                stopReason = "converged";
+            } else if (times.length >= this._options.maxRuns) {
+                stopReason = "maxRuns";
+            } else if (elapsed() >= this._options.budget) {
+                stopReason = "budget";
+            }
+        }
+        statistics.warmup = warmup;
+        statistics.converged = (stopReason === "converged");
+        statistics.stopReason = stopReason;
+        return statistics;
+    }
+
+    /**
+     * Median, outliers and mean with confidence interval of the given times.
+     */
+    public static statistics(times: Array<number>, confidence: number = 0.95, outlierThreshold: number = 3.5): any {
+        const median = RunControl.median(times);
+        const outliers = RunControl.outliers(times, outlierThreshold);
+        const outlierSet = new Set(outliers);
+        const inliers = _.filter(times, (time: number, i: number) => !outlierSet.has(i));
+        const n = inliers.length;
+        const mean = _.mean(inliers);
+        let halfWidth = Number.POSITIVE_INFINITY;
+        if (n > 1) {
+            const variance = _.sumBy(inliers, (time: number) => (time - mean) * (time - mean)) / (n - 1);
+            halfWidth = RunControl.tQuantile(1 - (1 - confidence) / 2, n - 1) * Math.sqrt(variance / n);
+        }
+        return {
+            times: times,
+            outliers: outliers,
+            samples: n,
+            median: median,
+            mean: mean,
+            ciLow: mean - halfWidth,
+            ciHigh: mean + halfWidth,
+            relativeCi: (mean > 0 ? halfWidth / mean : (halfWidth === 0 ? 0 : Number.POSITIVE_INFINITY)),
+        };
+    }
+
+    public static median(values: Array<number>): number {
+        const sorted = _.sortBy(values);
+        const middle = Math.floor(sorted.length / 2);
+        return (sorted.length % 2 === 1 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2);
+    }
+
+    /**
+     * Indices of the values whose modified z-score (distance to the median in median absolute deviations)
+     * exceeds the threshold. Needs at least three values.
+     */
+    public static outliers(values: Array<number>, threshold: number = 3.5): Array<number> {
+        if (values.length < 3) {
+            return [];
+        }
+        const median = RunControl.median(values);
+        const mad = RunControl.median(_.map(values, (value: number) => Math.abs(value - median)));
+        if (mad === 0) {
+            return [];
+        }
+        const outliers = [];
+        _.forEach(values, (value: number, i: number) => {
+            if (0.6745 * Math.abs(value - median) / mad > threshold) {
+                outliers.push(i);
+            }
+        });
+        return outliers;
+    }
+
+    /**
+     * Quantile of the standard normal distribution (Acklam's rational approximation).
+     */
+    public static normalQuantile(p: number): number {
+        const a = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00];
+        const b = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01, -1.328068155288572e+01];
+        const c = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00];
+        const d = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00];
+        const tail = (q: number) => (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1);
+        if (p < 0.02425) {
+            return tail(Math.sqrt(-2 * Math.log(p)));
+        }
+        if (p > 1 - 0.02425) {
+            return -tail(Math.sqrt(-2 * Math.log(1 - p)));
+        }
+        const q = p - 0.5;
+        const r = q * q;
+        return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1);
+    }
+
+    /**
+     * Quantile of Student's t-distribution with the given degrees of freedom (Cornish-Fisher expansion,
+     * exact for one and two degrees of freedom).
+     */
+    public static tQuantile(p: number, degreesOfFreedom: number): number {
+        if (degreesOfFreedom === 1) {
+            return Math.tan(Math.PI * (p - 0.5));
+        }
+        if (degreesOfFreedom === 2) {
+            return (2 * p - 1) / Math.sqrt(2 * p * (1 - p));
+        }
+        const z = RunControl.normalQuantile(p);
+        const v = degreesOfFreedom;
+        const z3 = z * z * z;
+        const z5 = z3 * z * z;
+        const z7 = z5 * z * z;
+        return z + (z3 + z) / (4 * v) + (5 * z5 + 16 * z3 + 3 * z) / (96 * v * v) + (3 * z7 + 19 * z5 + 17 * z3 - 15 * z) / (384 * v * v * v);
+    }
+}
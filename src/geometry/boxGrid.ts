@@ -0,0 +1,114 @@
+/**
+ * Uniform grid over axis-aligned boxes given as typed arrays (top left corner and size), for finding the boxes that
+ * overlap a query box without testing all of them. Every box is registered in all cells it overlaps.
+ * The grid does not follow later changes of the arrays, a new grid has to be built when the boxes moved.
+ */
+export default class BoxGrid {
+    private readonly _xs: Float64Array;
+    private readonly _ys: Float64Array;
+    private readonly _widths: Float64Array;
+    private readonly _heights: Float64Array;
+    private readonly _count: number;
+    private _originX: number = 0;
+    private _originY: number = 0;
+    private _cellSize: number;
+    private _cols: number = 1;
+    private _rows: number = 1;
+    private _cellStarts: Int32Array; // CSR offsets into _cellBoxes, one more than the number of cells
+    private _cellBoxes: Int32Array;
+    private readonly _stamps: Int32Array; // query in which a box was last visited, to report every box once
+    private _stamp: number = 0;
+
+    constructor(xs: Float64Array, ys: Float64Array, widths: Float64Array, heights: Float64Array, count: number = xs.length, cellSize: number = 100) {
+        this._xs = xs;
+        this._ys = ys;
+        this._widths = widths;
+        this._heights = heights;
+        this._count = count;
+        this._stamps = new Int32Array(count);
+        let minX = Number.POSITIVE_INFINITY;
+        let minY = Number.POSITIVE_INFINITY;
+        let maxX = Number.NEGATIVE_INFINITY;
+        let maxY = Number.NEGATIVE_INFINITY;
+        for (let i = 0; i < count; ++i) {
+            minX = Math.min(minX, xs[i]);
+            minY = Math.min(minY, ys[i]);
+            maxX = Math.max(maxX, xs[i] + widths[i]);
+            maxY = Math.max(maxY, ys[i] + heights[i]);
+        }
+        if (count === 0) {
+            minX = minY = maxX = maxY = 0;
+        }
+        this._originX = minX;
+        this._originY = minY;
+        // not many more cells than boxes
+        this._cellSize = Math.max(cellSize, Math.sqrt((maxX - minX) * (maxY - minY) / (4 * count + 16)), 1e-9);
+        this._cols = Math.floor((maxX - minX) / this._cellSize) + 1;
+        this._rows = Math.floor((maxY - minY) / this._cellSize) + 1;
+
+        const numCells = this._cols * this._rows;
+        const cellStarts = new Int32Array(numCells + 1);
+        for (let i = 0; i < count; ++i) {
+            const colEnd = this._col(xs[i] + widths[i]);
+            const rowEnd = this._row(ys[i] + heights[i]);
+            for (let row = this._row(ys[i]); row <= rowEnd; ++row) {
+                for (let col = this._col(xs[i]); col <= colEnd; ++col) {
+                    cellStarts[row * this._cols + col + 1]++;
+                }
+            }
+        }
+        for (let cell = 0; cell < numCells; ++cell) {
+            cellStarts[cell + 1] += cellStarts[cell];
+        }
+        const cellBoxes = new Int32Array(cellStarts[numCells]);
+        const fill = cellStarts.slice(0, numCells);
+        for (let i = 0; i < count; ++i) {
+            const colEnd = this._col(xs[i] + widths[i]);
+            const rowEnd = this._row(ys[i] + heights[i]);
+            for (let row = this._row(ys[i]); row <= rowEnd; ++row) {
+                for (let col = this._col(xs[i]); col <= colEnd; ++col) {
+                    cellBoxes[fill[row * this._cols + col]++] = i;
+                }
+            }
+        }
+        this._cellStarts = cellStarts;
+        this._cellBoxes = cellBoxes;
+    }
+
+    /**
+     * Calls f once with the index of every box that overlaps the given box (touching counts as overlapping).
+     */
+    forEachInBox(x: number, y: number, width: number, height: number, f: (i: number) => void): void {
+        if (this._count === 0) {
+            return;
+        }
+        const stamp = ++this._stamp;
+        const colEnd = this._col(x + width);
+        const rowEnd = this._row(y + height);
+        for (let row = this._row(y); row <= rowEnd; ++row) {
+            for (let col = this._col(x); col <= colEnd; ++col) {
+                const cell = row * this._cols + col;
+                const end = this._cellStarts[cell + 1];
+                for (let c = this._cellStarts[cell]; c < end; ++c) {
+                    const i = this._cellBoxes[c];
+                    if (this._stamps[i] === stamp) {
+                        continue;
+                    }
+                    this._stamps[i] = stamp;
+                    if (this._xs[i] <= x + width && this._xs[i] + this._widths[i] >= x
+                        && this._ys[i] <= y + height && this._ys[i] + this._heights[i] >= y) {
+                        f(i);
+                    }
+                }
+            }
+        }
+    }
+
+    private _col(x: number): number {
+        return Math.min(this._cols - 1, Math.max(0, Math.floor((x - this._originX) / this._cellSize)));
+    }
+
+    private _row(y: number): number {
+        return Math.min(this._rows - 1, Math.max(0, Math.floor((y - this._originY) / this._cellSize)));
+    }
+}
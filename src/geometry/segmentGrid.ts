@@ -0,0 +1,244 @@
+import {EPSILON} from "../util/constants";
+import Segment from "./segment";
+
+/**
+ * Uniform grid over the bounding boxes of a set of segments for finding their pairwise crossings.
+ * Every segment is registered in all cells its bounding box overlaps, and only segments sharing a cell are tested.
+ * A pair is reported only in the cell that contains the top left corner of the intersection of both bounding boxes,
+ * so no pair is found twice and no set of visited pairs is needed.
+ * Crossings are defined like Segment.intersects: segments sharing their start or their end point do not cross.
+ */
+export default class SegmentGrid {
+    // segments registered in more cells than this on average coarsen the grid
+    private static MAX_CELLS_PER_SEGMENT = 16;
+
+    private readonly _segments: Array<Segment>;
+    private readonly _coords: Float64Array; // per segment: startX, startY, endX, endY, minX, minY, maxX, maxY
+    private _originX: number = 0;
+    private _originY: number = 0;
+    private _cellWidth: number = 1;
+    private _cellHeight: number = 1;
+    private _cols: number = 1;
+    private _rows: number = 1;
+    private _cellStarts: Int32Array; // CSR offsets into _cellSegments, one more than the number of cells
+    private _cellSegments: Int32Array;
+
+    constructor(segments: Array<Segment>) {
+        this._segments = segments;
+        this._coords = new Float64Array(8 * segments.length);
+        let minX = Number.POSITIVE_INFINITY;
+        let minY = Number.POSITIVE_INFINITY;
+        let maxX = Number.NEGATIVE_INFINITY;
+        let maxY = Number.NEGATIVE_INFINITY;
+        let sumWidth = 0;
+        let sumHeight = 0;
+        for (let i = 0; i < segments.length; ++i) {
+            const segment = segments[i];
+            const c = 8 * i;
+            this._coords[c] = segment.start.x;
+            this._coords[c + 1] = segment.start.y;
+            this._coords[c + 2] = segment.end.x;
+            this._coords[c + 3] = segment.end.y;
+            this._coords[c + 4] = Math.min(segment.start.x, segment.end.x);
+            this._coords[c + 5] = Math.min(segment.start.y, segment.end.y);
+            this._coords[c + 6] = Math.max(segment.start.x, segment.end.x);
+            this._coords[c + 7] = Math.max(segment.start.y, segment.end.y);
+            minX = Math.min(minX, this._coords[c + 4]);
+            minY = Math.min(minY, this._coords[c + 5]);
+            maxX = Math.max(maxX, this._coords[c + 6]);
+            maxY = Math.max(maxY, this._coords[c + 7]);
+            sumWidth += this._coords[c + 6] - this._coords[c + 4];
+            sumHeight += this._coords[c + 7] - this._coords[c + 5];
+        }
+        if (segments.length === 0) {
+            this._cellStarts = new Int32Array(2);
+            this._cellSegments = new Int32Array(0);
+            return;
+        }
+        this._originX = minX;
+        this._originY = minY;
+
+        // cells about as large as the average bounding box, but not many more cells than segments
+        const width = maxX - minX;
+        const height = maxY - minY;
+        let cols = Math.max(1, Math.ceil(width / Math.max(1, sumWidth / segments.length)));
+        let rows = Math.max(1, Math.ceil(height / Math.max(1, sumHeight / segments.length)));
+        const maxCells = 4 * segments.length;
+        if (cols * rows > maxCells) {
+            const factor = Math.sqrt(cols * rows / maxCells);
+            cols = Math.max(1, Math.floor(cols / factor));
+            rows = Math.max(1, Math.floor(rows / factor));
+        }
+        while (true) {
+            this._setCells(width, height, cols, rows);
+            if (this._countEntries() <= SegmentGrid.MAX_CELLS_PER_SEGMENT * segments.length || cols * rows === 1) {
+                break;
+            }
+            cols = Math.max(1, Math.floor(cols / 2));
+            rows = Math.max(1, Math.floor(rows / 2));
+        }
+        this._fillCells();
+    }
+
+    /**
+     * Returns the number of pairwise crossings without materializing the pairs.
+     */
+    countCrossings(): number {
+        return this._forEachCrossing(null);
+    }
+
+    /**
+     * Returns the sum of the costs of all crossings, where a crossing costs between 1 (orthogonal segments) and
+     * 2 (almost parallel segments), see LayoutAnalysis.segmentCrossingsWithAngles.
+     */
+    crossingCost(): number {
+        let cost = 0;
+        this._forEachCrossing((i: number, j: number) => {
+            cost += 1 + this._angleCost(i, j);
+        });
+        return cost;
+    }
+
+    /**
+     * Returns all pairs of crossing segments.
+     */
+    crossingPairs(): Array<[Segment, Segment]> {
+        const pairs: Array<[Segment, Segment]> = [];
+        this._forEachCrossing((i: number, j: number) => {
+            pairs.push([this._segments[i], this._segments[j]]);
+        });
+        return pairs;
+    }
+
+    /**
+     * Calls f with the indices of every pair of crossing segments, the lower index first; returns the number of pairs.
+     */
+    forEachCrossing(f: (i: number, j: number) => void): number {
+        return this._forEachCrossing(f);
+    }
+
+    private _setCells(width: number, height: number, cols: number, rows: number): void {
+        this._cols = cols;
+        this._rows = rows;
+        // a little wider than the extent, so that the maximum coordinates fall into the last cell
+        this._cellWidth = Math.max(width * (1 + 1e-9), EPSILON) / cols;
+        this._cellHeight = Math.max(height * (1 + 1e-9), EPSILON) / rows;
+    }
+
+    private _col(x: number): number {
+        return Math.min(this._cols - 1, Math.max(0, Math.floor((x - this._originX) / this._cellWidth)));
+    }
+
+    private _row(y: number): number {
+        return Math.min(this._rows - 1, Math.max(0, Math.floor((y - this._originY) / this._cellHeight)));
+    }
+
+    private _countEntries(): number {
+        let entries = 0;
+        for (let i = 0; i < this._segments.length; ++i) {
+            const c = 8 * i;
+            entries += (this._col(this._coords[c + 6]) - this._col(this._coords[c + 4]) + 1)
+                * (this._row(this._coords[c + 7]) - this._row(this._coords[c + 5]) + 1);
+        }
+        return entries;
+    }
+
+    private _fillCells(): void {
+        const numCells = this._cols * this._rows;
+        const cellStarts = new Int32Array(numCells + 1);
+        for (let i = 0; i < this._segments.length; ++i) {
+            const c = 8 * i;
+            const colEnd = this._col(this._coords[c + 6]);
+            const rowEnd = this._row(this._coords[c + 7]);
+            for (let row = this._row(this._coords[c + 5]); row <= rowEnd; ++row) {
+                for (let col = this._col(this._coords[c + 4]); col <= colEnd; ++col) {
+                    cellStarts[row * this._cols + col + 1]++;
+                }
+            }
+        }
+        for (let cell = 0; cell < numCells; ++cell) {
+            cellStarts[cell + 1] += cellStarts[cell];
+        }
+        const cellSegments = new Int32Array(cellStarts[numCells]);
+        const fill = cellStarts.slice(0, numCells);
+        for (let i = 0; i < this._segments.length; ++i) {
+            const c = 8 * i;
+            const colEnd = this._col(this._coords[c + 6]);
+            const rowEnd = this._row(this._coords[c + 7]);
+            for (let row = this._row(this._coords[c + 5]); row <= rowEnd; ++row) {
+                for (let col = this._col(this._coords[c + 4]); col <= colEnd; ++col) {
+                    cellSegments[fill[row * this._cols + col]++] = i;
+                }
+            }
+        }
+        this._cellStarts = cellStarts;
+        this._cellSegments = cellSegments;
+    }
+
+    private _forEachCrossing(f: (i: number, j: number) => void): number {
+        const coords = this._coords;
+        let count = 0;
+        for (let row = 0; row < this._rows; ++row) {
+            for (let col = 0; col < this._cols; ++col) {
+                const cell = row * this._cols + col;
+                const end = this._cellStarts[cell + 1];
+                for (let a = this._cellStarts[cell]; a < end; ++a) {
+                    const i = this._cellSegments[a];
+                    const ci = 8 * i;
+                    for (let b = a + 1; b < end; ++b) {
+                        const j = this._cellSegments[b];
+                        const cj = 8 * j;
+                        // bounding boxes intersect (like Box.intersects)
+                        if (!(coords[ci + 4] + EPSILON < coords[cj + 6] && coords[ci + 6] > coords[cj + 4] + EPSILON
+                            && coords[ci + 5] + EPSILON < coords[cj + 7] && coords[ci + 7] > coords[cj + 5] + EPSILON)) {
+                            continue;
+                        }
+                        // only reported in the cell of the top left corner of the intersection of the boxes
+                        if (this._col(Math.max(coords[ci + 4], coords[cj + 4])) !== col
+                            || this._row(Math.max(coords[ci + 5], coords[cj + 5])) !== row) {
+                            continue;
+                        }
+                        if (this._crosses(ci, cj)) {
+                            count++;
+                            if (f !== null) {
+                                if (i < j) {
+                                    f(i, j);
+                                } else {
+                                    f(j, i);
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        return count;
+    }
+
+    private _crosses(ci: number, cj: number): boolean {
+        const coords = this._coords;
+        if ((coords[ci] === coords[cj] && coords[ci + 1] === coords[cj + 1])
+            || (coords[ci + 2] === coords[cj + 2] && coords[ci + 3] === coords[cj + 3])) {
+            return false;
+        }
+        return (this._orientation(ci, coords[cj], coords[cj + 1]) !== this._orientation(ci, coords[cj + 2], coords[cj + 3])
+            && this._orientation(cj, coords[ci], coords[ci + 1]) !== this._orientation(cj, coords[ci + 2], coords[ci + 3]));
+    }
+
+    // like Segment.orientation
+    private _orientation(c: number, x: number, y: number): number {
+        const coords = this._coords;
+        return Math.sign((coords[c + 3] - coords[c + 1]) * (x - coords[c + 2]) - (coords[c + 2] - coords[c]) * (y - coords[c + 3]));
+    }
+
+    // (cos(2 * angle) + 1) / 2 for the angle between the segments, which is the squared cosine of the angle
+    private _angleCost(i: number, j: number): number {
+        const coords = this._coords;
+        const xI = coords[8 * i + 2] - coords[8 * i];
+        const yI = coords[8 * i + 3] - coords[8 * i + 1];
+        const xJ = coords[8 * j + 2] - coords[8 * j];
+        const yJ = coords[8 * j + 3] - coords[8 * j + 1];
+        const dot = xI * xJ + yI * yJ;
+        return dot * dot / ((xI * xI + yI * yI) * (xJ * xJ + yJ * yJ));
+    }
+}
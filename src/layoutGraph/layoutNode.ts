@@ -31,6 +31,9 @@ export default class LayoutNode extends Node<LayoutGraph, LayoutEdge> {
 
     public levelNodes: Array<LevelNode> = [];
 
+    // ids of the render nodes from the top-level graph down to this node, e.g. "3/12", null for scope and virtual nodes
+    public renderPath: string = null;
+
     public childGraphs: Array<LayoutGraph> = [];
 
     public readonly padding: number;
@@ -3,8 +3,10 @@ module.exports = {
     lodash: require('lodash'),
     seedrandom: require('seedrandom'),
     Bench: require('./bench/bench').default,
+    RunControl: require('./bench/runControl').default,
     Loader: require('./parse/loader').default,
     Parser: require('./parse/parser').default,
+    BinaryParser: require('./parse/binaryParser').default,
     graph: {
         Graph: require('./graph/graph').default,
         Node: require('./graph/node').default,
@@ -20,6 +22,9 @@ module.exports = {
         LevelGraph: require('./levelGraph/levelGraph').default,
         LevelNode: require('./levelGraph/levelNode').default,
     },
+    renderer: {
+        HeadlessRenderer: require('./renderer/headlessRenderer').default,
+    },
     rankGraph: {
         RankGraph: require('./rank/rankGraph').default,
         RankNode: require('./rank/rankNode').default,
@@ -18,6 +18,9 @@ import Timer from "../util/timer";
 export default abstract class Layouter {
     protected _options: any;
 
+    // laid out nodes with child graphs by render path, for the option lazy
+    private _innerLayouts: Map<string, LayoutNode> = new Map();
+
     constructor(options: object = {}) {
         this._options = _.defaults(options, {
             targetEdgeLength: 50,
@@ -26,6 +29,8 @@ export default abstract class Layouter {
             weightCrossings: 1,
             weightLengths: 0.1,
             printTimes: false,
+            relayoutThreshold: 0.5,
+            lazy: false,
         });
     }
 
@@ -39,10 +44,67 @@ export default abstract class Layouter {
     }
 
     public async layout(renderGraph: RenderGraph): Promise<LayoutGraph> {
+        this._innerLayouts.clear();
+        return this._layout(renderGraph, null, []);
+    }
+
+    /**
+     * Expands the node at the id path (see relayout) and lays out the graph again.
+     * With the option lazy, collapsed nodes with child graphs (states and nested SDFGs) are laid out as placeholders
+     * of their collapsed size without their contents, which get no layout at all. The layouter keeps the inner
+     * layout of every expanded node until the next call of layout, so expanding lays out only the contents of the
+     * node if it was never expanded before, and the graphs around it. Collapsing and expanding again reuses the inner
+     * layout. Without lazy, the whole graph is laid out again and collapsed nodes are laid out like expanded ones.
+     */
+    public async expand(renderGraph: RenderGraph, path: Array<number>): Promise<LayoutGraph> {
+        return this._setCollapsed(renderGraph, path, false);
+    }
+
+    /**
+     * Collapses the node at the id path and lays out the graph again (see expand).
+     */
+    public async collapse(renderGraph: RenderGraph, path: Array<number>): Promise<LayoutGraph> {
+        return this._setCollapsed(renderGraph, path, true);
+    }
+
+    private async _setCollapsed(renderGraph: RenderGraph, path: Array<number>, collapsed: boolean): Promise<LayoutGraph> {
+        let graph = renderGraph;
+        let node = null;
+        _.forEach(path, (id: number) => {
+            node = graph.node(id);
+            graph = node.childGraph;
+        });
+        if (node === null || node.childGraph === null) {
+            throw new Error("No node with child graph at path " + path.join("/"));
+        }
+        node.collapsed = collapsed;
+        return this._layout(renderGraph, null, []);
+    }
+
+    /**
+     * Lays out an edited graph and keeps the previous layout of the nested graphs the edit did not touch.
+     * previous is the result of the last layout (or relayout) of the graph before the edit. changes holds the id
+     * paths of the added, removed or modified render nodes, i.e. the ids from the top-level graph down to the node
+     * (e.g. [stateId, nodeId] for a node in a state); an added or removed edge is given by its source or destination.
+     * Nodes with child graphs (states, nested SDFGs) without changes keep their size and contents: they are laid out
+     * like simple nodes and their contents are moved along with them, so only the graphs on the paths to the changes
+     * are ranked, ordered and placed again. Map scopes are part of their graph and always laid out again.
+     * If more than relayoutThreshold of all nodes would have to be laid out again, the whole graph is laid out.
+     */
+    public async relayout(renderGraph: RenderGraph, previous: LayoutGraph, changes: Array<Array<number>>): Promise<LayoutGraph> {
+        return this._layout(renderGraph, previous, changes);
+    }
+
+    private async _layout(renderGraph: RenderGraph, previous: LayoutGraph, changes: Array<Array<number>>): Promise<LayoutGraph> {
         const layoutGraph = this.createLayoutGraph(renderGraph);
 
         this._createComponents(layoutGraph);
 
+        let reused = (previous !== null ? this._detachReusable(layoutGraph, previous, changes) : []);
+        if (this._options.lazy) {
+            reused = reused.concat(this._detachCached(layoutGraph, changes));
+        }
+
         if (this._options['bundle']) {
             this._createBundles(layoutGraph);
         }
@@ -51,15 +113,33 @@ export default abstract class Layouter {
 
         const tmpRandom = Math.random;
         seedrandom("I am the seed string.", {global: true});
+        const timerEnabled = Timer.isEnabled();
+        if (this._options.printTimes) {
+            Timer.setEnabled(true);
+        }
         await this.doLayout(layoutGraph);
+        Timer.setEnabled(timerEnabled);
         Math.random = tmpRandom;
 
+        this._attachReused(reused);
+
         this._restoreCycles(layoutGraph);
         this._placeLoops(layoutGraph);
 
-        this._copyLayoutInfo(layoutGraph, renderGraph);
+        if (this._options.lazy) {
+            _.forEach(layoutGraph.allNodes(), (node: LayoutNode) => {
+                if (!node.isScopeNode && node.childGraphs.length > 0 && node.renderPath !== null) {
+                    this._innerLayouts.set(node.renderPath, node);
+                }
+            });
+        }
+
+        const laidOutGraphs = this._laidOutGraphs(renderGraph);
+        this._copyLayoutInfo(laidOutGraphs);
         if (DEBUG) {
-            Assert.assertAll(renderGraph.allEdges(), (edge: RenderEdge) => edge.points.length > 0, "edge has no points assigned");
+            _.forEach(laidOutGraphs, (graph: RenderGraph) => {
+                Assert.assertAll(graph.edges(), (edge: RenderEdge) => edge.points.length > 0, "edge has no points assigned");
+            });
         }
 
         if (this._options.printTimes) {
@@ -69,6 +149,13 @@ export default abstract class Layouter {
         return layoutGraph;
     }
 
+    /**
+     * Resolves once the layouter is ready to lay out, e.g. when its web workers have started.
+     */
+    public ready(): Promise<void> {
+        return Promise.resolve();
+    }
+
     public cleanUp(): void {
         // do nothing
     }
@@ -175,7 +262,7 @@ export default abstract class Layouter {
     }
 
     private createLayoutGraph(renderGraph: RenderGraph): LayoutGraph {
-        const transformSubgraph = (renderGraph: RenderGraph): LayoutGraph => {
+        const transformSubgraph = (renderGraph: RenderGraph, path: string): LayoutGraph => {
             let mayHaveCycles = false;
             if (renderGraph.parentNode === null || renderGraph.parentNode.type() === "NestedSDFG") {
                 mayHaveCycles = true;
@@ -184,13 +271,17 @@ export default abstract class Layouter {
 
             // add nodes and create groups for scopes (maps etc.)
             const createLayoutNode = (node: RenderNode) => {
-                const layoutNode = new LayoutNode(node.size(), node.childPadding, node.connectorPadding);
+                // a layout replaces the size of the render node with its bounding box (including its child graph), which
+                // must not carry over when the graph is laid out again (in lazy mode or after an edit)
+                const size = (this._options.lazy || node.x !== null ? node.collapsedSize() : node.size());
+                const layoutNode = new LayoutNode(size, node.childPadding, node.connectorPadding);
                 _.forEach(node.inConnectors, (connector: RenderConnector) => {
                     layoutNode.addConnector("IN", connector.name);
                 });
                 _.forEach(node.outConnectors, (connector: RenderConnector) => {
                     layoutNode.addConnector("OUT", connector.name);
                 });
+                layoutNode.renderPath = path + node.id;
                 node.layoutNode = layoutNode;
                 return layoutNode;
             };
@@ -295,14 +386,14 @@ export default abstract class Layouter {
 
             // recursively transform subgraph
             _.forEach(renderGraph.nodes(), (node: RenderNode) => {
-                if (node.childGraph !== null) {
-                    node.layoutNode.setChildGraph(transformSubgraph(node.childGraph));
+                if (node.childGraph !== null && !this._isPlaceholder(node)) {
+                    node.layoutNode.setChildGraph(transformSubgraph(node.childGraph, path + node.id + "/"));
                 }
             });
             renderGraph.layoutGraph = layoutGraph;
             return layoutGraph;
         }
-        return transformSubgraph(renderGraph);
+        return transformSubgraph(renderGraph, "");
     }
 
     private _createComponents(graph: LayoutGraph): void {
@@ -435,8 +526,32 @@ export default abstract class Layouter {
         });
     }
 
-    private _copyLayoutInfo(layoutGraph: LayoutGraph, renderGraph: RenderGraph) {
-        _.forEach(renderGraph.allNodes(), (node: RenderNode) => {
+    private _isPlaceholder(node: RenderNode): boolean {
+        return (this._options.lazy && node.collapsed && node.childGraph !== null);
+    }
+
+    /**
+     * Returns the render graph and all nested graphs except those in placeholders.
+     */
+    private _laidOutGraphs(renderGraph: RenderGraph): Array<RenderGraph> {
+        const graphs = [];
+        const addGraphs = (graph: RenderGraph) => {
+            graphs.push(graph);
+            _.forEach(graph.nodes(), (node: RenderNode) => {
+                if (node.childGraph !== null && !this._isPlaceholder(node)) {
+                    addGraphs(node.childGraph);
+                }
+            });
+        };
+        addGraphs(renderGraph);
+        return graphs;
+    }
+
+    private _copyLayoutInfo(graphs: Array<RenderGraph>) {
+        const nodes = _.flatMap(graphs, (graph: RenderGraph) => graph.nodes());
+        const edges = _.flatMap(graphs, (graph: RenderGraph) => graph.edges());
+        _.forEach(nodes, (node: RenderNode) => {
+            node.isPlaceholder = this._isPlaceholder(node);
             _.assign(node, node.layoutNode.boundingBox());
             _.forEach(_.concat(node.inConnectors), (connector: RenderConnector) => {
                 _.assign(connector, node.layoutNode.connector("IN", connector.name).boundingBox());
@@ -448,7 +563,7 @@ export default abstract class Layouter {
             delete node.layoutGraph;
             delete node.layoutNode;
         });
-        _.forEach(renderGraph.allEdges(), (edge: RenderEdge) => {
+        _.forEach(edges, (edge: RenderEdge) => {
             _.assign(edge, _.pick(edge.layoutEdge, ['points', 'labelX', 'labelY']));
             // duplicate bundle points to make curved edges go through them
             if (edge.layoutEdge.srcBundle !== null) {
@@ -460,11 +575,191 @@ export default abstract class Layouter {
             edge.updateBoundingBox();
             delete edge.layoutEdge;
         });
-        _.forEach(renderGraph.allGraphs(), (graph: RenderGraph) => {
+        _.forEach(graphs, (graph: RenderGraph) => {
             delete graph.layoutGraph;
         });
     }
 
+    /**
+     * Finds the outermost nodes with child graphs that have a counterpart with the same structure in the previous
+     * layout and contain no change, and turns them into simple nodes of their previous size for the layout.
+     * Returns the nodes with their counterparts and child graphs, or nothing if too much changed.
+     */
+    private _detachReusable(layoutGraph: LayoutGraph, previous: LayoutGraph, changes: Array<Array<number>>): Array<[LayoutNode, LayoutNode, Array<LayoutGraph>]> {
+        const changed = this._changedPaths(changes);
+        // nodes of the graphs including the contents of their scopes, which come from the same render graph
+        const addNodes = (graphs: Array<LayoutGraph>, nodes: Array<LayoutNode>): Array<LayoutNode> => {
+            _.forEach(graphs, (graph: LayoutGraph) => {
+                _.forEach(graph.nodes(), (node: LayoutNode) => {
+                    nodes.push(node);
+                    if (node.isScopeNode) {
+                        addNodes(node.childGraphs, nodes);
+                    }
+                });
+            });
+            return nodes;
+        };
+        const reusable = [];
+        const findReusable = (graphs: Array<LayoutGraph>, previousGraphs: Array<LayoutGraph>) => {
+            const previousNodes = new Map();
+            _.forEach(addNodes(previousGraphs, []), (node: LayoutNode) => {
+                if (node.renderPath !== null) {
+                    previousNodes.set(node.renderPath, node);
+                }
+            });
+            _.forEach(addNodes(graphs, []), (node: LayoutNode) => {
+                if (node.isScopeNode || node.childGraphs.length === 0 || !previousNodes.has(node.renderPath)) {
+                    return;
+                }
+                const previousNode = previousNodes.get(node.renderPath);
+                if (changed.has(node.renderPath) || !this._sameStructure(node.childGraphs, previousNode.childGraphs)) {
+                    findReusable(node.childGraphs, previousNode.childGraphs);
+                } else {
+                    reusable.push([node, previousNode]);
+                }
+            });
+        };
+        findReusable([layoutGraph], [previous]);
+
+        const numNodes = layoutGraph.allNodes().length;
+        const numReused = _.sum(_.map(reusable, ([node, previousNode]) => _.sum(_.map(node.childGraphs, (childGraph: LayoutGraph) => childGraph.allNodes().length))));
+        if (numNodes - numReused > this._options.relayoutThreshold * numNodes) {
+            return [];
+        }
+        return this._detach(reusable);
+    }
+
+    /**
+     * Like _detachReusable, but takes the outermost unchanged nodes with an inner layout kept for the option lazy.
+     */
+    private _detachCached(layoutGraph: LayoutGraph, changes: Array<Array<number>>): Array<[LayoutNode, LayoutNode, Array<LayoutGraph>]> {
+        const changed = this._changedPaths(changes);
+        const reusable = [];
+        const findCached = (graph: LayoutGraph) => {
+            _.forEach(graph.nodes(), (node: LayoutNode) => {
+                if (node.childGraphs.length === 0) {
+                    return;
+                }
+                const cachedNode = this._innerLayouts.get(node.renderPath);
+                if (!node.isScopeNode && cachedNode !== undefined && !changed.has(node.renderPath)
+                    && this._sameStructure(node.childGraphs, cachedNode.childGraphs)) {
+                    reusable.push([node, cachedNode]);
+                } else {
+                    _.forEach(node.childGraphs, findCached);
+                }
+            });
+        };
+        findCached(layoutGraph);
+        return this._detach(reusable);
+    }
+
+    /**
+     * Returns the id paths of the changed nodes and all their ancestors, joined by "/" like render paths.
+     */
+    private _changedPaths(changes: Array<Array<number>>): Set<string> {
+        const changed = new Set<string>();
+        _.forEach(changes, (path: Array<number>) => {
+            for (let i = 1; i <= path.length; ++i) {
+                changed.add(path.slice(0, i).join("/"));
+            }
+        });
+        return changed;
+    }
+
+    /**
+     * Takes the child graphs out of the nodes and gives the nodes the size of their counterparts.
+     */
+    private _detach(reusable: Array<[LayoutNode, LayoutNode]>): Array<[LayoutNode, LayoutNode, Array<LayoutGraph>]> {
+        return _.map(reusable, ([node, previousNode]): [LayoutNode, LayoutNode, Array<LayoutGraph>] => {
+            const childGraphs = node.childGraphs;
+            node.childGraphs = [];
+            // _placeLoops takes the width of a self-loop off again
+            node.setSize({
+                width: previousNode.width + (previousNode.selfLoop !== null ? this._options.targetEdgeLength : 0),
+                height: previousNode.height,
+            });
+            return [node, previousNode, childGraphs];
+        });
+    }
+
+    /**
+     * Checks that the graphs have the nodes (by id and render path) and the edges (by id and end points) of the
+     * previous graphs.
+     */
+    private _sameStructure(graphs: Array<LayoutGraph>, previousGraphs: Array<LayoutGraph>): boolean {
+        if (graphs.length !== previousGraphs.length) {
+            return false;
+        }
+        return _.every(graphs, (graph: LayoutGraph, c: number) => {
+            const previousGraph = previousGraphs[c];
+            const numSelfLoops = _.filter(previousGraph.nodes(), (node: LayoutNode) => node.selfLoop !== null).length;
+            if (graph.numNodes() !== previousGraph.numNodes() || graph.numEdges() !== previousGraph.numEdges() + numSelfLoops) {
+                return false;
+            }
+            const sameEdges = _.every(graph.edges(), (edge: LayoutEdge) => {
+                const previousEdge = this._previousEdge(previousGraph, edge);
+                return (previousEdge !== undefined && previousEdge.src === edge.src && previousEdge.dst === edge.dst);
+            });
+            return sameEdges && _.every(graph.nodes(), (node: LayoutNode) => {
+                const previousNode = previousGraph.node(node.id);
+                return (previousNode !== undefined && previousNode.renderPath === node.renderPath
+                    && this._sameStructure(node.childGraphs, previousNode.childGraphs));
+            });
+        });
+    }
+
+    /**
+     * Puts the child graphs back into the reused nodes and copies their previous layout, moved with the node.
+     */
+    private _attachReused(reused: Array<[LayoutNode, LayoutNode, Array<LayoutGraph>]>): void {
+        _.forEach(reused, ([node, previousNode, childGraphs]) => {
+            node.childGraphs = childGraphs;
+            this._copyPreviousLayout(childGraphs, previousNode.childGraphs, node.x - previousNode.x, node.y - previousNode.y);
+        });
+    }
+
+    private _copyPreviousLayout(graphs: Array<LayoutGraph>, previousGraphs: Array<LayoutGraph>, x: number, y: number): void {
+        _.forEach(graphs, (graph: LayoutGraph, c: number) => {
+            const previousGraph = previousGraphs[c];
+            _.forEach(graph.nodes(), (node: LayoutNode) => {
+                const previousNode = previousGraph.node(node.id);
+                node.setPosition(new Vector(previousNode.x + x, previousNode.y + y));
+                node.setSize(previousNode.size());
+                node.rank = previousNode.rank;
+                node.rankSpan = previousNode.rankSpan;
+                _.forEach(node.connectors(), (connector: LayoutConnector) => {
+                    const previousConnector = previousNode.connector(connector.type, connector.name);
+                    if (previousConnector !== undefined) {
+                        connector.setPosition(previousConnector.x + x, previousConnector.y + y);
+                    }
+                });
+                this._copyPreviousLayout(node.childGraphs, previousNode.childGraphs, x, y);
+            });
+            // the graph has not been through _removeCycles, so self-loops are still edges;
+            // the bundles stay unset because _copyLayoutInfo already added the bundle points to the previous points
+            _.forEach(graph.edges(), (edge: LayoutEdge) => {
+                const previousEdge = this._previousEdge(previousGraph, edge);
+                edge.points = _.map(previousEdge.points, (point: Vector) => new Vector(point.x + x, point.y + y));
+            });
+        });
+    }
+
+    /**
+     * Returns the edge with the id of the edge in the previous graph, where self-loops are no edges of the graph
+     * anymore but the selfLoop of their node.
+     */
+    private _previousEdge(previousGraph: LayoutGraph, edge: LayoutEdge): LayoutEdge {
+        const previousEdge = previousGraph.edge(edge.id);
+        if (previousEdge !== undefined || edge.src !== edge.dst) {
+            return previousEdge;
+        }
+        const previousNode = previousGraph.node(edge.src);
+        if (previousNode === undefined || previousNode.selfLoop === null || previousNode.selfLoop.id !== edge.id) {
+            return undefined;
+        }
+        return previousNode.selfLoop;
+    }
+
     private _removeCycles(graph: LayoutGraph): void {
         _.forEach(graph.allGraphs(), (subgraph: LayoutGraph) => {
             if (subgraph.mayHaveCycles) {
@@ -1,13 +1,25 @@
 import {DEBUG, EPSILON} from "../util/constants";
 import * as _ from "lodash";
 import Assert from "../util/assert";
+import BoxGrid from "../geometry/boxGrid";
 import LayoutEdge from "../layoutGraph/layoutEdge";
 import LayoutGraph from "../layoutGraph/layoutGraph";
 import LayoutNode from "../layoutGraph/layoutNode";
 import RecursiveLayouter from "./recursiveLayouter";
 import Shuffle from "../util/shuffle";
+import Timer from "../util/timer";
 import Vector from "../geometry/vector";
 
+const TIMER_FORCES = Timer.register(["doLayout", "forces"]);
+
+/**
+ * Force-directed layouter: edges are springs that are turned downwards by a magnetic field and nodes repel each other.
+ * The repulsion is ramped up over rampIterations iterations (default: all of them).
+ * By default, all pairs of non-adjacent nodes repel each other and the iteration runs until the nodes stop moving.
+ * For large graphs, repulsion can be cut off at repulsionCutoff, so that only nearby nodes have to be found (see
+ * BoxGrid), and after the ramp the step size can be multiplied by cooling (< 1) whenever the forces do not decrease
+ * and the iteration stopped once no node moves more than tolerance.
+ */
 export default class MagneticSpringLayouter extends RecursiveLayouter {
     constructor(options: object = {}) {
         super();
@@ -21,6 +33,10 @@ export default class MagneticSpringLayouter extends RecursiveLayouter {
             magneticAngleExponent: 5,
             forceCap: 100,
             decay: 1,
+            repulsionCutoff: null,
+            rampIterations: null,
+            tolerance: 0,
+            cooling: 1,
         });
     }
 
@@ -76,161 +92,190 @@ export default class MagneticSpringLayouter extends RecursiveLayouter {
                 });
         }
 
-        // precompute set of neighbors and non-neighbors
-        const neighbors = new Array(graph.maxId() + 1);
-        const nonNeighbors = new Array(graph.maxId() + 1);
-        const forces = new Array(graph.maxId() + 1);
-        _.forEach(graph.nodes(), (node) => {
-            neighbors[node.id] = new Set();
-            nonNeighbors[node.id] = new Set();
+        const nodes = graph.nodes();
+        const n = nodes.length;
+        const targetEdgeLength = this._options.targetEdgeLength;
+        const spaceBetweenNodes = this._options.spaceBetweenNodes;
+        const forceCap = this._options.forceCap;
+        const cutoff = this._options.repulsionCutoff;
+        const rampIterations = Math.max(1, (this._options.rampIterations !== null ?
+            Math.min(this._options.numIterations, this._options.rampIterations) : this._options.numIterations));
+
+        // positions and sizes by node index, the nodes are moved once at the end
+        const index = new Int32Array(graph.maxId() + 1);
+        const xs = new Float64Array(n);
+        const ys = new Float64Array(n);
+        const widths = new Float64Array(n);
+        const heights = new Float64Array(n);
+        _.forEach(nodes, (node: LayoutNode, i: number) => {
+            index[node.id] = i;
+            xs[i] = node.x;
+            ys[i] = node.y;
+            widths[i] = node.width;
+            heights[i] = node.height;
         });
-        _.forEach(graph.edges(), (edge: LayoutEdge) => {
-            if (edge.src !== edge.dst) {
-                neighbors[edge.dst].add(graph.node(edge.src));
-            }
+        const startXs = xs.slice();
+        const startYs = ys.slice();
+
+        // in-neighbors in CSR form and the set of adjacent pairs (i * n + j with i < j), which do not repel each other
+        const inStarts = new Int32Array(n + 1);
+        _.forEach(nodes, (node: LayoutNode, i: number) => {
+            inStarts[i + 1] = inStarts[i] + graph.inEdgesIds(node.id).length;
         });
-        _.forEach(graph.nodes(), (nodeA) => {
-            _.forEach(graph.nodes(), (nodeB) => {
-                if (nodeA !== nodeB && !neighbors[nodeA.id].has(nodeB) && !neighbors[nodeB.id].has(nodeA)) {
-                    nonNeighbors[nodeA.id].add(nodeB);
+        const inNodes = new Int32Array(inStarts[n]);
+        const adjacent = new Set<number>();
+        _.forEach(nodes, (node: LayoutNode, i: number) => {
+            _.forEach(graph.inEdges(node.id), (edge: LayoutEdge, k: number) => {
+                const j = index[edge.src];
+                inNodes[inStarts[i] + k] = j;
+                if (i !== j) {
+                    adjacent.add(Math.min(i, j) * n + Math.max(i, j));
                 }
             });
         });
 
-        function xIntersection(src: Vector, dst: Vector, srcToDst: Vector, x: number): Vector {
-            if (DEBUG) {
-                Assert.assert(srcToDst.x !== 0, "x intersection with vertical line");
-            }
-            if (Math.sign(dst.x - src.x) === Math.sign(x - dst.x)) {
-                return null;
-            }
-            return srcToDst.clone().setX(x - src.x).add(src);
-        }
-
-        function yIntersection(src: Vector, dst: Vector, srcToDst: Vector, y: number): Vector {
-            if (DEBUG) {
-                Assert.assert(srcToDst.y !== 0, "y intersection with horizontal line");
-            }
-            if (Math.sign(dst.y - src.y) === Math.sign(y - dst.y)) {
-                return null;
-            }
-            return srcToDst.clone().setY(y - src.y).add(src);
-        }
-
-        function distanceVector(srcNode: LayoutNode, dstNode: LayoutNode) {
-            const srcBox = srcNode.boundingBox();
-            const dstBox = dstNode.boundingBox();
-            const srcCenter = srcBox.center();
-            const dstCenter = dstBox.center();
-            if (srcBox.intersects(dstBox)) {
-                if (srcCenter.x === dstCenter.x && srcCenter.y === dstCenter.y) {
-                    return new Vector(Math.random(), Math.random()).setLength(0.001);
-                }
-                return dstCenter.clone().sub(srcCenter).setLength(0.001);
-            }
-            const srcToDst = dstCenter.sub(srcCenter);
-            const x = Math.max(0, Math.abs(srcToDst.x) - (srcNode.width + dstNode.width) / 2);
-            const y = Math.max(0, Math.abs(srcToDst.y) - (srcNode.height + dstNode.height) / 2);
-            if (x === 0 && y === 0) {
-                return dstCenter.clone().sub(srcCenter).setLength(0.001);
-            }
-            return srcToDst.setLength((new Vector(x, y)).length());
-        }
-
-        function edgeDistanceVector(srcNode: LayoutNode, dstNode: LayoutNode) {
-            const src = srcNode.boundingBox().bottomCenter();
-            const dst = dstNode.boundingBox().topCenter();
-            if (src.x === dst.x && src.y === dst.y) {
-                const srcCenter = srcNode.boundingBox().center();
-                const dstCenter = dstNode.boundingBox().center();
-                if (srcCenter.x === dstCenter.x && srcCenter.y === dstCenter.y) {
-                    return new Vector(Math.random(), Math.random()).setLength(1E-5);
-                }
-                return dstCenter.clone().sub(srcCenter).setLength(1E-5);
-            }
-            return dst.sub(src);
-        }
-
-        const fieldVector = new Vector(0, 1);
         const HALF_PI = Math.PI / 2;
 
         let weightSpring = this._options.weightSpring;
         let weightMagnetic = this._options.weightMagnetic;
         let weightRepulsive = 0;
+        // once the repulsion has been ramped up, the step shrinks whenever the energy (sum of squared forces) does not
+        // decrease, so that oscillating nodes come to rest
+        let stepSize = this._options.stepSize;
+        let energy = Number.POSITIVE_INFINITY;
+        Timer.start(TIMER_FORCES);
         for (let iteration = 0; iteration < this._options.numIterations; ++iteration) {
-            _.forEach(graph.nodes(), (node: LayoutNode) => {
-                forces[node.id] = new Vector();
-            });
+            // nodes farther apart than the cutoff do not repel each other, so only the grid cells around a node are visited
+            const grid = (cutoff !== null ? new BoxGrid(xs, ys, widths, heights, n, Math.max(cutoff, spaceBetweenNodes)) : null);
+            const factor = Math.pow(this._options.decay, iteration) * stepSize;
             let maxOffset = 0;
-            _.forEach(graph.nodes(), (node: LayoutNode) => {
-                let springForce = new Vector();
-                let magneticForce = new Vector();
-                let repulsiveForce = new Vector();
-                _.forEach(graph.inNeighbors(node.id), (inNeighbor: LayoutNode) => {
+            let newEnergy = 0;
+            for (let i = 0; i < n; ++i) {
+                let springX = 0;
+                let springY = 0;
+                let magneticX = 0;
+                let magneticY = 0;
+                let repulsiveX = 0;
+                let repulsiveY = 0;
+                const centerX = xs[i] + widths[i] / 2;
+                const centerY = ys[i] + heights[i] / 2;
+                for (let k = inStarts[i]; k < inStarts[i + 1]; ++k) {
+                    const j = inNodes[k];
+                    // edge vector from the bottom center of the in-neighbor to the top center of the node
+                    let vx = centerX - (xs[j] + widths[j] / 2);
+                    let vy = ys[i] - (ys[j] + heights[j]);
+                    let length: number;
+                    if (vx === 0 && vy === 0) {
+                        vx = 0;
+                        vy = centerY - (ys[j] + heights[j] / 2);
+                        if (vy === 0) {
+                            vx = Math.random();
+                            vy = Math.random();
+                        }
+                        length = Math.sqrt(vx * vx + vy * vy);
+                        vx *= 1E-5 / length;
+                        vy *= 1E-5 / length;
+                        length = 1E-5;
+                    } else {
+                        length = Math.sqrt(vx * vx + vy * vy);
+                    }
                     // spring force
-                    const edgeVector = edgeDistanceVector(inNeighbor, node);
-                    const strength = Math.log(edgeVector.length() / this._options.targetEdgeLength);
-                    springForce.add(edgeVector.clone().normalize().multiplyScalar(-1 * strength));
+                    const strength = Math.log(length / targetEdgeLength);
+                    springX -= vx / length * strength;
+                    springY -= vy / length * strength;
                     // magnetic force
-                    if (edgeVector.x === 0 && edgeVector.y > 0) {
+                    if (vx === 0 && vy > 0) {
+                        continue;
+                    }
+                    // direction (1 / vx, 1 / vy) with the x component flipped for downward and the y component for
+                    // upward edges, normalized; straight down for vertical edges
+                    let directionX = 0;
+                    let directionY = 1;
+                    if (vx !== 0) {
+                        const sign = Math.sign(vx * vy);
+                        directionX = sign * vy / length;
+                        directionY = sign * vx / length;
+                        if (vy < 0) {
+                            directionY = -directionY;
+                        } else {
+                            directionX = -directionX;
+                        }
+                    }
+                    const angle = HALF_PI - Math.sign(vy) * Math.atan(Math.abs(vy / vx));
+                    const magnitude = Math.pow(angle / HALF_PI, this._options.magneticAngleExponent)
+                        * Math.pow(length, this._options.magneticDistanceExponent);
+                    magneticX += directionX * magnitude;
+                    magneticY += directionY * magnitude;
+                }
+                // repulsive force from the other nodes, with a cutoff only from those whose boxes are closer than it
+                const repel = (j: number) => {
+                    if (j === i || adjacent.has(Math.min(i, j) * n + Math.max(i, j))) {
                         return;
                     }
-                    let magneticDirection = new Vector(1 / edgeVector.x, 1 / edgeVector.y);
-                    if (edgeVector.y < 0) {
-                        magneticDirection.y *= -1;
+                    let dx = (xs[j] + widths[j] / 2) - centerX;
+                    let dy = (ys[j] + heights[j] / 2) - centerY;
+                    const gapX = Math.abs(dx) - (widths[i] + widths[j]) / 2;
+                    const gapY = Math.abs(dy) - (heights[i] + heights[j]) / 2;
+                    let length: number;
+                    if (gapX < EPSILON && gapY < EPSILON) {
+                        // overlapping boxes push each other apart along the line between their centers
+                        if (dx === 0 && dy === 0) {
+                            dx = Math.random();
+                            dy = Math.random();
+                        }
+                        length = 0.001;
                     } else {
-                        magneticDirection.x *= -1;
+                        length = Math.sqrt(Math.max(0, gapX) * Math.max(0, gapX) + Math.max(0, gapY) * Math.max(0, gapY));
+                        if (length === 0) {
+                            length = 0.001;
+                        }
                     }
-                    if (edgeVector.x === 0) {
-                        magneticDirection = fieldVector.clone();
-                    }
-                    let angle = HALF_PI - Math.sign(edgeVector.y) * Math.atan(Math.abs(edgeVector.y / edgeVector.x));
-                    let angleFactor = Math.pow(angle / HALF_PI, this._options.magneticAngleExponent);
-                    const distanceFactor = Math.pow(edgeVector.length(), this._options.magneticDistanceExponent);
-                    const tmpMagneticForce = magneticDirection.clone().normalize().multiplyScalar(angleFactor * distanceFactor);
-                    if (DEBUG) {
-                        Assert.assert(tmpMagneticForce.isFinite(), "magnetic force is not finite");
+                    if (cutoff !== null && length > cutoff) {
+                        return;
                     }
-                    magneticForce.add(tmpMagneticForce);
-                });
-                nonNeighbors[node.id].forEach((nonNeighbor: LayoutNode) => {
-                    // repulsive force
-                    const edgeVector = distanceVector(node, nonNeighbor);
-                    const length = edgeVector.length();
-                    const relativeLength = length / this._options.spaceBetweenNodes;
+                    const relativeLength = length / spaceBetweenNodes;
                     const strength = 1 / (relativeLength * relativeLength);
-                    const tmpRepulsiveForce = edgeVector.clone().normalize().multiplyScalar(-1 * strength);
-                    if (DEBUG) {
-                        Assert.assert(tmpRepulsiveForce.isFinite(), "repulsive force is not finite");
+                    const centerDistance = Math.sqrt(dx * dx + dy * dy);
+                    repulsiveX -= dx / centerDistance * strength;
+                    repulsiveY -= dy / centerDistance * strength;
+                };
+                if (grid !== null) {
+                    grid.forEachInBox(xs[i] - cutoff, ys[i] - cutoff, widths[i] + 2 * cutoff, heights[i] + 2 * cutoff, repel);
+                } else {
+                    for (let j = 0; j < n; ++j) {
+                        repel(j);
                     }
-                    repulsiveForce.add(tmpRepulsiveForce);
-                });
-                if (repulsiveForce.length() > this._options.forceCap) {
-                    repulsiveForce.setLength(this._options.forceCap);
-                }
-                if (springForce.length() > this._options.forceCap) {
-                    springForce.setLength(this._options.forceCap);
                 }
-                if (magneticForce.length() > this._options.forceCap) {
-                    magneticForce.setLength(this._options.forceCap);
-                }
-                repulsiveForce.multiplyScalar(weightRepulsive);
-                springForce.multiplyScalar(weightSpring);
-                magneticForce.multiplyScalar(weightMagnetic);
-                const offset = springForce.clone().add(magneticForce).add(repulsiveForce);
-                offset.multiplyScalar(Math.pow(this._options.decay, iteration) * this._options.stepSize);
-                maxOffset = Math.max(maxOffset, offset.length());
+                const springScale = weightSpring * Math.min(1, forceCap / Math.sqrt(springX * springX + springY * springY));
+                const magneticScale = weightMagnetic * Math.min(1, forceCap / Math.sqrt(magneticX * magneticX + magneticY * magneticY));
+                const repulsiveScale = weightRepulsive * Math.min(1, forceCap / Math.sqrt(repulsiveX * repulsiveX + repulsiveY * repulsiveY));
+                const forceX = springX * springScale + magneticX * magneticScale + repulsiveX * repulsiveScale;
+                const forceY = springY * springScale + magneticY * magneticScale + repulsiveY * repulsiveScale;
+                newEnergy += forceX * forceX + forceY * forceY;
+                const offsetX = forceX * factor;
+                const offsetY = forceY * factor;
                 if (DEBUG) {
-                    Assert.assert(offset.isFinite(), "offset is not finite");
+                    Assert.assert(isFinite(offsetX) && isFinite(offsetY), "offset is not finite");
                 }
-                node.translate(offset.x, offset.y);
-            });
-            // stop when all nodes in subgraph almost stopped moving
-            if (maxOffset < EPSILON) {
+                xs[i] += offsetX;
+                ys[i] += offsetY;
+                maxOffset = Math.max(maxOffset, Math.sqrt(offsetX * offsetX + offsetY * offsetY));
+            }
+            // stop when all nodes in subgraph almost stopped moving, after the repulsion has been ramped up also
+            // when they move less than the tolerance (if any)
+            if (maxOffset < EPSILON || (iteration + 1 >= rampIterations && maxOffset < this._options.tolerance)) {
                 break;
             }
-            weightRepulsive += this._options.weightRepulsive / this._options.numIterations;
+            if (iteration + 1 >= rampIterations && newEnergy >= energy) {
+                stepSize *= this._options.cooling;
+            }
+            energy = newEnergy;
+            weightRepulsive = Math.min(this._options.weightRepulsive, weightRepulsive + this._options.weightRepulsive / rampIterations);
         }
+        Timer.stop(TIMER_FORCES);
+        _.forEach(nodes, (node: LayoutNode, i: number) => {
+            node.translate(xs[i] - startXs[i], ys[i] - startYs[i]);
+        });
 
         // place edges
         _.forEach(graph.edges(), (edge: LayoutEdge) => {
@@ -4,13 +4,15 @@ import LayoutNode from "../layoutGraph/layoutNode";
 import LayoutGraph from "../layoutGraph/layoutGraph";
 import Timer from "../util/timer";
 
+const TIMER_DO_LAYOUT = Timer.register(["doLayout"]);
+
 export default abstract class RecursiveLayouter extends Layouter {
     doLayout(graph: LayoutGraph) {
-        Timer.start(["doLayout"]);
+        Timer.start(TIMER_DO_LAYOUT);
         this.recursiveLayout(graph);
         const box = graph.boundingBox();
         graph.translateElements(-box.x, -box.y);
-        Timer.stop(["doLayout"]);
+        Timer.stop(TIMER_DO_LAYOUT);
     }
 
     recursiveLayout(graph: LayoutGraph) {
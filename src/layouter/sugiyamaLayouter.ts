@@ -20,12 +20,40 @@ import OrderRank from "../order/orderRank";
 import RankGraph from "../rank/rankGraph";
 import RankNode from "../rank/rankNode";
 import Segment from "../geometry/segment";
+import SegmentGrid from "../geometry/segmentGrid";
 import Shuffle from "../util/shuffle";
 import Timer from "../util/timer";
 import Vector from "../geometry/vector";
 import Wasm from "../wasm/wasm";
 import WorkerPool from "../util/workerPool";
 
+const TIMER_DO_LAYOUT = Timer.register(["doLayout"]);
+const TIMER_ADD_VIRTUAL_NODES = Timer.register(["doLayout", "addVirtualNodes"]);
+const TIMER_ASSIGN_COORDINATES = Timer.register(["doLayout", "assignCoordinates"]);
+const TIMER_ASSIGN_Y = Timer.register(["doLayout", "assignCoordinates", "assignY"]);
+const TIMER_PLACE_SUBGRAPH = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph"]);
+const TIMER_ASSIGN_X = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX"]);
+const TIMER_ALIGN_MEDIAN = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian"]);
+const TIMER_CREATE_NEIGHBOR_LIST = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "createNeighborList"]);
+const TIMER_FIND_NEIGHBOR = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "findNeighbor"]);
+const TIMER_MARK_CONFLICTS = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "markConflicts"]);
+const TIMER_RANK = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "rank"]);
+const TIMER_GET_RANKS = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "getRanks"]);
+const TIMER_MERGE = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "merge"]);
+const TIMER_CHANGE_PARENT_SIZE = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "changeParentSize"]);
+const TIMER_PLACE_CONNECTORS = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "placeConnectors"]);
+const TIMER_PLACE_EDGES = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges"]);
+const TIMER_MARK_NO_PROXIES = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "markNoProxies"]);
+const TIMER_REMOVE_VIRTUAL = Timer.register(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "removeVirtual"]);
+const TIMER_ASSIGN_RANKS = Timer.register(["doLayout", "assignRanks"]);
+const TIMER_OPTIMIZE_ANGLES = Timer.register(["doLayout", "optimizeAngles"]);
+const TIMER_ORDER_RANKS = Timer.register(["doLayout", "orderRanks"]);
+const TIMER_DO_ORDER = Timer.register(["doLayout", "orderRanks", "doOrder"]);
+const TIMER_INSERT_NODES = Timer.register(["doLayout", "orderRanks", "doOrder", "insertNodes"]);
+const TIMER_ORDER_CONNECTORS = Timer.register(["doLayout", "orderRanks", "doOrder", "orderConnectors"]);
+const TIMER_ORDER_NODES = Timer.register(["doLayout", "orderRanks", "doOrder", "orderNodes"]);
+const TIMER_PREORDER = Timer.register(["doLayout", "orderRanks", "doOrder", "preorder"]);
+
 export default class SugiyamaLayouter extends Layouter {
     protected _wasm: Wasm;
     protected _pool: WorkerPool = null;
@@ -44,6 +72,7 @@ export default class SugiyamaLayouter extends Layouter {
             webWorkers: false,
             maxWorkers: (typeof(navigator) !== "undefined" ? (navigator.hardwareConcurrency - 1) : 0),
             sharedArrayBuffer: false,
+            keepWorkers: true,
         });
         if (this._options.webWorkers && this._options.maxWorkers > 0) {
             let workerPath = '/worker/worker.js';
@@ -51,7 +80,7 @@ export default class SugiyamaLayouter extends Layouter {
             if (layouterDirPos > -1) {
                 workerPath = window.location.href.substr(0, layouterDirPos + ROOT_DIR.length) + '/worker/worker.js';
             }
-            this._pool = new WorkerPool(workerPath, Math.min(Math.max(this._options.numShuffles, 4), this._options.maxWorkers), this);
+            this._pool = WorkerPool.get(workerPath, Math.min(Math.max(this._options.numShuffles, 4), this._options.maxWorkers), this);
         }
         if (this._options.webAssembly) {
             let wasmPath = '/wasm/countCrossings.js';
@@ -71,12 +100,20 @@ export default class SugiyamaLayouter extends Layouter {
         this._bufferClass = this._options.sharedArrayBuffer ? SharedArrayBuffer : ArrayBuffer;
     }
 
+    /**
+     * Gives back the worker pool; unless keepWorkers is disabled, its workers stay alive for the next layouter.
+     */
     public cleanUp(): void {
         if (this._pool !== null) {
-            this._pool.cleanUp();
+            this._pool.release(this._options.keepWorkers);
+            this._pool = null;
         }
     }
 
+    public ready(): Promise<void> {
+        return (this._pool !== null ? this._pool.ready() : Promise.resolve());
+    }
+
     public disableWasm(): void {
         this._wasm = null;
     }
@@ -90,40 +127,40 @@ export default class SugiyamaLayouter extends Layouter {
             return;
         }
 
-        Timer.start(["doLayout"]);
+        Timer.start(TIMER_DO_LAYOUT);
 
         // STEP 1: ASSIGN RANKS
-        Timer.start(["doLayout", "assignRanks"]);
+        Timer.start(TIMER_ASSIGN_RANKS);
         this._assignRanks(graph);
-        Timer.stop(["doLayout", "assignRanks"]);
+        Timer.stop(TIMER_ASSIGN_RANKS);
 
         // STEP 2: ADD VIRTUAL NODES
-        Timer.start(["doLayout", "addVirtualNodes"]);
+        Timer.start(TIMER_ADD_VIRTUAL_NODES);
         this._addVirtualNodes(graph);
-        Timer.stop(["doLayout", "addVirtualNodes"]);
+        Timer.stop(TIMER_ADD_VIRTUAL_NODES);
 
         // STEP 3: ORDER RANKS
-        Timer.start(["doLayout", "orderRanks"]);
+        Timer.start(TIMER_ORDER_RANKS);
         await this._orderRanks(graph);
-        Timer.stop(["doLayout", "orderRanks"]);
+        Timer.stop(TIMER_ORDER_RANKS);
 
         // STEP 4: ASSIGN COORDINATES & REMOVE VIRTUAL NODES
         const rankTops = [];
         const segmentsPerRank = [];
         const crossingsPerRank = [];
 
-        Timer.start(["doLayout", "assignCoordinates"]);
+        Timer.start(TIMER_ASSIGN_COORDINATES);
         await this._assignCoordinates(graph, rankTops, segmentsPerRank, crossingsPerRank);
-        Timer.stop(["doLayout", "assignCoordinates"]);
+        Timer.stop(TIMER_ASSIGN_COORDINATES);
 
         // STEP 5 (OPTIONAL): OPTIMIZE ANGLES
         if (this._options.optimizeAngles) {
-            Timer.start(["doLayout", "optimizeAngles"]);
+            Timer.start(TIMER_OPTIMIZE_ANGLES);
             this._optimizeAngles(graph, rankTops, segmentsPerRank, crossingsPerRank);
-            Timer.stop(["doLayout", "optimizeAngles"]);
+            Timer.stop(TIMER_OPTIMIZE_ANGLES);
         }
 
-        Timer.stop(["doLayout"]);
+        Timer.stop(TIMER_DO_LAYOUT);
     }
 
     private _assignRanks(graph: LayoutGraph): void {
@@ -454,14 +491,14 @@ export default class SugiyamaLayouter extends Layouter {
     }
 
     public async doOrder(graph: LayoutGraph, shuffle: boolean = false): Promise<void> {
-        Timer.start(["doLayout", "orderRanks", "doOrder"]);
+        Timer.start(TIMER_DO_ORDER);
         /**
          * STEP 1 (OPTIONAL): ORDER NODES BASED ON CONNECTORS
          * In this step, scope insides and outsides are handled in the same order graph.
          * If there are nested scopes, they are flattened.
          */
         if (this._options.jointOrder) {
-            Timer.start(["doLayout", "orderRanks", "doOrder", "preorder"]);
+            Timer.start(TIMER_PREORDER);
             // order
             const connectorOrderGraph = this._createConnectorGraph(graph, true, shuffle, shuffle);
             await connectorOrderGraph.order({
@@ -481,7 +518,7 @@ export default class SugiyamaLayouter extends Layouter {
                     }
                 }
             });
-            Timer.stop(["doLayout", "orderRanks", "doOrder", "preorder"]);
+            Timer.stop(TIMER_PREORDER);
         }
 
         /**
@@ -495,7 +532,7 @@ export default class SugiyamaLayouter extends Layouter {
         // child graphs are visited before their parents
         const allGraphs = graph.allGraphs();
         for (let i = allGraphs.length - 1; i >= 0; --i) {
-            Timer.start(["doLayout", "orderRanks", "doOrder", "orderNodes"]);
+            Timer.start(TIMER_ORDER_NODES);
 
             const subgraph = allGraphs[i];
             this._addVirtualNodes(subgraph, true);
@@ -553,9 +590,9 @@ export default class SugiyamaLayouter extends Layouter {
                 countInitial: this._options.jointOrder,
             });
 
-            Timer.stop(["doLayout", "orderRanks", "doOrder", "orderNodes"]);
+            Timer.stop(TIMER_ORDER_NODES);
 
-            Timer.start(["doLayout", "orderRanks", "doOrder", "insertNodes"]);
+            Timer.start(TIMER_INSERT_NODES);
 
             // copy node order into layout graph
             const newOrderNodes: Set<OrderNode> = new Set();
@@ -727,7 +764,7 @@ export default class SugiyamaLayouter extends Layouter {
                     });
                 }
             });
-            Timer.stop(["doLayout", "orderRanks", "doOrder", "insertNodes"]);
+            Timer.stop(TIMER_INSERT_NODES);
         }
 
         this._updateLevelNodeRanks(graph);
@@ -741,7 +778,7 @@ export default class SugiyamaLayouter extends Layouter {
          */
 
         // order connectors
-        Timer.start(["doLayout", "orderRanks", "doOrder", "orderConnectors"]);
+        Timer.start(TIMER_ORDER_CONNECTORS);
         const connectorOrderGraph = this._createConnectorGraph(graph, false, false, shuffle && !this._options.jointOrder);
 
         await connectorOrderGraph.order({
@@ -779,9 +816,9 @@ export default class SugiyamaLayouter extends Layouter {
                 }
             }
         });
-        Timer.stop(["doLayout", "orderRanks", "doOrder", "orderConnectors"]);
+        Timer.stop(TIMER_ORDER_CONNECTORS);
 
-        Timer.stop(["doLayout", "orderRanks", "doOrder"]);
+        Timer.stop(TIMER_DO_ORDER);
     }
 
     private async _orderAndCount(graph: LayoutGraph): Promise<number> {
@@ -873,16 +910,19 @@ export default class SugiyamaLayouter extends Layouter {
                         edges[e++] = (edge.weight === Number.POSITIVE_INFINITY ? -1 : edge.weight); // weight
                     });
                 });
+                // the buffers are sent to every worker once instead of with every shuffle
+                const data = this._pool.setData([allGraphs.length, metadataBuf, nodesBuf, inConnectorsBuf, outConnectorsBuf, edgesBuf]);
                 const startedPromises = [];
                 const donePromises = [null];
                 for (let s = 0; s < this._options.numShuffles; ++s) {
-                    const [startedPromise, donePromise] = this._pool.exec("orderRanks", [s + 1, allGraphs.length, metadata.buffer, nodes.buffer, inConnectors.buffer, outConnectors.buffer, edges.buffer, this._options.webAssembly]);
+                    const [startedPromise, donePromise] = this._pool.exec("orderRanks", [s + 1, data, this._options.webAssembly]);
                     startedPromises.push(startedPromise);
                     donePromises.push(donePromise);
                 }
                 await Promise.all(startedPromises);
                 donePromises[0] = this._orderAndCount(graph);
                 const results = await Promise.all(donePromises);
+                this._pool.clearData(data);
                 let minCrossings = results[0];
                 let minIndex = 0;
                 _.forEach(results, (result: number, index: number) => {
@@ -983,7 +1023,7 @@ export default class SugiyamaLayouter extends Layouter {
      */
     private async _assignCoordinates(graph: LayoutGraph, rankTops: Array<number>, segmentsPerRank: Array<Array<Segment>>, crossingsPerRank: Array<Array<[Segment, Segment]>>): Promise<void> {
         // assign y
-        Timer.start(["doLayout", "assignCoordinates", "assignY"]);
+        Timer.start(TIMER_ASSIGN_Y);
         rankTops.length = graph.numRanks + 1;
         _.fill(rankTops, Number.POSITIVE_INFINITY);
         const rankBottoms = _.fill(new Array(graph.numRanks), Number.NEGATIVE_INFINITY);
@@ -1023,14 +1063,14 @@ export default class SugiyamaLayouter extends Layouter {
             rankBottoms[r] = maxBottom;
             rankTops[r + 1] = maxBottom + this._options.targetEdgeLength;
         }
-        Timer.stop(["doLayout", "assignCoordinates", "assignY"]);
+        Timer.stop(TIMER_ASSIGN_Y);
 
         const nodeHasInProxies = [];
         const nodeHasOutProxies = [];
 
         // assign x and set size; assign edge and connector coordinates
         const placeSubgraph = async (subgraph: LayoutGraph, offset: number): Promise<void> => {
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph"]);
+            Timer.start(TIMER_PLACE_SUBGRAPH);
 
             // place all subgraphs in order to know their size
             const nodes = subgraph.nodes();
@@ -1048,14 +1088,14 @@ export default class SugiyamaLayouter extends Layouter {
             // assign x
             await this._assignX(subgraph, offset + (subgraph.parentNode !== null ? subgraph.parentNode.padding : 0));
 
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "changeParentSize"]);
+            Timer.start(TIMER_CHANGE_PARENT_SIZE);
 
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "placeConnectors"]);
+            Timer.start(TIMER_PLACE_CONNECTORS);
             // place connectors
             _.forEach(subgraph.nodes(), (node: LayoutNode) => {
                 this._placeConnectors(node, rankTops, rankBottoms);
             });
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "placeConnectors"]);
+            Timer.stop(TIMER_PLACE_CONNECTORS);
 
             /**
              * PLACE EDGES
@@ -1086,10 +1126,10 @@ export default class SugiyamaLayouter extends Layouter {
                 return proxyPoint;
             };
 
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges"]);
+            Timer.start(TIMER_PLACE_EDGES);
 
             // mark nodes that do not need proxies
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "markNoProxies"]);
+            Timer.start(TIMER_MARK_NO_PROXIES);
             nodeHasInProxies.length = subgraph.maxId() + 1;
             nodeHasOutProxies.length = subgraph.maxId() + 1;
             _.forEach(subgraph.nodes(), (node: LayoutNode) => {
@@ -1150,7 +1190,7 @@ export default class SugiyamaLayouter extends Layouter {
                     }
                 });
             });
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "markNoProxies"]);
+            Timer.stop(TIMER_MARK_NO_PROXIES);
 
             _.forEach(subgraph.edges(), (edge: LayoutEdge) => {
                 if (edge.isReplica) {
@@ -1237,7 +1277,7 @@ export default class SugiyamaLayouter extends Layouter {
                     });
                 }
             });
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "removeVirtual"]);
+            Timer.start(TIMER_REMOVE_VIRTUAL);
             _.forEach(_.clone(subgraph.nodes()), (node: LayoutNode) => {
                 // remove virtual nodes and edges
                 if (node.isVirtual) {
@@ -1250,9 +1290,9 @@ export default class SugiyamaLayouter extends Layouter {
                     subgraph.removeNode(node.id);
                 }
             });
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges", "removeVirtual"]);
+            Timer.stop(TIMER_REMOVE_VIRTUAL);
 
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "placeEdges"]);
+            Timer.stop(TIMER_PLACE_EDGES);
 
             // mark crossings for later angle optimization
             if (this._options.optimizeAngles) {
@@ -1292,21 +1332,21 @@ export default class SugiyamaLayouter extends Layouter {
                     subgraph.exitNode.setPosition(new Vector(left, subgraph.exitNode.y));
                 }
             }
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "changeParentSize"]);
+            Timer.stop(TIMER_CHANGE_PARENT_SIZE);
 
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph"]);
+            Timer.stop(TIMER_PLACE_SUBGRAPH);
         }
 
         await placeSubgraph(graph, 0);
     }
 
     private async _assignX(subgraph: LayoutGraph, offset = 0) {
-        Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX"]);
-        Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "getRanks"]);
+        Timer.start(TIMER_ASSIGN_X);
+        Timer.start(TIMER_GET_RANKS);
         const levelGraph = subgraph.levelGraph();
         const ranks = levelGraph.ranks();
-        Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "getRanks"]);
-        Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian"]);
+        Timer.stop(TIMER_GET_RANKS);
+        Timer.start(TIMER_ALIGN_MEDIAN);
         let xAssignments: Array<Array<number>>;
         if (this._options.webWorkers && this._options.maxWorkers >= 4) {
             let numNodesPerRank, levelNodes, levelEdges;
@@ -1335,12 +1375,14 @@ export default class SugiyamaLayouter extends Layouter {
                 levelEdges[e++] = edge.weight;
             });
 
+            const data = this._pool.setData([ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf]);
             xAssignments = await Promise.all([
-                this._pool.exec("alignMedian", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, "UP", "LEFT", this._options.spaceBetweenNodes])[1],
-                this._pool.exec("alignMedian", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, "UP", "RIGHT", this._options.spaceBetweenNodes])[1],
-                this._pool.exec("alignMedian", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, "DOWN", "LEFT", this._options.spaceBetweenNodes])[1],
-                this._pool.exec("alignMedian", [ranks.length, numNodesPerRankBuf, levelNodesBuf, levelGraph.numEdges(), levelEdgesBuf, "DOWN", "RIGHT", this._options.spaceBetweenNodes])[1],
+                this._pool.exec("alignMedian", [data, "UP", "LEFT", this._options.spaceBetweenNodes])[1],
+                this._pool.exec("alignMedian", [data, "UP", "RIGHT", this._options.spaceBetweenNodes])[1],
+                this._pool.exec("alignMedian", [data, "DOWN", "LEFT", this._options.spaceBetweenNodes])[1],
+                this._pool.exec("alignMedian", [data, "DOWN", "RIGHT", this._options.spaceBetweenNodes])[1],
             ]);
+            this._pool.clearData(data);
         } else {
             xAssignments = ([
                 this._alignMedian(levelGraph, "UP", "LEFT"),
@@ -1350,10 +1392,10 @@ export default class SugiyamaLayouter extends Layouter {
             ]);
         }
 
-        Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian"]);
+        Timer.stop(TIMER_ALIGN_MEDIAN);
 
         // align left-most and right-most nodes
-        Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "merge"]);
+        Timer.start(TIMER_MERGE);
         let minMaxX = Number.POSITIVE_INFINITY;
         _.forEach(xAssignments, (xAssignment: Array<number>) => {
             minMaxX = Math.min(minMaxX, _.max(xAssignment));
@@ -1389,9 +1431,9 @@ export default class SugiyamaLayouter extends Layouter {
                 node.layoutNode.updatePosition(new Vector(node.x, node.layoutNode.y));
             }
         });
-        Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "merge"]);
+        Timer.stop(TIMER_MERGE);
 
-        Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX"]);
+        Timer.stop(TIMER_ASSIGN_X);
     }
 
     private _alignMedian(levelGraph: LevelGraph, neighborDir: "UP" | "DOWN", preference: "LEFT" | "RIGHT"): Array<number> {
@@ -1431,7 +1473,7 @@ export default class SugiyamaLayouter extends Layouter {
             blockGraph.addEdge(new Edge(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));
         }
         for (let r = firstRank; r - verticalDir !== lastRank; r += verticalDir) {
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "createNeighborList"]);
+            Timer.start(TIMER_CREATE_NEIGHBOR_LIST);
             // create sorted list of neighbors
             _.forEach(ranks[r], (node: LevelNode, n) => {
                 neighbors[n].length = 0;
@@ -1443,9 +1485,9 @@ export default class SugiyamaLayouter extends Layouter {
                     neighbors[node.position].push(n);
                 });
             });
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "createNeighborList"]);
+            Timer.stop(TIMER_CREATE_NEIGHBOR_LIST);
 
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "markConflicts"]);
+            Timer.start(TIMER_MARK_CONFLICTS);
 
             // mark segments that cross a heavy segment as non-usable
             let heavyLeft = -1;
@@ -1466,9 +1508,9 @@ export default class SugiyamaLayouter extends Layouter {
                     heavyLeft = heavyRight;
                 }
             }
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "markConflicts"]);
+            Timer.stop(TIMER_MARK_CONFLICTS);
 
-            Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "findNeighbor"]);
+            Timer.start(TIMER_FIND_NEIGHBOR);
 
             let maxNeighborTaken = (preference === "LEFT" ? Number.NEGATIVE_INFINITY : Number.POSITIVE_INFINITY);
             const compare = (preference === "LEFT" ? ((a, b) => a < b) : ((a, b) => a > b));
@@ -1508,18 +1550,18 @@ export default class SugiyamaLayouter extends Layouter {
                 const edgeLength = (ranks[r][n - 1].layoutNode.width + ranks[r][n].layoutNode.width) / 2 + this._options.spaceBetweenNodes;
                 blockGraph.addEdge(new Edge(blockPerNode[ranks[r][n - 1].id], blockPerNode[ranks[r][n].id], edgeLength));
             }
-            Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "findNeighbor"]);
+            Timer.stop(TIMER_FIND_NEIGHBOR);
         }
 
         const xAssignment = new Array(levelGraph.maxId() + 1);
 
         // compact
-        Timer.start(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "rank"]);
+        Timer.start(TIMER_RANK);
         blockGraph.rank();
         _.forEach(levelGraph.nodes(), (node: LevelNode) => {
             xAssignment[node.id] = blockGraph.node(blockPerNode[node.id]).rank;
         });
-        Timer.stop(["doLayout", "assignCoordinates", "placeSubgraph", "assignX", "alignMedian", "rank"]);
+        Timer.stop(TIMER_RANK);
 
         return xAssignment;
     }
@@ -1632,9 +1674,9 @@ export default class SugiyamaLayouter extends Layouter {
     private _markCrossings(subgraph: LayoutGraph, segmentsPerRank: Array<Array<Segment>>,
                            crossingsPerRank: Array<Array<[Segment, Segment]>>, rankTops: Array<number>,
                            rankBottoms: Array<number>): void {
-        const endpointsPerRank = new Array(rankTops.length);
+        const newSegmentsPerRank = new Array(rankTops.length);
         for (let r = 1; r < rankTops.length; ++r) {
-            endpointsPerRank[r] = [];
+            newSegmentsPerRank[r] = [];
         }
 
         _.forEach(subgraph.edges(), (edge: LayoutEdge) => {
@@ -1650,29 +1692,20 @@ export default class SugiyamaLayouter extends Layouter {
                         end = start.clone().add(segment.vector().setY(this._options.targetEdgeLength));
                     }
                     segment = new Segment(start, end);
-                    endpointsPerRank[startRank + 1].push([segment.start, segment]);
-                    endpointsPerRank[startRank + 1].push([segment.end, segment]);
+                    newSegmentsPerRank[startRank + 1].push(segment);
                     segmentsPerRank[startRank + 1].push(segment);
                 }
             });
         });
 
+        // the grid only tests segments that are close to each other, a sweep over x would test all overlapping pairs
         for (let r = 1; r < rankTops.length; ++r) {
-            const pointsSorted = _.sortBy(endpointsPerRank[r], ([point, segment]) => point.x); // sort by x
-            const openSegments: Set<Segment> = new Set();
-            _.forEach(pointsSorted, ([point, segment]) => {
-                if (openSegments.has(segment)) {
-                    openSegments.delete(segment);
-                } else {
-                    openSegments.forEach((otherSegment) => {
-                        if ((segment.start.x !== otherSegment.start.x) && (segment.end.x !== otherSegment.end.x) &&
-                            (Math.sign(segment.start.x - otherSegment.start.x) !== Math.sign(segment.end.x - otherSegment.end.x))) {
-                            crossingsPerRank[r].push([segment, otherSegment]);
-                        }
-                    });
-                    openSegments.add(segment);
-                }
-            });
+            const segments = newSegmentsPerRank[r];
+            if (segments.length > 1) {
+                new SegmentGrid(segments).forEachCrossing((i: number, j: number) => {
+                    crossingsPerRank[r].push([segments[j], segments[i]]);
+                });
+            }
         }
     }
 
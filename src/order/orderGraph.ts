@@ -10,6 +10,17 @@ import OrderRank from "./orderRank";
 import Timer from "../util/timer";
 import Wasm from "../wasm/wasm";
 
+const TIMER_ORDER = Timer.register(["doLayout", "orderRanks", "doOrder", "order"]);
+const TIMER_DO_ORDER = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder"]);
+const TIMER_REORDER = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "reorder"]);
+const TIMER_RESOLVE = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve"]);
+const TIMER_RESOLVE_HEAVY_HEAVY = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyHeavy"]);
+const TIMER_RESOLVE_HEAVY_LIGHT = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight"]);
+const TIMER_CHECK_X = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "checkX"]);
+const TIMER_RESOLVE_X = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveX"]);
+const TIMER_RESOLVE_Y = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveY"]);
+const TIMER_SETUP = Timer.register(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "setup"]);
+
 interface Neighbor {
     end: number;
     weight: number;
@@ -164,7 +175,7 @@ export default class OrderGraph {
         if (this._nodeGraph.numNodes() === 0) {
             return;
         }
-        Timer.start(["doLayout", "orderRanks", "doOrder", "order"]);
+        Timer.start(TIMER_ORDER);
         options = _.defaults(options, {
             method: "barycenter",
             countOnly: false,
@@ -201,8 +212,8 @@ export default class OrderGraph {
                 }, "edge not between neighboring ranks");
             }
 
-            Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder"]);
-            Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "setup"]);
+            Timer.start(TIMER_DO_ORDER);
+            Timer.start(TIMER_SETUP);
 
             const numRanks = graph._rankGraph.numNodes();
 
@@ -261,7 +272,7 @@ export default class OrderGraph {
 
             crossings[0] = 0;
 
-            Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "setup"]);
+            Timer.stop(TIMER_SETUP);
 
             const countCrossings = (testOrder: Array<number>, r: number, direction: number = 0, preventConflicts: boolean = false) => {
                 if (preventConflicts) {
@@ -336,7 +347,7 @@ export default class OrderGraph {
              * @param preventConflicts
              */
             const reorder = (preventConflicts: boolean = false) => {
-                Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "reorder"]);
+                Timer.start(TIMER_REORDER);
                 const multiplicator = maxEdgeWeight * maxEdgesPerRank + 1;
 
                 let boolDirection = 1;
@@ -511,7 +522,7 @@ export default class OrderGraph {
                     this._setGroupPositionAndOffset(groupOrder[r], groupPositions, groupOffsetsPos, numNodesPerGroup);
                 }
 
-                Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "reorder"]);
+                Timer.stop(TIMER_REORDER);
             };
 
             const getConflict = (type: "HEAVYHEAVY" | "HEAVYLIGHT", r: number): [number, number ,number, number, number] => {
@@ -558,7 +569,7 @@ export default class OrderGraph {
              */
             const heavy = [];
             const resolveHeavyHeavy = (r: number) => {
-                Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyHeavy"]);
+                Timer.start(TIMER_RESOLVE_HEAVY_HEAVY);
                 heavy.length = 0;
                 for (let tmpPos = 0; tmpPos < order[r].length; ++tmpPos) {
                     const tmpNodeId = order[r][tmpPos];
@@ -576,7 +587,7 @@ export default class OrderGraph {
                         positions[order[r][tmpPos]] = tmpPos;
                     }
                 }
-                Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyHeavy"]);
+                Timer.stop(TIMER_RESOLVE_HEAVY_HEAVY);
             }
 
             /**
@@ -586,7 +597,7 @@ export default class OrderGraph {
                 if (DEBUG) {
                     Assert.assertAll(_.range(ranks.length), r => groupOrder[r].length === 1, "conflict resolution with more than one group per rank");
                 }
-                Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve"]);
+                Timer.start(TIMER_RESOLVE);
 
                 for (let r = 0; r < order.length; ++r) {
                     _.forEach(ranks[r].groups[0].nodes, (node: OrderNode) => {
@@ -675,7 +686,7 @@ export default class OrderGraph {
                 }
 
                 const resolveHeavyLight = (conflict: [number, number, number, number, number]) => {
-                    Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight"]);
+                    Timer.start(TIMER_RESOLVE_HEAVY_LIGHT);
 
                     const [r, crossedNorthPos, crossedSouthPos, crossingNorthPos, crossingSouthPos] = conflict;
 
@@ -690,7 +701,7 @@ export default class OrderGraph {
                     let crossingEdge;
 
                     const resolveY = () => {
-                        Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveY"]);
+                        Timer.start(TIMER_RESOLVE_Y);
 
                         // mark nodes that must not be moved
                         _.forEach(order[r - 1], (nodeId: number) => {
@@ -791,11 +802,11 @@ export default class OrderGraph {
                             Assert.assertAll(_.range(1, r + 1), r => getConflict("HEAVYLIGHT", r) === null, "heavy-light conflict after y resolution with r = " + r);
                         }
 
-                        Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveY"]);
+                        Timer.stop(TIMER_RESOLVE_Y);
                     }
 
                     const checkXResolution = (side: "LEFT" | "RIGHT") => {
-                        Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "checkX"]);
+                        Timer.start(TIMER_CHECK_X);
                         const nodesPerRank = new Array(ranks.length);
                         const minGreenNodePerRank: Array<number> = new Array(ranks.length);
                         const maxRedNodePerRank: Array<number> = new Array(ranks.length);
@@ -905,7 +916,7 @@ export default class OrderGraph {
                             }
                         }
                         if (conflict) {
-                            Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "checkX"]);
+                            Timer.stop(TIMER_CHECK_X);
                             return null;
                         }
                         // group nodes
@@ -928,12 +939,12 @@ export default class OrderGraph {
                                 }
                             });
                         });
-                        Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "checkX"]);
+                        Timer.stop(TIMER_CHECK_X);
                         return nodesPerRankGrouped;
                     };
 
                     const resolveX = (side: "LEFT" | "RIGHT", nodesPerRank) => {
-                        Timer.start(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveX"]);
+                        Timer.start(TIMER_RESOLVE_X);
 
                         _.forEach(nodesPerRank, (rank, r: number) => {
                             if (rank["MOVING"].size === 0 || rank["GREEN"].size === 0) {
@@ -969,7 +980,7 @@ export default class OrderGraph {
                         if (DEBUG) {
                             Assert.assertAll(_.range(r + 1), r => getConflict("HEAVYHEAVY", r) === null, "heavy-heavy conflict after x resolution");
                         }
-                        Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight", "resolveX"]);
+                        Timer.stop(TIMER_RESOLVE_X);
                     };
 
                     didResolveY = false;
@@ -1001,7 +1012,7 @@ export default class OrderGraph {
                         resolveY();
                         didResolveY = true;
                     }
-                    Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve", "resolveHeavyLight"]);
+                    Timer.stop(TIMER_RESOLVE_HEAVY_LIGHT);
                 }
 
                 let didResolveY = false;
@@ -1030,7 +1041,7 @@ export default class OrderGraph {
                     crossings[tmpR] = countCrossings(order[tmpR], tmpR);
                 }
 
-                Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder", "resolve"]);
+                Timer.stop(TIMER_RESOLVE);
             }
 
             if (options["countInitial"]) {
@@ -1091,7 +1102,7 @@ export default class OrderGraph {
 
             const numCrossings = _.sum(crossings);
 
-            Timer.stop(["doLayout", "orderRanks", "doOrder", "order", "doOrder"]);
+            Timer.stop(TIMER_DO_ORDER);
 
             return numCrossings;
         }
@@ -1162,7 +1173,7 @@ export default class OrderGraph {
                 numCrossings += await doOrder(componentGraph);
             }
         }
-        Timer.stop(["doLayout", "orderRanks", "doOrder", "order"]);
+        Timer.stop(TIMER_ORDER);
 
         return numCrossings;
     }
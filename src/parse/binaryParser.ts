@@ -0,0 +1,99 @@
+import Parser from "./parser";
+import RenderGraph from "../renderGraph/renderGraph";
+
+/**
+ * Builds render graphs from the binary layout input compiled by experiments/bench/binary.py, which holds the graph
+ * structure in flat 32 bit integer sections and all labels and connector names in a string table.
+ * The sections are read through typed array views on the buffer, so no intermediate JSON object tree is built.
+ * Edges get their precomputed label instead of their attributes.
+ */
+export default class BinaryParser {
+    public static MAGIC = 0x42464453;
+    public static VERSION = 1;
+    public static TYPES = ["AccessNode", "LibraryNode", "MapEntry", "MapExit", "NestedSDFG", "SDFGState", "Tasklet", "Memlet", "InterstateEdge"];
+
+    private static NODE_FIELDS = 9;
+    private static EDGE_FIELDS = 6;
+
+    /**
+     * Parses the binary graph starting at byteOffset of an ArrayBuffer or SharedArrayBuffer.
+     */
+    static parse(buffer: any, byteOffset: number = 0): RenderGraph {
+        if (byteOffset % 4 !== 0) {
+            buffer = new Uint8Array(buffer, byteOffset).slice().buffer;
+            byteOffset = 0;
+        }
+        const header = new Uint32Array(buffer, byteOffset, 8);
+        if (header[0] !== BinaryParser.MAGIC) {
+            throw new Error("Not a binary graph");
+        }
+        if (header[1] !== BinaryParser.VERSION) {
+            throw new Error("Unsupported binary graph version: " + header[1]);
+        }
+        const [numGraphs, numNodes, numConnectors, numEdges, numStrings, numBytes] = header.subarray(2);
+        let offset = byteOffset + header.byteLength;
+        const section = (length: number): Int32Array => {
+            const view = new Int32Array(buffer, offset, length);
+            offset += view.byteLength;
+            return view;
+        };
+        const graphs = section(4 * numGraphs);
+        const nodes = section(BinaryParser.NODE_FIELDS * numNodes);
+        const connectors = section(numConnectors);
+        const edges = section(BinaryParser.EDGE_FIELDS * numEdges);
+        const stringOffsets = section(numStrings + 1);
+        const bytes = new Uint8Array(buffer, offset, numBytes);
+
+        // strings are decoded once on first use; TextDecoder does not accept views on shared memory
+        const SharedArrayBufferClass = globalThis["SharedArrayBuffer"];
+        const shared = (typeof SharedArrayBufferClass === "function" && buffer instanceof SharedArrayBufferClass);
+        const decoder = new TextDecoder();
+        const strings = new Array(numStrings);
+        const string = (i: number): string => {
+            if (i < 0) {
+                return null;
+            }
+            if (strings[i] === undefined) {
+                const view = bytes.subarray(stringOffsets[i], stringOffsets[i + 1]);
+                strings[i] = decoder.decode(shared ? view.slice() : view);
+            }
+            return strings[i];
+        };
+
+        const build = (g: number): RenderGraph => {
+            const graph = new RenderGraph();
+            const nodeEnd = graphs[4 * g] + graphs[4 * g + 1];
+            for (let i = graphs[4 * g]; i < nodeEnd; ++i) {
+                const n = BinaryParser.NODE_FIELDS * i;
+                const type = BinaryParser.TYPES[nodes[n + 1]];
+                const node = new (Parser.classForType(type))(type, string(nodes[n + 2]));
+                if (nodes[n + 3] >= 0) {
+                    node.setChildGraph(build(nodes[n + 3]));
+                }
+                const inStart = nodes[n + 6];
+                const outStart = inStart + nodes[n + 7];
+                const inConnectors = [];
+                for (let c = inStart; c < outStart; ++c) {
+                    inConnectors.push(string(connectors[c]));
+                }
+                const outConnectors = [];
+                for (let c = outStart; c < outStart + nodes[n + 8]; ++c) {
+                    outConnectors.push(string(connectors[c]));
+                }
+                node.setConnectors(inConnectors, outConnectors);
+                node.scopeEntry = (nodes[n + 4] >= 0 ? nodes[n + 4] : null);
+                node.scopeExit = (nodes[n + 5] >= 0 ? nodes[n + 5] : null);
+                graph.addNode(node, nodes[n]);
+            }
+            const edgeEnd = graphs[4 * g + 2] + graphs[4 * g + 3];
+            for (let i = graphs[4 * g + 2]; i < edgeEnd; ++i) {
+                const e = BinaryParser.EDGE_FIELDS * i;
+                const edge = new (Parser.classForType(BinaryParser.TYPES[edges[e + 2]]))(edges[e], edges[e + 1], string(edges[e + 3]), string(edges[e + 4]), {});
+                edge.compiledLabel = string(edges[e + 5]);
+                graph.addEdge(edge);
+            }
+            return graph;
+        };
+        return build(0);
+    }
+}
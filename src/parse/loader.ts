@@ -1,3 +1,4 @@
+import BinaryParser from "./binaryParser";
 import Parser from "./parser";
 import RenderGraph from "../renderGraph/renderGraph";
 import {ROOT_DIR} from "../util/constants";
@@ -17,32 +18,63 @@ export default class Loader {
         if (basePath === null) {
             basePath = Loader.getBasePath();
         }
-        const doXhr = (path) => {
-            return new Promise(function (resolve, reject) {
-                const xhr = new XMLHttpRequest();
-                xhr.onload = function () {
-                    if (this.status < 400) {
-                        resolve(xhr.response);
-                    } else {
-                        reject({
-                            status: this.status,
-                            statusText: xhr.statusText
-                        });
-                    }
-                };
-                xhr.onerror = function () {
-                    reject({status: this.status, statusText: xhr.statusText});
-                };
-                xhr.open('GET', path);
-                xhr.send();
-            });
-        }
-        return doXhr(basePath + name + ".json")
+        return Loader._xhr(basePath + name + ".json", "text")
             .then(response => JSON.parse(<string>response))
             .then(json => Parser.parse(json))
             .catch(() => null);
     }
 
+    /**
+     * Loads a graph compiled by experiments/bench/binary.py (name + ".bin") and builds it directly from the buffer,
+     * see BinaryParser. With shared, the file is held in a SharedArrayBuffer (if available) first.
+     */
+    static loadBinary(name: string, basePath: string = "./graphs/", shared: boolean = false): Promise<RenderGraph> {
+        return Loader.fetchBinary(name, basePath, shared)
+            .then(buffer => BinaryParser.parse(buffer))
+            .catch(() => null);
+    }
+
+    /**
+     * Fetches the binary file of a graph as ArrayBuffer, or as SharedArrayBuffer with shared (if the environment
+     * provides it, e.g. cross-origin isolated pages), which can be passed to workers without copying.
+     */
+    static fetchBinary(name: string, basePath: string = "./graphs/", shared: boolean = false): Promise<any> {
+        if (basePath === null) {
+            basePath = Loader.getBasePath();
+        }
+        return Loader._xhr(basePath + name + ".bin", "arraybuffer").then((buffer: ArrayBuffer) => {
+            const SharedArrayBufferClass = globalThis["SharedArrayBuffer"];
+            if (!shared || typeof SharedArrayBufferClass !== "function") {
+                return buffer;
+            }
+            const sharedBuffer = new SharedArrayBufferClass(buffer.byteLength);
+            new Uint8Array(sharedBuffer).set(new Uint8Array(buffer));
+            return sharedBuffer;
+        });
+    }
+
+    private static _xhr(path: string, responseType: XMLHttpRequestResponseType): Promise<any> {
+        return new Promise(function (resolve, reject) {
+            const xhr = new XMLHttpRequest();
+            xhr.responseType = responseType;
+            xhr.onload = function () {
+                if (this.status < 400) {
+                    resolve(xhr.response);
+                } else {
+                    reject({
+                        status: this.status,
+                        statusText: xhr.statusText
+                    });
+                }
+            };
+            xhr.onerror = function () {
+                reject({status: this.status, statusText: xhr.statusText});
+            };
+            xhr.open('GET', path);
+            xhr.send();
+        });
+    }
+
     static getBasePath() {
         let graphDir = '/graphs/';
         let layouterDirPos = window.location.href.indexOf(ROOT_DIR);
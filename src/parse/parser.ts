@@ -54,6 +54,8 @@ export default class Parser {
 
         node.setConnectors(inConnectors, outConnectors);
 
+        node.collapsed = (jsonNode.attributes.is_collapsed === true);
+
         // set scope entry and exit
         node.scopeEntry = jsonNode.scope_entry ? parseInt(jsonNode.scope_entry) : null;
         node.scopeExit = jsonNode.scope_exit ? parseInt(jsonNode.scope_exit) : null;
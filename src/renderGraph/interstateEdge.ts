@@ -3,6 +3,9 @@ import Color from "../renderer/color";
 
 export default class InterstateEdge extends RenderEdge {
     label(): string {
+        if (this.compiledLabel !== null) {
+            return this.compiledLabel;
+        }
         return this.attributes.label || "";
     }
     color(): Color {
@@ -2,6 +2,9 @@ import RenderEdge from "./renderEdge";
 
 export default class Memlet extends RenderEdge {
     label(): string {
+        if (this.compiledLabel !== null) {
+            return this.compiledLabel;
+        }
         if (!this.attributes.subset) {
             return "";
         }
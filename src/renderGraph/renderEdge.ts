@@ -14,6 +14,8 @@ export default abstract class RenderEdge extends Edge<RenderGraph, RenderNode> {
     public srcConnector: string = null;
     public dstConnector: string = null;
     public attributes: any = {};
+    // label computed when the graph was compiled to the binary format (see BinaryParser), used instead of attributes
+    public compiledLabel: string = null;
 
     public x: number = null;
     public y: number = null;
@@ -29,6 +29,22 @@ export default class RenderGraph extends Graph<RenderNode, RenderEdge> {
         return new Box(minX, minY, maxX - minX, maxY - minY);
     }
 
+    /**
+     * Collapses all nodes with a child graph that are nested at least depth levels deep (0 for the top level)
+     * and expands the others.
+     */
+    collapseFrom(depth: number): void {
+        const collapse = (graph: RenderGraph, level: number) => {
+            _.forEach(graph.nodes(), (node: RenderNode) => {
+                if (node.childGraph !== null) {
+                    node.collapsed = (level >= depth);
+                    collapse(node.childGraph, level + 1);
+                }
+            });
+        };
+        collapse(this, 0);
+    }
+
     numNodes(): number {
         return this.allNodes().length;
     }
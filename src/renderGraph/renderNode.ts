@@ -26,6 +26,11 @@ export default abstract class RenderNode extends Node<RenderGraph, RenderEdge> {
     public layoutGraph: LayoutGraph = null;
     public layoutNode: LayoutNode = null;
 
+    // collapsed nodes with a child graph are laid out without it by layouters with the option lazy,
+    // which then set isPlaceholder and leave the child graph without layout
+    public collapsed: boolean = false;
+    public isPlaceholder: boolean = false;
+
     public x: number = null;
     public y: number = null;
     public width: number = 0;
@@ -73,6 +78,16 @@ export default abstract class RenderNode extends Node<RenderGraph, RenderEdge> {
         };
     }
 
+    /**
+     * Size of the node without its child graph, i.e. of its label and connectors, as before any layout.
+     */
+    collapsedSize(): Size {
+        return {
+            width: Math.max(this.labelSize.width, this.connectorsWidth()),
+            height: this.labelSize.height,
+        };
+    }
+
     boundingBox(): Box {
         return new Box(this.x, this.y, this.width, this.height);
     }
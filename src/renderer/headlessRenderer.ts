@@ -0,0 +1,50 @@
+import RenderGraph from "../renderGraph/renderGraph";
+import Renderer from "./renderer";
+import Size from "../geometry/size";
+
+/**
+ * Renderer without a display, e.g. for running the layouter in Node.js.
+ * Text is measured with the advance widths of Arial (which shares its metrics with Helvetica) instead of a font
+ * engine, so node sizes are deterministic and do not depend on the fonts installed on the machine.
+ */
+export default class HeadlessRenderer extends Renderer {
+    // advance widths in 1/1000 em of the printable ASCII characters, starting at the space (32)
+    private static readonly _WIDTHS = [
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278, // space to /
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, // 0 to ?
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778, // @ to O
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556, // P to _
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556, // ` to o
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584, // p to ~
+    ];
+    private static readonly _DEFAULT_WIDTH = 556;
+    private static readonly _LINE_HEIGHT = 1.15;
+
+    protected _render(graph: RenderGraph, view: any = null): void {
+    }
+
+    public setView(x: number, y: number, zoom: number): void {
+    }
+
+    public viewSize(): Size {
+        return {width: 0, height: 0};
+    }
+
+    public getTextSize(text: string, fontSize: number, fontFamily: string): Size {
+        const lines = String(text).split("\n");
+        let width = 0;
+        for (let l = 0; l < lines.length; ++l) {
+            let lineWidth = 0;
+            for (let c = 0; c < lines[l].length; ++c) {
+                const code = lines[l].charCodeAt(c);
+                const index = code - 32;
+                lineWidth += (index >= 0 && index < HeadlessRenderer._WIDTHS.length) ? HeadlessRenderer._WIDTHS[index] : HeadlessRenderer._DEFAULT_WIDTH;
+            }
+            width = Math.max(width, lineWidth);
+        }
+        return {
+            width: width * fontSize / 1000,
+            height: lines.length * fontSize * HeadlessRenderer._LINE_HEIGHT,
+        };
+    }
+}
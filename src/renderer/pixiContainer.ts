@@ -12,6 +12,7 @@ import EdgeShape from "../shapes/edgeShape";
 import AbstractPolygon from "../shapes/abstractPolygon";
 import Text from "../shapes/text";
 import ShapeCollection from "../shapes/shapeCollection";
+import Color from "./color";
 
 export default class PixiContainer extends RendererContainer
 {
@@ -23,80 +24,133 @@ export default class PixiContainer extends RendererContainer
     }
 
     protected _renderShape(shape: Shape) {
+        if (shape instanceof Text) {
+            const fontStyle = new PIXI.TextStyle({fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex()});
+            const pixiText = new PIXI.Text(shape.text, fontStyle);
+            pixiText.x = shape.x;
+            pixiText.y = shape.y;
+            this.pixiContainer.addChild(pixiText);
+        } else if (shape instanceof ShapeCollection) {
+            _.forEach(shape.getShapes(), (childShape: Shape) => {
+                this._renderShape(childShape);
+            });
+        } else {
+            const graphics = new Graphics();
+            if (this._draw(graphics, shape)) {
+                this.pixiContainer.addChild(graphics);
+            }
+        }
+    }
+
+    /**
+     * Draws a shape other than text into the graphics object; returns false if the shape cannot be drawn.
+     */
+    private _draw(graphics: Graphics, shape: Shape): boolean {
         if (shape instanceof Rectangle) {
-            const rectangle = new Graphics();
-            rectangle.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
-            rectangle.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
-            rectangle.drawRect(0, 0, shape.width, shape.height);
-            rectangle.endFill();
-            rectangle.x = shape.x;
-            rectangle.y = shape.y;
+            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
+            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
+            graphics.drawRect(0, 0, shape.width, shape.height);
+            graphics.endFill();
+            graphics.x = shape.x;
+            graphics.y = shape.y;
             if (shape.zIndex !== null) {
-                rectangle.zIndex = shape.zIndex;
+                graphics.zIndex = shape.zIndex;
             }
-            this.pixiContainer.addChild(rectangle);
         } else if (shape instanceof Circle) {
-            const circle = new PIXI.Graphics();
-            circle.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
-            circle.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
+            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
+            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
             const box = shape.boundingBox();
             const center = box.center();
-            circle.drawCircle(center.x, center.y, shape.width / 2);
-            circle.endFill();
-            this.pixiContainer.addChild(circle);
+            graphics.drawCircle(center.x, center.y, shape.width / 2);
+            graphics.endFill();
         } else if (shape instanceof Ellipse) {
-            const ellipse = new PIXI.Graphics();
-            ellipse.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
-            ellipse.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
+            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
+            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
             const box = shape.boundingBox();
             const center = box.center();
-            ellipse.drawEllipse(center.x, center.y, shape.width / 2, shape.height / 2);
-            ellipse.endFill();
-            this.pixiContainer.addChild(ellipse);
+            graphics.drawEllipse(center.x, center.y, shape.width / 2, shape.height / 2);
+            graphics.endFill();
         } else if (shape instanceof Line) {
-            const line = new Graphics();
-            line.lineStyle(shape.lineWidth);
-            line.moveTo(shape.x1, shape.y1);
-            line.lineTo(shape.x2, shape.y2);
-            this.pixiContainer.addChild(line);
+            graphics.lineStyle(shape.lineWidth);
+            graphics.moveTo(shape.x1, shape.y1);
+            graphics.lineTo(shape.x2, shape.y2);
         } else if (shape instanceof EdgeShape) {
-            let line = new Graphics();
-            line.lineStyle(1, shape.color.number(), shape.color.alpha);
-            line.moveTo(_.head(shape.points()).x, _.head(shape.points()).y);
+            graphics.lineStyle(1, shape.color.number(), shape.color.alpha);
+            graphics.moveTo(_.head(shape.points()).x, _.head(shape.points()).y);
             _.forEach(_.tail(shape.points()), (point: Vector) => {
-                line.lineTo(point.x, point.y);
+                graphics.lineTo(point.x, point.y);
             });
             // draw arrow head
             const end = new Vector(_.last(shape.points()).x, _.last(shape.points()).y);
             const dir = end.clone().sub(shape.points()[shape.points().length - 2]);
             const angle = dir.angle();
             const point1 = (new Vector(end.x - 5, end.y + 3)).rotateAround(end, angle);
-            line.lineTo(point1.x, point1.y);
-            line.moveTo(end.x, end.y);
+            graphics.lineTo(point1.x, point1.y);
+            graphics.moveTo(end.x, end.y);
             const point2 = (new Vector(end.x - 5, end.y - 3)).rotateAround(end, angle);
-            line.lineTo(point2.x, point2.y);
-            line.zIndex = -1;
-            this.pixiContainer.addChild(line);
+            graphics.lineTo(point2.x, point2.y);
+            graphics.zIndex = -1;
         } else if (shape instanceof AbstractPolygon) {
-            const polygon = new PIXI.Graphics();
-            polygon.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
-            polygon.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
-            polygon.drawPolygon(shape.getPath());
-            polygon.endFill();
-            this.pixiContainer.addChild(polygon);
-        } else if (shape instanceof Text) {
-            const fontStyle = new PIXI.TextStyle({fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex()});
-            const pixiText = new PIXI.Text(shape.text, fontStyle);
-            pixiText.x = shape.x;
-            pixiText.y = shape.y;
-            this.pixiContainer.addChild(pixiText);
-        } else if (shape instanceof ShapeCollection) {
-            _.forEach(shape.getShapes(), (childShape: Shape) => {
-                this._renderShape(childShape);
-            });
+            graphics.lineStyle(1, shape.borderColor.number(), shape.borderColor.alpha);
+            graphics.beginFill(shape.backgroundColor.number(), shape.backgroundColor.alpha);
+            graphics.drawPolygon(shape.getPath());
+            graphics.endFill();
+        } else {
+            return false;
+        }
+        return true;
+    }
+
+    protected _numShownObjects(): number {
+        return this.pixiContainer.children.length;
+    }
+
+    protected _createObject(kind: string): any {
+        return (kind === "text" ? new PIXI.Text("") : new Graphics());
+    }
+
+    protected _drawObject(object: any, shape: Shape, simplified: boolean): void {
+        if (shape instanceof Text) {
+            object.text = shape.text;
+            object.style = new PIXI.TextStyle({fontFamily: shape.fontFamily, fontSize: shape.fontSize, fill: shape.color.hex()});
+            object.x = shape.x;
+            object.y = shape.y;
+            return;
+        }
+        const graphics = <Graphics>object;
+        graphics.clear();
+        graphics.x = 0;
+        graphics.y = 0;
+        if (!simplified) {
+            this._draw(graphics, shape);
+        } else if (shape instanceof EdgeShape) {
+            // straight line without arrow head
+            const points = shape.points();
+            graphics.lineStyle(1, shape.color.number(), shape.color.alpha);
+            graphics.moveTo(_.head(points).x, _.head(points).y);
+            graphics.lineTo(_.last(points).x, _.last(points).y);
+        } else {
+            const box = shape.boundingBox();
+            const background = (<any>shape).backgroundColor || Color.WHITE;
+            const border = (<any>shape).borderColor || (<any>shape).color || Color.BLACK;
+            graphics.lineStyle(1, border.number(), border.alpha);
+            graphics.beginFill(background.number(), background.alpha);
+            graphics.drawRect(box.x, box.y, box.width, box.height);
+            graphics.endFill();
         }
     }
 
+    protected _showObject(object: any, order: number): void {
+        // with sortableChildren, the objects are drawn in the order of their shapes
+        this.pixiContainer.sortableChildren = true;
+        object.zIndex = order;
+        this.pixiContainer.addChild(object);
+    }
+
+    protected _hideObject(object: any): void {
+        this.pixiContainer.removeChild(object);
+    }
+
     public removeChildren() {
         super.removeChildren();
         this.pixiContainer.removeChildren();
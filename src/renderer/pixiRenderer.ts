@@ -5,6 +5,7 @@ import PixiContainer from "./pixiContainer";
 import RenderGraph from "../renderGraph/renderGraph";
 import Renderer from "./renderer";
 import Shape from "../shapes/shape";
+import Box from "../geometry/box";
 import Size from "../geometry/size";
 
 export default class PixiRenderer extends Renderer {
@@ -12,7 +13,11 @@ export default class PixiRenderer extends Renderer {
     private readonly _viewport;
     protected _container: PixiContainer;
 
-    constructor(domContainer) {
+    /**
+     * @param domContainer Element to draw into.
+     * @param options Culling options of the container (see Renderer._setContainerOptions).
+     */
+    constructor(domContainer, options: object = {}) {
         super();
         this._app = new PIXI.Application({
             width: domContainer.clientWidth,
@@ -32,13 +37,20 @@ export default class PixiRenderer extends Renderer {
         this._app.stage.addChild(this._viewport);
 
         this._container = new PixiContainer();
+        this._setContainerOptions(options);
         this._viewport.addChild(this._container.pixiContainer);
 
         this._viewport.interactive = true;
 
         this._viewport.drag().pinch().wheel().decelerate();
 
-        document.addEventListener("keydown", (e) => {
+        // runs before the stage is drawn; updateView returns right away if the view did not change
+        this._app.ticker.add(() => {
+            const bounds = this._viewport.getVisibleBounds();
+            this._container.updateView(new Box(bounds.x, bounds.y, bounds.width, bounds.height), this._viewport.scale.x);
+        });
+
+        this._addDocumentListener("keydown", (e) => {
             if (e.ctrlKey && e.key === "s") {
                 e.preventDefault();
                 let fileName = prompt("Save as:", "screenshot");
@@ -88,6 +100,20 @@ export default class PixiRenderer extends Renderer {
         this._container.render();
     }
 
+    public setView(x: number, y: number, zoom: number): void {
+        this._viewport.setZoom(zoom, true);
+        this._viewport.moveCenter(x, y);
+    }
+
+    public viewSize(): Size {
+        return {width: this._viewport.screenWidth, height: this._viewport.screenHeight};
+    }
+
+    public cleanUp(): void {
+        super.cleanUp();
+        this._app.destroy(true, {children: true});
+    }
+
     public getTextSize(text: string, fontSize: number, fontFamily: string): Size {
         const fontStyle = new PIXI.TextStyle({fontFamily: fontFamily, fontSize: fontSize});
         return PIXI.TextMetrics.measureText(text, fontStyle);
@@ -30,11 +30,68 @@ import SugiyamaLayouter from "../layouter/sugiyamaLayouter";
 export default abstract class Renderer {
     protected _container: RendererContainer;
     protected _additionalShapes: Array<Shape> = [];
+    private _listeners: Array<[string, (e: any) => void]> = [];
 
     protected abstract _render(graph: RenderGraph, view?: any): void;
 
     public abstract getTextSize(text: string, fontSize: number, fontFamily: string): Size;
 
+    /**
+     * Centers the view at the world position (x, y) with the given zoom.
+     */
+    public abstract setView(x: number, y: number, zoom: number): void;
+
+    /**
+     * Size of the drawing area in pixels.
+     */
+    public abstract viewSize(): Size;
+
+    /**
+     * Shows a graph that is already laid out.
+     */
+    public render(graph: RenderGraph): void {
+        this._render(graph);
+    }
+
+    /**
+     * Number of display objects that are shown and, with culling, kept in pools for reuse.
+     */
+    public numDisplayObjects(): {shown: number, pooled: number} {
+        return this._container.numDisplayObjects();
+    }
+
+    /**
+     * Removes the event listeners and the drawing area of the renderer.
+     */
+    public cleanUp(): void {
+        _.forEach(this._listeners, ([type, listener]) => {
+            document.removeEventListener(type, listener);
+        });
+        this._listeners.length = 0;
+    }
+
+    /**
+     * Sets the options of the container: with culling, only the shapes in the view are drawn, in pooled display
+     * objects and simplified below lodZoom (see RendererContainer).
+     */
+    protected _setContainerOptions(options: any): void {
+        options = _.defaults(options, {
+            culling: false,
+            lodZoom: 0.5,
+            margin: 0.25,
+            minScreenSize: 1,
+        });
+        this._container.culling = options.culling;
+        this._container.lodZoom = options.lodZoom;
+        this._container.margin = options.margin;
+        this._container.minScreenSize = options.minScreenSize;
+    }
+
+    protected _addDocumentListener(type: string, listener: (e: any) => void): void {
+        document.addEventListener(type, listener);
+        this._listeners.push([type, listener]);
+    }
+
     show(layouter: Layouter, name: string, validate: boolean = false, printCost: boolean = false, loadFunction: (name: string, basePath?: string) => Promise<RenderGraph> = Loader.loadXhr): void {
         loadFunction(name).then((graph: RenderGraph) => {
             this.layoutAndRender(graph, layouter, validate, printCost);
@@ -123,6 +180,9 @@ export default abstract class Renderer {
                 break;
             case "NestedSDFG":
                 shapes.push(new Rectangle(node, node.x, node.y, node.width, node.height));
+                if (node.isPlaceholder) {
+                    shapes.push(new Text(this, this._labelPosition(node).x, this._labelPosition(node).y, node.label()));
+                }
                 break;
             case "SDFGState":
                 const color = new Color(0xDE, 0xEB, 0xF7);
@@ -148,7 +208,7 @@ export default abstract class Renderer {
         }
 
         // add child graph shapes
-        if (node.childGraph !== null) {
+        if (node.childGraph !== null && !node.isPlaceholder) {
             _.forEach(this._getShapesForGraph(node.childGraph), (shape: Shape) => {
                 shapes.push(shape);
             });
@@ -1,25 +1,133 @@
 import Shape from "../shapes/shape";
 import * as _ from "lodash";
 import Box from "../geometry/box";
+import BoxGrid from "../geometry/boxGrid";
+import EdgeShape from "../shapes/edgeShape";
+import MathText from "../shapes/mathText";
+import ShapeCollection from "../shapes/shapeCollection";
+import Text from "../shapes/text";
+import Vector from "../geometry/vector";
 
+/**
+ * Draws shapes, either all of them at once or, with culling enabled, only those in the current view.
+ * With culling, render() only indexes the shapes and updateView(view, zoom) shows the shapes that overlap the view
+ * (enlarged by margin times its size on every side) in display objects taken from pools of objects released by
+ * shapes that left the view. Below lodZoom, shapes are drawn simplified: without text, as plain boxes, and edges
+ * between the same two nodes as one straight line. Shapes (except edges) smaller than minScreenSize on the screen
+ * are not drawn.
+ */
 export default abstract class RendererContainer
 {
     protected _children: Array<Shape> = [];
 
+    public culling: boolean = false;
+    public lodZoom: number = 0.5;
+    public margin: number = 0.25;
+    public minScreenSize: number = 1;
+
+    // offset by which contentBoundingBox moved the shapes
+    public contentOffset: Vector = new Vector(0, 0);
+
+    private _shapes: Array<Shape> = []; // flat list of the shapes in drawing order
+    private _grid: BoxGrid = null;
+    private _sizes: Float64Array = null; // larger side of every shape
+    private _bundleLeaders: Uint8Array = null; // whether an edge is drawn in simplified mode
+    private _shown: Map<number, any> = new Map(); // display object of every shown shape
+    private _pools: Map<string, Array<any>> = new Map();
+    private _simplified: boolean = false;
+    private _lastView: Array<number> = null;
+
     public addChild(shape: Shape) {
         this._children.push(shape);
     }
 
     public removeChildren() {
         this._children.length = 0;
+        this._shown.forEach((object: any, i: number) => this._release(i, object));
+        this._shown.clear();
+        this._shapes = [];
+        this._grid = null;
+        this._lastView = null;
     }
 
     public render() {
+        if (this.culling) {
+            this._index();
+            return;
+        }
         _.forEach(this._children, (shape: Shape) => {
             this._renderShape(shape);
         });
     }
 
+    /**
+     * Shows the shapes in the view (world coordinates) at the given zoom, if culling is enabled.
+     */
+    public updateView(view: Box, zoom: number): void {
+        if (!this.culling || this._grid === null) {
+            return;
+        }
+        const key = [view.x, view.y, view.width, view.height, zoom];
+        if (this._lastView !== null && _.isEqual(key, this._lastView)) {
+            return;
+        }
+        this._lastView = key;
+        const simplified = (zoom < this.lodZoom);
+        if (simplified !== this._simplified) {
+            this._shown.forEach((object: any, i: number) => this._release(i, object));
+            this._shown.clear();
+            this._simplified = simplified;
+        }
+        const minSize = this.minScreenSize / zoom;
+        const visible = new Set<number>();
+        this._grid.forEachInBox(view.x - this.margin * view.width, view.y - this.margin * view.height,
+            (1 + 2 * this.margin) * view.width, (1 + 2 * this.margin) * view.height, (i: number) => {
+                const shape = this._shapes[i];
+                if (shape instanceof EdgeShape) {
+                    if (!simplified || this._bundleLeaders[i] === 1) {
+                        visible.add(i);
+                    }
+                } else if (this._sizes[i] >= minSize && !(simplified && this._isLabel(shape))) {
+                    visible.add(i);
+                }
+            });
+        this._shown.forEach((object: any, i: number) => {
+            if (!visible.has(i)) {
+                this._release(i, object);
+                this._shown.delete(i);
+            }
+        });
+        let added = false;
+        visible.forEach((i: number) => {
+            if (this._shown.has(i)) {
+                return;
+            }
+            const kind = this._objectKind(this._shapes[i], simplified);
+            if (kind === null) {
+                return;
+            }
+            const pool = this._pools.get(kind);
+            const object = (pool !== undefined && pool.length > 0) ? pool.pop() : this._createObject(kind);
+            this._drawObject(object, this._shapes[i], simplified);
+            this._showObject(object, i);
+            this._shown.set(i, object);
+            added = true;
+        });
+        if (added) {
+            this._arrangeObjects(this._shown);
+        }
+    }
+
+    /**
+     * Number of display objects that are shown and that are kept in pools for reuse (with culling).
+     */
+    public numDisplayObjects(): {shown: number, pooled: number} {
+        return {
+            shown: this._numShownObjects(),
+            pooled: _.sum(_.map(Array.from(this._pools.values()), (pool: Array<any>) => pool.length)),
+        };
+    }
+
     public contentBoundingBox() {
         let minX = Number.POSITIVE_INFINITY;
         let maxX = Number.NEGATIVE_INFINITY;
@@ -35,8 +143,104 @@ export default abstract class RendererContainer
         _.forEach(this._children, (shape: Shape) => {
             shape.offset(-minX, -minY);
         });
+        this.contentOffset = new Vector(-minX, -minY);
         return new Box(0, 0, maxX - minX, maxY - minY);
     }
 
+    private _index(): void {
+        const shapes = [];
+        const addShape = (shape: Shape) => {
+            if (shape instanceof ShapeCollection) {
+                _.forEach(shape.getShapes(), addShape);
+            } else {
+                shapes.push(shape);
+            }
+        };
+        _.forEach(this._children, addShape);
+        const n = shapes.length;
+        const xs = new Float64Array(n);
+        const ys = new Float64Array(n);
+        const widths = new Float64Array(n);
+        const heights = new Float64Array(n);
+        this._sizes = new Float64Array(n);
+        this._bundleLeaders = new Uint8Array(n);
+        const bundles = new Map<any, Set<string>>(); // node pairs with a drawn edge per graph
+        _.forEach(shapes, (shape: Shape, i: number) => {
+            const box = shape.boundingBox();
+            xs[i] = box.x;
+            ys[i] = box.y;
+            widths[i] = box.width;
+            heights[i] = box.height;
+            this._sizes[i] = Math.max(box.width, box.height);
+            if (shape instanceof EdgeShape) {
+                // edges between the same nodes of the same graph are drawn as one line when simplified
+                const edge = <any>shape.reference;
+                if (edge === null || edge === undefined || edge.graph === undefined) {
+                    this._bundleLeaders[i] = 1;
+                    return;
+                }
+                if (!bundles.has(edge.graph)) {
+                    bundles.set(edge.graph, new Set());
+                }
+                const pair = edge.src + " " + edge.dst;
+                if (!bundles.get(edge.graph).has(pair)) {
+                    bundles.get(edge.graph).add(pair);
+                    this._bundleLeaders[i] = 1;
+                }
+            }
+        });
+        this._shapes = shapes;
+        this._grid = new BoxGrid(xs, ys, widths, heights, n);
+        this._lastView = null;
+    }
+
+    private _release(i: number, object: any): void {
+        this._hideObject(object);
+        const kind = this._objectKind(this._shapes[i], this._simplified);
+        if (!this._pools.has(kind)) {
+            this._pools.set(kind, []);
+        }
+        this._pools.get(kind).push(object);
+    }
+
     protected abstract _renderShape(shape: Shape): void;
-}
\ No newline at end of file
+
+    protected abstract _numShownObjects(): number;
+
+    /**
+     * Kind of display object the shape is drawn in (null if it cannot be drawn); objects are only reused for shapes
+     * of the same kind.
+     */
+    protected _objectKind(shape: Shape, simplified: boolean): string {
+        return (shape instanceof Text && !simplified) ? "text" : "graphics";
+    }
+
+    /**
+     * Whether the shape is a label, which is left out when drawing simplified.
+     */
+    protected _isLabel(shape: Shape): boolean {
+        return shape instanceof Text || shape instanceof MathText;
+    }
+
+    protected _createObject(kind: string): any {
+        throw new Error("Culling is not supported by this renderer");
+    }
+
+    /**
+     * Draws the shape into the display object, which may have shown another shape of the same kind before.
+     */
+    protected _drawObject(object: any, shape: Shape, simplified: boolean): void {
+    }
+
+    protected _showObject(object: any, order: number): void {
+    }
+
+    protected _hideObject(object: any): void {
+    }
+
+    /**
+     * Brings the shown objects into the drawing order of their shapes after new ones were added.
+     */
+    protected _arrangeObjects(shown: Map<number, any>): void {
+    }
+}
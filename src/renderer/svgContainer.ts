@@ -13,6 +13,7 @@ import ShapeCollection from "../shapes/shapeCollection";
 import Color from "./color";
 import MathText from "../shapes/mathText";
 import Arc from "../shapes/arc";
+import Box from "../geometry/box";
 
 export default class SvgContainer extends RendererContainer {
     private readonly _svg: SVGElement;
@@ -65,28 +66,88 @@ export default class SvgContainer extends RendererContainer {
     }
 
     protected _renderShape(shape: Shape): void {
+        if (shape instanceof ShapeCollection) {
+            _.forEach(shape.getShapes(), (childShape: Shape) => {
+                this._renderShape(childShape);
+            });
+            return;
+        }
+        const kind = this._objectKind(shape, false);
+        if (kind !== null) {
+            const element = this._createObject(kind);
+            this._drawObject(element, shape, false);
+            this._svgContainer.appendChild(element);
+        }
+    }
+
+    protected _objectKind(shape: Shape, simplified: boolean): string {
+        if (simplified) {
+            return (shape instanceof EdgeShape ? "line" : "rect");
+        }
         if (shape instanceof Rectangle) {
-            const rectangle = document.createElementNS("http://www.w3.org/2000/svg", "rect");
-            rectangle.setAttribute('x', shape.x.toString());
-            rectangle.setAttribute('y', shape.y.toString());
-            rectangle.setAttribute('width', shape.width.toString());
-            rectangle.setAttribute('height', shape.height.toString());
-            if (shape.lineStyle === "dashed") {
-                rectangle.setAttribute('stroke-dasharray', '4');
-            }
-            this._addBackgroundAndBorder(rectangle, shape.backgroundColor, shape.borderColor);
-            if (shape.zIndex !== null) {
+            return "rect";
+        } else if (shape instanceof Circle) {
+            return "circle";
+        } else if (shape instanceof Arc) {
+            return "path";
+        } else if (shape instanceof Ellipse) {
+            return "ellipse";
+        } else if (shape instanceof Line) {
+            return "line";
+        } else if (shape instanceof EdgeShape) {
+            return "g";
+        } else if (shape instanceof AbstractPolygon) {
+            return "polygon";
+        } else if (shape instanceof Text) {
+            return "text";
+        } else if (shape instanceof MathText) {
+            return "foreignObject";
+        }
+        return null;
+    }
+
+    protected _numShownObjects(): number {
+        return this._svgContainer.childElementCount;
+    }
+
+    protected _createObject(kind: string): any {
+        const element = document.createElementNS("http://www.w3.org/2000/svg", kind);
+        if (kind === "g") {
+            // edge with arrow head
+            element.appendChild(document.createElementNS("http://www.w3.org/2000/svg", "path"));
+            element.appendChild(document.createElementNS("http://www.w3.org/2000/svg", "path"));
+        }
+        return element;
+    }
+
+    /**
+     * Sets all attributes of the element (created by _createObject for the kind of the shape) to draw the shape.
+     */
+    protected _drawObject(element: any, shape: Shape, simplified: boolean): void {
+        if (simplified) {
+            if (shape instanceof EdgeShape) {
+                // straight line without arrow head
+                const points = shape.points();
+                this._setLine(element, _.head(points), _.last(points), shape.lineWidth, shape.color, "solid");
+            } else {
+                const box = shape.boundingBox();
+                this._setBox(element, box.x, box.y, box.width, box.height);
+                this._addBackgroundAndBorder(element, (<any>shape).backgroundColor || Color.WHITE, (<any>shape).borderColor || (<any>shape).color || Color.BLACK);
+                this._setDashed(element, false);
             }
-            this._svgContainer.appendChild(rectangle);
+            return;
+        }
+        if (shape instanceof Rectangle) {
+            this._setBox(element, shape.x, shape.y, shape.width, shape.height);
+            this._setDashed(element, shape.lineStyle === "dashed");
+            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);
         } else if (shape instanceof Circle) {
-            const circle = document.createElementNS("http://www.w3.org/2000/svg", "circle");
             const box = shape.boundingBox();
             const center = box.center();
-            circle.setAttribute('cx', center.x.toString());
-            circle.setAttribute('cy', center.y.toString());
-            circle.setAttribute('r', (shape.width / 2).toString());
-            this._addBackgroundAndBorder(circle, shape.backgroundColor, shape.borderColor);
-            this._svgContainer.appendChild(circle);
+            element.setAttribute('cx', center.x.toString());
+            element.setAttribute('cy', center.y.toString());
+            element.setAttribute('r', (shape.width / 2).toString());
+            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);
         } else if (shape instanceof Arc) {
             // adapted from opsb: https://stackoverflow.com/a/18473154
             const polarToCartesian = (centerX, centerY, radius, angle) => {
@@ -104,60 +165,35 @@ export default class SvgContainer extends RendererContainer {
                     "A", radius, radius, 0, largeArcFlag, 0, end.x, end.y
                 ].join(" ");
             }
-            const arc = document.createElementNS("http://www.w3.org/2000/svg", "path");
-            arc.setAttribute('d', describeArc(shape.x + shape.radius, shape.y + shape.radius, shape.radius, shape.startAngle, shape.endAngle));
-            if (shape.lineStyle === "dashed") {
-                arc.setAttribute('stroke-dasharray', '4');
-            }
-            this._addBackgroundAndBorder(arc, shape.backgroundColor, shape.borderColor);
-            this._svgContainer.appendChild(arc);
-        } if (shape instanceof Ellipse) {
-            const ellipse = document.createElementNS("http://www.w3.org/2000/svg", "ellipse");
+            element.setAttribute('d', describeArc(shape.x + shape.radius, shape.y + shape.radius, shape.radius, shape.startAngle, shape.endAngle));
+            this._setDashed(element, shape.lineStyle === "dashed");
+            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);
+        } else if (shape instanceof Ellipse) {
             const box = shape.boundingBox();
             const center = box.center();
-            ellipse.setAttribute('cx', center.x.toString());
-            ellipse.setAttribute('cy', center.y.toString());
-            ellipse.setAttribute('rx', (shape.width / 2).toString());
-            ellipse.setAttribute('ry', (shape.height / 2).toString());
-            this._addBackgroundAndBorder(ellipse, shape.backgroundColor, shape.borderColor);
-            this._svgContainer.appendChild(ellipse);
+            element.setAttribute('cx', center.x.toString());
+            element.setAttribute('cy', center.y.toString());
+            element.setAttribute('rx', (shape.width / 2).toString());
+            element.setAttribute('ry', (shape.height / 2).toString());
+            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);
         } else if (shape instanceof Line) {
-            const line = document.createElementNS("http://www.w3.org/2000/svg", "line");
-            line.setAttribute('x1', shape.x1.toString());
-            line.setAttribute('y1', shape.y1.toString());
-            line.setAttribute('x2', shape.x2.toString());
-            line.setAttribute('y2', shape.y2.toString());
-            line.setAttribute('stroke-width', shape.lineWidth.toString());
-            line.setAttribute('stroke', shape.color.hex());
-            line.setAttribute('stroke-opacity', shape.color.alpha.toString());
-            this._svgContainer.appendChild(line);
-            if (shape.style === "dashed") {
-                line.setAttribute('stroke-dasharray', '4');
-            }
+            this._setLine(element, new Vector(shape.x1, shape.y1), new Vector(shape.x2, shape.y2), shape.lineWidth, shape.color, shape.style);
         } else if (shape instanceof EdgeShape) {
-            const path = document.createElementNS("http://www.w3.org/2000/svg", "path");
-            path.setAttribute('stroke-width', shape.lineWidth.toString());
-            path.setAttribute('stroke', shape.color.hex());
-            path.setAttribute('stroke-opacity', shape.color.alpha.toString());
-            path.setAttribute('fill', 'none');
-            let description = "M " + _.head(shape.points()).x.toString() + "," + _.head(shape.points()).y.toString() + " ";
-            _.forEach(_.tail(shape.points()), (point: Vector) => {
+            const path = element.childNodes[0];
+            const headPath = element.childNodes[1];
+            const points = shape.points();
+            this._setStroke(path, shape.lineWidth, shape.color);
+            let description = "M " + _.head(points).x.toString() + "," + _.head(points).y.toString() + " ";
+            _.forEach(_.tail(points), (point: Vector) => {
                 description += "L " + point.x.toString() + "," + point.y.toString() + " ";
             });
             path.setAttribute('d', description);
-            if (shape.lineStyle === "dashed") {
-                path.setAttribute('stroke-dasharray', '4');
-            }
-            this._svgContainer.appendChild(path);
+            this._setDashed(path, shape.lineStyle === "dashed");
 
             // draw arrow head
-            const headPath = document.createElementNS("http://www.w3.org/2000/svg", "path");
-            headPath.setAttribute('stroke-width', shape.lineWidth.toString());
-            headPath.setAttribute('stroke', shape.color.hex());
-            headPath.setAttribute('stroke-opacity', shape.color.alpha.toString());
-            headPath.setAttribute('fill', 'none');
-            const end = new Vector(_.last(shape.points()).x, _.last(shape.points()).y);
-            const dir = end.clone().sub(shape.points()[shape.points().length - 2]);
+            this._setStroke(headPath, shape.lineWidth, shape.color);
+            const end = new Vector(_.last(points).x, _.last(points).y);
+            const dir = end.clone().sub(points[points.length - 2]);
             const angle = dir.angle();
             const point1 = (new Vector(end.x - 5, end.y + 3)).rotateAround(end, angle);
             let headDescription = "M " + point1.x.toString() + "," + point1.y.toString() + " ";
@@ -165,40 +201,49 @@ export default class SvgContainer extends RendererContainer {
             const point2 = (new Vector(end.x - 5, end.y - 3)).rotateAround(end, angle);
             headDescription += "L " + point2.x.toString() + "," + point2.y.toString();
             headPath.setAttribute('d', headDescription);
-            this._svgContainer.appendChild(headPath);
         } else if (shape instanceof AbstractPolygon) {
-            const polygon = document.createElementNS("http://www.w3.org/2000/svg", "polygon");
-            this._addBackgroundAndBorder(polygon, shape.backgroundColor, shape.borderColor);
+            this._addBackgroundAndBorder(element, shape.backgroundColor, shape.borderColor);
             const points = shape.getPath();
             let description = "";
             for (let i = 0; i < points.length; i += 2) {
                 description += points[i] + "," + points[i + 1] + " ";
             }
-            polygon.setAttribute('points', description);
-            this._svgContainer.appendChild(polygon);
+            element.setAttribute('points', description);
         } else if (shape instanceof Text) {
-            const text = document.createElementNS("http://www.w3.org/2000/svg", "text");
-            text.setAttribute('x', shape.x.toString());
-            text.setAttribute('y', (shape.y + shape.fontSize).toString());
-            text.setAttribute('font-family', shape.fontFamily);
-            text.setAttribute('font-size', shape.fontSize.toString());
-            text.appendChild(document.createTextNode(shape.text));
-            this._svgContainer.appendChild(text);
+            element.setAttribute('x', shape.x.toString());
+            element.setAttribute('y', (shape.y + shape.fontSize).toString());
+            element.setAttribute('font-family', shape.fontFamily);
+            element.setAttribute('font-size', shape.fontSize.toString());
+            element.textContent = shape.text;
         } else if (shape instanceof MathText) {
-            const foreignObject = document.createElementNS("http://www.w3.org/2000/svg", "foreignObject");
-            foreignObject.setAttribute('x', shape.x.toString());
-            foreignObject.setAttribute('y', shape.y.toString());
-            foreignObject.setAttribute('width', shape.width.toString());
-            foreignObject.setAttribute('height', shape.height.toString());
-            foreignObject.setAttribute('color', shape.color.hex());
-            foreignObject.style.overflow = 'visible';
-            this._svgContainer.appendChild(foreignObject);
+            this._setBox(element, shape.x, shape.y, shape.width, shape.height);
+            element.setAttribute('color', shape.color.hex());
+            element.style.overflow = 'visible';
             shape.svg.style.position = 'absolute';
-            foreignObject.appendChild(shape.svg);
-        } else if (shape instanceof ShapeCollection) {
-            _.forEach(shape.getShapes(), (childShape: Shape) => {
-                this._renderShape(childShape);
-            });
+            element.textContent = "";
+            element.appendChild(shape.svg);
+        }
+    }
+
+    protected _showObject(element: any, order: number): void {
+        this._svgContainer.appendChild(element);
+    }
+
+    protected _hideObject(element: any): void {
+        element.remove();
+    }
+
+    protected _arrangeObjects(shown: Map<number, any>): void {
+        // moves only the elements that are out of the order of their shapes
+        const order = _.sortBy(Array.from(shown.keys()));
+        let next = this._svgContainer.firstChild;
+        for (const i of order) {
+            const element = shown.get(i);
+            if (element === next) {
+                next = next.nextSibling;
+            } else {
+                this._svgContainer.insertBefore(element, next);
+            }
         }
     }
 
@@ -255,11 +300,31 @@ export default class SvgContainer extends RendererContainer {
         return new Vector(this._width / 2, this._height / 2);
     }
 
+    /**
+     * Part of the world that is visible at the current zoom and translation.
+     */
+    public viewBox(): Box {
+        return new Box(-this._translate.x, -this._translate.y, this._width / this._zoom, this._height / this._zoom);
+    }
+
+    public contentBoundingBox(): Box {
+        const box = super.contentBoundingBox();
+        this._contentWidth = box.width;
+        this._contentHeight = box.height;
+        return box;
+    }
+
+    public remove(): void {
+        this._svg.remove();
+    }
+
     public render() {
         super.render();
-        const size = this._svgContainer.getBBox();
-        this._contentWidth = size.width;
-        this._contentHeight = size.height;
+        if (!this.culling) {
+            const size = this._svgContainer.getBBox();
+            this._contentWidth = size.width;
+            this._contentHeight = size.height;
+        }
         requestAnimationFrame(() => {
             this._svgContainer.style.transition = 'transform 10ms linear';
         });
@@ -275,4 +340,35 @@ export default class SvgContainer extends RendererContainer {
         element.setAttribute('stroke', borderColor.hex());
         element.setAttribute('stroke-opacity', borderColor.alpha.toString());
     }
+
+    private _setBox(element, x: number, y: number, width: number, height: number) {
+        element.setAttribute('x', x.toString());
+        element.setAttribute('y', y.toString());
+        element.setAttribute('width', width.toString());
+        element.setAttribute('height', height.toString());
+    }
+
+    private _setStroke(element, lineWidth: number, color: Color) {
+        element.setAttribute('stroke-width', lineWidth.toString());
+        element.setAttribute('stroke', color.hex());
+        element.setAttribute('stroke-opacity', color.alpha.toString());
+        element.setAttribute('fill', 'none');
+    }
+
+    private _setLine(element, start: Vector, end: Vector, lineWidth: number, color: Color, style: "solid" | "dashed") {
+        element.setAttribute('x1', start.x.toString());
+        element.setAttribute('y1', start.y.toString());
+        element.setAttribute('x2', end.x.toString());
+        element.setAttribute('y2', end.y.toString());
+        this._setStroke(element, lineWidth, color);
+        this._setDashed(element, style === "dashed");
+    }
+
+    private _setDashed(element, dashed: boolean) {
+        if (dashed) {
+            element.setAttribute('stroke-dasharray', '4');
+        } else {
+            element.removeAttribute('stroke-dasharray');
+        }
+    }
 }
\ No newline at end of file
@@ -10,13 +10,19 @@ export default class SvgRenderer extends Renderer {
     protected _container: SvgContainer;
     private readonly _weightExponent: number;
     private readonly _friction: number;
+    private _animationFrame: number = null;
 
-    constructor(domContainer) {
+    /**
+     * @param domContainer Element to draw into.
+     * @param options Culling options of the container (see Renderer._setContainerOptions).
+     */
+    constructor(domContainer, options: object = {}) {
         super();
         this._weightExponent = 2;
         this._friction = 0.999;
         this._container = new SvgContainer(domContainer);
-        document.addEventListener("keydown", (e) => {
+        this._setContainerOptions(options);
+        this._addDocumentListener("keydown", (e) => {
             if (e.ctrlKey && e.key === "s") {
                 e.preventDefault();
                 let fileName = prompt("Save as:", "screenshot");
@@ -32,14 +38,14 @@ export default class SvgRenderer extends Renderer {
         let isMouseDown = false;
         let x, y, mouseDownX, mouseDownY, mouseDownTopLeft;
         let v = new Vector(0, 0);
-        document.addEventListener("mousedown", (e) => {
+        this._addDocumentListener("mousedown", (e) => {
             isMouseDown = true;
             mouseDownX = e.clientX;
             mouseDownY = e.clientY;
             mouseDownTopLeft = this._container.getContentTopLeft();
             v = new Vector(0, 0);
         });
-        document.addEventListener("mouseup", (e) => {
+        this._addDocumentListener("mouseup", (e) => {
             const now = performance.now();
             isMouseDown = false;
             if (history.length < 2) {
@@ -63,7 +69,7 @@ export default class SvgRenderer extends Renderer {
             v = this._container.toWorld(v);
             history.length = 0;
         });
-        document.addEventListener("mousemove", (e) => {
+        this._addDocumentListener("mousemove", (e) => {
             const now = performance.now();
             x = e.clientX;
             y = e.clientY;
@@ -74,7 +80,7 @@ export default class SvgRenderer extends Renderer {
                 }
             }
         });
-        document.addEventListener("wheel", (e) => {
+        this._addDocumentListener("wheel", (e) => {
             const mouse = new Vector(e.clientX, e.clientY)
             const worldMouseBefore = this._container.toWorld(mouse.clone());
             this._container.setZoom(this._container.getZoom() * (1 + e.deltaY * -0.002));
@@ -92,9 +98,28 @@ export default class SvgRenderer extends Renderer {
                 this._container.translate(newCenter.sub(mouseDownTopLeft).add(this._container.toWorld(new Vector(x - mouseDownX, y - mouseDownY).invert())));
             }
             prevTime = now;
-            window.requestAnimationFrame(step);
+            this._container.updateView(this._container.viewBox(), this._container.getZoom());
+            this._animationFrame = window.requestAnimationFrame(step);
         };
-        window.requestAnimationFrame(step);
+        this._animationFrame = window.requestAnimationFrame(step);
+    }
+
+    public setView(x: number, y: number, zoom: number): void {
+        this._container.setZoom(zoom, false);
+        // the shapes were moved so that the content starts at the origin
+        const center = new Vector(x, y).add(this._container.contentOffset);
+        const view = this._container.viewBox();
+        this._container.translate(center.sub(new Vector(view.width / 2, view.height / 2)).add(this._container.getContentTopLeft()));
+    }
+
+    public viewSize(): Size {
+        return {width: this._container.width(), height: this._container.height()};
+    }
+
+    public cleanUp(): void {
+        super.cleanUp();
+        window.cancelAnimationFrame(this._animationFrame);
+        this._container.remove();
     }
 
     protected _render(graph: RenderGraph): void {
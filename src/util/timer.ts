@@ -1,44 +1,325 @@
 import * as _ from "lodash";
 
+// only defined in Node.js
+declare const process: any;
+
+/**
+ * Hierarchical timers identified by paths like ["doLayout", "orderRanks"].
+ * Paths are registered once (as module constants next to their use) and then referred to by their numeric id.
+ * Collection is disabled by default, so that start and stop only check a flag; it is enabled for breakdowns and
+ * printTimes. Outermost calls are written as (id, duration) pairs into a preallocated ring buffer, which is folded
+ * into the sums, counts, minima and maxima per path before it wraps and whenever results are read.
+ */
 export default class Timer {
-    private static _timers: Map<string, Array<number>> = new Map();
-    private static _measurements: Map<string, Array<number>> = new Map();
+    private static readonly RING_SIZE = 4096;
+
+    private static _enabled: boolean = false;
+    private static _ids: Map<string, number> = new Map();
+    private static _paths: Array<string> = [];
+    private static _names: Array<string> = [];
+    private static _depths: Int32Array = new Int32Array(64);
+    private static _startTimes: Float64Array = new Float64Array(64);
+    private static _sums: Float64Array = new Float64Array(64);
+    private static _counts: Float64Array = new Float64Array(64);
+    private static _mins: Float64Array = new Float64Array(64);
+    private static _maxs: Float64Array = new Float64Array(64);
+    private static _ring: Float64Array = new Float64Array(2 * Timer.RING_SIZE);
+    private static _written: number = 0;
+    private static _folded: number = 0;
+    private static _calls: number = 0;
+    private static _overheadPerCall: number = null;
+
+    // memory mode: heap usage is sampled at every start and stop
+    private static _memory: boolean = false;
+    private static _memoryStarts: Map<number, number> = new Map();
+    private static _memoryPeaks: Map<number, number> = new Map();
+    private static _peakPerPath: Map<number, number> = new Map();
+    private static _deltaPerPath: Map<number, number> = new Map();
+    private static _heapBase: number = null;
+    private static _heapPeak: number = null;
 
+    // trace mode: spans are also recorded as events of the Chrome trace event format, thread 0 is the main thread
+    private static _trace: boolean = false;
+    private static _traceEvents: Array<object> = [];
+
+    /**
+     * Clears all measurements; registered paths keep their ids.
+     */
     public static reset(): void {
-        Timer._timers = new Map();
-        Timer._measurements = new Map();
+        Timer._depths.fill(0);
+        Timer._sums.fill(0);
+        Timer._counts.fill(0);
+        Timer._mins.fill(Infinity);
+        Timer._maxs.fill(-Infinity);
+        Timer._written = 0;
+        Timer._folded = 0;
+        Timer._calls = 0;
+        Timer._memoryStarts = new Map();
+        Timer._memoryPeaks = new Map();
+        Timer._peakPerPath = new Map();
+        Timer._deltaPerPath = new Map();
+        Timer._heapBase = null;
+        Timer._heapPeak = null;
+        Timer._traceEvents = [];
+    }
+
+    /**
+     * Enables or disables the collection of times. The memory and trace modes only record while it is enabled.
+     */
+    public static setEnabled(enabled: boolean): void {
+        Timer._enabled = enabled;
+    }
+
+    public static isEnabled(): boolean {
+        return Timer._enabled;
+    }
+
+    /**
+     * Enables or disables the trace mode. In trace mode, every start and stop is recorded as begin and end event
+     * with its timestamp, and other parts (like the WorkerPool) can add events with traceEvent.
+     */
+    public static setTraceMode(enabled: boolean): void {
+        Timer._trace = enabled;
+    }
+
+    public static isTracing(): boolean {
+        return Timer._trace;
     }
 
-    public static start(path: Array<string>): void {
-        const id = path.join("|");
-        let timers = Timer._timers.get(id);
-        if (timers === undefined) {
-            timers = [];
-            Timer._timers.set(id, timers);
+    /**
+     * Adds an event (name, ph, ts in microseconds, tid, args, ...) to the trace if the trace mode is enabled.
+     */
+    public static traceEvent(event: object): void {
+        if (Timer._trace) {
+            Timer._traceEvents.push(Object.assign({cat: "layout", pid: 0, tid: 0}, event));
+        }
+    }
+
+    /**
+     * Recorded trace events since the last reset with thread name metadata (main thread, worker i in thread i + 1),
+     * ready for {"traceEvents": ...} files of chrome://tracing or Perfetto.
+     */
+    public static getTraceEvents(): Array<object> {
+        const threads = _.uniq(_.map(Timer._traceEvents, "tid").concat([0])).sort((a, b) => a - b);
+        const metadata = _.map(threads, tid => ({
+            name: "thread_name",
+            ph: "M",
+            pid: 0,
+            tid: tid,
+            args: {name: (tid === 0 ? "main" : "worker " + (tid - 1))},
+        }));
+        return metadata.concat(Timer._traceEvents);
+    }
+
+    /**
+     * Returns the id of a path, registering it on first use.
+     */
+    public static register(path: Array<string>): number {
+        const key = path.join("|");
+        let id = Timer._ids.get(key);
+        if (id === undefined) {
+            id = Timer._paths.length;
+            Timer._ids.set(key, id);
+            Timer._paths.push(key);
+            Timer._names.push(path[path.length - 1]);
+            if (id >= Timer._depths.length) {
+                Timer._grow(2 * Timer._depths.length);
+            }
+            Timer._mins[id] = Infinity;
+            Timer._maxs[id] = -Infinity;
         }
-        timers.push(performance.now());
+        return id;
     }
 
-    public static stop(path: Array<string>): void {
+    private static _grow(capacity: number): void {
+        const grow = (array, fill = 0) => {
+            const grown = new (array.constructor)(capacity).fill(fill);
+            grown.set(array);
+            return grown;
+        };
+        Timer._depths = grow(Timer._depths);
+        Timer._startTimes = grow(Timer._startTimes);
+        Timer._sums = grow(Timer._sums);
+        Timer._counts = grow(Timer._counts);
+        Timer._mins = grow(Timer._mins, Infinity);
+        Timer._maxs = grow(Timer._maxs, -Infinity);
+    }
+
+    /**
+     * Folds the samples of the ring buffer not yet counted into the statistics per path.
+     */
+    private static _fold(): void {
+        const ring = Timer._ring;
+        for (let sample = Timer._folded; sample < Timer._written; ++sample) {
+            const slot = 2 * (sample % Timer.RING_SIZE);
+            const id = ring[slot];
+            const duration = ring[slot + 1];
+            Timer._sums[id] += duration;
+            Timer._counts[id]++;
+            if (duration < Timer._mins[id]) {
+                Timer._mins[id] = duration;
+            }
+            if (duration > Timer._maxs[id]) {
+                Timer._maxs[id] = duration;
+            }
+        }
+        Timer._folded = Timer._written;
+    }
+
+    /**
+     * Enables or disables the memory mode. In memory mode, the used JS heap is sampled at every start and stop
+     * (process.memoryUsage in Node.js, performance.memory in Chrome), and for every path the peak above the heap
+     * at its start and the difference between stop and start are recorded. Peaks between two samples are not seen.
+     */
+    public static setMemoryMode(enabled: boolean): void {
+        Timer._memory = enabled;
+    }
+
+    /**
+     * Used JS heap in bytes, or null if the environment does not report it.
+     */
+    public static usedHeap(): number {
+        if (typeof process !== "undefined" && typeof process.memoryUsage === "function") {
+            return process.memoryUsage().heapUsed;
+        }
+        if (typeof performance !== "undefined" && performance["memory"] !== undefined) {
+            return performance["memory"].usedJSHeapSize;
+        }
+        return null;
+    }
+
+    private static _sampleMemory(): number {
+        const heap = Timer.usedHeap();
+        if (heap === null) {
+            return null;
+        }
+        if (Timer._heapBase === null) {
+            Timer._heapBase = heap;
+        }
+        Timer._heapPeak = Math.max(Timer._heapPeak === null ? heap : Timer._heapPeak, heap);
+        Timer._memoryPeaks.forEach((peak, id) => {
+            if (heap > peak) {
+                Timer._memoryPeaks.set(id, heap);
+            }
+        });
+        return heap;
+    }
+
+    public static start(path: number | Array<string>): void {
+        if (!Timer._enabled) {
+            return;
+        }
+        const id = (typeof path === "number" ? path : Timer.register(path));
+        const startTime = performance.now();
+        if (Timer._trace) {
+            Timer.traceEvent({name: Timer._names[id], cat: "timer", ph: "B", ts: startTime * 1000, args: {path: Timer._paths[id]}});
+        }
+        const outermost = (Timer._depths[id]++ === 0);
+        if (outermost) {
+            Timer._startTimes[id] = startTime;
+        }
+        if (Timer._memory) {
+            const heap = Timer._sampleMemory();
+            if (outermost && heap !== null) {
+                Timer._memoryStarts.set(id, heap);
+                Timer._memoryPeaks.set(id, heap);
+            }
+        }
+    }
+
+    public static stop(path: number | Array<string>): void {
+        if (!Timer._enabled) {
+            return;
+        }
         const stopTime = performance.now();
-        const id = path.join("|");
-        const timers = Timer._timers.get(id);
-        const startTime = timers[timers.length - 1];
-        timers.length = timers.length - 1;
-        let measurements = Timer._measurements.get(id);
-        if (measurements === undefined) {
-            measurements = [];
-            Timer._measurements.set(id, measurements);
+        const id = (typeof path === "number" ? path : Timer.register(path));
+        Timer._calls++;
+        if (Timer._trace) {
+            Timer.traceEvent({name: Timer._names[id], cat: "timer", ph: "E", ts: stopTime * 1000, args: {path: Timer._paths[id]}});
+        }
+        if (Timer._depths[id] === 0 || --Timer._depths[id] > 0) {
+            return; // for recursive calls, only add outermost
+        }
+        if (Timer._written - Timer._folded === Timer.RING_SIZE) {
+            Timer._fold();
+        }
+        const slot = 2 * (Timer._written % Timer.RING_SIZE);
+        Timer._ring[slot] = id;
+        Timer._ring[slot + 1] = stopTime - Timer._startTimes[id];
+        Timer._written++;
+        if (Timer._memory) {
+            const heap = Timer._sampleMemory();
+            if (heap !== null && Timer._memoryStarts.has(id)) {
+                const start = Timer._memoryStarts.get(id);
+                const peak = Timer._memoryPeaks.get(id) - start;
+                Timer._peakPerPath.set(id, Math.max(Timer._peakPerPath.get(id) || 0, peak));
+                Timer._deltaPerPath.set(id, (Timer._deltaPerPath.get(id) || 0) + heap - start);
+                Timer._memoryStarts.delete(id);
+                Timer._memoryPeaks.delete(id);
+            }
+        }
+    }
+
+    /**
+     * Measures the cost of a start/stop pair (including the loop) with collection enabled, in ms.
+     * The result is kept for getOverhead; the calibration path does not appear in any result.
+     */
+    public static calibrate(pairs: number = 10000): number {
+        const id = Timer.register(["timerCalibration"]);
+        const [enabled, memory, trace, calls] = [Timer._enabled, Timer._memory, Timer._trace, Timer._calls];
+        Timer._enabled = true;
+        Timer._memory = false;
+        Timer._trace = false;
+        // a first round only warms up the code, like the many calls of a layout do
+        let begin = 0;
+        for (let round = 0; round < 2; ++round) {
+            begin = performance.now();
+            for (let i = 0; i < pairs; ++i) {
+                Timer.start(id);
+                Timer.stop(id);
+            }
+        }
+        Timer._overheadPerCall = (performance.now() - begin) / pairs;
+        Timer._fold();
+        Timer._sums[id] = 0;
+        Timer._counts[id] = 0;
+        Timer._mins[id] = Infinity;
+        Timer._maxs[id] = -Infinity;
+        [Timer._enabled, Timer._memory, Timer._trace, Timer._calls] = [enabled, memory, trace, calls];
+        return Timer._overheadPerCall;
+    }
+
+    /**
+     * Number of start/stop pairs since the last reset, the calibrated cost of one pair and their product, the
+     * estimated time the instrumentation added to the measured times (in ms).
+     */
+    public static getOverhead(): object {
+        if (Timer._overheadPerCall === null) {
+            Timer.calibrate();
         }
-        if (timers.length === 0) {
-            measurements.push(stopTime - startTime); // for recursive calls, only add outermost
+        return {
+            timerCalls: Timer._calls,
+            timerOverheadPerCall: Timer._overheadPerCall,
+            timerOverhead: Timer._calls * Timer._overheadPerCall,
+        };
+    }
+
+    /**
+     * Calls f with the id and path of every path measured since the last reset, in the order of registration.
+     */
+    private static _forEachMeasured(f: (id: number, path: string) => void): void {
+        Timer._fold();
+        for (let id = 0; id < Timer._paths.length; ++id) {
+            if (Timer._counts[id] > 0) {
+                f(id, Timer._paths[id]);
+            }
         }
     }
 
     public static getTimes(): object {
         const timePerPath = {children: {}};
-        Timer._measurements.forEach((measurements, id) => {
-            const path = id.split("|");
+        Timer._forEachMeasured((id, key) => {
+            const path = key.split("|");
             let slot = timePerPath;
             _.forEach(path, part => {
                 if (slot.children[part] === undefined) {
@@ -48,31 +329,62 @@ export default class Timer {
                 }
                 slot = slot.children[part];
             });
-            slot["sum"] = _.sum(measurements);
-            slot["mean"] = _.mean(measurements);
-            slot["min"] = _.min(measurements);
-            slot["max"] = _.max(measurements);
-            slot["count"] = measurements.length;
+            slot["sum"] = Timer._sums[id];
+            slot["mean"] = Timer._sums[id] / Timer._counts[id];
+            slot["min"] = Timer._mins[id];
+            slot["max"] = Timer._maxs[id];
+            slot["count"] = Timer._counts[id];
         });
         return timePerPath;
     }
 
     public static getTimesPerPath(): object {
         const timesPerPath = {};
-        Timer._measurements.forEach((measurements, id) => {
-            timesPerPath[id] = _.sum(measurements);
+        Timer._forEachMeasured((id, path) => {
+            timesPerPath[path] = Timer._sums[id];
         });
         return timesPerPath;
     }
 
     public static getCountPerPath(): object {
         const countPerPath = {};
-        Timer._measurements.forEach((measurements, id) => {
-            countPerPath[id] = measurements.length;
+        Timer._forEachMeasured((id, path) => {
+            countPerPath[path] = Timer._counts[id];
         });
         return countPerPath;
     }
 
+    /**
+     * Maximum heap growth in bytes during any call of every path (sampled peak minus heap at the start of the call),
+     * shaped like getTimesPerPath. Empty unless the memory mode was enabled.
+     */
+    public static getPeakMemoryPerPath(): object {
+        const peakPerPath = {};
+        Timer._peakPerPath.forEach((peak, id) => {
+            peakPerPath[Timer._paths[id]] = peak;
+        });
+        return peakPerPath;
+    }
+
+    /**
+     * Sum of the heap differences in bytes between stop and start over all calls of every path (memory retained,
+     * negative if garbage was collected), shaped like getTimesPerPath.
+     */
+    public static getMemoryDeltaPerPath(): object {
+        const deltaPerPath = {};
+        Timer._deltaPerPath.forEach((delta, id) => {
+            deltaPerPath[Timer._paths[id]] = delta;
+        });
+        return deltaPerPath;
+    }
+
+    /**
+     * Heap at the first sample and highest sampled heap since the last reset, in bytes (null without samples).
+     */
+    public static getHeapRange(): object {
+        return {heapBase: Timer._heapBase, heapPeak: Timer._heapPeak};
+    }
+
     public static printTimes(times: object = null): void {
         const printTimes = (slot, name = "", level = 0, parentTime = 0) => {
             if (level > 0) {
@@ -1,36 +1,116 @@
 import SugiyamaLayouter from "../layouter/sugiyamaLayouter";
+import Timer from "./timer";
 
+interface PoolTask {
+    functionName: string;
+    args: Array<any>;
+    transferables: Array<Transferable>;
+    started: () => any;
+    done: (any) => any;
+}
+
+/**
+ * Pool of web workers that run the functions of worker/worker.js.
+ * Pools are shared by all layouters with the same worker script and number of workers (see WorkerPool.get) and
+ * live across layouts; their workers load their script right at construction, ready() resolves once all of them
+ * are up.
+ * Every task goes to the queue of one worker (round robin); a worker that runs out of tasks steals half of the
+ * longest queue. Up to batchSize tasks are posted to a worker at once, so it can start the next one without
+ * waiting for the main thread.
+ * Data used by many tasks (like the buffers of the graph to order) is sent to every worker once with setData and
+ * referenced in the arguments of the tasks by the returned WorkerPool.dataRef; SharedArrayBuffers are not copied.
+ */
 export default class WorkerPool
 {
-    private _ready: boolean = true;
+    private static _pools: Map<string, WorkerPool> = new Map();
+
+    private _key: string = null;
+    private _users: number = 0;
     private _workers: Array<Worker> = [];
-    private _inUse: Array<boolean> = [];
-    private _startedCallbacks: Array<() => any> = [];
-    private _doneCallbacks: Array<(any) => any> = [];
-    private _queue: Array<[number, string, Array<any>, Array<Transferable>]> = [];
-    private _queuePointer: number = 0;
+    private _running: Array<number> = []; // number of tasks posted to a worker and not done yet
+    private _localQueues: Array<Array<number>> = []; // task ids per worker, taken from the front, stolen from the back
+    private _nextWorker: number = 0;
+    private _batchSize: number;
+    private _nextTaskId: number = 0;
+    private _tasks: Map<number, PoolTask> = new Map(); // tasks by id until they are done
+    private _numDataSets: number = 0;
+    private _readyPromise: Promise<void>;
 
-    constructor(workerPath: string, numWorkers: number, layouter: SugiyamaLayouter) {
+    constructor(workerPath: string, numWorkers: number, layouter: SugiyamaLayouter, batchSize: number = 2) {
+        this._batchSize = Math.max(1, batchSize);
+        const readyPromises = [];
         for (let i = 0; i < numWorkers; ++i) {
             let tmpI = i;
             try {
                 this._workers[i] = new Worker(workerPath);
             } catch (e) {
+                // the workers created so far are terminated and will never report that they are ready
+                this.cleanUp();
+                readyPromises.length = 0;
                 layouter.disableWorkers();
-                return;
+                break;
             }
-            this._inUse[i] = false;
+            this._running[i] = 0;
+            this._localQueues[i] = [];
+            let readyCallback;
+            readyPromises.push(new Promise<void>(resolve => {
+                readyCallback = resolve;
+            }));
             this._workers[i].onmessage = e => {
                 const taskId = e.data[0];
-                if (e.data[1] === "strt") {
-                    this._startedCallbacks[taskId]();
+                if (e.data[1] === "ready") {
+                    readyCallback();
+                } else if (e.data[1] === "strt") {
+                    this._traceTask(taskId, "B", tmpI + 1, e.data[2]);
+                    this._tasks.get(taskId).started();
                 } else {
-                    this._inUse[tmpI] = false;
-                    this._ready = true;
-                    this._doneCallbacks[taskId](e.data[2]);
+                    this._traceTask(taskId, "E", tmpI + 1, e.data[3]);
+                    this._traceTask(taskId, "done", 0);
+                    this._running[tmpI]--;
+                    const task = this._tasks.get(taskId);
+                    this._tasks.delete(taskId);
+                    task.done(e.data[2]);
                     this.tryDispatch();
                 }
-            }
+            };
+            this._workers[i].postMessage(["warm"]);
+        }
+        this._readyPromise = Promise.all(readyPromises).then(() => undefined);
+    }
+
+    /**
+     * Returns the pool for the worker script and number of workers, creating it if there is none yet.
+     * Every call has to be matched by a call of release.
+     */
+    public static get(workerPath: string, numWorkers: number, layouter: SugiyamaLayouter): WorkerPool {
+        const key = workerPath + "|" + numWorkers;
+        let pool = WorkerPool._pools.get(key);
+        if (pool === undefined) {
+            pool = new WorkerPool(workerPath, numWorkers, layouter);
+            pool._key = key;
+            WorkerPool._pools.set(key, pool);
+        } else if (pool._workers.length === 0) {
+            layouter.disableWorkers();
+        }
+        pool._users++;
+        return pool;
+    }
+
+    /**
+     * Terminates the workers of all pools created by get.
+     */
+    public static terminateAll(): void {
+        WorkerPool._pools.forEach(pool => pool.cleanUp());
+        WorkerPool._pools.clear();
+    }
+
+    /**
+     * Gives the pool back after get; with keep, its workers stay alive for the next layouts even if nobody uses it.
+     */
+    public release(keep: boolean = true): void {
+        this._users--;
+        if (this._users <= 0 && !keep) {
+            this.cleanUp();
         }
     }
 
@@ -39,42 +119,125 @@ export default class WorkerPool
             this._workers[i].terminate();
             delete this._workers[i];
         }
+        this._workers.length = 0;
+        if (this._key !== null && WorkerPool._pools.get(this._key) === this) {
+            WorkerPool._pools.delete(this._key);
+        }
     }
 
-    public tryDispatch() {
-        if (!this._ready) {
+    /**
+     * Resolves once all workers have loaded their script.
+     */
+    public ready(): Promise<void> {
+        return this._readyPromise;
+    }
+
+    /**
+     * Sends the values to every worker once and returns a reference that stands for them in the arguments of exec
+     * (the values are inserted in place of the reference). ArrayBuffers are copied once per worker,
+     * SharedArrayBuffers are read in place. The workers keep the values until clearData.
+     */
+    public setData(values: Array<any>): any {
+        const name = "data" + (this._numDataSets++);
+        for (let i = 0; i < this._workers.length; ++i) {
+            this._workers[i].postMessage(["data", name, values]);
+        }
+        return WorkerPool.dataRef(name);
+    }
+
+    public clearData(ref: any): void {
+        for (let i = 0; i < this._workers.length; ++i) {
+            this._workers[i].postMessage(["clear", ref.poolData]);
+        }
+    }
+
+    public static dataRef(name: string): any {
+        return {poolData: name};
+    }
+
+    /**
+     * Adds a trace event of a task: phase "B" or "E" for its execution on the thread of its worker (at the time the
+     * worker reported in milliseconds since the epoch, if given), any other phase as instant event on the main thread.
+     */
+    private _traceTask(taskId: number, phase: string, tid: number, workerTime: number = undefined, args: object = {}) {
+        if (!Timer.isTracing()) {
             return;
         }
-        if (this._queuePointer < this._queue.length) {
-            const [taskId, functionName, args, transferables] = this._queue[this._queuePointer];
-            let started = false;
-            for (let i = 0; i < this._workers.length; ++i) {
-                if (!this._inUse[i]) {
-                    this._inUse[i] = true;
-                    this._workers[i].postMessage(["exec", taskId, functionName, ...args], transferables);
-                    this._queuePointer++;
-                    started = true;
-                }
-                if (i === this._workers.length - 1) {
-                    this._ready = false;
-                }
-                if (started) {
-                    break;
-                }
+        let time = performance.now();
+        if (workerTime !== undefined && performance.timeOrigin !== undefined) {
+            time = workerTime - performance.timeOrigin;
+        }
+        const functionName = this._tasks.get(taskId).functionName;
+        const event = {cat: "pool", ts: time * 1000, tid: tid, args: Object.assign({taskId: taskId, function: functionName}, args)};
+        if (phase === "B" || phase === "E") {
+            Timer.traceEvent(Object.assign(event, {name: functionName, ph: phase}));
+        } else {
+            Timer.traceEvent(Object.assign(event, {name: phase, ph: "i", s: "t"}));
+        }
+    }
+
+    /**
+     * Posts tasks to every worker that has fewer than batchSize tasks, from its own queue or else stolen from the
+     * back of the longest queue.
+     */
+    public tryDispatch() {
+        for (let i = 0; i < this._workers.length; ++i) {
+            const free = this._batchSize - this._running[i];
+            if (free <= 0) {
+                continue;
+            }
+            if (this._localQueues[i].length === 0) {
+                this._steal(i);
+            }
+            const taskIds = this._localQueues[i].splice(0, free);
+            if (taskIds.length === 0) {
+                continue;
             }
-            this.tryDispatch();
+            const tasks = [];
+            let transferables = [];
+            for (const taskId of taskIds) {
+                const task = this._tasks.get(taskId);
+                this._traceTask(taskId, "post", 0, undefined, {worker: i});
+                tasks.push([taskId, task.functionName, task.args]);
+                transferables = transferables.concat(task.transferables);
+                // the arguments are not needed anymore once posted
+                task.args = null;
+                task.transferables = null;
+            }
+            this._running[i] += taskIds.length;
+            this._workers[i].postMessage(["exec", tasks], transferables);
         }
     }
 
+    private _steal(thief: number): void {
+        let victim = -1;
+        for (let i = 0; i < this._workers.length; ++i) {
+            if (i !== thief && (victim === -1 || this._localQueues[i].length > this._localQueues[victim].length)) {
+                victim = i;
+            }
+        }
+        if (victim === -1 || this._localQueues[victim].length === 0) {
+            return;
+        }
+        const numStolen = Math.ceil(this._localQueues[victim].length / 2);
+        this._localQueues[thief] = this._localQueues[victim].splice(this._localQueues[victim].length - numStolen, numStolen);
+    }
+
     public exec(functionName: string, args: Array<any> = [], transferables: Array<Transferable> = []): [Promise<void>, Promise<any>] {
-        const taskId = this._queue.length;
+        const taskId = this._nextTaskId++;
+        const task: PoolTask = {functionName: functionName, args: args, transferables: transferables, started: null, done: null};
         const readyCallback = new Promise<void>(resolve => {
-            this._startedCallbacks[taskId] = resolve;
+            task.started = resolve;
         });
         const doneCallback = new Promise(resolve => {
-            this._doneCallbacks[taskId] = resolve;
+            task.done = resolve;
         });
-        this._queue.push([taskId, functionName, args, transferables]);
+        this._tasks.set(taskId, task);
+        this._traceTask(taskId, "enqueue", 0);
+        if (this._workers.length > 0) {
+            this._localQueues[this._nextWorker].push(taskId);
+            this._nextWorker = (this._nextWorker + 1) % this._workers.length;
+        }
         this.tryDispatch();
         return [readyCallback, doneCallback];
     }
@@ -96,12 +259,39 @@ export default class WorkerPool
         } else{
             context = global;
         }
-        context.onmessage = async function(e) {
-            if (e.data[0] === "exec") {
-                context.taskId = e.data[1];
-                context.postMessage([context.taskId, "strt"]);
-                const result = await WorkerPool.apply(e.data[2], e.data.slice(3));
-                context.postMessage([context.taskId, "done", result]);
+        const data = new Map();
+        // tasks are run one after the other, also when a batch arrives while a task is still awaited
+        let previous: Promise<void> = Promise.resolve();
+        const run = async (taskId, functionName, args) => {
+            // the times (ms since the epoch) place the execution on the timeline of the main thread in traces
+            context.postMessage([taskId, "strt", performance.timeOrigin + performance.now()]);
+            const resolvedArgs = [];
+            for (const arg of args) {
+                if (arg !== null && typeof arg === "object" && arg.poolData !== undefined) {
+                    resolvedArgs.push(...data.get(arg.poolData));
+                } else {
+                    resolvedArgs.push(arg);
+                }
+            }
+            const result = await WorkerPool.apply(functionName, resolvedArgs);
+            context.postMessage([taskId, "done", result, performance.timeOrigin + performance.now()]);
+        };
+        context.onmessage = function(e) {
+            switch (e.data[0]) {
+                case "warm":
+                    context.postMessage([null, "ready"]);
+                    break;
+                case "data":
+                    data.set(e.data[1], e.data[2]);
+                    break;
+                case "clear":
+                    data.delete(e.data[1]);
+                    break;
+                case "exec":
+                    for (const [taskId, functionName, args] of e.data[1]) {
+                        previous = previous.then(() => run(taskId, functionName, args));
+                    }
+                    break;
             }
         }
     }